@@ -7,16 +7,136 @@ DEPENDENCIES = ["web_server_base", "network"]
 AUTO_LOAD = ["web_server_base"]
 
 CONF_WEB_SERVER_BASE_ID = "web_server_base_id"
+CONF_STREAM_INTERVAL = "stream_interval"
+CONF_STREAM_BUDGET = "stream_budget"
+CONF_HISTORY_SIZE = "history_size"
+CONF_HISTORY_INTERVAL = "history_interval"
 
 from esphome.components import sensor, binary_sensor, text_sensor, climate, number, switch, select
 
 asgard_dashboard_ns = cg.esphome_ns.namespace("asgard_dashboard")
 EcodanDashboard = asgard_dashboard_ns.class_("EcodanDashboard", cg.Component)
+StateFieldType = asgard_dashboard_ns.enum("StateFieldType", is_class=True)
+
+# Worst-case serialized value width per field type, used to size the /dashboard/state buffer
+TEXT_MAX_CHARS = 64
+STATE_VALUE_WIDTH = {
+    "SENSOR":          24,
+    "NUMBER":          24,
+    "NUMBER_TRAITS":   80,
+    "CLIMATE_CURRENT": 24,
+    "CLIMATE_TARGET":  24,
+    "BINARY":          5,
+    "BINARY_STATE":    5,
+    "SWITCH":          5,
+    "TEXT":            2 + 2 * TEXT_MAX_CHARS,
+    "SELECT_INDEX":    12,
+}
+
+# (config key, json key, field type) in /dashboard/state order
+STATE_FIELDS = [
+    ("hp_feed_temp_id",                   "hp_feed_temp",                   "SENSOR"),
+    ("hp_return_temp_id",                 "hp_return_temp",                 "SENSOR"),
+    ("outside_temp_id",                   "outside_temp",                   "SENSOR"),
+    ("compressor_frequency_id",           "compressor_frequency",           "SENSOR"),
+    ("flow_rate_id",                      "flow_rate",                      "SENSOR"),
+    ("computed_output_power_id",          "computed_output_power",          "SENSOR"),
+    ("daily_computed_output_power_id",    "daily_computed_output_power",    "SENSOR"),
+    ("daily_total_energy_consumption_id", "daily_total_energy_consumption", "SENSOR"),
+    ("compressor_starts_id",              "compressor_starts",              "SENSOR"),
+    ("runtime_id",                        "runtime",                        "SENSOR"),
+    ("wifi_signal_db_id",                 "wifi_signal_db",                 "SENSOR"),
+    ("dhw_temp_id",                       "dhw_temp",                       "SENSOR"),
+    ("dhw_flow_temp_target_id",           "dhw_flow_temp_target",           "SENSOR"),
+    ("dhw_flow_temp_drop_id",             "dhw_flow_temp_drop",             "SENSOR"),
+    ("dhw_consumed_id",                   "dhw_consumed",                   "SENSOR"),
+    ("dhw_delivered_id",                  "dhw_delivered",                  "SENSOR"),
+    ("dhw_cop_id",                        "dhw_cop",                        "SENSOR"),
+    ("heating_consumed_id",               "heating_consumed",               "SENSOR"),
+    ("heating_produced_id",               "heating_produced",               "SENSOR"),
+    ("heating_cop_id",                    "heating_cop",                    "SENSOR"),
+    ("cooling_consumed_id",               "cooling_consumed",               "SENSOR"),
+    ("cooling_produced_id",               "cooling_produced",               "SENSOR"),
+    ("cooling_cop_id",                    "cooling_cop",                    "SENSOR"),
+    ("z1_flow_temp_target_id",            "z1_flow_temp_target",            "SENSOR"),
+    ("z2_flow_temp_target_id",            "z2_flow_temp_target",            "SENSOR"),
+    ("num_aa_setpoint_bias_id",           "auto_adaptive_setpoint_bias",    "NUMBER"),
+    ("num_aa_setpoint_bias_id",           "aa_bias_lim",                    "NUMBER_TRAITS"),
+    ("num_max_flow_temp_id",              "maximum_heating_flow_temp",      "NUMBER"),
+    ("num_max_flow_temp_id",              "max_flow_lim",                   "NUMBER_TRAITS"),
+    ("num_min_flow_temp_id",              "minimum_heating_flow_temp",      "NUMBER"),
+    ("num_min_flow_temp_id",              "min_flow_lim",                   "NUMBER_TRAITS"),
+    ("num_max_flow_temp_z2_id",           "maximum_heating_flow_temp_z2",   "NUMBER"),
+    ("num_max_flow_temp_z2_id",           "max_flow_z2_lim",                "NUMBER_TRAITS"),
+    ("num_min_flow_temp_z2_id",           "minimum_heating_flow_temp_z2",   "NUMBER"),
+    ("num_min_flow_temp_z2_id",           "min_flow_z2_lim",                "NUMBER_TRAITS"),
+    ("num_hysteresis_z1_id",              "thermostat_hysteresis_z1",       "NUMBER"),
+    ("num_hysteresis_z1_id",              "hysteresis_z1_lim",              "NUMBER_TRAITS"),
+    ("num_hysteresis_z2_id",              "thermostat_hysteresis_z2",       "NUMBER"),
+    ("num_hysteresis_z2_id",              "hysteresis_z2_lim",              "NUMBER_TRAITS"),
+    ("predictive_short_cycle_high_delta_time_window_id", "pred_sc_time",     "NUMBER"),
+    ("predictive_short_cycle_high_delta_time_window_id", "pred_sc_time_lim", "NUMBER_TRAITS"),
+    ("predictive_short_cycle_high_delta_threshold_id",   "pred_sc_delta",     "NUMBER"),
+    ("predictive_short_cycle_high_delta_threshold_id",   "pred_sc_delta_lim", "NUMBER_TRAITS"),
+    ("virtual_climate_z1_id",             "z1_current_temp",                "CLIMATE_CURRENT"),
+    ("virtual_climate_z1_id",             "z1_setpoint",                    "CLIMATE_TARGET"),
+    ("virtual_climate_z2_id",             "z2_current_temp",                "CLIMATE_CURRENT"),
+    ("virtual_climate_z2_id",             "z2_setpoint",                    "CLIMATE_TARGET"),
+    ("heatpump_climate_z1_id",            "eco_z1_current",                 "CLIMATE_CURRENT"),
+    ("heatpump_climate_z1_id",            "eco_z1_setpoint",                "CLIMATE_TARGET"),
+    ("heatpump_climate_z2_id",            "eco_z2_current",                 "CLIMATE_CURRENT"),
+    ("heatpump_climate_z2_id",            "eco_z2_setpoint",                "CLIMATE_TARGET"),
+    ("status_compressor_id",              "status_compressor",              "BINARY"),
+    ("status_booster_id",                 "status_booster",                 "BINARY"),
+    ("status_defrost_id",                 "status_defrost",                 "BINARY"),
+    ("status_water_pump_id",              "status_water_pump",              "BINARY"),
+    ("status_in1_request_id",             "status_in1_request",             "BINARY"),
+    ("status_in6_request_id",             "status_in6_request",             "BINARY"),
+    ("zone2_enabled_id",                  "zone2_enabled",                  "BINARY_STATE"),
+    ("predictive_short_cycle_control_enabled_id", "pred_sc_en",             "SWITCH"),
+    ("sw_auto_adaptive_id",               "auto_adaptive_control_enabled",  "SWITCH"),
+    ("sw_defrost_mit_id",                 "defrost_risk_handling_enabled",  "SWITCH"),
+    ("sw_smart_boost_id",                 "smart_boost_enabled",            "SWITCH"),
+    ("sw_force_dhw_id",                   "force_dhw",                      "SWITCH"),
+    ("version_id",                        "latest_version",                 "TEXT"),
+    ("status_operation_id",               "status_operation",               "TEXT"),
+    ("sel_heating_system_type_id",        "heating_system_type",            "SELECT_INDEX"),
+    ("sel_room_temp_source_z1_id",        "room_temp_source_z1",            "SELECT_INDEX"),
+    ("sel_room_temp_source_z2_id",        "room_temp_source_z2",            "SELECT_INDEX"),
+    ("operating_mode_z1_id",              "operating_mode_z1",              "SELECT_INDEX"),
+    ("operating_mode_z2_id",              "operating_mode_z2",              "SELECT_INDEX"),
+    ("sel_temp_source_z1_id",             "temp_sensor_source_z1",          "SELECT_INDEX"),
+    ("sel_temp_source_z2_id",             "temp_sensor_source_z2",          "SELECT_INDEX"),
+]
+
+
+# Bytes needed for /dashboard/state with these STATE_FIELDS entries at their widest
+def state_buffer_size(fields):
+    size = 3  # braces + terminator
+    for conf_key, json_key, field_type in fields:
+        size += len(json_key) + 4 + STATE_VALUE_WIDTH[field_type]
+    return size
+
+# (config key, series id, int16 scale) for the /dashboard/history ring buffer.
+# Series ids are part of the binary format (scripts/dashboard_history.py, dashboard page).
+HISTORY_SERIES = [
+    ("hp_feed_temp_id",          0, 100),
+    ("hp_return_temp_id",        1, 100),
+    ("outside_temp_id",          2, 100),
+    ("compressor_frequency_id",  3, 10),
+    ("computed_output_power_id", 4, 100),
+    ("heating_cop_id",           5, 100),
+]
 
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(): cv.declare_id(EcodanDashboard),
         cv.GenerateID(CONF_WEB_SERVER_BASE_ID): cv.use_id(web_server_base.WebServerBase),
+        cv.Optional(CONF_STREAM_INTERVAL, default="1s"):  cv.positive_time_period_milliseconds,
+        cv.Optional(CONF_STREAM_BUDGET, default=1024):    cv.int_range(min=128, max=16384),
+        cv.Optional(CONF_HISTORY_SIZE, default=1440):     cv.int_range(min=0, max=10080),
+        cv.Optional(CONF_HISTORY_INTERVAL, default="60s"): cv.All(
+            cv.positive_time_period_milliseconds, cv.Range(min=cv.TimePeriod(seconds=10))),
 
         cv.Optional("hp_feed_temp_id"):                    cv.use_id(sensor.Sensor),
         cv.Optional("hp_return_temp_id"):                  cv.use_id(sensor.Sensor),
@@ -106,6 +226,8 @@ async def to_code(config):
 
     wsb = await cg.get_variable(config[CONF_WEB_SERVER_BASE_ID])
     cg.add(var.set_web_server_base(wsb))
+    cg.add(var.set_stream_interval(config[CONF_STREAM_INTERVAL].total_milliseconds))
+    cg.add(var.set_stream_budget(config[CONF_STREAM_BUDGET]))
 
     pairs = [
         ("version_id",                        "set_version"),
@@ -174,4 +296,20 @@ async def to_code(config):
     ]
 
     for conf_key, setter in pairs:
-        await _wire(config, var, conf_key, setter)
\ No newline at end of file
+        await _wire(config, var, conf_key, setter)
+
+    # only configured entities end up in the serializer table
+    fields = [f for f in STATE_FIELDS if f[0] in config]
+    cg.add(var.reserve_state_fields(len(fields)))
+    cg.add(var.set_state_buffer_size(state_buffer_size(fields)))
+    for conf_key, json_key, field_type in fields:
+        ent = await cg.get_variable(config[conf_key])
+        cg.add(var.add_state_field(json_key, getattr(StateFieldType, field_type), ent))
+
+    # history_size 0 disables the ring buffer
+    cg.add(var.set_history_size(config[CONF_HISTORY_SIZE]))
+    cg.add(var.set_history_interval(config[CONF_HISTORY_INTERVAL].total_milliseconds))
+    for conf_key, series_id, scale in HISTORY_SERIES:
+        if conf_key in config:
+            sens = await cg.get_variable(config[conf_key])
+            cg.add(var.add_history_series(series_id, scale, sens))
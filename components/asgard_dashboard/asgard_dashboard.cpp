@@ -2,41 +2,126 @@
 #include "dashboard_html.h"
 #include "esphome/core/log.h"
 #include "esphome/core/application.h"
+#include "esphome/core/helpers.h"
 #include <esp_http_server.h>
 #include <cstdio>
 #include <cstring>
 #include <cmath>
+#include <cstdarg>
+#include <algorithm>
 
 namespace esphome {
 namespace asgard_dashboard {
 
 static const char *const TAG = "asgard_dashboard";
 
+// "%08x\r\n" chunk-size line written in front of every stream event
+static const size_t STREAM_CHUNK_HEADER = 10;
+// "event: state\ndata: " + "\n\n" + trailing chunk "\r\n", rounded up
+static const size_t STREAM_EVENT_OVERHEAD = 32;
+static const uint32_t STREAM_KEEPALIVE_MS = 15000;
+
+// Sensors are averaged over each history interval, sampled at this rate
+static const uint32_t HISTORY_SAMPLE_MS = 5000;
+// magic "EH", version, series count, u16 samples, u16 reserved, u32 interval s, u32 age of newest sample ms
+static const size_t HISTORY_HEADER_SIZE = 16;
+static const uint8_t HISTORY_FORMAT_VERSION = 1;
+
+static void put_u16_(uint8_t *p, uint16_t v) {
+  p[0] = v & 0xFF;
+  p[1] = v >> 8;
+}
+
+static void put_u32_(uint8_t *p, uint32_t v) {
+  put_u16_(p, v & 0xFFFF);
+  put_u16_(p + 2, v >> 16);
+}
+
+static uint32_t fnv1a_(const char *data, size_t len) {
+  uint32_t hash = 2166136261u;
+  while (len--) {
+    hash ^= static_cast<uint8_t>(*data++);
+    hash *= 16777619u;
+  }
+  return hash;
+}
+
+void StreamClient::destroy(void *ctx) {
+  auto *client = static_cast<StreamClient *>(ctx);
+  client->parent->remove_stream_client_(client);
+  delete client;
+}
+
 void EcodanDashboard::setup() {
   ESP_LOGI(TAG, "Setting up Ecodan Dashboard on /dashboard");
+  state_buffer_.resize(state_buffer_size_);
+
+  size_t n = state_fields_.size();
+  stream_values_.resize(state_buffer_size_);
+  stream_offsets_.resize(n);
+  stream_lengths_.resize(n);
+  stream_hashes_.resize(n);
+  stream_buffer_.resize(STREAM_CHUNK_HEADER + STREAM_EVENT_OVERHEAD + state_buffer_size_);
+
+  if (history_capacity_ > 0 && !history_series_.empty()) {
+    // prefers PSRAM when the board has it
+    RAMAllocator<int16_t> allocator;
+    history_data_ = allocator.allocate(history_capacity_ * history_series_.size());
+    if (history_data_ == nullptr) {
+      ESP_LOGW(TAG, "Could not allocate history buffer (%u slots), history disabled", (unsigned) history_capacity_);
+      history_capacity_ = 0;
+    } else {
+      ESP_LOGI(TAG, "History: %u series x %u slots every %us", (unsigned) history_series_.size(),
+               (unsigned) history_capacity_, (unsigned) (history_interval_ms_ / 1000));
+    }
+  }
+  last_history_store_ms_ = millis();
+
   base_->init();
   base_->add_handler(this);
 }
 
 void EcodanDashboard::loop() {
-  if (action_queue_.empty()) return;
+  if (!action_queue_.empty()) {
+    std::vector<DashboardAction> todo;
+    {
+      std::lock_guard<std::mutex> lock(action_lock_);
+      todo = action_queue_;
+      action_queue_.clear();
+    }
 
-  std::vector<DashboardAction> todo;
-  {
-    std::lock_guard<std::mutex> lock(action_lock_);
-    todo = action_queue_;
-    action_queue_.clear();
+    for (const auto &act : todo) {
+      this->dispatch_set_(act.key, act.s_value, act.f_value, act.is_string);
+    }
   }
 
-  for (const auto &act : todo) {
-    this->dispatch_set_(act.key, act.s_value, act.f_value, act.is_string);
+  uint32_t now = millis();
+  this->update_history_(now);
+
+  std::lock_guard<std::mutex> lock(stream_lock_);
+  if (stream_clients_.empty()) return;
+
+  bool snapshot_pending = false;
+  for (auto *client : stream_clients_) snapshot_pending |= client->needs_snapshot;
+  bool interval_due = now - last_stream_ms_ >= stream_interval_ms_;
+  if (!interval_due && !snapshot_pending) return;
+  if (interval_due) last_stream_ms_ = now;
+
+  this->update_stream_values_();
+  bool keepalive = interval_due && now - last_keepalive_ms_ >= STREAM_KEEPALIVE_MS;
+  if (keepalive) last_keepalive_ms_ = now;
+
+  for (auto *client : stream_clients_) {
+    if (client->closed) continue;
+    if (interval_due || client->needs_snapshot) this->send_stream_(client, keepalive);
   }
 }
 
 bool EcodanDashboard::canHandle(AsyncWebServerRequest *request) const {
   const auto& url = request->url();
   return (url == "/dashboard" || url == "/dashboard/" ||
-          url == "/dashboard/state" || url == "/dashboard/set");
+          url == "/dashboard/state" || url == "/dashboard/set" ||
+          url == "/dashboard/stream" || url == "/dashboard/history");
 }
 
 void EcodanDashboard::handleRequest(AsyncWebServerRequest *request) {
@@ -44,6 +129,8 @@ void EcodanDashboard::handleRequest(AsyncWebServerRequest *request) {
   if      (url == "/dashboard" || url == "/dashboard/") handle_root_(request);
   else if (url == "/dashboard/state")                   handle_state_(request);
   else if (url == "/dashboard/set")                     handle_set_(request);
+  else if (url == "/dashboard/stream")                  handle_stream_(request);
+  else if (url == "/dashboard/history")                 handle_history_(request);
   else                                                  request->send(404, "text/plain", "Not found");
 }
 
@@ -56,107 +143,217 @@ void EcodanDashboard::handle_root_(AsyncWebServerRequest *request) {
 }
 
 void EcodanDashboard::handle_state_(AsyncWebServerRequest *request) {
-  std::string j;
-  j.reserve(1500);
-  j += "{";
-
-  j += "\"hp_feed_temp\":"                     + sensor_str_(hp_feed_temp_) + ",";
-  j += "\"hp_return_temp\":"                   + sensor_str_(hp_return_temp_) + ",";
-  j += "\"outside_temp\":"                     + sensor_str_(outside_temp_) + ",";
-  j += "\"compressor_frequency\":"             + sensor_str_(compressor_frequency_) + ",";
-  j += "\"flow_rate\":"                        + sensor_str_(flow_rate_) + ",";
-  j += "\"computed_output_power\":"            + sensor_str_(computed_output_power_) + ",";
-  j += "\"daily_computed_output_power\":"      + sensor_str_(daily_computed_output_power_) + ",";
-  j += "\"daily_total_energy_consumption\":"   + sensor_str_(daily_total_energy_consumption_) + ",";
-  j += "\"compressor_starts\":"               + sensor_str_(compressor_starts_) + ",";
-  j += "\"runtime\":"                         + sensor_str_(runtime_) + ",";
-  j += "\"wifi_signal_db\":"                  + sensor_str_(wifi_signal_db_) + ",";
-
-  j += "\"dhw_temp\":"                        + sensor_str_(dhw_temp_) + ",";
-  j += "\"dhw_flow_temp_target\":"            + sensor_str_(dhw_flow_temp_target_) + ",";
-  j += "\"dhw_flow_temp_drop\":"              + sensor_str_(dhw_flow_temp_drop_) + ",";
-  j += "\"dhw_consumed\":"                    + sensor_str_(dhw_consumed_) + ",";
-  j += "\"dhw_delivered\":"                   + sensor_str_(dhw_delivered_) + ",";
-  j += "\"dhw_cop\":"                         + sensor_str_(dhw_cop_) + ",";
-
-  j += "\"heating_consumed\":"                + sensor_str_(heating_consumed_) + ",";
-  j += "\"heating_produced\":"                + sensor_str_(heating_produced_) + ",";
-  j += "\"heating_cop\":"                     + sensor_str_(heating_cop_) + ",";
-  j += "\"cooling_consumed\":"                + sensor_str_(cooling_consumed_) + ",";
-  j += "\"cooling_produced\":"                + sensor_str_(cooling_produced_) + ",";
-  j += "\"cooling_cop\":"                     + sensor_str_(cooling_cop_) + ",";
-
-  j += "\"z1_flow_temp_target\":"             + sensor_str_(z1_flow_temp_target_) + ",";
-  j += "\"z2_flow_temp_target\":"             + sensor_str_(z2_flow_temp_target_) + ",";
-
-  j += "\"auto_adaptive_setpoint_bias\":"     + number_str_(num_aa_setpoint_bias_) + ",";
-  j += "\"aa_bias_lim\":"                     + number_traits_(num_aa_setpoint_bias_) + ",";
-  
-  j += "\"maximum_heating_flow_temp\":"       + number_str_(num_max_flow_temp_) + ",";
-  j += "\"max_flow_lim\":"                    + number_traits_(num_max_flow_temp_) + ",";
-  j += "\"minimum_heating_flow_temp\":"       + number_str_(num_min_flow_temp_) + ",";
-  j += "\"min_flow_lim\":"                    + number_traits_(num_min_flow_temp_) + ",";
-
-  j += "\"maximum_heating_flow_temp_z2\":"    + number_str_(num_max_flow_temp_z2_) + ",";
-  j += "\"max_flow_z2_lim\":"                 + number_traits_(num_max_flow_temp_z2_) + ",";
-  j += "\"minimum_heating_flow_temp_z2\":"    + number_str_(num_min_flow_temp_z2_) + ",";
-  j += "\"min_flow_z2_lim\":"                 + number_traits_(num_min_flow_temp_z2_) + ",";
-
-  j += "\"thermostat_hysteresis_z1\":"        + number_str_(num_hysteresis_z1_) + ",";
-  j += "\"hysteresis_z1_lim\":"               + number_traits_(num_hysteresis_z1_) + ",";
-  
-  j += "\"thermostat_hysteresis_z2\":"        + number_str_(num_hysteresis_z2_) + ",";
-  j += "\"hysteresis_z2_lim\":"               + number_traits_(num_hysteresis_z2_) + ",";
-
-  j += "\"pred_sc_time\":"                    + number_str_(pred_sc_time_) + ",";
-  j += "\"pred_sc_time_lim\":"                + number_traits_(pred_sc_time_) + ",";
-  
-  j += "\"pred_sc_delta\":"                   + number_str_(pred_sc_delta_) + ",";
-  j += "\"pred_sc_delta_lim\":"               + number_traits_(pred_sc_delta_) + ",";  
-
-  j += "\"z1_current_temp\":"                 + climate_current_str_(virtual_climate_z1_) + ",";
-  j += "\"z1_setpoint\":"                     + climate_target_str_(virtual_climate_z1_) + ",";
-  j += "\"z2_current_temp\":"                 + climate_current_str_(virtual_climate_z2_) + ",";
-  j += "\"z2_setpoint\":"                     + climate_target_str_(virtual_climate_z2_) + ",";
-
-  j += "\"eco_z1_current\":"                  + climate_current_str_(heatpump_climate_z1_) + ",";
-  j += "\"eco_z1_setpoint\":"                 + climate_target_str_(heatpump_climate_z1_) + ",";
-  j += "\"eco_z2_current\":"                  + climate_current_str_(heatpump_climate_z2_) + ",";
-  j += "\"eco_z2_setpoint\":"                 + climate_target_str_(heatpump_climate_z2_) + ",";
-
-  j += "\"status_compressor\":"               + std::string(bin_str_(status_compressor_)) + ",";
-  j += "\"status_booster\":"                  + std::string(bin_str_(status_booster_)) + ",";
-  j += "\"status_defrost\":"                  + std::string(bin_str_(status_defrost_)) + ",";
-  j += "\"status_water_pump\":"               + std::string(bin_str_(status_water_pump_)) + ",";
-  j += "\"status_in1_request\":"              + std::string(bin_str_(status_in1_request_)) + ",";
-  j += "\"status_in6_request\":"              + std::string(bin_str_(status_in6_request_)) + ",";
-  j += "\"zone2_enabled\":"                   + std::string(bin_state_(status_zone2_enabled_) ? "true" : "false") + ",";
-
-  j += "\"pred_sc_en\":"                      + sw_str_(pred_sc_switch_) + ",";
-  j += "\"auto_adaptive_control_enabled\":"   + sw_str_(sw_auto_adaptive_) + ",";
-  j += "\"defrost_risk_handling_enabled\":"   + sw_str_(sw_defrost_mit_) + ",";
-  j += "\"smart_boost_enabled\":"             + sw_str_(sw_smart_boost_) + ",";
-  j += "\"force_dhw\":"                       + sw_str_(sw_force_dhw_) + ","; 
-  j += "\"latest_version\":\""                + text_val_(version_) + "\",";
-  j += "\"status_operation\":\""              + text_val_(status_operation_) + "\",";
-  
-  j += "\"heating_system_type\":\""           + select_idx_(sel_heating_system_type_) + "\",";
-  j += "\"room_temp_source_z1\":\""           + select_idx_(sel_room_temp_source_z1_) + "\",";
-  j += "\"room_temp_source_z2\":\""           + select_idx_(sel_room_temp_source_z2_) + "\",";
-  j += "\"operating_mode_z1\":\""             + select_idx_(sel_operating_mode_z1_) + "\",";
-  j += "\"operating_mode_z2\":\""             + select_idx_(sel_operating_mode_z2_) + "\",";
-  j += "\"temp_sensor_source_z1\":\""           + select_idx_(sel_temp_source_z1_) + "\",";
-  j += "\"temp_sensor_source_z2\":\""           + select_idx_(sel_temp_source_z2_) + "\"";
-
-  j += "}";
-
-  AsyncWebServerResponse *response =
-      request->beginResponse(200, "application/json", j.c_str());
+  // Single preallocated buffer, reused for every poll. The IDF web server sends
+  // synchronously, so holding the lock across send() keeps the buffer stable.
+  std::lock_guard<std::mutex> lock(state_lock_);
+  size_t len = serialize_state_(state_buffer_.data(), state_buffer_.size());
+  if (len == 0) {
+    ESP_LOGW(TAG, "State buffer too small (%u bytes)", (unsigned) state_buffer_.size());
+    request->send(500, "text/plain", "State buffer overflow");
+    return;
+  }
+
+  AsyncWebServerResponse *response = request->beginResponse(
+      200, "application/json", reinterpret_cast<const uint8_t *>(state_buffer_.data()), len);
   response->addHeader("Access-Control-Allow-Origin", "*");
   response->addHeader("Cache-Control", "no-cache");
   request->send(response);
 }
 
+void EcodanDashboard::handle_stream_(AsyncWebServerRequest *request) {
+  {
+    std::lock_guard<std::mutex> lock(stream_lock_);
+    if (stream_clients_.size() >= STREAM_MAX_CLIENTS) {
+      request->send(503, "text/plain", "Too many stream clients");
+      return;
+    }
+  }
+
+  // Open a chunked event-stream response and keep the socket; events are pushed from loop().
+  // The session owns the client and frees it through free_ctx when the socket closes.
+  httpd_req_t *req = *request;
+  httpd_resp_set_status(req, HTTPD_200);
+  httpd_resp_set_type(req, "text/event-stream");
+  httpd_resp_set_hdr(req, "Cache-Control", "no-cache");
+  httpd_resp_set_hdr(req, "Access-Control-Allow-Origin", "*");
+  static const char RETRY[] = "retry: 5000\n\n";
+  if (httpd_resp_send_chunk(req, RETRY, sizeof(RETRY) - 1) != ESP_OK) return;
+
+  auto *client = new StreamClient{this, req->handle, httpd_req_to_sockfd(req), true, false,
+                                  std::vector<uint32_t>(state_fields_.size(), 0)};
+  req->sess_ctx = client;
+  req->free_ctx = StreamClient::destroy;
+
+  std::lock_guard<std::mutex> lock(stream_lock_);
+  stream_clients_.push_back(client);
+  ESP_LOGD(TAG, "Stream client connected (fd %d, %u open)", client->fd, (unsigned) stream_clients_.size());
+}
+
+void EcodanDashboard::remove_stream_client_(StreamClient *client) {
+  std::lock_guard<std::mutex> lock(stream_lock_);
+  for (auto it = stream_clients_.begin(); it != stream_clients_.end(); ++it) {
+    if (*it == client) {
+      stream_clients_.erase(it);
+      break;
+    }
+  }
+  ESP_LOGD(TAG, "Stream client disconnected (fd %d, %u open)", client->fd, (unsigned) stream_clients_.size());
+}
+
+void EcodanDashboard::update_stream_values_() {
+  char *buf = stream_values_.data();
+  size_t cap = stream_values_.size();
+  size_t pos = 0;
+  for (size_t i = 0; i < state_fields_.size(); i++) {
+    size_t start = pos;
+    if (!append_value_(buf, cap, pos, state_fields_[i])) {
+      // never happens with the codegen-computed size; leave the field out rather than send garbage
+      pos = start;
+      stream_lengths_[i] = 0;
+      continue;
+    }
+    stream_offsets_[i] = static_cast<uint16_t>(start);
+    stream_lengths_[i] = static_cast<uint16_t>(pos - start);
+    stream_hashes_[i] = fnv1a_(buf + start, pos - start);
+  }
+}
+
+void EcodanDashboard::send_stream_(StreamClient *client, bool keepalive) {
+  char *buf = stream_buffer_.data() + STREAM_CHUNK_HEADER;
+  size_t cap = stream_buffer_.size() - STREAM_CHUNK_HEADER - 2;  // keep room for the chunk's trailing CRLF
+  size_t pos = 0;
+
+  // A fresh client gets every field regardless of budget; afterwards only changed fields are sent,
+  // and whatever does not fit the per-client budget stays pending until the next tick.
+  size_t budget = client->needs_snapshot ? cap : std::min(cap, stream_budget_);
+  append_(buf, cap, pos, "event: state\ndata: {");
+  bool first = true;
+  for (size_t i = 0; i < state_fields_.size(); i++) {
+    size_t len = stream_lengths_[i];
+    if (len == 0) continue;
+    if (!client->needs_snapshot && client->sent_hashes[i] == stream_hashes_[i]) continue;
+
+    const char *key = state_fields_[i].key;
+    size_t need = strlen(key) + 4 + len;
+    if (!first && pos + need + 3 > budget) continue;
+
+    append_(buf, cap, pos, first ? "\"%s\":" : ",\"%s\":", key);
+    memcpy(buf + pos, stream_values_.data() + stream_offsets_[i], len);
+    pos += len;
+    client->sent_hashes[i] = stream_hashes_[i];
+    first = false;
+  }
+
+  if (first) {
+    // nothing changed; an SSE comment now and then lets a dead socket surface as a send error
+    if (!keepalive) return;
+    pos = 0;
+    append_(buf, cap, pos, ":\n\n");
+  } else {
+    append_(buf, cap, pos, "}\n\n");
+  }
+  client->needs_snapshot = false;
+
+  if (!send_chunk_(client, buf, pos)) {
+    ESP_LOGD(TAG, "Stream send failed (fd %d), closing", client->fd);
+    client->closed = true;
+    httpd_sess_trigger_close(client->hd, client->fd);
+  }
+}
+
+bool EcodanDashboard::send_chunk_(StreamClient *client, char *buf, size_t payload_len) {
+  char header[STREAM_CHUNK_HEADER + 1];
+  snprintf(header, sizeof(header), "%08x\r\n", static_cast<unsigned>(payload_len));
+  char *start = buf - STREAM_CHUNK_HEADER;
+  memcpy(start, header, STREAM_CHUNK_HEADER);
+  buf[payload_len] = '\r';
+  buf[payload_len + 1] = '\n';
+
+  size_t total = STREAM_CHUNK_HEADER + payload_len + 2;
+  int sent = httpd_socket_send(client->hd, client->fd, start, total, 0);
+  return sent == static_cast<int>(total);
+}
+
+void EcodanDashboard::update_history_(uint32_t now) {
+  if (history_data_ == nullptr) return;
+
+  if (now - last_history_sample_ms_ >= HISTORY_SAMPLE_MS) {
+    last_history_sample_ms_ = now;
+    for (auto &series : history_series_) {
+      if (!series.sensor->has_state() || !std::isfinite(series.sensor->state)) continue;
+      series.sum += series.sensor->state;
+      series.count++;
+    }
+  }
+
+  if (now - last_history_store_ms_ < history_interval_ms_) return;
+  // a client is downloading the ring; keep averaging and store on a later loop
+  std::unique_lock<std::mutex> lock(history_lock_, std::try_to_lock);
+  if (!lock.owns_lock()) return;
+  last_history_store_ms_ = now;
+
+  for (size_t i = 0; i < history_series_.size(); i++) {
+    auto &series = history_series_[i];
+    int16_t value = HISTORY_MISSING;
+    if (series.count > 0) {
+      long scaled = lroundf(series.sum / series.count * series.scale);
+      value = static_cast<int16_t>(std::max(-32767L, std::min(32767L, scaled)));
+    }
+    history_data_[i * history_capacity_ + history_head_] = value;
+    series.sum = 0.0f;
+    series.count = 0;
+  }
+  history_head_ = (history_head_ + 1) % history_capacity_;
+  if (history_count_ < history_capacity_) history_count_++;
+}
+
+void EcodanDashboard::handle_history_(AsyncWebServerRequest *request) {
+  if (history_data_ == nullptr) {
+    request->send(404, "text/plain", "History disabled");
+    return;
+  }
+
+  // Little-endian throughout (as is the ESP32), so the int16 slots go out as stored.
+  // Layout: header, one (id, reserved, u16 scale) descriptor per series, then each
+  // series' samples oldest first. Every part is a multiple of 2 bytes so the page can
+  // view the samples as an Int16Array without copying.
+  httpd_req_t *req = *request;
+  std::lock_guard<std::mutex> lock(history_lock_);
+
+  size_t n = history_series_.size();
+  uint8_t header[HISTORY_HEADER_SIZE + 4 * HISTORY_MAX_SERIES] = {0};
+  header[0] = 'E';
+  header[1] = 'H';
+  header[2] = HISTORY_FORMAT_VERSION;
+  header[3] = static_cast<uint8_t>(n);
+  put_u16_(header + 4, static_cast<uint16_t>(history_count_));
+  put_u32_(header + 8, history_interval_ms_ / 1000);
+  put_u32_(header + 12, history_count_ > 0 ? millis() - last_history_store_ms_ : 0);
+  for (size_t i = 0; i < n; i++) {
+    uint8_t *desc = header + HISTORY_HEADER_SIZE + 4 * i;
+    desc[0] = history_series_[i].id;
+    put_u16_(desc + 2, history_series_[i].scale);
+  }
+
+  httpd_resp_set_type(req, "application/octet-stream");
+  httpd_resp_set_hdr(req, "Cache-Control", "no-cache");
+  httpd_resp_set_hdr(req, "Access-Control-Allow-Origin", "*");
+  if (httpd_resp_send_chunk(req, reinterpret_cast<const char *>(header), HISTORY_HEADER_SIZE + 4 * n) != ESP_OK) return;
+
+  size_t oldest = (history_head_ + history_capacity_ - history_count_) % history_capacity_;
+  size_t first_len = std::min(history_count_, history_capacity_ - oldest);
+  for (size_t i = 0; i < n; i++) {
+    const int16_t *row = history_data_ + i * history_capacity_;
+    if (first_len > 0 &&
+        httpd_resp_send_chunk(req, reinterpret_cast<const char *>(row + oldest), first_len * 2) != ESP_OK)
+      return;
+    if (history_count_ > first_len &&
+        httpd_resp_send_chunk(req, reinterpret_cast<const char *>(row), (history_count_ - first_len) * 2) != ESP_OK)
+      return;
+  }
+  httpd_resp_send_chunk(req, nullptr, 0);
+}
+
 void EcodanDashboard::handle_set_(AsyncWebServerRequest *request) {
   if (request->method() != HTTP_POST) {
     request->send(405, "text/plain", "Method Not Allowed");
@@ -297,59 +494,6 @@ void EcodanDashboard::dispatch_set_(const std::string &key, const std::string &s
   }
 }
 
-std::string EcodanDashboard::sensor_str_(sensor::Sensor *s) {
-  if (s == nullptr || !s->has_state()) return "null";
-  char buf[16];
-  snprintf(buf, sizeof(buf), "%.2f", s->state);
-  return std::string(buf);
-}
-
-std::string EcodanDashboard::climate_current_str_(climate::Climate *c) {
-  if (c == nullptr || std::isnan(c->current_temperature)) return "null";
-  char buf[16];
-  snprintf(buf, sizeof(buf), "%.1f", c->current_temperature);
-  return std::string(buf);
-}
-
-std::string EcodanDashboard::climate_target_str_(climate::Climate *c) {
-  if (c == nullptr || std::isnan(c->target_temperature)) return "null";
-  char buf[16];
-  snprintf(buf, sizeof(buf), "%.1f", c->target_temperature);
-  return std::string(buf);
-}
-
-std::string EcodanDashboard::number_str_(number::Number *n) {
-  if (n == nullptr || !n->has_state()) return "null";
-  char buf[16];
-  snprintf(buf, sizeof(buf), "%.1f", n->state);
-  return std::string(buf);
-}
-
-const char *EcodanDashboard::bin_str_(binary_sensor::BinarySensor *b) {
-  if (b == nullptr || !b->has_state()) return "null";
-  return b->state ? "true" : "false";
-}
-
-bool EcodanDashboard::bin_state_(binary_sensor::BinarySensor *b) {
-  return (b != nullptr && b->has_state() && b->state);
-}
-
-std::string EcodanDashboard::text_val_(text_sensor::TextSensor *t) {
-  if (t == nullptr || !t->has_state()) return "";
-  std::string out;
-  for (char c : t->state) {
-    if (c == '"') out += "\\\"";
-    else if (c == '\\') out += "\\\\";
-    else out += c;
-  }
-  return out;
-}
-
-std::string EcodanDashboard::select_idx_(select::Select *s) {
-  if (s == nullptr || !s->active_index().has_value()) return "null";
-  return std::to_string(s->active_index().value());
-}
-
 std::string EcodanDashboard::select_str_(select::Select *s) {
   if (s == nullptr) return "";
   auto val = s->current_option();
@@ -363,18 +507,5 @@ std::string EcodanDashboard::select_str_(select::Select *s) {
   return out;
 }
 
-std::string EcodanDashboard::sw_str_(switch_::Switch *sw) {
-  if (sw == nullptr) return "null";
-  return sw->state ? "true" : "false";
-}
-
-std::string EcodanDashboard::number_traits_(number::Number *n) {
-  if (n == nullptr) return "null";
-  char buf[64];
-  snprintf(buf, sizeof(buf), "{\"min\":%.1f,\"max\":%.1f,\"step\":%.1f}", 
-           n->traits.get_min_value(), n->traits.get_max_value(), n->traits.get_step());
-  return std::string(buf);
-}
-
 }  // namespace asgard_dashboard
-}  // namespace esphome
\ No newline at end of file
+}  // namespace esphome
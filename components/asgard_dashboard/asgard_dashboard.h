@@ -12,9 +12,43 @@
 #include "esphome/components/switch/switch.h"
 #include "esphome/components/select/select.h"
 
+#include "state_json.h"
+
+#include <esp_http_server.h>
+
 namespace esphome {
 namespace asgard_dashboard {
 
+// One downsampled series in the /dashboard/history ring buffer. Samples are stored as
+// int16 (value * scale); HISTORY_MISSING marks a slot where the sensor had no state.
+struct HistorySeries {
+  uint8_t id;       // fixed series id, see HISTORY_SERIES in __init__.py
+  uint16_t scale;
+  sensor::Sensor *sensor;
+  float sum;
+  uint16_t count;
+};
+
+static const int16_t HISTORY_MISSING = INT16_MIN;
+static const size_t HISTORY_MAX_SERIES = 8;
+
+class EcodanDashboard;
+
+// Maximum number of concurrent /dashboard/stream clients; further clients get 503 and fall back to polling
+static const size_t STREAM_MAX_CLIENTS = 3;
+
+// One open /dashboard/stream connection. Owned by the httpd session (freed via free_ctx on disconnect).
+struct StreamClient {
+  EcodanDashboard *parent;
+  httpd_handle_t hd;
+  int fd;
+  bool needs_snapshot;
+  bool closed;
+  std::vector<uint32_t> sent_hashes;  // per state field, hash of the value last sent to this client
+
+  static void destroy(void *ctx);
+};
+
 struct DashboardAction {
   std::string key;
   std::string s_value;
@@ -112,6 +146,24 @@ class EcodanDashboard : public Component, public AsyncWebHandler {
   void set_heatpump_climate_z1(climate::Climate *c)           { heatpump_climate_z1_ = c; }
   void set_heatpump_climate_z2(climate::Climate *c)           { heatpump_climate_z2_ = c; }
 
+  // State serializer table, filled by codegen
+  void reserve_state_fields(size_t n)                         { state_fields_.reserve(n); }
+  void set_state_buffer_size(size_t n)                        { state_buffer_size_ = n; }
+  void add_state_field(const char *key, StateFieldType type, void *entity) {
+    state_fields_.push_back({key, type, entity});
+  }
+
+  // Stream tuning
+  void set_stream_interval(uint32_t ms)                       { stream_interval_ms_ = ms; }
+  void set_stream_budget(size_t bytes)                        { stream_budget_ = bytes; }
+
+  // History ring buffer, filled by codegen
+  void set_history_size(size_t slots)                         { history_capacity_ = slots; }
+  void set_history_interval(uint32_t ms)                      { history_interval_ms_ = ms; }
+  void add_history_series(uint8_t id, uint16_t scale, sensor::Sensor *s) {
+    if (history_series_.size() < HISTORY_MAX_SERIES) history_series_.push_back({id, scale, s, 0.0f, 0});
+  }
+
   // AsyncWebHandler
   bool canHandle(AsyncWebServerRequest *request) const override;
   void handleRequest(AsyncWebServerRequest *request) override;
@@ -121,23 +173,49 @@ class EcodanDashboard : public Component, public AsyncWebHandler {
   void handle_root_(AsyncWebServerRequest *request);
   void handle_state_(AsyncWebServerRequest *request);
   void handle_set_(AsyncWebServerRequest *request);
+  void handle_stream_(AsyncWebServerRequest *request);
+  void handle_history_(AsyncWebServerRequest *request);
+  void update_history_(uint32_t now);
+  void update_stream_values_();
+  void send_stream_(StreamClient *client, bool keepalive);
+  bool send_chunk_(StreamClient *client, char *buf, size_t payload_len);
+  void remove_stream_client_(StreamClient *client);
   void dispatch_set_(const std::string &key, const std::string &sval, float fval, bool is_string);
 
-  // JSON helpers
-  static std::string sensor_str_(sensor::Sensor *s);
-  static std::string climate_current_str_(climate::Climate *c);
-  static std::string climate_target_str_(climate::Climate *c);
-  static std::string number_str_(number::Number *n);
-  static const char *bin_str_(binary_sensor::BinarySensor *b);
-  static bool bin_state_(binary_sensor::BinarySensor *b);
-  static std::string text_val_(text_sensor::TextSensor *t);
-  
-  static std::string select_idx_(select::Select *s); 
+  // JSON helpers (the writers are in state_json.h)
+  size_t serialize_state_(char *buf, size_t cap) { return serialize_state(state_fields_, buf, cap); }
   static std::string select_str_(select::Select *s);
 
-  static std::string sw_str_(switch_::Switch *sw);
-  
-  static std::string number_traits_(number::Number *n);
+  std::vector<StateField> state_fields_;
+  std::vector<char> state_buffer_;
+  size_t state_buffer_size_{0};
+  std::mutex state_lock_;
+
+  // /dashboard/stream: field values are serialized once per tick, clients get whatever differs from what they saw
+  friend struct StreamClient;
+  std::vector<StreamClient *> stream_clients_;
+  std::mutex stream_lock_;
+  std::vector<char> stream_values_;        // value text of every field, back to back
+  std::vector<uint16_t> stream_offsets_;   // start of each field's value in stream_values_
+  std::vector<uint16_t> stream_lengths_;
+  std::vector<uint32_t> stream_hashes_;
+  std::vector<char> stream_buffer_;        // outgoing event, with room for the chunk header in front
+  uint32_t stream_interval_ms_{1000};
+  size_t stream_budget_{1024};
+  uint32_t last_stream_ms_{0};
+  uint32_t last_keepalive_ms_{0};
+
+  // /dashboard/history: series-major ring, history_data_[series * capacity + slot]
+  std::vector<HistorySeries> history_series_;
+  int16_t *history_data_{nullptr};
+  size_t history_capacity_{0};
+  size_t history_head_{0};   // next slot to write
+  size_t history_count_{0};
+  uint32_t history_interval_ms_{60000};
+  uint32_t last_history_sample_ms_{0};
+  uint32_t last_history_store_ms_{0};
+  std::mutex history_lock_;
+
   std::vector<DashboardAction> action_queue_;
   std::mutex action_lock_;
 
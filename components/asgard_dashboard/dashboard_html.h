@@ -6,903 +6,964 @@ namespace esphome {
 namespace asgard_dashboard {
 
 static const uint8_t DASHBOARD_HTML_GZ[] = {
-  0x1f, 0x8b, 0x08, 0x00, 0xa5, 0xc0, 0x95, 0x69, 0x02, 0xff, 0xed, 0x7d, 0xd9, 0x96, 0xdb, 0x48,
-  0x72, 0xe8, 0xbb, 0xbe, 0x22, 0x9b, 0x33, 0x6e, 0x90, 0xa3, 0x22, 0x8a, 0x04, 0xc9, 0x5a, 0x55,
-  0xd5, 0xa3, 0xad, 0x2d, 0x8d, 0xa5, 0x96, 0x8e, 0x4a, 0x3d, 0x6d, 0xb7, 0xac, 0x53, 0x42, 0x91,
-  0x20, 0x89, 0x16, 0x08, 0xd0, 0x00, 0x58, 0x8b, 0xe4, 0x3a, 0xc7, 0x8f, 0xf7, 0xf9, 0x5e, 0x9f,
-  0xe3, 0x17, 0x7f, 0x84, 0xbf, 0xc1, 0x9f, 0x32, 0x5f, 0x72, 0x23, 0x22, 0x17, 0x64, 0x02, 0x09,
-  0x2e, 0x55, 0xa5, 0x5e, 0xdc, 0xee, 0xa5, 0x08, 0x24, 0x22, 0x32, 0x23, 0x23, 0x23, 0x23, 0x23,
-  0x72, 0x89, 0x7c, 0xf0, 0xd5, 0x93, 0x57, 0x8f, 0xdf, 0xfe, 0xd3, 0xeb, 0xa7, 0x6c, 0x9a, 0xcf,
-  0xa2, 0xe3, 0x7b, 0x0f, 0xf0, 0x87, 0x45, 0x7e, 0x3c, 0x39, 0x6a, 0x04, 0x71, 0x03, 0x13, 0x02,
-  0x7f, 0x04, 0x3f, 0xb3, 0x20, 0xf7, 0xd9, 0x70, 0xea, 0xa7, 0x59, 0x90, 0x1f, 0x35, 0xbe, 0x7f,
-  0xfb, 0x6d, 0x7b, 0xaf, 0x21, 0x93, 0x63, 0x7f, 0x16, 0x1c, 0x35, 0xce, 0xc3, 0xe0, 0x62, 0x9e,
-  0xa4, 0x79, 0x83, 0x0d, 0x93, 0x38, 0x0f, 0x62, 0x00, 0xbb, 0x08, 0x47, 0xf9, 0xf4, 0x68, 0x14,
-  0x9c, 0x87, 0xc3, 0xa0, 0x4d, 0x2f, 0x5b, 0x2c, 0x8c, 0xc3, 0x3c, 0xf4, 0xa3, 0x76, 0x36, 0xf4,
-  0xa3, 0xe0, 0xa8, 0xeb, 0x76, 0x30, 0x9b, 0x3c, 0xcc, 0xa3, 0xe0, 0xf8, 0x61, 0x36, 0xf1, 0xd3,
-  0x11, 0x7b, 0xe2, 0x67, 0xd3, 0xb3, 0x04, 0x9e, 0x1e, 0x6c, 0xf3, 0xf4, 0x7b, 0x0f, 0xb2, 0xfc,
-  0x0a, 0x7f, 0x19, 0xfb, 0x73, 0x38, 0xc3, 0x32, 0xd8, 0x22, 0x8d, 0x9a, 0xce, 0x34, 0xcf, 0xe7,
-  0xd9, 0xc1, 0xf6, 0xf6, 0x18, 0xca, 0xcb, 0xdc, 0x49, 0x92, 0x4c, 0xa2, 0xc0, 0x9f, 0x87, 0x99,
-  0x3b, 0x4c, 0x66, 0xdb, 0xc3, 0x2c, 0xf3, 0xbe, 0x19, 0xfb, 0xb3, 0x30, 0xba, 0x3a, 0xfa, 0x4b,
-  0x90, 0x3f, 0x4a, 0xfd, 0x30, 0xce, 0xee, 0xbf, 0x4c, 0xe2, 0xe4, 0xe0, 0x62, 0x32, 0xcd, 0xff,
-  0xdc, 0xeb, 0x74, 0x0e, 0xfb, 0xf0, 0xff, 0x0e, 0xfc, 0xbf, 0xdb, 0xe9, 0x7c, 0x2d, 0x40, 0x4f,
-  0xe6, 0xfe, 0x30, 0xb8, 0xff, 0xf7, 0x69, 0x92, 0x07, 0xd9, 0x47, 0x13, 0x72, 0xc0, 0xa1, 0xbf,
-  0x1e, 0x85, 0xd9, 0x3c, 0xf2, 0xaf, 0x8e, 0xb2, 0x0b, 0x7f, 0xee, 0xb4, 0x0e, 0xef, 0x01, 0x59,
-  0x07, 0x69, 0x92, 0xe4, 0xec, 0x33, 0x3c, 0x31, 0xd6, 0x6e, 0x9f, 0x4d, 0x0e, 0xd8, 0x1f, 0x3a,
-  0x7e, 0x27, 0xe8, 0xfa, 0x87, 0xf4, 0xea, 0xe1, 0xfb, 0xb8, 0x3b, 0xf0, 0x06, 0xfc, 0xbd, 0x07,
-  0xef, 0xdd, 0x41, 0x77, 0xd8, 0xeb, 0xe0, 0xfb, 0x10, 0xaa, 0x8a, 0x09, 0xbd, 0xee, 0xbe, 0xb7,
-  0x4f, 0x00, 0x49, 0x3a, 0x0a, 0x52, 0x4c, 0x0a, 0xbc, 0x51, 0xdf, 0x3f, 0x14, 0xd9, 0xfa, 0xc3,
-  0x21, 0x70, 0x15, 0xb3, 0xea, 0x0c, 0xf7, 0xc6, 0xe3, 0x43, 0x95, 0x84, 0xd9, 0xed, 0x8e, 0xc7,
-  0xe3, 0x5d, 0x4a, 0xbb, 0xf0, 0xd3, 0x18, 0x12, 0xc6, 0xe3, 0xb3, 0x8e, 0x47, 0xf9, 0x8f, 0xa0,
-  0x35, 0x29, 0xbb, 0xf1, 0xb8, 0xdf, 0x1f, 0x0c, 0x64, 0x76, 0xf3, 0x45, 0x3a, 0x8f, 0x02, 0x48,
-  0x1e, 0x76, 0xf6, 0xfa, 0xe3, 0x21, 0x42, 0xe6, 0xc1, 0x25, 0xe6, 0x1f, 0x78, 0x81, 0xcf, 0xf3,
-  0xc7, 0x04, 0x24, 0x7e, 0x6f, 0x6f, 0x7f, 0xff, 0xec, 0x4c, 0xa6, 0x60, 0x79, 0x7d, 0x7f, 0xe0,
-  0xef, 0x2a, 0xd2, 0x40, 0x48, 0x72, 0x2a, 0x60, 0xe7, 0xac, 0x47, 0x75, 0x1c, 0x26, 0x49, 0x64,
-  0x50, 0x9a, 0xfa, 0xa3, 0x70, 0x91, 0x1d, 0xb0, 0xae, 0x37, 0xbf, 0x94, 0x58, 0x33, 0x6c, 0x0c,
-  0xe6, 0xa8, 0xd6, 0x61, 0xd8, 0x3a, 0xce, 0x16, 0xc3, 0xf4, 0x0c, 0xdb, 0x01, 0x11, 0x33, 0x3f,
-  0x06, 0x34, 0x87, 0xda, 0x85, 0x89, 0x76, 0x01, 0x18, 0x4c, 0x6e, 0x67, 0x41, 0x1a, 0x8e, 0x31,
-  0xb7, 0x6b, 0x6c, 0x84, 0x3f, 0xb1, 0xcf, 0x6c, 0xe6, 0xa7, 0x93, 0x30, 0x3e, 0x80, 0x7a, 0xcf,
-  0xfd, 0xd1, 0x28, 0x8c, 0x27, 0xf8, 0x78, 0x96, 0x5c, 0xb6, 0xb3, 0xf0, 0x13, 0xbe, 0x71, 0xd6,
-  0x02, 0x87, 0x2f, 0x0f, 0x01, 0x89, 0xc1, 0xa7, 0xd1, 0x15, 0xa0, 0x9d, 0xf9, 0xc3, 0x8f, 0x93,
-  0x34, 0x59, 0xc4, 0xd0, 0x10, 0xe7, 0x7e, 0xda, 0xc4, 0x46, 0x6a, 0x1d, 0x82, 0x20, 0x47, 0x49,
-  0x2a, 0x53, 0xb0, 0xe6, 0x90, 0x86, 0xc2, 0xd6, 0xe6, 0xc2, 0x22, 0xbf, 0x20, 0x2d, 0xf0, 0x65,
-  0x16, 0xc6, 0xc0, 0x88, 0x10, 0x44, 0x06, 0xaa, 0xd9, 0xe9, 0x9c, 0x4f, 0x0b, 0x22, 0x58, 0x87,
-  0x17, 0x07, 0xff, 0x61, 0x7f, 0x0a, 0x52, 0x28, 0x93, 0x98, 0x60, 0x2b, 0xd8, 0x6b, 0x21, 0xc9,
-  0x82, 0xce, 0x3c, 0x4f, 0x66, 0x90, 0xdd, 0xfc, 0x92, 0x65, 0x49, 0x14, 0x8e, 0x24, 0x10, 0x7d,
-  0x06, 0x38, 0xca, 0x44, 0x95, 0xd2, 0xed, 0x00, 0x5c, 0x77, 0x07, 0x38, 0xcc, 0x84, 0x90, 0x1e,
-  0xb0, 0x71, 0x14, 0xc0, 0xab, 0x1f, 0x85, 0x93, 0xb8, 0x1d, 0xe6, 0xc1, 0x0c, 0x98, 0x89, 0x32,
-  0x13, 0xa4, 0x87, 0xec, 0xa7, 0x45, 0x96, 0x87, 0xe3, 0xab, 0xb6, 0xe8, 0xaf, 0x07, 0x8c, 0x98,
-  0xde, 0x3e, 0x0b, 0xf2, 0x8b, 0x20, 0x88, 0x79, 0x2b, 0x4d, 0xfc, 0x39, 0xcf, 0x17, 0x2a, 0x93,
-  0x64, 0xd0, 0x75, 0x13, 0x10, 0x2e, 0x40, 0x1b, 0x7e, 0xbc, 0x3a, 0x64, 0x79, 0x32, 0xa7, 0xaa,
-  0x7d, 0x6a, 0x87, 0xf1, 0x28, 0xb8, 0xa4, 0x6a, 0x13, 0x4d, 0xd4, 0x1e, 0x2e, 0xaf, 0x6a, 0xfb,
-  0xcc, 0x1f, 0x4d, 0x82, 0x0c, 0x6a, 0x5c, 0xa2, 0x89, 0xb2, 0x26, 0x62, 0xf1, 0xbd, 0x7d, 0x91,
-  0xe2, 0x3b, 0xfe, 0xe5, 0x09, 0x90, 0x9b, 0x62, 0x9a, 0xcc, 0x2a, 0x45, 0xee, 0x8a, 0x7e, 0x56,
-  0xca, 0x8d, 0xf2, 0x18, 0x85, 0x69, 0x30, 0xe4, 0x34, 0x42, 0xdb, 0x2d, 0x66, 0x71, 0xa9, 0xe6,
-  0x04, 0x14, 0xc4, 0x23, 0x4b, 0xdd, 0x05, 0x53, 0x28, 0x6b, 0x4b, 0x1b, 0xa3, 0x4c, 0xca, 0xd6,
-  0x07, 0x59, 0x0a, 0x24, 0x53, 0x2a, 0x22, 0xd2, 0x13, 0x92, 0x40, 0xea, 0xee, 0x80, 0xed, 0x75,
-  0xb8, 0xbc, 0x63, 0x45, 0xdc, 0xf1, 0x45, 0xfb, 0x3c, 0x48, 0x33, 0xa0, 0x0f, 0xb8, 0x61, 0x60,
-  0xf2, 0x8e, 0x2c, 0x0b, 0xb8, 0x10, 0x52, 0x84, 0xba, 0x49, 0x88, 0xb4, 0x12, 0x05, 0xec, 0x3f,
-  0x82, 0xbf, 0xb9, 0x7f, 0x06, 0xcc, 0x4d, 0x6b, 0x38, 0xcb, 0xe9, 0x13, 0x1d, 0x42, 0x88, 0x06,
-  0xfe, 0xf1, 0xe4, 0xd3, 0xfa, 0x52, 0x26, 0x04, 0xac, 0x00, 0xec, 0xcc, 0x45, 0xff, 0xe1, 0x34,
-  0xe4, 0xb1, 0x4d, 0x9e, 0xf3, 0x14, 0xfa, 0xc5, 0xdc, 0x4f, 0xa1, 0x62, 0xb2, 0xa8, 0x03, 0x16,
-  0x27, 0x71, 0x50, 0xc3, 0xb5, 0x3a, 0xd6, 0x8b, 0xee, 0x55, 0xe5, 0x8c, 0xde, 0x18, 0x24, 0x47,
-  0x66, 0x6f, 0xd8, 0x53, 0x9d, 0x61, 0xb8, 0x48, 0x33, 0x2c, 0x6f, 0x9e, 0x84, 0x5c, 0xf2, 0x45,
-  0xc5, 0xa5, 0x52, 0xe2, 0xe5, 0xf0, 0x37, 0x28, 0x89, 0x08, 0x17, 0xa2, 0xde, 0x71, 0xbd, 0x4c,
-  0x88, 0x74, 0x51, 0xdb, 0x83, 0x69, 0x72, 0x4e, 0x7d, 0xd8, 0xa6, 0x20, 0xea, 0xba, 0xb4, 0x9e,
-  0x81, 0xeb, 0x83, 0x94, 0x9e, 0x07, 0xb5, 0x52, 0xa0, 0xe7, 0x91, 0x4e, 0xce, 0xfc, 0x66, 0x67,
-  0x0b, 0xda, 0x0d, 0xff, 0x0c, 0x06, 0x5b, 0x40, 0x53, 0xb7, 0x25, 0x65, 0x00, 0x47, 0x5d, 0xd0,
-  0x83, 0x24, 0xf4, 0xba, 0x20, 0x70, 0x3e, 0xfb, 0x71, 0x38, 0xf3, 0x79, 0x45, 0xc6, 0xd0, 0x81,
-  0x9e, 0xc7, 0x80, 0xdb, 0xcb, 0x58, 0xe0, 0x67, 0x81, 0xa6, 0x9c, 0xba, 0x7d, 0x2e, 0x29, 0x97,
-  0x52, 0x68, 0xbb, 0x30, 0xe4, 0xe9, 0xc2, 0xd3, 0x61, 0xfe, 0x22, 0x4f, 0x44, 0x15, 0xf4, 0x12,
-  0x8b, 0x7a, 0xa8, 0x82, 0xcf, 0xa2, 0x64, 0xf8, 0x51, 0x50, 0xf7, 0xe7, 0x8f, 0xc1, 0xd5, 0x38,
-  0x05, 0xeb, 0x20, 0x93, 0xc5, 0x7f, 0x66, 0xe3, 0x34, 0x99, 0xc1, 0x4f, 0x02, 0xaa, 0x26, 0xcc,
-  0xaf, 0x48, 0x7d, 0x10, 0xbf, 0xc7, 0x49, 0x3a, 0x13, 0x32, 0x13, 0xf9, 0x79, 0xf0, 0x4f, 0xcd,
-  0xc1, 0xfc, 0x12, 0x6b, 0x09, 0x4a, 0x46, 0x07, 0xef, 0xd6, 0x81, 0x77, 0x08, 0x98, 0x33, 0x85,
-  0x34, 0x4e, 0xb5, 0x5b, 0xac, 0xa5, 0x22, 0xa4, 0x72, 0xb4, 0x35, 0x63, 0xaf, 0x55, 0x08, 0x72,
-  0x6d, 0x67, 0x29, 0xc9, 0xd6, 0x1e, 0xa9, 0x4e, 0xc9, 0xea, 0x1e, 0x60, 0x51, 0x8a, 0xa6, 0x22,
-  0x06, 0xd4, 0xa5, 0x75, 0xa1, 0x13, 0x59, 0x90, 0x6c, 0x08, 0x09, 0xbc, 0x56, 0xf5, 0x52, 0xc2,
-  0xa7, 0x43, 0x55, 0x24, 0xa8, 0x80, 0x6f, 0x47, 0xfe, 0x59, 0x10, 0xc9, 0x0e, 0x5a, 0x62, 0x09,
-  0xa5, 0x59, 0xeb, 0x5f, 0x68, 0xff, 0x9e, 0xea, 0x5a, 0x5a, 0x87, 0xdb, 0x33, 0x13, 0x8d, 0x7e,
-  0x49, 0xc9, 0x51, 0x90, 0x43, 0x3e, 0x6d, 0x1c, 0x52, 0xb8, 0x90, 0xc9, 0x71, 0xbf, 0xbe, 0xef,
-  0xe3, 0x4b, 0x5b, 0x6b, 0xdd, 0xc5, 0x7c, 0x1e, 0xa4, 0x43, 0x92, 0x55, 0xfa, 0x7e, 0x31, 0x05,
-  0x1a, 0x29, 0xc7, 0x00, 0x05, 0x9c, 0x0f, 0x15, 0xb2, 0x6b, 0xf2, 0xba, 0x9e, 0xfb, 0xd1, 0x02,
-  0x5b, 0x7e, 0x3d, 0x0d, 0x4e, 0x8c, 0xaf, 0xd2, 0x6f, 0xeb, 0xd5, 0xd6, 0xb2, 0xcb, 0x05, 0xbb,
-  0x53, 0xb4, 0x02, 0x4d, 0x7c, 0x34, 0x8d, 0x5a, 0x16, 0x50, 0xb4, 0x90, 0xca, 0xb0, 0x98, 0x66,
-  0x83, 0x9d, 0xa4, 0x30, 0x1e, 0xdb, 0x95, 0x45, 0xcf, 0x06, 0x8f, 0x26, 0x60, 0x19, 0x1c, 0xd3,
-  0x6c, 0xb0, 0xdc, 0x0c, 0x2c, 0x43, 0xf3, 0x54, 0xa5, 0x65, 0x44, 0x77, 0x6f, 0x93, 0x3d, 0xbe,
-  0x36, 0x7b, 0x3b, 0x15, 0xf6, 0xee, 0x22, 0x7b, 0xcb, 0x92, 0xd1, 0xab, 0x1d, 0x47, 0x97, 0x08,
-  0x44, 0x69, 0x54, 0x14, 0x16, 0x8a, 0x18, 0xa7, 0xa2, 0x60, 0x9c, 0x0b, 0x11, 0x15, 0x9d, 0x84,
-  0xa7, 0x78, 0xa5, 0x3e, 0x6b, 0xf6, 0x16, 0xf4, 0x6e, 0x72, 0xb2, 0xc6, 0xad, 0x16, 0x21, 0x7e,
-  0xb8, 0x41, 0xff, 0x2f, 0x8d, 0x2d, 0x85, 0xd2, 0xdd, 0x29, 0x34, 0x6c, 0x31, 0xb8, 0x17, 0x03,
-  0x2b, 0xa7, 0x46, 0x59, 0x8b, 0x77, 0x60, 0xcf, 0xd9, 0x79, 0xa6, 0x15, 0x16, 0x05, 0x13, 0xb0,
-  0x8d, 0x96, 0x9a, 0x13, 0x15, 0x4b, 0x8d, 0xd0, 0x39, 0x22, 0x91, 0xb3, 0x26, 0xa9, 0x94, 0xe5,
-  0x40, 0xc9, 0x07, 0x17, 0x98, 0x7d, 0xf5, 0x6e, 0x15, 0xad, 0x8a, 0x88, 0xa8, 0x51, 0x55, 0x94,
-  0x3f, 0xa2, 0xde, 0x27, 0xc7, 0x30, 0xe2, 0xaf, 0xb4, 0xc7, 0x3d, 0x45, 0x7c, 0x36, 0x4d, 0xc3,
-  0xf8, 0xa3, 0xb2, 0xc8, 0x65, 0xab, 0x43, 0xa9, 0xe0, 0x82, 0x10, 0xab, 0x0b, 0x3b, 0x37, 0x0d,
-  0x60, 0x6c, 0x81, 0xf1, 0xed, 0x50, 0x65, 0xda, 0xe9, 0xfc, 0x9d, 0x96, 0x69, 0x47, 0x71, 0x70,
-  0xe8, 0xc7, 0xe7, 0x7e, 0xa6, 0x95, 0x0e, 0x80, 0xec, 0x2b, 0xee, 0xac, 0xfa, 0x68, 0xff, 0xf0,
-  0x7e, 0x34, 0xcc, 0xd3, 0xe8, 0x67, 0x96, 0xb0, 0x6b, 0x55, 0x6e, 0x9a, 0x5c, 0xdc, 0x91, 0x20,
-  0xa9, 0x22, 0x76, 0x81, 0xc4, 0xce, 0xfa, 0x76, 0xa4, 0x26, 0x48, 0x06, 0x59, 0x07, 0x91, 0x9f,
-  0xe5, 0xed, 0x64, 0xdc, 0xce, 0xaf, 0xe6, 0x41, 0x31, 0xb2, 0xc9, 0xfc, 0xb8, 0x2d, 0x53, 0x60,
-  0xc8, 0x01, 0x4d, 0xd7, 0x35, 0x5d, 0xab, 0x12, 0x41, 0x09, 0x31, 0x7c, 0x09, 0x9e, 0xc1, 0x0d,
-  0x46, 0x09, 0xdb, 0x98, 0x40, 0x19, 0x66, 0x8b, 0x33, 0x1b, 0x41, 0x9b, 0xca, 0x32, 0xaa, 0xbb,
-  0xca, 0x90, 0xe9, 0x52, 0x0f, 0x59, 0xa9, 0x05, 0x85, 0x75, 0xdf, 0x61, 0x7d, 0x5d, 0x09, 0x4a,
-  0xee, 0xf5, 0x37, 0xb1, 0xf4, 0xb9, 0x91, 0x9a, 0x4c, 0x26, 0x51, 0x40, 0xdd, 0x7c, 0x79, 0x77,
-  0xe8, 0xed, 0x19, 0x7d, 0xac, 0x53, 0xdb, 0xc9, 0xf4, 0x1c, 0xc3, 0x78, 0xbe, 0xc8, 0x4b, 0x16,
-  0xa0, 0xc8, 0xaf, 0x53, 0x64, 0x56, 0xc2, 0xcc, 0x80, 0xd6, 0x52, 0xe7, 0xf4, 0xcf, 0xa0, 0x06,
-  0x8b, 0x1c, 0xa8, 0x09, 0xe3, 0x2c, 0xe0, 0x28, 0x77, 0x65, 0xb4, 0xf1, 0xaa, 0x54, 0xdc, 0x06,
-  0xdd, 0x46, 0xf3, 0xa3, 0x48, 0x37, 0xcd, 0x0c, 0x3a, 0x0f, 0x0e, 0xce, 0x02, 0x68, 0x2b, 0x3e,
-  0xaa, 0x8a, 0x2e, 0xe4, 0x38, 0x87, 0x56, 0xe2, 0xf9, 0xc8, 0x44, 0x63, 0x20, 0xb9, 0xd3, 0xf4,
-  0x24, 0xb5, 0x88, 0xa7, 0xf3, 0x97, 0xbf, 0x55, 0xab, 0x28, 0xc5, 0xa7, 0x54, 0x87, 0x01, 0xaa,
-  0xaa, 0xd5, 0x14, 0x17, 0x6d, 0x72, 0x30, 0x9c, 0x06, 0xc3, 0x8f, 0xc1, 0x88, 0xdd, 0xaf, 0xb2,
-  0xbd, 0xe2, 0x90, 0x74, 0xbd, 0xdd, 0x2d, 0x74, 0x46, 0xf0, 0x17, 0xfc, 0x91, 0x41, 0x51, 0xfe,
-  0x32, 0x23, 0x65, 0xfd, 0x32, 0x35, 0x16, 0xda, 0xec, 0xfd, 0x7f, 0x6c, 0x76, 0x77, 0xc9, 0x3f,
-  0xa8, 0xb2, 0x43, 0x2f, 0x52, 0xf5, 0xf8, 0x2c, 0x88, 0xc0, 0x84, 0xa9, 0x99, 0xe9, 0xb9, 0x89,
-  0x84, 0xec, 0xd6, 0x29, 0x85, 0x0d, 0x4c, 0x23, 0xa5, 0x46, 0xfb, 0xd2, 0x2b, 0xa8, 0x48, 0x5c,
-  0xb2, 0xc8, 0x23, 0x18, 0x96, 0xa4, 0x0e, 0x14, 0x72, 0xe1, 0x79, 0x9d, 0xb2, 0xc7, 0x46, 0x03,
-  0x13, 0x69, 0x0a, 0xd2, 0xe8, 0x07, 0x24, 0x57, 0xba, 0xce, 0xe3, 0x1c, 0x38, 0x18, 0x27, 0xc3,
-  0x45, 0xb6, 0x96, 0xf3, 0x90, 0xe5, 0x01, 0x2a, 0x9a, 0x8d, 0x07, 0x74, 0x85, 0x2c, 0xe6, 0x05,
-  0x24, 0xcd, 0xe6, 0x78, 0xbc, 0xa3, 0x69, 0x25, 0x83, 0xa7, 0xab, 0x1b, 0xa2, 0xc6, 0xbf, 0xae,
-  0x6d, 0x0c, 0xc1, 0xf2, 0x81, 0x95, 0xc1, 0x37, 0x1a, 0x0e, 0xe5, 0x87, 0x6a, 0xef, 0xea, 0x0e,
-  0xb2, 0x1a, 0x15, 0x28, 0x39, 0xb2, 0x9e, 0xfb, 0xb6, 0xf6, 0xb4, 0x00, 0xce, 0x0a, 0x60, 0x3f,
-  0x94, 0x73, 0x02, 0x7a, 0x49, 0xca, 0x39, 0xd7, 0x7a, 0x10, 0x4d, 0xbb, 0x37, 0x3b, 0xee, 0xde,
-  0x9e, 0x01, 0x0e, 0x23, 0xe2, 0xda, 0xe3, 0x61, 0x7f, 0x0d, 0xaf, 0x49, 0x91, 0xac, 0xf9, 0xb9,
-  0xfd, 0x3d, 0x35, 0x9a, 0x09, 0x19, 0x95, 0x7c, 0x94, 0x4e, 0x06, 0xd8, 0x70, 0x86, 0xcc, 0x70,
-  0xa9, 0x16, 0x66, 0x2b, 0x69, 0xc7, 0x52, 0xc7, 0xd9, 0xb3, 0x48, 0xd1, 0xde, 0x32, 0x29, 0x5a,
-  0x8f, 0x95, 0x9d, 0xbd, 0xda, 0x26, 0xb8, 0x53, 0xcf, 0x67, 0xf5, 0x00, 0xbf, 0xc9, 0x10, 0x24,
-  0xf9, 0x57, 0x48, 0xd8, 0x52, 0x71, 0xd9, 0x6b, 0x89, 0x99, 0xf1, 0xa9, 0x3f, 0x02, 0x13, 0x0c,
-  0xcc, 0x87, 0x0e, 0xb7, 0x23, 0xaa, 0xa0, 0xca, 0xd0, 0x56, 0x45, 0x2c, 0x13, 0xad, 0xfd, 0xbd,
-  0x32, 0x38, 0x3d, 0x40, 0x8d, 0x8d, 0x51, 0xdf, 0xed, 0x1f, 0xca, 0x6a, 0xb5, 0x83, 0x73, 0xe0,
-  0x6e, 0x56, 0x58, 0x7a, 0x85, 0x71, 0x88, 0x6b, 0x17, 0x80, 0x06, 0x7c, 0x3c, 0xfb, 0x18, 0x82,
-  0xe0, 0x00, 0x6b, 0x7c, 0x48, 0x1c, 0x96, 0x55, 0xa2, 0x69, 0x99, 0xf7, 0x2d, 0x72, 0xd1, 0xb7,
-  0x8f, 0x9e, 0x4a, 0xaf, 0x94, 0x54, 0x6d, 0x85, 0xf3, 0xd7, 0x26, 0x51, 0x07, 0x07, 0x92, 0x26,
-  0x3e, 0x60, 0xb5, 0xf3, 0xe9, 0x62, 0x76, 0xb6, 0x16, 0xa9, 0x86, 0x26, 0xec, 0xda, 0x34, 0x21,
-  0x8d, 0xdd, 0x75, 0x43, 0x5b, 0xab, 0x76, 0x42, 0xb3, 0xea, 0xe1, 0xca, 0xc1, 0xcd, 0x6c, 0xe6,
-  0x81, 0xad, 0x95, 0xfb, 0x6a, 0xc4, 0x3c, 0x0b, 0x27, 0xa0, 0x40, 0x67, 0xf3, 0x75, 0x35, 0x42,
-  0x6f, 0xa7, 0x22, 0xee, 0x3d, 0x12, 0x77, 0x60, 0x67, 0xb1, 0x22, 0xb2, 0xc4, 0x86, 0x56, 0x05,
-  0x42, 0xcf, 0x88, 0x4b, 0x86, 0xfd, 0x4e, 0xad, 0x61, 0x2f, 0xb4, 0x97, 0x9f, 0xdb, 0x3d, 0x1b,
-  0xee, 0x6c, 0xf4, 0xad, 0x5e, 0xab, 0xae, 0x52, 0xf6, 0xb4, 0x41, 0x0b, 0xf2, 0xb2, 0x3b, 0xb1,
-  0x75, 0x53, 0x87, 0x05, 0x9e, 0xc5, 0x07, 0xd8, 0xbb, 0x0b, 0x1f, 0x60, 0x85, 0x82, 0x28, 0x08,
-  0xd8, 0xcc, 0xa9, 0xe9, 0xad, 0x3f, 0xf5, 0xc5, 0x85, 0x22, 0x4a, 0x26, 0x34, 0x00, 0xa6, 0x49,
-  0x54, 0xb7, 0x96, 0xb3, 0x67, 0x99, 0xd1, 0x58, 0x3a, 0x6d, 0x00, 0x59, 0x72, 0x7d, 0xaf, 0x14,
-  0xfa, 0x0e, 0xce, 0xd9, 0x7b, 0x96, 0x1e, 0xb1, 0x73, 0xb7, 0xb6, 0x81, 0x57, 0xab, 0xb0, 0xed,
-  0x4d, 0x55, 0x51, 0xc3, 0xf5, 0x2d, 0x62, 0x6d, 0x41, 0xbd, 0xbe, 0x37, 0xb0, 0x00, 0xf4, 0xce,
-  0x22, 0x72, 0x29, 0xa6, 0xde, 0x97, 0xdb, 0xdd, 0x35, 0xc9, 0xab, 0x0c, 0xfa, 0x96, 0x5a, 0x7b,
-  0xfb, 0x03, 0x14, 0x98, 0x19, 0x13, 0x24, 0xd3, 0xa2, 0x93, 0x63, 0xdd, 0xb0, 0x36, 0xe3, 0x28,
-  0xb9, 0x68, 0x5f, 0xe1, 0x18, 0x00, 0xf2, 0x11, 0x7d, 0xa9, 0xd9, 0xf3, 0x55, 0xcd, 0x54, 0x99,
-  0x10, 0x30, 0x35, 0x90, 0x3b, 0x28, 0xcd, 0xe3, 0xce, 0x53, 0xee, 0x8b, 0x68, 0x9c, 0x05, 0xf6,
-  0xa4, 0x57, 0xd5, 0x29, 0x88, 0x82, 0x5e, 0x62, 0x16, 0x32, 0x4a, 0xfe, 0x0f, 0xe6, 0xc2, 0x40,
-  0x9f, 0x76, 0xf1, 0xf8, 0x9c, 0x88, 0xec, 0x20, 0x45, 0xff, 0x20, 0xea, 0x55, 0x41, 0xa3, 0xe0,
-  0x6c, 0x31, 0xb1, 0x2d, 0x21, 0xf5, 0xf4, 0x86, 0x0e, 0xe3, 0x71, 0xb2, 0x62, 0xe2, 0x17, 0xc1,
-  0x56, 0x4d, 0xf8, 0x52, 0xcd, 0xd2, 0x34, 0xa9, 0xac, 0x59, 0xf1, 0xbd, 0x01, 0xe5, 0xd5, 0xb5,
-  0xb3, 0x24, 0x1a, 0x69, 0x98, 0xa9, 0x7f, 0x61, 0x23, 0xb4, 0x58, 0xd4, 0x0a, 0x67, 0x41, 0x3b,
-  0xf7, 0x27, 0xb5, 0xcb, 0x59, 0x72, 0xd0, 0xef, 0xb8, 0xbb, 0x86, 0x45, 0xb8, 0xc3, 0x39, 0xc2,
-  0x3d, 0x43, 0x3f, 0xcb, 0x0d, 0xff, 0x7e, 0x1c, 0x5e, 0x06, 0x23, 0x14, 0x08, 0x7d, 0x6a, 0x34,
-  0xd5, 0xa7, 0x1a, 0x96, 0x2f, 0x9e, 0xd7, 0x19, 0x7f, 0x4b, 0x3a, 0xc5, 0x06, 0x92, 0xa5, 0x9a,
-  0x7b, 0x1f, 0x35, 0x56, 0xbf, 0xce, 0x0e, 0x5d, 0xbd, 0xcc, 0xb5, 0x47, 0x6e, 0x6c, 0xd5, 0xac,
-  0xeb, 0x65, 0xda, 0xba, 0xfa, 0xfe, 0xfe, 0x7e, 0xbd, 0xb1, 0x24, 0xb9, 0xe7, 0x66, 0x53, 0x1a,
-  0x07, 0xd7, 0x5c, 0x2b, 0x2b, 0xf0, 0xa4, 0x64, 0xd8, 0x14, 0x89, 0x12, 0x10, 0x7b, 0x2a, 0x5f,
-  0xe6, 0x9b, 0x05, 0xa3, 0xd0, 0x67, 0x4d, 0xad, 0x65, 0x77, 0x77, 0xb0, 0x5e, 0x90, 0xa7, 0x65,
-  0x7e, 0xb5, 0x3c, 0x7d, 0xca, 0xdc, 0xf1, 0x22, 0x8a, 0x38, 0x26, 0x7c, 0x9e, 0xa4, 0xe1, 0xa8,
-  0xcd, 0xc7, 0x57, 0xa8, 0x02, 0xdb, 0x66, 0xed, 0x2e, 0x5f, 0xd9, 0x7b, 0xb0, 0x2d, 0xb6, 0x01,
-  0x3d, 0xd8, 0x16, 0x9b, 0x92, 0x70, 0xf7, 0xc6, 0xf1, 0x3d, 0xbe, 0x47, 0x29, 0x48, 0x71, 0x7f,
-  0xd0, 0x83, 0x51, 0x78, 0xce, 0x86, 0x91, 0x9f, 0x65, 0x47, 0x0d, 0x63, 0xfb, 0x41, 0x83, 0x85,
-  0x23, 0x99, 0xf4, 0x88, 0xa7, 0x1c, 0xd3, 0xa2, 0x92, 0x8e, 0x41, 0xa0, 0x22, 0x1d, 0xbe, 0x90,
-  0x35, 0xa2, 0x7f, 0xe2, 0x83, 0xbc, 0x02, 0x40, 0x90, 0xf3, 0x09, 0x37, 0xeb, 0x8e, 0x1a, 0xdd,
-  0x4e, 0x43, 0x54, 0x8d, 0x3f, 0xe3, 0x3a, 0xe9, 0xa3, 0xe4, 0xf2, 0xa8, 0x81, 0x16, 0x97, 0xd7,
-  0x87, 0xff, 0x1a, 0x20, 0xd3, 0x51, 0x74, 0xd4, 0xc0, 0x86, 0x6b, 0xb0, 0x0c, 0x86, 0xd2, 0x8f,
-  0xc1, 0x51, 0x03, 0xc6, 0x16, 0x5c, 0x22, 0x7f, 0x8c, 0xfc, 0x95, 0xa9, 0x6d, 0x91, 0x67, 0x4f,
-  0x25, 0xa0, 0x26, 0x1b, 0xfa, 0xf3, 0xa3, 0x06, 0xc9, 0xbb, 0x91, 0xfc, 0x13, 0xc8, 0x85, 0x4c,
-  0x3f, 0x7e, 0x30, 0xf7, 0x81, 0x8b, 0x50, 0xd5, 0x97, 0xdd, 0x3e, 0xc8, 0xa5, 0xbb, 0xbb, 0xf3,
-  0xd7, 0x9e, 0x3b, 0xf0, 0x3d, 0x77, 0xc0, 0xf0, 0x7f, 0xa4, 0xa5, 0xd3, 0x86, 0xdf, 0xf3, 0x6e,
-  0xd7, 0xf5, 0x76, 0xfc, 0x3e, 0xa4, 0xf5, 0x29, 0xbd, 0x8b, 0x76, 0x21, 0xeb, 0x7c, 0x6a, 0x6c,
-  0x1f, 0x03, 0xa3, 0xcf, 0x27, 0x45, 0x25, 0xbf, 0x0d, 0x82, 0x91, 0x64, 0xc9, 0x36, 0xf2, 0x64,
-  0x09, 0x83, 0xb8, 0x11, 0x32, 0x4d, 0x72, 0xce, 0xef, 0xb3, 0xf6, 0x18, 0x90, 0x1b, 0xc7, 0x7f,
-  0xfb, 0xb7, 0x7f, 0xd7, 0x51, 0x1f, 0x6c, 0x03, 0xd3, 0x8f, 0xef, 0xfd, 0x2f, 0xff, 0xd7, 0xe2,
-  0xff, 0x9b, 0x20, 0x5f, 0xa4, 0xf1, 0x46, 0x2d, 0x20, 0xb9, 0x9f, 0x12, 0xea, 0x8d, 0xf8, 0xbf,
-  0x92, 0xfb, 0xbf, 0x6a, 0xde, 0xef, 0xb0, 0xee, 0x1e, 0x7b, 0x01, 0x3f, 0x3b, 0xec, 0x85, 0xd7,
-  0xc1, 0xbf, 0x5d, 0x8f, 0x79, 0xec, 0x45, 0x1f, 0x1f, 0xf7, 0xf8, 0x1f, 0x80, 0xf8, 0x51, 0x92,
-  0x65, 0x10, 0x52, 0x6a, 0x81, 0x27, 0x41, 0x94, 0xfb, 0xec, 0xed, 0xbd, 0x32, 0xfb, 0x57, 0x31,
-  0x7f, 0x94, 0xff, 0x4e, 0x05, 0x7f, 0x17, 0x58, 0xeb, 0x0f, 0x98, 0x94, 0xf6, 0x2e, 0xfc, 0x81,
-  0xef, 0xdb, 0x08, 0x70, 0xfc, 0x00, 0x11, 0xd9, 0x65, 0x17, 0x48, 0xf5, 0x1a, 0xec, 0x0a, 0x7e,
-  0xe1, 0xe7, 0xd2, 0x13, 0xaf, 0xf0, 0xbb, 0x8f, 0xa0, 0x08, 0xa4, 0x81, 0xf6, 0x5d, 0x4f, 0x00,
-  0x77, 0x3b, 0xf4, 0x88, 0x08, 0x03, 0x77, 0xa7, 0xcf, 0x51, 0xa0, 0x2b, 0xc1, 0x63, 0x15, 0xad,
-  0x2b, 0x70, 0xf6, 0x38, 0x42, 0x4f, 0x40, 0xef, 0x59, 0x40, 0xbd, 0x12, 0xac, 0xb7, 0x0c, 0xb8,
-  0xbb, 0xe7, 0xf6, 0x76, 0x04, 0x3c, 0x15, 0xcd, 0x2b, 0xb0, 0xef, 0xee, 0xee, 0x09, 0x2c, 0xa2,
-  0xd2, 0x52, 0x4a, 0x4f, 0x54, 0x59, 0xd6, 0x99, 0x83, 0xeb, 0xb0, 0xf3, 0x24, 0xba, 0x22, 0x78,
-  0x1a, 0xed, 0xa1, 0xfd, 0xf7, 0x98, 0xe7, 0x31, 0x12, 0x56, 0x2e, 0xd4, 0xf0, 0x97, 0xc3, 0x4b,
-  0xc8, 0xb2, 0xba, 0x78, 0xb5, 0xc8, 0xb3, 0x70, 0x14, 0x6c, 0xa6, 0xb1, 0x71, 0xe7, 0x81, 0x94,
-  0xdb, 0x84, 0x67, 0xf0, 0xfb, 0x12, 0xde, 0x32, 0xdb, 0x81, 0xe9, 0xa0, 0x31, 0x90, 0xdf, 0xf0,
-  0x17, 0x74, 0x77, 0x97, 0xed, 0xb3, 0x1e, 0xe8, 0x0d, 0x52, 0x23, 0xdd, 0xa5, 0x0d, 0xf0, 0x6d,
-  0x1a, 0xfc, 0xcb, 0x66, 0xdc, 0xa7, 0xfd, 0x1d, 0x6a, 0xc4, 0x04, 0xf4, 0xdf, 0xa7, 0xe2, 0x40,
-  0xc6, 0x4e, 0x3d, 0x4d, 0x57, 0x18, 0x2a, 0x65, 0x37, 0x82, 0x71, 0x73, 0xd0, 0x86, 0x7f, 0xed,
-  0x00, 0xf8, 0x1d, 0xff, 0x65, 0xda, 0xf7, 0x52, 0xc3, 0x80, 0x93, 0x7a, 0xa3, 0x61, 0x14, 0xbd,
-  0xdb, 0x14, 0x2c, 0xe7, 0xdf, 0x5d, 0x97, 0x98, 0x24, 0xb1, 0xea, 0x11, 0xdd, 0x1e, 0x48, 0x7e,
-  0x8f, 0xa1, 0x59, 0xe3, 0xd1, 0xdf, 0x2e, 0x6a, 0x26, 0xe8, 0x18, 0xa0, 0xdf, 0x31, 0x05, 0xfe,
-  0x02, 0x84, 0xec, 0x18, 0x80, 0x69, 0x51, 0x4c, 0xf3, 0x45, 0xbe, 0x59, 0xcf, 0x40, 0x27, 0x56,
-  0xd3, 0x4b, 0x80, 0xff, 0x3b, 0x1d, 0x53, 0x81, 0xd3, 0xee, 0xce, 0x7e, 0x04, 0x83, 0xde, 0x0e,
-  0xc3, 0x3f, 0xfe, 0x1e, 0x0c, 0x0a, 0x68, 0x35, 0x76, 0xdb, 0x30, 0x06, 0xf5, 0xba, 0x68, 0x39,
-  0xd6, 0x88, 0xfd, 0xeb, 0x34, 0x19, 0xdd, 0x42, 0x1f, 0xcd, 0x01, 0xfd, 0xf7, 0xcb, 0xf4, 0xf3,
-  0xae, 0x55, 0x1f, 0xa1, 0xaa, 0x8a, 0xfa, 0xed, 0x7e, 0xed, 0xb7, 0xb6, 0xf1, 0x11, 0xe7, 0x8d,
-  0x19, 0x54, 0x04, 0xad, 0x06, 0x6e, 0xea, 0xc8, 0x2a, 0x7b, 0x45, 0x95, 0xc1, 0x78, 0x48, 0x2f,
-  0xd1, 0x1e, 0x02, 0x34, 0x44, 0xd0, 0xf2, 0xdc, 0x87, 0xae, 0x76, 0xee, 0xd9, 0x0a, 0x1b, 0x94,
-  0xbe, 0x98, 0x4d, 0xff, 0x38, 0x89, 0xb3, 0x1b, 0x69, 0x3c, 0xf0, 0xd7, 0xb3, 0xdf, 0xb9, 0x01,
-  0xd0, 0x63, 0x50, 0x78, 0x8f, 0xf4, 0x1a, 0x8c, 0x3e, 0x1d, 0x73, 0xc4, 0x2f, 0xc6, 0xac, 0x8e,
-  0xdb, 0xdf, 0x07, 0x0b, 0xc1, 0xdf, 0x07, 0x03, 0x81, 0xf7, 0x47, 0xcf, 0xed, 0x7a, 0xed, 0x7d,
-  0x30, 0x11, 0x5f, 0x10, 0x7a, 0x5d, 0xdb, 0x9c, 0xe4, 0x7e, 0x9a, 0xdf, 0xac, 0x75, 0x32, 0x42,
-  0xfd, 0x5d, 0xb5, 0xcf, 0x30, 0x4c, 0x87, 0x11, 0xd8, 0xa9, 0x97, 0xbc, 0xcf, 0x0c, 0x45, 0x37,
-  0x4a, 0x89, 0x28, 0x60, 0x2d, 0xff, 0x6e, 0x69, 0x47, 0xe8, 0x8e, 0x64, 0xb5, 0xe1, 0x7f, 0xf0,
-  0xd0, 0x5f, 0x66, 0xb9, 0xbd, 0x59, 0x6c, 0xe6, 0x66, 0x33, 0xbe, 0x4d, 0x56, 0x79, 0xdb, 0x8b,
-  0x18, 0xa7, 0x42, 0x7f, 0x9f, 0xca, 0x72, 0x00, 0x1c, 0x76, 0x07, 0x03, 0x1f, 0xcc, 0x82, 0x6e,
-  0x97, 0x2f, 0x26, 0xe3, 0xfc, 0x47, 0x67, 0x8f, 0x59, 0x15, 0xa8, 0xdb, 0xf7, 0xd8, 0xbe, 0x8f,
-  0x2d, 0xb2, 0x23, 0x80, 0xbd, 0xae, 0x8b, 0xcf, 0x16, 0xe0, 0x3d, 0x77, 0x00, 0x1d, 0x69, 0xc7,
-  0xed, 0x76, 0x7d, 0x74, 0xe8, 0x39, 0xf8, 0x8e, 0xbb, 0x3f, 0x58, 0xee, 0x57, 0x76, 0xa4, 0x63,
-  0xe9, 0x76, 0xa4, 0xa3, 0xd5, 0x29, 0x1c, 0x2d, 0xb3, 0xe5, 0x7f, 0x08, 0xbf, 0x0d, 0x6f, 0xd4,
-  0x15, 0x2f, 0xc2, 0x71, 0x58, 0xd7, 0xe0, 0xda, 0x83, 0x7d, 0x6a, 0x92, 0x66, 0xb3, 0x2d, 0xf3,
-  0x90, 0xc5, 0x39, 0x21, 0x5e, 0x0c, 0xae, 0x25, 0x60, 0x4a, 0xe3, 0xf8, 0x9c, 0x4a, 0x12, 0x99,
-  0x0a, 0x24, 0x84, 0xc0, 0x0d, 0x94, 0xdf, 0xcf, 0x47, 0x85, 0x8d, 0x6a, 0x12, 0xc0, 0x67, 0x4c,
-  0x71, 0x8a, 0xf4, 0xde, 0x83, 0xd8, 0x57, 0xe5, 0x88, 0x03, 0x44, 0x44, 0xc1, 0x83, 0xb3, 0x45,
-  0x9e, 0x27, 0xb1, 0xf1, 0x29, 0x8f, 0x19, 0x5f, 0x65, 0x6a, 0xb0, 0x24, 0x1e, 0x46, 0xe1, 0xf0,
-  0xe3, 0x51, 0x23, 0xbb, 0x08, 0xf3, 0xe1, 0xf4, 0xad, 0x7f, 0xd6, 0x74, 0x66, 0x49, 0x1c, 0xe6,
-  0x49, 0xea, 0x6c, 0xb1, 0x7c, 0x1a, 0x66, 0xad, 0xc6, 0xf1, 0x4b, 0x9e, 0xf0, 0x60, 0x9b, 0xe7,
-  0x55, 0x9f, 0xad, 0x3d, 0xbf, 0x2c, 0xc8, 0xf3, 0x30, 0x9e, 0x64, 0x45, 0x86, 0x27, 0x22, 0xe5,
-  0xa6, 0x39, 0xe2, 0xd2, 0x95, 0x96, 0xdb, 0x55, 0x86, 0x8b, 0xbb, 0x2f, 0x12, 0x3d, 0xc3, 0x07,
-  0xdb, 0xc0, 0x10, 0xe4, 0x8b, 0x64, 0x25, 0x9d, 0x6f, 0x11, 0x55, 0x6b, 0xc8, 0x52, 0x8c, 0x63,
-  0x36, 0x82, 0x27, 0xe5, 0xf9, 0x66, 0x6d, 0xff, 0x78, 0x31, 0xa1, 0x6d, 0x69, 0x5d, 0x7d, 0x67,
-  0x37, 0xc8, 0xa3, 0xf6, 0xc5, 0xd8, 0x66, 0x8f, 0x9d, 0xee, 0x2a, 0x82, 0x1e, 0x2b, 0xcf, 0x34,
-  0xaa, 0x0a, 0xc0, 0xc8, 0x91, 0x2f, 0x32, 0xf6, 0x16, 0x74, 0x0d, 0xca, 0x32, 0x6f, 0xe3, 0xb2,
-  0x54, 0x98, 0x44, 0xc9, 0xe9, 0x77, 0xd4, 0xa4, 0x7c, 0xab, 0x32, 0x56, 0x35, 0xa3, 0x8c, 0x1e,
-  0x23, 0x08, 0xe9, 0x50, 0xfa, 0x72, 0x5c, 0x16, 0x9e, 0x3b, 0xa9, 0x66, 0xf1, 0x59, 0xd4, 0xca,
-  0x5c, 0x1f, 0xd3, 0xf7, 0x5d, 0xe9, 0x5b, 0xca, 0x68, 0xd7, 0x56, 0xa1, 0x22, 0x37, 0xe0, 0xd5,
-  0xdb, 0x60, 0x36, 0x0f, 0xc0, 0x69, 0x5b, 0xa4, 0x41, 0xa6, 0xf1, 0xa6, 0x22, 0x3f, 0x62, 0x39,
-  0x55, 0xf4, 0xe7, 0x3c, 0x6e, 0x03, 0x7c, 0x90, 0xb7, 0x3f, 0x25, 0xc9, 0xac, 0x51, 0xa6, 0x95,
-  0xaf, 0xb8, 0x18, 0x2b, 0x7d, 0x7b, 0x96, 0x3d, 0xec, 0x9a, 0x2c, 0x52, 0x66, 0x0f, 0xa3, 0xe8,
-  0x47, 0xc8, 0xae, 0x09, 0x22, 0xf8, 0x06, 0xdf, 0x19, 0xbe, 0xe9, 0x22, 0xad, 0x29, 0x0a, 0x3b,
-  0x17, 0xf9, 0x06, 0x77, 0x7d, 0x24, 0xd0, 0x40, 0xb4, 0xdd, 0xf7, 0xa6, 0x38, 0x15, 0xdb, 0xe2,
-  0x55, 0x4d, 0xb4, 0x25, 0x33, 0x71, 0x5a, 0xb7, 0x21, 0xda, 0x1b, 0x67, 0xf9, 0x0d, 0x2a, 0xee,
-  0xa6, 0x10, 0x7e, 0x02, 0x58, 0x16, 0xc2, 0xa7, 0xb2, 0xef, 0xbe, 0x18, 0x96, 0x06, 0xf3, 0xc0,
-  0xcf, 0xe9, 0xec, 0x07, 0x88, 0xb9, 0x9f, 0xb6, 0x27, 0xb8, 0x0c, 0x07, 0x82, 0xd4, 0xdc, 0xef,
-  0x8c, 0x82, 0xc9, 0x96, 0x3c, 0x0f, 0xcd, 0x37, 0x49, 0x6f, 0xe9, 0x67, 0x13, 0x69, 0xf7, 0x25,
-  0x6e, 0x26, 0x95, 0x44, 0xfe, 0xd8, 0x65, 0x6f, 0x41, 0x8c, 0x82, 0xfc, 0x0b, 0xb0, 0x63, 0x0c,
-  0xff, 0x74, 0x3a, 0x5a, 0x49, 0x8f, 0xf9, 0x70, 0xfc, 0x8b, 0xb0, 0xa4, 0xd3, 0x41, 0x72, 0x80,
-  0x25, 0x7b, 0x65, 0x96, 0xec, 0x89, 0x6d, 0x18, 0x3a, 0x4f, 0x70, 0xf6, 0x84, 0x81, 0x42, 0x26,
-  0xc3, 0x6a, 0x4d, 0x7a, 0xf9, 0xd8, 0x14, 0x4c, 0xda, 0x9f, 0x3c, 0x6b, 0x67, 0xba, 0xe3, 0x0a,
-  0xf1, 0x93, 0xec, 0x6b, 0xb5, 0xb1, 0xb7, 0x59, 0x1b, 0x6b, 0x15, 0x69, 0xa3, 0x05, 0x75, 0xeb,
-  0xda, 0x60, 0xef, 0xdb, 0x3f, 0xeb, 0x6b, 0xf4, 0x6c, 0x26, 0x09, 0x3a, 0x41, 0x38, 0x3d, 0xf5,
-  0x73, 0xb0, 0x77, 0xcf, 0xf7, 0xce, 0x02, 0x6f, 0x3d, 0x79, 0xf1, 0x96, 0xc8, 0x8b, 0x3e, 0x54,
-  0xdd, 0x60, 0xd4, 0xc2, 0x9d, 0x62, 0x3f, 0xdf, 0x98, 0xb5, 0xd9, 0xa8, 0xf3, 0x38, 0x99, 0xcd,
-  0x41, 0xe7, 0x67, 0x49, 0x4a, 0xd3, 0xc0, 0x8b, 0x20, 0x1e, 0x5e, 0xfd, 0xf2, 0xba, 0xfd, 0x19,
-  0x6f, 0xd8, 0x2f, 0xae, 0xde, 0x1f, 0x27, 0x49, 0xf4, 0x65, 0xca, 0xe1, 0xda, 0x5b, 0x96, 0xf3,
-  0xe4, 0xd9, 0x0f, 0x5f, 0xa4, 0x2e, 0x18, 0x42, 0x43, 0x96, 0xf1, 0x22, 0x98, 0x40, 0x43, 0x07,
-  0x51, 0xe4, 0x7f, 0x81, 0xa2, 0xb8, 0xa2, 0x52, 0xd5, 0x09, 0xc6, 0x69, 0x92, 0x7d, 0x99, 0xe1,
-  0xa6, 0xd3, 0x29, 0x86, 0x9b, 0x47, 0x09, 0x94, 0x12, 0xa4, 0x77, 0xd9, 0x17, 0x71, 0xb1, 0x62,
-  0xd3, 0xbe, 0x28, 0xcf, 0xc0, 0x59, 0xfa, 0x9f, 0xd9, 0xbd, 0x8e, 0x5f, 0x07, 0x29, 0xee, 0x5d,
-  0xc1, 0x3d, 0xb4, 0x1a, 0x71, 0x55, 0x0a, 0xc5, 0x31, 0x32, 0xc5, 0x02, 0x33, 0x20, 0x46, 0xa7,
-  0x64, 0x40, 0x6e, 0x66, 0x80, 0x7a, 0xc5, 0x79, 0x1c, 0xdc, 0x63, 0x5c, 0xee, 0xa7, 0x22, 0x33,
-  0x0e, 0xd0, 0xd3, 0xcf, 0xeb, 0xf4, 0xca, 0xc7, 0x75, 0xd4, 0xce, 0xb1, 0x6e, 0x67, 0x77, 0x6b,
-  0xd0, 0x13, 0xbb, 0xec, 0xcc, 0x5d, 0x43, 0x7b, 0x7a, 0xec, 0x8e, 0x7a, 0xca, 0xca, 0x27, 0x12,
-  0x64, 0x3a, 0xdf, 0xa4, 0x23, 0xe3, 0xb0, 0x68, 0xb4, 0x96, 0xe6, 0x0e, 0xf6, 0xb4, 0xb9, 0x83,
-  0xbd, 0xbb, 0x99, 0x3b, 0xf0, 0x6e, 0x31, 0x77, 0x00, 0x0e, 0x3e, 0xce, 0x15, 0x0c, 0x1e, 0x1a,
-  0xdb, 0x24, 0x70, 0x1e, 0xa1, 0xeb, 0x0d, 0x3b, 0xed, 0xae, 0xdb, 0xdb, 0x6b, 0xbb, 0x83, 0xb6,
-  0xd7, 0xee, 0xb6, 0x7b, 0xf0, 0xd6, 0xd9, 0xf5, 0x70, 0x92, 0xad, 0xdf, 0x6b, 0xbb, 0x9e, 0xd7,
-  0x6f, 0xf7, 0xdd, 0xce, 0x00, 0x68, 0x6e, 0xef, 0x30, 0x81, 0xed, 0xb1, 0xbe, 0xbb, 0xcf, 0xfa,
-  0x6c, 0x87, 0x9e, 0xbb, 0xee, 0x0e, 0xeb, 0xb1, 0x1e, 0x3c, 0xf7, 0xd8, 0xc0, 0x1d, 0xf8, 0xbb,
-  0x6c, 0x57, 0x4e, 0x9c, 0xf7, 0x59, 0x87, 0xb2, 0xef, 0xba, 0x1e, 0x64, 0x46, 0x59, 0x42, 0x31,
-  0xb8, 0x5f, 0x83, 0xcf, 0x33, 0xe0, 0x3c, 0x06, 0xa0, 0xd6, 0xce, 0xac, 0xdb, 0x7a, 0xac, 0x10,
-  0x08, 0x3a, 0x75, 0xd8, 0x35, 0x5b, 0x40, 0x17, 0x74, 0xb5, 0x65, 0xb8, 0x51, 0xa3, 0x9d, 0x2d,
-  0xf0, 0xda, 0xc4, 0x03, 0xb8, 0x36, 0xe3, 0xf6, 0x14, 0xda, 0x7f, 0x4e, 0xfe, 0x3e, 0x7b, 0xfc,
-  0xea, 0x75, 0x99, 0x98, 0x7a, 0xda, 0xb4, 0x23, 0x18, 0xfa, 0x0c, 0xc4, 0x72, 0x2a, 0x9f, 0xc7,
-  0x6c, 0x1b, 0x97, 0x70, 0x58, 0xf3, 0xe3, 0x0f, 0xd3, 0xd6, 0xba, 0xc4, 0x1e, 0xf3, 0xf9, 0x13,
-  0x8d, 0xe4, 0x30, 0x56, 0xdd, 0x94, 0x4b, 0xab, 0xbe, 0xa1, 0x50, 0x9f, 0x49, 0x81, 0xe2, 0x2a,
-  0xc8, 0xc9, 0x22, 0xaf, 0xc5, 0x36, 0x90, 0x97, 0x31, 0xa3, 0xaa, 0xf2, 0x7e, 0xd3, 0x1a, 0xa5,
-  0x7c, 0x06, 0xe8, 0x4b, 0x28, 0x14, 0x11, 0xc7, 0xe9, 0x37, 0xa3, 0x50, 0x96, 0xac, 0x24, 0xe3,
-  0x9a, 0x8e, 0xf5, 0x0b, 0x38, 0x87, 0xdd, 0x1d, 0x5a, 0xb7, 0x61, 0xf6, 0x85, 0x9d, 0x3e, 0xdb,
-  0x8b, 0xe8, 0x1b, 0xb3, 0x2e, 0xfb, 0xec, 0xb0, 0x7e, 0xc4, 0x71, 0xad, 0xd8, 0x7b, 0xcc, 0xeb,
-  0x44, 0x84, 0xac, 0xa3, 0x7f, 0x09, 0x7d, 0x62, 0xb7, 0xc2, 0xd6, 0xd0, 0x27, 0xc3, 0xdf, 0x9e,
-  0x3e, 0x19, 0xde, 0x46, 0x9f, 0x0c, 0x7f, 0x3d, 0xfa, 0xa4, 0xb4, 0xdf, 0x9c, 0x26, 0x9a, 0x7e,
-  0x6d, 0x56, 0xcb, 0xee, 0xce, 0x56, 0xcf, 0xfb, 0xa2, 0x56, 0x0b, 0x45, 0xac, 0xfb, 0xcd, 0x28,
-  0x99, 0xdb, 0xac, 0xc9, 0xdf, 0x4d, 0x4f, 0xaf, 0xfa, 0x41, 0x6b, 0xf4, 0xf2, 0xd1, 0x6f, 0xaf,
-  0x97, 0x8f, 0x6e, 0xd3, 0xcb, 0x47, 0x5f, 0xaa, 0x97, 0x6b, 0xab, 0x2b, 0xbc, 0xd7, 0x9b, 0x4b,
-  0x08, 0x72, 0x35, 0xc3, 0xba, 0x86, 0x50, 0x2c, 0x1e, 0x94, 0xfa, 0x35, 0x6d, 0x7f, 0x37, 0x0e,
-  0xaf, 0xd1, 0x7e, 0x78, 0x9c, 0xf3, 0xc0, 0xbd, 0xfb, 0x62, 0x63, 0x7c, 0x26, 0xa7, 0x6b, 0x9a,
-  0x18, 0x98, 0xab, 0x3d, 0x0e, 0xf3, 0x2d, 0x3c, 0x57, 0x31, 0xf3, 0x2f, 0x9b, 0xbd, 0x41, 0x07,
-  0x67, 0x67, 0xba, 0xe3, 0xb4, 0xd5, 0x92, 0x7d, 0xc9, 0xae, 0x8f, 0x34, 0x1f, 0x6c, 0xa9, 0x17,
-  0xf6, 0x23, 0xf4, 0x26, 0xd6, 0xad, 0x9f, 0xc5, 0x90, 0xba, 0xed, 0xd8, 0x58, 0x2b, 0x2b, 0x22,
-  0x75, 0x34, 0x8e, 0x5f, 0xd1, 0x4c, 0x3c, 0x1e, 0x00, 0x7d, 0x99, 0x8c, 0x02, 0xc9, 0x6c, 0x71,
-  0x26, 0x5f, 0x87, 0xe7, 0x49, 0x5c, 0x58, 0xe1, 0xb9, 0xfd, 0xa9, 0x3b, 0x03, 0x04, 0x9a, 0x4f,
-  0x9f, 0xe2, 0x91, 0x03, 0x4c, 0x8d, 0x47, 0x27, 0x04, 0xd5, 0x74, 0x12, 0x99, 0xed, 0x29, 0x42,
-  0x9d, 0x7e, 0xea, 0x16, 0x4b, 0x3d, 0x0f, 0x92, 0x39, 0x56, 0x81, 0x6c, 0x6b, 0x31, 0xd3, 0xc7,
-  0xb4, 0x15, 0x81, 0x07, 0xdb, 0xe2, 0xbb, 0x01, 0x47, 0x33, 0x56, 0x2b, 0xa1, 0x70, 0x8a, 0x27,
-  0x88, 0x33, 0x0a, 0xab, 0x86, 0x93, 0x76, 0xe7, 0x55, 0x38, 0x1c, 0x81, 0xd7, 0x29, 0x95, 0xe0,
-  0x56, 0x96, 0x0a, 0x00, 0x49, 0xca, 0x9e, 0xa4, 0x57, 0xec, 0xfb, 0xb9, 0x3d, 0x8b, 0x65, 0x24,
-  0x6d, 0x73, 0x9e, 0x1e, 0xdf, 0xa6, 0xfd, 0xde, 0x24, 0xc9, 0x8c, 0x48, 0x64, 0x27, 0xc9, 0x22,
-  0x1d, 0x6e, 0xd6, 0x82, 0x59, 0x3a, 0xac, 0x6b, 0xc0, 0x14, 0xf2, 0x3d, 0x45, 0xd1, 0x3e, 0xcd,
-  0x28, 0x5f, 0x6b, 0x13, 0xf2, 0xc2, 0xa7, 0x41, 0x3a, 0x4b, 0x50, 0x45, 0x54, 0x1b, 0x25, 0x99,
-  0x05, 0xec, 0x61, 0x96, 0x85, 0x19, 0x46, 0xda, 0x81, 0xfe, 0xff, 0xe6, 0xe9, 0xc9, 0x5b, 0xf6,
-  0xf0, 0xf5, 0xf3, 0x0a, 0xa4, 0x88, 0x2f, 0xfb, 0xd7, 0x30, 0xcd, 0x17, 0x7e, 0x64, 0xcd, 0xf3,
-  0x2e, 0xb8, 0xc5, 0x19, 0x05, 0xed, 0x01, 0xad, 0x76, 0x03, 0x7e, 0xe5, 0x59, 0x1d, 0xbb, 0x38,
-  0xa7, 0x28, 0xe3, 0x65, 0x0c, 0xab, 0xd6, 0x8f, 0x3d, 0xc7, 0x58, 0x1b, 0x15, 0x7e, 0x3c, 0x39,
-  0xe9, 0xee, 0x5d, 0x7a, 0x9d, 0x4a, 0xfa, 0xcb, 0x37, 0x8f, 0x57, 0x70, 0xc4, 0xa6, 0x34, 0x64,
-  0x1c, 0x9c, 0x86, 0x8d, 0x80, 0x1f, 0x2d, 0xfa, 0x63, 0xa5, 0x45, 0x53, 0x44, 0xeb, 0x24, 0x9b,
-  0xa6, 0x5f, 0x3d, 0x5e, 0x4a, 0x47, 0xea, 0x4a, 0xc6, 0xcd, 0x71, 0xad, 0x5d, 0xac, 0x4f, 0xb0,
-  0x1b, 0xfb, 0x30, 0xc4, 0xf1, 0x63, 0x35, 0x48, 0x14, 0xeb, 0x79, 0x68, 0x0e, 0xf1, 0xc6, 0xf9,
-  0xd4, 0x6d, 0x0b, 0x43, 0x82, 0x8f, 0x18, 0xd4, 0xa2, 0xff, 0xfd, 0x5f, 0x8f, 0x8d, 0xa1, 0x63,
-  0xe5, 0xb0, 0x7e, 0xd8, 0xa8, 0x25, 0xcf, 0x9c, 0x2a, 0x37, 0xa1, 0x28, 0x12, 0x07, 0xa0, 0x9a,
-  0x4b, 0x97, 0x32, 0xd0, 0x83, 0xbe, 0xf6, 0x0d, 0x49, 0x4d, 0x07, 0x68, 0xcd, 0xe6, 0x20, 0x18,
-  0x6d, 0x34, 0xd6, 0x80, 0xdc, 0xff, 0xf3, 0x7f, 0xd5, 0x6a, 0x63, 0x39, 0x5f, 0x1c, 0x71, 0x2d,
-  0xf5, 0xee, 0x96, 0x82, 0x14, 0x0e, 0x74, 0x3e, 0x64, 0x1c, 0xab, 0xd8, 0x68, 0xb0, 0x29, 0x5d,
-  0xf7, 0x39, 0x5d, 0xf7, 0x0b, 0xaa, 0xaa, 0xdc, 0xbb, 0x4d, 0x0f, 0x7c, 0x86, 0xeb, 0xe4, 0x69,
-  0x00, 0x2a, 0x81, 0x7d, 0x1d, 0x9f, 0x65, 0xf3, 0xc3, 0xc2, 0x24, 0x00, 0x12, 0xa6, 0xf0, 0xd5,
-  0xa8, 0xb6, 0x6e, 0x13, 0xc8, 0x33, 0x8b, 0xfa, 0x51, 0x40, 0xed, 0x24, 0xa0, 0x69, 0x2d, 0xf0,
-  0x1f, 0x1e, 0xd0, 0x08, 0x43, 0x57, 0x81, 0x91, 0x88, 0xbd, 0xb6, 0x61, 0x92, 0xca, 0x93, 0xb4,
-  0xc2, 0x1b, 0xc8, 0x58, 0x30, 0x5b, 0xdd, 0x6e, 0x03, 0x63, 0xb8, 0x1c, 0x35, 0x7a, 0x6e, 0x07,
-  0x89, 0x09, 0xe6, 0x22, 0x51, 0x2d, 0x2b, 0xc8, 0xf8, 0x2e, 0xdd, 0x7e, 0x07, 0xf9, 0x9f, 0xc4,
-  0x54, 0xd6, 0x51, 0x03, 0x73, 0xa1, 0x3e, 0x8d, 0x3c, 0x75, 0xd4, 0xaa, 0x8b, 0x7d, 0x85, 0x5b,
-  0x46, 0x61, 0x28, 0x96, 0xb8, 0x3f, 0x75, 0xf5, 0xa6, 0x81, 0xcf, 0x38, 0xc4, 0x53, 0x56, 0x52,
-  0x99, 0x98, 0x2b, 0x1b, 0xb2, 0xbb, 0xe1, 0xb1, 0xcb, 0xc6, 0xf1, 0xc3, 0xf9, 0x3c, 0xba, 0x62,
-  0x35, 0x9d, 0x5c, 0x2e, 0x6a, 0x2f, 0xd5, 0x10, 0x6a, 0xaa, 0x9a, 0x7b, 0x11, 0x3c, 0xb2, 0x07,
-  0xf8, 0x41, 0x23, 0x3f, 0x9b, 0x06, 0xb5, 0xd1, 0x67, 0x39, 0xd8, 0x40, 0xd3, 0x02, 0x94, 0xc2,
-  0x77, 0x08, 0x3c, 0x1d, 0x26, 0x23, 0x68, 0xe2, 0xff, 0x51, 0x2a, 0x27, 0x18, 0x26, 0xed, 0xdf,
-  0x92, 0xda, 0x11, 0xf4, 0x4a, 0xd5, 0x33, 0xb8, 0x6b, 0xd5, 0xa3, 0xf2, 0xbf, 0xa1, 0xfa, 0xd1,
-  0xe9, 0xbb, 0xcf, 0xe9, 0xdb, 0x40, 0x05, 0xad, 0xea, 0x54, 0x3c, 0xf7, 0x52, 0xc7, 0xe2, 0x62,
-  0xb9, 0x46, 0xd7, 0xea, 0x94, 0xe2, 0x67, 0x99, 0xe7, 0xc1, 0xab, 0x3e, 0xcf, 0xa1, 0xec, 0x87,
-  0x42, 0xf0, 0xa5, 0x91, 0x6e, 0xd9, 0x54, 0xb2, 0xc4, 0xfa, 0x27, 0xe2, 0xf1, 0xa9, 0x6e, 0x81,
-  0xfe, 0x70, 0x6d, 0x07, 0xc1, 0xfb, 0x65, 0x1c, 0x04, 0x6f, 0x13, 0x07, 0xc1, 0xfb, 0x5f, 0x07,
-  0xe1, 0x36, 0x0e, 0x02, 0x71, 0x1d, 0x1e, 0x80, 0xeb, 0x68, 0xd4, 0x7f, 0x19, 0x7f, 0xc1, 0xdb,
-  0xc8, 0x5f, 0xf0, 0x7e, 0xf7, 0xfe, 0x82, 0xb7, 0x99, 0xbf, 0xe0, 0xfd, 0xcc, 0xfe, 0xc2, 0xe6,
-  0x9e, 0x82, 0xf7, 0x9b, 0xf7, 0x14, 0xbc, 0xdf, 0x90, 0xa7, 0xe0, 0x7d, 0x41, 0x4f, 0xc1, 0xbb,
-  0x85, 0xa7, 0xe0, 0xfd, 0xf2, 0x9e, 0x82, 0xf7, 0x4b, 0x7a, 0x0a, 0xde, 0x17, 0xf0, 0x14, 0xbc,
-  0x1b, 0x78, 0x0a, 0x9e, 0xdd, 0x53, 0xf0, 0x6e, 0xe9, 0x29, 0x78, 0xbf, 0x2a, 0x4f, 0xc1, 0xfb,
-  0x1f, 0xe1, 0x29, 0x78, 0xbf, 0x31, 0x4f, 0xc1, 0xfb, 0xc2, 0x9e, 0x82, 0x77, 0x4b, 0x4f, 0xc1,
-  0xfb, 0xa2, 0x9e, 0x82, 0x57, 0xe7, 0x29, 0x78, 0x3f, 0x87, 0xa7, 0xe0, 0x6d, 0xea, 0x29, 0xac,
-  0xe1, 0x06, 0x3c, 0x5c, 0xe4, 0x09, 0x7b, 0x38, 0xf2, 0xe7, 0x78, 0x3a, 0xe2, 0x36, 0x4a, 0xf9,
-  0x69, 0xec, 0x9f, 0x45, 0x60, 0xa3, 0x3d, 0xc4, 0xf3, 0x8b, 0x18, 0x70, 0x4e, 0x8a, 0x30, 0x8f,
-  0xb1, 0x27, 0x0f, 0x7e, 0x14, 0xb1, 0x84, 0x1b, 0xa6, 0x6a, 0xa5, 0x98, 0xc2, 0x67, 0x89, 0x90,
-  0x85, 0xec, 0xa2, 0xed, 0xfb, 0x15, 0x13, 0x89, 0xce, 0x88, 0x34, 0x1d, 0x5c, 0x3e, 0x39, 0xf5,
-  0x05, 0xcd, 0xa7, 0x22, 0xbe, 0xdd, 0x69, 0x40, 0x04, 0x8c, 0x44, 0x43, 0xb8, 0x22, 0x46, 0x71,
-  0xab, 0x44, 0xb2, 0x11, 0xaf, 0xb8, 0xa1, 0x94, 0xfc, 0x36, 0x51, 0x79, 0x2b, 0x8b, 0x50, 0x6c,
-  0x08, 0xc4, 0x93, 0xbb, 0x39, 0xe7, 0xf1, 0x6d, 0x39, 0x30, 0x9a, 0xd5, 0x71, 0x60, 0xc4, 0xcb,
-  0x3a, 0x4d, 0xc3, 0xec, 0xe3, 0x29, 0x7c, 0x1f, 0xe1, 0xde, 0x81, 0x5f, 0x9c, 0x03, 0x27, 0x20,
-  0xf3, 0x39, 0xa3, 0x0d, 0x8b, 0xb7, 0xad, 0x7a, 0x76, 0x56, 0x57, 0xf5, 0x0c, 0x0b, 0x39, 0x3d,
-  0xc3, 0x42, 0xee, 0xbe, 0xc2, 0xcb, 0x0d, 0x5f, 0xf2, 0xc1, 0x58, 0x71, 0xbc, 0xe9, 0x16, 0x9c,
-  0x12, 0x5a, 0x99, 0x3d, 0x0a, 0xfd, 0x4c, 0x12, 0x74, 0x1b, 0xdd, 0xec, 0xfb, 0xed, 0x33, 0xc8,
-  0x6a, 0x13, 0xa3, 0x10, 0x39, 0x2d, 0xd0, 0x6e, 0xa8, 0x70, 0x8b, 0x42, 0xd7, 0xb2, 0xf8, 0x36,
-  0x63, 0xd1, 0x4b, 0xff, 0x92, 0x3b, 0xd1, 0x38, 0x25, 0x78, 0x27, 0x0c, 0x02, 0x7b, 0xeb, 0x06,
-  0xfc, 0x41, 0x2b, 0xed, 0xc6, 0xec, 0xe1, 0x45, 0x7e, 0x09, 0xee, 0x84, 0xf1, 0x5d, 0x73, 0x27,
-  0x8c, 0x6f, 0xc2, 0x1d, 0x18, 0xe2, 0x6e, 0xce, 0x1d, 0x2a, 0x72, 0x1d, 0xee, 0xe8, 0x4c, 0x12,
-  0x25, 0xa3, 0xe5, 0xa4, 0xb6, 0x37, 0xdb, 0xcf, 0x7c, 0x69, 0x66, 0xa4, 0x79, 0xd5, 0x4c, 0x91,
-  0xa2, 0x99, 0xa8, 0x75, 0x16, 0x6a, 0xcd, 0x26, 0xff, 0x8d, 0x44, 0xd8, 0xbb, 0x3b, 0x11, 0x6e,
-  0x93, 0xad, 0x71, 0x13, 0x29, 0x06, 0x8e, 0xdd, 0x46, 0x90, 0x79, 0xc1, 0xeb, 0xb4, 0xd6, 0x2d,
-  0xa4, 0xd9, 0xbb, 0x3b, 0x69, 0xbe, 0x21, 0xa3, 0x08, 0xf1, 0x56, 0x32, 0xbd, 0x3e, 0xa3, 0xd6,
-  0x99, 0x6e, 0xb1, 0x38, 0x53, 0xf5, 0xbe, 0xd4, 0x4a, 0x89, 0x87, 0xa1, 0x67, 0x8a, 0x57, 0xb1,
-  0x3e, 0xbe, 0xc2, 0x83, 0xf9, 0xba, 0xa9, 0x72, 0x73, 0x5d, 0xf4, 0x3a, 0x0d, 0x46, 0x21, 0x8f,
-  0x6b, 0x7b, 0x47, 0xa6, 0xdf, 0x3c, 0x1b, 0xd6, 0x0d, 0xff, 0x73, 0x55, 0xd8, 0x69, 0x86, 0x35,
-  0x39, 0x1d, 0x62, 0x4d, 0x7e, 0x35, 0x46, 0x20, 0x1e, 0xef, 0x65, 0x3f, 0x84, 0xf1, 0x08, 0x84,
-  0x19, 0x43, 0x6b, 0xb6, 0xee, 0x42, 0x9e, 0x81, 0x1d, 0xe0, 0x2c, 0xc5, 0x9b, 0xb8, 0x5d, 0xb4,
-  0x91, 0x8a, 0xa3, 0xdd, 0x50, 0x96, 0x8b, 0x42, 0xd7, 0xf2, 0xa5, 0x36, 0xb5, 0x95, 0x29, 0x3a,
-  0xdf, 0x34, 0x0d, 0xa0, 0x11, 0xa3, 0x11, 0x6b, 0x82, 0xcb, 0x7b, 0x67, 0xac, 0x1a, 0x61, 0xe6,
-  0x37, 0x61, 0x16, 0x21, 0xde, 0x82, 0x5d, 0xb2, 0xe0, 0xe5, 0x0c, 0x5b, 0xe5, 0x70, 0x1a, 0x0e,
-  0xe6, 0xc3, 0x87, 0x4d, 0xab, 0x5b, 0x49, 0xfd, 0x79, 0x50, 0x4c, 0xd7, 0x94, 0xdc, 0xb8, 0x3b,
-  0x77, 0x13, 0xcb, 0x9b, 0x16, 0x7f, 0x91, 0xe9, 0x96, 0xb7, 0x7e, 0xfc, 0x91, 0x56, 0x28, 0x96,
-  0x4d, 0xb8, 0x50, 0xe8, 0x85, 0xe9, 0xc5, 0x17, 0x9e, 0x56, 0xd1, 0xcf, 0xa1, 0xde, 0x4a, 0x60,
-  0x91, 0xd4, 0xcd, 0x66, 0x54, 0x64, 0x05, 0x6f, 0x3c, 0x4f, 0xa2, 0x8a, 0xdc, 0x7c, 0x92, 0xa4,
-  0xcc, 0x0d, 0x7d, 0x77, 0x74, 0xa9, 0x61, 0x49, 0x38, 0xef, 0xd5, 0xee, 0x19, 0x15, 0xa7, 0xe2,
-  0x74, 0x05, 0x61, 0x9f, 0xb6, 0x12, 0x8b, 0x2a, 0x65, 0x38, 0x6d, 0x83, 0x2c, 0xd5, 0x47, 0xc0,
-  0x2f, 0xdb, 0x18, 0xba, 0x21, 0x09, 0x4f, 0xd2, 0x64, 0xbe, 0x6e, 0xf1, 0xa3, 0x54, 0xec, 0xce,
-  0xbd, 0x9b, 0xa2, 0x31, 0x02, 0xd4, 0x62, 0x86, 0x47, 0xfb, 0xd7, 0x2b, 0xbe, 0x1c, 0xf8, 0xe9,
-  0x96, 0xc5, 0x63, 0xec, 0xb1, 0xc5, 0x70, 0xfd, 0xe2, 0xcb, 0xc1, 0xc6, 0xee, 0x6c, 0xa2, 0xff,
-  0xdb, 0x24, 0x1d, 0x06, 0x0c, 0x74, 0x0f, 0xfb, 0x2e, 0xb9, 0xb8, 0xad, 0x51, 0x31, 0x06, 0x52,
-  0xeb, 0xac, 0x8a, 0x31, 0x16, 0x74, 0x0a, 0x00, 0x77, 0x68, 0x38, 0xac, 0xa5, 0xdf, 0xa1, 0x6e,
-  0x42, 0xc1, 0x0b, 0x45, 0x4e, 0x8a, 0xd6, 0xae, 0xbe, 0x97, 0x6e, 0x5c, 0xc6, 0xa0, 0x29, 0xf5,
-  0x9b, 0x96, 0xd7, 0x3e, 0x57, 0xbd, 0xfa, 0x60, 0x35, 0xbb, 0x41, 0xec, 0x13, 0x1e, 0xbc, 0x45,
-  0x97, 0xc9, 0x22, 0x06, 0x4e, 0x32, 0x69, 0xf3, 0x88, 0x26, 0xb6, 0xb9, 0xe2, 0xca, 0xd5, 0x01,
-  0x96, 0xbb, 0x38, 0xf4, 0xa9, 0x54, 0xea, 0x3a, 0x31, 0x12, 0x15, 0x4f, 0x5c, 0xd7, 0xd5, 0xcb,
-  0xd4, 0x9f, 0xab, 0x55, 0xd5, 0x2f, 0xca, 0xd0, 0xd5, 0xd6, 0x92, 0xb0, 0x23, 0x73, 0x7f, 0x91,
-  0x05, 0x8f, 0x8c, 0x16, 0xe5, 0xe2, 0xf1, 0x1a, 0x3f, 0x60, 0xdc, 0x10, 0x7a, 0x30, 0x5b, 0x73,
-  0x59, 0xa6, 0x2a, 0x1b, 0x30, 0x68, 0xfd, 0x14, 0x79, 0x86, 0x99, 0x3c, 0xc6, 0x97, 0x1b, 0x64,
-  0x02, 0x16, 0x68, 0x1c, 0x25, 0xfe, 0x48, 0xe6, 0xf3, 0x44, 0xbc, 0xaf, 0x9f, 0x95, 0xe9, 0x78,
-  0x6c, 0x70, 0xe5, 0x95, 0xce, 0x91, 0x34, 0x9c, 0x4c, 0x82, 0xf4, 0xfb, 0x39, 0x16, 0x8d, 0x64,
-  0xbc, 0xf4, 0x63, 0x5c, 0x56, 0xfa, 0x36, 0x4c, 0x67, 0x17, 0x7e, 0x1a, 0x30, 0xfe, 0xa5, 0x44,
-  0x54, 0x4d, 0x5b, 0x09, 0x79, 0xc9, 0x8c, 0x73, 0xcd, 0x0a, 0x54, 0xb3, 0x73, 0x0c, 0x45, 0x30,
-  0x0e, 0x65, 0xb0, 0xaf, 0x04, 0xac, 0x3b, 0xfe, 0x66, 0x0b, 0xbb, 0xc0, 0x90, 0xfc, 0x79, 0x7e,
-  0xd4, 0x70, 0xcf, 0xc2, 0x58, 0x57, 0x14, 0x73, 0x7e, 0xa0, 0xb9, 0xa8, 0x83, 0xd9, 0x05, 0x95,
-  0x6a, 0xf0, 0x33, 0xb1, 0xc4, 0xcf, 0x1f, 0x95, 0xbd, 0xf7, 0x20, 0x1b, 0xa6, 0xe1, 0x3c, 0x3f,
-  0xbe, 0x87, 0x6a, 0x3a, 0x67, 0xcf, 0x9e, 0x9f, 0xbc, 0x7d, 0xf5, 0xe6, 0x9f, 0x4e, 0x5f, 0x3e,
-  0xff, 0xee, 0xfb, 0xb7, 0x4f, 0x4f, 0xd8, 0x11, 0xeb, 0xf6, 0xfb, 0x78, 0x01, 0x33, 0xff, 0xfc,
-  0xfa, 0xd5, 0x8b, 0x17, 0xa7, 0x2f, 0x31, 0x79, 0xd0, 0xe9, 0x74, 0x0e, 0xef, 0x89, 0x64, 0xd0,
-  0x11, 0x79, 0x92, 0x5e, 0x41, 0xf2, 0x67, 0xa8, 0x21, 0x46, 0x2c, 0x83, 0x5e, 0x33, 0x9b, 0x67,
-  0x07, 0xec, 0xdd, 0xfb, 0x2d, 0x86, 0x01, 0xdb, 0xf9, 0x53, 0x8a, 0x97, 0x2a, 0xe2, 0xc3, 0xa7,
-  0x6e, 0x36, 0x17, 0x4f, 0x9e, 0x7a, 0xea, 0xa2, 0x55, 0x24, 0x53, 0xd5, 0x33, 0x64, 0xf8, 0xa9,
-  0x8b, 0xf1, 0x28, 0xe4, 0x97, 0xe2, 0x19, 0x8f, 0x8a, 0xf3, 0x27, 0xdc, 0x8c, 0xc3, 0x9f, 0x80,
-  0x3d, 0xe0, 0x6f, 0xcd, 0xe6, 0xc5, 0x1b, 0xcd, 0xc6, 0xf2, 0x57, 0xc8, 0x0b, 0x53, 0xc4, 0x04,
-  0x75, 0x01, 0x32, 0x5f, 0xe8, 0x08, 0x61, 0xdc, 0xd5, 0x5f, 0x76, 0xf0, 0xe5, 0xde, 0xb5, 0xaa,
-  0xec, 0x5c, 0xdc, 0x3c, 0x75, 0xc4, 0x2f, 0xc0, 0x56, 0x13, 0x8d, 0x07, 0x2c, 0x06, 0x85, 0xb5,
-  0xc5, 0xe4, 0xd4, 0x9a, 0xf1, 0x0e, 0xbe, 0x8a, 0x7c, 0x17, 0x38, 0x62, 0xd2, 0xa2, 0x04, 0xa5,
-  0x25, 0x21, 0x9c, 0xf4, 0x73, 0x14, 0x54, 0x61, 0xc9, 0xeb, 0xd9, 0x09, 0xa3, 0x49, 0x4f, 0xe2,
-  0xbb, 0xd2, 0x14, 0x9e, 0xd8, 0x27, 0x5a, 0x24, 0x14, 0x3b, 0xd7, 0xb4, 0xe2, 0xf8, 0x02, 0x55,
-  0x81, 0xe4, 0xd9, 0x90, 0x34, 0x18, 0x8d, 0x2b, 0x18, 0x2e, 0xec, 0xe9, 0x28, 0xcc, 0x91, 0x2d,
-  0x90, 0xca, 0x13, 0xb3, 0x20, 0x3d, 0x0f, 0x52, 0x0c, 0x2e, 0x15, 0x88, 0x74, 0xf1, 0xe1, 0xc5,
-  0xf3, 0x97, 0xcf, 0xdf, 0x9e, 0x58, 0x58, 0xf8, 0x19, 0x17, 0xdf, 0x0e, 0x58, 0x7b, 0xb0, 0x85,
-  0xab, 0xd3, 0x07, 0x0c, 0x7e, 0xd1, 0x2e, 0xc4, 0xcb, 0xbd, 0xba, 0xec, 0x5a, 0x67, 0x5e, 0x01,
-  0xdc, 0xeb, 0x08, 0xe0, 0x9d, 0x3a, 0x68, 0xe2, 0xa0, 0x80, 0xf6, 0x24, 0xf4, 0xa0, 0x3e, 0x6f,
-  0xde, 0x0a, 0xab, 0xb2, 0x2f, 0x72, 0x37, 0xe0, 0x97, 0x17, 0x50, 0xb4, 0xa8, 0x00, 0xef, 0xba,
-  0x0a, 0x1e, 0x9f, 0x24, 0xc2, 0x40, 0x14, 0xa0, 0x37, 0x78, 0x05, 0xa3, 0x67, 0xc3, 0x50, 0xc2,
-  0x20, 0xc0, 0xfb, 0x8a, 0xfe, 0x12, 0xb0, 0x21, 0x27, 0x32, 0x6f, 0x95, 0x75, 0xc7, 0x42, 0xbc,
-  0x6c, 0xfb, 0x55, 0xc0, 0x08, 0xab, 0x0b, 0xd8, 0x32, 0x78, 0x45, 0x89, 0x2e, 0x5c, 0x2b, 0x10,
-  0x34, 0xb9, 0x3b, 0x79, 0xfb, 0xf4, 0xf5, 0xe9, 0xd3, 0x17, 0x16, 0x51, 0x72, 0xb4, 0xf5, 0x03,
-  0xa7, 0x24, 0x39, 0x4e, 0x31, 0x77, 0xee, 0xe8, 0x3d, 0xd4, 0x29, 0x66, 0x8d, 0x9d, 0xaa, 0x40,
-  0x38, 0xc6, 0x5c, 0xa5, 0x53, 0xea, 0xb4, 0x8e, 0x31, 0x41, 0xe7, 0x94, 0xfa, 0xaf, 0xa3, 0x4d,
-  0x78, 0x38, 0x95, 0x96, 0x75, 0x0c, 0x0f, 0xdf, 0x31, 0xdb, 0xd1, 0x29, 0x1c, 0x2a, 0xc7, 0x6c,
-  0x34, 0x47, 0xed, 0x5d, 0x75, 0x4a, 0x5d, 0xda, 0x31, 0x76, 0xb6, 0x3a, 0x46, 0xef, 0x76, 0xd4,
-  0x3a, 0xb6, 0x53, 0xea, 0xd3, 0x8e, 0xb1, 0xca, 0xed, 0x10, 0x9b, 0xa3, 0x80, 0x77, 0xee, 0xbf,
-  0x07, 0x2b, 0x76, 0xca, 0x03, 0x02, 0x02, 0xb3, 0x41, 0xf7, 0xe3, 0x87, 0x30, 0x0e, 0xf3, 0xd0,
-  0xa7, 0x58, 0x64, 0x4f, 0x70, 0x11, 0xf8, 0x88, 0x8d, 0xfd, 0x28, 0x0b, 0xf8, 0x47, 0xb0, 0x2f,
-  0x52, 0xfc, 0x12, 0x8c, 0xcc, 0x74, 0x15, 0x6d, 0x07, 0x92, 0xb9, 0x62, 0x51, 0x31, 0x3f, 0x54,
-  0x8a, 0x16, 0x47, 0x4e, 0xa4, 0x1d, 0xde, 0x1b, 0x2f, 0x62, 0x1e, 0x2d, 0xaf, 0x34, 0x6e, 0xe3,
-  0xdd, 0x61, 0xc9, 0x10, 0x5c, 0x92, 0x38, 0x77, 0xc1, 0xef, 0x7d, 0x1a, 0x05, 0xf8, 0xf8, 0xe8,
-  0xea, 0xf9, 0xa8, 0xe9, 0xc8, 0x51, 0xd5, 0x69, 0xb9, 0x34, 0xe8, 0x37, 0xe9, 0x86, 0x19, 0x95,
-  0x53, 0x69, 0xf4, 0xa4, 0xe1, 0x8b, 0xcb, 0x15, 0x1f, 0xa4, 0x8f, 0xd6, 0xc9, 0xf9, 0x10, 0x90,
-  0xc2, 0x31, 0x6b, 0x12, 0x8a, 0x8b, 0x69, 0x99, 0x1b, 0x05, 0xf1, 0x24, 0x9f, 0xb2, 0xa3, 0x23,
-  0x60, 0x55, 0x8b, 0xf1, 0x4b, 0x33, 0x0e, 0x55, 0xe6, 0x08, 0x03, 0x79, 0x6b, 0x08, 0xef, 0x3a,
-  0xef, 0xb5, 0xcf, 0x40, 0xd2, 0x13, 0x3f, 0xf7, 0xb1, 0xe6, 0xc1, 0x05, 0xfb, 0x56, 0xbc, 0x36,
-  0xa9, 0x24, 0xf9, 0xd1, 0xc5, 0xdb, 0x00, 0xe3, 0x51, 0xb3, 0xb1, 0xe0, 0x41, 0x1a, 0xb7, 0x28,
-  0xd7, 0x56, 0x91, 0xcb, 0xe5, 0x34, 0x15, 0x19, 0xfc, 0xe3, 0xcb, 0x17, 0xcf, 0xf2, 0x7c, 0xfe,
-  0x06, 0xa3, 0x07, 0x65, 0x39, 0xcf, 0x06, 0xbe, 0xba, 0x0b, 0xaa, 0xb6, 0xeb, 0x8f, 0x46, 0x4f,
-  0xf1, 0x02, 0xa0, 0x17, 0x30, 0x8a, 0x07, 0x60, 0xb7, 0x34, 0x1b, 0xe0, 0x33, 0x4d, 0x30, 0xe6,
-  0x10, 0x64, 0xda, 0x0c, 0x5a, 0xec, 0xe8, 0x98, 0x18, 0xc3, 0x6b, 0x19, 0x88, 0xba, 0xe1, 0x06,
-  0xd0, 0x45, 0x8e, 0x13, 0x9a, 0x2d, 0xf1, 0x55, 0x16, 0x8c, 0xf7, 0x96, 0x61, 0x08, 0xa7, 0x23,
-  0xf6, 0xd2, 0xcf, 0xa7, 0x2e, 0x9d, 0x72, 0x6d, 0x22, 0x1e, 0x14, 0x06, 0xb2, 0xb0, 0xcd, 0x02,
-  0x37, 0x07, 0xee, 0x45, 0x2d, 0xf6, 0x27, 0xbc, 0x64, 0x91, 0xc8, 0xc1, 0x7f, 0xf0, 0xb2, 0xa1,
-  0xb7, 0x68, 0x9d, 0x34, 0x3f, 0xf0, 0x06, 0xa1, 0xe3, 0xcc, 0x7f, 0xfc, 0x2c, 0xf2, 0xbb, 0xfe,
-  0xbb, 0x0f, 0x02, 0x14, 0x2f, 0x1a, 0xba, 0x56, 0xb5, 0xa8, 0x92, 0x8f, 0xb8, 0x48, 0x7a, 0x89,
-  0x72, 0x04, 0xe6, 0x72, 0x45, 0xed, 0xe2, 0x41, 0xd1, 0x8a, 0xf2, 0xa2, 0xec, 0xc6, 0xdf, 0xfe,
-  0xf3, 0xff, 0xb1, 0x93, 0x05, 0x98, 0x5b, 0x59, 0xf6, 0x15, 0x7b, 0x13, 0x80, 0xf9, 0x20, 0x0c,
-  0x76, 0x64, 0x31, 0x4a, 0x71, 0x41, 0x70, 0x90, 0xe3, 0x94, 0x6a, 0xb2, 0xc8, 0x9b, 0xbc, 0xac,
-  0x28, 0x19, 0xd2, 0x86, 0x58, 0x37, 0x0d, 0xb8, 0x40, 0x6d, 0xb1, 0x2e, 0x1a, 0x4a, 0x92, 0x6e,
-  0x16, 0x00, 0xba, 0xa5, 0xcc, 0x0f, 0x7f, 0xfb, 0xcf, 0xff, 0x60, 0x4f, 0xf1, 0xce, 0xa4, 0x0f,
-  0x18, 0x05, 0x6b, 0x11, 0x58, 0x2b, 0x9a, 0x40, 0x7b, 0x37, 0x1b, 0xaf, 0x5f, 0x9d, 0xbc, 0x05,
-  0x4a, 0x1a, 0xdb, 0xa2, 0xdd, 0xd5, 0x67, 0xf4, 0xd8, 0x9a, 0x52, 0x3a, 0x20, 0xf5, 0xfa, 0x5e,
-  0x21, 0xe7, 0x45, 0x00, 0x4b, 0xf4, 0xbe, 0x9e, 0x8f, 0xc0, 0xb6, 0xc9, 0x63, 0x5e, 0x7b, 0x25,
-  0xe0, 0x20, 0x1c, 0xe9, 0x15, 0xdf, 0xe8, 0x99, 0xa4, 0x0f, 0xa3, 0xa8, 0xe9, 0xb8, 0xba, 0xab,
-  0x06, 0x3d, 0x08, 0x32, 0x7f, 0xea, 0x83, 0x47, 0x0a, 0x1e, 0x2e, 0x54, 0x36, 0x88, 0x5c, 0xb2,
-  0x2e, 0x91, 0xef, 0x50, 0xe1, 0x59, 0x72, 0x1e, 0x34, 0x1d, 0x1e, 0xc8, 0xd2, 0x69, 0x11, 0x55,
-  0x7a, 0xee, 0xe5, 0xee, 0x43, 0x59, 0x3b, 0xec, 0x3e, 0xe3, 0x04, 0xb5, 0xb4, 0xbc, 0xa0, 0x41,
-  0x8b, 0x8c, 0xca, 0xf9, 0x58, 0xa8, 0x14, 0xf1, 0x3a, 0x6f, 0x40, 0x20, 0x5e, 0x7a, 0x57, 0x5b,
-  0xae, 0xa6, 0x26, 0x32, 0xff, 0x3c, 0x78, 0xc6, 0x6d, 0x5c, 0x52, 0x37, 0xfc, 0x42, 0x37, 0x6c,
-  0xed, 0xe8, 0x04, 0x12, 0xfd, 0x49, 0x00, 0xdc, 0xcf, 0x9f, 0x83, 0x62, 0x83, 0x0c, 0x68, 0x8b,
-  0xef, 0xa9, 0x30, 0x89, 0x41, 0xc3, 0xfe, 0xe5, 0xe4, 0xd5, 0x77, 0x20, 0x77, 0x29, 0x08, 0x51,
-  0x38, 0xbe, 0x6a, 0x8a, 0x0f, 0x2d, 0x54, 0x44, 0x0c, 0xc4, 0x05, 0xc9, 0x85, 0x3c, 0xf1, 0x3a,
-  0xaa, 0xa2, 0x40, 0x94, 0x1e, 0xad, 0x40, 0xd5, 0xa7, 0xf1, 0xde, 0xb4, 0x23, 0xb3, 0xe0, 0x49,
-  0x4d, 0xc1, 0x4a, 0x2d, 0x7d, 0x05, 0x48, 0xba, 0x0a, 0x22, 0xe2, 0xef, 0x15, 0xdd, 0x15, 0x2b,
-  0x87, 0x1a, 0x9a, 0xe8, 0x9c, 0xfb, 0x29, 0xb8, 0x87, 0x88, 0x71, 0xa8, 0xfa, 0x0d, 0x01, 0xb8,
-  0x85, 0x55, 0xcf, 0xbe, 0xfe, 0x9a, 0x95, 0xd3, 0xa4, 0xc2, 0x3b, 0x66, 0x5a, 0xa7, 0x62, 0xaf,
-  0xce, 0x7e, 0x82, 0x76, 0x72, 0x3f, 0x06, 0x57, 0x99, 0xaa, 0xb7, 0x6a, 0xa4, 0x8f, 0x45, 0xef,
-  0x64, 0x46, 0x51, 0xef, 0x3e, 0xbe, 0xc7, 0x22, 0x1e, 0xa6, 0xa9, 0x7f, 0xe5, 0x86, 0x19, 0xfd,
-  0xaa, 0x2f, 0xad, 0x96, 0x8e, 0x03, 0xff, 0x88, 0x7c, 0x11, 0xe9, 0x88, 0x49, 0xa8, 0xc3, 0x02,
-  0x44, 0x74, 0x3a, 0xcc, 0xfd, 0xa3, 0xcb, 0xc3, 0x5c, 0xff, 0x10, 0xe6, 0x53, 0x3c, 0x40, 0x81,
-  0x9e, 0x84, 0xd3, 0x62, 0xff, 0xfa, 0xaf, 0xac, 0xf4, 0xc5, 0xe3, 0x5f, 0x96, 0x16, 0x85, 0x8a,
-  0x55, 0x23, 0xad, 0xca, 0x8b, 0x16, 0x6a, 0xf6, 0xa8, 0x89, 0x63, 0x57, 0x4b, 0xa7, 0x47, 0x3e,
-  0x5e, 0xeb, 0x9d, 0x5c, 0x93, 0x04, 0x6a, 0x96, 0x24, 0x0a, 0x5c, 0xbc, 0xa9, 0xa0, 0xd9, 0x10,
-  0x62, 0x40, 0x22, 0x01, 0xfa, 0x07, 0x74, 0x3c, 0xea, 0xb6, 0x80, 0xc6, 0x31, 0x10, 0x19, 0xd5,
-  0x31, 0xaa, 0x6a, 0xf0, 0x3c, 0xcc, 0xc2, 0xb3, 0x30, 0x0a, 0xf3, 0x2b, 0xee, 0x2c, 0x16, 0x2a,
-  0x91, 0xb8, 0xa1, 0x30, 0x0b, 0x38, 0x61, 0xa9, 0x83, 0x72, 0x6c, 0x4c, 0xc3, 0xd1, 0x28, 0x88,
-  0x1b, 0x2d, 0x53, 0xf6, 0x0f, 0x89, 0x6a, 0x94, 0x75, 0x8c, 0xb3, 0x00, 0x36, 0x42, 0x53, 0xfb,
-  0xbc, 0x85, 0x17, 0x7e, 0x92, 0xb2, 0x2b, 0x04, 0x19, 0xa4, 0xf3, 0x21, 0xf6, 0x28, 0xc8, 0x9c,
-  0xa2, 0x25, 0x34, 0xd1, 0x53, 0xdb, 0x62, 0x7e, 0x34, 0x9f, 0xfa, 0x9c, 0xbd, 0x24, 0xa2, 0x98,
-  0x2a, 0x65, 0x94, 0x7d, 0xa0, 0x00, 0x11, 0xbb, 0xfd, 0x2d, 0xb6, 0x0f, 0x66, 0x5f, 0xd7, 0xf3,
-  0xb6, 0x60, 0x10, 0x20, 0x8c, 0xeb, 0xd6, 0x87, 0x62, 0x7c, 0x9b, 0x41, 0x23, 0x20, 0x1e, 0x0c,
-  0x26, 0x2f, 0x92, 0x8b, 0x20, 0x7d, 0xec, 0xe3, 0xc4, 0x86, 0x94, 0xfa, 0x99, 0x1b, 0x82, 0x9b,
-  0xbf, 0x18, 0x05, 0x59, 0xd3, 0x89, 0x54, 0xe0, 0x35, 0x6c, 0x53, 0xa3, 0x14, 0x28, 0x00, 0x23,
-  0x51, 0x30, 0xbc, 0xa3, 0xb2, 0x54, 0x4a, 0x39, 0x97, 0x69, 0x92, 0xb3, 0x0b, 0xe0, 0x4f, 0xca,
-  0x45, 0x46, 0xff, 0x84, 0x73, 0x73, 0x95, 0xc4, 0x29, 0x0f, 0xc2, 0x24, 0x71, 0x4a, 0x05, 0xf3,
-  0x52, 0x77, 0x77, 0xb6, 0x58, 0xcf, 0x5b, 0x55, 0xf2, 0x90, 0x87, 0x5f, 0xc1, 0x3c, 0x58, 0x95,
-  0xfc, 0x8e, 0xac, 0xc3, 0x0a, 0xf2, 0x39, 0x39, 0x96, 0x4c, 0x38, 0x29, 0x1d, 0x60, 0xc0, 0xa0,
-  0xb7, 0x2a, 0x17, 0xe1, 0x3a, 0x5b, 0x72, 0xe9, 0xee, 0x43, 0x3d, 0xba, 0x58, 0x19, 0x6f, 0x50,
-  0xa9, 0xd1, 0x7a, 0x2d, 0x7b, 0x6d, 0x0a, 0x0e, 0x1e, 0xdc, 0x29, 0x84, 0xa6, 0x4e, 0x5a, 0x1c,
-  0x2d, 0x6a, 0xa4, 0x73, 0x67, 0xd2, 0xe1, 0x88, 0xd8, 0x7d, 0xce, 0x21, 0xfb, 0x82, 0xa2, 0xe0,
-  0x88, 0x08, 0x25, 0xce, 0xba, 0xad, 0xee, 0x88, 0xb8, 0x49, 0xce, 0xba, 0x2d, 0xec, 0x88, 0xc8,
-  0x6d, 0xce, 0xba, 0x8d, 0xe9, 0x88, 0x48, 0x82, 0x56, 0x04, 0x3c, 0xdf, 0x32, 0x3a, 0xbb, 0xaa,
-  0x56, 0x30, 0x01, 0x92, 0xf4, 0x6a, 0xf5, 0xfd, 0x81, 0xbf, 0xeb, 0x3b, 0x5a, 0xd3, 0x6b, 0x69,
-  0xa5, 0x66, 0xc6, 0xa8, 0x96, 0xbc, 0x99, 0xc3, 0xd1, 0xa5, 0xa1, 0x1a, 0x84, 0x25, 0x9e, 0x89,
-  0x28, 0x83, 0xd0, 0xa2, 0x42, 0x03, 0xbb, 0x6a, 0x5e, 0xe7, 0x1d, 0xe0, 0xbc, 0xa7, 0x36, 0x92,
-  0xc0, 0x72, 0xa7, 0xa3, 0x09, 0x2c, 0xaa, 0x5a, 0x80, 0x93, 0xc1, 0x2e, 0x81, 0x5b, 0xeb, 0x8a,
-  0x72, 0x81, 0x29, 0x68, 0xb2, 0xf5, 0xea, 0x0e, 0xfd, 0x67, 0xed, 0x00, 0x15, 0x75, 0x28, 0x69,
-  0x44, 0x51, 0x25, 0xe2, 0x24, 0x03, 0x4c, 0x36, 0xa1, 0x9f, 0x45, 0xce, 0x50, 0x66, 0x98, 0x03,
-  0xc3, 0x64, 0x36, 0x4b, 0xe2, 0x57, 0x74, 0x4e, 0x26, 0x13, 0xb3, 0x6f, 0x8c, 0xf9, 0x71, 0x38,
-  0xf3, 0xc5, 0x8d, 0xa7, 0x68, 0xaf, 0x6e, 0x51, 0x2a, 0xd8, 0xf3, 0x73, 0x80, 0x02, 0xe3, 0xe6,
-  0x80, 0x4c, 0x4c, 0x9e, 0x3a, 0xf3, 0x43, 0x9a, 0xad, 0x7c, 0x98, 0xcd, 0x61, 0xa4, 0x7e, 0x83,
-  0x68, 0x06, 0x16, 0xdd, 0x0f, 0xea, 0x8b, 0x2b, 0xaa, 0x3f, 0x8b, 0x79, 0x36, 0x87, 0xee, 0x10,
-  0x05, 0xd3, 0x86, 0xbe, 0xa2, 0x7d, 0x28, 0x70, 0xb8, 0xeb, 0xcf, 0xd8, 0x3c, 0x5a, 0x4c, 0x42,
-  0x0c, 0x29, 0xf2, 0x59, 0x6e, 0x8e, 0xe2, 0x51, 0x25, 0x0f, 0x8c, 0x6b, 0x9e, 0x75, 0x0c, 0xc6,
-  0x30, 0x3c, 0xf6, 0x81, 0x36, 0xe0, 0xce, 0xfd, 0xf8, 0xc0, 0x18, 0x7f, 0xc5, 0xee, 0x09, 0x9d,
-  0x7a, 0xfe, 0x8f, 0x20, 0xea, 0xd2, 0x29, 0x25, 0x86, 0xe3, 0x30, 0x48, 0xff, 0x21, 0xb8, 0x42,
-  0xd7, 0x3c, 0xca, 0xb9, 0xeb, 0x2c, 0xff, 0x49, 0xe2, 0xd7, 0x7e, 0x4c, 0xf7, 0x65, 0x34, 0x3f,
-  0xd3, 0x4a, 0xc2, 0x75, 0x79, 0xb0, 0xa7, 0x54, 0x97, 0x9f, 0x41, 0xca, 0x5c, 0x51, 0x23, 0xd0,
-  0x26, 0x49, 0x94, 0x87, 0x73, 0x57, 0x10, 0x53, 0x38, 0xb6, 0x55, 0x54, 0x09, 0x9a, 0x89, 0x36,
-  0x0f, 0x84, 0xfd, 0x9b, 0x35, 0x71, 0x6e, 0xf1, 0xf3, 0xe5, 0x01, 0x4a, 0x09, 0xde, 0xe3, 0x7a,
-  0xdd, 0xb2, 0xa1, 0x73, 0xf3, 0xbe, 0xe9, 0xe0, 0xf4, 0xaf, 0x63, 0x40, 0x5c, 0x6f, 0x95, 0x2b,
-  0x52, 0x57, 0x07, 0xc3, 0x03, 0x47, 0xb6, 0x99, 0x05, 0x65, 0x57, 0xf1, 0xf0, 0x04, 0x4c, 0x49,
-  0xe8, 0xc1, 0x84, 0xbf, 0x25, 0x8a, 0xce, 0x28, 0xcd, 0xbd, 0x74, 0x67, 0x61, 0x5c, 0x4d, 0xf3,
-  0x2f, 0x57, 0x50, 0x83, 0x9e, 0x21, 0xf8, 0xf9, 0xc1, 0x6d, 0x39, 0x5b, 0x25, 0x78, 0x15, 0x67,
-  0xee, 0xaa, 0x4a, 0xf7, 0x2c, 0x95, 0x2b, 0xcb, 0x27, 0x63, 0x17, 0xd3, 0x20, 0x88, 0x50, 0xa4,
-  0x0d, 0xc9, 0x34, 0x19, 0x32, 0x07, 0x1d, 0x39, 0x5d, 0x01, 0x63, 0x95, 0xdf, 0x24, 0xc6, 0x86,
-  0x5b, 0x2a, 0xa1, 0xb7, 0x11, 0xd1, 0x1b, 0xc8, 0x28, 0xb3, 0x65, 0xb0, 0xb6, 0x94, 0x52, 0xb8,
-  0xfa, 0x1b, 0x8a, 0x29, 0xf8, 0xc9, 0x14, 0xe5, 0xfe, 0x11, 0x2d, 0xc3, 0x34, 0x5b, 0x5f, 0x5e,
-  0x8a, 0x91, 0x9a, 0xff, 0x49, 0x62, 0x7c, 0x4f, 0xff, 0x15, 0x75, 0xe5, 0x78, 0x85, 0x48, 0x5f,
-  0x6a, 0xea, 0x1a, 0x17, 0x71, 0x86, 0x1f, 0x33, 0x23, 0x85, 0xc9, 0xf5, 0x34, 0x35, 0x94, 0x1b,
-  0x1a, 0x15, 0x17, 0x42, 0x11, 0x5e, 0x5e, 0x76, 0xdd, 0x70, 0xfe, 0x02, 0x2d, 0x96, 0xc2, 0xd8,
-  0x92, 0xb1, 0x97, 0x49, 0x9c, 0x38, 0xb8, 0x4a, 0x13, 0x27, 0x74, 0x4f, 0x3a, 0x78, 0x22, 0xe2,
-  0x6e, 0x03, 0x31, 0xf9, 0xab, 0xba, 0x82, 0x7f, 0xf9, 0x16, 0x0b, 0x7e, 0x11, 0xce, 0x42, 0xc8,
-  0x6d, 0xa7, 0xfc, 0xf1, 0x4d, 0x92, 0x8b, 0x91, 0xad, 0xc3, 0xb4, 0x4e, 0x5a, 0x3c, 0x63, 0x68,
-  0xab, 0x83, 0xe2, 0xd6, 0x70, 0xe7, 0x0f, 0xdd, 0xc0, 0x1b, 0xf5, 0x7d, 0x07, 0x3c, 0xac, 0x7b,
-  0xa5, 0x96, 0xbe, 0xb2, 0xd7, 0xb7, 0x5a, 0xc9, 0x9b, 0xd6, 0x6c, 0x53, 0xc2, 0x0a, 0x6f, 0x90,
-  0xdc, 0x74, 0x7d, 0x96, 0x14, 0x7c, 0x4d, 0x7a, 0x6e, 0xd6, 0xce, 0xa7, 0x28, 0x70, 0xa7, 0x85,
-  0xdf, 0x70, 0xaf, 0x63, 0x70, 0x99, 0x37, 0x1d, 0x6f, 0xe4, 0xb4, 0xb6, 0x44, 0x1b, 0xe3, 0x92,
-  0x23, 0x14, 0x8d, 0x01, 0xe8, 0x84, 0xae, 0x01, 0x09, 0xf4, 0x91, 0x2a, 0xda, 0x22, 0x20, 0x96,
-  0xeb, 0x30, 0x0d, 0x3a, 0x1b, 0xbe, 0x09, 0xca, 0xc4, 0x77, 0x40, 0xc5, 0x2b, 0x1d, 0xa0, 0xba,
-  0x05, 0x2a, 0x2d, 0x93, 0xd1, 0x1a, 0xec, 0x63, 0x59, 0x31, 0x61, 0x70, 0x6e, 0x69, 0x21, 0xff,
-  0xe4, 0xb7, 0x6a, 0xbc, 0xe2, 0xce, 0x5e, 0xcb, 0x91, 0x39, 0xfc, 0xc0, 0x2f, 0xfa, 0x06, 0x8b,
-  0x8b, 0x76, 0xcb, 0xbc, 0x11, 0xb7, 0x9e, 0x83, 0x06, 0x02, 0x87, 0x36, 0xe3, 0xad, 0xee, 0xf6,
-  0x68, 0x9e, 0x33, 0xaa, 0x98, 0x0f, 0x05, 0x8d, 0xfc, 0x46, 0x08, 0xa2, 0xb2, 0x96, 0x46, 0x61,
-  0x45, 0xd7, 0xd2, 0xa8, 0x47, 0x40, 0xed, 0xec, 0x20, 0x89, 0x77, 0x4b, 0xa3, 0xba, 0x10, 0xc2,
-  0xd9, 0x5a, 0xc2, 0x47, 0x72, 0x0d, 0x4a, 0xdc, 0xe9, 0xba, 0x83, 0x55, 0x65, 0x73, 0xf8, 0x27,
-  0x7e, 0x06, 0xe0, 0xef, 0xfa, 0x5b, 0xbd, 0xf7, 0xab, 0xc9, 0xf1, 0x56, 0x93, 0x23, 0xdc, 0x82,
-  0xbb, 0x26, 0x67, 0x8b, 0xf1, 0x99, 0x86, 0xf2, 0xc0, 0x68, 0xf0, 0x4a, 0x1c, 0x65, 0x5c, 0xca,
-  0x2c, 0x0c, 0x4c, 0x7e, 0xd7, 0xa2, 0x54, 0xdc, 0xa1, 0xb0, 0xb4, 0x68, 0xbc, 0x76, 0xe1, 0x36,
-  0x45, 0xaf, 0xc5, 0x03, 0xe3, 0xf2, 0x03, 0x14, 0xc8, 0x25, 0xc2, 0x8d, 0xdc, 0xb8, 0x6d, 0x4b,
-  0xed, 0x6d, 0xf5, 0xd7, 0x12, 0x9c, 0xf5, 0xe9, 0xe2, 0x97, 0x3d, 0xdc, 0x39, 0x5d, 0x65, 0xee,
-  0x11, 0x91, 0xef, 0x05, 0xb1, 0x62, 0x78, 0xd6, 0x54, 0xbd, 0xeb, 0xba, 0x86, 0xdb, 0xa4, 0x74,
-  0x74, 0xd5, 0x69, 0xa9, 0x02, 0xcb, 0x61, 0xbe, 0xb0, 0x16, 0xc4, 0x78, 0x5f, 0x1a, 0x29, 0xab,
-  0x6a, 0xe5, 0x0f, 0x9d, 0x71, 0x77, 0xe0, 0x0d, 0x9c, 0x0a, 0x57, 0xc4, 0x38, 0x50, 0xe6, 0x0a,
-  0xf0, 0x00, 0xb7, 0x2d, 0x15, 0xcc, 0xdb, 0xdb, 0xdf, 0x3f, 0x3b, 0x23, 0xb0, 0xd1, 0x95, 0x4a,
-  0x0d, 0xbc, 0xc0, 0xc7, 0xa6, 0xd6, 0x07, 0x69, 0x3f, 0x8a, 0xb0, 0xf8, 0xec, 0xa0, 0x64, 0xaf,
-  0x50, 0x9b, 0x09, 0xcc, 0x61, 0x7e, 0x59, 0x9a, 0x7d, 0xd5, 0xd6, 0x6f, 0xc0, 0x2d, 0xe6, 0xfb,
-  0xf7, 0x8f, 0x10, 0xce, 0x15, 0xe3, 0x81, 0x5b, 0xb4, 0x02, 0xce, 0xce, 0xda, 0xbf, 0x68, 0xd3,
-  0xc0, 0x25, 0x7b, 0x53, 0x7a, 0xc0, 0xe5, 0x22, 0x99, 0xc9, 0x8f, 0x6a, 0xb6, 0xf4, 0x61, 0xab,
-  0x8a, 0x55, 0xe6, 0xb0, 0xa2, 0xfa, 0x1b, 0xa5, 0xc3, 0xe9, 0xdf, 0x96, 0xc3, 0x36, 0xc9, 0x56,
-  0x6f, 0x04, 0x2d, 0xcb, 0x1e, 0x23, 0xb9, 0xac, 0x81, 0xe7, 0xa2, 0xa9, 0x81, 0xbf, 0xc3, 0xb9,
-  0x83, 0xf7, 0x8c, 0x76, 0x8e, 0x98, 0x08, 0xd7, 0x26, 0x5f, 0xae, 0xb7, 0xaa, 0x6d, 0xa4, 0x9a,
-  0xe7, 0x03, 0xfb, 0xe3, 0x67, 0x9d, 0x72, 0xfa, 0x7a, 0x7d, 0x20, 0x52, 0x69, 0xaa, 0x7e, 0xe4,
-  0x5e, 0xb1, 0xaf, 0x8e, 0xf8, 0x0a, 0x29, 0x94, 0xab, 0xa7, 0x83, 0x29, 0xfa, 0x6d, 0x78, 0x19,
-  0x8c, 0x9a, 0xdd, 0x16, 0x10, 0xe2, 0xfc, 0xed, 0xdf, 0xfe, 0xdd, 0xb9, 0xfe, 0xef, 0xff, 0x7a,
-  0xfc, 0x61, 0x1d, 0x0b, 0x51, 0xad, 0x3b, 0x19, 0x2b, 0xb3, 0xab, 0xad, 0x10, 0x05, 0x7e, 0x97,
-  0x56, 0x88, 0x14, 0x19, 0xa9, 0x74, 0x9e, 0x7d, 0x72, 0xb6, 0xea, 0xb5, 0x8c, 0xec, 0x12, 0x9b,
-  0xa8, 0x63, 0x6f, 0x20, 0x35, 0x8a, 0x3e, 0xb7, 0x50, 0x63, 0x1b, 0x18, 0xd3, 0x97, 0x78, 0x8e,
-  0x46, 0x75, 0xbf, 0x2c, 0x98, 0x20, 0x2b, 0xf4, 0x8e, 0x57, 0xc9, 0x43, 0x34, 0xad, 0x31, 0xef,
-  0x45, 0xad, 0xd6, 0xc1, 0x65, 0xbb, 0xe7, 0x38, 0xb1, 0x82, 0xb9, 0xf6, 0x5b, 0x85, 0x60, 0x94,
-  0x3b, 0xc8, 0x6a, 0xfc, 0xae, 0xdb, 0x69, 0x99, 0x0d, 0xfa, 0x0b, 0xe8, 0xc3, 0xdf, 0xbe, 0x3a,
-  0xc4, 0xcd, 0x0a, 0x43, 0x10, 0xfc, 0x0a, 0xb3, 0x47, 0x26, 0xab, 0xeb, 0x54, 0x5d, 0xa9, 0xe5,
-  0x2c, 0xd6, 0xe6, 0xb0, 0x54, 0xcf, 0xce, 0x46, 0xfa, 0xc1, 0x46, 0x6f, 0x04, 0xf4, 0xae, 0xa7,
-  0x37, 0xae, 0x9f, 0x7d, 0xfa, 0x50, 0xa6, 0x3c, 0x1c, 0x37, 0x6d, 0xb3, 0xa6, 0x46, 0x9d, 0xdf,
-  0xb7, 0xa0, 0x90, 0xfb, 0x47, 0xcc, 0x61, 0x4d, 0x39, 0x7d, 0xea, 0x94, 0xf3, 0x11, 0x4b, 0x6e,
-  0xcd, 0xea, 0x7c, 0x6d, 0x5d, 0x56, 0x72, 0x3e, 0xd5, 0xa9, 0x61, 0x66, 0x54, 0xe2, 0xcb, 0x46,
-  0x5a, 0xac, 0xb4, 0x9b, 0x64, 0xb5, 0x1e, 0xd3, 0x10, 0xbe, 0xa8, 0x3f, 0x65, 0x46, 0x29, 0xe3,
-  0x9e, 0x55, 0xad, 0x66, 0xb3, 0x76, 0x0d, 0xdc, 0x22, 0xa5, 0x6b, 0xb6, 0x8e, 0xd0, 0x64, 0xc2,
-  0x34, 0x2a, 0x54, 0x52, 0x9d, 0x1a, 0x29, 0x56, 0x59, 0x8c, 0xb9, 0xe8, 0x92, 0x4e, 0x81, 0x96,
-  0xba, 0xb6, 0x19, 0x80, 0xc5, 0xed, 0x54, 0x3f, 0x3f, 0xf1, 0xba, 0x70, 0xe1, 0x96, 0xcf, 0x0a,
-  0xcd, 0x68, 0x0a, 0xfc, 0x61, 0x77, 0x4c, 0xeb, 0x38, 0x4c, 0xaa, 0xef, 0x5e, 0x67, 0xab, 0x3f,
-  0xd8, 0x02, 0x25, 0x8e, 0xe7, 0x4b, 0x1c, 0x7b, 0xad, 0xe4, 0x82, 0x03, 0x06, 0x5f, 0x0b, 0xd2,
-  0x65, 0xa3, 0xcd, 0x17, 0xae, 0x56, 0xd1, 0x67, 0x2a, 0xf5, 0x1a, 0x8f, 0xfb, 0xfd, 0xc1, 0x60,
-  0xb3, 0x7a, 0x89, 0xfe, 0xfa, 0x0b, 0x56, 0x48, 0xd7, 0x28, 0x95, 0x2a, 0x09, 0x17, 0x73, 0xa3,
-  0x2a, 0xfd, 0x80, 0x2d, 0xc4, 0x5e, 0x2f, 0x66, 0xf3, 0x5f, 0x56, 0x00, 0x71, 0x0b, 0xb1, 0xbd,
-  0x56, 0x62, 0xae, 0x61, 0xa3, 0x5a, 0x3d, 0xff, 0xae, 0xcb, 0x46, 0xc1, 0xcc, 0x8f, 0x57, 0xce,
-  0xb6, 0x7c, 0xe1, 0x6a, 0x85, 0x71, 0xd7, 0x5e, 0x2b, 0x31, 0x00, 0x6f, 0x58, 0xab, 0x9d, 0x5f,
-  0x4b, 0xad, 0x76, 0x6e, 0x5a, 0xab, 0x4d, 0xbd, 0x4b, 0x69, 0x1a, 0x96, 0x26, 0x5b, 0x69, 0xba,
-  0xd5, 0x34, 0xa5, 0xe4, 0x3c, 0x6e, 0x31, 0xe2, 0x5f, 0x99, 0x36, 0x0b, 0x6d, 0x89, 0x95, 0x3b,
-  0x62, 0xf7, 0x74, 0xc3, 0xc0, 0x36, 0x59, 0xab, 0x4d, 0xd7, 0x2a, 0x63, 0xe9, 0xc6, 0x73, 0xb4,
-  0x66, 0xbe, 0xc2, 0xa4, 0x3a, 0x60, 0xcd, 0xf3, 0x56, 0xbd, 0x1b, 0x39, 0xf3, 0xe7, 0x30, 0xd8,
-  0xbe, 0x73, 0x70, 0x93, 0x29, 0xb4, 0x3c, 0xff, 0xc1, 0xa0, 0xa5, 0x8e, 0xe8, 0xad, 0x9a, 0x3a,
-  0x92, 0x1a, 0x17, 0x1f, 0x8d, 0x21, 0xc5, 0x11, 0xe3, 0xa2, 0xe3, 0xbc, 0xaf, 0x31, 0x0c, 0xa0,
-  0x98, 0x77, 0xe7, 0xef, 0x71, 0x41, 0xda, 0x71, 0x96, 0xd8, 0x08, 0x7a, 0x15, 0xea, 0xe7, 0x62,
-  0xab, 0x96, 0xc4, 0xd6, 0x17, 0x98, 0x1d, 0xa8, 0x5d, 0xc9, 0xfc, 0xd5, 0xda, 0xc9, 0xd0, 0xd4,
-  0xd0, 0x5f, 0xac, 0x8d, 0x4d, 0xeb, 0xe1, 0x15, 0x6b, 0x93, 0x36, 0x11, 0x95, 0xcd, 0x9b, 0x62,
-  0xb1, 0x9c, 0xde, 0xd1, 0x20, 0xad, 0xd8, 0x1c, 0x85, 0x6d, 0x48, 0x4d, 0x4a, 0x5e, 0x6b, 0xc5,
-  0x4c, 0x15, 0x12, 0x86, 0xfb, 0xca, 0x48, 0xc4, 0xb0, 0x4f, 0x53, 0x3c, 0xd6, 0x79, 0x04, 0x92,
-  0x8b, 0x87, 0xb6, 0xb9, 0x28, 0x49, 0xcb, 0x40, 0x3e, 0xd3, 0x70, 0x2a, 0x5f, 0x46, 0x85, 0xf4,
-  0x49, 0x05, 0x2e, 0x9f, 0x41, 0xeb, 0x15, 0x8f, 0x3b, 0x55, 0xd1, 0x13, 0xe5, 0x9f, 0xfb, 0x51,
-  0xb1, 0xcd, 0xe0, 0x1d, 0x52, 0xf3, 0x4e, 0x63, 0x04, 0xaf, 0xc5, 0xfb, 0x6f, 0xdc, 0x52, 0xbd,
-  0x0e, 0x2b, 0xb3, 0x08, 0x8a, 0x2b, 0x75, 0x66, 0x3b, 0x16, 0x04, 0xea, 0xe9, 0x55, 0x4c, 0x9a,
-  0xe9, 0x15, 0x34, 0x5d, 0x99, 0x27, 0x36, 0x3f, 0x41, 0x34, 0xf7, 0xdd, 0xb4, 0x5c, 0x75, 0xde,
-  0x46, 0xee, 0x41, 0xe0, 0x0e, 0xd2, 0x12, 0x33, 0x52, 0x33, 0xf7, 0x0f, 0xab, 0xb9, 0xdc, 0xa1,
-  0xb3, 0x54, 0xea, 0xf3, 0xbf, 0x7d, 0x49, 0xb1, 0x67, 0x96, 0xc4, 0xc4, 0x10, 0x5e, 0xa1, 0x3f,
-  0xf0, 0xa9, 0x5e, 0x65, 0xe7, 0x6e, 0x15, 0xa6, 0xe1, 0x96, 0x3e, 0x6b, 0xaf, 0xad, 0x79, 0x68,
-  0x5a, 0x41, 0x3d, 0xd6, 0x95, 0x85, 0xad, 0xcb, 0xa5, 0x4f, 0x96, 0x5a, 0x25, 0x9c, 0x69, 0xfa,
-  0xe8, 0xf0, 0xde, 0x97, 0x6b, 0xde, 0x1a, 0x9f, 0x8f, 0x59, 0x9d, 0x3e, 0x7d, 0xf7, 0x0c, 0x5f,
-  0x69, 0x15, 0xfb, 0x67, 0x46, 0xda, 0x46, 0xb2, 0x62, 0x8d, 0x0d, 0x74, 0xcd, 0x57, 0xc5, 0x5c,
-  0x17, 0xbe, 0x69, 0x2e, 0x60, 0x75, 0x03, 0x7f, 0x9c, 0xe0, 0x3e, 0x5c, 0x30, 0x1e, 0x02, 0x17,
-  0x1e, 0x8b, 0x7d, 0x65, 0x98, 0xde, 0xae, 0x1c, 0x97, 0x78, 0xc0, 0xfa, 0xb8, 0x2f, 0x52, 0xe6,
-  0xc2, 0xb6, 0xb7, 0xd9, 0x73, 0x70, 0x08, 0x59, 0x86, 0xbb, 0xce, 0x82, 0x34, 0x60, 0x74, 0xa0,
-  0x97, 0x35, 0xfb, 0x59, 0x8b, 0x25, 0x33, 0x5a, 0xfc, 0x65, 0x80, 0x36, 0x4d, 0x16, 0xa3, 0x00,
-  0x06, 0x38, 0xf0, 0xea, 0xe7, 0x49, 0x14, 0xdd, 0x63, 0x96, 0x73, 0x18, 0x50, 0xe0, 0xe1, 0xbd,
-  0x62, 0x3f, 0xd0, 0x22, 0x4f, 0xc6, 0x63, 0x9e, 0x0c, 0x74, 0x94, 0x0f, 0xf3, 0xfd, 0x89, 0xed,
-  0x74, 0xf8, 0x9e, 0xfb, 0x0e, 0x21, 0x5d, 0x4c, 0xf1, 0x1c, 0x82, 0xea, 0xb0, 0xd5, 0xdd, 0xbc,
-  0x5f, 0x7f, 0xcd, 0xaa, 0x1f, 0xdf, 0x75, 0xde, 0x43, 0x8d, 0x78, 0x51, 0x52, 0x2f, 0x58, 0xb2,
-  0xc8, 0xa6, 0xe1, 0x38, 0x97, 0x6b, 0xf5, 0xf2, 0x3b, 0x1e, 0x05, 0x54, 0x5f, 0x54, 0x2a, 0xf0,
-  0xc5, 0x0e, 0x8e, 0xc7, 0x04, 0xab, 0xe0, 0x78, 0x64, 0xb0, 0x0e, 0x1e, 0x8f, 0x0d, 0xda, 0x30,
-  0x8c, 0xf4, 0x12, 0x0e, 0x6e, 0xf6, 0xb5, 0xe1, 0x18, 0xe9, 0x66, 0x35, 0x40, 0x52, 0x0a, 0x0c,
-  0xe3, 0x13, 0xed, 0x39, 0x54, 0x9f, 0xe4, 0x11, 0xd1, 0xb2, 0xab, 0x5a, 0x2d, 0x4e, 0x29, 0x1d,
-  0xfb, 0x27, 0xa1, 0x82, 0xec, 0xe4, 0x48, 0xa5, 0x64, 0x47, 0x05, 0x15, 0x55, 0xf7, 0x61, 0x47,
-  0xcf, 0xef, 0x1a, 0x45, 0xc2, 0xd2, 0x90, 0xf3, 0x45, 0x36, 0x45, 0xc1, 0x26, 0x20, 0xa3, 0x21,
-  0xe9, 0xcb, 0xc8, 0x9d, 0xce, 0x4f, 0xf1, 0x95, 0xc2, 0x68, 0xb3, 0x6f, 0xbe, 0x61, 0x6a, 0xc7,
-  0xb3, 0xde, 0xbe, 0x05, 0x2c, 0xef, 0x05, 0xf5, 0xd0, 0xd4, 0xe8, 0x02, 0xfc, 0x53, 0xf7, 0x54,
-  0x06, 0x4f, 0xb0, 0xc3, 0x7a, 0x1a, 0xac, 0xb7, 0x02, 0x96, 0x0b, 0x47, 0x91, 0xb3, 0x08, 0xc2,
-  0xb1, 0x84, 0x12, 0xcf, 0xc0, 0xf0, 0xd6, 0xc0, 0xe0, 0xc2, 0x54, 0x94, 0x81, 0xaf, 0x3c, 0xbe,
-  0x78, 0xce, 0x63, 0xb3, 0xdb, 0xcb, 0x31, 0xb0, 0xbc, 0xf5, 0xb0, 0x48, 0x08, 0x05, 0xce, 0x50,
-  0xd9, 0xcc, 0xa7, 0x63, 0x79, 0x49, 0xb8, 0x15, 0x89, 0xc4, 0x53, 0x20, 0x71, 0x0d, 0x77, 0x2a,
-  0x42, 0xda, 0x83, 0x9e, 0x04, 0x04, 0x47, 0x9d, 0xb8, 0xa8, 0x88, 0xac, 0x89, 0x55, 0x94, 0x08,
-  0x63, 0x43, 0x17, 0x57, 0x47, 0x78, 0x4f, 0xa8, 0xca, 0xb3, 0x89, 0x77, 0x26, 0xa6, 0x56, 0x6a,
-  0x91, 0xa4, 0xa4, 0x9b, 0x68, 0x22, 0xb5, 0x40, 0xbb, 0x67, 0x11, 0x7f, 0x13, 0x85, 0x36, 0xdb,
-  0xd2, 0x87, 0xfa, 0xc2, 0xb0, 0x6f, 0x98, 0x58, 0x90, 0x72, 0x9a, 0xf2, 0x83, 0x52, 0xcb, 0xd0,
-  0x76, 0x2a, 0x68, 0x3b, 0x55, 0xb4, 0x42, 0x31, 0xf3, 0xf9, 0x40, 0x6d, 0x4f, 0xaa, 0xd6, 0xbf,
-  0xc0, 0x81, 0x69, 0xe6, 0x68, 0x9f, 0xe1, 0xbc, 0x24, 0x0e, 0x29, 0xcd, 0xbc, 0x45, 0xbb, 0x96,
-  0xd1, 0x1f, 0xc4, 0xf3, 0x45, 0x27, 0x74, 0x76, 0xa4, 0xe9, 0xc4, 0x51, 0xfb, 0xbb, 0x17, 0x30,
-  0x68, 0x7f, 0xc6, 0x91, 0x01, 0xed, 0x78, 0xaf, 0x3d, 0x0a, 0x27, 0x21, 0xda, 0x25, 0xe0, 0x1a,
-  0x2e, 0xf2, 0xc0, 0x48, 0xca, 0x02, 0x28, 0x7a, 0xa4, 0x25, 0xc1, 0xb0, 0xc8, 0x49, 0x7a, 0xa7,
-  0x86, 0x3d, 0xed, 0xe4, 0x9d, 0x71, 0xe4, 0xee, 0xbd, 0x3a, 0xa4, 0x31, 0x44, 0xc2, 0x86, 0x34,
-  0xde, 0xbb, 0xaa, 0x12, 0xfc, 0x81, 0x67, 0xa6, 0xf2, 0xe2, 0x30, 0x72, 0xb2, 0x13, 0x06, 0x09,
-  0x7a, 0xd6, 0xaa, 0x8c, 0x3a, 0xe2, 0x70, 0x09, 0x46, 0xb7, 0x82, 0x01, 0x9a, 0x62, 0x19, 0x82,
-  0x57, 0x41, 0x40, 0xd5, 0xb1, 0x0c, 0xa3, 0x57, 0xc5, 0xf0, 0x96, 0x63, 0xf4, 0x2d, 0x65, 0xa0,
-  0x16, 0x58, 0x86, 0x33, 0xb0, 0x94, 0xb2, 0x0a, 0x67, 0xc7, 0x52, 0x0e, 0x6a, 0x81, 0x65, 0x38,
-  0xbb, 0x96, 0x72, 0x24, 0x8e, 0xb6, 0x21, 0xfa, 0x47, 0x0f, 0x20, 0x50, 0xaf, 0x24, 0x71, 0xe0,
-  0xc9, 0x18, 0x64, 0xb4, 0x68, 0x08, 0xb6, 0x57, 0x30, 0x0e, 0xe3, 0x00, 0x4c, 0xa2, 0x6f, 0x58,
-  0x19, 0xe0, 0x40, 0x6d, 0x5c, 0x7b, 0xd7, 0xdb, 0x1a, 0x6c, 0xed, 0x16, 0x32, 0x11, 0x8e, 0x68,
-  0x42, 0xa5, 0x8e, 0x2c, 0xdc, 0xc5, 0xec, 0xf2, 0x25, 0x79, 0x28, 0xf8, 0x2b, 0x24, 0x40, 0xea,
-  0x14, 0x25, 0x6d, 0xab, 0x85, 0x05, 0x20, 0x49, 0xbe, 0x34, 0xa9, 0x5c, 0x89, 0x44, 0xca, 0x0d,
-  0xbb, 0x13, 0x3f, 0xe6, 0xb2, 0x5b, 0x9e, 0xfb, 0x5f, 0x29, 0x70, 0x4a, 0xd7, 0x15, 0x99, 0xec,
-  0xac, 0xc8, 0xc4, 0xb3, 0x66, 0xc2, 0x35, 0x5f, 0x91, 0xcb, 0x60, 0x45, 0x2e, 0x3d, 0x6b, 0x2e,
-  0x52, 0x15, 0x16, 0xf9, 0xf4, 0x57, 0xe4, 0xd3, 0xb7, 0xe6, 0x43, 0xca, 0xb1, 0xc8, 0xa4, 0xb7,
-  0x22, 0x93, 0x81, 0x35, 0x13, 0x54, 0x95, 0x45, 0x1e, 0xde, 0x8a, 0x3c, 0x76, 0x6a, 0xf2, 0xd8,
-  0xd1, 0xf2, 0xe8, 0x72, 0x0d, 0x42, 0x96, 0xb8, 0xb6, 0x05, 0xd4, 0x6a, 0x74, 0x5a, 0xce, 0x97,
-  0xc9, 0xa3, 0xb4, 0xe7, 0xc1, 0x33, 0x50, 0x87, 0xd9, 0xc3, 0x49, 0xa2, 0x0c, 0xdf, 0xe6, 0x40,
-  0xda, 0xba, 0xca, 0xe0, 0x15, 0x26, 0x93, 0x38, 0xf2, 0x86, 0xdb, 0x6a, 0xc9, 0x79, 0xb1, 0xab,
-  0x64, 0xe8, 0x14, 0x23, 0xfa, 0xcc, 0x15, 0x73, 0xce, 0x8e, 0x8f, 0x8c, 0x82, 0x44, 0x66, 0xc5,
-  0x09, 0xb9, 0x22, 0x3f, 0xec, 0x57, 0xed, 0x2e, 0x1d, 0x91, 0x2b, 0x12, 0x1f, 0x08, 0x95, 0x29,
-  0x4f, 0x86, 0x95, 0x0e, 0xcc, 0x82, 0xf6, 0x7e, 0xc1, 0x5d, 0x6f, 0x01, 0xf7, 0xae, 0xc0, 0x55,
-  0x8e, 0xd9, 0xc6, 0x5a, 0xbb, 0xf0, 0xd8, 0x87, 0x6a, 0x97, 0xaa, 0xbe, 0x7f, 0x14, 0x0f, 0xc8,
-  0x88, 0x82, 0x0f, 0x97, 0x82, 0xfa, 0x97, 0xf2, 0x08, 0xb6, 0x72, 0xb5, 0x94, 0x23, 0x5f, 0xaa,
-  0x3d, 0x35, 0x4f, 0xcd, 0x7e, 0xdd, 0x6b, 0x69, 0x63, 0x16, 0x8a, 0x43, 0x6c, 0x81, 0x35, 0x77,
-  0x1a, 0x18, 0xa9, 0xba, 0x84, 0x15, 0xe9, 0xc6, 0xd1, 0xd6, 0x20, 0x7f, 0x4b, 0x91, 0x6d, 0x40,
-  0x2f, 0x6d, 0xa1, 0xaf, 0x5a, 0xf8, 0x77, 0xe8, 0xb8, 0x7e, 0xc5, 0x49, 0x6f, 0xd5, 0x9e, 0x44,
-  0x0d, 0xf1, 0xec, 0x29, 0x0f, 0xa8, 0x84, 0xea, 0xea, 0x2b, 0x40, 0xaa, 0x14, 0x20, 0xae, 0x3f,
-  0xc1, 0x02, 0x40, 0xbb, 0x15, 0x05, 0x90, 0x26, 0x94, 0xbb, 0x2f, 0xc0, 0x69, 0x94, 0xef, 0x9a,
-  0x62, 0x2d, 0x7b, 0x8e, 0xd4, 0xca, 0x4b, 0x68, 0x51, 0xa7, 0x36, 0x03, 0xca, 0xb1, 0x38, 0xde,
-  0xa7, 0x6f, 0xcf, 0xa6, 0x42, 0x82, 0x48, 0xcf, 0x5d, 0xa0, 0x05, 0x91, 0xcb, 0x6f, 0x4b, 0x09,
-  0x46, 0x85, 0x3c, 0x2a, 0x9a, 0x71, 0x61, 0xb6, 0xf4, 0x9d, 0xbe, 0x72, 0xf3, 0xdf, 0xac, 0x74,
-  0x30, 0x7a, 0xcd, 0x03, 0x9d, 0x34, 0x3f, 0x06, 0x57, 0xcb, 0x18, 0xab, 0xf7, 0x46, 0x30, 0x61,
-  0xfe, 0x4a, 0x53, 0x1d, 0xb4, 0xc8, 0xfc, 0x6d, 0x94, 0xf8, 0x39, 0x02, 0x0b, 0x09, 0xd0, 0xc2,
-  0x81, 0xe0, 0x1c, 0x88, 0x38, 0x45, 0xf9, 0x57, 0x64, 0xb8, 0xea, 0x4a, 0x32, 0x8e, 0x08, 0x07,
-  0x80, 0x6e, 0xd4, 0x2c, 0xbc, 0x6c, 0xe1, 0x5a, 0x17, 0x9f, 0x85, 0x63, 0xad, 0xcf, 0x4e, 0x49,
-  0x1f, 0x5b, 0x88, 0x9c, 0xca, 0x57, 0x44, 0x6d, 0xe1, 0x78, 0xb4, 0x63, 0x86, 0x4a, 0x2e, 0x50,
-  0x0d, 0x80, 0x82, 0x30, 0x99, 0xeb, 0x18, 0xa3, 0x41, 0x9e, 0xe4, 0xc1, 0x1c, 0x52, 0x91, 0x23,
-  0x86, 0x50, 0x97, 0x39, 0x87, 0x77, 0x80, 0x34, 0x71, 0x38, 0xd5, 0xf8, 0xa6, 0x26, 0xa2, 0x20,
-  0x73, 0xfc, 0xc4, 0xee, 0x33, 0x87, 0x87, 0x57, 0xd1, 0x85, 0xe3, 0xf9, 0xc8, 0xfa, 0xf9, 0x8b,
-  0xf1, 0x5d, 0xa9, 0xb1, 0x35, 0xa4, 0x13, 0xa9, 0x2b, 0x6b, 0x3e, 0x40, 0x80, 0x36, 0x5a, 0x5b,
-  0x4a, 0x35, 0xcc, 0x9b, 0x35, 0xb4, 0xcc, 0xea, 0x8e, 0xda, 0x95, 0x57, 0xa1, 0x85, 0xdd, 0x82,
-  0xc2, 0xc6, 0x55, 0x00, 0x50, 0xbb, 0xe0, 0xba, 0xbf, 0xd1, 0x24, 0x22, 0x74, 0x06, 0x87, 0xd4,
-  0xb6, 0x59, 0xd5, 0xca, 0x84, 0x45, 0x7c, 0x34, 0x99, 0x58, 0xca, 0x74, 0x11, 0xdf, 0x84, 0xc8,
-  0x57, 0xca, 0x81, 0x73, 0xbd, 0x54, 0x75, 0x21, 0x16, 0x50, 0x15, 0xdc, 0xa9, 0xf0, 0x98, 0xdf,
-  0x88, 0x8e, 0x22, 0xa1, 0x81, 0x69, 0xc4, 0x9a, 0x4a, 0x6e, 0xea, 0xa3, 0x92, 0x8d, 0x27, 0xf0,
-  0x49, 0x51, 0x57, 0x61, 0xaf, 0x54, 0x75, 0x6a, 0x1e, 0x5f, 0x1d, 0x2c, 0xa1, 0x61, 0xa0, 0x22,
-  0x65, 0x36, 0x4d, 0xa8, 0xac, 0x4a, 0xf1, 0x4a, 0x21, 0x22, 0xfc, 0xb3, 0xcc, 0x2c, 0xa9, 0x5d,
-  0x91, 0xd9, 0x16, 0x8e, 0x2d, 0x6e, 0xa7, 0xd3, 0x3d, 0x2c, 0x71, 0x16, 0x0a, 0x48, 0xe5, 0xa4,
-  0xde, 0x9d, 0x99, 0xbc, 0x3c, 0xa3, 0x4f, 0xde, 0x63, 0x8c, 0x43, 0xb7, 0x24, 0x08, 0x88, 0xb8,
-  0xe8, 0xae, 0x38, 0x6c, 0xcf, 0x51, 0xa4, 0xf4, 0xf1, 0x37, 0x97, 0x02, 0x7a, 0xb9, 0xe2, 0xe0,
-  0x1b, 0x6a, 0x5c, 0x24, 0x10, 0x7c, 0xed, 0xb3, 0x28, 0x19, 0x7e, 0xa4, 0x29, 0x7d, 0x3a, 0x03,
-  0xc2, 0xb5, 0x70, 0x51, 0xf8, 0xc3, 0x87, 0xcb, 0x8a, 0x2e, 0x45, 0x19, 0x97, 0x24, 0x34, 0x11,
-  0xaf, 0x90, 0x7e, 0x7c, 0xbb, 0x69, 0xf9, 0x27, 0xe9, 0x90, 0x2b, 0x95, 0x91, 0x6b, 0xb9, 0x26,
-  0xed, 0xd0, 0x84, 0x7c, 0x43, 0x33, 0xa2, 0xb5, 0xd4, 0xaa, 0x3b, 0xde, 0x74, 0x56, 0xc9, 0x02,
-  0x70, 0xc1, 0x01, 0xe5, 0xca, 0xc1, 0x11, 0xcf, 0x48, 0xd6, 0x35, 0x9d, 0xc2, 0x81, 0xa2, 0x5a,
-  0xaa, 0xd0, 0x4a, 0xe5, 0xb4, 0xba, 0xe8, 0xe1, 0x36, 0xd6, 0xc5, 0xc6, 0xe0, 0xaa, 0x8e, 0x54,
-  0x9b, 0x72, 0xe0, 0x77, 0xd4, 0x3d, 0x72, 0xce, 0x96, 0x22, 0xb0, 0x98, 0x34, 0xa3, 0xd3, 0xf4,
-  0xe6, 0x34, 0x98, 0xe8, 0x8e, 0xa4, 0x1c, 0xcb, 0x93, 0x5e, 0x56, 0x0d, 0x3e, 0x52, 0xf1, 0x52,
-  0xb0, 0x33, 0x94, 0x72, 0x6b, 0x57, 0x32, 0x51, 0x9a, 0x9d, 0xab, 0x27, 0xe7, 0xac, 0x3d, 0xa2,
-  0x6d, 0x1d, 0xb9, 0xbe, 0xeb, 0x13, 0xf4, 0xd5, 0x7f, 0xff, 0x17, 0x67, 0xb8, 0xc1, 0x8b, 0x32,
-  0x16, 0xad, 0xb2, 0x95, 0xab, 0xe3, 0xfb, 0xa7, 0x18, 0x3d, 0xe9, 0x34, 0x0a, 0x67, 0x2d, 0x11,
-  0xaf, 0xeb, 0x9d, 0x8a, 0xae, 0xf4, 0x9e, 0xa4, 0x42, 0x03, 0x39, 0x54, 0x78, 0x60, 0x2e, 0xf2,
-  0xf9, 0x2b, 0x42, 0xfc, 0xac, 0xa3, 0x62, 0xec, 0xa5, 0xf7, 0xc2, 0xf4, 0x34, 0x01, 0x31, 0xf1,
-  0xd0, 0x02, 0x4a, 0xa6, 0x67, 0x19, 0xd4, 0xbf, 0xb4, 0x80, 0x62, 0x74, 0x28, 0x8c, 0x4b, 0xe4,
-  0x76, 0x0f, 0x49, 0x88, 0x05, 0x31, 0xe0, 0x74, 0xd4, 0x11, 0x13, 0xc6, 0x3a, 0x31, 0x1a, 0x60,
-  0x95, 0x18, 0x0e, 0x2a, 0x89, 0x31, 0x40, 0xcb, 0xc4, 0x10, 0x68, 0x0d, 0x31, 0xb2, 0x16, 0x9f,
-  0x3c, 0x3b, 0x73, 0x50, 0x93, 0x58, 0xf8, 0xc3, 0xc1, 0x6d, 0x2c, 0x12, 0x08, 0x65, 0x2e, 0x49,
-  0x84, 0x2a, 0xa3, 0x38, 0xc2, 0x0a, 0x5e, 0xd9, 0xc9, 0xe3, 0x61, 0xae, 0x2c, 0x1c, 0xab, 0x23,
-  0x4f, 0x21, 0x94, 0xf9, 0x56, 0x47, 0x9e, 0x44, 0xb0, 0x93, 0x87, 0xb1, 0xd5, 0x4f, 0xb3, 0xe1,
-  0x29, 0xba, 0x69, 0x65, 0xfa, 0x64, 0x98, 0xad, 0x82, 0xba, 0x32, 0xb4, 0x49, 0x9e, 0x06, 0x2f,
-  0x88, 0xab, 0xc2, 0xeb, 0xd4, 0x15, 0xf0, 0x82, 0x36, 0x0b, 0x02, 0x7e, 0xb1, 0xd1, 0x4b, 0x51,
-  0xbd, 0x6c, 0x04, 0xf3, 0xd8, 0x5f, 0x55, 0x92, 0x15, 0x42, 0x95, 0x66, 0x85, 0x52, 0xa2, 0x5a,
-  0x43, 0x29, 0x93, 0x2d, 0x51, 0x2a, 0x84, 0x17, 0x38, 0x92, 0xf2, 0x42, 0x93, 0xa9, 0x2b, 0xec,
-  0x4e, 0x3f, 0x75, 0x05, 0xe9, 0xeb, 0x1a, 0x89, 0x2a, 0xd2, 0xa0, 0x0a, 0x20, 0x43, 0x06, 0xd6,
-  0x67, 0xb4, 0x4b, 0x64, 0x4d, 0x2b, 0xf9, 0xf3, 0x9a, 0x22, 0x84, 0xa8, 0x98, 0x05, 0x02, 0x2b,
-  0x86, 0xde, 0x8b, 0xac, 0x47, 0x15, 0xa4, 0x68, 0x81, 0x6b, 0x6b, 0x55, 0xbc, 0x8d, 0xab, 0xe2,
-  0x6d, 0x54, 0x15, 0x6f, 0x65, 0x55, 0xbc, 0xd5, 0x55, 0xf1, 0x2a, 0x55, 0xb9, 0x67, 0x28, 0xec,
-  0x59, 0xb1, 0x4f, 0xd4, 0x3e, 0x81, 0xaf, 0x74, 0xb9, 0x86, 0x34, 0x56, 0xc7, 0xf6, 0xc6, 0xb3,
-  0xbc, 0x5b, 0x1a, 0x5d, 0x8c, 0x71, 0x42, 0x43, 0x4a, 0xd5, 0x39, 0xba, 0x02, 0x49, 0x1f, 0x81,
-  0x6a, 0xd0, 0x92, 0x45, 0x9e, 0x85, 0x44, 0xa3, 0x40, 0x13, 0x09, 0x4b, 0x91, 0xd0, 0xf9, 0xe7,
-  0x04, 0xd6, 0x2d, 0x66, 0x7c, 0xa5, 0xce, 0x38, 0x68, 0x41, 0xc5, 0xec, 0xb0, 0xea, 0xb8, 0x03,
-  0x95, 0xf6, 0xec, 0x53, 0xb5, 0x34, 0xd0, 0x42, 0xc0, 0x31, 0xa0, 0x51, 0x90, 0x48, 0x6a, 0x09,
-  0x53, 0x08, 0xe3, 0x85, 0xad, 0x4e, 0xf3, 0x05, 0x1d, 0x6e, 0x12, 0x45, 0x2e, 0xc0, 0x7f, 0x3e,
-  0xe5, 0xa9, 0xa7, 0x73, 0x0c, 0x2f, 0xa2, 0xd1, 0x57, 0x07, 0xd2, 0xb2, 0x1c, 0xc8, 0xa0, 0xf2,
-  0x3e, 0xfe, 0x50, 0x29, 0x10, 0x83, 0x56, 0x1b, 0x0d, 0x36, 0xf2, 0xc3, 0xe8, 0xea, 0xd4, 0x9e,
-  0x2f, 0xcf, 0x63, 0x5a, 0xc9, 0x04, 0x45, 0xdc, 0x92, 0x09, 0xc5, 0x5e, 0x3b, 0xc5, 0x10, 0x41,
-  0x13, 0xcc, 0x11, 0x83, 0x79, 0xd3, 0x94, 0x4f, 0x6d, 0x3e, 0x3c, 0x34, 0x12, 0x1d, 0xed, 0xd2,
-  0xf9, 0xcd, 0x93, 0xb5, 0x8a, 0x8b, 0x75, 0x8a, 0xba, 0xf6, 0xe1, 0xf0, 0xad, 0xa2, 0xee, 0x65,
-  0x79, 0x5b, 0xc4, 0xa8, 0x4c, 0xd1, 0x8a, 0x71, 0xc5, 0xb3, 0x96, 0xb9, 0xa8, 0x82, 0xf8, 0x40,
-  0xb4, 0x4e, 0x9d, 0xba, 0xac, 0x2e, 0xc2, 0x71, 0x28, 0x3b, 0x09, 0x3e, 0x9f, 0x66, 0xe1, 0x24,
-  0x86, 0x4a, 0x8f, 0xce, 0x56, 0x90, 0x6b, 0x02, 0xb7, 0xa8, 0x98, 0xd1, 0x23, 0xbd, 0x1c, 0xbd,
-  0x20, 0x2d, 0x92, 0xbf, 0xd6, 0x4d, 0x20, 0x95, 0xcb, 0xba, 0x49, 0x95, 0x1e, 0x08, 0xbe, 0xe8,
-  0x1c, 0x08, 0x5c, 0x5e, 0xed, 0x13, 0x9d, 0xe4, 0xb1, 0x53, 0xcd, 0x00, 0x43, 0xb9, 0x8b, 0xbd,
-  0x93, 0xd6, 0x0c, 0xf0, 0xfb, 0x12, 0xf4, 0x42, 0x22, 0x74, 0xf4, 0xa1, 0x08, 0xe8, 0x4e, 0x88,
-  0xac, 0x2a, 0x01, 0x32, 0x8a, 0x7a, 0x15, 0x13, 0xc6, 0x10, 0x70, 0xf7, 0x53, 0x0b, 0x6a, 0x31,
-  0x7b, 0x54, 0x44, 0xf4, 0xaf, 0xa9, 0xad, 0x2c, 0x8b, 0x4f, 0xe2, 0x39, 0x22, 0x18, 0x3a, 0xc1,
-  0xab, 0xc8, 0xe7, 0xb8, 0x04, 0xa7, 0x93, 0x84, 0x71, 0x1b, 0xdb, 0xd3, 0x76, 0x28, 0xd5, 0x93,
-  0x87, 0xea, 0x89, 0x87, 0xbf, 0x29, 0xaa, 0x63, 0xd6, 0x42, 0xa0, 0x24, 0x0b, 0xc1, 0x7d, 0x1d,
-  0x65, 0x2e, 0x62, 0xca, 0xdb, 0x51, 0x86, 0xc4, 0xf3, 0x4a, 0x29, 0x9c, 0xd1, 0xec, 0xf1, 0xab,
-  0xd7, 0x65, 0xb9, 0x20, 0xbc, 0xa1, 0x49, 0x9d, 0x88, 0xe6, 0xb3, 0x94, 0xba, 0xa1, 0x49, 0x9d,
-  0x44, 0x59, 0x46, 0xdd, 0xd0, 0xa4, 0xae, 0x28, 0x65, 0x05, 0x75, 0x23, 0x93, 0x3a, 0x43, 0x0c,
-  0x2c, 0xc5, 0x8c, 0x4c, 0xca, 0xcc, 0xb6, 0xe7, 0xeb, 0xa3, 0x65, 0x04, 0x83, 0x2e, 0x9e, 0x7f,
-  0x3d, 0x4d, 0x60, 0x34, 0x14, 0x1d, 0x49, 0x08, 0x58, 0x69, 0x85, 0xbe, 0x55, 0x95, 0x2c, 0x1e,
-  0xec, 0x14, 0x05, 0x45, 0xdb, 0x27, 0xa0, 0xc0, 0x68, 0x12, 0x0e, 0x60, 0x08, 0x20, 0x57, 0x77,
-  0xb3, 0x9e, 0x1a, 0x86, 0x43, 0x99, 0x0e, 0xcf, 0x42, 0x87, 0xb7, 0x92, 0x0e, 0x4f, 0xd1, 0xe1,
-  0xd5, 0xd2, 0xe1, 0x2d, 0xa3, 0xc3, 0x2b, 0xd1, 0x21, 0xa2, 0xb7, 0x56, 0x68, 0x81, 0xf4, 0xd3,
-  0x82, 0x2f, 0x16, 0x52, 0x8a, 0x18, 0xb0, 0x58, 0x9a, 0x00, 0xd7, 0x48, 0xaa, 0x14, 0xe2, 0xd5,
-  0x14, 0xe2, 0xad, 0x2a, 0xc4, 0x33, 0x0a, 0xf1, 0x2a, 0x85, 0x68, 0xf0, 0xc5, 0x55, 0x7c, 0xe0,
-  0x33, 0x1a, 0xd7, 0x63, 0x4a, 0x24, 0xf2, 0x23, 0xab, 0x05, 0xa9, 0x4b, 0xea, 0xb8, 0x77, 0x13,
-  0xce, 0x16, 0xb3, 0x53, 0xd9, 0x01, 0x95, 0x1e, 0xb1, 0xa3, 0x71, 0xf1, 0x26, 0xaf, 0x63, 0x13,
-  0x34, 0x79, 0x93, 0xd8, 0x92, 0xf2, 0x78, 0x6b, 0x59, 0x8b, 0x54, 0xb8, 0x75, 0x85, 0x6a, 0x2d,
-  0xad, 0x21, 0x17, 0xb7, 0x19, 0x99, 0x7e, 0x45, 0xb5, 0x18, 0xfd, 0x22, 0x9f, 0x92, 0x29, 0x5f,
-  0x34, 0x6e, 0xa1, 0x48, 0x7d, 0xdf, 0xc2, 0xf3, 0xd2, 0x6d, 0x54, 0x16, 0xfd, 0x3b, 0x9a, 0x71,
-  0x6d, 0xbd, 0xec, 0x1e, 0x4f, 0x0b, 0x5a, 0x76, 0x46, 0x68, 0x96, 0x3b, 0x30, 0x2d, 0xc0, 0x50,
-  0x13, 0xa3, 0x0e, 0x41, 0xac, 0x2a, 0xa0, 0x4f, 0xba, 0x4c, 0x69, 0xdb, 0x25, 0x0d, 0xe4, 0x92,
-  0x99, 0x19, 0x5d, 0xdb, 0x70, 0x8a, 0x87, 0xaf, 0x64, 0xbe, 0xc6, 0x34, 0x4d, 0x97, 0x4f, 0xd3,
-  0x58, 0x67, 0xad, 0xba, 0x76, 0x0c, 0x61, 0x54, 0x8f, 0xdc, 0x44, 0x6e, 0x7b, 0xe5, 0x9b, 0x44,
-  0x6b, 0xe0, 0xbd, 0x5a, 0x78, 0xcf, 0x9e, 0x3f, 0xb7, 0x9e, 0xb0, 0xfb, 0x13, 0x31, 0x41, 0x4c,
-  0xf6, 0xd0, 0x52, 0x9a, 0xbc, 0xa5, 0x38, 0x9e, 0x16, 0xe7, 0x37, 0xcc, 0xde, 0x2c, 0xe2, 0x98,
-  0x47, 0xa4, 0xb7, 0x6c, 0xcf, 0xd1, 0x01, 0xf1, 0xac, 0x3e, 0x07, 0xd4, 0x8d, 0x5e, 0x3e, 0x49,
-  0x55, 0xbc, 0xe2, 0xea, 0x2e, 0xad, 0x3d, 0x55, 0x77, 0xd2, 0x18, 0x5b, 0x0b, 0x92, 0x39, 0x6e,
-  0xfa, 0xe5, 0x99, 0x55, 0x5c, 0x11, 0xda, 0x8f, 0xdf, 0xaa, 0x46, 0xdf, 0x93, 0xa4, 0x3c, 0x13,
-  0x21, 0xf1, 0x8e, 0x44, 0x36, 0xa5, 0x38, 0x76, 0x8e, 0x01, 0xfc, 0x98, 0x0f, 0x6b, 0x36, 0x60,
-  0x1c, 0xf1, 0x4c, 0x60, 0xbc, 0x91, 0x05, 0xff, 0xb1, 0x00, 0xab, 0xe0, 0x7c, 0xd5, 0x32, 0xcd,
-  0x88, 0x7e, 0x95, 0xef, 0x7a, 0x90, 0x40, 0x6d, 0x5f, 0x4f, 0x10, 0x51, 0xf8, 0x83, 0x25, 0x3e,
-  0x64, 0x08, 0x80, 0x6d, 0x1e, 0x4e, 0x54, 0x4c, 0xd0, 0x72, 0x9c, 0x96, 0xc0, 0xd5, 0xe2, 0xcf,
-  0xe6, 0xa2, 0x77, 0x60, 0xfc, 0xb6, 0xf6, 0x7c, 0x11, 0x65, 0x28, 0x63, 0xaa, 0xd1, 0x4a, 0xc5,
-  0x82, 0xb3, 0xb3, 0xba, 0x58, 0xf4, 0xaa, 0xb4, 0x62, 0xe1, 0xb5, 0x25, 0x70, 0xeb, 0x8a, 0xcd,
-  0xe6, 0xa4, 0x87, 0x94, 0x4c, 0x99, 0xa5, 0xbe, 0x86, 0xa1, 0x1d, 0x1b, 0x6e, 0x65, 0xc9, 0xdc,
-  0x72, 0x52, 0xed, 0x48, 0xc5, 0x4b, 0xe4, 0x96, 0x96, 0xd1, 0xea, 0xda, 0x4b, 0xd9, 0x06, 0x19,
-  0x55, 0x42, 0x53, 0x25, 0x0a, 0x05, 0x64, 0x3d, 0xa2, 0x0a, 0x79, 0x51, 0x44, 0x21, 0x72, 0x4b,
-  0xcb, 0x68, 0x5d, 0xde, 0x70, 0x9a, 0x84, 0x6c, 0x56, 0x69, 0x7a, 0x32, 0xbd, 0x58, 0x8f, 0x24,
-  0x92, 0x4a, 0x83, 0x22, 0x40, 0x6d, 0x15, 0xb9, 0x6c, 0xc8, 0x24, 0x90, 0xff, 0xb2, 0x9f, 0x12,
-  0x62, 0x40, 0x77, 0x7e, 0x90, 0xd1, 0x8d, 0x40, 0xca, 0x41, 0x33, 0xc3, 0x6b, 0x26, 0xfb, 0x69,
-  0xd5, 0x85, 0xc2, 0xd5, 0x37, 0xbe, 0xc7, 0x98, 0xaf, 0x73, 0xf1, 0x7d, 0x69, 0xcb, 0xb6, 0xa5,
-  0xb5, 0x2c, 0xcb, 0xf2, 0x98, 0x95, 0xb1, 0x28, 0xbf, 0xd9, 0x12, 0x78, 0x60, 0x5b, 0xcd, 0xaa,
-  0x2c, 0xcf, 0x93, 0xd1, 0x72, 0x8e, 0xd3, 0x32, 0x62, 0x45, 0xa9, 0x79, 0xae, 0xcf, 0xbe, 0x7f,
-  0x15, 0x66, 0xdf, 0xf9, 0xdf, 0x01, 0x00, 0x2e, 0xf8, 0xe8, 0xab, 0xa3, 0x36, 0x77, 0xdc, 0x88,
-  0x0d, 0x4f, 0xa6, 0xeb, 0xad, 0x32, 0xf6, 0x8c, 0x8c, 0x35, 0xde, 0xe0, 0x4d, 0x67, 0xb4, 0xaa,
-  0xce, 0x47, 0x6e, 0xe2, 0x8d, 0xb9, 0xe0, 0x59, 0xde, 0x5c, 0x2e, 0xb6, 0x11, 0x86, 0x18, 0xd6,
-  0x54, 0x4c, 0xef, 0x21, 0x9c, 0xda, 0x2d, 0x80, 0x5f, 0xa0, 0x29, 0x97, 0x2e, 0xd7, 0x21, 0x30,
-  0x1e, 0x11, 0x2f, 0x16, 0x8b, 0x75, 0xe8, 0xfb, 0x9c, 0x98, 0xa2, 0x30, 0xa4, 0xf2, 0x24, 0xfc,
-  0x84, 0x0a, 0x5e, 0x4e, 0x49, 0x61, 0x11, 0x1d, 0x77, 0x80, 0x30, 0x2a, 0x13, 0xcd, 0x7f, 0x16,
-  0x69, 0xdb, 0x0a, 0x15, 0x23, 0xbc, 0xcb, 0xe7, 0x2a, 0x12, 0x58, 0x58, 0x4d, 0x31, 0x63, 0xb6,
-  0x25, 0x52, 0xc2, 0xb8, 0x29, 0x66, 0xc8, 0xe4, 0xf2, 0x2a, 0x37, 0x3f, 0x4b, 0x8b, 0xb8, 0xf7,
-  0x4b, 0x4b, 0xaf, 0x7c, 0x38, 0xb4, 0x2e, 0xd2, 0x1b, 0x8b, 0x9c, 0x60, 0x39, 0x3c, 0xc7, 0x98,
-  0xfb, 0xb4, 0x9c, 0xbb, 0xce, 0xb2, 0xfc, 0xf2, 0x46, 0x29, 0x51, 0xa5, 0x09, 0x41, 0x9d, 0x74,
-  0x9b, 0x25, 0xb4, 0xf8, 0xa2, 0xb3, 0xd1, 0xf5, 0x6c, 0x0b, 0xcd, 0x35, 0x2b, 0xb8, 0xbc, 0x76,
-  0x3e, 0x1d, 0x17, 0x50, 0x75, 0xf4, 0xe7, 0xe1, 0x6b, 0xb0, 0xbc, 0x9a, 0x73, 0xff, 0x0a, 0x23,
-  0x46, 0x1b, 0xc1, 0xc3, 0x03, 0xdc, 0xbc, 0xe9, 0x5f, 0xf8, 0x61, 0xce, 0xc6, 0x01, 0x5d, 0x2d,
-  0xb6, 0x8d, 0x37, 0xb5, 0x9e, 0x25, 0x7e, 0x3a, 0xda, 0xce, 0x30, 0xfa, 0x93, 0x98, 0x1c, 0x9d,
-  0x05, 0xf9, 0x34, 0xc1, 0xbd, 0xa3, 0x18, 0x6c, 0x1e, 0x52, 0xf9, 0x2d, 0x5b, 0x74, 0xf8, 0xcd,
-  0x11, 0x5d, 0xb1, 0xfd, 0x16, 0xec, 0x2f, 0xba, 0xf5, 0x62, 0x3e, 0x8f, 0x42, 0x1e, 0xf6, 0x7e,
-  0xfb, 0xa7, 0x2c, 0x89, 0x1d, 0x0c, 0x7b, 0x86, 0xa7, 0xcd, 0x0e, 0xca, 0x91, 0xcf, 0x25, 0x49,
-  0xea, 0x58, 0x3e, 0x8f, 0x4e, 0x1e, 0x64, 0x6e, 0xf2, 0xb1, 0xc5, 0xf2, 0x69, 0x0a, 0x23, 0x29,
-  0xea, 0x1a, 0x0a, 0x84, 0xdf, 0x74, 0x9e, 0xbd, 0x7d, 0xfb, 0x9a, 0x61, 0x84, 0x78, 0x84, 0xe0,
-  0xf6, 0x85, 0xb5, 0xc6, 0xda, 0x55, 0x69, 0xe6, 0x4e, 0x15, 0x1e, 0xa5, 0x9d, 0xd7, 0x57, 0xb2,
-  0xe5, 0x33, 0x93, 0x30, 0x8b, 0xe0, 0x40, 0x9c, 0x6c, 0xa1, 0xdd, 0xba, 0x48, 0x92, 0x16, 0x91,
-  0xdf, 0xc1, 0x5b, 0x00, 0xb0, 0x70, 0x92, 0x22, 0x7e, 0xc8, 0x44, 0x0b, 0xd1, 0x6d, 0x00, 0xfe,
-  0x07, 0x01, 0x06, 0xee, 0x0c, 0xec, 0x2d, 0x7f, 0x12, 0xc8, 0x08, 0xfe, 0x7c, 0x0f, 0x80, 0x8d,
-  0x58, 0x6e, 0xe7, 0x11, 0x21, 0xc1, 0xda, 0xb4, 0x92, 0x74, 0x3d, 0x8f, 0xf3, 0xca, 0x16, 0x9f,
-  0xd6, 0xcf, 0x48, 0xfa, 0xc3, 0x87, 0x4d, 0x75, 0x71, 0x80, 0x25, 0x78, 0x7e, 0xc6, 0x05, 0x95,
-  0x0f, 0x26, 0x32, 0x7a, 0x46, 0xc7, 0x0c, 0x3a, 0x8f, 0x8d, 0xae, 0xed, 0x36, 0x50, 0xce, 0x21,
-  0x05, 0x21, 0xb6, 0xb2, 0x00, 0x85, 0xac, 0xde, 0x6b, 0x74, 0x0a, 0x0e, 0x89, 0x6e, 0xa2, 0xad,
-  0x52, 0x22, 0x67, 0x86, 0xf7, 0xef, 0x1f, 0x8a, 0xc3, 0x41, 0x96, 0xb2, 0xd1, 0xbf, 0xa4, 0xa2,
-  0xd7, 0x2c, 0x5b, 0x2d, 0xb2, 0x71, 0x77, 0xae, 0x6b, 0x2f, 0x9e, 0xd6, 0x24, 0xd7, 0x29, 0x1d,
-  0x2c, 0x8a, 0x8d, 0x4a, 0x97, 0x6b, 0x68, 0xcb, 0x4b, 0xc7, 0xa5, 0xaa, 0xf5, 0xea, 0x4e, 0x9b,
-  0x17, 0x5a, 0x37, 0xab, 0xbb, 0x57, 0x5b, 0x77, 0x5a, 0xc7, 0x5b, 0xaf, 0xfa, 0x9b, 0x11, 0x60,
-  0x56, 0xdf, 0xab, 0xad, 0xfe, 0x5a, 0x04, 0x48, 0xb7, 0x7b, 0xa9, 0xe4, 0xd5, 0x5c, 0xe9, 0x3c,
-  0x0d, 0x27, 0x53, 0xb1, 0x84, 0x46, 0x2b, 0x80, 0x17, 0x74, 0xab, 0xb2, 0x85, 0x1e, 0xb5, 0x74,
-  0xb8, 0x0e, 0x35, 0xdc, 0xb5, 0x5f, 0xc2, 0x8e, 0x35, 0xa8, 0x91, 0xd7, 0x16, 0xd7, 0xd0, 0x22,
-  0xd6, 0x03, 0xcb, 0xd4, 0x14, 0x5a, 0x61, 0x88, 0x1b, 0x6d, 0x70, 0x77, 0x08, 0xaa, 0x11, 0xe3,
-  0xe6, 0x5e, 0x1c, 0xa3, 0xd0, 0xfc, 0xce, 0xc4, 0x81, 0xba, 0x11, 0xcd, 0x8b, 0x7f, 0x97, 0x30,
-  0x7e, 0xbd, 0x40, 0x26, 0x77, 0x1a, 0x6c, 0xae, 0x6c, 0xca, 0xca, 0x44, 0x5e, 0xd6, 0xa1, 0xe9,
-  0x13, 0xbb, 0x3e, 0xc2, 0x1b, 0x2a, 0x95, 0x42, 0xa2, 0xe1, 0x44, 0x67, 0xa9, 0x98, 0x79, 0x6e,
-  0x95, 0x28, 0x51, 0x14, 0x43, 0xbe, 0x6a, 0xbf, 0xe0, 0xf5, 0x1a, 0x1a, 0xad, 0x50, 0x62, 0xf6,
-  0xd6, 0xc1, 0x59, 0x4e, 0x6d, 0x8a, 0xbf, 0xcc, 0x7e, 0x41, 0xce, 0x7b, 0xb5, 0x7d, 0xb6, 0xa4,
-  0xb3, 0xd1, 0x71, 0x95, 0x9c, 0xfd, 0xf9, 0x59, 0xf9, 0x23, 0x18, 0x1e, 0x62, 0xcf, 0xe2, 0x1d,
-  0xab, 0x78, 0x65, 0xd2, 0xf0, 0xb6, 0xa8, 0xef, 0x6b, 0xe7, 0x61, 0x9a, 0x2f, 0xfc, 0xe8, 0x74,
-  0x18, 0x61, 0x00, 0xf3, 0xe0, 0x14, 0xeb, 0x28, 0x91, 0x97, 0x30, 0x16, 0x41, 0xee, 0x3b, 0x8a,
-  0xb5, 0x4b, 0x3a, 0x59, 0xc9, 0xfc, 0xaa, 0xef, 0x67, 0xf6, 0x69, 0x5a, 0x49, 0xcf, 0x96, 0x3a,
-  0x86, 0x6a, 0xa7, 0x84, 0x72, 0x5f, 0xb7, 0x8b, 0x21, 0xdf, 0x99, 0xcc, 0x19, 0xac, 0xbb, 0xef,
-  0xf1, 0x8a, 0x66, 0x3e, 0x5f, 0x42, 0xb3, 0xe5, 0xbf, 0x9a, 0xbe, 0xf6, 0x74, 0x98, 0x8c, 0xfc,
-  0x78, 0x53, 0x11, 0xa9, 0x1f, 0xf8, 0x71, 0x16, 0x59, 0x6f, 0x61, 0xd5, 0x55, 0xc5, 0xd6, 0x35,
-  0x7b, 0xcb, 0xe0, 0xa4, 0x02, 0xce, 0x44, 0x6d, 0x2a, 0x24, 0xbc, 0xb8, 0xfb, 0x65, 0x59, 0xa9,
-  0x5c, 0xc5, 0x44, 0x6d, 0xc2, 0xab, 0xba, 0x76, 0xd3, 0xac, 0xba, 0xde, 0xa9, 0xd2, 0x6e, 0x96,
-  0x4b, 0x5f, 0xbe, 0x64, 0xeb, 0x91, 0xb1, 0x4f, 0x5b, 0x29, 0x9b, 0x9a, 0xb5, 0xa9, 0x6d, 0x83,
-  0x58, 0xe1, 0x19, 0x20, 0xa6, 0xa3, 0x5d, 0x08, 0xb4, 0xa9, 0xcd, 0xae, 0xed, 0x72, 0x53, 0xc5,
-  0x20, 0x00, 0xba, 0x0b, 0xf2, 0x74, 0x80, 0xda, 0xc8, 0xc9, 0x5f, 0x4b, 0x47, 0xb6, 0xcb, 0xc2,
-  0xae, 0xb2, 0x54, 0xf7, 0xe4, 0x04, 0xe5, 0x1d, 0x71, 0xc6, 0x14, 0x86, 0xf3, 0xf4, 0xcd, 0x1b,
-  0xb9, 0xc3, 0xcd, 0xf0, 0xc4, 0x15, 0xd7, 0x67, 0xd9, 0x04, 0x67, 0x52, 0xa8, 0x1e, 0x47, 0xfc,
-  0x9a, 0x2f, 0xcd, 0x75, 0x5a, 0x3a, 0xe3, 0x45, 0x37, 0xaa, 0x0a, 0x69, 0x2f, 0xcd, 0x56, 0x40,
-  0xae, 0x3c, 0x99, 0x5a, 0xec, 0x3b, 0x7f, 0x86, 0xde, 0x34, 0x47, 0xa0, 0xb2, 0x91, 0x55, 0x4d,
-  0x51, 0x2a, 0x2a, 0x04, 0x16, 0xe0, 0x13, 0xf5, 0x75, 0x31, 0xa9, 0x89, 0x17, 0xec, 0xca, 0x4b,
-  0xc6, 0x72, 0x97, 0x8c, 0x8d, 0x54, 0x14, 0xc5, 0x5f, 0xf0, 0xd6, 0xa3, 0xf2, 0x3d, 0x64, 0xb6,
-  0xf2, 0x80, 0x0b, 0xde, 0x1e, 0x9d, 0x83, 0xb9, 0xe6, 0x97, 0xfa, 0x05, 0x78, 0x5b, 0xd0, 0x09,
-  0x4d, 0x28, 0xab, 0x2b, 0xf6, 0xe8, 0x4e, 0xbf, 0x8c, 0xae, 0x06, 0x2e, 0x5d, 0xda, 0x17, 0x25,
-  0x93, 0x47, 0x8b, 0xf1, 0x98, 0xca, 0x7b, 0xf7, 0x5e, 0x5e, 0xf0, 0x09, 0xa9, 0x8f, 0xe5, 0x0e,
-  0xd4, 0x65, 0x2c, 0x32, 0x2f, 0xc6, 0xc5, 0xaa, 0xa9, 0x83, 0x38, 0x20, 0x22, 0x4f, 0xc2, 0xf3,
-  0x15, 0xc8, 0xe2, 0x16, 0xe6, 0x02, 0xd1, 0x8f, 0xb3, 0xf0, 0x4d, 0x30, 0xa1, 0x03, 0x0c, 0xdb,
-  0xff, 0x7c, 0xd9, 0x7d, 0xf4, 0xcf, 0xef, 0xde, 0x75, 0xda, 0xfb, 0x87, 0xef, 0xff, 0xf4, 0x6e,
-  0xf6, 0x0f, 0xef, 0xb7, 0x27, 0x87, 0xc6, 0x74, 0x0b, 0x48, 0xd1, 0x8b, 0x64, 0xd2, 0x94, 0x66,
-  0x42, 0x53, 0xab, 0x7a, 0x4b, 0xe7, 0x03, 0xb0, 0x2d, 0x51, 0xd7, 0xc4, 0x54, 0xd8, 0xc0, 0x8c,
-  0xea, 0xba, 0x61, 0x0c, 0x7f, 0x9f, 0xbd, 0x7d, 0x89, 0x77, 0x4f, 0x3a, 0xfc, 0x9e, 0x98, 0x12,
-  0x93, 0x30, 0x89, 0x0b, 0xf2, 0x09, 0x91, 0xdf, 0x6c, 0x18, 0x17, 0x40, 0xe3, 0x2d, 0x6e, 0xfc,
-  0x6e, 0x62, 0x94, 0xe0, 0x56, 0x83, 0xcf, 0xda, 0x95, 0x9a, 0x05, 0xfb, 0x56, 0x91, 0x02, 0xfd,
-  0x92, 0xbe, 0x67, 0x4e, 0x05, 0xb8, 0x7a, 0x01, 0x14, 0x32, 0x0e, 0x5a, 0x3d, 0xa0, 0xe8, 0x47,
-  0xb8, 0x7c, 0x13, 0x00, 0x13, 0xe8, 0x22, 0xc1, 0x80, 0x0e, 0x67, 0xf1, 0xa9, 0x15, 0x3d, 0x8b,
-  0x24, 0x16, 0x1a, 0x07, 0x4a, 0xae, 0x47, 0x13, 0x8b, 0x00, 0x26, 0x22, 0x5e, 0x4e, 0x87, 0x4b,
-  0x01, 0x5a, 0xa4, 0x11, 0x6b, 0xd5, 0xe9, 0xf6, 0xaa, 0x86, 0x7e, 0x25, 0x73, 0xaf, 0xd5, 0x10,
-  0x7d, 0x97, 0xdf, 0x68, 0x08, 0xa5, 0xbd, 0x00, 0x06, 0x37, 0x1b, 0xed, 0x76, 0x9b, 0x29, 0x2c,
-  0x06, 0x86, 0x28, 0x67, 0x44, 0x9e, 0x06, 0xfe, 0x8c, 0xc1, 0x47, 0xcc, 0x08, 0x65, 0x23, 0x8c,
-  0xc7, 0x09, 0xcf, 0xe2, 0xba, 0x5a, 0x21, 0xea, 0x50, 0x48, 0x58, 0xe5, 0x1e, 0x43, 0x0d, 0x0c,
-  0x72, 0x1c, 0xa9, 0xcb, 0xaf, 0x74, 0x7e, 0xbb, 0x8f, 0x5f, 0xbc, 0x3a, 0x79, 0xfa, 0xa4, 0xd8,
-  0x4f, 0x6d, 0xd6, 0xe9, 0x49, 0x98, 0x0d, 0xab, 0xd5, 0x1a, 0xa1, 0xa6, 0x4f, 0x55, 0xad, 0x4a,
-  0xc3, 0x82, 0x99, 0xc3, 0x9b, 0x60, 0xb8, 0x42, 0x24, 0xb4, 0xa0, 0xf0, 0xe6, 0x86, 0x7d, 0xbd,
-  0x65, 0x52, 0xff, 0x82, 0x6e, 0xfd, 0x93, 0x02, 0xae, 0x84, 0x17, 0x23, 0x59, 0xa8, 0x8f, 0xe6,
-  0x34, 0x20, 0xaa, 0x96, 0x58, 0x5c, 0x33, 0x29, 0x40, 0x80, 0x11, 0x14, 0x17, 0xa5, 0xa9, 0xba,
-  0xd7, 0x96, 0x54, 0x44, 0x90, 0xa9, 0x42, 0x70, 0xf3, 0x34, 0x9c, 0x61, 0x4b, 0xe3, 0x45, 0x61,
-  0x0d, 0xe3, 0x50, 0x46, 0x31, 0xb2, 0xcc, 0xd3, 0x04, 0xaf, 0x50, 0xfc, 0x0b, 0xe8, 0x78, 0xec,
-  0x7b, 0xda, 0xed, 0x72, 0x2a, 0x9f, 0x96, 0xae, 0xd7, 0x59, 0xa1, 0xd8, 0x05, 0x2a, 0x9f, 0x60,
-  0x46, 0xe4, 0x02, 0xa3, 0xaa, 0xc2, 0x4b, 0xe5, 0x8c, 0x74, 0x36, 0x7c, 0x45, 0x87, 0x12, 0x85,
-  0x4c, 0x97, 0xeb, 0x1f, 0x81, 0x04, 0x44, 0x38, 0xc2, 0xa0, 0xee, 0xa1, 0xf3, 0xcd, 0x98, 0x80,
-  0xc7, 0x02, 0xd4, 0x8b, 0x9b, 0x2d, 0xce, 0xf8, 0xfc, 0x15, 0xde, 0xb4, 0xd5, 0x6d, 0x95, 0x6c,
-  0x80, 0x03, 0xd6, 0xf8, 0xbe, 0x51, 0x4c, 0x98, 0xe6, 0xfe, 0x44, 0x66, 0x85, 0x8f, 0xdf, 0xb0,
-  0x0f, 0xef, 0xfe, 0xf8, 0x59, 0xbe, 0x5e, 0xbf, 0xff, 0x80, 0xf0, 0x1a, 0x38, 0x8c, 0x0d, 0x18,
-  0xab, 0x13, 0x60, 0x14, 0x25, 0xd7, 0xef, 0xff, 0xf8, 0x19, 0x61, 0x31, 0xe6, 0x8f, 0x4e, 0x3a,
-  0x8f, 0xf6, 0x23, 0xdb, 0x2d, 0xc3, 0xc1, 0x9a, 0xb4, 0x22, 0x34, 0x9b, 0xba, 0xa7, 0x49, 0xab,
-  0x02, 0x6d, 0xa8, 0x7f, 0xf2, 0xf4, 0xd1, 0xf7, 0x7f, 0xef, 0xb4, 0x74, 0xf0, 0x51, 0x70, 0xb6,
-  0x98, 0x10, 0x82, 0xba, 0x12, 0xaf, 0x8c, 0xf5, 0xfc, 0xbb, 0x6f, 0x5f, 0x99, 0x48, 0xd8, 0xbb,
-  0x96, 0xe3, 0xfc, 0xf0, 0xf0, 0xcd, 0x77, 0x26, 0x0e, 0x0a, 0xef, 0x72, 0x1c, 0x18, 0x8f, 0x5f,
-  0xbd, 0x31, 0x91, 0xf8, 0xd0, 0x47, 0x52, 0x64, 0x2a, 0x02, 0x1a, 0x9a, 0x01, 0xb0, 0x34, 0x9b,
-  0x5b, 0x91, 0x12, 0x1c, 0x7a, 0xc5, 0x5c, 0x7a, 0x3d, 0x9b, 0x10, 0x48, 0x5b, 0xd7, 0x7b, 0xf7,
-  0xe4, 0x3d, 0x1a, 0x9d, 0xcb, 0x99, 0x54, 0xc6, 0x79, 0x5e, 0xc6, 0xa9, 0xf2, 0xa8, 0x8c, 0xf2,
-  0x43, 0x19, 0xa5, 0xca, 0xa2, 0x32, 0xca, 0xd3, 0x32, 0x8a, 0x64, 0x50, 0x99, 0x3f, 0x88, 0x68,
-  0x63, 0x50, 0x0d, 0xd4, 0x63, 0x34, 0x0d, 0x0c, 0xe3, 0x86, 0x2f, 0xe6, 0x88, 0xd1, 0x66, 0xf5,
-  0x4a, 0xcf, 0xa1, 0x3e, 0xd2, 0xf1, 0x38, 0x08, 0x28, 0xc5, 0x22, 0x9b, 0xeb, 0xf7, 0x20, 0xbc,
-  0x58, 0xd8, 0xf5, 0x87, 0x96, 0xb1, 0x5c, 0x9c, 0x9a, 0x0b, 0xa5, 0xc3, 0x14, 0x83, 0x6b, 0x8a,
-  0x81, 0x1e, 0xd7, 0xa8, 0xce, 0x79, 0xce, 0xa9, 0x5c, 0x13, 0x95, 0xd6, 0x0b, 0x55, 0x3d, 0x46,
-  0xc5, 0x82, 0xd6, 0x92, 0xac, 0x80, 0x04, 0xd5, 0x47, 0xe1, 0x0f, 0x0f, 0xb2, 0x39, 0x98, 0xed,
-  0xf2, 0xce, 0x7b, 0xa0, 0xa7, 0x0d, 0xbd, 0xa9, 0x71, 0x5c, 0xd0, 0xf6, 0x60, 0x1b, 0x21, 0x8e,
-  0x09, 0xee, 0x58, 0x90, 0x29, 0xd2, 0x54, 0x17, 0xd3, 0xc7, 0x78, 0xce, 0xc2, 0xc7, 0xd3, 0x30,
-  0x1a, 0x35, 0x53, 0x11, 0x02, 0xc5, 0x00, 0xc8, 0x86, 0x69, 0x12, 0x45, 0x6f, 0x93, 0x39, 0x5d,
-  0xcb, 0x59, 0xf9, 0xf0, 0x2c, 0x08, 0x27, 0xd3, 0x5c, 0x3b, 0xc1, 0x67, 0xc0, 0x0c, 0x31, 0x5f,
-  0xc1, 0x81, 0xc7, 0xc9, 0x02, 0x2c, 0xc6, 0x63, 0x36, 0x28, 0x6e, 0xa5, 0x35, 0x60, 0xb9, 0xa1,
-  0xcf, 0x29, 0x31, 0x3e, 0x8c, 0xc3, 0x34, 0xcb, 0x29, 0x5d, 0x0c, 0x16, 0x45, 0xd3, 0x18, 0xc1,
-  0x5d, 0x74, 0xc9, 0xe0, 0xcb, 0x88, 0x34, 0x44, 0x48, 0xa3, 0xa8, 0xb0, 0x76, 0xbe, 0x92, 0xcf,
-  0x85, 0xaa, 0x02, 0x9f, 0x63, 0x99, 0x81, 0x36, 0x47, 0xf0, 0x47, 0x78, 0x03, 0xab, 0xba, 0x0a,
-  0x59, 0x64, 0x21, 0xab, 0x82, 0x4e, 0x8b, 0x69, 0x19, 0xc3, 0xc8, 0x87, 0xbb, 0xcd, 0x1a, 0x87,
-  0xea, 0xfb, 0x92, 0x0b, 0x60, 0xcb, 0xa3, 0x26, 0xcf, 0xdc, 0x3a, 0x58, 0x1a, 0xa3, 0xad, 0xa5,
-  0x58, 0x42, 0xb5, 0x96, 0x5a, 0xbe, 0x21, 0xd6, 0x56, 0x30, 0x37, 0x3e, 0xa0, 0x33, 0xd4, 0x19,
-  0x31, 0x26, 0x9f, 0xc9, 0x7a, 0x87, 0x0e, 0x28, 0x6f, 0x6d, 0x5b, 0x66, 0x3f, 0x56, 0xcd, 0x47,
-  0x23, 0xab, 0x51, 0x72, 0x11, 0xe3, 0xea, 0x89, 0x96, 0x1b, 0x0c, 0x70, 0x45, 0x5b, 0x2f, 0xbf,
-  0x70, 0xfa, 0x2c, 0x4a, 0xce, 0x44, 0xff, 0x7e, 0x04, 0x8f, 0xcd, 0x77, 0x05, 0xe2, 0x4f, 0xe0,
-  0x2f, 0x37, 0x9d, 0x7f, 0x86, 0xc6, 0xc3, 0x1b, 0x9f, 0x64, 0x4c, 0x63, 0xe4, 0xda, 0x36, 0xd8,
-  0x02, 0x21, 0xae, 0xe7, 0x68, 0x2b, 0x90, 0x8b, 0x14, 0x97, 0xef, 0xf8, 0x6c, 0xa7, 0xfb, 0xfd,
-  0x9b, 0x17, 0xa2, 0x1b, 0xf3, 0x8b, 0x5e, 0xe1, 0xbd, 0x89, 0x25, 0x69, 0xf0, 0xfe, 0x92, 0x2e,
-  0xef, 0x73, 0x1e, 0xfb, 0xee, 0x34, 0x0d, 0x30, 0x68, 0x15, 0xe4, 0xcd, 0xdf, 0x65, 0x5d, 0xb1,
-  0x4b, 0xa3, 0xe7, 0x70, 0xfa, 0xc7, 0xcf, 0x86, 0x66, 0x7a, 0x7e, 0xf2, 0x4a, 0xa8, 0xa4, 0x96,
-  0x9b, 0x45, 0x21, 0xd8, 0x2b, 0x9d, 0xad, 0xee, 0x7e, 0xeb, 0xda, 0xcd, 0x2f, 0xf3, 0x0f, 0x3c,
-  0x0b, 0x79, 0xd9, 0x37, 0x46, 0xb9, 0x2a, 0x88, 0x4d, 0x83, 0xf3, 0xe4, 0xa3, 0x46, 0x2c, 0x94,
-  0x68, 0x0d, 0x15, 0x26, 0x9a, 0x5b, 0xa8, 0x4c, 0x0c, 0x4f, 0xc6, 0x39, 0xae, 0xdc, 0x95, 0x92,
-  0x54, 0xe1, 0xdb, 0xa1, 0xf1, 0x9d, 0x9f, 0x2b, 0x23, 0x54, 0xbc, 0x46, 0x81, 0x7e, 0x71, 0xa9,
-  0x9d, 0xcb, 0x0c, 0xc2, 0xf7, 0x5a, 0xa5, 0xab, 0x10, 0xab, 0x77, 0x3e, 0xd1, 0xc2, 0x28, 0xde,
-  0xea, 0x44, 0x85, 0xdf, 0x30, 0x00, 0x00, 0x05, 0xf9, 0xa3, 0x1b, 0x1b, 0xe8, 0x00, 0xe4, 0x90,
-  0x07, 0x34, 0x53, 0x01, 0x08, 0x96, 0x84, 0x06, 0x38, 0xbc, 0xb7, 0x22, 0x26, 0x00, 0x1e, 0x64,
-  0x50, 0x30, 0xb6, 0xeb, 0xac, 0x6c, 0xc1, 0xd8, 0x52, 0x8c, 0x0c, 0xf0, 0x30, 0xa2, 0x3b, 0xe3,
-  0x85, 0x20, 0xdb, 0x2e, 0x8a, 0xbf, 0x5d, 0x7d, 0xd7, 0xa8, 0xa0, 0x11, 0xd0, 0x60, 0x79, 0xd8,
-  0x03, 0x05, 0x44, 0xb4, 0x73, 0xc2, 0x2b, 0x15, 0x6f, 0xa9, 0x33, 0xe7, 0x72, 0x79, 0xb3, 0x56,
-  0x5f, 0x82, 0xde, 0x69, 0x53, 0x56, 0x6d, 0xbc, 0x54, 0xce, 0x69, 0xd5, 0x9e, 0x61, 0x2c, 0x4f,
-  0x55, 0x18, 0x51, 0x15, 0xcc, 0xdb, 0xbb, 0x37, 0x2f, 0x83, 0x9f, 0xfe, 0xa4, 0x42, 0x9a, 0xc6,
-  0xc5, 0xd3, 0xc4, 0xdb, 0xbf, 0x9c, 0x18, 0x37, 0x4d, 0x66, 0x4b, 0xfa, 0x31, 0x0c, 0x75, 0xe1,
-  0x5c, 0x4c, 0x80, 0x00, 0x03, 0x53, 0x9c, 0x11, 0x76, 0xa6, 0x79, 0x3e, 0xcf, 0x0e, 0xb6, 0xb7,
-  0x87, 0xa3, 0xd8, 0xfd, 0x29, 0xa3, 0xcd, 0xc2, 0xa9, 0x1b, 0x07, 0xf9, 0x76, 0x3c, 0x9f, 0x6d,
-  0xf3, 0x8b, 0xcb, 0x7e, 0xca, 0xfe, 0xdc, 0x77, 0xfb, 0x6e, 0x67, 0x1b, 0x88, 0xca, 0x45, 0xda,
-  0x62, 0x46, 0xbb, 0x27, 0xe1, 0x9b, 0xc3, 0xb3, 0x4b, 0xa4, 0x26, 0x90, 0x57, 0x17, 0x6b, 0xb3,
-  0x49, 0xd3, 0x35, 0x89, 0x62, 0x6c, 0xba, 0x16, 0x59, 0x53, 0x7f, 0x36, 0x0b, 0x52, 0x20, 0xcb,
-  0x73, 0x3b, 0xee, 0x9e, 0x23, 0x51, 0xcb, 0x24, 0x18, 0xb1, 0x3b, 0x3e, 0xad, 0x4d, 0x03, 0x63,
-  0x9f, 0xd6, 0x67, 0xce, 0x4f, 0x59, 0x9b, 0x07, 0x93, 0xa5, 0xe6, 0x23, 0x82, 0xba, 0x4e, 0x91,
-  0x4f, 0x0d, 0x49, 0xcc, 0xb8, 0x28, 0x54, 0x0b, 0x34, 0x6a, 0xdc, 0x27, 0xae, 0xa5, 0xeb, 0x33,
-  0x83, 0x5a, 0x72, 0x31, 0x63, 0xa2, 0x27, 0x6a, 0xb7, 0x3e, 0x17, 0x78, 0x5b, 0xec, 0xf5, 0xab,
-  0x17, 0x2f, 0x4e, 0x5f, 0x9e, 0x14, 0xa0, 0x2a, 0x6c, 0xa3, 0xe2, 0x0b, 0xee, 0x1f, 0x30, 0x6c,
-  0xa9, 0x4f, 0x52, 0x41, 0xf0, 0x9f, 0x7a, 0xc0, 0x69, 0xe1, 0xd7, 0xd7, 0x03, 0x91, 0xe1, 0xdb,
-  0xc2, 0x3e, 0x09, 0xb6, 0x1c, 0xf1, 0xfc, 0x18, 0x9e, 0x70, 0x0f, 0x02, 0xfe, 0x4e, 0xf3, 0x59,
-  0x74, 0xfc, 0xff, 0x01, 0x04, 0x72, 0xc0, 0x5a, 0x96, 0x0c, 0x01, 0x00
+  0x1f, 0x8b, 0x08, 0x00, 0x56, 0x61, 0xd5, 0x6a, 0x02, 0xff, 0xed, 0x7d, 0xdb, 0x96, 0xdb, 0x38,
+  0x92, 0xe0, 0xbb, 0xbf, 0x02, 0xa5, 0xee, 0x29, 0x4a, 0xed, 0x14, 0x53, 0xa2, 0xa4, 0xbc, 0x3a,
+  0xb3, 0xda, 0xb7, 0x1a, 0xbb, 0x27, 0x5d, 0xf6, 0xb1, 0x5d, 0x5d, 0xd3, 0xed, 0xf1, 0x49, 0x33,
+  0x25, 0x4a, 0x62, 0x99, 0x22, 0xb5, 0x24, 0x95, 0x17, 0x7b, 0xf2, 0x9c, 0x79, 0xdc, 0xe7, 0xdd,
+  0x39, 0x67, 0x5e, 0xe6, 0x23, 0xe6, 0x6d, 0xdf, 0xfb, 0x53, 0xfa, 0x4b, 0x36, 0x22, 0x70, 0x21,
+  0x40, 0x82, 0xba, 0x64, 0xa6, 0xeb, 0x32, 0x35, 0xd5, 0x5d, 0x95, 0x14, 0x19, 0x11, 0x08, 0x04,
+  0x02, 0x81, 0x40, 0x00, 0x08, 0x3c, 0xf8, 0xea, 0xc9, 0xcb, 0xc7, 0x6f, 0xff, 0xf2, 0xea, 0x29,
+  0x9b, 0xe6, 0xb3, 0xe8, 0xf8, 0xde, 0x03, 0xfc, 0xc3, 0x22, 0x3f, 0x9e, 0x1c, 0x35, 0x82, 0xb8,
+  0x81, 0x2f, 0x02, 0x7f, 0x04, 0x7f, 0x66, 0x41, 0xee, 0xb3, 0xe1, 0xd4, 0x4f, 0xb3, 0x20, 0x3f,
+  0x6a, 0x7c, 0xff, 0xf6, 0xdb, 0xf6, 0x5e, 0x43, 0xbe, 0x8e, 0xfd, 0x59, 0x70, 0xd4, 0x38, 0x0f,
+  0x83, 0x8b, 0x79, 0x92, 0xe6, 0x0d, 0x36, 0x4c, 0xe2, 0x3c, 0x88, 0x01, 0xec, 0x22, 0x1c, 0xe5,
+  0xd3, 0xa3, 0x51, 0x70, 0x1e, 0x0e, 0x83, 0x36, 0xfd, 0xd8, 0x62, 0x61, 0x1c, 0xe6, 0xa1, 0x1f,
+  0xb5, 0xb3, 0xa1, 0x1f, 0x05, 0x47, 0x5d, 0xb7, 0x83, 0x64, 0xf2, 0x30, 0x8f, 0x82, 0xe3, 0x87,
+  0xd9, 0xc4, 0x4f, 0x47, 0xec, 0x89, 0x9f, 0x4d, 0xcf, 0x12, 0x78, 0x7a, 0xb0, 0xcd, 0xdf, 0xdf,
+  0x7b, 0x90, 0xe5, 0x57, 0xf8, 0x97, 0xb1, 0x3f, 0x86, 0x33, 0x2c, 0x83, 0x2d, 0xd2, 0xa8, 0xe9,
+  0x4c, 0xf3, 0x7c, 0x9e, 0x1d, 0x6c, 0x6f, 0x8f, 0xa1, 0xbc, 0xcc, 0x9d, 0x24, 0xc9, 0x24, 0x0a,
+  0xfc, 0x79, 0x98, 0xb9, 0xc3, 0x64, 0xb6, 0x3d, 0xcc, 0x32, 0xef, 0x9b, 0xb1, 0x3f, 0x0b, 0xa3,
+  0xab, 0xa3, 0x3f, 0x05, 0xf9, 0xa3, 0xd4, 0x0f, 0xe3, 0xec, 0xfe, 0x8b, 0x24, 0x4e, 0x0e, 0x2e,
+  0x26, 0xd3, 0xfc, 0x8f, 0xbd, 0x4e, 0xe7, 0xb0, 0x0f, 0xff, 0xee, 0xc0, 0xbf, 0xbb, 0x9d, 0xce,
+  0xd7, 0x02, 0xf4, 0xcd, 0xdc, 0x1f, 0x06, 0xf7, 0xff, 0x31, 0x4d, 0xf2, 0x20, 0xfb, 0x68, 0x42,
+  0x0e, 0x38, 0xf4, 0xd7, 0xa3, 0x30, 0x9b, 0x47, 0xfe, 0xd5, 0x51, 0x76, 0xe1, 0xcf, 0x9d, 0xd6,
+  0xe1, 0x3d, 0x60, 0xeb, 0x20, 0x4d, 0x92, 0x9c, 0x7d, 0x86, 0x27, 0xc6, 0xda, 0xed, 0xb3, 0xc9,
+  0x01, 0xfb, 0x5d, 0xc7, 0xef, 0x04, 0x5d, 0xff, 0x90, 0x7e, 0x7a, 0xf8, 0x7b, 0xdc, 0x1d, 0x78,
+  0x03, 0xfe, 0xbb, 0x07, 0xbf, 0xbb, 0x83, 0xee, 0xb0, 0xd7, 0xc1, 0xdf, 0x43, 0xa8, 0x2a, 0xbe,
+  0xe8, 0x75, 0xf7, 0xbd, 0x7d, 0x02, 0x48, 0xd2, 0x51, 0x90, 0xe2, 0xab, 0xc0, 0x1b, 0xf5, 0xfd,
+  0x43, 0x41, 0xd6, 0x1f, 0x0e, 0x41, 0xaa, 0x48, 0xaa, 0x33, 0xdc, 0x1b, 0x8f, 0x0f, 0xd5, 0x2b,
+  0x24, 0xb7, 0x3b, 0x1e, 0x8f, 0x77, 0xe9, 0xdd, 0x85, 0x9f, 0xc6, 0xf0, 0x62, 0x3c, 0x3e, 0xeb,
+  0x78, 0x44, 0x7f, 0x04, 0xad, 0x49, 0xe4, 0xc6, 0xe3, 0x7e, 0x7f, 0x30, 0x90, 0xe4, 0xe6, 0x8b,
+  0x74, 0x1e, 0x05, 0xf0, 0x7a, 0xd8, 0xd9, 0xeb, 0x8f, 0x87, 0x08, 0x99, 0x07, 0x97, 0x48, 0x3f,
+  0xf0, 0x02, 0x9f, 0xd3, 0xc7, 0x17, 0xc8, 0xfc, 0xde, 0xde, 0xfe, 0xfe, 0xd9, 0x99, 0x7c, 0x83,
+  0xe5, 0xf5, 0xfd, 0x81, 0xbf, 0xab, 0x58, 0x03, 0x25, 0xc9, 0xa9, 0x80, 0x9d, 0xb3, 0x1e, 0xd5,
+  0x71, 0x98, 0x24, 0x91, 0xc1, 0x69, 0xea, 0x8f, 0xc2, 0x45, 0x76, 0xc0, 0xba, 0xde, 0xfc, 0x52,
+  0x62, 0xcd, 0xb0, 0x31, 0x98, 0xa3, 0x5a, 0x87, 0x61, 0xeb, 0x38, 0x5b, 0x0c, 0xdf, 0x67, 0xd8,
+  0x0e, 0x88, 0x98, 0xf9, 0x31, 0xa0, 0x39, 0xd4, 0x2e, 0x4c, 0xb4, 0x0b, 0xc0, 0xe0, 0xeb, 0x76,
+  0x16, 0xa4, 0xe1, 0x18, 0xa9, 0x5d, 0x63, 0x23, 0xfc, 0x81, 0x7d, 0x66, 0x33, 0x3f, 0x9d, 0x84,
+  0xf1, 0x01, 0xd4, 0x7b, 0xee, 0x8f, 0x46, 0x61, 0x3c, 0xc1, 0xc7, 0xb3, 0xe4, 0xb2, 0x9d, 0x85,
+  0x9f, 0xf0, 0x17, 0x17, 0x2d, 0x48, 0xf8, 0xf2, 0x10, 0x90, 0x18, 0x7c, 0x1a, 0x5d, 0x01, 0xda,
+  0x99, 0x3f, 0xfc, 0x38, 0x49, 0x93, 0x45, 0x0c, 0x0d, 0x71, 0xee, 0xa7, 0x4d, 0x6c, 0xa4, 0xd6,
+  0x21, 0x28, 0x72, 0x94, 0xa4, 0xf2, 0x0d, 0xd6, 0x1c, 0xde, 0xa1, 0xb2, 0xb5, 0xb9, 0xb2, 0xc8,
+  0x2f, 0xc8, 0x0b, 0x7c, 0x99, 0x85, 0x31, 0x08, 0x22, 0x04, 0x95, 0x81, 0x6a, 0x76, 0x3a, 0xe7,
+  0xd3, 0x82, 0x09, 0xd6, 0xe1, 0xc5, 0xc1, 0xff, 0xb1, 0x3f, 0x05, 0x29, 0x94, 0x49, 0x42, 0xb0,
+  0x15, 0xec, 0xb5, 0x90, 0x65, 0xc1, 0x67, 0x9e, 0x27, 0x33, 0x20, 0x37, 0xbf, 0x64, 0x59, 0x12,
+  0x85, 0x23, 0x09, 0x44, 0x9f, 0x01, 0x8e, 0x88, 0xa8, 0x52, 0xba, 0x1d, 0x80, 0xeb, 0xee, 0x80,
+  0x84, 0x99, 0x50, 0xd2, 0x03, 0x36, 0x8e, 0x02, 0xf8, 0xe9, 0x47, 0xe1, 0x24, 0x6e, 0x87, 0x79,
+  0x30, 0x03, 0x61, 0xa2, 0xce, 0x04, 0xe9, 0x21, 0xfb, 0x71, 0x91, 0xe5, 0xe1, 0xf8, 0xaa, 0x2d,
+  0xfa, 0xeb, 0x01, 0x23, 0xa1, 0xb7, 0xcf, 0x82, 0xfc, 0x22, 0x08, 0x62, 0xde, 0x4a, 0x13, 0x7f,
+  0xce, 0xe9, 0x42, 0x65, 0x92, 0x0c, 0xba, 0x6e, 0x02, 0xca, 0x05, 0x68, 0xc3, 0x8f, 0x57, 0x87,
+  0x2c, 0x4f, 0xe6, 0x54, 0xb5, 0x4f, 0xed, 0x30, 0x1e, 0x05, 0x97, 0x54, 0x6d, 0xe2, 0x89, 0xda,
+  0xc3, 0xe5, 0x55, 0x6d, 0x9f, 0xf9, 0xa3, 0x49, 0x90, 0x41, 0x8d, 0x4b, 0x3c, 0x11, 0x69, 0x62,
+  0x16, 0x7f, 0xb7, 0x2f, 0x52, 0xfc, 0x8d, 0xff, 0xe5, 0x2f, 0x80, 0x9a, 0x12, 0x9a, 0x24, 0x95,
+  0xa2, 0x74, 0x45, 0x3f, 0x2b, 0x51, 0x23, 0x1a, 0xa3, 0x30, 0x0d, 0x86, 0x9c, 0x47, 0x68, 0xbb,
+  0xc5, 0x2c, 0x2e, 0xd5, 0x9c, 0x80, 0x82, 0x78, 0x64, 0xa9, 0xbb, 0x10, 0x0a, 0x91, 0xb6, 0xb4,
+  0x31, 0xea, 0xa4, 0x6c, 0x7d, 0xd0, 0xa5, 0x40, 0x0a, 0xa5, 0xa2, 0x22, 0x3d, 0xa1, 0x09, 0x64,
+  0xee, 0x0e, 0xd8, 0x5e, 0x87, 0xeb, 0x3b, 0x56, 0xc4, 0x1d, 0x5f, 0xb4, 0xcf, 0x83, 0x34, 0x03,
+  0xfe, 0x40, 0x1a, 0x06, 0x26, 0xef, 0xc8, 0xb2, 0x80, 0x0b, 0xa1, 0x45, 0x68, 0x9b, 0x84, 0x4a,
+  0x2b, 0x55, 0xc0, 0xfe, 0x23, 0xe4, 0x9b, 0xfb, 0x67, 0x20, 0xdc, 0xb4, 0x46, 0xb2, 0x9c, 0x3f,
+  0xd1, 0x21, 0x84, 0x6a, 0xe0, 0x7f, 0x3c, 0xf9, 0xb4, 0xbe, 0x96, 0x09, 0x05, 0x2b, 0x00, 0x3b,
+  0x73, 0xd1, 0x7f, 0x38, 0x0f, 0x79, 0x6c, 0xd3, 0xe7, 0x3c, 0x85, 0x7e, 0x31, 0xf7, 0x53, 0xa8,
+  0x98, 0x2c, 0xea, 0x80, 0xc5, 0x49, 0x1c, 0xd4, 0x48, 0xad, 0x4e, 0xf4, 0xa2, 0x7b, 0x55, 0x25,
+  0xa3, 0x37, 0x06, 0xe9, 0x91, 0xd9, 0x1b, 0xf6, 0x54, 0x67, 0x18, 0x2e, 0xd2, 0x0c, 0xcb, 0x9b,
+  0x27, 0x21, 0xd7, 0x7c, 0x51, 0x71, 0x69, 0x94, 0x78, 0x39, 0xfc, 0x17, 0x94, 0x44, 0x8c, 0x0b,
+  0x55, 0xef, 0xb8, 0x5e, 0x26, 0x54, 0xba, 0xa8, 0xed, 0xc1, 0x34, 0x39, 0xa7, 0x3e, 0x6c, 0x33,
+  0x10, 0x75, 0x5d, 0x5a, 0x27, 0xe0, 0xfa, 0xa0, 0xa5, 0xe7, 0x41, 0xad, 0x16, 0xe8, 0x34, 0xd2,
+  0xc9, 0x99, 0xdf, 0xec, 0x6c, 0x41, 0xbb, 0xe1, 0x7f, 0x06, 0x83, 0x2d, 0xe0, 0xa9, 0xdb, 0x92,
+  0x3a, 0x80, 0xa3, 0x2e, 0xd8, 0x41, 0x52, 0x7a, 0x5d, 0x11, 0xb8, 0x9c, 0xfd, 0x38, 0x9c, 0xf9,
+  0xbc, 0x22, 0x63, 0xe8, 0x40, 0xcf, 0x63, 0xc0, 0xed, 0x65, 0x2c, 0xf0, 0xb3, 0x40, 0x33, 0x4e,
+  0xdd, 0x3e, 0xd7, 0x94, 0x4b, 0xa9, 0xb4, 0x5d, 0x18, 0xf2, 0x74, 0xe5, 0xe9, 0x30, 0x7f, 0x91,
+  0x27, 0xa2, 0x0a, 0x7a, 0x89, 0x45, 0x3d, 0x54, 0xc1, 0x67, 0x51, 0x32, 0xfc, 0x28, 0xb8, 0xfb,
+  0xe3, 0xc7, 0xe0, 0x6a, 0x9c, 0x82, 0x77, 0x90, 0xc9, 0xe2, 0x3f, 0xb3, 0x71, 0x9a, 0xcc, 0xe0,
+  0x4f, 0x02, 0xa6, 0x26, 0xcc, 0xaf, 0xc8, 0x7c, 0x90, 0xbc, 0xc7, 0x49, 0x3a, 0x13, 0x3a, 0x13,
+  0xf9, 0x79, 0xf0, 0x97, 0xe6, 0x60, 0x7e, 0x89, 0xb5, 0x04, 0x23, 0xa3, 0x83, 0x77, 0xeb, 0xc0,
+  0x3b, 0x04, 0xcc, 0x85, 0x42, 0x16, 0xa7, 0xda, 0x2d, 0xd6, 0x32, 0x11, 0xd2, 0x38, 0xda, 0x9a,
+  0xb1, 0xd7, 0x2a, 0x14, 0xb9, 0xb6, 0xb3, 0x94, 0x74, 0x6b, 0x8f, 0x4c, 0xa7, 0x14, 0x75, 0x0f,
+  0xb0, 0xe8, 0x8d, 0x66, 0x22, 0x06, 0xd4, 0xa5, 0x75, 0xa5, 0x13, 0x24, 0x48, 0x37, 0x84, 0x06,
+  0x5e, 0xab, 0x7a, 0x29, 0xe5, 0xd3, 0xa1, 0x2a, 0x1a, 0x54, 0xc0, 0xb7, 0x23, 0xff, 0x2c, 0x88,
+  0x64, 0x07, 0x2d, 0x89, 0x84, 0xde, 0x59, 0xeb, 0x5f, 0x58, 0xff, 0x9e, 0xea, 0x5a, 0x5a, 0x87,
+  0xdb, 0x33, 0x5f, 0x1a, 0xfd, 0x92, 0x5e, 0x47, 0x41, 0x0e, 0x74, 0xda, 0x38, 0xa4, 0x70, 0x25,
+  0x93, 0xe3, 0x7e, 0x7d, 0xdf, 0xc7, 0x1f, 0x6d, 0xad, 0x75, 0x17, 0xf3, 0x79, 0x90, 0x0e, 0x49,
+  0x57, 0xe9, 0xfb, 0xc5, 0x14, 0x78, 0x24, 0x8a, 0x01, 0x2a, 0x38, 0x1f, 0x2a, 0x64, 0xd7, 0xe4,
+  0x75, 0x3d, 0xf7, 0xa3, 0x05, 0xb6, 0xfc, 0x7a, 0x16, 0x9c, 0x04, 0x5f, 0xe5, 0xdf, 0xd6, 0xab,
+  0xad, 0x65, 0x97, 0x0b, 0x76, 0xa7, 0xe8, 0x05, 0x9a, 0xf8, 0xe8, 0x1a, 0xb5, 0x2c, 0xa0, 0xe8,
+  0x21, 0x95, 0x61, 0xf1, 0x9d, 0x0d, 0x76, 0x92, 0xc2, 0x78, 0x6c, 0x37, 0x16, 0x3d, 0x1b, 0x3c,
+  0xba, 0x80, 0x65, 0x70, 0x7c, 0x67, 0x83, 0xe5, 0x6e, 0x60, 0x19, 0x9a, 0xbf, 0x55, 0x56, 0x46,
+  0x74, 0xf7, 0x36, 0xf9, 0xe3, 0x6b, 0x8b, 0xb7, 0x53, 0x11, 0xef, 0x2e, 0x8a, 0xb7, 0xac, 0x19,
+  0xbd, 0xda, 0x71, 0x74, 0x89, 0x42, 0x94, 0x46, 0x45, 0xe1, 0xa1, 0x88, 0x71, 0x2a, 0x0a, 0xc6,
+  0xb9, 0x50, 0x51, 0xd1, 0x49, 0xf8, 0x1b, 0xaf, 0xd4, 0x67, 0xcd, 0xde, 0x82, 0xb3, 0x9b, 0x9c,
+  0xbc, 0x71, 0xab, 0x47, 0x88, 0x1f, 0x6e, 0xd0, 0xff, 0x4b, 0x63, 0x4b, 0x61, 0x74, 0x77, 0x0a,
+  0x0b, 0x5b, 0x0c, 0xee, 0xc5, 0xc0, 0xca, 0xb9, 0x51, 0xde, 0xe2, 0x1d, 0xf8, 0x73, 0x76, 0x99,
+  0x69, 0x85, 0x45, 0xc1, 0x04, 0x7c, 0xa3, 0xa5, 0xee, 0x44, 0xc5, 0x53, 0x23, 0x74, 0x8e, 0x48,
+  0xec, 0xac, 0xc9, 0x2a, 0x91, 0x1c, 0x28, 0xfd, 0xe0, 0x0a, 0xb3, 0xaf, 0x7e, 0x5b, 0x55, 0xab,
+  0xa2, 0x22, 0x6a, 0x54, 0x15, 0xe5, 0x8f, 0xa8, 0xf7, 0xc9, 0x31, 0x8c, 0xe4, 0x2b, 0xfd, 0x71,
+  0x4f, 0x31, 0x9f, 0x4d, 0xd3, 0x30, 0xfe, 0xa8, 0x3c, 0x72, 0xd9, 0xea, 0x50, 0x2a, 0x4c, 0x41,
+  0x48, 0xd4, 0x85, 0x9f, 0x9b, 0x06, 0x30, 0xb6, 0xc0, 0xf8, 0x76, 0xa8, 0x88, 0x76, 0x3a, 0xff,
+  0xa0, 0x11, 0xed, 0x28, 0x09, 0x0e, 0xfd, 0xf8, 0xdc, 0xcf, 0xb4, 0xd2, 0x01, 0x90, 0x7d, 0xc5,
+  0x27, 0xab, 0x3e, 0xfa, 0x3f, 0xbc, 0x1f, 0x0d, 0xf3, 0x34, 0xfa, 0x89, 0x35, 0xec, 0x5a, 0x95,
+  0x9b, 0x26, 0x17, 0x77, 0xa4, 0x48, 0xaa, 0x88, 0x5d, 0x60, 0xb1, 0xb3, 0xbe, 0x1f, 0xa9, 0x29,
+  0x92, 0xc1, 0xd6, 0x41, 0xe4, 0x67, 0x79, 0x3b, 0x19, 0xb7, 0xf3, 0xab, 0x79, 0x50, 0x8c, 0x6c,
+  0x92, 0x1e, 0xf7, 0x65, 0x0a, 0x0c, 0x39, 0xa0, 0xe9, 0xb6, 0xa6, 0x6b, 0x35, 0x22, 0xa8, 0x21,
+  0xc6, 0x5c, 0x82, 0x13, 0xb8, 0xc1, 0x28, 0x61, 0x1b, 0x13, 0x88, 0x60, 0xb6, 0x38, 0xb3, 0x31,
+  0xb4, 0xa9, 0x2e, 0xa3, 0xb9, 0xab, 0x0c, 0x99, 0x2e, 0xf5, 0x90, 0x95, 0x56, 0x50, 0x78, 0xf7,
+  0x1d, 0xd6, 0xd7, 0x8d, 0xa0, 0x94, 0x5e, 0x7f, 0x13, 0x4f, 0x9f, 0x3b, 0xa9, 0xc9, 0x64, 0x12,
+  0x05, 0xd4, 0xcd, 0x97, 0x77, 0x87, 0xde, 0x9e, 0xd1, 0xc7, 0x3a, 0xb5, 0x9d, 0x4c, 0xa7, 0x18,
+  0xc6, 0xf3, 0x45, 0x5e, 0xf2, 0x00, 0x05, 0xbd, 0x4e, 0x41, 0xac, 0x84, 0x99, 0x01, 0xaf, 0xa5,
+  0xce, 0xe9, 0x9f, 0x41, 0x0d, 0x16, 0x39, 0x70, 0x13, 0xc6, 0x59, 0xc0, 0x51, 0xee, 0xca, 0x69,
+  0xe3, 0x55, 0xa9, 0x4c, 0x1b, 0x74, 0x1f, 0xcd, 0x8f, 0x22, 0xdd, 0x35, 0x33, 0xf8, 0x3c, 0x38,
+  0x38, 0x0b, 0xa0, 0xad, 0xf8, 0xa8, 0x2a, 0xba, 0x90, 0xe3, 0x1c, 0x5a, 0x99, 0xe7, 0x23, 0x13,
+  0x8d, 0x81, 0x34, 0x9d, 0xa6, 0x27, 0x69, 0x45, 0x3c, 0x5d, 0xbe, 0xfc, 0x57, 0xb5, 0x8a, 0x52,
+  0x7d, 0x4a, 0x75, 0x18, 0xa0, 0xa9, 0x5a, 0xcd, 0x71, 0xd1, 0x26, 0x07, 0xc3, 0x69, 0x30, 0xfc,
+  0x18, 0x8c, 0xd8, 0xfd, 0xaa, 0xd8, 0x2b, 0x13, 0x92, 0xae, 0xb7, 0xbb, 0x85, 0x93, 0x11, 0xfc,
+  0x0b, 0xf3, 0x91, 0x41, 0x51, 0xfe, 0x32, 0x27, 0x65, 0xfd, 0x32, 0x35, 0x11, 0xda, 0xfc, 0xfd,
+  0x7f, 0x6e, 0x76, 0x77, 0x69, 0x7e, 0x50, 0x15, 0x87, 0x5e, 0xa4, 0xea, 0xf1, 0x59, 0x10, 0x81,
+  0x0b, 0x53, 0x13, 0xe9, 0xb9, 0x89, 0x86, 0xec, 0xd6, 0x19, 0x85, 0x0d, 0x5c, 0x23, 0x65, 0x46,
+  0xfb, 0x72, 0x56, 0x50, 0xd1, 0xb8, 0x64, 0x91, 0x47, 0x30, 0x2c, 0x49, 0x1b, 0x28, 0xf4, 0xc2,
+  0xf3, 0x3a, 0xe5, 0x19, 0x1b, 0x0d, 0x4c, 0x64, 0x29, 0xc8, 0xa2, 0x1f, 0x90, 0x5e, 0xe9, 0x36,
+  0x8f, 0x4b, 0xe0, 0x60, 0x9c, 0x0c, 0x17, 0xd9, 0x5a, 0x93, 0x87, 0x2c, 0x0f, 0xd0, 0xd0, 0x6c,
+  0x3c, 0xa0, 0x2b, 0x64, 0x11, 0x17, 0x90, 0x3c, 0x9b, 0xe3, 0xf1, 0x8e, 0x66, 0x95, 0x0c, 0x99,
+  0xae, 0x6e, 0x88, 0x9a, 0xf9, 0x75, 0x6d, 0x63, 0x08, 0x91, 0x0f, 0xac, 0x02, 0xbe, 0xd1, 0x70,
+  0x28, 0x3f, 0x54, 0x7b, 0x57, 0x77, 0x90, 0xd5, 0x98, 0x40, 0x29, 0x91, 0xf5, 0xa6, 0x6f, 0x6b,
+  0x87, 0x05, 0x30, 0x2a, 0x80, 0xfd, 0x50, 0xc6, 0x04, 0xf4, 0x92, 0xd4, 0xe4, 0x5c, 0xeb, 0x41,
+  0x14, 0x76, 0x6f, 0x76, 0xdc, 0xbd, 0x3d, 0x03, 0x1c, 0x46, 0xc4, 0xb5, 0xc7, 0xc3, 0xfe, 0x1a,
+  0xb3, 0x26, 0xc5, 0xb2, 0x36, 0xcf, 0xed, 0xef, 0xa9, 0xd1, 0x4c, 0xe8, 0xa8, 0x94, 0xa3, 0x9c,
+  0x64, 0x80, 0x0f, 0x67, 0xe8, 0x0c, 0xd7, 0x6a, 0xe1, 0xb6, 0x92, 0x75, 0x2c, 0x75, 0x9c, 0x3d,
+  0x8b, 0x16, 0xed, 0x2d, 0xd3, 0xa2, 0xf5, 0x44, 0xd9, 0xd9, 0xab, 0x6d, 0x82, 0x3b, 0x9d, 0xf9,
+  0xac, 0x1e, 0xe0, 0x37, 0x19, 0x82, 0xa4, 0xfc, 0x0a, 0x0d, 0x5b, 0xaa, 0x2e, 0x7b, 0x2d, 0x11,
+  0x19, 0x9f, 0xfa, 0x23, 0x70, 0xc1, 0xc0, 0x7d, 0xe8, 0x70, 0x3f, 0xa2, 0x0a, 0xaa, 0x1c, 0x6d,
+  0x55, 0xc4, 0x32, 0xd5, 0xda, 0xdf, 0x2b, 0x83, 0xd3, 0x03, 0xd4, 0xd8, 0x18, 0xf5, 0xdd, 0xfe,
+  0xa1, 0xac, 0x56, 0x3b, 0x38, 0x07, 0xe9, 0x66, 0x85, 0xa7, 0x57, 0x38, 0x87, 0xb8, 0x76, 0x01,
+  0x68, 0x20, 0xc7, 0xb3, 0x8f, 0x21, 0x28, 0x0e, 0x88, 0xc6, 0x87, 0x97, 0xc3, 0xb2, 0x49, 0x34,
+  0x3d, 0xf3, 0xbe, 0x45, 0x2f, 0xfa, 0xf6, 0xd1, 0x53, 0xd9, 0x95, 0x92, 0xa9, 0xad, 0x48, 0xfe,
+  0xda, 0x64, 0xea, 0xe0, 0x40, 0xf2, 0xc4, 0x07, 0xac, 0x76, 0x3e, 0x5d, 0xcc, 0xce, 0xd6, 0x62,
+  0xd5, 0xb0, 0x84, 0x5d, 0x9b, 0x25, 0xa4, 0xb1, 0xbb, 0x6e, 0x68, 0x6b, 0xd5, 0x06, 0x34, 0xab,
+  0x33, 0x5c, 0x39, 0xb8, 0x99, 0xcd, 0x3c, 0xb0, 0xb5, 0x72, 0x5f, 0x8d, 0x98, 0x67, 0xe1, 0x04,
+  0x0c, 0xe8, 0x6c, 0xbe, 0xae, 0x45, 0xe8, 0xed, 0x54, 0xd4, 0xbd, 0x47, 0xea, 0x0e, 0xe2, 0x2c,
+  0x56, 0x44, 0x96, 0xf8, 0xd0, 0xaa, 0x40, 0xe8, 0x19, 0x71, 0xc9, 0xb1, 0xdf, 0xa9, 0x75, 0xec,
+  0x85, 0xf5, 0xf2, 0x73, 0xfb, 0xcc, 0x86, 0x4f, 0x36, 0xfa, 0xd6, 0x59, 0xab, 0x6e, 0x52, 0xf6,
+  0xb4, 0x41, 0x0b, 0x68, 0xd9, 0x27, 0xb1, 0x75, 0xa1, 0xc3, 0x02, 0xcf, 0x32, 0x07, 0xd8, 0xbb,
+  0x8b, 0x39, 0xc0, 0x0a, 0x03, 0x51, 0x30, 0xb0, 0xd9, 0xa4, 0xa6, 0xb7, 0x7e, 0xe8, 0x8b, 0x2b,
+  0x45, 0x94, 0x4c, 0x68, 0x00, 0x4c, 0x93, 0xa8, 0x6e, 0x2d, 0x67, 0xcf, 0x12, 0xd1, 0x58, 0x1a,
+  0x36, 0x00, 0x92, 0xdc, 0xde, 0x2b, 0x83, 0xbe, 0x83, 0x31, 0x7b, 0xcf, 0xd2, 0x23, 0x76, 0xee,
+  0xd6, 0x37, 0xf0, 0x6a, 0x0d, 0xb6, 0xbd, 0xa9, 0x2a, 0x66, 0xb8, 0xbe, 0x45, 0xac, 0x2d, 0xa8,
+  0xd7, 0xf7, 0x06, 0x1e, 0x80, 0xde, 0x59, 0x04, 0x95, 0x22, 0xf4, 0xbe, 0xdc, 0xef, 0xae, 0x79,
+  0xbd, 0xca, 0xa1, 0x6f, 0xa9, 0xb5, 0xb7, 0xdf, 0x41, 0x81, 0x99, 0x11, 0x20, 0x99, 0x16, 0x9d,
+  0x1c, 0xeb, 0x86, 0xb5, 0x19, 0x47, 0xc9, 0x45, 0xfb, 0x0a, 0xc7, 0x00, 0xd0, 0x8f, 0xe8, 0x4b,
+  0x45, 0xcf, 0x57, 0x35, 0x53, 0x25, 0x20, 0x60, 0x5a, 0x20, 0x77, 0x50, 0x8a, 0xe3, 0xce, 0x53,
+  0x3e, 0x17, 0xd1, 0x24, 0x0b, 0xe2, 0x49, 0xaf, 0xaa, 0x21, 0x88, 0x82, 0x5f, 0x12, 0x16, 0x0a,
+  0x4a, 0xfe, 0x0b, 0xee, 0xc2, 0x40, 0x0f, 0xbb, 0x78, 0x3c, 0x26, 0x22, 0x3b, 0x48, 0xd1, 0x3f,
+  0x88, 0x7b, 0x55, 0xd0, 0x28, 0x38, 0x5b, 0x4c, 0x6c, 0x4b, 0x48, 0x3d, 0xbd, 0xa1, 0xc3, 0x78,
+  0x9c, 0xac, 0x08, 0xfc, 0x22, 0xd8, 0xaa, 0x80, 0x2f, 0xd5, 0x2c, 0x4d, 0x93, 0xca, 0x9a, 0x15,
+  0xdf, 0x1b, 0x50, 0x5e, 0x5d, 0x3b, 0x4b, 0xa2, 0x91, 0x86, 0x99, 0xfa, 0x17, 0x36, 0x46, 0x8b,
+  0x45, 0xad, 0x70, 0x16, 0xb4, 0x73, 0x7f, 0x52, 0xbb, 0x9c, 0x25, 0x07, 0xfd, 0x8e, 0xbb, 0x6b,
+  0x78, 0x84, 0x3b, 0x5c, 0x22, 0x7c, 0x66, 0xe8, 0x67, 0xb9, 0x31, 0xbf, 0x1f, 0x87, 0x97, 0xc1,
+  0x08, 0x15, 0x42, 0x0f, 0x8d, 0xa6, 0x7a, 0xa8, 0x61, 0xf9, 0xe2, 0x79, 0x9d, 0xf3, 0xb7, 0xa4,
+  0x53, 0x6c, 0xa0, 0x59, 0xaa, 0xb9, 0xf7, 0xd1, 0x62, 0xf5, 0xeb, 0xfc, 0xd0, 0xd5, 0xcb, 0x5c,
+  0x7b, 0x34, 0x8d, 0xad, 0xba, 0x75, 0xbd, 0x4c, 0x5b, 0x57, 0xdf, 0xdf, 0xdf, 0xaf, 0x77, 0x96,
+  0xa4, 0xf4, 0xdc, 0x6c, 0x4a, 0xe3, 0xe0, 0x9a, 0x6b, 0x65, 0x05, 0x9e, 0xd4, 0x0c, 0x9b, 0x21,
+  0x51, 0x0a, 0x62, 0x7f, 0xcb, 0x97, 0xf9, 0x66, 0xc1, 0x28, 0xf4, 0x59, 0x53, 0x6b, 0xd9, 0xdd,
+  0x1d, 0xac, 0x17, 0xd0, 0xb4, 0xc4, 0x57, 0xcb, 0xe1, 0x53, 0xe6, 0x8e, 0x17, 0x51, 0xc4, 0x31,
+  0xe1, 0xf3, 0x24, 0x0d, 0x47, 0x6d, 0x3e, 0xbe, 0x42, 0x15, 0xd8, 0x36, 0x6b, 0x77, 0xf9, 0xca,
+  0xde, 0x83, 0x6d, 0xb1, 0x0d, 0xe8, 0xc1, 0xb6, 0xd8, 0x94, 0x84, 0xbb, 0x37, 0x8e, 0xef, 0xf1,
+  0x3d, 0x4a, 0x41, 0x8a, 0xfb, 0x83, 0x1e, 0x8c, 0xc2, 0x73, 0x36, 0x8c, 0xfc, 0x2c, 0x3b, 0x6a,
+  0x18, 0xdb, 0x0f, 0x1a, 0x2c, 0x1c, 0xc9, 0x57, 0x8f, 0xf8, 0x9b, 0x63, 0x5a, 0x54, 0xd2, 0x31,
+  0x08, 0x54, 0xbc, 0x87, 0x2f, 0xe4, 0x8d, 0xe8, 0x9f, 0xf8, 0x20, 0xaf, 0x00, 0x10, 0xe4, 0x7c,
+  0xc2, 0xdd, 0xba, 0xa3, 0x46, 0xb7, 0xd3, 0x10, 0x55, 0xe3, 0xcf, 0xb8, 0x4e, 0xfa, 0x28, 0xb9,
+  0x3c, 0x6a, 0xa0, 0xc7, 0xe5, 0xf5, 0xe1, 0xff, 0x0d, 0xd0, 0xe9, 0x28, 0x3a, 0x6a, 0x60, 0xc3,
+  0x35, 0x58, 0x06, 0x43, 0xe9, 0xc7, 0xe0, 0xa8, 0x01, 0x63, 0x0b, 0x2e, 0x91, 0x3f, 0x46, 0xf9,
+  0xca, 0xb7, 0x6d, 0x41, 0xb3, 0xa7, 0x5e, 0xa0, 0x25, 0x1b, 0xfa, 0xf3, 0xa3, 0x06, 0xe9, 0xbb,
+  0xf1, 0xfa, 0x47, 0xd0, 0x0b, 0xf9, 0xfe, 0xf8, 0xc1, 0xdc, 0x07, 0x29, 0x42, 0x55, 0x5f, 0x74,
+  0xfb, 0xa0, 0x97, 0xee, 0xee, 0xce, 0x9f, 0x7b, 0xee, 0xc0, 0xf7, 0xdc, 0x01, 0xc3, 0x7f, 0x91,
+  0x97, 0x4e, 0x1b, 0xfe, 0x9e, 0x77, 0xbb, 0xae, 0xb7, 0xe3, 0xf7, 0xe1, 0x5d, 0x9f, 0xde, 0x77,
+  0xd1, 0x2f, 0x64, 0x9d, 0x4f, 0x8d, 0xed, 0x63, 0x10, 0xf4, 0xf9, 0xa4, 0xa8, 0xe4, 0xb7, 0x41,
+  0x30, 0x92, 0x22, 0xd9, 0x46, 0x99, 0x2c, 0x11, 0x10, 0x77, 0x42, 0xa6, 0x49, 0xce, 0xe5, 0x7d,
+  0xd6, 0x1e, 0x03, 0x72, 0xe3, 0xf8, 0xef, 0xff, 0xf6, 0xef, 0x3a, 0xea, 0x83, 0x6d, 0x10, 0xfa,
+  0xf1, 0xbd, 0xff, 0x91, 0xff, 0x5a, 0xf2, 0x7f, 0x1d, 0xe4, 0x8b, 0x34, 0xde, 0xa8, 0x05, 0xa4,
+  0xf4, 0x53, 0x42, 0xbd, 0x91, 0xfc, 0x57, 0x4a, 0xff, 0x17, 0x2d, 0xfb, 0x1d, 0xd6, 0xdd, 0x63,
+  0x27, 0xf0, 0x67, 0x87, 0x9d, 0x78, 0x1d, 0xfc, 0x6f, 0xd7, 0x63, 0x1e, 0x3b, 0xe9, 0xe3, 0xe3,
+  0x1e, 0xff, 0x0f, 0x40, 0xfc, 0x55, 0xb2, 0x65, 0x30, 0x52, 0x6a, 0x81, 0x27, 0x41, 0x94, 0xfb,
+  0xec, 0xed, 0xbd, 0xb2, 0xf8, 0x57, 0x09, 0x7f, 0x94, 0xff, 0x46, 0x15, 0x7f, 0x17, 0x44, 0xeb,
+  0x0f, 0x98, 0xd4, 0xf6, 0x2e, 0xfc, 0x07, 0xbe, 0x6f, 0x23, 0xc0, 0xf1, 0x03, 0x44, 0x64, 0x97,
+  0x5d, 0x60, 0xd5, 0x6b, 0xb0, 0x2b, 0xf8, 0x0b, 0x7f, 0x2e, 0x3d, 0xf1, 0x13, 0xfe, 0xee, 0x23,
+  0x28, 0x02, 0x69, 0xa0, 0x7d, 0xd7, 0x13, 0xc0, 0xdd, 0x0e, 0x3d, 0x22, 0xc2, 0xc0, 0xdd, 0xe9,
+  0x73, 0x14, 0xe8, 0x4a, 0xf0, 0x58, 0x45, 0xeb, 0x0a, 0x9c, 0x3d, 0x8e, 0xd0, 0x13, 0xd0, 0x7b,
+  0x16, 0x50, 0xaf, 0x04, 0xeb, 0x2d, 0x03, 0xee, 0xee, 0xb9, 0xbd, 0x1d, 0x01, 0x4f, 0x45, 0xf3,
+  0x0a, 0xec, 0xbb, 0xbb, 0x7b, 0x02, 0x8b, 0xb8, 0xb4, 0x94, 0xd2, 0x13, 0x55, 0x96, 0x75, 0xe6,
+  0xe0, 0x3a, 0xec, 0x3c, 0x89, 0xae, 0x08, 0x9e, 0x46, 0x7b, 0x68, 0xff, 0x3d, 0xe6, 0x79, 0x8c,
+  0x94, 0x95, 0x2b, 0x35, 0xfc, 0x97, 0xc3, 0x4b, 0xc8, 0xb2, 0xb9, 0x78, 0xb9, 0xc8, 0xb3, 0x70,
+  0x14, 0x6c, 0x66, 0xb1, 0x71, 0xe7, 0x81, 0xd4, 0xdb, 0x84, 0x13, 0xf8, 0x6d, 0x29, 0x6f, 0x59,
+  0xec, 0x20, 0x74, 0xb0, 0x18, 0x28, 0x6f, 0xf8, 0x2f, 0xd8, 0xee, 0x2e, 0xdb, 0x67, 0x3d, 0xb0,
+  0x1b, 0x64, 0x46, 0xba, 0x4b, 0x1b, 0xe0, 0xdb, 0x34, 0xf8, 0x5f, 0x9b, 0x49, 0x9f, 0xf6, 0x77,
+  0xa8, 0x11, 0x13, 0xd0, 0x7f, 0x9b, 0x86, 0x03, 0x05, 0x3b, 0xf5, 0x34, 0x5b, 0x61, 0x98, 0x94,
+  0xdd, 0x08, 0xc6, 0xcd, 0x41, 0x1b, 0xfe, 0x67, 0x07, 0xc0, 0xef, 0xf8, 0x3f, 0xa6, 0x7d, 0x2f,
+  0x35, 0x0c, 0x4c, 0x52, 0x6f, 0x34, 0x8c, 0xe2, 0xec, 0x36, 0x05, 0xcf, 0xf9, 0x37, 0xd7, 0x25,
+  0x26, 0x49, 0xac, 0x7a, 0x44, 0xb7, 0x07, 0x9a, 0xdf, 0x63, 0xe8, 0xd6, 0x78, 0xf4, 0xdf, 0x2e,
+  0x5a, 0x26, 0xe8, 0x18, 0x60, 0xdf, 0xf1, 0x0d, 0xfc, 0x17, 0x20, 0x64, 0xc7, 0x00, 0x4c, 0x8b,
+  0x61, 0x9a, 0x2f, 0xf2, 0xcd, 0x7a, 0x06, 0x4e, 0x62, 0x35, 0xbb, 0x04, 0xf8, 0xbf, 0xd1, 0x31,
+  0x15, 0x24, 0xed, 0xee, 0xec, 0x47, 0x30, 0xe8, 0xed, 0x30, 0xfc, 0x8f, 0xbf, 0x07, 0x83, 0x02,
+  0x7a, 0x8d, 0xdd, 0x36, 0x8c, 0x41, 0xbd, 0x2e, 0x7a, 0x8e, 0x35, 0x6a, 0xff, 0x2a, 0x4d, 0x46,
+  0xb7, 0xb0, 0x47, 0x73, 0x40, 0xff, 0xed, 0x0a, 0xfd, 0xbc, 0x6b, 0xb5, 0x47, 0x68, 0xaa, 0xa2,
+  0x7e, 0xbb, 0x5f, 0xfb, 0xad, 0x6d, 0x7c, 0xc4, 0xb8, 0x31, 0x83, 0x8a, 0xa0, 0xd7, 0xc0, 0x5d,
+  0x1d, 0x59, 0x65, 0xaf, 0xa8, 0x32, 0x38, 0x0f, 0xe9, 0x25, 0xfa, 0x43, 0x80, 0x86, 0x08, 0x1a,
+  0xcd, 0x7d, 0xe8, 0x6a, 0xe7, 0x9e, 0xad, 0xb0, 0x41, 0xe9, 0x8b, 0xd9, 0xf4, 0x8f, 0x93, 0x38,
+  0xbb, 0x91, 0xc5, 0x83, 0xf9, 0x7a, 0xf6, 0x1b, 0x77, 0x00, 0x7a, 0x0c, 0x0a, 0xef, 0x91, 0x5d,
+  0x83, 0xd1, 0xa7, 0x63, 0x8e, 0xf8, 0xc5, 0x98, 0xd5, 0x71, 0xfb, 0xfb, 0xe0, 0x21, 0xf8, 0xfb,
+  0xe0, 0x20, 0xf0, 0xfe, 0xe8, 0xb9, 0x5d, 0xaf, 0xbd, 0x0f, 0x2e, 0xe2, 0x09, 0xa1, 0xd7, 0xb5,
+  0xcd, 0x9b, 0xdc, 0x4f, 0xf3, 0x9b, 0xb5, 0x4e, 0x46, 0xa8, 0xbf, 0xa9, 0xf6, 0x19, 0x86, 0xe9,
+  0x30, 0x02, 0x3f, 0xf5, 0x92, 0xf7, 0x99, 0xa1, 0xe8, 0x46, 0x29, 0x31, 0x05, 0xa2, 0xe5, 0xdf,
+  0x2d, 0xed, 0x08, 0xdd, 0x91, 0xbc, 0x36, 0xfc, 0x3f, 0x3c, 0xf4, 0x97, 0x79, 0x6e, 0xaf, 0x17,
+  0x9b, 0x4d, 0xb3, 0x19, 0xdf, 0x26, 0xab, 0x66, 0xdb, 0x8b, 0x18, 0x43, 0xa1, 0xbf, 0x4d, 0x63,
+  0x39, 0x00, 0x09, 0xbb, 0x83, 0x81, 0x0f, 0x6e, 0x41, 0xb7, 0xcb, 0x17, 0x93, 0x31, 0xfe, 0xd1,
+  0xd9, 0x63, 0x56, 0x03, 0xea, 0xf6, 0x3d, 0xb6, 0xef, 0x63, 0x8b, 0xec, 0x08, 0x60, 0xaf, 0xeb,
+  0xe2, 0xb3, 0x05, 0x78, 0xcf, 0x1d, 0x40, 0x47, 0xda, 0x71, 0xbb, 0x5d, 0x1f, 0x27, 0xf4, 0x1c,
+  0x7c, 0xc7, 0xdd, 0x1f, 0x2c, 0x9f, 0x57, 0x76, 0xe4, 0xc4, 0xd2, 0xed, 0xc8, 0x89, 0x56, 0xa7,
+  0x98, 0x68, 0x99, 0x2d, 0xff, 0x43, 0xf8, 0x6d, 0x78, 0xa3, 0xae, 0x78, 0x11, 0x8e, 0xc3, 0xba,
+  0x06, 0xd7, 0x1e, 0xec, 0xa1, 0x49, 0x8a, 0x66, 0x5b, 0xe2, 0x90, 0xc5, 0x39, 0x21, 0x5e, 0x0c,
+  0xae, 0x25, 0xe0, 0x9b, 0xc6, 0xf1, 0x39, 0x95, 0x24, 0x88, 0x0a, 0x24, 0x84, 0xc0, 0x0d, 0x94,
+  0xdf, 0xcf, 0x47, 0x85, 0x8f, 0x6a, 0x32, 0xc0, 0x23, 0xa6, 0x18, 0x22, 0xbd, 0xf7, 0x20, 0xf6,
+  0x55, 0x39, 0xe2, 0x00, 0x11, 0x71, 0xf0, 0xe0, 0x6c, 0x91, 0xe7, 0x49, 0x6c, 0x7c, 0xca, 0x63,
+  0xc6, 0x57, 0x99, 0x1a, 0x2c, 0x89, 0x87, 0x51, 0x38, 0xfc, 0x78, 0xd4, 0xc8, 0x2e, 0xc2, 0x7c,
+  0x38, 0x7d, 0xeb, 0x9f, 0x35, 0x9d, 0x59, 0x12, 0x87, 0x79, 0x92, 0x3a, 0x5b, 0x2c, 0x9f, 0x86,
+  0x59, 0xab, 0x71, 0xfc, 0x82, 0xbf, 0x78, 0xb0, 0xcd, 0x69, 0xd5, 0x93, 0xb5, 0xd3, 0xcb, 0x82,
+  0x3c, 0x0f, 0xe3, 0x49, 0x56, 0x10, 0x7c, 0x23, 0xde, 0xdc, 0x94, 0x22, 0x2e, 0x5d, 0x69, 0xd4,
+  0xae, 0x32, 0x5c, 0xdc, 0x3d, 0x49, 0x74, 0x82, 0x0f, 0xb6, 0x41, 0x20, 0x28, 0x17, 0x29, 0x4a,
+  0x3a, 0xdf, 0x22, 0xaa, 0xd6, 0x90, 0xa5, 0x18, 0xc7, 0x6c, 0x84, 0x4c, 0xca, 0xf1, 0x66, 0x6d,
+  0xff, 0x78, 0x11, 0xd0, 0xb6, 0xb4, 0xae, 0xbe, 0xb3, 0x1b, 0xf4, 0x51, 0xfb, 0x62, 0x6c, 0xb3,
+  0xc7, 0x4e, 0x77, 0x15, 0x41, 0x8f, 0x95, 0x67, 0x1a, 0x55, 0x05, 0x60, 0xe4, 0xc8, 0x17, 0x19,
+  0x7b, 0x0b, 0xb6, 0x06, 0x75, 0x99, 0xb7, 0x71, 0x59, 0x2b, 0x4c, 0xa6, 0x64, 0xf8, 0x1d, 0x2d,
+  0x29, 0xdf, 0xaa, 0x8c, 0x55, 0xcd, 0x88, 0xd0, 0x63, 0x04, 0x21, 0x1b, 0x4a, 0x5f, 0x8e, 0xcb,
+  0xca, 0x73, 0x27, 0xd5, 0x2c, 0x3e, 0x8b, 0x5a, 0x99, 0xeb, 0x63, 0xfa, 0xbe, 0x2b, 0x7d, 0x4b,
+  0x19, 0xed, 0xda, 0x2a, 0x4c, 0xe4, 0x06, 0xb2, 0x7a, 0x1b, 0xcc, 0xe6, 0x01, 0x4c, 0xda, 0x16,
+  0x69, 0x90, 0x69, 0xb2, 0xa9, 0xe8, 0x8f, 0x58, 0x4e, 0x15, 0xfd, 0x39, 0x8f, 0xdb, 0x00, 0x1f,
+  0xe4, 0xed, 0x4f, 0x49, 0x32, 0x6b, 0x94, 0x79, 0xe5, 0x2b, 0x2e, 0xc6, 0x4a, 0xdf, 0x9e, 0x65,
+  0x0f, 0xbb, 0xa6, 0x8b, 0x44, 0xec, 0x61, 0x14, 0xfd, 0x15, 0xc8, 0x35, 0x41, 0x05, 0x5f, 0xe3,
+  0x6f, 0x86, 0xbf, 0x74, 0x95, 0xd6, 0x0c, 0x85, 0x5d, 0x8a, 0x7c, 0x83, 0xbb, 0x3e, 0x12, 0x68,
+  0x20, 0xda, 0xee, 0x7b, 0x53, 0x9d, 0x8a, 0x6d, 0xf1, 0xaa, 0x26, 0xda, 0x92, 0x99, 0x38, 0xad,
+  0xdb, 0x10, 0xed, 0x8d, 0x51, 0x7e, 0x83, 0x8b, 0xbb, 0x29, 0x84, 0x9f, 0x00, 0x96, 0x85, 0xf0,
+  0x50, 0xf6, 0xdd, 0x17, 0xc3, 0xd2, 0x60, 0x1e, 0xf8, 0x39, 0x9d, 0xfd, 0x00, 0x35, 0xf7, 0xd3,
+  0xf6, 0x04, 0x97, 0xe1, 0x40, 0x91, 0x9a, 0xfb, 0x9d, 0x51, 0x30, 0xd9, 0x92, 0xe7, 0xa1, 0xf9,
+  0x26, 0xe9, 0x2d, 0xfd, 0x6c, 0x22, 0xed, 0xbe, 0xc4, 0xcd, 0xa4, 0x92, 0xc9, 0xbf, 0x76, 0xd9,
+  0x5b, 0x50, 0xa3, 0x20, 0xff, 0x02, 0xe2, 0x18, 0xc3, 0x3f, 0x9d, 0x8e, 0x56, 0xd2, 0x63, 0x3e,
+  0x1c, 0xff, 0x2c, 0x22, 0xe9, 0x74, 0x90, 0x1d, 0x10, 0xc9, 0x5e, 0x59, 0x24, 0x7b, 0x62, 0x1b,
+  0x86, 0x2e, 0x13, 0x8c, 0x9e, 0x30, 0x30, 0xc8, 0xe4, 0x58, 0xad, 0xc9, 0x2f, 0x1f, 0x9b, 0x82,
+  0x49, 0xfb, 0x93, 0x67, 0xed, 0x4c, 0x77, 0x5c, 0x21, 0x7e, 0x92, 0x7d, 0xad, 0x36, 0xf6, 0x36,
+  0x6b, 0x63, 0xad, 0x22, 0x6d, 0xf4, 0xa0, 0x6e, 0x5d, 0x1b, 0xec, 0x7d, 0xfb, 0x67, 0x7d, 0x8d,
+  0x9f, 0xcd, 0x34, 0x41, 0x67, 0x08, 0xc3, 0x53, 0x3f, 0x85, 0x78, 0xf7, 0x7c, 0xef, 0x2c, 0xf0,
+  0xd6, 0xd3, 0x17, 0x6f, 0x89, 0xbe, 0xe8, 0x43, 0xd5, 0x0d, 0x46, 0x2d, 0xdc, 0x29, 0xf6, 0xd3,
+  0x8d, 0x59, 0x9b, 0x8d, 0x3a, 0x8f, 0x93, 0xd9, 0x1c, 0x6c, 0x7e, 0x96, 0xa4, 0x14, 0x06, 0x5e,
+  0x04, 0xf1, 0xf0, 0xea, 0xe7, 0xb7, 0xed, 0xcf, 0x78, 0xc3, 0x7e, 0x71, 0xf3, 0xfe, 0x38, 0x49,
+  0xa2, 0x2f, 0x53, 0x0e, 0xb7, 0xde, 0xb2, 0x9c, 0x27, 0xcf, 0x7e, 0xf8, 0x22, 0x75, 0xc1, 0x14,
+  0x1a, 0xb2, 0x8c, 0x93, 0x60, 0x02, 0x0d, 0x1d, 0x44, 0x91, 0xff, 0x05, 0x8a, 0xe2, 0x86, 0x4a,
+  0x55, 0x27, 0x18, 0xa7, 0x49, 0xf6, 0x65, 0x86, 0x9b, 0x4e, 0xa7, 0x18, 0x6e, 0x1e, 0x25, 0x50,
+  0x4a, 0x90, 0xde, 0x65, 0x5f, 0xc4, 0xc5, 0x8a, 0x4d, 0xfb, 0xa2, 0x3c, 0x03, 0x67, 0xe9, 0x7f,
+  0x66, 0xf7, 0x3a, 0x7e, 0x15, 0xa4, 0xb8, 0x77, 0x05, 0xf7, 0xd0, 0x6a, 0xcc, 0x55, 0x39, 0x14,
+  0xc7, 0xc8, 0x94, 0x08, 0xcc, 0x84, 0x18, 0x9d, 0x92, 0x03, 0xb9, 0x99, 0x03, 0xea, 0x15, 0xe7,
+  0x71, 0x70, 0x8f, 0x71, 0xb9, 0x9f, 0x0a, 0x62, 0x1c, 0xa0, 0xa7, 0x9f, 0xd7, 0xe9, 0x95, 0x8f,
+  0xeb, 0xa8, 0x9d, 0x63, 0xdd, 0xce, 0xee, 0xd6, 0xa0, 0x27, 0x76, 0xd9, 0x99, 0xbb, 0x86, 0xf6,
+  0xf4, 0xdc, 0x1d, 0xf5, 0x9c, 0x95, 0x4f, 0x24, 0xc8, 0xf7, 0x7c, 0x93, 0x8e, 0xcc, 0xc3, 0xa2,
+  0xf1, 0x5a, 0x8a, 0x1d, 0xec, 0x69, 0xb1, 0x83, 0xbd, 0xbb, 0x89, 0x1d, 0x78, 0xb7, 0x88, 0x1d,
+  0xc0, 0x04, 0x1f, 0x63, 0x05, 0x83, 0x87, 0xc6, 0x36, 0x09, 0x8c, 0x23, 0x74, 0xbd, 0x61, 0xa7,
+  0xdd, 0x75, 0x7b, 0x7b, 0x6d, 0x77, 0xd0, 0xf6, 0xda, 0xdd, 0x76, 0x0f, 0x7e, 0x75, 0x76, 0x3d,
+  0x0c, 0xb2, 0xf5, 0x7b, 0x6d, 0xd7, 0xf3, 0xfa, 0xed, 0xbe, 0xdb, 0x19, 0x00, 0xcf, 0xed, 0x1d,
+  0x26, 0xb0, 0x3d, 0xd6, 0x77, 0xf7, 0x59, 0x9f, 0xed, 0xd0, 0x73, 0xd7, 0xdd, 0x61, 0x3d, 0xd6,
+  0x83, 0xe7, 0x1e, 0x1b, 0xb8, 0x03, 0x7f, 0x97, 0xed, 0xca, 0xc0, 0x79, 0x9f, 0x75, 0x88, 0x7c,
+  0xd7, 0xf5, 0x80, 0x18, 0x91, 0x84, 0x62, 0x70, 0xbf, 0x06, 0x8f, 0x33, 0x60, 0x1c, 0x03, 0x50,
+  0x6b, 0x23, 0xeb, 0xb6, 0x1e, 0x2b, 0x14, 0x82, 0x4e, 0x1d, 0x76, 0xcd, 0x16, 0xd0, 0x15, 0x5d,
+  0x6d, 0x19, 0x6e, 0xd4, 0x58, 0x67, 0x0b, 0xbc, 0x16, 0x78, 0x80, 0xa9, 0xcd, 0xb8, 0x3d, 0x85,
+  0xf6, 0x9f, 0xd3, 0x7c, 0x9f, 0x3d, 0x7e, 0xf9, 0xaa, 0xcc, 0x4c, 0x3d, 0x6f, 0xda, 0x11, 0x0c,
+  0x3d, 0x02, 0xb1, 0x9c, 0xcb, 0xe7, 0x31, 0xdb, 0xc6, 0x25, 0x1c, 0xd6, 0xfc, 0xf8, 0xc3, 0xb4,
+  0xb5, 0x2e, 0xb3, 0xc7, 0x3c, 0x7e, 0xa2, 0xb1, 0x1c, 0xc6, 0xaa, 0x9b, 0x72, 0x6d, 0xd5, 0x37,
+  0x14, 0xea, 0x91, 0x14, 0x28, 0xae, 0x82, 0x9c, 0x2c, 0xf2, 0x5a, 0x6c, 0x03, 0x79, 0x99, 0x30,
+  0xaa, 0x26, 0xef, 0x57, 0x6d, 0x51, 0xca, 0x67, 0x80, 0xbe, 0x84, 0x41, 0x11, 0x79, 0x9c, 0x7e,
+  0x35, 0x06, 0x65, 0xc9, 0x4a, 0x32, 0xae, 0xe9, 0x58, 0xbf, 0xc0, 0xe4, 0xb0, 0xbb, 0x43, 0xeb,
+  0x36, 0xcc, 0xbe, 0xb0, 0xd3, 0x67, 0x7b, 0x11, 0x7d, 0x63, 0xd6, 0x65, 0x9f, 0x1d, 0xd6, 0x8f,
+  0x38, 0xae, 0x15, 0x7b, 0x8f, 0x79, 0x9d, 0x88, 0x90, 0x75, 0xf4, 0x2f, 0x61, 0x4f, 0xec, 0x5e,
+  0xd8, 0x1a, 0xf6, 0x64, 0xf8, 0xeb, 0xb3, 0x27, 0xc3, 0xdb, 0xd8, 0x93, 0xe1, 0x2f, 0xc7, 0x9e,
+  0x94, 0xf6, 0x9b, 0x53, 0xa0, 0xe9, 0x97, 0xe6, 0xb5, 0xec, 0xee, 0x6c, 0xf5, 0xbc, 0x2f, 0xea,
+  0xb5, 0x50, 0xc6, 0xba, 0x5f, 0x8d, 0x91, 0xb9, 0xcd, 0x9a, 0xfc, 0xdd, 0xf4, 0xf4, 0xea, 0x3c,
+  0x68, 0x8d, 0x5e, 0x3e, 0xfa, 0xf5, 0xf5, 0xf2, 0xd1, 0x6d, 0x7a, 0xf9, 0xe8, 0x4b, 0xf5, 0x72,
+  0x6d, 0x75, 0x85, 0xf7, 0x7a, 0x73, 0x09, 0x41, 0xae, 0x66, 0x58, 0xd7, 0x10, 0x8a, 0xc5, 0x83,
+  0x52, 0xbf, 0xa6, 0xed, 0xef, 0xc6, 0xe1, 0x35, 0xda, 0x0f, 0x8f, 0x31, 0x0f, 0xdc, 0xbb, 0x2f,
+  0x36, 0xc6, 0x67, 0x32, 0x5c, 0xd3, 0xc4, 0xc4, 0x5c, 0xed, 0x71, 0x98, 0x6f, 0xe1, 0xb9, 0x8a,
+  0x99, 0x7f, 0xd9, 0xec, 0x0d, 0x3a, 0x18, 0x9d, 0xe9, 0x8e, 0xd3, 0x56, 0x4b, 0xf6, 0x25, 0xbb,
+  0x3d, 0xd2, 0xe6, 0x60, 0x4b, 0x67, 0x61, 0x7f, 0x85, 0xde, 0xc4, 0xba, 0xf5, 0x51, 0x0c, 0x69,
+  0xdb, 0x8e, 0x8d, 0xb5, 0xb2, 0x22, 0x53, 0x47, 0xe3, 0xf8, 0x25, 0x45, 0xe2, 0xf1, 0x00, 0xe8,
+  0x8b, 0x64, 0x14, 0x48, 0x61, 0x8b, 0x33, 0xf9, 0x3a, 0x3c, 0x7f, 0xc5, 0x95, 0x15, 0x9e, 0xdb,
+  0x9f, 0xba, 0x33, 0x40, 0xa0, 0x78, 0xfa, 0x14, 0x8f, 0x1c, 0xe0, 0xdb, 0x78, 0xf4, 0x86, 0xa0,
+  0x9a, 0x4e, 0x22, 0xc9, 0x9e, 0x22, 0xd4, 0xe9, 0xa7, 0x6e, 0xb1, 0xd4, 0xf3, 0x20, 0x99, 0x63,
+  0x15, 0xc8, 0xb7, 0x16, 0x91, 0x3e, 0xa6, 0xad, 0x08, 0x3c, 0xd8, 0x16, 0xdf, 0x0d, 0x38, 0x8a,
+  0x58, 0xad, 0x84, 0xc2, 0x10, 0x4f, 0x10, 0x67, 0x94, 0x56, 0x0d, 0x83, 0x76, 0xe7, 0x55, 0x38,
+  0x1c, 0x81, 0xd7, 0x29, 0x95, 0xe0, 0x56, 0x96, 0x0a, 0x00, 0x49, 0xca, 0x9e, 0xa4, 0x57, 0xec,
+  0xfb, 0xb9, 0x9d, 0xc4, 0x32, 0x96, 0xb6, 0xb9, 0x4c, 0x8f, 0x6f, 0xd3, 0x7e, 0xaf, 0x93, 0x64,
+  0x46, 0x2c, 0xb2, 0x37, 0xc9, 0x22, 0x1d, 0x6e, 0xd6, 0x82, 0x59, 0x3a, 0xac, 0x6b, 0xc0, 0x14,
+  0xe8, 0x9e, 0xa2, 0x6a, 0x9f, 0x66, 0x44, 0xd7, 0xda, 0x84, 0xbc, 0xf0, 0x69, 0x90, 0xce, 0x12,
+  0x34, 0x11, 0xd5, 0x46, 0x49, 0x66, 0x01, 0x7b, 0x98, 0x65, 0x61, 0x86, 0x99, 0x76, 0xa0, 0xff,
+  0xbf, 0x7e, 0xfa, 0xe6, 0x2d, 0x7b, 0xf8, 0xea, 0x79, 0x05, 0x52, 0xe4, 0x97, 0xfd, 0x73, 0x98,
+  0xe6, 0x0b, 0x3f, 0xb2, 0xd2, 0xbc, 0x0b, 0x69, 0x71, 0x41, 0x41, 0x7b, 0x40, 0xab, 0xdd, 0x40,
+  0x5e, 0x79, 0x56, 0x27, 0x2e, 0x2e, 0x29, 0x22, 0xbc, 0x4c, 0x60, 0xd5, 0xfa, 0xb1, 0xe7, 0x98,
+  0x6b, 0xa3, 0x22, 0x8f, 0x27, 0x6f, 0xba, 0x7b, 0x97, 0x5e, 0xa7, 0xf2, 0xfe, 0xc5, 0xeb, 0xc7,
+  0x2b, 0x24, 0x62, 0x33, 0x1a, 0x32, 0x0f, 0x4e, 0xc3, 0xc6, 0xc0, 0x5f, 0x2d, 0xf6, 0x63, 0xa5,
+  0x47, 0x53, 0x64, 0xeb, 0x24, 0x9f, 0xa6, 0x5f, 0x3d, 0x5e, 0x4a, 0x47, 0xea, 0x4a, 0xce, 0xcd,
+  0x71, 0xad, 0x5f, 0xac, 0x07, 0xd8, 0x8d, 0x7d, 0x18, 0xe2, 0xf8, 0xb1, 0x1a, 0x24, 0x8a, 0xf5,
+  0x3c, 0x74, 0x87, 0x78, 0xe3, 0x7c, 0xea, 0xb6, 0x85, 0x23, 0xc1, 0x47, 0x0c, 0x6a, 0xd1, 0xbf,
+  0xfd, 0xd7, 0x63, 0x63, 0xe8, 0x58, 0x39, 0xac, 0x1f, 0x36, 0x6a, 0xd9, 0x33, 0x43, 0xe5, 0x26,
+  0x14, 0x65, 0xe2, 0x00, 0x54, 0x73, 0xe9, 0x52, 0x26, 0x7a, 0xd0, 0xd7, 0xbe, 0xe1, 0x55, 0xd3,
+  0x01, 0x5e, 0xb3, 0x39, 0x28, 0x46, 0x1b, 0x9d, 0x35, 0x60, 0xf7, 0x7f, 0xff, 0x1f, 0xb5, 0xda,
+  0x58, 0xa6, 0x8b, 0x23, 0xae, 0xa5, 0xde, 0xdd, 0x52, 0x92, 0xc2, 0x81, 0x2e, 0x87, 0x8c, 0x63,
+  0x15, 0x1b, 0x0d, 0x36, 0xe5, 0xeb, 0x3e, 0xe7, 0xeb, 0x7e, 0xc1, 0x55, 0x55, 0x7a, 0xb7, 0xe9,
+  0x81, 0xcf, 0x70, 0x9d, 0x3c, 0x0d, 0xc0, 0x24, 0xb0, 0xaf, 0xe3, 0xb3, 0x6c, 0x7e, 0x58, 0xb8,
+  0x04, 0xc0, 0xc2, 0x14, 0xbe, 0x1a, 0xd5, 0xd6, 0x7d, 0x02, 0x79, 0x66, 0x51, 0x3f, 0x0a, 0xa8,
+  0x9d, 0x04, 0x34, 0xbd, 0x05, 0xfe, 0x87, 0x27, 0x34, 0xc2, 0xd4, 0x55, 0xe0, 0x24, 0x62, 0xaf,
+  0x6d, 0x98, 0xac, 0xf2, 0x57, 0x5a, 0xe1, 0x0d, 0x14, 0x2c, 0xb8, 0xad, 0x6e, 0xb7, 0x81, 0x39,
+  0x5c, 0x8e, 0x1a, 0x3d, 0xb7, 0x83, 0xcc, 0x04, 0x73, 0xf1, 0x52, 0x2d, 0x2b, 0xc8, 0xfc, 0x2e,
+  0xdd, 0x7e, 0x07, 0xe5, 0x9f, 0xc4, 0x54, 0xd6, 0x51, 0x03, 0xa9, 0x50, 0x9f, 0x46, 0x99, 0x3a,
+  0x6a, 0xd5, 0xc5, 0xbe, 0xc2, 0x2d, 0xb3, 0x30, 0x14, 0x4b, 0xdc, 0x9f, 0xba, 0x7a, 0xd3, 0xc0,
+  0x67, 0x1c, 0xe2, 0x89, 0x94, 0x34, 0x26, 0xe6, 0xca, 0x86, 0xec, 0x6e, 0x78, 0xec, 0xb2, 0x71,
+  0xfc, 0x70, 0x3e, 0x8f, 0xae, 0x58, 0x4d, 0x27, 0x97, 0x8b, 0xda, 0x4b, 0x2d, 0x84, 0x0a, 0x55,
+  0xf3, 0x59, 0x04, 0xcf, 0xec, 0x01, 0xf3, 0xa0, 0x91, 0x9f, 0x4d, 0x83, 0xda, 0xec, 0xb3, 0x1c,
+  0x6c, 0xa0, 0x59, 0x01, 0x7a, 0xc3, 0x77, 0x08, 0x3c, 0x1d, 0x26, 0x23, 0x68, 0xe2, 0xff, 0x56,
+  0x26, 0x27, 0x18, 0x26, 0xed, 0x5f, 0x93, 0xd9, 0x11, 0xfc, 0x4a, 0xd3, 0x33, 0xb8, 0x6b, 0xd3,
+  0xa3, 0xe8, 0xdf, 0xd0, 0xfc, 0xe8, 0xfc, 0xdd, 0xe7, 0xfc, 0x6d, 0x60, 0x82, 0x56, 0x75, 0x2a,
+  0x4e, 0xbd, 0xd4, 0xb1, 0xb8, 0x5a, 0xae, 0xd1, 0xb5, 0x3a, 0xa5, 0xfc, 0x59, 0xe6, 0x79, 0xf0,
+  0xea, 0x9c, 0xe7, 0x50, 0xf6, 0x43, 0xa1, 0xf8, 0xd2, 0x49, 0xb7, 0x6c, 0x2a, 0x59, 0xe2, 0xfd,
+  0x13, 0xf3, 0xf8, 0x54, 0xb7, 0x40, 0x7f, 0xb8, 0xf6, 0x04, 0xc1, 0xfb, 0x79, 0x26, 0x08, 0xde,
+  0x26, 0x13, 0x04, 0xef, 0x7f, 0x26, 0x08, 0xb7, 0x99, 0x20, 0x90, 0xd4, 0xe1, 0x01, 0xa4, 0x8e,
+  0x4e, 0xfd, 0x97, 0x99, 0x2f, 0x78, 0x1b, 0xcd, 0x17, 0xbc, 0xdf, 0xfc, 0x7c, 0xc1, 0xdb, 0x6c,
+  0xbe, 0xe0, 0xfd, 0xc4, 0xf3, 0x85, 0xcd, 0x67, 0x0a, 0xde, 0xaf, 0x7e, 0xa6, 0xe0, 0xfd, 0x8a,
+  0x66, 0x0a, 0xde, 0x17, 0x9c, 0x29, 0x78, 0xb7, 0x98, 0x29, 0x78, 0x3f, 0xff, 0x4c, 0xc1, 0xfb,
+  0x39, 0x67, 0x0a, 0xde, 0x17, 0x98, 0x29, 0x78, 0x37, 0x98, 0x29, 0x78, 0xf6, 0x99, 0x82, 0x77,
+  0xcb, 0x99, 0x82, 0xf7, 0x8b, 0x9a, 0x29, 0x78, 0xff, 0x2d, 0x66, 0x0a, 0xde, 0xaf, 0x6c, 0xa6,
+  0xe0, 0x7d, 0xe1, 0x99, 0x82, 0x77, 0xcb, 0x99, 0x82, 0xf7, 0x45, 0x67, 0x0a, 0x5e, 0xdd, 0x4c,
+  0xc1, 0xfb, 0x29, 0x66, 0x0a, 0xde, 0xa6, 0x33, 0x85, 0x35, 0xa6, 0x01, 0x0f, 0x17, 0x79, 0xc2,
+  0x1e, 0x8e, 0xfc, 0x39, 0x9e, 0x8e, 0xb8, 0x8d, 0x51, 0x7e, 0x1a, 0xfb, 0x67, 0x11, 0xf8, 0x68,
+  0x0f, 0xf1, 0xfc, 0x22, 0x26, 0x9c, 0x93, 0x2a, 0xcc, 0x73, 0xec, 0xc9, 0x83, 0x1f, 0x45, 0x2e,
+  0xe1, 0x86, 0x69, 0x5a, 0x29, 0xa7, 0xf0, 0x59, 0x22, 0x74, 0x21, 0xbb, 0x68, 0xfb, 0x7e, 0xc5,
+  0x45, 0xa2, 0x33, 0x22, 0x4d, 0x07, 0x97, 0x4f, 0x4e, 0x7d, 0xc1, 0xf3, 0xa9, 0xc8, 0x6f, 0x77,
+  0x1a, 0x10, 0x03, 0x23, 0xd1, 0x10, 0xae, 0xc8, 0x51, 0xdc, 0x2a, 0xb1, 0x6c, 0xe4, 0x2b, 0x6e,
+  0x28, 0x23, 0xbf, 0x4d, 0x5c, 0xde, 0xca, 0x23, 0x14, 0x1b, 0x02, 0xf1, 0xe4, 0x6e, 0xce, 0x65,
+  0x7c, 0x5b, 0x09, 0x8c, 0x66, 0x75, 0x12, 0x18, 0xf1, 0xb2, 0x4e, 0xd3, 0x30, 0xfb, 0x78, 0x0a,
+  0xdf, 0x47, 0xb8, 0x77, 0xe0, 0x67, 0x97, 0xc0, 0x1b, 0xd0, 0xf9, 0x9c, 0xd1, 0x86, 0xc5, 0xdb,
+  0x56, 0x3d, 0x3b, 0xab, 0xab, 0x7a, 0x86, 0x85, 0x9c, 0x9e, 0x61, 0x21, 0x77, 0x5f, 0xe1, 0xe5,
+  0x8e, 0x2f, 0xcd, 0xc1, 0x58, 0x71, 0xbc, 0xe9, 0x16, 0x92, 0x12, 0x56, 0x99, 0x3d, 0x0a, 0xfd,
+  0x4c, 0x32, 0x74, 0x1b, 0xdb, 0xec, 0xfb, 0xed, 0x33, 0x20, 0xb5, 0x89, 0x53, 0x88, 0x92, 0x16,
+  0x68, 0x37, 0x34, 0xb8, 0x45, 0xa1, 0x6b, 0x79, 0x7c, 0x9b, 0x89, 0xe8, 0x85, 0x7f, 0xc9, 0x27,
+  0xd1, 0x18, 0x12, 0xbc, 0x13, 0x01, 0x81, 0xbf, 0x75, 0x03, 0xf9, 0xa0, 0x97, 0x76, 0x63, 0xf1,
+  0xf0, 0x22, 0xbf, 0x84, 0x74, 0xc2, 0xf8, 0xae, 0xa5, 0x13, 0xc6, 0x37, 0x91, 0x0e, 0x0c, 0x71,
+  0x37, 0x97, 0x0e, 0x15, 0xb9, 0x8e, 0x74, 0x74, 0x21, 0x89, 0x92, 0xd1, 0x73, 0x52, 0xdb, 0x9b,
+  0xed, 0x67, 0xbe, 0x34, 0x37, 0xd2, 0xbc, 0x6a, 0xa6, 0x78, 0xa3, 0xb9, 0xa8, 0x75, 0x1e, 0x6a,
+  0xcd, 0x26, 0xff, 0x8d, 0x54, 0xd8, 0xbb, 0x3b, 0x15, 0x6e, 0x93, 0xaf, 0x71, 0x13, 0x2d, 0x06,
+  0x89, 0xdd, 0x46, 0x91, 0x79, 0xc1, 0xeb, 0xb4, 0xd6, 0x2d, 0xb4, 0xd9, 0xbb, 0x3b, 0x6d, 0xbe,
+  0xa1, 0xa0, 0x08, 0xf1, 0x56, 0x3a, 0xbd, 0xbe, 0xa0, 0xd6, 0x09, 0xb7, 0x58, 0x26, 0x53, 0xf5,
+  0x73, 0xa9, 0x95, 0x1a, 0x0f, 0x43, 0xcf, 0x14, 0xaf, 0x62, 0x7d, 0x7c, 0x85, 0x07, 0xf3, 0x75,
+  0x57, 0xe5, 0xe6, 0xb6, 0xe8, 0x55, 0x1a, 0x8c, 0x42, 0x9e, 0xd7, 0xf6, 0x8e, 0x5c, 0xbf, 0x79,
+  0x36, 0xac, 0x1b, 0xfe, 0xe7, 0xaa, 0xb0, 0xd3, 0x0c, 0x6b, 0x72, 0x3a, 0xc4, 0x9a, 0xfc, 0x62,
+  0x9c, 0x40, 0x3c, 0xde, 0xcb, 0x7e, 0x08, 0xe3, 0x11, 0x28, 0x33, 0xa6, 0xd6, 0x6c, 0xdd, 0x85,
+  0x3e, 0x83, 0x38, 0x60, 0xb2, 0x14, 0x6f, 0x32, 0xed, 0xa2, 0x8d, 0x54, 0x1c, 0xed, 0x86, 0xba,
+  0x5c, 0x14, 0xba, 0xd6, 0x5c, 0x6a, 0x53, 0x5f, 0x99, 0xb2, 0xf3, 0x4d, 0xd3, 0x00, 0x1a, 0x31,
+  0x1a, 0xb1, 0x26, 0x4c, 0x79, 0xef, 0x4c, 0x54, 0x23, 0x24, 0x7e, 0x13, 0x61, 0x11, 0xe2, 0x2d,
+  0xc4, 0x25, 0x0b, 0x5e, 0x2e, 0xb0, 0x55, 0x13, 0x4e, 0x63, 0x82, 0xf9, 0xf0, 0x61, 0xd3, 0x3a,
+  0xad, 0xa4, 0xfe, 0x3c, 0x28, 0xc2, 0x35, 0xa5, 0x69, 0xdc, 0x9d, 0x4f, 0x13, 0xcb, 0x9b, 0x16,
+  0x7f, 0x96, 0x70, 0xcb, 0x5b, 0x3f, 0xfe, 0x48, 0x2b, 0x14, 0xcb, 0x02, 0x2e, 0x94, 0x7a, 0x61,
+  0x7a, 0xf1, 0x85, 0xc3, 0x2a, 0xfa, 0x39, 0xd4, 0x5b, 0x29, 0x2c, 0xb2, 0xba, 0x59, 0x44, 0x45,
+  0x56, 0xf0, 0xc6, 0x71, 0x12, 0x55, 0xe4, 0xe6, 0x41, 0x92, 0xb2, 0x34, 0xf4, 0xdd, 0xd1, 0xa5,
+  0x86, 0x25, 0xe5, 0xbc, 0x57, 0xbb, 0x67, 0x54, 0x9c, 0x8a, 0xd3, 0x0d, 0x84, 0x3d, 0x6c, 0x25,
+  0x16, 0x55, 0xca, 0x70, 0xda, 0x06, 0x59, 0xaa, 0x8f, 0x80, 0x5f, 0xb6, 0x31, 0x74, 0x43, 0x16,
+  0x9e, 0xa4, 0xc9, 0x7c, 0xdd, 0xe2, 0x47, 0xa9, 0xd8, 0x9d, 0x7b, 0x37, 0x45, 0x63, 0x06, 0xa8,
+  0xc5, 0x0c, 0x8f, 0xf6, 0xaf, 0x57, 0x7c, 0x39, 0xf1, 0xd3, 0x2d, 0x8b, 0xc7, 0xdc, 0x63, 0x8b,
+  0xe1, 0xfa, 0xc5, 0x97, 0x93, 0x8d, 0xdd, 0x59, 0xa0, 0xff, 0xdb, 0x24, 0x1d, 0x06, 0x0c, 0x6c,
+  0x0f, 0xfb, 0x2e, 0xb9, 0xb8, 0xad, 0x53, 0x31, 0x06, 0x56, 0xeb, 0xbc, 0x8a, 0x31, 0x16, 0x74,
+  0x0a, 0x00, 0x77, 0xe8, 0x38, 0xac, 0x65, 0xdf, 0xa1, 0x6e, 0xc2, 0xc0, 0x0b, 0x43, 0x4e, 0x86,
+  0xd6, 0x6e, 0xbe, 0x97, 0x6e, 0x5c, 0xc6, 0xa4, 0x29, 0xf5, 0x9b, 0x96, 0xd7, 0x3e, 0x57, 0xbd,
+  0xfa, 0x60, 0x35, 0xbb, 0x41, 0xee, 0x13, 0x9e, 0xbc, 0x45, 0xd7, 0xc9, 0x22, 0x07, 0x4e, 0x32,
+  0x69, 0xf3, 0x8c, 0x26, 0xb6, 0x58, 0x71, 0xe5, 0xea, 0x00, 0xcb, 0x5d, 0x1c, 0x7a, 0x28, 0x95,
+  0xba, 0x4e, 0x8c, 0x4c, 0xc5, 0x13, 0xd7, 0x75, 0xf5, 0x32, 0xf5, 0xe7, 0x6a, 0x55, 0xf5, 0x8b,
+  0x32, 0x74, 0xb3, 0xb5, 0x24, 0xed, 0xc8, 0xdc, 0x5f, 0x64, 0xc1, 0x23, 0xa3, 0x45, 0xb9, 0x7a,
+  0xbc, 0xc2, 0x0f, 0x98, 0x37, 0x84, 0x1e, 0xcc, 0xd6, 0x5c, 0x46, 0x54, 0x91, 0x01, 0x87, 0xd6,
+  0x4f, 0x51, 0x66, 0x48, 0xe4, 0x31, 0xfe, 0xb8, 0x01, 0x11, 0xf0, 0x40, 0xe3, 0x28, 0xf1, 0x47,
+  0x92, 0xce, 0x13, 0xf1, 0x7b, 0x7d, 0x52, 0xe6, 0xc4, 0x63, 0x83, 0x2b, 0xaf, 0x74, 0x89, 0xa4,
+  0xe1, 0x64, 0x12, 0xa4, 0xdf, 0xcf, 0xb1, 0x68, 0x64, 0xe3, 0x85, 0x1f, 0xe3, 0xb2, 0xd2, 0xb7,
+  0x61, 0x3a, 0xbb, 0xf0, 0xd3, 0x80, 0xf1, 0x2f, 0x25, 0xa6, 0x6a, 0xda, 0x4a, 0xe8, 0x4b, 0x66,
+  0x9c, 0x6b, 0x56, 0xa0, 0x9a, 0x9f, 0x63, 0x18, 0x82, 0x71, 0x28, 0x93, 0x7d, 0x25, 0xe0, 0xdd,
+  0xf1, 0x5f, 0xb6, 0xb4, 0x0b, 0x0c, 0xd9, 0x9f, 0xe7, 0x47, 0x0d, 0xf7, 0x2c, 0x8c, 0x75, 0x43,
+  0x31, 0xe7, 0x07, 0x9a, 0x8b, 0x3a, 0x98, 0x5d, 0x50, 0x99, 0x06, 0x3f, 0x13, 0x4b, 0xfc, 0xfc,
+  0x51, 0xf9, 0x7b, 0x0f, 0xb2, 0x61, 0x1a, 0xce, 0xf3, 0xe3, 0x7b, 0x68, 0xa6, 0x73, 0xf6, 0xec,
+  0xf9, 0x9b, 0xb7, 0x2f, 0x5f, 0xff, 0xe5, 0xf4, 0xc5, 0xf3, 0xef, 0xbe, 0x7f, 0xfb, 0xf4, 0x0d,
+  0x3b, 0x62, 0xdd, 0x7e, 0x1f, 0x2f, 0x60, 0xe6, 0x9f, 0x5f, 0xbd, 0x3c, 0x39, 0x39, 0x7d, 0x81,
+  0xaf, 0x07, 0x9d, 0x4e, 0xe7, 0xf0, 0x9e, 0x78, 0x0d, 0x36, 0x22, 0x4f, 0xd2, 0x2b, 0x78, 0xfd,
+  0x19, 0x6a, 0x88, 0x19, 0xcb, 0xa0, 0xd7, 0xcc, 0xe6, 0xd9, 0x01, 0x7b, 0xf7, 0x7e, 0x8b, 0x61,
+  0xc2, 0x76, 0xfe, 0x94, 0xe2, 0xa5, 0x8a, 0xf8, 0xf0, 0xa9, 0x9b, 0xcd, 0xc5, 0x93, 0xa7, 0x9e,
+  0xba, 0xe8, 0x15, 0xc9, 0xb7, 0xea, 0x19, 0x08, 0x7e, 0xea, 0x62, 0x3e, 0x0a, 0xf9, 0xa5, 0x78,
+  0xc6, 0xa3, 0xe2, 0xfc, 0x09, 0x37, 0xe3, 0xf0, 0x27, 0x10, 0x0f, 0xcc, 0xb7, 0x66, 0xf3, 0xe2,
+  0x17, 0x45, 0x63, 0xf9, 0x4f, 0xa0, 0x85, 0x6f, 0x44, 0x80, 0xba, 0x00, 0x99, 0x2f, 0x74, 0x84,
+  0x30, 0xee, 0xea, 0x3f, 0x76, 0x24, 0x1b, 0x22, 0x8b, 0x31, 0xff, 0x36, 0x4f, 0x2e, 0x02, 0xc1,
+  0xec, 0x30, 0x21, 0xe4, 0x7b, 0xd7, 0x87, 0x42, 0x1c, 0x4f, 0x9e, 0xfe, 0xf9, 0xf9, 0xe3, 0xa7,
+  0xa7, 0x52, 0x96, 0xff, 0xf4, 0xf4, 0x2f, 0x28, 0xb1, 0xcf, 0xac, 0x73, 0xc0, 0x1c, 0x14, 0x06,
+  0xd8, 0x71, 0x28, 0xc1, 0x01, 0x69, 0xc0, 0x93, 0x07, 0x4f, 0x82, 0x32, 0xfc, 0xea, 0x21, 0x08,
+  0x54, 0x0b, 0x1e, 0xfb, 0xf0, 0x48, 0xa5, 0xc0, 0xf3, 0x00, 0x9e, 0xa1, 0x18, 0x87, 0x5d, 0x2b,
+  0x99, 0xcf, 0xc5, 0x05, 0x58, 0x47, 0xfc, 0x1e, 0x6e, 0x15, 0xef, 0x3c, 0x60, 0x31, 0xd8, 0xcd,
+  0x2d, 0x26, 0x23, 0x7c, 0xc6, 0x6f, 0x98, 0x32, 0xc9, 0xdf, 0x02, 0x47, 0xc4, 0x4e, 0x4a, 0x50,
+  0xda, 0x2b, 0x84, 0x93, 0xd3, 0x2d, 0x05, 0x55, 0x4c, 0x28, 0x74, 0x72, 0xc2, 0x77, 0xd3, 0x5f,
+  0xf1, 0xcd, 0x71, 0x0a, 0x4f, 0x6c, 0x57, 0x2d, 0x5e, 0x14, 0x1b, 0xe8, 0xb4, 0xe2, 0xf8, 0x3a,
+  0x59, 0x81, 0xe4, 0xd9, 0x90, 0x34, 0x98, 0x7b, 0x85, 0x54, 0x30, 0x6b, 0xd9, 0xd3, 0x51, 0x98,
+  0xa3, 0x58, 0x54, 0x7b, 0x64, 0x41, 0x7a, 0x1e, 0xa4, 0x98, 0xe3, 0x2a, 0x10, 0xef, 0xc5, 0x87,
+  0x93, 0xe7, 0x2f, 0x9e, 0xbf, 0x7d, 0x63, 0x11, 0xe1, 0x67, 0x5c, 0x03, 0x3c, 0x60, 0xed, 0xc1,
+  0x16, 0x2e, 0x92, 0x1f, 0x30, 0xf8, 0x8b, 0xee, 0x29, 0xde, 0x31, 0xd6, 0x65, 0xd7, 0xba, 0xf0,
+  0x0a, 0xe0, 0x5e, 0x47, 0x00, 0xef, 0xd4, 0x41, 0x93, 0x04, 0x05, 0xb4, 0x27, 0xa1, 0x07, 0xf5,
+  0xb4, 0x79, 0x2b, 0xac, 0x22, 0x5f, 0x50, 0x37, 0xe0, 0x97, 0x17, 0x50, 0xb4, 0xa8, 0x00, 0xef,
+  0xba, 0x0a, 0x1e, 0x9f, 0x24, 0xc2, 0x40, 0x14, 0xa0, 0x37, 0x78, 0x05, 0xa3, 0x67, 0xc3, 0x50,
+  0xca, 0x20, 0xc0, 0xfb, 0x8a, 0xff, 0x12, 0xb0, 0xa1, 0x27, 0x92, 0xb6, 0x22, 0xdd, 0xb1, 0x30,
+  0x2f, 0xdb, 0x7e, 0x15, 0x30, 0xc2, 0xea, 0x0a, 0xb6, 0x0c, 0x5e, 0x71, 0xa2, 0x2b, 0xd7, 0x0a,
+  0x04, 0x4d, 0xef, 0xde, 0xbc, 0x7d, 0xfa, 0xea, 0xf4, 0xe9, 0x89, 0x45, 0x95, 0x1c, 0x6d, 0x19,
+  0xc3, 0x29, 0x69, 0x8e, 0x53, 0x84, 0xf0, 0x1d, 0xbd, 0x87, 0x3a, 0x45, 0xf0, 0xda, 0xa9, 0x2a,
+  0x84, 0x63, 0x84, 0x4c, 0x9d, 0x52, 0xa7, 0x75, 0x8c, 0x38, 0xa1, 0x53, 0xea, 0xbf, 0x8e, 0x16,
+  0x77, 0x71, 0x2a, 0x2d, 0xeb, 0x18, 0x81, 0x06, 0xc7, 0x6c, 0x47, 0xa7, 0x98, 0xd7, 0x39, 0x66,
+  0xa3, 0x39, 0x6a, 0x0b, 0xad, 0x53, 0xea, 0xd2, 0x8e, 0xb1, 0xc1, 0xd6, 0x31, 0x7a, 0xb7, 0xa3,
+  0x96, 0xd3, 0x9d, 0x52, 0x9f, 0x76, 0x8c, 0xc5, 0x76, 0x87, 0xc4, 0x1c, 0x05, 0xbc, 0x73, 0xff,
+  0x23, 0x38, 0xd3, 0x53, 0x9e, 0x97, 0x10, 0x84, 0x0d, 0x43, 0x10, 0x7e, 0x08, 0xe3, 0x30, 0x0f,
+  0x7d, 0x4a, 0x89, 0xf6, 0x04, 0xd7, 0xa2, 0x8f, 0xd8, 0xd8, 0x8f, 0xb2, 0x80, 0x7f, 0x04, 0x37,
+  0x27, 0xc5, 0x2f, 0xc1, 0xc8, 0x7c, 0xaf, 0x92, 0xfe, 0xc0, 0x6b, 0x6e, 0x58, 0x54, 0xea, 0x11,
+  0xf5, 0x46, 0x4b, 0x67, 0x27, 0xde, 0x1d, 0xde, 0x1b, 0x2f, 0x62, 0x9e, 0xb4, 0xaf, 0xe4, 0x3e,
+  0xe0, 0x15, 0x66, 0xc9, 0x10, 0x66, 0x46, 0x71, 0xee, 0xc2, 0xf4, 0xfb, 0x69, 0x14, 0xe0, 0xe3,
+  0xa3, 0xab, 0xe7, 0xa3, 0xa6, 0x23, 0x07, 0x77, 0xa7, 0xe5, 0x92, 0xef, 0xd1, 0xa4, 0x8b, 0x6e,
+  0x14, 0xa5, 0xd2, 0x20, 0x4e, 0xa3, 0x28, 0xd7, 0x2b, 0xee, 0x2b, 0x1c, 0xad, 0x43, 0xf9, 0x10,
+  0x90, 0xc2, 0x31, 0x6b, 0x12, 0x8a, 0x8b, 0xef, 0x32, 0x37, 0x0a, 0xe2, 0x49, 0x3e, 0x65, 0x47,
+  0x47, 0x20, 0xaa, 0x16, 0xe3, 0x77, 0x77, 0x1c, 0x2a, 0xe2, 0x08, 0x03, 0xb4, 0x35, 0x84, 0x77,
+  0x9d, 0xf7, 0xda, 0x67, 0x60, 0xe9, 0x89, 0x9f, 0xfb, 0x58, 0xf3, 0xe0, 0x82, 0x7d, 0x2b, 0x7e,
+  0x36, 0xa9, 0x24, 0xf9, 0xd1, 0xc5, 0x4b, 0x09, 0xe3, 0x51, 0xb3, 0xb1, 0xe0, 0xb9, 0x22, 0xb7,
+  0x88, 0x6a, 0xab, 0xa0, 0x72, 0x39, 0x4d, 0x05, 0x81, 0x7f, 0x7e, 0x71, 0xf2, 0x2c, 0xcf, 0xe7,
+  0xaf, 0x31, 0x89, 0x51, 0x96, 0x73, 0x32, 0xf0, 0xd5, 0x5d, 0x50, 0xb5, 0x5d, 0x7f, 0x34, 0x7a,
+  0x8a, 0xf7, 0x10, 0x9d, 0x80, 0x33, 0x11, 0x80, 0xfb, 0xd4, 0x6c, 0xc0, 0xd4, 0x6d, 0x82, 0xa9,
+  0x8f, 0x80, 0x68, 0x33, 0x68, 0xb1, 0xa3, 0x63, 0x12, 0x0c, 0xaf, 0x65, 0x20, 0xea, 0x86, 0xfb,
+  0x50, 0x17, 0x39, 0xc6, 0x55, 0x5b, 0xe2, 0xab, 0x2c, 0x18, 0xaf, 0x4f, 0xc3, 0x4c, 0x52, 0x47,
+  0xec, 0x85, 0x9f, 0x4f, 0x5d, 0x3a, 0x6c, 0xdb, 0x44, 0x3c, 0x28, 0x0c, 0x74, 0x61, 0x9b, 0x05,
+  0x6e, 0x0e, 0xd2, 0x8b, 0x5a, 0xec, 0x0f, 0x78, 0xd7, 0x23, 0xb1, 0x83, 0xff, 0xe0, 0x9d, 0x47,
+  0x6f, 0xd1, 0x49, 0x6a, 0x7e, 0xe0, 0x0d, 0x42, 0xa7, 0xaa, 0x7f, 0xff, 0x59, 0xd0, 0xbb, 0xfe,
+  0x87, 0x0f, 0x02, 0x14, 0xef, 0x3b, 0xba, 0x56, 0xb5, 0xa8, 0xb2, 0x8f, 0xb8, 0xc8, 0x7a, 0x89,
+  0x73, 0x04, 0xe6, 0x7a, 0x45, 0xed, 0xe2, 0x41, 0xd1, 0x8a, 0xf3, 0xa2, 0xec, 0xc6, 0xdf, 0xff,
+  0xf3, 0xff, 0xb2, 0x37, 0x0b, 0xf0, 0xfa, 0xb2, 0xec, 0x2b, 0xf6, 0x3a, 0x00, 0x2f, 0x46, 0xcc,
+  0x1b, 0x50, 0xc4, 0xa8, 0xc5, 0x05, 0xc3, 0x41, 0x8e, 0x91, 0x5d, 0x70, 0x22, 0x9a, 0xbc, 0xac,
+  0x28, 0x19, 0xd2, 0xbe, 0x5c, 0x37, 0x0d, 0xb8, 0x42, 0x81, 0xbf, 0x81, 0xfe, 0x9a, 0xe4, 0x9b,
+  0x05, 0x80, 0x6e, 0x29, 0xf3, 0xc3, 0xdf, 0xff, 0xf3, 0x3f, 0xd8, 0x53, 0xbc, 0xba, 0xe9, 0x03,
+  0x26, 0xe3, 0x5a, 0x04, 0xd6, 0x8a, 0x26, 0xd0, 0xde, 0xcd, 0xc6, 0xab, 0x97, 0x6f, 0xde, 0x02,
+  0x27, 0x8d, 0x6d, 0xd1, 0xee, 0xea, 0x33, 0x4e, 0x1c, 0x9b, 0x52, 0x3b, 0xe0, 0xed, 0xf5, 0xbd,
+  0x42, 0xcf, 0x8b, 0x3c, 0x9a, 0x38, 0x09, 0x7c, 0x3e, 0x02, 0x17, 0x2b, 0x8f, 0x79, 0xed, 0x95,
+  0x82, 0x83, 0x72, 0xa4, 0x57, 0x7c, 0xbf, 0x69, 0x92, 0x3e, 0x8c, 0xa2, 0xa6, 0xe3, 0xea, 0x33,
+  0x46, 0xe8, 0x41, 0x40, 0xfc, 0xa9, 0x0f, 0x13, 0x63, 0x98, 0x68, 0x43, 0x65, 0x83, 0xc8, 0x25,
+  0x27, 0x17, 0xe5, 0x0e, 0x15, 0x9e, 0x25, 0xe7, 0x41, 0xd3, 0xe1, 0xf9, 0x34, 0x9d, 0x16, 0x71,
+  0xa5, 0x53, 0x2f, 0x77, 0x1f, 0x22, 0xed, 0xb0, 0xfb, 0x8c, 0x33, 0xd4, 0xd2, 0x68, 0x41, 0x83,
+  0x16, 0x84, 0xca, 0x74, 0x2c, 0x5c, 0x8a, 0xb4, 0xa1, 0x37, 0x60, 0x10, 0xef, 0xde, 0xab, 0x2d,
+  0x57, 0x33, 0x13, 0x99, 0x7f, 0x1e, 0x3c, 0xe3, 0xae, 0x36, 0x99, 0x1b, 0x7e, 0xaf, 0x1c, 0xb6,
+  0x76, 0xf4, 0x06, 0x5e, 0xfa, 0x93, 0x00, 0xa4, 0x9f, 0x3f, 0x07, 0xc3, 0x06, 0x04, 0x68, 0xa7,
+  0xf1, 0xa9, 0xf0, 0xcc, 0xc1, 0xc2, 0xfe, 0xe9, 0xcd, 0xcb, 0xef, 0x40, 0xef, 0x52, 0x50, 0xa2,
+  0x70, 0x7c, 0xd5, 0x14, 0x1f, 0x5a, 0x68, 0x88, 0x18, 0xa8, 0x0b, 0xb2, 0x0b, 0x34, 0xf1, 0x56,
+  0xac, 0xa2, 0x40, 0xd4, 0x1e, 0xad, 0x40, 0xd5, 0xa7, 0xf1, 0xfa, 0xb6, 0x23, 0xb3, 0xe0, 0x49,
+  0x4d, 0xc1, 0xca, 0x2c, 0x7d, 0x05, 0x48, 0xba, 0x09, 0x22, 0xe6, 0xef, 0x15, 0xdd, 0x15, 0x2b,
+  0x87, 0x16, 0x9a, 0xf8, 0x9c, 0xfb, 0x29, 0xcc, 0x52, 0x11, 0xe3, 0x50, 0xf5, 0x1b, 0x02, 0x70,
+  0x8b, 0xc9, 0x05, 0xfb, 0xfa, 0x6b, 0x56, 0x7e, 0x27, 0x0d, 0xde, 0x31, 0xd3, 0x3a, 0x15, 0x7b,
+  0x79, 0xf6, 0x23, 0xb4, 0x93, 0xfb, 0x31, 0xb8, 0xca, 0x54, 0xbd, 0x55, 0x23, 0x7d, 0x2c, 0x7a,
+  0x27, 0x33, 0x8a, 0x7a, 0xf7, 0xf1, 0x3d, 0x16, 0xf1, 0x30, 0x4d, 0xfd, 0x2b, 0x37, 0xcc, 0xe8,
+  0xaf, 0xfa, 0xd2, 0x6a, 0xe9, 0x38, 0xf0, 0x8f, 0xa0, 0x8b, 0x48, 0x47, 0x4c, 0x42, 0x1d, 0x16,
+  0x20, 0xa5, 0x4e, 0x67, 0x41, 0x42, 0x13, 0xa9, 0x15, 0x52, 0xad, 0x55, 0x0b, 0x6d, 0x74, 0xd4,
+  0xc4, 0x51, 0xa8, 0xa5, 0x53, 0x96, 0x8f, 0xd7, 0x7a, 0x77, 0xd5, 0xda, 0x94, 0x04, 0x9c, 0x44,
+  0x81, 0x8b, 0x57, 0x1f, 0x34, 0x1b, 0xa2, 0x41, 0xa9, 0x71, 0xc1, 0x92, 0x80, 0xb5, 0x46, 0x2b,
+  0x15, 0xd0, 0x88, 0xa4, 0x29, 0xdb, 0x08, 0x06, 0xe1, 0x51, 0xf0, 0x24, 0x38, 0x0f, 0x87, 0x4a,
+  0xe9, 0xce, 0x16, 0x63, 0x5d, 0x0d, 0x46, 0xe7, 0x82, 0x6d, 0xec, 0xea, 0x7f, 0x86, 0x0e, 0x44,
+  0x00, 0xb2, 0xc1, 0xe1, 0xd9, 0x3d, 0xbb, 0xca, 0x83, 0x13, 0xde, 0x24, 0x0f, 0x30, 0x2f, 0xf3,
+  0xbf, 0xfe, 0x2b, 0x20, 0xa1, 0xae, 0x7c, 0x1f, 0xc6, 0xf9, 0x5e, 0x13, 0x1a, 0xe9, 0x2b, 0x1c,
+  0x9a, 0x2e, 0xfb, 0x83, 0xf2, 0xa7, 0xae, 0xfa, 0xb4, 0x57, 0xfe, 0xe4, 0xf1, 0x4f, 0x5d, 0xa9,
+  0x4d, 0x62, 0x5c, 0x96, 0x5c, 0xc5, 0x38, 0x5c, 0x6a, 0xe0, 0x3d, 0x6d, 0x30, 0x1a, 0xc2, 0x20,
+  0x90, 0x1b, 0xdf, 0xbb, 0x3b, 0xcd, 0xbe, 0x66, 0xec, 0xe4, 0xa8, 0x9b, 0xc3, 0x94, 0xc1, 0x8f,
+  0x5e, 0x64, 0x06, 0x6c, 0xcf, 0x6b, 0xee, 0x09, 0x58, 0x3e, 0x66, 0x74, 0xb4, 0x52, 0x83, 0x0b,
+  0x68, 0x2d, 0x00, 0x07, 0x59, 0x04, 0x6e, 0x9c, 0x5c, 0x40, 0x87, 0x69, 0x9b, 0xb8, 0x5d, 0x4f,
+  0x2b, 0xc8, 0x22, 0x21, 0xaa, 0xd4, 0x0e, 0xd8, 0xa2, 0x3e, 0x50, 0x8f, 0xe1, 0xaf, 0x47, 0x7f,
+  0xff, 0xc0, 0xb9, 0x2e, 0xd5, 0x56, 0x15, 0x0c, 0xde, 0x4d, 0x18, 0x64, 0x62, 0x5e, 0xc3, 0xf0,
+  0xae, 0x50, 0x96, 0x8c, 0xc7, 0x4c, 0x27, 0x25, 0xc6, 0x6b, 0xd6, 0x24, 0x5f, 0x89, 0xdc, 0x26,
+  0xf8, 0xf3, 0x00, 0x3e, 0xb0, 0xf0, 0xfe, 0xfd, 0x96, 0xd1, 0x0d, 0xc3, 0x51, 0x49, 0x7c, 0x8a,
+  0x4c, 0x28, 0xd4, 0x4b, 0x14, 0x8b, 0x57, 0x33, 0x97, 0x25, 0xd9, 0xdd, 0x93, 0xb0, 0xc6, 0xf8,
+  0xa1, 0x1b, 0x0d, 0x54, 0x97, 0xe7, 0x08, 0xcc, 0x55, 0x1d, 0x44, 0xb0, 0x85, 0xfc, 0x6e, 0x89,
+  0x4a, 0x72, 0x04, 0x5e, 0xa7, 0x77, 0xe1, 0x08, 0xfb, 0x05, 0xef, 0x80, 0x30, 0x63, 0x9f, 0xa1,
+  0x41, 0xd8, 0x62, 0xe7, 0xd8, 0x61, 0xcf, 0x69, 0xec, 0x6c, 0xf7, 0xbc, 0xdd, 0x9d, 0x3d, 0xf6,
+  0x0d, 0xc9, 0x84, 0x1d, 0xc0, 0xdb, 0x6d, 0xce, 0x98, 0xa0, 0x83, 0x82, 0xb8, 0x7f, 0x44, 0x72,
+  0x24, 0xf2, 0xf8, 0xf6, 0x5a, 0x49, 0x4e, 0x33, 0x25, 0x46, 0x29, 0x60, 0x52, 0xa9, 0x41, 0x0e,
+  0x84, 0xba, 0xc0, 0xc4, 0xa0, 0x79, 0xba, 0x05, 0xf5, 0xc7, 0x82, 0x45, 0x3b, 0xb7, 0x59, 0x93,
+  0x7f, 0x6c, 0xb3, 0x2e, 0xfc, 0x1b, 0xa2, 0x42, 0x14, 0x5a, 0x43, 0xc5, 0x8b, 0xe6, 0xfa, 0xac,
+  0x95, 0xb3, 0x25, 0x5b, 0xeb, 0x1a, 0xed, 0xba, 0x9f, 0x5d, 0xc5, 0x43, 0x66, 0x18, 0x5b, 0xb3,
+  0xbb, 0xf1, 0x96, 0x29, 0x1b, 0xca, 0x94, 0x5a, 0xdb, 0xbf, 0xf0, 0x61, 0x96, 0x3b, 0x0e, 0x28,
+  0x42, 0xbc, 0x8d, 0x0b, 0xee, 0x67, 0x09, 0xd8, 0xdd, 0x6d, 0xc3, 0xee, 0x4a, 0xcb, 0x0b, 0x9e,
+  0x60, 0xf2, 0x51, 0x37, 0xbe, 0xaa, 0x07, 0x07, 0xd8, 0x85, 0x6d, 0x5d, 0x9d, 0xd3, 0x47, 0x4c,
+  0x1f, 0x25, 0xf3, 0x68, 0x31, 0x1e, 0x83, 0x4f, 0xd3, 0xd2, 0xc9, 0x02, 0x72, 0x41, 0x53, 0x23,
+  0x3a, 0x0e, 0xd3, 0x2c, 0x3f, 0xc1, 0xc1, 0x01, 0x68, 0x0b, 0x7e, 0x2c, 0x36, 0xfa, 0x1b, 0xcb,
+  0x37, 0xf0, 0x3f, 0xa1, 0x19, 0x9f, 0xc7, 0x63, 0xf4, 0xe8, 0xaf, 0x78, 0x59, 0xa8, 0xb4, 0xd4,
+  0xa7, 0x83, 0x73, 0x9d, 0x0a, 0x80, 0x8c, 0x9e, 0xe3, 0x5d, 0x96, 0xcd, 0x1c, 0xdb, 0x25, 0x67,
+  0xc7, 0x47, 0x5a, 0xc9, 0x1a, 0x9f, 0x31, 0x57, 0x15, 0x30, 0x17, 0x16, 0x2a, 0x9c, 0x97, 0x32,
+  0x70, 0xc7, 0x5a, 0xaf, 0xb3, 0xab, 0x7f, 0x0a, 0xae, 0x54, 0x47, 0x53, 0xc3, 0x0a, 0xde, 0xef,
+  0x0a, 0x6d, 0xda, 0xb4, 0x44, 0x7d, 0x8a, 0x51, 0xa6, 0x09, 0xca, 0xbc, 0xc5, 0x60, 0x04, 0x7a,
+  0xcf, 0xbd, 0x41, 0x2a, 0x0c, 0x79, 0x29, 0x54, 0xbd, 0xc5, 0x0b, 0x78, 0x87, 0x40, 0x82, 0xd1,
+  0xe2, 0xe3, 0xa1, 0xb2, 0xee, 0xeb, 0x0f, 0x66, 0x28, 0x38, 0x8c, 0x8f, 0xcb, 0xb1, 0x02, 0x8b,
+  0xfc, 0x48, 0xf5, 0x73, 0x0a, 0x09, 0x38, 0x2d, 0x82, 0xa9, 0x4a, 0x26, 0x83, 0x79, 0x4a, 0xd0,
+  0x84, 0x09, 0x6f, 0xac, 0x06, 0x1b, 0x1a, 0xc1, 0xc8, 0x70, 0x71, 0x46, 0xdf, 0x2b, 0x5c, 0xf9,
+  0x62, 0x29, 0x96, 0x28, 0x1b, 0x63, 0x75, 0x45, 0xa9, 0xc5, 0xa8, 0x17, 0x8b, 0xf1, 0xcd, 0x71,
+  0x2c, 0xa8, 0x2e, 0xbf, 0xa0, 0xe2, 0x87, 0x30, 0x07, 0x75, 0xc7, 0xb8, 0x1c, 0xb8, 0x4e, 0xf5,
+  0x24, 0x3a, 0x26, 0x85, 0x5a, 0x38, 0x63, 0x28, 0x35, 0x06, 0x63, 0x44, 0x71, 0xa1, 0xd9, 0x61,
+  0x14, 0x6d, 0x16, 0x1f, 0xe4, 0x00, 0x4b, 0x7f, 0x97, 0x0c, 0xb1, 0xbc, 0x2b, 0xa9, 0xb0, 0xa8,
+  0x7d, 0xa4, 0xbd, 0xa7, 0x9c, 0xc9, 0xea, 0xd4, 0xe1, 0x3c, 0xcc, 0xc2, 0xb3, 0x30, 0x82, 0x3e,
+  0xc0, 0xe3, 0xbc, 0xc5, 0x34, 0x82, 0x2b, 0x8e, 0xc4, 0x2c, 0xe0, 0x44, 0x74, 0x0b, 0x04, 0xdc,
+  0x98, 0x86, 0xa3, 0x51, 0x10, 0x37, 0x5a, 0xa6, 0xbf, 0xc8, 0x35, 0x08, 0xfd, 0x43, 0x61, 0xa6,
+  0x9a, 0xda, 0xe7, 0x2d, 0xbc, 0xab, 0x9b, 0x26, 0x08, 0x85, 0x03, 0x00, 0x66, 0xfd, 0x21, 0x7a,
+  0xa1, 0x40, 0x9c, 0x12, 0x1d, 0x35, 0xb1, 0xe1, 0xb6, 0x98, 0x1f, 0xcd, 0xa7, 0x3e, 0xb7, 0x4c,
+  0x64, 0x05, 0xf0, 0xad, 0x1a, 0x9b, 0x3e, 0x50, 0x6e, 0xa7, 0x5d, 0x18, 0x51, 0xf7, 0x41, 0x07,
+  0xba, 0x1e, 0x8c, 0x78, 0xbf, 0xff, 0x4c, 0x18, 0xd7, 0xad, 0x0f, 0xc5, 0x60, 0x39, 0x03, 0x09,
+  0x23, 0x1e, 0x4c, 0xc0, 0x4e, 0x30, 0xc2, 0xf9, 0xd8, 0xc7, 0x35, 0x09, 0x39, 0x2c, 0xce, 0xdc,
+  0x30, 0x1e, 0x46, 0x8b, 0x11, 0xf4, 0x29, 0x27, 0x52, 0x39, 0x53, 0xb1, 0xc1, 0x8d, 0x52, 0xa0,
+  0x00, 0x4c, 0x22, 0xc5, 0xf0, 0x7a, 0xe9, 0x52, 0x29, 0x65, 0x2a, 0xd3, 0x24, 0x67, 0x17, 0x20,
+  0x9f, 0x14, 0xf4, 0x0e, 0x9c, 0x09, 0xfd, 0x13, 0x2e, 0xab, 0x55, 0x5e, 0x4e, 0x79, 0xfe, 0x44,
+  0x89, 0x53, 0x2a, 0x98, 0x97, 0xba, 0xbb, 0xb3, 0xc5, 0x7a, 0xde, 0xaa, 0x92, 0x87, 0x3c, 0x73,
+  0x1a, 0xd2, 0x60, 0x55, 0xf6, 0x3b, 0xb2, 0x0e, 0x2b, 0xd8, 0xe7, 0xec, 0x58, 0x88, 0x70, 0x56,
+  0x3a, 0x20, 0x80, 0x41, 0x6f, 0x15, 0x15, 0x11, 0xf5, 0xb6, 0x50, 0xe9, 0xee, 0x43, 0x3d, 0xba,
+  0x58, 0x19, 0x6f, 0x50, 0xa9, 0xd1, 0x7a, 0x2d, 0x7b, 0x6d, 0x2a, 0x0e, 0x9e, 0xb9, 0x2d, 0x94,
+  0xa6, 0x4e, 0x5b, 0x1c, 0x2d, 0xe1, 0xb3, 0x73, 0x67, 0xda, 0xe1, 0x88, 0xb4, 0xbb, 0xce, 0x21,
+  0xfb, 0x82, 0xaa, 0xe0, 0x88, 0xe4, 0x62, 0xce, 0xba, 0xad, 0xee, 0x88, 0x94, 0x87, 0xce, 0xba,
+  0x2d, 0xec, 0x88, 0xa4, 0xab, 0xce, 0xba, 0x8d, 0xe9, 0x88, 0x24, 0xc0, 0x56, 0x04, 0x3c, 0x9a,
+  0x3a, 0x3a, 0xbb, 0xaa, 0x56, 0x10, 0x7c, 0x24, 0xa3, 0x5a, 0x7d, 0x7f, 0xe0, 0xef, 0xfa, 0x8e,
+  0xd6, 0xf4, 0xda, 0xbb, 0x52, 0x33, 0x63, 0x42, 0x6a, 0xde, 0xcc, 0xe1, 0xe8, 0xd2, 0x30, 0x0d,
+  0xc2, 0x99, 0xcc, 0x44, 0x82, 0x60, 0xcd, 0x11, 0x50, 0x4b, 0x32, 0x30, 0xac, 0x5d, 0xbe, 0xa7,
+  0x36, 0x92, 0xc0, 0xf2, 0x90, 0x82, 0x09, 0x2c, 0xaa, 0x5a, 0x80, 0x53, 0x90, 0x4b, 0x02, 0xb7,
+  0xd6, 0x55, 0xe5, 0x02, 0x53, 0xf0, 0x64, 0xeb, 0xd5, 0x1d, 0xfa, 0xbf, 0xb5, 0x03, 0x54, 0xcc,
+  0xa1, 0xe4, 0x11, 0x55, 0x95, 0x98, 0x93, 0x02, 0x30, 0xc5, 0x84, 0x9e, 0x0c, 0x05, 0x10, 0x33,
+  0x63, 0x0a, 0x3d, 0x4c, 0x66, 0xb3, 0x24, 0x7e, 0x49, 0x47, 0x5c, 0x33, 0xb1, 0x70, 0xc6, 0x98,
+  0x1f, 0x87, 0x33, 0x5f, 0x5c, 0x56, 0x8e, 0x31, 0x9e, 0x2d, 0x7a, 0x0b, 0x5e, 0xd8, 0x1c, 0xa0,
+  0xc2, 0xf3, 0xe0, 0x80, 0xdc, 0x6a, 0xfe, 0x76, 0xe6, 0x87, 0xb4, 0xd0, 0xf8, 0x30, 0x9b, 0x83,
+  0x43, 0xf0, 0x1a, 0xd1, 0x0c, 0x2c, 0x72, 0x47, 0xfd, 0x21, 0xa7, 0xf6, 0x59, 0x2c, 0x91, 0x39,
+  0x74, 0xfd, 0xb7, 0xb3, 0xc5, 0xbf, 0x62, 0x4c, 0x45, 0xe0, 0xf0, 0x70, 0x39, 0x63, 0xf3, 0x68,
+  0x31, 0x09, 0x31, 0x1b, 0xd8, 0x67, 0xa6, 0xdc, 0x08, 0x4c, 0x08, 0x8d, 0x2f, 0x54, 0x46, 0x31,
+  0x03, 0x83, 0x31, 0xbc, 0xd9, 0xe2, 0x40, 0x9b, 0xda, 0xce, 0xfd, 0xf8, 0xc0, 0x98, 0xe9, 0x8a,
+  0x8d, 0x8f, 0x3a, 0xf7, 0xfc, 0x1f, 0xc1, 0xd4, 0xa5, 0x53, 0x7a, 0x19, 0x8e, 0xc3, 0x20, 0x05,
+  0x97, 0x02, 0xc3, 0xd9, 0x51, 0xce, 0xc3, 0xcd, 0xf2, 0x9f, 0x24, 0x7e, 0xe5, 0xc7, 0x74, 0xd5,
+  0x55, 0xf3, 0x33, 0x6d, 0x02, 0xb8, 0x2e, 0xcf, 0xc5, 0xe9, 0xad, 0xcb, 0x8f, 0x0f, 0x67, 0xae,
+  0xa8, 0x11, 0x58, 0x93, 0x24, 0xca, 0xc3, 0xb9, 0x2b, 0x98, 0x29, 0x82, 0xc1, 0x55, 0x54, 0x09,
+  0x9a, 0x89, 0x36, 0x0f, 0x44, 0xcc, 0x28, 0x6b, 0xe2, 0x7a, 0xdf, 0xe7, 0xcb, 0x03, 0xd4, 0x12,
+  0xbc, 0x82, 0xfd, 0xba, 0x65, 0x43, 0xe7, 0x21, 0xb1, 0xa6, 0x83, 0x2b, 0xb7, 0x8e, 0x01, 0x71,
+  0xbd, 0x55, 0xae, 0x48, 0x5d, 0x1d, 0x8c, 0xa8, 0x35, 0x8a, 0xcd, 0x2c, 0x08, 0xa7, 0x0e, 0x6f,
+  0x70, 0xa6, 0x93, 0x35, 0x09, 0x7f, 0x4b, 0x14, 0x4d, 0xb3, 0x9f, 0xcc, 0xbd, 0x74, 0x67, 0x61,
+  0x5c, 0x7d, 0xe7, 0x5f, 0xae, 0xe0, 0x06, 0xa3, 0xa9, 0xe0, 0x36, 0x06, 0xb7, 0x95, 0x6c, 0x95,
+  0xe1, 0x55, 0x92, 0xb9, 0xab, 0x2a, 0xdd, 0xb3, 0x54, 0xae, 0xac, 0x9f, 0x8c, 0x5d, 0x4c, 0x83,
+  0x20, 0x42, 0x95, 0x36, 0x34, 0xd3, 0x14, 0xc8, 0x1c, 0x6c, 0xe4, 0x74, 0x05, 0x8c, 0x55, 0x7f,
+  0x93, 0x18, 0x1b, 0x6e, 0xa9, 0x86, 0xde, 0x46, 0x45, 0x6f, 0xa0, 0xa3, 0xcc, 0x46, 0x60, 0x6d,
+  0x2d, 0xa5, 0x9b, 0x66, 0x6e, 0xa8, 0xa6, 0xd3, 0xe4, 0x82, 0x2e, 0xa8, 0x79, 0x44, 0x3b, 0x28,
+  0x9a, 0xad, 0x2f, 0xaf, 0xc5, 0xc8, 0xcd, 0x7f, 0x27, 0x35, 0xbe, 0xa7, 0xff, 0x15, 0x75, 0xe5,
+  0x78, 0x85, 0x4a, 0x5f, 0x6a, 0xe6, 0x1a, 0xf7, 0x5f, 0x0c, 0x3f, 0x66, 0xc6, 0x1b, 0x26, 0xb7,
+  0xc2, 0xa8, 0xa1, 0xdc, 0xb0, 0xa8, 0xb8, 0x87, 0x09, 0xe1, 0xc5, 0x36, 0x26, 0xd6, 0x70, 0xfe,
+  0x04, 0x2d, 0x96, 0xc2, 0xd8, 0x92, 0xb1, 0x17, 0x49, 0x9c, 0x38, 0xb8, 0xc1, 0x22, 0x4e, 0xc0,
+  0x53, 0x1b, 0xe2, 0x4c, 0x44, 0x5c, 0x4b, 0x24, 0x16, 0x4c, 0x55, 0x57, 0xf0, 0x2f, 0xdf, 0x62,
+  0xc1, 0x27, 0xe1, 0x2c, 0x04, 0x6a, 0x3b, 0xe5, 0x8f, 0xaf, 0x93, 0x5c, 0x8c, 0x6c, 0x1d, 0xa6,
+  0x75, 0xd2, 0xe2, 0x19, 0xb3, 0x52, 0x1e, 0xd0, 0x54, 0x4a, 0xb0, 0xda, 0x0d, 0xbc, 0x51, 0xdf,
+  0x77, 0x60, 0xa2, 0x75, 0xaf, 0xd4, 0xd2, 0x57, 0xf6, 0xfa, 0x56, 0x2b, 0x79, 0xd3, 0x9a, 0x6d,
+  0xca, 0x58, 0x11, 0x77, 0xa5, 0xd0, 0xb6, 0xbe, 0xb2, 0x08, 0x93, 0x4e, 0x7a, 0x6e, 0xd6, 0xae,
+  0x41, 0x28, 0x70, 0xa7, 0x85, 0xdf, 0xf0, 0x98, 0x42, 0x70, 0x99, 0x37, 0x1d, 0x6f, 0xe4, 0xb4,
+  0xb6, 0x44, 0x1b, 0xe3, 0x6e, 0x21, 0x28, 0x1a, 0x73, 0xc7, 0x0a, 0x5b, 0x03, 0x1a, 0xe8, 0x23,
+  0x57, 0xb4, 0xbb, 0x4f, 0xec, 0xb4, 0xc1, 0x77, 0xd0, 0xd9, 0xf0, 0x97, 0xe0, 0x4c, 0x7c, 0x07,
+  0xd4, 0x6f, 0xf9, 0xc6, 0x93, 0x02, 0x95, 0x76, 0xb8, 0xd0, 0xf6, 0xa9, 0xc7, 0xb2, 0x62, 0xc2,
+  0xe1, 0xdc, 0xd2, 0xb2, 0xf5, 0xca, 0x6f, 0xd5, 0xab, 0x06, 0x3a, 0x7b, 0x2d, 0x47, 0x52, 0xf8,
+  0x81, 0x4e, 0x4b, 0x33, 0x6f, 0x8b, 0x5f, 0x92, 0xf8, 0x9a, 0x27, 0xf1, 0x45, 0x0b, 0x04, 0x13,
+  0xda, 0x8c, 0xb7, 0xba, 0xdb, 0xa3, 0xb5, 0xc1, 0xa8, 0xe2, 0x3e, 0x14, 0x3c, 0xf2, 0xcb, 0x9c,
+  0x88, 0xcb, 0x5a, 0x1e, 0x85, 0x17, 0x5d, 0xcb, 0xa3, 0x9e, 0xbc, 0xbc, 0xb3, 0x83, 0x2c, 0xde,
+  0x2d, 0x8f, 0xea, 0x2e, 0x27, 0x67, 0x6b, 0x89, 0x1c, 0x69, 0x6a, 0x50, 0x92, 0x4e, 0xd7, 0x1d,
+  0xac, 0x2a, 0x9b, 0xc3, 0x3f, 0xf1, 0x33, 0x00, 0x7f, 0xd7, 0xdf, 0xea, 0xbd, 0x5f, 0xcd, 0x8e,
+  0xb7, 0x9a, 0x1d, 0x31, 0x2d, 0xb8, 0x6b, 0x76, 0xb6, 0x18, 0x8f, 0x34, 0x94, 0x07, 0x46, 0x43,
+  0x56, 0x22, 0x0b, 0xc1, 0x52, 0x61, 0xe1, 0x9d, 0x22, 0x77, 0xad, 0x4a, 0xc5, 0xf5, 0x47, 0x4b,
+  0x8b, 0xc6, 0x1b, 0x93, 0x6e, 0x53, 0xf4, 0x5a, 0x32, 0x30, 0xee, 0x2d, 0x42, 0x85, 0x5c, 0xa2,
+  0xdc, 0x28, 0x8d, 0xdb, 0xb6, 0xd4, 0xde, 0x56, 0x7f, 0x2d, 0xc5, 0x59, 0x9f, 0x2f, 0x7e, 0x4f,
+  0xd3, 0x9d, 0xf3, 0xb5, 0x5a, 0x7a, 0x2f, 0xd5, 0xce, 0xb8, 0x25, 0xcc, 0xed, 0xed, 0xef, 0x9f,
+  0x9d, 0x55, 0x98, 0xdb, 0x88, 0x35, 0x6f, 0xcb, 0x2b, 0x8b, 0x8c, 0x78, 0x79, 0x2f, 0x78, 0x12,
+  0xbe, 0x82, 0x36, 0xee, 0xb8, 0xae, 0x6b, 0xcc, 0xe1, 0xd4, 0x80, 0x51, 0x9d, 0x41, 0x55, 0x81,
+  0xa5, 0xcf, 0x51, 0xb8, 0x2e, 0xc2, 0xf9, 0x28, 0x0d, 0xdb, 0x55, 0x1b, 0xf7, 0xbb, 0xce, 0xb8,
+  0x3b, 0xf0, 0x06, 0x4e, 0x45, 0x0a, 0x62, 0x50, 0xaa, 0x4a, 0x81, 0xb6, 0x3f, 0xdb, 0x84, 0x35,
+  0xba, 0x52, 0x6f, 0x03, 0x2f, 0xf0, 0x51, 0xef, 0x74, 0x8f, 0xc1, 0x8f, 0x22, 0x2c, 0x3e, 0x3b,
+  0x28, 0x39, 0x4f, 0xd4, 0x34, 0x02, 0x73, 0x98, 0x5f, 0x96, 0x96, 0x4f, 0xb5, 0x0d, 0x18, 0x30,
+  0x47, 0xe7, 0xe7, 0x00, 0x8f, 0x10, 0xce, 0x15, 0x83, 0x93, 0x5b, 0xc8, 0x1d, 0x97, 0x57, 0xed,
+  0x5f, 0xb4, 0x75, 0xdc, 0x92, 0xf3, 0xab, 0x96, 0x55, 0x4a, 0xaf, 0x99, 0x29, 0x8f, 0x2a, 0x59,
+  0xfa, 0xb0, 0x55, 0xc5, 0x2a, 0x4b, 0x58, 0x71, 0xfd, 0x8d, 0x1a, 0x50, 0xe8, 0x7f, 0x2d, 0x87,
+  0x6d, 0x42, 0x56, 0x6f, 0x04, 0x8d, 0x64, 0x8f, 0x91, 0x26, 0xd6, 0xc0, 0x73, 0x65, 0xd4, 0xc0,
+  0xdf, 0x61, 0x20, 0x03, 0x97, 0x44, 0xde, 0xbd, 0x2f, 0xa1, 0x5c, 0x9b, 0x72, 0xb9, 0xde, 0xaa,
+  0xb6, 0x91, 0x6a, 0x9e, 0x0f, 0xec, 0xf7, 0x9f, 0x75, 0xce, 0xe9, 0xeb, 0xf5, 0x81, 0x78, 0x4b,
+  0x6b, 0xed, 0x23, 0xf7, 0x8a, 0xd6, 0x1f, 0x69, 0x21, 0xed, 0x1b, 0xa6, 0xbf, 0x07, 0xbf, 0xf8,
+  0xdb, 0xf0, 0x32, 0x18, 0xe1, 0x92, 0x2c, 0xe8, 0xca, 0xdf, 0xff, 0xed, 0xdf, 0x9d, 0xeb, 0xbf,
+  0xfd, 0xd7, 0xe3, 0x0f, 0xeb, 0xb8, 0xab, 0x6a, 0xe3, 0x88, 0xb1, 0xb5, 0x6a, 0xb5, 0x4b, 0xa4,
+  0xc0, 0xef, 0xd2, 0x25, 0x52, 0xeb, 0x22, 0xc2, 0xb6, 0x3c, 0xfb, 0xe4, 0x6c, 0xd5, 0x5b, 0x15,
+  0xd9, 0x25, 0x36, 0x19, 0x1b, 0xbc, 0x81, 0xb4, 0x21, 0x7a, 0xa0, 0xa3, 0xc6, 0x51, 0x31, 0x62,
+  0xa9, 0x78, 0x1e, 0x57, 0x75, 0xbf, 0x2c, 0x98, 0xa0, 0x28, 0xf4, 0x8e, 0x57, 0xa1, 0x21, 0x9a,
+  0xd6, 0x08, 0xc2, 0x51, 0xab, 0x75, 0x70, 0x31, 0x9e, 0x16, 0xc6, 0x90, 0x6a, 0xbf, 0x55, 0x28,
+  0x46, 0xb9, 0x83, 0xac, 0xc6, 0xef, 0xba, 0x9d, 0x96, 0xd9, 0xa0, 0x3f, 0x83, 0x3d, 0xfc, 0xf5,
+  0x9b, 0x43, 0x5c, 0x88, 0x1b, 0x82, 0xe2, 0x57, 0x84, 0x3d, 0x32, 0x45, 0x5d, 0x67, 0xea, 0x4a,
+  0x2d, 0x67, 0x71, 0x7d, 0x87, 0xa5, 0x7a, 0x76, 0x36, 0xb2, 0x0f, 0x36, 0x7e, 0x71, 0xed, 0x76,
+  0x3d, 0xbb, 0x71, 0xfd, 0xec, 0xd3, 0x87, 0x43, 0xeb, 0x00, 0x30, 0xd7, 0x22, 0xb9, 0xb4, 0x93,
+  0xfd, 0x9d, 0x51, 0x69, 0xbe, 0x75, 0x5e, 0x83, 0x81, 0x5f, 0x25, 0x88, 0x32, 0x5d, 0x0c, 0xe0,
+  0xce, 0xc1, 0x50, 0x91, 0x9d, 0x6a, 0x01, 0x93, 0xf7, 0x91, 0xcb, 0xbf, 0xfd, 0x3f, 0xdc, 0x9e,
+  0xa7, 0xec, 0x94, 0xd7, 0xba, 0x66, 0x1f, 0x7f, 0xf8, 0x60, 0xc3, 0xc5, 0xf2, 0x2c, 0xd8, 0x8f,
+  0x5f, 0xbe, 0xc2, 0x4a, 0x25, 0x06, 0x0d, 0x0b, 0x81, 0xa6, 0x2d, 0x2e, 0x6d, 0x72, 0x2c, 0xc8,
+  0x3a, 0xac, 0x29, 0x03, 0xd4, 0x4e, 0x99, 0x8e, 0x58, 0xd5, 0x6c, 0x56, 0x23, 0xe2, 0x75, 0xa4,
+  0x64, 0xc4, 0xda, 0xa9, 0xd1, 0x90, 0xa8, 0xd4, 0xd8, 0x1b, 0x99, 0xe6, 0xd2, 0x1e, 0xd7, 0xd5,
+  0xc6, 0x59, 0x43, 0xf8, 0xa2, 0x33, 0x56, 0x33, 0x85, 0x2b, 0x9f, 0xbb, 0xd6, 0x9a, 0x6b, 0x6b,
+  0x7f, 0xc7, 0x8d, 0xdb, 0xba, 0xb9, 0xee, 0x08, 0xf3, 0x2c, 0x9c, 0xcf, 0xc2, 0xce, 0xd6, 0xd9,
+  0xc6, 0x62, 0x1d, 0xcb, 0x88, 0xf6, 0x97, 0x0c, 0x25, 0xb4, 0xd4, 0xb5, 0xcd, 0x79, 0x2d, 0xae,
+  0xee, 0xfc, 0xe9, 0x99, 0xd7, 0x95, 0x0b, 0xcf, 0xc3, 0x54, 0x78, 0x46, 0xff, 0xe6, 0x77, 0xbb,
+  0x63, 0x5a, 0x29, 0x63, 0x72, 0x4c, 0xea, 0x75, 0xb6, 0xfa, 0x83, 0x2d, 0x18, 0x99, 0xf0, 0xf0,
+  0xad, 0x63, 0xaf, 0x95, 0x5c, 0xd2, 0xc1, 0xcc, 0xb4, 0x74, 0x38, 0xe5, 0xe7, 0xaa, 0x56, 0xd1,
+  0x67, 0x2a, 0xf5, 0x1a, 0x8f, 0xfb, 0xfd, 0xc1, 0x60, 0xb3, 0x7a, 0x89, 0xfe, 0xfa, 0x33, 0x56,
+  0x48, 0xb7, 0x28, 0x95, 0x2a, 0x89, 0x49, 0xfc, 0x46, 0x55, 0xfa, 0x01, 0x5b, 0x88, 0xbd, 0x5a,
+  0xcc, 0xe6, 0x3f, 0xaf, 0x02, 0xe2, 0xf9, 0x2a, 0x7b, 0xad, 0x44, 0x34, 0x67, 0xa3, 0x5a, 0x3d,
+  0xff, 0xae, 0xcb, 0x46, 0xc1, 0xcc, 0x8f, 0x57, 0xc6, 0xb3, 0xbe, 0x70, 0xb5, 0xc2, 0xb8, 0x6b,
+  0xaf, 0x95, 0xf0, 0x2a, 0x36, 0xac, 0xd5, 0xce, 0x2f, 0xa5, 0x56, 0x3b, 0x37, 0xad, 0xd5, 0xa6,
+  0x53, 0x66, 0xe9, 0xef, 0x96, 0xc2, 0xd9, 0x14, 0xd0, 0x36, 0xfd, 0x43, 0x19, 0x29, 0x2f, 0xdc,
+  0x98, 0x2b, 0xd3, 0x11, 0xa3, 0x83, 0x3a, 0xf2, 0x9c, 0xce, 0x9e, 0xee, 0xed, 0xd8, 0xc2, 0xe1,
+  0x5a, 0x40, 0x5c, 0x79, 0x80, 0x37, 0x8e, 0x82, 0x9b, 0x74, 0x85, 0x9f, 0x78, 0xc0, 0x9a, 0xe7,
+  0xad, 0xfa, 0xb9, 0xf1, 0xcc, 0x47, 0xc7, 0xe7, 0x9d, 0x83, 0x47, 0x5f, 0xa0, 0xe5, 0xf9, 0x1f,
+  0xcc, 0xe8, 0xee, 0x88, 0xde, 0xaa, 0x99, 0x23, 0x69, 0x71, 0xf1, 0xd1, 0x18, 0x52, 0x1c, 0x31,
+  0x2e, 0x3a, 0xce, 0xfb, 0x1a, 0xc7, 0x00, 0x8a, 0x79, 0x77, 0xfe, 0x1e, 0x97, 0xfc, 0x1d, 0x67,
+  0x89, 0x8f, 0xa0, 0x57, 0xa1, 0x3e, 0xda, 0x5d, 0xf5, 0x24, 0xb6, 0xbe, 0x40, 0xc8, 0xa3, 0x76,
+  0xad, 0xf8, 0x17, 0xeb, 0xfc, 0x43, 0x53, 0x43, 0x7f, 0xb1, 0x36, 0x36, 0x77, 0x3a, 0xcb, 0x2e,
+  0x34, 0xdf, 0x07, 0x57, 0x72, 0x6f, 0x8a, 0xed, 0x08, 0xf4, 0x1b, 0xbd, 0xec, 0x8a, 0xcf, 0x51,
+  0xf8, 0x86, 0xd4, 0xa4, 0x34, 0x15, 0xaf, 0xb8, 0xa9, 0x42, 0xc3, 0x70, 0x83, 0x20, 0xa9, 0x18,
+  0xf6, 0x69, 0x4a, 0x56, 0x3f, 0x8f, 0x40, 0x73, 0x31, 0xa3, 0x0d, 0x57, 0x25, 0xe9, 0x19, 0xc8,
+  0x67, 0x1a, 0x4e, 0xe5, 0x8f, 0x51, 0xa1, 0x7d, 0xd2, 0x80, 0xcb, 0x67, 0xb0, 0x7a, 0xc5, 0xe3,
+  0x4e, 0x55, 0xf5, 0x44, 0xf9, 0xe7, 0xfa, 0xf6, 0x4f, 0xdc, 0xd4, 0x98, 0xbd, 0xd3, 0x04, 0xc1,
+  0x6b, 0xf1, 0xfe, 0x1b, 0xb7, 0xec, 0xf0, 0x57, 0x42, 0x23, 0x4a, 0x2a, 0x75, 0x73, 0x11, 0x2c,
+  0x08, 0xcc, 0xd3, 0xcb, 0x98, 0x2c, 0xd3, 0x4b, 0x68, 0xba, 0xb2, 0x4c, 0x6c, 0x93, 0x1f, 0xd1,
+  0xdc, 0x77, 0xd3, 0x72, 0xd5, 0x60, 0x94, 0xdc, 0xe5, 0xc1, 0x67, 0x7d, 0x4b, 0xdc, 0x48, 0xcd,
+  0xdd, 0x3f, 0xac, 0x52, 0xb9, 0xc3, 0x19, 0x60, 0xa9, 0xcf, 0xff, 0xfa, 0x35, 0xc5, 0x4e, 0x2c,
+  0x89, 0x49, 0x20, 0xbc, 0x42, 0xbf, 0xe3, 0xc1, 0x74, 0xe5, 0xe7, 0x6e, 0x15, 0xae, 0xe1, 0x96,
+  0xbe, 0x2e, 0xa2, 0xad, 0x2a, 0x69, 0x56, 0x41, 0x3d, 0xd6, 0x95, 0x85, 0xad, 0xcb, 0xb5, 0x4f,
+  0x96, 0x5a, 0x65, 0x9c, 0x69, 0xf6, 0xe8, 0xf0, 0xde, 0x97, 0x6b, 0xde, 0x9a, 0x39, 0x1f, 0xb3,
+  0x4e, 0xfa, 0xf4, 0xfd, 0x49, 0x7c, 0x2d, 0x5b, 0xec, 0x50, 0x1a, 0x69, 0x5b, 0xf5, 0x8a, 0x55,
+  0x4c, 0xb0, 0x35, 0x5f, 0x15, 0x01, 0x3c, 0xfc, 0xa5, 0x4d, 0x01, 0xab, 0xc7, 0x0a, 0xe3, 0xe4,
+  0xc2, 0x38, 0x07, 0x21, 0xb7, 0xa3, 0xe1, 0xfb, 0x76, 0xe5, 0x10, 0xe7, 0x03, 0xd6, 0xc7, 0x9d,
+  0xa7, 0x92, 0x0a, 0xdb, 0xde, 0x66, 0xcf, 0x61, 0x42, 0xc8, 0x32, 0xdc, 0xd7, 0x17, 0xa4, 0x01,
+  0xa3, 0x6c, 0x27, 0xac, 0xd9, 0xcf, 0x5a, 0x2c, 0x99, 0xd1, 0xf2, 0x3a, 0x03, 0xb4, 0x69, 0xb2,
+  0x18, 0x05, 0x30, 0xc0, 0x05, 0x39, 0xb8, 0x3d, 0x51, 0x84, 0x27, 0x1f, 0x2a, 0xa7, 0x43, 0xa1,
+  0x40, 0xed, 0xa0, 0xc4, 0x70, 0x91, 0xf3, 0x83, 0x11, 0x9c, 0x8f, 0x72, 0xa6, 0x83, 0x3f, 0xb0,
+  0x9d, 0x8e, 0x3a, 0xd5, 0x71, 0x0f, 0xb7, 0x88, 0xe0, 0xe9, 0xc8, 0x66, 0xfd, 0xfe, 0xf5, 0xaf,
+  0xbf, 0xae, 0xd9, 0xc0, 0xfe, 0x40, 0x14, 0x25, 0xed, 0x82, 0x85, 0x44, 0x36, 0x0d, 0xc7, 0xb9,
+  0xdc, 0x0d, 0x21, 0xbf, 0x63, 0x6a, 0x00, 0xf5, 0x45, 0xbd, 0x05, 0xb9, 0xd8, 0xc1, 0x31, 0x87,
+  0x42, 0x15, 0x1c, 0xf3, 0x29, 0xd4, 0xc1, 0x63, 0x4e, 0x05, 0x1b, 0x86, 0xf1, 0xbe, 0x84, 0x83,
+  0xd9, 0x16, 0x6c, 0x38, 0xc6, 0x7b, 0xb3, 0x1a, 0xa0, 0x29, 0x05, 0x86, 0xf1, 0x89, 0x76, 0x75,
+  0xaa, 0x4f, 0x32, 0x7f, 0x46, 0x79, 0xaa, 0x5a, 0x2d, 0x4e, 0x19, 0x1d, 0xfb, 0x27, 0x61, 0x82,
+  0xec, 0xec, 0x48, 0xa3, 0x64, 0x47, 0x05, 0x13, 0x55, 0xf7, 0x61, 0xc7, 0x4e, 0x4f, 0xe4, 0x6a,
+  0xa8, 0x62, 0x51, 0x84, 0xab, 0xfa, 0x1a, 0xa3, 0x4a, 0x1a, 0xa1, 0x6b, 0xd4, 0x2d, 0x8b, 0x46,
+  0xcc, 0x17, 0xd9, 0x14, 0x7b, 0x08, 0x01, 0x19, 0x1a, 0x41, 0x5f, 0x46, 0xee, 0x74, 0x7e, 0x8a,
+  0x3f, 0xe9, 0xb2, 0x12, 0xf6, 0x0d, 0x3f, 0xf2, 0x62, 0x00, 0xa3, 0xa2, 0x14, 0xb0, 0xbc, 0x3b,
+  0xd5, 0x43, 0x93, 0xf6, 0x08, 0xf0, 0x4f, 0xdd, 0x53, 0x99, 0xa2, 0xca, 0x0e, 0xeb, 0x69, 0xb0,
+  0xde, 0x0a, 0x58, 0xae, 0x65, 0x05, 0x65, 0x91, 0xea, 0x6c, 0x09, 0x27, 0x9e, 0x81, 0xe1, 0xad,
+  0x81, 0xc1, 0xb5, 0xb2, 0x28, 0x03, 0x7f, 0xf2, 0x5b, 0x5c, 0x72, 0x7e, 0x03, 0x8e, 0xbd, 0x1c,
+  0x03, 0xcb, 0x5b, 0x0f, 0x8b, 0xb4, 0x59, 0xe0, 0x0c, 0x95, 0xf3, 0x7d, 0x8a, 0xaf, 0x17, 0x41,
+  0x3c, 0xbc, 0xb2, 0x22, 0x91, 0x9e, 0x0b, 0x24, 0x6e, 0x2a, 0x4f, 0xc5, 0xc5, 0x41, 0x60, 0x70,
+  0x01, 0xc1, 0x51, 0x07, 0x4a, 0x2b, 0xba, 0x6f, 0x62, 0x15, 0x25, 0xc2, 0x20, 0xd3, 0xc5, 0xb5,
+  0x23, 0xde, 0xa5, 0xaa, 0x1d, 0xc3, 0xc4, 0x3b, 0x13, 0x31, 0x9a, 0x5a, 0x24, 0xd9, 0x65, 0x4c,
+  0x34, 0xf1, 0xb6, 0x40, 0xbb, 0x67, 0xe9, 0x47, 0x26, 0x0a, 0xed, 0x8b, 0xa6, 0x0f, 0xf5, 0x85,
+  0x61, 0x27, 0x33, 0xb1, 0xe0, 0xcd, 0x69, 0xca, 0xcf, 0x81, 0x2f, 0x43, 0xdb, 0xa9, 0xa0, 0xed,
+  0x54, 0xd1, 0xee, 0x55, 0xfb, 0xa6, 0xc0, 0x12, 0x3f, 0xeb, 0x15, 0x89, 0x77, 0x59, 0xad, 0x75,
+  0x17, 0x39, 0xf4, 0x30, 0x40, 0x83, 0x87, 0x53, 0xfa, 0x68, 0x45, 0xc3, 0x2e, 0x2d, 0x7b, 0x1a,
+  0xdf, 0xb8, 0x7d, 0x8a, 0x81, 0xe5, 0x02, 0x54, 0x8d, 0x39, 0x3c, 0xd4, 0x69, 0x3f, 0x06, 0x05,
+  0x73, 0x33, 0x7e, 0x74, 0x49, 0x9c, 0xa0, 0x0c, 0x9a, 0x79, 0x8b, 0xb6, 0xbc, 0xe3, 0x54, 0x17,
+  0x0f, 0x74, 0xbf, 0xa1, 0xc3, 0xba, 0x4d, 0x27, 0x8e, 0xda, 0xdf, 0x9d, 0x80, 0x3f, 0xf2, 0x19,
+  0x07, 0x3d, 0x9c, 0xa2, 0x78, 0xed, 0x51, 0x38, 0x09, 0xd1, 0xe5, 0x82, 0x59, 0x2f, 0xb0, 0x6c,
+  0xbc, 0xca, 0x02, 0x28, 0x7a, 0xa4, 0xbd, 0x82, 0x11, 0x9f, 0xb3, 0xf4, 0x4e, 0x8d, 0xe8, 0x5a,
+  0xaa, 0x03, 0x23, 0xc7, 0xc1, 0x7b, 0x75, 0x90, 0x68, 0x88, 0x8c, 0x0d, 0xc9, 0x95, 0x71, 0x55,
+  0x25, 0xf8, 0x03, 0x27, 0xa6, 0x68, 0x71, 0x18, 0x19, 0xc7, 0x85, 0xf1, 0x8f, 0x9e, 0xb5, 0x2a,
+  0xa3, 0xd5, 0x3a, 0x5c, 0x82, 0xd1, 0xad, 0x60, 0x80, 0xed, 0x5a, 0x86, 0xe0, 0x55, 0x10, 0xd0,
+  0x98, 0x2d, 0xc3, 0xe8, 0x55, 0x31, 0xbc, 0xe5, 0x18, 0x7d, 0x4b, 0x19, 0x68, 0x97, 0x96, 0xe1,
+  0x0c, 0x2c, 0xa5, 0xac, 0xc2, 0xd9, 0xb1, 0x94, 0x83, 0x76, 0x69, 0x19, 0xce, 0xae, 0xa5, 0x9c,
+  0x55, 0x38, 0x7b, 0x15, 0x1c, 0xd1, 0x39, 0x84, 0x1d, 0x92, 0x2b, 0xf6, 0x7f, 0xf5, 0x00, 0xe4,
+  0xab, 0xaf, 0xc0, 0x3e, 0x26, 0x71, 0xe0, 0xc9, 0x8c, 0xb5, 0x08, 0xf4, 0xae, 0xb7, 0x35, 0xd8,
+  0xda, 0x2d, 0x34, 0x24, 0x1c, 0x51, 0xe4, 0xa8, 0xae, 0x40, 0xdc, 0x10, 0xef, 0xf2, 0xdd, 0x1d,
+  0x48, 0x11, 0x29, 0x4b, 0x9b, 0xa7, 0x74, 0x6f, 0xb5, 0xea, 0x00, 0x24, 0x69, 0x9b, 0xa6, 0xa3,
+  0x2b, 0x91, 0xc8, 0xf8, 0x62, 0xe7, 0xe2, 0x27, 0xa6, 0x76, 0xcb, 0x8b, 0x1c, 0x2b, 0xd5, 0x4f,
+  0xd9, 0xe2, 0x82, 0xc8, 0xce, 0x0a, 0x22, 0x9e, 0x95, 0x08, 0xb7, 0xcc, 0x05, 0x95, 0xc1, 0x0a,
+  0x2a, 0x3d, 0x2b, 0x15, 0x69, 0xaa, 0x0b, 0x3a, 0xfd, 0x15, 0x74, 0xfa, 0x56, 0x3a, 0x64, 0xbc,
+  0x0b, 0x22, 0xbd, 0x15, 0x44, 0x06, 0x56, 0x22, 0x68, 0xca, 0x0b, 0x1a, 0xde, 0x0a, 0x1a, 0x3b,
+  0x35, 0x34, 0x76, 0x34, 0x1a, 0x5d, 0x6e, 0x4f, 0x68, 0xca, 0xa1, 0xed, 0x26, 0xb6, 0x7a, 0xd7,
+  0x96, 0xe3, 0xfd, 0xf2, 0xc8, 0xe9, 0x79, 0xf0, 0x0c, 0x8c, 0x63, 0xf6, 0x70, 0x92, 0x28, 0x0f,
+  0xbf, 0x39, 0x90, 0x4e, 0xbd, 0xf2, 0xec, 0xcd, 0x23, 0xcc, 0xb8, 0x43, 0x9b, 0x66, 0x69, 0x76,
+  0x03, 0x6d, 0x3f, 0x61, 0x5a, 0x14, 0x24, 0x88, 0x15, 0x09, 0x0a, 0x0a, 0x7a, 0x5f, 0xd1, 0x89,
+  0x53, 0xca, 0x50, 0x50, 0xbc, 0x7c, 0x20, 0x0c, 0xa8, 0x3c, 0xce, 0x5f, 0xca, 0x57, 0x02, 0xb6,
+  0xfc, 0x84, 0xc7, 0x18, 0x04, 0xdc, 0xbb, 0x02, 0x57, 0xcd, 0x40, 0x37, 0xb6, 0xe1, 0x45, 0x68,
+  0x62, 0xa8, 0x36, 0x3c, 0xeb, 0x5b, 0x91, 0xf1, 0xac, 0x95, 0x28, 0xf8, 0x70, 0x29, 0xa8, 0x7f,
+  0x29, 0x33, 0xe0, 0xa8, 0x39, 0x65, 0x4b, 0x3f, 0x59, 0xaa, 0x55, 0x94, 0x9a, 0xa7, 0x66, 0xeb,
+  0xf7, 0xb5, 0xf4, 0x81, 0x0b, 0xc3, 0x21, 0x76, 0x53, 0x9b, 0xfb, 0x44, 0x8c, 0xb7, 0xba, 0x86,
+  0x15, 0xef, 0x8d, 0xcc, 0x22, 0x41, 0xfe, 0x96, 0xf2, 0x1b, 0x36, 0xf1, 0x9c, 0xed, 0x39, 0x66,
+  0x75, 0x91, 0x13, 0x59, 0x9c, 0xa1, 0xab, 0x35, 0xdf, 0xba, 0x45, 0xcd, 0x10, 0x53, 0x7f, 0xf0,
+  0xb4, 0x9a, 0x64, 0x00, 0x01, 0xa9, 0x52, 0x80, 0xb8, 0x04, 0x0f, 0x0b, 0x00, 0xeb, 0x56, 0x14,
+  0x40, 0x96, 0x50, 0xee, 0x9d, 0x81, 0xd9, 0xb1, 0xfc, 0x0d, 0xb3, 0xf7, 0x00, 0x74, 0x28, 0x18,
+  0x55, 0xa7, 0xc8, 0xd4, 0xca, 0x4b, 0x78, 0x51, 0x49, 0x33, 0x02, 0xa2, 0x58, 0x9c, 0x14, 0xd5,
+  0x77, 0xfa, 0x53, 0x21, 0x41, 0xa4, 0x53, 0x17, 0x68, 0x41, 0xe4, 0xf2, 0x3b, 0xf3, 0x82, 0x51,
+  0xa1, 0x8f, 0x8a, 0x67, 0x5c, 0x81, 0x2e, 0x7d, 0xa7, 0xaf, 0x7c, 0x7a, 0x62, 0x56, 0x3a, 0x18,
+  0xbd, 0xe2, 0x79, 0xe6, 0x9a, 0x1f, 0x83, 0xab, 0x65, 0x82, 0xd5, 0x7b, 0x23, 0x38, 0x34, 0x7f,
+  0xa6, 0x98, 0x0e, 0x6d, 0x11, 0xf8, 0x36, 0x4a, 0xfc, 0x1c, 0x81, 0x8b, 0xc3, 0xfd, 0x32, 0x1b,
+  0x9b, 0x3c, 0xeb, 0xcc, 0x11, 0xc4, 0x61, 0x6b, 0x24, 0x2d, 0xd3, 0xb8, 0x71, 0x00, 0xe8, 0x46,
+  0x4d, 0x23, 0xad, 0x82, 0xf9, 0x59, 0x44, 0x10, 0xf4, 0x30, 0x9c, 0x0c, 0x26, 0x08, 0x95, 0x53,
+  0x74, 0x45, 0xd2, 0x3c, 0x8e, 0x47, 0xfb, 0x9d, 0xa8, 0xe4, 0x02, 0xd5, 0x00, 0x28, 0x18, 0x93,
+  0x54, 0xc7, 0x98, 0x13, 0xfc, 0x4d, 0x1e, 0xcc, 0xe1, 0x2d, 0x4a, 0xc4, 0x50, 0xea, 0xb2, 0xe4,
+  0xf0, 0x26, 0xb8, 0x26, 0x8e, 0xa3, 0x9a, 0xdc, 0x54, 0xc4, 0x0d, 0x88, 0xe3, 0x27, 0x76, 0x9f,
+  0x39, 0x3c, 0xbb, 0x9d, 0xae, 0x1c, 0xcf, 0x47, 0xd6, 0xcf, 0x5f, 0x4c, 0xee, 0xca, 0x8c, 0xad,
+  0xa1, 0x9d, 0xc8, 0x5d, 0xd9, 0xf2, 0x01, 0x02, 0xb4, 0xd1, 0xda, 0x5a, 0xaa, 0x61, 0xde, 0xac,
+  0xa1, 0x8d, 0xc3, 0xf9, 0xb7, 0x6f, 0x57, 0x5e, 0x85, 0x16, 0x76, 0x0b, 0x4a, 0x1e, 0x5c, 0x01,
+  0x40, 0xeb, 0x82, 0x1b, 0x1c, 0x8c, 0x26, 0x11, 0x99, 0xcb, 0x38, 0xa4, 0xb6, 0x49, 0xae, 0x56,
+  0x27, 0x2c, 0xea, 0xa3, 0xe9, 0xc4, 0x52, 0xa1, 0x8b, 0xf4, 0x72, 0xc4, 0xbe, 0x32, 0x0e, 0x5c,
+  0xea, 0xa5, 0xaa, 0x0b, 0xb5, 0x80, 0xaa, 0xe0, 0x96, 0x0c, 0xda, 0x99, 0x41, 0x19, 0x4f, 0x74,
+  0x30, 0x8d, 0x59, 0xd3, 0xc8, 0x4d, 0x7d, 0x34, 0xb2, 0xf1, 0x04, 0x3e, 0x29, 0xee, 0x2a, 0xe2,
+  0x95, 0xa6, 0x4e, 0x2d, 0x58, 0xa8, 0x33, 0x4a, 0x34, 0x0c, 0x54, 0xb4, 0xcc, 0x66, 0x09, 0xd5,
+  0xc9, 0x1a, 0xf1, 0x93, 0x32, 0x74, 0xf9, 0x67, 0x99, 0x59, 0x52, 0xbb, 0xa2, 0xb3, 0x2d, 0x1c,
+  0x5b, 0xdc, 0x4e, 0xa7, 0x7b, 0x58, 0x92, 0x2c, 0x14, 0x90, 0xca, 0xe8, 0xe5, 0x6a, 0x5f, 0x96,
+  0x43, 0x7c, 0xf2, 0x1e, 0x63, 0x9a, 0xe1, 0x25, 0xc9, 0xd5, 0xc4, 0x3d, 0xc6, 0x45, 0x12, 0x23,
+  0x8e, 0x22, 0xd5, 0x8a, 0xff, 0x72, 0x29, 0x5f, 0xab, 0x2b, 0x0e, 0x47, 0xa2, 0x29, 0xc5, 0x92,
+  0x61, 0x92, 0x7f, 0x16, 0x25, 0xc3, 0x8f, 0xb4, 0x28, 0x41, 0xe7, 0x84, 0xcc, 0xe4, 0x23, 0x9f,
+  0xbc, 0x87, 0x0f, 0x97, 0x15, 0x5d, 0xba, 0x44, 0x46, 0xb2, 0xd0, 0x44, 0xbc, 0x42, 0xad, 0xf1,
+  0xd7, 0x4d, 0xcb, 0x7f, 0x93, 0x0e, 0xb9, 0xb5, 0x18, 0xb9, 0x96, 0x5b, 0x70, 0x0f, 0x4d, 0xc8,
+  0xd7, 0x14, 0xd3, 0xad, 0xe5, 0x56, 0x5d, 0xe1, 0xab, 0x8b, 0x4a, 0x16, 0x80, 0x4b, 0x26, 0xa8,
+  0x30, 0x0e, 0x0e, 0x65, 0xda, 0x6b, 0xc3, 0x82, 0x29, 0x14, 0x28, 0xa9, 0xa5, 0xca, 0xac, 0xd4,
+  0x4d, 0xab, 0x8a, 0x9e, 0x50, 0x69, 0x5d, 0x6c, 0x4c, 0x9d, 0xef, 0x48, 0x73, 0x28, 0x07, 0x74,
+  0x47, 0xdd, 0x12, 0xec, 0x6c, 0x29, 0xfe, 0x8a, 0x60, 0x1d, 0x25, 0x5c, 0x30, 0xc3, 0x6f, 0xa2,
+  0x9b, 0x91, 0xd1, 0x2b, 0x07, 0xdb, 0xac, 0x96, 0x79, 0xa4, 0xd2, 0xd0, 0xa1, 0x92, 0x97, 0xa8,
+  0xb5, 0x2b, 0x44, 0x94, 0xc5, 0xe6, 0x66, 0xc7, 0x39, 0x6b, 0x8f, 0x68, 0x5f, 0x4a, 0xae, 0xef,
+  0xc5, 0x05, 0x3b, 0xf4, 0xb7, 0xff, 0x72, 0x5a, 0x15, 0x59, 0x94, 0xb1, 0x68, 0x99, 0xb0, 0x5c,
+  0x1d, 0xdf, 0x3f, 0xc5, 0xa4, 0x94, 0xa7, 0x51, 0x38, 0x6b, 0x89, 0x34, 0xa8, 0xef, 0x54, 0xd2,
+  0x4a, 0x4a, 0x3f, 0xa2, 0x83, 0x1c, 0x2a, 0x3c, 0x70, 0x03, 0x79, 0xdc, 0x8c, 0x10, 0x3f, 0xeb,
+  0xa8, 0x98, 0xd2, 0xf2, 0xbd, 0x70, 0x29, 0x4d, 0x40, 0x7c, 0x79, 0x68, 0x01, 0x25, 0x97, 0xb2,
+  0x0c, 0xea, 0x5f, 0x5a, 0x40, 0x31, 0xe9, 0x26, 0xe6, 0x2d, 0x72, 0xbb, 0x87, 0xa4, 0xc3, 0x82,
+  0x19, 0x98, 0x4c, 0xd4, 0x31, 0x13, 0xc6, 0x3a, 0x33, 0x1a, 0x60, 0x95, 0x19, 0x0e, 0x2a, 0x99,
+  0x31, 0x40, 0xcb, 0xcc, 0x10, 0x68, 0x0d, 0x33, 0xb2, 0x16, 0x9f, 0x3c, 0xbb, 0x70, 0xd0, 0x90,
+  0x58, 0xe4, 0xc3, 0xc1, 0x6d, 0x22, 0x12, 0x08, 0x65, 0x29, 0x49, 0x84, 0xaa, 0xa0, 0x38, 0xc2,
+  0x0a, 0x59, 0xd9, 0xd9, 0xe3, 0xd9, 0x43, 0x2d, 0x12, 0xab, 0x63, 0x4f, 0x21, 0x94, 0xe5, 0x56,
+  0xc7, 0x9e, 0x44, 0xb0, 0xb3, 0x87, 0x37, 0xe7, 0x9c, 0x66, 0xc3, 0x53, 0x9c, 0x7e, 0x95, 0xf9,
+  0x93, 0xd9, 0x4b, 0x0b, 0xee, 0xca, 0xd0, 0x26, 0x7b, 0x1a, 0xbc, 0x60, 0xae, 0x0a, 0xaf, 0x73,
+  0x57, 0xc0, 0x0b, 0xde, 0x2c, 0x08, 0xf8, 0xc5, 0xc6, 0x2f, 0x25, 0x4b, 0xb5, 0x31, 0xcc, 0x53,
+  0xaa, 0x56, 0x59, 0x56, 0x08, 0x55, 0x9e, 0x15, 0x4a, 0x89, 0x6b, 0x0d, 0xa5, 0xcc, 0xb6, 0x44,
+  0xa9, 0x30, 0x5e, 0xe0, 0x48, 0xce, 0x0b, 0x4b, 0xa6, 0x2e, 0x28, 0x3e, 0xfd, 0xd4, 0x15, 0xac,
+  0xaf, 0xeb, 0xfc, 0xa9, 0x04, 0xce, 0x2a, 0xbf, 0x12, 0x39, 0x4e, 0x9f, 0xd1, 0xdf, 0x90, 0x35,
+  0xad, 0xd0, 0xe7, 0x35, 0x45, 0x08, 0x51, 0x31, 0x0b, 0x04, 0x56, 0x0c, 0x67, 0x25, 0xb2, 0x1e,
+  0x55, 0x90, 0xa2, 0x05, 0xae, 0xad, 0x55, 0xf1, 0x36, 0xae, 0x8a, 0xb7, 0x51, 0x55, 0xbc, 0x95,
+  0x55, 0xf1, 0x56, 0x57, 0xc5, 0xab, 0x54, 0xe5, 0x9e, 0x61, 0xb0, 0x67, 0xc5, 0x46, 0x57, 0xfb,
+  0xc2, 0x81, 0xb2, 0xe5, 0x1a, 0xd2, 0x58, 0x9d, 0xec, 0x1c, 0xcf, 0xf2, 0x6e, 0x69, 0x74, 0x31,
+  0xc6, 0x09, 0x0d, 0x29, 0x55, 0x47, 0x2d, 0x0b, 0x24, 0x7d, 0x04, 0xaa, 0x41, 0x2b, 0x32, 0x95,
+  0x0b, 0x34, 0x3d, 0xc6, 0x5e, 0x87, 0x24, 0x12, 0x9a, 0xc3, 0x3f, 0x75, 0x8b, 0x28, 0x5f, 0xa9,
+  0x93, 0x27, 0x5a, 0xae, 0x56, 0x3b, 0xac, 0x3a, 0x84, 0x42, 0xa5, 0x3d, 0xfb, 0x54, 0x2d, 0x0d,
+  0xac, 0x10, 0x48, 0x0c, 0x78, 0x14, 0x2c, 0x92, 0x59, 0xc2, 0x37, 0x84, 0x71, 0x62, 0xab, 0xd3,
+  0x7c, 0x41, 0xe7, 0xdf, 0x6a, 0x57, 0x01, 0x0a, 0xfe, 0xea, 0x40, 0x5a, 0x96, 0x63, 0x32, 0x54,
+  0xde, 0xc7, 0x1f, 0x2a, 0x05, 0xe2, 0x95, 0x24, 0x46, 0x83, 0x8d, 0xfc, 0x30, 0xba, 0x3a, 0xb5,
+  0xd3, 0xe5, 0x34, 0xa6, 0x15, 0x22, 0xa8, 0xe2, 0x16, 0x22, 0x94, 0xd2, 0xf6, 0x14, 0xb3, 0x48,
+  0x4d, 0x90, 0x22, 0x5e, 0xd5, 0x42, 0xa1, 0x9c, 0x5a, 0x3a, 0x3c, 0xb1, 0x16, 0x1d, 0xb0, 0xd3,
+  0xe5, 0xcd, 0x5f, 0x6b, 0x15, 0x17, 0xab, 0x11, 0x75, 0xed, 0xc3, 0xe1, 0x5b, 0x45, 0xdd, 0xcb,
+  0xfa, 0xb6, 0x88, 0xd1, 0x98, 0xa2, 0x17, 0xe3, 0x8a, 0x67, 0x8d, 0xb8, 0xa8, 0x82, 0xf8, 0x40,
+  0xbc, 0x4e, 0x9d, 0x3a, 0x52, 0x17, 0xe1, 0x38, 0x94, 0x9d, 0x04, 0x9f, 0x4f, 0xb3, 0x70, 0x12,
+  0x43, 0xa5, 0x47, 0x67, 0x2b, 0xd8, 0x35, 0x81, 0x5b, 0x54, 0xcc, 0xe8, 0x91, 0x5e, 0x8e, 0x5e,
+  0x90, 0x76, 0x4f, 0x93, 0xd6, 0x4d, 0xe0, 0x2d, 0xd7, 0x75, 0x93, 0x2b, 0xfd, 0x9a, 0x9f, 0xa2,
+  0x73, 0x20, 0x70, 0x79, 0x95, 0x51, 0x74, 0x92, 0xc7, 0x4e, 0x95, 0x00, 0x5e, 0xd4, 0x23, 0x36,
+  0x7f, 0x5a, 0x09, 0xe0, 0xf7, 0x25, 0xe8, 0x85, 0x46, 0xe8, 0xe8, 0x43, 0x71, 0x5d, 0x0f, 0x21,
+  0xb2, 0xaa, 0x06, 0xc8, 0x3b, 0x72, 0xaa, 0x98, 0x30, 0x86, 0xc0, 0x34, 0x3e, 0xb5, 0xa0, 0x16,
+  0x51, 0xa1, 0xe2, 0xbe, 0xa6, 0x9a, 0xda, 0xca, 0xb2, 0x78, 0x70, 0xce, 0x11, 0x57, 0xdd, 0x10,
+  0xbc, 0xba, 0xd7, 0x06, 0x97, 0xfe, 0x74, 0x96, 0x30, 0x1d, 0x76, 0x7b, 0xda, 0x0e, 0xa5, 0x79,
+  0xf2, 0x8c, 0x85, 0x36, 0x51, 0x1d, 0xb3, 0x16, 0x02, 0x25, 0x59, 0x08, 0xe9, 0xeb, 0x28, 0x73,
+  0x71, 0x63, 0x90, 0x1d, 0x65, 0x48, 0x32, 0xaf, 0x94, 0xc2, 0x05, 0x8d, 0x27, 0x43, 0xca, 0x7a,
+  0x41, 0x78, 0x43, 0x93, 0x3b, 0x91, 0xf0, 0x69, 0x29, 0x77, 0x43, 0x93, 0x3b, 0x89, 0xb2, 0x8c,
+  0xbb, 0xa1, 0xc9, 0x5d, 0x51, 0xca, 0x0a, 0xee, 0x46, 0x26, 0x77, 0x86, 0x1a, 0x58, 0x8a, 0x19,
+  0x99, 0x9c, 0x99, 0x6d, 0xcf, 0xd7, 0x65, 0xcb, 0x08, 0x06, 0x5f, 0x9c, 0x7e, 0x3d, 0x4f, 0xe0,
+  0x34, 0x14, 0x1d, 0x49, 0x28, 0x58, 0x69, 0x67, 0x40, 0xab, 0xaa, 0x59, 0x3c, 0x87, 0x3c, 0x2a,
+  0x8a, 0xb6, 0x3f, 0x41, 0x81, 0x51, 0x70, 0x0d, 0x60, 0x08, 0x20, 0x9f, 0x06, 0xe9, 0x2c, 0xc1,
+  0x01, 0xf3, 0xd4, 0x70, 0x1c, 0xca, 0x7c, 0x78, 0x16, 0x3e, 0xbc, 0x95, 0x7c, 0x78, 0x8a, 0x0f,
+  0xaf, 0x96, 0x0f, 0x6f, 0x19, 0x1f, 0x5e, 0x89, 0x0f, 0x91, 0x14, 0xbf, 0xc2, 0x0b, 0xbc, 0x3f,
+  0x2d, 0xe4, 0x62, 0x61, 0xa5, 0x48, 0xad, 0x8f, 0xa5, 0x09, 0x70, 0x8d, 0xa5, 0x4a, 0x21, 0x5e,
+  0x4d, 0x21, 0xde, 0xaa, 0x42, 0x3c, 0xa3, 0x10, 0xaf, 0x52, 0x88, 0x06, 0x5f, 0x5c, 0xb4, 0x0c,
+  0x73, 0x46, 0xe3, 0xf2, 0x73, 0x89, 0x44, 0xf3, 0xc8, 0x6a, 0x41, 0xea, 0x0a, 0x62, 0x3e, 0xbb,
+  0x09, 0x67, 0x8b, 0xd9, 0xa9, 0xec, 0x80, 0xca, 0x8e, 0xd8, 0xd1, 0xb8, 0x7a, 0xd3, 0xac, 0x63,
+  0x13, 0x34, 0x79, 0x4f, 0xec, 0x92, 0xf2, 0x78, 0x6b, 0x59, 0x8b, 0x54, 0xb8, 0x75, 0x85, 0x6a,
+  0x2d, 0xad, 0x21, 0x17, 0x77, 0x55, 0x9a, 0xf3, 0x8a, 0x6a, 0x31, 0xfa, 0x35, 0x8d, 0x25, 0x57,
+  0xbe, 0x68, 0xdc, 0xc2, 0x90, 0xfa, 0xbe, 0x45, 0xe6, 0xa5, 0xbb, 0x46, 0x2d, 0xf6, 0x77, 0x34,
+  0xe3, 0xd6, 0x7a, 0xd9, 0x2d, 0xed, 0x16, 0xb4, 0xec, 0x8c, 0xd0, 0x2c, 0x37, 0x9c, 0x5b, 0x80,
+  0xa1, 0x26, 0x46, 0x1d, 0x82, 0x58, 0x55, 0x40, 0x0f, 0xba, 0x4c, 0x69, 0xdf, 0x28, 0x0d, 0xe4,
+  0x52, 0x98, 0x19, 0x5d, 0xca, 0x75, 0x8a, 0xa7, 0xc7, 0x24, 0x5d, 0x23, 0x4c, 0xd3, 0xe5, 0x61,
+  0x1a, 0x6b, 0xd0, 0xaa, 0x6b, 0xc7, 0x10, 0x4e, 0xf5, 0xc8, 0x4d, 0xe4, 0xbe, 0x5d, 0xbe, 0xcb,
+  0xb5, 0x06, 0xde, 0xab, 0x85, 0xf7, 0xec, 0xf4, 0xb9, 0xf7, 0x84, 0xdd, 0x9f, 0x98, 0x09, 0x62,
+  0xf2, 0x87, 0x96, 0xf2, 0xe4, 0x2d, 0xc5, 0xf1, 0xf4, 0x54, 0xd4, 0xd9, 0xeb, 0x45, 0x1c, 0xf3,
+  0x8b, 0x7e, 0x2c, 0xdb, 0x82, 0x74, 0x40, 0x4c, 0xe7, 0xc0, 0x01, 0x75, 0xa7, 0x97, 0x07, 0xa9,
+  0x8a, 0x9f, 0xb8, 0x6a, 0x4b, 0x6b, 0x4a, 0xd5, 0x1d, 0x3c, 0xc6, 0x5e, 0x80, 0x64, 0x8e, 0xbb,
+  0x96, 0x39, 0xb1, 0xca, 0x54, 0x84, 0x0e, 0x14, 0xb4, 0xaa, 0x09, 0x1a, 0x25, 0x2b, 0xcf, 0x44,
+  0xd6, 0xc4, 0x23, 0x41, 0xa6, 0x94, 0xea, 0xd0, 0x31, 0x80, 0x1f, 0xf3, 0x61, 0xcd, 0x06, 0x8c,
+  0x23, 0x9e, 0x09, 0x8c, 0xf7, 0xed, 0xe1, 0x3f, 0x16, 0x60, 0x95, 0xbf, 0xb1, 0x5a, 0xa6, 0x99,
+  0xf4, 0xb1, 0xf2, 0x5d, 0xcf, 0x23, 0xa9, 0xed, 0xde, 0x09, 0x22, 0xca, 0x90, 0xb1, 0x64, 0x0e,
+  0x19, 0x02, 0x20, 0x4d, 0x38, 0x54, 0x7c, 0x96, 0xe3, 0xb4, 0x04, 0xae, 0x96, 0xd6, 0x3f, 0x17,
+  0xbd, 0x03, 0x53, 0xfc, 0xb5, 0xe7, 0x8b, 0x28, 0x43, 0x1d, 0x53, 0x8d, 0x56, 0x2a, 0x16, 0x26,
+  0x3b, 0xab, 0x8b, 0xc5, 0x59, 0x95, 0x56, 0x2c, 0xfc, 0x6c, 0x09, 0xdc, 0xba, 0x62, 0xb3, 0x39,
+  0xd9, 0x21, 0xa5, 0x53, 0x66, 0xa9, 0xaf, 0x60, 0x68, 0xc7, 0x86, 0x5b, 0x59, 0x32, 0xf7, 0x9c,
+  0x54, 0x3b, 0x52, 0xf1, 0x12, 0xb9, 0xa5, 0x11, 0x5a, 0x5d, 0x7b, 0xa9, 0xdb, 0xa0, 0xa3, 0x4a,
+  0x69, 0xaa, 0x4c, 0xa1, 0x82, 0xac, 0xc7, 0x54, 0xa1, 0x2f, 0x8a, 0x29, 0x44, 0x6e, 0x69, 0x84,
+  0xd6, 0x95, 0x0d, 0xe7, 0x49, 0xe8, 0x66, 0x95, 0xa7, 0x27, 0xd3, 0x8b, 0xf5, 0x58, 0x22, 0xad,
+  0x34, 0x38, 0x02, 0xd4, 0x56, 0x41, 0x65, 0x43, 0x21, 0x81, 0xfe, 0x97, 0xe7, 0x29, 0x21, 0xde,
+  0x93, 0xc3, 0x4f, 0x62, 0xba, 0x11, 0x68, 0x39, 0x58, 0x66, 0xf8, 0x99, 0xc9, 0x7e, 0x5a, 0x9d,
+  0x42, 0xe1, 0xaa, 0x1a, 0xdf, 0x24, 0xcd, 0xd7, 0xaf, 0xf8, 0xee, 0xb3, 0x65, 0x9b, 0xcf, 0x5a,
+  0x96, 0xe5, 0x76, 0x24, 0x65, 0x2c, 0xb6, 0x6f, 0xb6, 0xb4, 0x1d, 0xd8, 0x56, 0xa9, 0x2a, 0xcb,
+  0xee, 0xe4, 0xb4, 0x9c, 0x63, 0x58, 0x46, 0xac, 0x14, 0x35, 0xcf, 0xf5, 0xe8, 0xfb, 0x57, 0x61,
+  0xf6, 0x9d, 0xff, 0x1d, 0x00, 0xb4, 0x60, 0xca, 0xa7, 0xaf, 0x7a, 0xda, 0xa6, 0xe3, 0xc6, 0x95,
+  0x3b, 0xe4, 0xba, 0xde, 0x8a, 0xb0, 0x67, 0x10, 0xd6, 0x64, 0x83, 0xf7, 0xd8, 0xd2, 0x6a, 0x39,
+  0x1f, 0xb9, 0x49, 0x36, 0xe6, 0x42, 0x66, 0x79, 0x77, 0xbc, 0xd8, 0x2c, 0x18, 0x62, 0xe6, 0x5b,
+  0x11, 0xde, 0x43, 0x38, 0xb5, 0x0b, 0x00, 0xbf, 0x40, 0x53, 0x2e, 0x5d, 0x86, 0x93, 0xc9, 0xff,
+  0x8b, 0x45, 0x60, 0x1d, 0xfa, 0x3e, 0x67, 0xa6, 0x28, 0x0c, 0xb9, 0x7c, 0x13, 0x7e, 0x42, 0x03,
+  0x2f, 0x43, 0x52, 0x58, 0x44, 0xc7, 0x1d, 0x20, 0x8c, 0x22, 0xa2, 0xcd, 0x9f, 0xc5, 0xbb, 0x6d,
+  0x85, 0x8a, 0x39, 0xef, 0xe5, 0x73, 0x15, 0x09, 0x3c, 0xac, 0xa6, 0x88, 0x98, 0x6d, 0x89, 0x37,
+  0x61, 0xdc, 0x14, 0x11, 0x32, 0xb9, 0x6c, 0xca, 0xdd, 0xcf, 0xd2, 0xe2, 0xec, 0xfd, 0xd2, 0x92,
+  0xaa, 0x27, 0xd2, 0xe9, 0x5b, 0x16, 0xdf, 0x8d, 0xc5, 0x4b, 0xf0, 0x1c, 0x9e, 0xe3, 0x55, 0x46,
+  0xb4, 0x4c, 0xbb, 0xce, 0x72, 0xfb, 0xf2, 0x46, 0x29, 0x71, 0xa5, 0x29, 0x41, 0x9d, 0x76, 0x9b,
+  0x25, 0xb4, 0xf8, 0x62, 0xb2, 0xd1, 0xf5, 0x6c, 0x0b, 0xc8, 0x35, 0x2b, 0xb3, 0xbc, 0x76, 0xa5,
+  0x3b, 0x02, 0xfc, 0x79, 0xf8, 0x0a, 0x3c, 0xaf, 0xe6, 0xdc, 0xbf, 0xc2, 0xa4, 0xe2, 0xc6, 0x9d,
+  0x2c, 0x4b, 0xaf, 0x05, 0xc8, 0xe8, 0xae, 0x41, 0x1e, 0x1c, 0x9d, 0x05, 0xf9, 0x34, 0xc1, 0x1d,
+  0xa2, 0x78, 0x87, 0x0f, 0xbc, 0xe5, 0x77, 0xa8, 0xd2, 0xe9, 0x3d, 0x47, 0x74, 0xc5, 0xf6, 0x5b,
+  0xf0, 0xbf, 0xe8, 0x32, 0xb1, 0xf9, 0x3c, 0x0a, 0xf9, 0x6d, 0x42, 0xdb, 0x3f, 0x66, 0x49, 0xec,
+  0x60, 0x66, 0x3c, 0x3c, 0x2e, 0x77, 0x50, 0xbe, 0x50, 0x46, 0xb2, 0xa4, 0xf2, 0x0a, 0x18, 0x57,
+  0x0f, 0xe4, 0xd3, 0x14, 0x46, 0x52, 0xb4, 0x35, 0x74, 0xbf, 0x50, 0xd3, 0x79, 0xf6, 0xf6, 0xed,
+  0x2b, 0x86, 0x17, 0xef, 0x20, 0x04, 0xf7, 0x2f, 0xac, 0x35, 0xd6, 0x2e, 0xc2, 0x35, 0x77, 0xa0,
+  0xf0, 0xcb, 0x6f, 0x78, 0x7d, 0xa5, 0x58, 0x3e, 0x33, 0x09, 0xb3, 0x08, 0x0e, 0xc4, 0xd1, 0x1c,
+  0xda, 0x25, 0x8c, 0x2c, 0x69, 0x17, 0x1d, 0x39, 0x78, 0xb9, 0x12, 0x16, 0x4e, 0x5a, 0xc4, 0x4f,
+  0xc9, 0x68, 0xc9, 0xdc, 0x0d, 0xc0, 0xff, 0x20, 0xc0, 0xc0, 0x9d, 0x81, 0xbf, 0xe5, 0x4f, 0x02,
+  0x79, 0xb1, 0x05, 0x5f, 0xdb, 0xb7, 0x31, 0xcb, 0xfd, 0x3c, 0x62, 0x24, 0x58, 0x9b, 0x57, 0xd2,
+  0xae, 0xe7, 0x71, 0x5e, 0xd9, 0xba, 0xd3, 0xfa, 0x09, 0x59, 0x7f, 0xf8, 0xb0, 0xa9, 0xee, 0x63,
+  0xb2, 0xdc, 0x49, 0x94, 0x71, 0x45, 0xe5, 0x83, 0x89, 0xcc, 0x69, 0xd2, 0x31, 0xef, 0xf2, 0xc1,
+  0x46, 0xd7, 0x76, 0x11, 0xa8, 0xc9, 0x21, 0xe5, 0xa9, 0xb6, 0x8a, 0x00, 0x95, 0xac, 0x7e, 0xd6,
+  0xe8, 0x14, 0x12, 0x12, 0xdd, 0x44, 0x5b, 0xa5, 0x44, 0xc9, 0x0c, 0xef, 0xdf, 0x3f, 0x14, 0xa7,
+  0x9b, 0x2c, 0x65, 0xe3, 0xfc, 0x92, 0x8a, 0x5e, 0xb3, 0x6c, 0xb5, 0xc8, 0xc6, 0xa7, 0x73, 0x5d,
+  0x7b, 0xf1, 0xb4, 0x26, 0xb9, 0x4e, 0xe9, 0xe0, 0x51, 0x6c, 0x54, 0xba, 0x5c, 0x43, 0x5b, 0x5e,
+  0x3a, 0x2e, 0x55, 0xad, 0x57, 0x77, 0xda, 0xbb, 0xd0, 0xba, 0x59, 0xdd, 0xbd, 0xda, 0xba, 0xd3,
+  0x3a, 0xde, 0x7a, 0xd5, 0xdf, 0x8c, 0x01, 0xb3, 0xfa, 0x5e, 0x6d, 0xf5, 0xd7, 0x62, 0x40, 0x4e,
+  0xbb, 0x97, 0x6a, 0x1e, 0xce, 0x4f, 0xc3, 0x21, 0x57, 0xbb, 0x69, 0x02, 0x13, 0xdb, 0xe1, 0xd5,
+  0x30, 0x0a, 0x4e, 0xa7, 0xe1, 0x64, 0x2a, 0x96, 0xd0, 0x68, 0x05, 0x10, 0xe8, 0x8c, 0x92, 0x0b,
+  0x0b, 0x3f, 0x6a, 0xe9, 0x70, 0x1d, 0x6e, 0xf8, 0xd4, 0x7e, 0x89, 0x38, 0xd6, 0xe0, 0x66, 0x8a,
+  0x63, 0x60, 0x12, 0x8d, 0x6a, 0x78, 0x11, 0xeb, 0x81, 0x65, 0x6e, 0x0a, 0xab, 0x30, 0xc4, 0x0d,
+  0x34, 0xb8, 0x39, 0x04, 0xcd, 0xc8, 0x43, 0x10, 0x3f, 0x7b, 0x28, 0xc4, 0x8f, 0x63, 0x14, 0xba,
+  0xdf, 0x99, 0x38, 0x11, 0x38, 0xa2, 0xb8, 0xf8, 0x77, 0x09, 0xe3, 0x37, 0x50, 0x64, 0x4e, 0xf5,
+  0xd2, 0x8b, 0x35, 0x8d, 0x4d, 0xd9, 0x98, 0xc8, 0x3b, 0xd0, 0x34, 0x7b, 0x62, 0xb7, 0x47, 0x78,
+  0xff, 0xb8, 0x32, 0x48, 0x34, 0x9c, 0xe8, 0x22, 0x15, 0x91, 0xe7, 0x56, 0x89, 0x13, 0xc5, 0x31,
+  0xd0, 0x55, 0xfb, 0x00, 0xaf, 0xd7, 0xb0, 0x68, 0x85, 0x11, 0xb3, 0xb7, 0x0e, 0x46, 0x39, 0xb5,
+  0x10, 0x7f, 0x59, 0xfc, 0x82, 0x9d, 0xf7, 0x6a, 0x5b, 0x6c, 0xc9, 0x66, 0xe3, 0xc4, 0x55, 0x4a,
+  0xf6, 0xa7, 0x17, 0xe5, 0x5f, 0xc1, 0xf1, 0x10, 0x7b, 0x11, 0xef, 0xd8, 0xc4, 0x2b, 0x97, 0x86,
+  0xb7, 0x45, 0x7d, 0x5f, 0x3b, 0x0f, 0xd3, 0x7c, 0xe1, 0x47, 0xa7, 0xc3, 0x08, 0x73, 0xdc, 0x07,
+  0xa7, 0x58, 0x47, 0x89, 0xbc, 0x44, 0xb0, 0x08, 0x72, 0xdf, 0x51, 0xa2, 0x5d, 0xd2, 0xc9, 0x4a,
+  0xee, 0x57, 0x7d, 0x3f, 0xb3, 0x87, 0x69, 0x25, 0x3f, 0x5b, 0xea, 0x1c, 0xad, 0x9d, 0x13, 0xa2,
+  0xbe, 0x6e, 0x17, 0x43, 0xb9, 0x33, 0x49, 0x19, 0xbc, 0xbb, 0xef, 0xe7, 0x73, 0x19, 0x2f, 0xa1,
+  0x68, 0xf9, 0x2f, 0xa6, 0xaf, 0x3d, 0x1d, 0x26, 0x23, 0x3f, 0xde, 0x54, 0x45, 0xea, 0x07, 0x7e,
+  0x8c, 0x22, 0xeb, 0x2d, 0xac, 0xba, 0xaa, 0xd8, 0xb9, 0x66, 0x6f, 0x19, 0x0c, 0x2a, 0x60, 0x24,
+  0x6a, 0x53, 0x25, 0xe1, 0xc5, 0xdd, 0x2f, 0xeb, 0x4a, 0xe5, 0x86, 0x4b, 0x6a, 0x13, 0x5e, 0xd5,
+  0xb5, 0x9b, 0x66, 0xd5, 0xad, 0x99, 0x95, 0x76, 0xb3, 0xdc, 0xc0, 0x77, 0x97, 0xad, 0x27, 0x27,
+  0x8b, 0xe7, 0x81, 0x7e, 0xa3, 0x35, 0x76, 0x56, 0xd4, 0x68, 0x9c, 0xb8, 0x07, 0xfe, 0x4c, 0xdd,
+  0x56, 0x5b, 0x6e, 0x6b, 0x9a, 0x1a, 0x10, 0xe2, 0x8d, 0xae, 0x17, 0xa3, 0x22, 0xac, 0x97, 0x8b,
+  0xad, 0xe9, 0xe1, 0x6b, 0x7b, 0xe2, 0x54, 0x31, 0x08, 0x80, 0x93, 0x8b, 0xa6, 0x79, 0xc5, 0x15,
+  0x48, 0x21, 0x9c, 0xe0, 0x94, 0x51, 0xd4, 0x14, 0x26, 0xd4, 0x02, 0x40, 0xec, 0xf7, 0x54, 0x5f,
+  0xc4, 0x6b, 0xe3, 0x28, 0xbb, 0xf9, 0x51, 0x6f, 0x0d, 0xc5, 0x83, 0xba, 0xb0, 0x29, 0x28, 0x6f,
+  0xb8, 0x33, 0x22, 0x24, 0xce, 0xd3, 0xd7, 0xaf, 0xe5, 0x06, 0x3a, 0x73, 0xa2, 0x8f, 0x92, 0x3e,
+  0x81, 0x72, 0x84, 0x28, 0x45, 0x24, 0x41, 0x6f, 0x06, 0x95, 0x53, 0x93, 0x1f, 0x05, 0x91, 0xef,
+  0xa1, 0x65, 0xfd, 0x91, 0x76, 0x67, 0x13, 0x5d, 0xff, 0xf4, 0x86, 0xc2, 0xbf, 0xee, 0xcb, 0x57,
+  0x4f, 0xbf, 0x2b, 0x45, 0x5b, 0x70, 0x6d, 0xfd, 0x4d, 0x81, 0xdd, 0xd4, 0x46, 0x44, 0xee, 0x9a,
+  0xb8, 0x1a, 0x01, 0x3d, 0x20, 0x50, 0xd2, 0x08, 0x6c, 0x9c, 0x02, 0xb0, 0xd4, 0xb0, 0x08, 0xe4,
+  0xb4, 0x4a, 0x58, 0xd5, 0xbb, 0xa9, 0x1c, 0xae, 0x02, 0x30, 0xb9, 0x29, 0x8e, 0x97, 0x14, 0x3a,
+  0xb4, 0xa4, 0xf1, 0xb4, 0x8b, 0x3d, 0x03, 0x3a, 0x16, 0xa4, 0x76, 0x4a, 0xcb, 0xb6, 0x49, 0x53,
+  0xf3, 0x4c, 0x4c, 0xd1, 0x3e, 0xf0, 0xa5, 0xd8, 0x84, 0x5f, 0x6c, 0x23, 0xbf, 0xbe, 0xa9, 0x36,
+  0x54, 0xaa, 0x09, 0x26, 0x00, 0xb5, 0x16, 0xc3, 0xdd, 0xa5, 0xeb, 0x7a, 0xd7, 0x6c, 0xb5, 0xc7,
+  0x27, 0x2f, 0xdf, 0x3c, 0x7d, 0xa2, 0xdd, 0xe4, 0x6b, 0xe9, 0x8b, 0x95, 0xeb, 0x7a, 0xcb, 0x0d,
+  0xbb, 0xc5, 0x5e, 0xbd, 0x3c, 0x39, 0x39, 0x7d, 0x41, 0xd9, 0x08, 0x74, 0x5b, 0x62, 0x5c, 0x03,
+  0x8b, 0xf9, 0x0e, 0xf4, 0x1e, 0xcc, 0xb9, 0x2c, 0x74, 0xb1, 0xb5, 0xac, 0xea, 0x64, 0xc4, 0x74,
+  0x23, 0x50, 0x52, 0x35, 0x65, 0xa8, 0x66, 0xd9, 0x04, 0x83, 0x8f, 0xd4, 0x99, 0x8f, 0xf8, 0x85,
+  0xc3, 0x5a, 0xb4, 0x61, 0x69, 0x90, 0x38, 0x47, 0x02, 0x62, 0x80, 0x28, 0x05, 0xf8, 0x80, 0x2a,
+  0x7f, 0x4d, 0x46, 0xee, 0x3b, 0x7f, 0x86, 0xf6, 0x8b, 0x23, 0x50, 0xd9, 0x68, 0x2f, 0x9a, 0xa2,
+  0x54, 0x1c, 0x43, 0x19, 0x35, 0x0b, 0x0d, 0x8f, 0x62, 0x1d, 0x20, 0x0a, 0xfc, 0x54, 0xca, 0x2f,
+  0x77, 0xc9, 0x3f, 0x4f, 0x45, 0x51, 0xfc, 0x07, 0xde, 0xbf, 0x5a, 0xbe, 0x11, 0xd9, 0x56, 0x1e,
+  0xa8, 0xb0, 0xb7, 0x47, 0x47, 0xc2, 0xae, 0xf9, 0xf5, 0xe2, 0x41, 0xd1, 0x9c, 0xaa, 0xc9, 0xe8,
+  0xc6, 0xcc, 0xec, 0x95, 0xbf, 0xc8, 0xca, 0xd7, 0x87, 0x47, 0xc9, 0x84, 0x5f, 0x8a, 0x88, 0x99,
+  0x46, 0xde, 0x1f, 0x4a, 0xb3, 0x9c, 0x4c, 0x1e, 0xcb, 0x3d, 0xdb, 0xcb, 0x44, 0x04, 0x70, 0x99,
+  0xb9, 0xbb, 0x5b, 0x9d, 0x49, 0x03, 0x3b, 0xf9, 0x24, 0x3c, 0x5f, 0x81, 0xdc, 0xe6, 0x80, 0x05,
+  0xa2, 0x1f, 0x67, 0xe1, 0xeb, 0x60, 0x42, 0x67, 0x79, 0xb6, 0xff, 0xe5, 0xb2, 0xfb, 0xe8, 0x5f,
+  0xde, 0xbd, 0xeb, 0xb4, 0xf7, 0x0f, 0xdf, 0xff, 0xe1, 0xdd, 0xec, 0x9f, 0xde, 0x6f, 0x4f, 0x0e,
+  0xcb, 0xf6, 0xe4, 0x24, 0x99, 0x28, 0xfd, 0x69, 0x06, 0xba, 0xf9, 0xd0, 0x7e, 0x80, 0xd8, 0x12,
+  0x75, 0xf9, 0x56, 0x45, 0x0c, 0xcc, 0xa8, 0xae, 0x1b, 0xc6, 0xf0, 0xdf, 0x67, 0x6f, 0x5f, 0x9c,
+  0xa0, 0x88, 0xf9, 0xed, 0x5b, 0x25, 0x21, 0xe1, 0x2b, 0xae, 0x9b, 0x6f, 0x88, 0xfd, 0x66, 0x03,
+  0xb0, 0x63, 0xbc, 0xd8, 0x59, 0xde, 0x6c, 0xdd, 0x38, 0xf7, 0xd3, 0x66, 0xbb, 0x8d, 0xbd, 0xbe,
+  0xd5, 0xe0, 0x81, 0xee, 0x52, 0xb3, 0x54, 0x6c, 0x18, 0x7d, 0xcf, 0x9c, 0x0a, 0xb0, 0xc5, 0x74,
+  0x01, 0x3b, 0xd2, 0x70, 0xd1, 0x8a, 0x67, 0x00, 0x42, 0xa0, 0x2b, 0xcd, 0x75, 0x83, 0xa4, 0x93,
+  0x48, 0x62, 0x31, 0x48, 0x43, 0xc9, 0xf5, 0x68, 0x62, 0xdd, 0xcc, 0x44, 0xc4, 0x6b, 0xb2, 0x4b,
+  0xe6, 0xc4, 0x5a, 0x75, 0xba, 0x13, 0x50, 0x54, 0xdb, 0x1f, 0xe2, 0x0d, 0xe3, 0xbd, 0x56, 0x43,
+  0xf4, 0x7d, 0x7e, 0xb7, 0x3a, 0x94, 0x76, 0x02, 0x02, 0x6e, 0x36, 0xda, 0xed, 0x36, 0x53, 0x58,
+  0x0c, 0xe6, 0x6e, 0x5c, 0x10, 0xdc, 0xc8, 0xc0, 0x47, 0x24, 0x84, 0xba, 0x11, 0xc6, 0xe3, 0x84,
+  0x93, 0xb8, 0xae, 0x56, 0x48, 0xd9, 0xb9, 0xca, 0x8d, 0xea, 0x1a, 0x98, 0x61, 0xe8, 0x96, 0xda,
+  0x39, 0xb3, 0x4e, 0x4f, 0xc2, 0x6c, 0x58, 0xad, 0xd6, 0x08, 0x9d, 0xa3, 0x54, 0xd5, 0xaa, 0xe4,
+  0x49, 0x99, 0x14, 0x5e, 0x07, 0xc3, 0x15, 0x2a, 0x61, 0x18, 0x45, 0xfd, 0xec, 0x8a, 0xde, 0x32,
+  0xa9, 0x7f, 0x41, 0xf7, 0x8f, 0x4b, 0x05, 0x57, 0xca, 0x8b, 0xd9, 0x6b, 0xd4, 0x47, 0x33, 0x72,
+  0x8e, 0xa6, 0x25, 0x16, 0x17, 0xde, 0x0b, 0x10, 0x10, 0x04, 0xe5, 0x42, 0x6a, 0xaa, 0xee, 0xb5,
+  0x25, 0x0d, 0x11, 0x10, 0x55, 0x08, 0x6e, 0x9e, 0x86, 0x38, 0x2a, 0xd3, 0xf5, 0x8b, 0x0d, 0xe3,
+  0x7c, 0x52, 0x31, 0x34, 0xce, 0xd3, 0x04, 0x2f, 0x73, 0xff, 0x13, 0x38, 0x3a, 0xd8, 0xf7, 0xb4,
+  0xe1, 0x50, 0xd1, 0x69, 0xe9, 0xbe, 0x0a, 0x2b, 0x9c, 0x15, 0x81, 0xca, 0xd7, 0x64, 0x10, 0xb9,
+  0xc0, 0xa8, 0xba, 0x25, 0xa5, 0x72, 0x46, 0xba, 0x18, 0xbe, 0xa2, 0xf3, 0xb9, 0x42, 0xa7, 0xcb,
+  0xf5, 0x8f, 0x40, 0x03, 0x22, 0x1c, 0x34, 0xd0, 0xf6, 0xd0, 0xc1, 0x7f, 0x7c, 0x01, 0x56, 0xb8,
+  0xf8, 0xe1, 0x66, 0x8b, 0x33, 0x1e, 0xf2, 0xc5, 0xfb, 0x0b, 0xbb, 0xad, 0x92, 0xdb, 0x7c, 0xc0,
+  0x1a, 0xdf, 0x37, 0x8a, 0x35, 0x86, 0xdc, 0x9f, 0x48, 0x52, 0xf8, 0xf8, 0x0d, 0xfb, 0xf0, 0xee,
+  0xf7, 0x9f, 0xe5, 0xcf, 0xeb, 0xf7, 0x1f, 0x10, 0x5e, 0x03, 0x87, 0xb1, 0x01, 0x93, 0x0e, 0x03,
+  0x8c, 0xe2, 0xe4, 0xfa, 0xfd, 0xef, 0x3f, 0x23, 0x2c, 0xe6, 0xf9, 0xd2, 0x59, 0xe7, 0x19, 0xbe,
+  0x64, 0xbb, 0x65, 0xe8, 0xb1, 0x92, 0x55, 0x84, 0x66, 0x53, 0xb7, 0xdf, 0x69, 0x55, 0xa0, 0x23,
+  0x28, 0x4f, 0x9e, 0x3e, 0xfa, 0xfe, 0x1f, 0x9d, 0x96, 0x0e, 0x3e, 0x0a, 0xce, 0x16, 0x13, 0x47,
+  0x0d, 0x8b, 0x36, 0xac, 0xe7, 0xdf, 0x7d, 0xfb, 0xd2, 0x44, 0xc2, 0xde, 0xb5, 0x1c, 0xe7, 0x87,
+  0x87, 0xaf, 0xbf, 0x33, 0x71, 0x50, 0x79, 0x97, 0xe3, 0x80, 0x8f, 0xf9, 0xf2, 0xb5, 0x89, 0xc4,
+  0x87, 0x3e, 0xd2, 0x22, 0xd3, 0x10, 0xd0, 0xd0, 0x0c, 0x80, 0xa5, 0xb1, 0xbb, 0xa2, 0x25, 0x38,
+  0xf4, 0x8a, 0xe5, 0xa7, 0x7a, 0x31, 0x21, 0x90, 0xb6, 0x14, 0xfe, 0xee, 0xc9, 0x7b, 0x9c, 0xa7,
+  0x2d, 0x17, 0x52, 0x19, 0xe7, 0x79, 0x19, 0xa7, 0x2a, 0xa3, 0x32, 0xca, 0x0f, 0x65, 0x94, 0xaa,
+  0x88, 0xca, 0x28, 0x4f, 0xcb, 0x28, 0x52, 0x40, 0x65, 0xf9, 0x20, 0xa2, 0x4d, 0x40, 0x35, 0x50,
+  0x8f, 0xd1, 0x35, 0x30, 0x9c, 0x1b, 0xbe, 0xfe, 0x59, 0x5c, 0x6e, 0xbe, 0x62, 0x71, 0xf4, 0x50,
+  0x1f, 0xe9, 0x78, 0x66, 0x10, 0xd4, 0x62, 0x41, 0xe6, 0xfa, 0x3d, 0x28, 0x2f, 0x16, 0x76, 0xfd,
+  0xa1, 0x65, 0xec, 0xb0, 0x48, 0xcd, 0xbd, 0x05, 0xc3, 0x14, 0x13, 0xea, 0x8a, 0x81, 0x1e, 0x97,
+  0x75, 0xcf, 0x39, 0xe5, 0x54, 0x6e, 0x23, 0x90, 0xde, 0x0b, 0x55, 0x3d, 0x46, 0xc3, 0x82, 0xde,
+  0x92, 0xac, 0x80, 0x04, 0xd5, 0x47, 0xe1, 0x0f, 0x0f, 0xb2, 0x39, 0xcc, 0x74, 0x09, 0xfb, 0xa8,
+  0x81, 0xfc, 0xb4, 0xa1, 0x37, 0x35, 0x8e, 0x0b, 0xde, 0x1e, 0x6c, 0x23, 0xc4, 0x31, 0xc1, 0x1d,
+  0x0b, 0x36, 0xc5, 0x3b, 0xd5, 0xc5, 0xf4, 0x31, 0x9e, 0x8b, 0xf0, 0xf1, 0x34, 0x8c, 0x46, 0xcd,
+  0x54, 0x64, 0x2b, 0x32, 0x00, 0xb2, 0x61, 0x0a, 0xee, 0xe9, 0x5b, 0xca, 0xeb, 0x6d, 0xf9, 0xf0,
+  0x2c, 0x08, 0x27, 0xd3, 0x5c, 0x3b, 0xcc, 0x6a, 0xc0, 0x0c, 0x91, 0xae, 0x90, 0xc0, 0x63, 0xba,
+  0x5e, 0xfb, 0x98, 0x0d, 0x3a, 0xea, 0xac, 0xbf, 0x01, 0xcb, 0xe7, 0xc6, 0x9c, 0x13, 0xe3, 0x03,
+  0x5d, 0x02, 0x4d, 0xef, 0xc5, 0x60, 0x51, 0x34, 0x8d, 0x91, 0x87, 0x49, 0xd7, 0x0c, 0xbe, 0xf2,
+  0x4e, 0x43, 0x84, 0x74, 0x8a, 0x0a, 0x6f, 0xe7, 0x2b, 0xf9, 0x5c, 0x98, 0x2a, 0x98, 0xa6, 0x2f,
+  0x73, 0xd0, 0xe6, 0x08, 0xfe, 0x28, 0x8f, 0x8b, 0xd3, 0x70, 0x92, 0x84, 0xac, 0x0a, 0xce, 0xf3,
+  0x4d, 0xcf, 0x18, 0x46, 0x3e, 0xdc, 0xa0, 0xd9, 0x38, 0x54, 0xdf, 0x4b, 0x81, 0x17, 0x7e, 0xaa,
+  0xd6, 0x31, 0x66, 0x37, 0x72, 0xd4, 0xe4, 0xc4, 0xad, 0x83, 0xa5, 0x31, 0xda, 0x5a, 0x8a, 0x25,
+  0x54, 0x6b, 0xa9, 0x32, 0xfa, 0xb0, 0xac, 0x60, 0xee, 0x7c, 0x40, 0x67, 0xa8, 0x73, 0x62, 0x4c,
+  0x39, 0x93, 0xf7, 0x0e, 0x1d, 0x50, 0xde, 0x85, 0xb9, 0xcc, 0x7f, 0xac, 0xba, 0x8f, 0x06, 0x29,
+  0x98, 0xf5, 0xc6, 0xb8, 0xe0, 0xa8, 0x51, 0x83, 0x01, 0xae, 0x68, 0x6b, 0x91, 0x2a, 0xa2, 0x74,
+  0x9d, 0xb7, 0x6a, 0xc0, 0x28, 0x39, 0x13, 0xfd, 0xfb, 0x11, 0x3c, 0x36, 0xdf, 0x15, 0x88, 0x3f,
+  0x26, 0x61, 0xdc, 0x74, 0xfe, 0x05, 0x1a, 0x0f, 0xef, 0xd1, 0x93, 0x79, 0xcc, 0x51, 0x6a, 0xdb,
+  0xe0, 0x0b, 0x84, 0xb8, 0x04, 0xaa, 0x2d, 0xda, 0x2f, 0x52, 0x5c, 0xf1, 0x16, 0xb3, 0xf0, 0xef,
+  0x5f, 0x9f, 0x88, 0x6e, 0xcc, 0x67, 0xc1, 0xf0, 0xbb, 0x89, 0x25, 0x69, 0xf0, 0xfe, 0x92, 0x2e,
+  0xef, 0x73, 0x19, 0xfb, 0xee, 0x34, 0x0d, 0x30, 0x51, 0x1d, 0xd0, 0xe6, 0xbf, 0x65, 0x5d, 0xb1,
+  0x4b, 0xe3, 0xcc, 0xe1, 0xf4, 0xf7, 0x9f, 0x0d, 0xcb, 0xf4, 0xfc, 0xcd, 0x4b, 0x61, 0x92, 0x5a,
+  0xea, 0x06, 0xee, 0xee, 0x7e, 0xeb, 0xda, 0xcd, 0x2f, 0xf3, 0x0f, 0x9c, 0xc4, 0x10, 0x5e, 0x7f,
+  0xe4, 0xaa, 0xaf, 0x31, 0x9b, 0x06, 0xe7, 0xc9, 0x47, 0x8d, 0x59, 0x28, 0xd1, 0x9a, 0x1e, 0x50,
+  0x34, 0xb7, 0x30, 0x99, 0x98, 0x92, 0x90, 0x4b, 0x5c, 0x4d, 0x57, 0x4a, 0x5a, 0x85, 0xbf, 0x0e,
+  0x8d, 0xef, 0xfc, 0x28, 0x26, 0xa1, 0xe2, 0x7d, 0x30, 0xf4, 0x17, 0x77, 0xa7, 0x70, 0x9d, 0x41,
+  0xf8, 0x5e, 0xab, 0x74, 0xc1, 0x6c, 0xf5, 0x26, 0x3d, 0xda, 0x4b, 0x80, 0x77, 0xe5, 0x51, 0xe1,
+  0x37, 0xcc, 0x85, 0x41, 0x89, 0x3d, 0xe9, 0xea, 0x19, 0x8a, 0xce, 0x0c, 0x79, 0x12, 0x43, 0x15,
+  0x77, 0x58, 0x92, 0x25, 0xe3, 0xf0, 0xde, 0x8a, 0xf4, 0x18, 0x78, 0xf6, 0x47, 0xc1, 0xd8, 0x2e,
+  0x09, 0xb4, 0x25, 0x60, 0x4c, 0x31, 0x49, 0xc6, 0xc3, 0x28, 0xa2, 0x6b, 0x16, 0x39, 0x23, 0xc6,
+  0xad, 0x8a, 0x6a, 0xb2, 0x75, 0x9b, 0xfa, 0xae, 0x51, 0x41, 0x23, 0xb7, 0xc7, 0xf2, 0x0c, 0x20,
+  0x0a, 0x88, 0x78, 0xe7, 0x8c, 0x57, 0x2a, 0xde, 0x52, 0xe9, 0x17, 0x64, 0xc0, 0xa5, 0xd6, 0x5e,
+  0x82, 0xdd, 0x69, 0x13, 0xa9, 0x36, 0x5e, 0xd5, 0xe9, 0xb4, 0x6a, 0x8f, 0xfd, 0x96, 0x43, 0x15,
+  0x46, 0x82, 0x11, 0xaa, 0xe2, 0x2d, 0xca, 0xe0, 0xe7, 0xa5, 0xa9, 0x90, 0xa6, 0x2a, 0x05, 0xbb,
+  0x1d, 0xc9, 0xf6, 0x4f, 0x6f, 0x8c, 0xfb, 0x7b, 0xb3, 0x25, 0xfd, 0x18, 0x86, 0xba, 0x70, 0x2e,
+  0x02, 0x20, 0x20, 0xc0, 0x14, 0x17, 0x51, 0x9c, 0x69, 0x9e, 0xcf, 0xb3, 0x83, 0xed, 0xed, 0xe1,
+  0x28, 0x76, 0x7f, 0xcc, 0x68, 0x7f, 0x7d, 0xea, 0xc6, 0x41, 0xbe, 0x1d, 0xcf, 0x67, 0xdb, 0xfc,
+  0x3a, 0xc8, 0x1f, 0xb3, 0x3f, 0xf6, 0xdd, 0xbe, 0xdb, 0xd9, 0x06, 0xa6, 0x72, 0xf1, 0x6e, 0x31,
+  0xa3, 0x0d, 0xc7, 0xf0, 0xcd, 0xe1, 0xe4, 0x12, 0x69, 0x09, 0xe4, 0x85, 0xf0, 0x5a, 0x48, 0x75,
+  0xba, 0x26, 0x53, 0x8c, 0x4d, 0xd7, 0x62, 0x6b, 0xea, 0xcf, 0x66, 0x41, 0x0a, 0x6c, 0x79, 0x6e,
+  0xc7, 0xdd, 0x73, 0x24, 0x6a, 0x99, 0x05, 0x23, 0x8d, 0xcd, 0xa7, 0xb5, 0x79, 0x60, 0xec, 0xd3,
+  0xfa, 0xc2, 0xf9, 0x31, 0x6b, 0xf3, 0x04, 0xd2, 0xd4, 0x7c, 0xc4, 0x50, 0xd7, 0x29, 0xe8, 0xd4,
+  0xb0, 0xc4, 0x8c, 0xeb, 0x97, 0xb5, 0xe4, 0xc2, 0x08, 0xfd, 0x8c, 0xa7, 0xfc, 0xa9, 0xbc, 0x7f,
+  0x12, 0x9c, 0x83, 0x09, 0x55, 0x5f, 0x71, 0x57, 0x7f, 0xdc, 0x6c, 0x56, 0xb2, 0x04, 0x1b, 0x41,
+  0x34, 0x3d, 0x6d, 0x71, 0x35, 0x5c, 0x5b, 0xfd, 0x4c, 0xd1, 0x17, 0xf3, 0x35, 0x66, 0x8c, 0xcd,
+  0x83, 0xf4, 0xdc, 0x8f, 0x9a, 0x2a, 0xc2, 0xa7, 0x02, 0x82, 0x3a, 0x6c, 0x91, 0x77, 0x47, 0xe5,
+  0x80, 0x55, 0x02, 0xc7, 0xbd, 0x3c, 0x86, 0x93, 0xf6, 0x49, 0x5a, 0x1e, 0xfe, 0xa7, 0x1e, 0x70,
+  0x5a, 0x04, 0x0c, 0xea, 0x81, 0xc8, 0xa3, 0x6e, 0x61, 0x67, 0x07, 0x27, 0x91, 0x1a, 0xf3, 0x18,
+  0x9e, 0x70, 0x3f, 0x10, 0xfe, 0x9d, 0xe6, 0xb3, 0xe8, 0xf8, 0xff, 0x03, 0x35, 0x12, 0xfa, 0xdc,
+  0x00, 0x1a, 0x01, 0x00
 };
-static const size_t DASHBOARD_HTML_GZ_LEN = 14316;
+static const size_t DASHBOARD_HTML_GZ_LEN = 15284;
 
 } // namespace asgard_dashboard
 } // namespace esphome
@@ -0,0 +1,151 @@
+#pragma once
+// The /dashboard/state serializer: the codegen-built field table and the JSON writers shared by
+// /dashboard/state and /dashboard/stream. Only the entity headers are needed, so the host test
+// (tests/host/dashboard_state_test.py) builds it as is.
+#include <cmath>
+#include <cstdarg>
+#include <cstdio>
+#include <string>
+#include <vector>
+
+#include "esphome/components/sensor/sensor.h"
+#include "esphome/components/binary_sensor/binary_sensor.h"
+#include "esphome/components/text_sensor/text_sensor.h"
+#include "esphome/components/climate/climate.h"
+#include "esphome/components/number/number.h"
+#include "esphome/components/switch/switch.h"
+#include "esphome/components/select/select.h"
+
+namespace esphome {
+namespace asgard_dashboard {
+
+enum class StateFieldType : uint8_t {
+  SENSOR,
+  NUMBER,
+  NUMBER_TRAITS,
+  CLIMATE_CURRENT,
+  CLIMATE_TARGET,
+  BINARY,
+  BINARY_STATE,
+  SWITCH,
+  TEXT,
+  SELECT_INDEX,
+};
+
+// Keep in sync with TEXT_MAX_CHARS in __init__.py (used to size the state buffer)
+static const size_t STATE_TEXT_MAX_CHARS = 64;
+
+// One entry of the codegen-built /dashboard/state table (unconfigured entities are never added)
+struct StateField {
+  const char *key;
+  StateFieldType type;
+  void *entity;
+};
+
+inline bool append_(char *buf, size_t cap, size_t &pos, const char *fmt, ...) {
+  if (pos >= cap) return false;
+  va_list args;
+  va_start(args, fmt);
+  int n = vsnprintf(buf + pos, cap - pos, fmt, args);
+  va_end(args);
+  if (n < 0 || static_cast<size_t>(n) >= cap - pos) return false;
+  pos += n;
+  return true;
+}
+
+// Larger magnitudes go out as null, so "%.2f" stays within STATE_VALUE_WIDTH in __init__.py
+static const float STATE_FLOAT_LIMIT = 1e15f;
+
+inline bool append_float_(char *buf, size_t cap, size_t &pos, const char *fmt, float value) {
+  if (!std::isfinite(value) || std::fabs(value) >= STATE_FLOAT_LIMIT) return append_(buf, cap, pos, "null");
+  return append_(buf, cap, pos, fmt, value);
+}
+
+inline bool append_text_(char *buf, size_t cap, size_t &pos, const std::string &text) {
+  if (!append_(buf, cap, pos, "\"")) return false;
+  size_t count = 0;
+  for (char c : text) {
+    if (count++ >= STATE_TEXT_MAX_CHARS) break;
+    if (c == '"' || c == '\\') {
+      if (pos + 2 >= cap) return false;
+      buf[pos++] = '\\';
+    } else if (pos + 1 >= cap) {
+      return false;
+    } else if (static_cast<unsigned char>(c) < 0x20) {
+      c = ' ';  // JSON strings cannot carry raw control characters
+    }
+    buf[pos++] = c;
+  }
+  buf[pos] = '\0';
+  return append_(buf, cap, pos, "\"");
+}
+
+inline bool append_value_(char *buf, size_t cap, size_t &pos, const StateField &field) {
+  switch (field.type) {
+    case StateFieldType::SENSOR: {
+      auto *s = static_cast<sensor::Sensor *>(field.entity);
+      if (!s->has_state()) return append_(buf, cap, pos, "null");
+      return append_float_(buf, cap, pos, "%.2f", s->state);
+    }
+    case StateFieldType::NUMBER: {
+      auto *n = static_cast<number::Number *>(field.entity);
+      if (!n->has_state()) return append_(buf, cap, pos, "null");
+      return append_float_(buf, cap, pos, "%.1f", n->state);
+    }
+    case StateFieldType::NUMBER_TRAITS: {
+      auto *n = static_cast<number::Number *>(field.entity);
+      return append_(buf, cap, pos, "{\"min\":") &&
+             append_float_(buf, cap, pos, "%.1f", n->traits.get_min_value()) &&
+             append_(buf, cap, pos, ",\"max\":") &&
+             append_float_(buf, cap, pos, "%.1f", n->traits.get_max_value()) &&
+             append_(buf, cap, pos, ",\"step\":") &&
+             append_float_(buf, cap, pos, "%.1f", n->traits.get_step()) &&
+             append_(buf, cap, pos, "}");
+    }
+    case StateFieldType::CLIMATE_CURRENT:
+      return append_float_(buf, cap, pos, "%.1f", static_cast<climate::Climate *>(field.entity)->current_temperature);
+    case StateFieldType::CLIMATE_TARGET:
+      return append_float_(buf, cap, pos, "%.1f", static_cast<climate::Climate *>(field.entity)->target_temperature);
+    case StateFieldType::BINARY: {
+      auto *b = static_cast<binary_sensor::BinarySensor *>(field.entity);
+      if (!b->has_state()) return append_(buf, cap, pos, "null");
+      return append_(buf, cap, pos, b->state ? "true" : "false");
+    }
+    case StateFieldType::BINARY_STATE: {
+      auto *b = static_cast<binary_sensor::BinarySensor *>(field.entity);
+      return append_(buf, cap, pos, (b->has_state() && b->state) ? "true" : "false");
+    }
+    case StateFieldType::SWITCH:
+      return append_(buf, cap, pos, static_cast<switch_::Switch *>(field.entity)->state ? "true" : "false");
+    case StateFieldType::TEXT: {
+      auto *t = static_cast<text_sensor::TextSensor *>(field.entity);
+      if (!t->has_state()) return append_(buf, cap, pos, "\"\"");
+      return append_text_(buf, cap, pos, t->state);
+    }
+    case StateFieldType::SELECT_INDEX: {
+      auto idx = static_cast<select::Select *>(field.entity)->active_index();
+      if (!idx.has_value()) return append_(buf, cap, pos, "\"null\"");
+      return append_(buf, cap, pos, "\"%u\"", static_cast<unsigned>(idx.value()));
+    }
+  }
+  return append_(buf, cap, pos, "null");
+}
+
+// The whole /dashboard/state object into buf, its length or 0 when it does not fit cap.
+inline size_t serialize_state(const std::vector<StateField> &fields, char *buf, size_t cap) {
+  size_t pos = 0;
+  if (!append_(buf, cap, pos, "{")) return 0;
+
+  bool first = true;
+  for (const auto &field : fields) {
+    if (!append_(buf, cap, pos, first ? "\"%s\":" : ",\"%s\":", field.key)) return 0;
+    if (!append_value_(buf, cap, pos, field)) return 0;
+    first = false;
+  }
+
+  if (!append_(buf, cap, pos, "}")) return 0;
+  return pos;
+}
+
+}  // namespace asgard_dashboard
+}  // namespace esphome
@@ -6,12 +6,18 @@ from esphome.const import CONF_ID
 
 CODEOWNERS = ["@gekkekoe"]
 
-AUTO_LOAD = ["binary_sensor", "sensor", "text_sensor", "uart"]
+AUTO_LOAD = ["binary_sensor", "sensor", "socket", "text_sensor", "uart"]
 
 CONF_ECODAN_ID = "ecodan_id"
 CONF_PROXY_UART_ID = "proxy_uart_id"
 CONF_SPECIFIC_HEAT_CONSTANT = "specific_heat_constant_override"
 CONF_POLLING_INTERVAL_OVERRIDE = "polling_interval_override"
+CONF_ALWAYS_POLL = "always_poll"
+CONF_POLL_INTERVALS = "poll_intervals"
+CONF_REQUEST_CODE_BUDGET = "request_code_budget"
+CONF_BUS_CAPTURE_PORT = "bus_capture_port"
+CONF_MQTT_BATCH_TOPIC = "mqtt_batch_topic"
+CONF_MQTT_BATCH_INTERVAL = "mqtt_batch_interval"
 
 uart_ns = cg.esphome_ns.namespace("uart")
 UARTComponent = uart_ns.class_("UARTComponent")
@@ -21,12 +27,90 @@ hub_ns = cg.esphome_ns.namespace('ecodan')
 ECODAN = hub_ns.class_('EcodanHeatpump', cg.PollingComponent)
 ECODAN_CLIMATE = hub_ns.class_('EcodanClimate', climate.Climate, cg.PollingComponent, uart.UARTDevice)
 
+# Generated into keys.h by generate_keys.py, one enumerator per platform schema key
+SensorKey = hub_ns.enum('SensorKey', is_class=True)
+BinarySensorKey = hub_ns.enum('BinarySensorKey', is_class=True)
+TextSensorKey = hub_ns.enum('TextSensorKey', is_class=True)
+GetType = hub_ns.enum('GetType', is_class=True)
+RequestCode = hub_ns.struct('Status').enum('REQUEST_CODE', is_class=True)
+
+# Status messages whose fields are read outside the entity publishers (climate, optimizer,
+# short cycle/service code logic, climate lambdas in confs/), so they are polled in every config.
+CORE_STATUS_MESSAGES = [
+    "DATETIME_FIRMWARE",
+    "DEFROST_STATE",
+    "ERROR_STATE",
+    "COMPRESSOR_FREQUENCY",
+    "TEMPERATURE_CONFIG",
+    "SH_TEMPERATURE_STATE",
+    "TEMPERATURE_STATE_A",
+    "TEMPERATURE_STATE_B",
+    "ACTIVE_TIME",
+    "PUMP_STATUS_A",
+    "MODE_FLAGS_A",
+    "MODE_FLAGS_B",
+]
+
+# Status messages that only feed entities, with the sensor/binary_sensor/text_sensor keys they
+# publish (see handle_get_response). They are polled when at least one of the keys is configured.
+ENTITY_STATUS_MESSAGES = {
+    "DHW_STATE": ["heat_source"],
+    "HEATING_POWER": ["output_power", "energy_consumed_increasing"],
+    "TEMPERATURE_STATE_C": ["boiler_flow_temp", "boiler_return_temp"],
+    "TEMPERATURE_STATE_D": [
+        "mixing_tank_temp", "hp_refrigerant_condensing_temp", "discharge_temp", "ou_liquid_pipe_temp",
+        "ou_two_phase_pipe_temp", "ou_suction_pipe_temp", "ou_heatsink_temp", "ou_compressor_surface_temp",
+        "super_heat_temp", "sub_cool_temp",
+    ],
+    "EXTERNAL_STATE": ["status_in1_request", "status_in6_request", "status_in5_request"],
+    "PUMP_STATUS_B": ["mixing_valve_step_z1"],
+    "FLOW_RATE": ["flow_rate", "computed_output_power", "status_booster", "status_booster_2", "status_immersion"],
+    "ENERGY_USAGE": ["heating_consumed", "cool_consumed", "dhw_consumed", "heating_cop", "cool_cop", "dhw_cop"],
+    "ENERGY_DELIVERY": ["heating_delivered", "cool_delivered", "dhw_delivered", "heating_cop", "cool_cop", "dhw_cop"],
+}
+
+STATUS_MESSAGES = {name: getattr(GetType, name) for name in CORE_STATUS_MESSAGES + list(ENTITY_STATUS_MESSAGES)}
+
+# Minimum time between two polls of a message, anything not listed is polled every round.
+# Clock and energy counters change at most once a minute, leave their bus slots to the fast ones.
+DEFAULT_POLL_INTERVALS = {
+    "DATETIME_FIRMWARE": "60s",
+    "ENERGY_USAGE": "60s",
+    "ENERGY_DELIVERY": "60s",
+}
+
+POLL_INTERVALS_SCHEMA = cv.Schema(
+    {
+        cv.Optional(name.lower(), default=DEFAULT_POLL_INTERVALS.get(name, "0s")): cv.positive_time_period_milliseconds
+        for name in STATUS_MESSAGES
+    }
+)
+
+
+def enable_status_messages(hp, keys):
+    """Add the status messages that publish any of the configured entity keys to the poll table."""
+    for name, message_keys in ENTITY_STATUS_MESSAGES.items():
+        if any(key in message_keys for key in keys):
+            cg.add(hp.enable_status_message(STATUS_MESSAGES[name]))
+
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(CONF_ID): cv.declare_id(ECODAN),
         cv.Optional(CONF_PROXY_UART_ID): cv.use_id(UARTComponent),
         cv.Optional(CONF_SPECIFIC_HEAT_CONSTANT): cv.float_,
         cv.Optional(CONF_POLLING_INTERVAL_OVERRIDE): cv.uint32_t,
+        # extra status messages for lambdas that read get_status() fields without a matching entity
+        cv.Optional(CONF_ALWAYS_POLL, default=[]): cv.ensure_list(cv.enum(STATUS_MESSAGES, upper=True)),
+        cv.Optional(CONF_POLL_INTERVALS, default={}): POLL_INTERVALS_SCHEMA,
+        # share of bus time request codes may use, they block status polling while pending
+        cv.Optional(CONF_REQUEST_CODE_BUDGET, default="20%"): cv.percentage,
+        # stream every bus frame to a TCP client (scripts/cn105_capture.py), off when not set
+        cv.Optional(CONF_BUS_CAPTURE_PORT): cv.port,
+        # also publish every changed sensor/binary sensor value per poll round as one JSON object on this
+        # topic (read by scripts/mqtt_logger.py), the per entity topics stay for Home Assistant
+        cv.Optional(CONF_MQTT_BATCH_TOPIC): cv.All(cv.requires_component("mqtt"), cv.publish_topic),
+        # a batch goes out when a poll round finishes, or after this long when none does (proxy mode)
+        cv.Optional(CONF_MQTT_BATCH_INTERVAL, default="60s"): cv.positive_time_period_milliseconds,
     }
     ).extend(cv.polling_component_schema('500ms')
     .extend(uart.UART_DEVICE_SCHEMA))
@@ -43,3 +127,17 @@ async def to_code(config):
         cg.add(hp.set_specific_heat_constant(config[CONF_SPECIFIC_HEAT_CONSTANT]))
     if CONF_POLLING_INTERVAL_OVERRIDE in config:
         cg.add(hp.set_polling_interval(config[CONF_POLLING_INTERVAL_OVERRIDE]))
+    cg.add(hp.set_request_code_budget(config[CONF_REQUEST_CODE_BUDGET]))
+    if CONF_BUS_CAPTURE_PORT in config:
+        cg.add(hp.set_bus_capture_port(config[CONF_BUS_CAPTURE_PORT]))
+    if CONF_MQTT_BATCH_TOPIC in config:
+        cg.add(hp.set_mqtt_batch_topic(config[CONF_MQTT_BATCH_TOPIC]))
+        cg.add(hp.set_mqtt_batch_interval(config[CONF_MQTT_BATCH_INTERVAL].total_milliseconds))
+
+    for name in CORE_STATUS_MESSAGES:
+        cg.add(hp.enable_status_message(STATUS_MESSAGES[name]))
+    for message in config[CONF_ALWAYS_POLL]:
+        cg.add(hp.enable_status_message(message))
+    for name, interval in config[CONF_POLL_INTERVALS].items():
+        if interval.total_milliseconds > 0:
+            cg.add(hp.set_status_poll_interval(STATUS_MESSAGES[name.upper()], interval.total_milliseconds))
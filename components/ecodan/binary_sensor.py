@@ -9,7 +9,7 @@ from esphome.const import (
     ENTITY_CATEGORY_DIAGNOSTIC
 )
 
-from . import ECODAN, CONF_ECODAN_ID
+from . import ECODAN, CONF_ECODAN_ID, BinarySensorKey, enable_status_messages
 
 
 AUTO_LOAD = ["ecodan"]
@@ -152,6 +152,7 @@ CONFIG_SCHEMA = cv.Schema(
 
 async def to_code(config):
     hp = await cg.get_variable(config[CONF_ECODAN_ID])
+    keys = []
 
     for key, conf in config.items():
         if not isinstance(conf, dict):
@@ -159,4 +160,7 @@ async def to_code(config):
         id = conf.get("id")
         if id and id.type == binary_sensor.BinarySensor:
             sens = await binary_sensor.new_binary_sensor(conf)
-            cg.add(hp.register_binarySensor(sens, key))
+            cg.add(hp.register_binarySensor(sens, getattr(BinarySensorKey, key.upper())))
+            keys.append(key)
+
+    enable_status_messages(hp, keys)
@@ -0,0 +1,138 @@
+#include "ecodan.h"
+
+#include <cerrno>
+
+namespace esphome {
+namespace ecodan
+{
+    // Raw bus capture, read by scripts/cn105_capture.py. After connecting, a client receives
+    // CAPTURE_MAGIC, a format version byte and three reserved bytes, then one record per frame:
+    //   uint32 LE timestamp (micros(), wraps after ~71 min), uint8 flags, uint8 length, frame bytes
+    // flags: bits 0-1 CaptureDirection, 0x40 = dropped marker (data is a uint32 LE count of
+    // records lost to a full queue), 0x80 = frame failed its checksum.
+    static const uint8_t CAPTURE_MAGIC[] = { 'C', 'N', '5', 'C' };
+    static const uint8_t CAPTURE_VERSION = 1;
+    static const uint8_t CAPTURE_FLAG_DROPPED = 0x40;
+    static const uint8_t CAPTURE_FLAG_BAD_CHECKSUM = 0x80;
+    static const size_t CAPTURE_RECORD_HEADER = 6;
+    // records held while the socket is busy, about 1.5 s of full duplex bus traffic at 2400 baud
+    static const UBaseType_t CAPTURE_QUEUE_LENGTH = 32;
+
+    void EcodanHeatpump::setup_capture() {
+        if (busCapturePort == 0)
+            return;
+
+        this->capture_queue_ = xQueueCreate(CAPTURE_QUEUE_LENGTH, sizeof(CaptureRecord));
+        if (this->capture_queue_ == nullptr) {
+            ESP_LOGE(TAG, "Could not create capture_queue");
+            return;
+        }
+
+        this->capture_server_ = socket::socket_ip(SOCK_STREAM, 0);
+        if (!this->capture_server_) {
+            ESP_LOGE(TAG, "Bus capture: could not create socket");
+            return;
+        }
+        int enable = 1;
+        this->capture_server_->setsockopt(SOL_SOCKET, SO_REUSEADDR, &enable, sizeof(int));
+        this->capture_server_->setblocking(false);
+
+        struct sockaddr_storage server;
+        socklen_t sl = socket::set_sockaddr_any((struct sockaddr *) &server, sizeof(server), busCapturePort);
+        if (sl == 0 || this->capture_server_->bind((struct sockaddr *) &server, sl) != 0
+                || this->capture_server_->listen(1) != 0) {
+            ESP_LOGE(TAG, "Bus capture: could not listen on port %u, errno %d", busCapturePort, errno);
+            this->capture_server_ = nullptr;
+            return;
+        }
+        ESP_LOGI(TAG, "Bus capture listening on port %u", busCapturePort);
+    }
+
+    void EcodanHeatpump::capture_frame(CaptureDirection direction, const uint8_t *data, uint8_t length, bool valid) {
+        if (!this->captureActive.load(std::memory_order_relaxed))
+            return;
+
+        CaptureRecord record;
+        record.timestampUs = micros();
+        record.flags = static_cast<uint8_t>(direction) | (valid ? 0 : CAPTURE_FLAG_BAD_CHECKSUM);
+        record.length = std::min<uint8_t>(length, sizeof(record.data));
+        memcpy(record.data, data, record.length);
+
+        // never block the serial task, a full queue is reported to the client as a dropped marker
+        if (xQueueSend(this->capture_queue_, &record, (TickType_t)0) != pdTRUE)
+            this->captureDropped.fetch_add(1, std::memory_order_relaxed);
+    }
+
+    void EcodanHeatpump::handle_capture() {
+        if (!this->capture_server_)
+            return;
+
+        if (!this->capture_client_) {
+            struct sockaddr_storage source_addr;
+            socklen_t addr_len = sizeof(source_addr);
+            this->capture_client_ = this->capture_server_->accept((struct sockaddr *) &source_addr, &addr_len);
+            if (!this->capture_client_)
+                return;
+
+            this->capture_client_->setblocking(false);
+            xQueueReset(this->capture_queue_);
+            this->captureDropped.store(0);
+            this->capturePending.assign(CAPTURE_MAGIC, CAPTURE_MAGIC + sizeof(CAPTURE_MAGIC));
+            this->capturePending.insert(this->capturePending.end(), { CAPTURE_VERSION, 0, 0, 0 });
+            this->captureActive.store(true);
+            ESP_LOGI(TAG, "Bus capture client connected");
+        }
+
+        // the client never sends anything, a read of 0 means it went away
+        uint8_t discard[16];
+        ssize_t received = this->capture_client_->read(discard, sizeof(discard));
+        if (received == 0 || (received < 0 && errno != EWOULDBLOCK && errno != EAGAIN)) {
+            close_capture_client();
+            return;
+        }
+
+        // keep at most a few records buffered here, the rest waits in the queue
+        CaptureRecord record;
+        while (this->capturePending.size() < 4 * sizeof(CaptureRecord)) {
+            uint32_t dropped = this->captureDropped.exchange(0, std::memory_order_relaxed);
+            if (dropped > 0) {
+                uint32_t now = micros();
+                const uint8_t marker[] = {
+                    uint8_t(now), uint8_t(now >> 8), uint8_t(now >> 16), uint8_t(now >> 24),
+                    CAPTURE_FLAG_DROPPED, sizeof(uint32_t),
+                    uint8_t(dropped), uint8_t(dropped >> 8), uint8_t(dropped >> 16), uint8_t(dropped >> 24) };
+                this->capturePending.insert(this->capturePending.end(), marker, marker + sizeof(marker));
+                continue;
+            }
+            if (xQueueReceive(this->capture_queue_, &record, (TickType_t)0) != pdTRUE)
+                break;
+
+            const uint8_t header[CAPTURE_RECORD_HEADER] = {
+                uint8_t(record.timestampUs), uint8_t(record.timestampUs >> 8),
+                uint8_t(record.timestampUs >> 16), uint8_t(record.timestampUs >> 24),
+                record.flags, record.length };
+            this->capturePending.insert(this->capturePending.end(), header, header + sizeof(header));
+            this->capturePending.insert(this->capturePending.end(), record.data, record.data + record.length);
+        }
+
+        if (this->capturePending.empty())
+            return;
+
+        ssize_t written = this->capture_client_->write(this->capturePending.data(), this->capturePending.size());
+        if (written < 0) {
+            if (errno != EWOULDBLOCK && errno != EAGAIN)
+                close_capture_client();
+            return;
+        }
+        this->capturePending.erase(this->capturePending.begin(), this->capturePending.begin() + written);
+    }
+
+    void EcodanHeatpump::close_capture_client() {
+        this->captureActive.store(false);
+        this->capture_client_ = nullptr;
+        this->capturePending.clear();
+        ESP_LOGI(TAG, "Bus capture client disconnected");
+    }
+
+} // namespace ecodan
+} // namespace esphome
@@ -1,4 +1,5 @@
 #include "ecodan.h"
+#include "status_poll.h"
 
 #include "esphome.h"
 
@@ -236,25 +237,90 @@ namespace ecodan
         Message{MsgType::GET_CMD, GetType::ENERGY_DELIVERY}
     };
 
+    // statusCmdQueue entries that feed the configured entities, selected at codegen time,
+    // with their minimum poll interval (0 = every round)
+    uint32_t statusPollMask = 0;
+    uint32_t statusPollIntervalMs[MAX_STATUS_CMD_SIZE] = {};
+    StatusPollRuntime statusPollQueue[MAX_STATUS_CMD_SIZE] = {};
+    uint8_t statusPollSize = 0;
+
+    static void rebuild_status_poll_queue()
+    {
+        // keeps the order of statusCmdQueue, which is also the tie breaker for equally overdue messages
+        statusPollSize = 0;
+        for (auto i = 0; i < MAX_STATUS_CMD_SIZE; i++) {
+            if (statusPollMask & (1u << i))
+                statusPollQueue[statusPollSize++] = StatusPollRuntime{static_cast<uint8_t>(i), statusPollIntervalMs[i]};
+        }
+    }
+
+    void EcodanHeatpump::enable_status_message(GetType type)
+    {
+        for (auto i = 0; i < MAX_STATUS_CMD_SIZE; i++) {
+            if (statusCmdQueue[i].payload_type<GetType>() == type)
+                statusPollMask |= 1u << i;
+        }
+        rebuild_status_poll_queue();
+    }
+
+    void EcodanHeatpump::set_status_poll_interval(GetType type, uint32_t intervalMs)
+    {
+        for (auto i = 0; i < MAX_STATUS_CMD_SIZE; i++) {
+            if (statusCmdQueue[i].payload_type<GetType>() == type)
+                statusPollIntervalMs[i] = intervalMs;
+        }
+        rebuild_status_poll_queue();
+    }
+
     struct ServiceCodeRuntime {
         Status::REQUEST_CODE Request;
         bool IsOutdoorExtendedThermistor{false};
         uint32_t SecondsBetweenCalls{0};
-        std::chrono::time_point<std::chrono::steady_clock> LastAttempt{};
+        uint8_t Priority{0};
+        uint32_t LastAttemptMs{0};
+        bool Attempted{false};
     };
 
-    #define MAX_SERVICE_CODE_CMD_SIZE 5
-    ServiceCodeRuntime serviceCodeCmdQueue[MAX_SERVICE_CODE_CMD_SIZE] = {
-        ServiceCodeRuntime{Status::REQUEST_CODE::COMPRESSOR_STARTS, false, 60*60, std::chrono::steady_clock::now() - std::chrono::seconds(60*60)},
-        ServiceCodeRuntime{Status::REQUEST_CODE::TH4_DISCHARGE_TEMP, true, 0, std::chrono::steady_clock::time_point{}},
-        ServiceCodeRuntime{Status::REQUEST_CODE::TH3_LIQUID_PIPE1_TEMP, true, 0, std::chrono::steady_clock::time_point{}},
-        //ServiceCodeRuntime{Status::REQUEST_CODE::TH6_2_PHASE_PIPE_TEMP, true, 0, std::chrono::steady_clock::time_point{}},
-        //ServiceCodeRuntime{Status::REQUEST_CODE::TH32_SUCTION_PIPE_TEMP, true, 0, std::chrono::steady_clock::time_point{}},
-        //ServiceCodeRuntime{Status::REQUEST_CODE::TH8_HEAT_SINK_TEMP, true, 0, std::chrono::steady_clock::time_point{}},
-        ServiceCodeRuntime{Status::REQUEST_CODE::DISCHARGE_SUPERHEAT, true, 0, std::chrono::steady_clock::time_point{}},
-        //ServiceCodeRuntime{Status::REQUEST_CODE::SUB_COOL, true, 0, std::chrono::steady_clock::time_point{}},
-        ServiceCodeRuntime{Status::REQUEST_CODE::FAN_SPEED, false, 2*60, std::chrono::steady_clock::time_point{}}
-    };
+    // request codes of the configured sensors, added at codegen time (add_request_code)
+    #define MAX_SERVICE_CODE_CMD_SIZE 10
+    ServiceCodeRuntime serviceCodeCmdQueue[MAX_SERVICE_CODE_CMD_SIZE] = {};
+    uint8_t serviceCodeCmdSize = 0;
+
+    void EcodanHeatpump::add_request_code(Status::REQUEST_CODE code, bool isOutdoorExtendedThermistor, uint32_t secondsBetweenCalls, uint8_t priority)
+    {
+        if (serviceCodeCmdSize >= MAX_SERVICE_CODE_CMD_SIZE) {
+            ESP_LOGE(TAG, "Too many request codes, ignoring code %d", static_cast<int16_t>(code));
+            return;
+        }
+        serviceCodeCmdQueue[serviceCodeCmdSize++] = ServiceCodeRuntime{code, isOutdoorExtendedThermistor, secondsBetweenCalls, priority};
+        hasRequestCodeSensors = true;
+    }
+
+    // Index into serviceCodeCmdQueue of the request code to run next, -1 when none is due.
+    // Highest priority wins, equal priorities go to the one that waited longest.
+    static int next_request_code(uint32_t now, bool reportsExtendedOutdoorUnitThermistors)
+    {
+        int next = -1;
+        int64_t nextWaited = -1;
+        for (auto i = 0; i < serviceCodeCmdSize; i++) {
+            auto& request = serviceCodeCmdQueue[i];
+
+            // ftc7 units report these in 0x0f for free
+            if (reportsExtendedOutdoorUnitThermistors && request.IsOutdoorExtendedThermistor)
+                continue;
+
+            int64_t waited = request.Attempted ? static_cast<int64_t>(now - request.LastAttemptMs) : INT32_MAX;
+            if (waited < static_cast<int64_t>(request.SecondsBetweenCalls) * 1000)
+                continue;
+
+            if (next < 0 || request.Priority > serviceCodeCmdQueue[next].Priority
+                || (request.Priority == serviceCodeCmdQueue[next].Priority && waited > nextWaited)) {
+                next = i;
+                nextWaited = waited;
+            }
+        }
+        return next;
+    }
 
     bool EcodanHeatpump::dispatch_next_status_cmd()
     {
@@ -262,56 +328,85 @@ namespace ecodan
             return true;
         
         auto static cmdIndex = 0;
-        auto static serviceCodeCmdIndex = 0;
         auto static loopIndex = 0;
 
-        loopIndex = (loopIndex + 1) % MAX_STATUS_CMD_SIZE;
-
-        // only execute when we have sensors and a ftc version is known, since ftc7 gets a lot for free
-        if (hasRequestCodeSensors && requestCodesEnabled && initialCmdCompleted() && loopIndex == 0) {
-            int counter = 0;
-            while (counter <= MAX_SERVICE_CODE_CMD_SIZE && activeRequestCode == Status::REQUEST_CODE::NONE) {
-                counter++;
-                serviceCodeCmdIndex = (serviceCodeCmdIndex + 1) % MAX_SERVICE_CODE_CMD_SIZE;
-                auto& request = serviceCodeCmdQueue[serviceCodeCmdIndex];
-
-                // check if svc code should be executed
-                if (status.ReportsExtendedOutdoorUnitThermistors && request.IsOutdoorExtendedThermistor)
-                    continue;
-
-                if (request.SecondsBetweenCalls > 0) {
-                    auto allow_run = std::chrono::steady_clock::now() - request.LastAttempt > std::chrono::seconds(request.SecondsBetweenCalls);
-                    if (!allow_run) // skip and handle next service call 
-                        continue;
+        // nothing selected at codegen time, poll everything
+        if (statusPollSize == 0) {
+            for (auto& cmd : statusCmdQueue)
+                enable_status_message(cmd.payload_type<GetType>());
+        }
 
-                    serviceCodeCmdQueue[serviceCodeCmdIndex].LastAttempt = std::chrono::steady_clock::now();
-                } 
-                activeRequestCode = serviceCodeCmdQueue[serviceCodeCmdIndex].Request;
+        loopIndex = (loopIndex + 1) % statusPollSize;
+        // the table wrapped: the replies to the last round are in, publish them as one batch
+        if (loopIndex == 0)
+            batchRoundDone = true;
+
+        // only execute when we have sensors and a ftc version is known, since ftc7 gets a lot for free.
+        // A negative budget means request codes used more than their share of bus time recently.
+        if (hasRequestCodeSensors && requestCodesEnabled && initialCmdCompleted() && loopIndex == 0 && requestCodeCreditMs >= 0.0f) {
+            auto next = next_request_code(millis(), status.ReportsExtendedOutdoorUnitThermistors);
+            if (next >= 0) {
+                auto& request = serviceCodeCmdQueue[next];
+                request.Attempted = true;
+                request.LastAttemptMs = millis();
+                activeRequestCode = request.Request;
+                activeRequestCodeStartMs = request.LastAttemptMs;
+                //ESP_LOGE(TAG, "Active svc: %d", static_cast<int16_t>(activeRequestCode));
+                return true;
             }
-            //ESP_LOGE(TAG, "Active svc: %d", static_cast<int16_t>(activeRequestCode));
-            return true;
         }
 
-        cmdIndex = (cmdIndex + 1) % (!initialCmdCompleted() ? MAX_INITIAL_CMD_SIZE : MAX_STATUS_CMD_SIZE);
-        auto& cmd = !initialCmdCompleted() ? initialCmdQueue[cmdIndex] : statusCmdQueue[cmdIndex];
+        StatusPollRuntime* poll = nullptr;
+        if (!initialCmdCompleted()) {
+            cmdIndex = (cmdIndex + 1) % MAX_INITIAL_CMD_SIZE;
+        }
+        else {
+            auto next = next_status_poll(statusPollQueue, statusPollSize, millis());
+            if (next < 0) // every message was polled within its interval, leave the bus idle
+                return true;
+            poll = &statusPollQueue[next];
+        }
+
+        auto& cmd = poll == nullptr ? initialCmdQueue[cmdIndex] : statusCmdQueue[poll->Cmd];
         if (!serial_tx(cmd))
         {
             ESP_LOGI(TAG, "Unable to dispatch status update request, flushing queued requests...");
             cmdIndex = 0;
-            serviceCodeCmdIndex = 0;
             reset_connection();
             return false;
         }
+
+        if (poll != nullptr) {
+            poll->Sent = true;
+            poll->LastSentMs = millis();
+        }
         return true;
     }
 
     bool EcodanHeatpump::handle_active_request_codes() {
 
         const unsigned long REQUEST_RETRY_INTERVAL = 1*1000; 
+        const float REQUEST_BUDGET_BURST_MS = 5*1000;
+        const unsigned long REQUEST_MAX_DURATION_MS = 15*1000;
         static unsigned long last_svc_request_time = 0;
 
+        // bus time budget as a token bucket: time spent waiting for a request code is paid from
+        // credit that accrues at requestCodeBudget per elapsed ms
+        unsigned long current_time = millis();
+        float elapsed = static_cast<float>(current_time - requestCodeBudgetUpdateMs);
+        requestCodeBudgetUpdateMs = current_time;
+        requestCodeCreditMs += elapsed * requestCodeBudget;
+        if (activeRequestCode != Status::REQUEST_CODE::NONE)
+            requestCodeCreditMs -= elapsed;
+        requestCodeCreditMs = std::min(requestCodeCreditMs, REQUEST_BUDGET_BURST_MS);
+
         if (activeRequestCode != Status::REQUEST_CODE::NONE) {
-            unsigned long current_time = millis();
+            if (current_time - activeRequestCodeStartMs > REQUEST_MAX_DURATION_MS) {
+                ESP_LOGW(TAG, "No reply to service request (code %d), giving up", static_cast<int16_t>(activeRequestCode));
+                activeRequestCode = Status::REQUEST_CODE::NONE;
+                return true;
+            }
+
             if (current_time - last_svc_request_time >= REQUEST_RETRY_INTERVAL) {
                 ESP_LOGD(TAG, "Sending active service request (code %d)...", activeRequestCode);
                 Message svc_cmd{MsgType::GET_CMD, GetType::SERVICE_REQUEST_CODE, static_cast<int16_t>(activeRequestCode)};
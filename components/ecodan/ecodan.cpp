@@ -21,6 +21,7 @@ namespace ecodan
     void EcodanHeatpump::setup() {
         heatpumpInitialized = initialize();
         this->last_proxy_activity_ = std::chrono::steady_clock::now();
+        setup_capture();
 
         BaseType_t task_core_id;
 #if CONFIG_FREERTOS_UNICORE
@@ -40,43 +41,16 @@ namespace ecodan
         );
     }
 
-
-    void EcodanHeatpump::publish_state(const std::string& sensorKey, float sensorValue) {
-        auto sensor_it = sensors.find(sensorKey);
-        if (sensor_it != sensors.end()) {
-            sensor_it->second->publish_state(sensorValue);
-        } 
-        else 
-        {
-            ESP_LOGI(TAG, "Could not publish state of sensor '%s' with value: '%f'", sensorKey.c_str(), sensorValue);
-        }
-    }
-
-    void EcodanHeatpump::publish_state(const std::string& sensorKey, const std::string& sensorValue) {        
-        auto textSensor_it = textSensors.find(sensorKey);
-        if (textSensor_it != textSensors.end()) {
-            textSensor_it->second->publish_state(sensorValue);
-        }
-        else 
-        {
-            ESP_LOGI(TAG, "Could not publish state of sensor '%s' with value: '%s'", sensorKey.c_str(), sensorValue.c_str());
-        }
-    }
-
-    void EcodanHeatpump::publish_state(const std::string& sensorKey, bool sensorValue) {
-        auto binarySensor_it = binarySensors.find(sensorKey);
-        if (binarySensor_it != binarySensors.end()) {
-            binarySensor_it->second->publish_state(sensorValue);
-        }
-        else 
-        {
-            ESP_LOGI(TAG, "Could not publish state of sensor '%s' with value: '%d'", sensorKey.c_str(), sensorValue);
-        }
-    }
-
     void EcodanHeatpump::update() {        
         if (heatpumpInitialized)
             handle_loop();            
+
+        if (millis() - lastSuppressedReportMs >= 60000) {
+            lastSuppressedReportMs = millis();
+            publish_state(SensorKey::PUBLISHES_SUPPRESSED, static_cast<float>(publishesSuppressed));
+        }
+
+        publish_batch();
     }
 
     void EcodanHeatpump::dump_config() {
@@ -126,6 +100,8 @@ namespace ecodan
             received_message.reset();
         }
         
+        handle_capture();
+
         auto now = std::chrono::steady_clock::now();
         if (now - last_response > std::chrono::seconds(90))
         {
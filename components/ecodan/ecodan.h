@@ -5,6 +5,11 @@
 #include <chrono>
 #include <optional>
 #include <atomic>
+#include <array>
+#include <vector>
+#include <memory>
+#include <cmath>
+#include <bitset>
 
 #include "esphome.h"
 #include "esphome/core/component.h"
@@ -13,6 +18,10 @@
 #include "esphome/components/sensor/sensor.h"
 #include "esphome/components/text_sensor/text_sensor.h"
 #include "esphome/components/binary_sensor/binary_sensor.h"
+#include "esphome/components/socket/socket.h"
+#ifdef USE_MQTT
+#include "esphome/components/mqtt/mqtt_client.h"
+#endif
 #include "esphome/components/thermostat/thermostat_climate.h"
 
 #include "freertos/FreeRTOS.h"
@@ -22,6 +31,7 @@
 
 #include "proto.h"
 #include "status.h"
+#include "keys.h"
 
 namespace esphome {
 namespace ecodan 
@@ -34,6 +44,31 @@ namespace ecodan
         unsigned long last_sent_time = 0; 
     };
 
+    // publish-on-change for one sensor (deadband/heartbeat options in sensor.py, off unless
+    // configured), a negative deadband passes every value
+    struct PublishFilter {
+        float deadband = -1.0f;
+        uint32_t heartbeatMs = 0;
+        float lastValue = NAN;
+        uint32_t lastPublishMs = 0;
+        bool published = false;
+
+        bool accept(float value, uint32_t now) {
+            if (deadband >= 0.0f && published) {
+                // decoded values are multiples of 0.01, leave room for float rounding at the edge
+                bool unchanged = std::isnan(value) ? std::isnan(lastValue)
+                    : (value == lastValue || std::fabs(value - lastValue) < deadband - 1e-4f);
+                bool heartbeatDue = heartbeatMs != 0 && now - lastPublishMs >= heartbeatMs;
+                if (unchanged && !heartbeatDue)
+                    return false;
+            }
+            lastValue = value;
+            lastPublishMs = now;
+            published = true;
+            return true;
+        }
+    };
+
     class EcodanHeatpump : public PollingComponent {
     public:        
         EcodanHeatpump();
@@ -42,31 +77,36 @@ namespace ecodan
         void loop() override;
         void dump_config() override;    
     
-        void register_sensor(sensor::Sensor *obj, const std::string& key) {
-            if (obj != nullptr)
-                sensors[key] = obj;
+        void register_sensor(sensor::Sensor *obj, SensorKey key) {
+            sensors[key_index(key)] = obj;
         }
 
-        void register_textSensor(text_sensor::TextSensor *obj, const std::string& key) {
-            if (obj != nullptr) 
-                textSensors[key] = obj;
+        void set_publish_filter(SensorKey key, float deadband, uint32_t heartbeatMs) {
+            auto &filter = publishFilters[key_index(key)];
+            filter.deadband = deadband;
+            filter.heartbeatMs = heartbeatMs;
         }
 
-        void register_binarySensor(binary_sensor::BinarySensor *obj, const std::string& key) {
-            if (obj != nullptr) {
-                obj->publish_state(false);
-                binarySensors[key] = obj;
-            }
+        void register_textSensor(text_sensor::TextSensor *obj, TextSensorKey key) {
+            textSensors[key_index(key)] = obj;
         }
 
-        void enable_request_code_sensors() {
-            hasRequestCodeSensors = true;
+        void register_binarySensor(binary_sensor::BinarySensor *obj, BinarySensorKey key) {
+            if (obj != nullptr)
+                obj->publish_state(false);
+            binarySensors[key_index(key)] = obj;
         }
 
+        void add_request_code(Status::REQUEST_CODE code, bool isOutdoorExtendedThermistor, uint32_t secondsBetweenCalls, uint8_t priority);
+        void set_request_code_budget(float budget) { requestCodeBudget = budget; }
+
         void enable_request_codes(bool enable) {
             requestCodesEnabled = enable;
         }
 
+        void enable_status_message(GetType type);
+        void set_status_poll_interval(GetType type, uint32_t intervalMs);
+
         // exposed as external component commands
         void set_ignore_slave_cmd(bool ignoreCmds) { ignoreSlaveCMDs = ignoreCmds; };
         void set_room_temperature(float value, esphome::ecodan::Zone zone);
@@ -85,18 +125,52 @@ namespace ecodan
         void set_polling_interval(uint32_t ms) { this->set_update_interval(ms); }
         void set_uart_parent(uart::UARTComponent *uart) { this->uart_ = uart; }
         void set_proxy_uart(uart::UARTComponent *uart) { this->proxy_uart_ = uart; }
+        void set_bus_capture_port(uint16_t port) { busCapturePort = port; }
+        void set_mqtt_batch_topic(const std::string &topic) { mqttBatchTopic = topic; }
+        void set_mqtt_batch_interval(uint32_t ms) { mqttBatchIntervalMs = ms; }
         const Status& get_status() const { return status; }
         std::optional<CONTROLLER_FLAG> get_svc_state_before_lockout() { return serverControlFlagBeforeLockout; }
 
     protected:
-        std::map<std::string, sensor::Sensor*> sensors;
-        std::map<std::string, text_sensor::TextSensor*> textSensors;
-        std::map<std::string, binary_sensor::BinarySensor*> binarySensors;
+        // indexed by the generated key enums (keys.h), unconfigured entries stay nullptr
+        std::array<sensor::Sensor*, key_index(SensorKey::COUNT)> sensors{};
+        std::array<text_sensor::TextSensor*, key_index(TextSensorKey::COUNT)> textSensors{};
+        std::array<binary_sensor::BinarySensor*, key_index(BinarySensorKey::COUNT)> binarySensors{};
+        std::array<PublishFilter, key_index(SensorKey::COUNT)> publishFilters{};
+        uint32_t publishesSuppressed = 0;
+        uint32_t lastSuppressedReportMs = 0;
 
         // publish func
-        void publish_state(const std::string& sensorKey, float sensorValue);
-        void publish_state(const std::string& sensorKey, const std::string& sensorValue);
-        void publish_state(const std::string& sensorKey, bool sensorValue);
+        void publish_state(SensorKey key, float sensorValue) {
+            auto *sensor = sensors[key_index(key)];
+            if (sensor == nullptr)
+                return;
+            // a configured filter also holds back the sensor's state and its on_value callbacks,
+            // not only the API, MQTT and web server publishes, hence opt-in per sensor
+            if (!publishFilters[key_index(key)].accept(sensorValue, millis())) {
+                publishesSuppressed++;
+                return;
+            }
+            // compared before the sensor's own filters: with filter_out nan, or any multiply/offset/
+            // lambda filter, state never equals the polled value and every poll would count as a change
+            bool changed = std::isnan(sensorValue) ? !std::isnan(sensor->raw_state) : sensor->raw_state != sensorValue;
+            sensor->publish_state(sensorValue);
+            if (changed)
+                batchSensors.set(key_index(key));
+        }
+
+        void publish_state(TextSensorKey key, const std::string& sensorValue) {
+            if (auto *textSensor = textSensors[key_index(key)])
+                textSensor->publish_state(sensorValue);
+        }
+
+        void publish_state(BinarySensorKey key, bool sensorValue) {
+            if (auto *binarySensor = binarySensors[key_index(key)]) {
+                if (!binarySensor->has_state() || binarySensor->state != sensorValue)
+                    batchBinarySensors.set(key_index(key));
+                binarySensor->publish_state(sensorValue);
+            }
+        }
 
         bool begin_connect();
 
@@ -120,6 +194,10 @@ namespace ecodan
         bool hasRequestCodeSensors = false;
         bool requestCodesEnabled = true;
         Status::REQUEST_CODE activeRequestCode = Status::REQUEST_CODE::NONE;
+        uint32_t activeRequestCodeStartMs = 0;
+        float requestCodeBudget = 0.2f;
+        float requestCodeCreditMs = 0.0f;
+        uint32_t requestCodeBudgetUpdateMs = 0;
 
         std::optional<CONTROLLER_FLAG> serverControlFlagBeforeLockout = {};
         std::queue<QueuedCommand> cmdQueue;
@@ -149,6 +227,8 @@ namespace ecodan
         
         void handle_response(Message& res);
         void handle_get_response(Message& res);
+        // plain Status fields, generated from scripts/cn105.py into fields.cpp
+        bool decode_fields(Message& res);
         void handle_set_response(Message& res);
         void handle_connect_response(Message& res);
 
@@ -156,6 +236,43 @@ namespace ecodan
         bool proxy_available();
         void serial_io_task();
         void process_serial_byte(uint8_t byte, Message& buffer, bool is_proxy_message);
+
+        // raw frame capture for scripts/cn105_capture.py (capture.cpp)
+        enum class CaptureDirection : uint8_t {
+            FROM_FTC = 0,
+            TO_FTC = 1,
+            FROM_SLAVE = 2
+        };
+
+        struct CaptureRecord {
+            uint32_t timestampUs;
+            uint8_t flags;
+            uint8_t length;
+            uint8_t data[HEADER_SIZE_B + PAYLOAD_SIZE + CHECKSUM_SIZE];
+        };
+
+        uint16_t busCapturePort = 0;
+        QueueHandle_t capture_queue_ = nullptr;
+        std::unique_ptr<socket::Socket> capture_server_;
+        std::unique_ptr<socket::Socket> capture_client_;
+        std::vector<uint8_t> capturePending;
+        std::atomic<bool> captureActive{false};
+        std::atomic<uint32_t> captureDropped{0};
+
+        void setup_capture();
+        void handle_capture();
+        void close_capture_client();
+        void capture_frame(CaptureDirection direction, const uint8_t *data, uint8_t length, bool valid);
+
+        // changed values batched into one JSON document per poll round (mqtt_batch.cpp)
+        std::string mqttBatchTopic;
+        std::bitset<key_index(SensorKey::COUNT)> batchSensors;
+        std::bitset<key_index(BinarySensorKey::COUNT)> batchBinarySensors;
+        bool batchRoundDone = false;        // set by dispatch_next_status_cmd when the poll table wraps
+        uint32_t mqttBatchIntervalMs = 60000;   // flush anyway after this long without a finished round
+        uint32_t lastBatchMs = 0;
+
+        void publish_batch();
         
         static void serial_io_task_trampoline(void *arg) {
             static_cast<EcodanHeatpump*>(arg)->serial_io_task();
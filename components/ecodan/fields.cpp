@@ -0,0 +1,235 @@
+// Generated by scripts/generate_fields.py from cn105.FIELDS in scripts/cn105.py; do not edit.
+#include "ecodan.h"
+
+namespace esphome {
+namespace ecodan
+{
+    static bool any_nonzero(Message& res, size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+            if (res[i] != 0)
+                return true;
+        }
+        return false;
+    }
+
+    bool EcodanHeatpump::decode_fields(Message& res)
+    {
+        switch (res.payload_type<GetType>())
+        {
+        case GetType::DEFROST_STATE:
+            status.MasterZone1 = static_cast<decltype(status.MasterZone1)>(res[1]);
+            status.MasterZone2 = static_cast<decltype(status.MasterZone2)>(res[2]);
+            status.DefrostActive = res[3] != 0;
+            publish_state(BinarySensorKey::STATUS_DEFROST, status.DefrostActive);
+            return true;
+        case GetType::ERROR_STATE:
+            status.RefrigerantErrorCode = static_cast<decltype(status.RefrigerantErrorCode)>(res[1]);
+            status.FaultCodeNumeric = res.get_u16(2);
+            status.FaultCodeLetters = res.get_u16(4);
+            status.MultiZoneStatus = static_cast<decltype(status.MultiZoneStatus)>(res[8]);
+            publish_state(SensorKey::REFRIGERANT_ERROR_CODE, static_cast<float>(status.RefrigerantErrorCode));
+            publish_state(SensorKey::STATUS_MULTI_ZONE, static_cast<float>(status.MultiZoneStatus));
+            return true;
+        case GetType::COMPRESSOR_FREQUENCY:
+            status.CompressorFrequency = static_cast<decltype(status.CompressorFrequency)>(res[1]);
+            publish_state(SensorKey::COMPRESSOR_FREQUENCY, static_cast<float>(status.CompressorFrequency));
+            return true;
+        case GetType::DHW_STATE:
+            status.HeatSource = static_cast<decltype(status.HeatSource)>(res[6]);
+            publish_state(SensorKey::HEAT_SOURCE, static_cast<float>(status.HeatSource));
+            return true;
+        case GetType::HEATING_POWER:
+            status.OutputPower = static_cast<decltype(status.OutputPower)>(res[6]);
+            status.EnergyConsumedIncreasing = res.get_u16(11) / 10.0f;
+            publish_state(SensorKey::OUTPUT_POWER, static_cast<float>(status.OutputPower));
+            publish_state(SensorKey::ENERGY_CONSUMED_INCREASING, status.EnergyConsumedIncreasing);
+            return true;
+        case GetType::TEMPERATURE_CONFIG:
+            status.Zone1SetTemperature = res.get_float16(1);
+            status.Zone2SetTemperature = res.get_float16(3);
+            status.Zone1FlowTemperatureSetPoint = res.get_float16(5);
+            status.Zone2FlowTemperatureSetPoint = res.get_float16(7);
+            status.LegionellaPreventionSetPoint = res.get_float16(9);
+            status.DhwTemperatureDrop = res.get_float8_v2(11);
+            status.MaximumFlowTemperature = res.get_float8_v2(12);
+            status.MinimumFlowTemperature = res.get_float8_v2(13);
+            publish_state(SensorKey::Z1_ROOM_TEMP_TARGET, status.Zone1SetTemperature);
+            publish_state(SensorKey::Z2_ROOM_TEMP_TARGET, status.Zone2SetTemperature);
+            publish_state(SensorKey::Z1_FLOW_TEMP_TARGET, status.Zone1FlowTemperatureSetPoint);
+            publish_state(SensorKey::Z2_FLOW_TEMP_TARGET, status.Zone2FlowTemperatureSetPoint);
+            publish_state(SensorKey::LEGIONELLA_PREVENTION_TEMP, status.LegionellaPreventionSetPoint);
+            publish_state(SensorKey::DHW_FLOW_TEMP_DROP, status.DhwTemperatureDrop);
+            return true;
+        case GetType::SH_TEMPERATURE_STATE:
+            status.Zone1RoomTemperature = res[1] != 0xF0 ? res.get_float16(1) : 0.0f;
+            status.Zone2RoomTemperature = res[3] != 0xF0 ? res.get_float16(3) : 0.0f;
+            status.OutsideTemperature = res.get_float8(11, 40.0f);
+            status.HpRefrigerantLiquidTemperature = res.get_float16_signed(8);
+            publish_state(SensorKey::Z1_ROOM_TEMP, status.Zone1RoomTemperature);
+            publish_state(SensorKey::Z2_ROOM_TEMP, status.Zone2RoomTemperature);
+            publish_state(SensorKey::OUTSIDE_TEMP, status.OutsideTemperature);
+            publish_state(SensorKey::HP_REFRIGERANT_TEMP, status.HpRefrigerantLiquidTemperature);
+            return true;
+        case GetType::TEMPERATURE_STATE_A:
+            status.HpFeedTemperature = res.get_float16(1);
+            status.HpReturnTemperature = res.get_float16(4);
+            status.DhwTemperature = res.get_float16(7);
+            status.DhwSecondaryTemperature = res.get_float16(10);
+            publish_state(SensorKey::HP_FEED_TEMP, status.HpFeedTemperature);
+            publish_state(SensorKey::HP_RETURN_TEMP, status.HpReturnTemperature);
+            publish_state(SensorKey::DHW_TEMP, status.DhwTemperature);
+            publish_state(SensorKey::DHW_SECONDARY_TEMP, status.DhwSecondaryTemperature);
+            return true;
+        case GetType::TEMPERATURE_STATE_B:
+            status.Z1FeedTemperature = res.get_float16(1);
+            status.Z1ReturnTemperature = res.get_float16(4);
+            status.Z2FeedTemperature = res.get_float16(7);
+            status.Z2ReturnTemperature = res.get_float16(10);
+            publish_state(SensorKey::Z1_FEED_TEMP, status.Z1FeedTemperature);
+            publish_state(SensorKey::Z1_RETURN_TEMP, status.Z1ReturnTemperature);
+            publish_state(SensorKey::Z2_FEED_TEMP, status.Z2FeedTemperature);
+            publish_state(SensorKey::Z2_RETURN_TEMP, status.Z2ReturnTemperature);
+            return true;
+        case GetType::TEMPERATURE_STATE_C:
+            status.BoilerFlowTemperature = res.get_float16(1);
+            status.BoilerReturnTemperature = res.get_float16(4);
+            publish_state(SensorKey::BOILER_FLOW_TEMP, status.BoilerFlowTemperature);
+            publish_state(SensorKey::BOILER_RETURN_TEMP, status.BoilerReturnTemperature);
+            return true;
+        case GetType::TEMPERATURE_STATE_D:
+            status.MixingTankTemperature = res.get_float16(1);
+            status.HpRefrigerantCondensingTemperature = (res[4] == 0x0F && res[5] == 0xD9) ? res.get_float8_v3(6) : res.get_float16_signed(4);
+            status.ReportsExtendedOutdoorUnitThermistors = status.ReportsExtendedOutdoorUnitThermistors || any_nonzero(res, 7, 15);
+            if (status.ReportsExtendedOutdoorUnitThermistors) {
+                status.RcDischargeTemp = static_cast<decltype(status.RcDischargeTemp)>(res[7]);
+                status.RcOuLiquidPipeTemp = res.get_float8(8, 39.0f);
+                status.RcOuTwoPhasePipeTemp = res.get_float8(9, 39.0f);
+                status.RcOuSuctionPipeTemp = res.get_float8(10, 39.0f);
+                status.RcOuHeatSinkTemp = res[11] - 40.0f;
+                status.RcOuCompressorSurfaceTemp = res[12] - 40.0f;
+                status.RcDischargeSuperHeatTemp = static_cast<decltype(status.RcDischargeSuperHeatTemp)>(res[13]);
+                status.RcSubCoolTemp = res.get_float8(14, 39.0f);
+            }
+            publish_state(SensorKey::MIXING_TANK_TEMP, status.MixingTankTemperature);
+            publish_state(SensorKey::HP_REFRIGERANT_CONDENSING_TEMP, status.HpRefrigerantCondensingTemperature);
+            if (status.ReportsExtendedOutdoorUnitThermistors) {
+                publish_state(SensorKey::DISCHARGE_TEMP, static_cast<float>(status.RcDischargeTemp));
+                publish_state(SensorKey::OU_LIQUID_PIPE_TEMP, status.RcOuLiquidPipeTemp);
+                publish_state(SensorKey::OU_TWO_PHASE_PIPE_TEMP, status.RcOuTwoPhasePipeTemp);
+                publish_state(SensorKey::OU_SUCTION_PIPE_TEMP, status.RcOuSuctionPipeTemp);
+                publish_state(SensorKey::OU_HEATSINK_TEMP, status.RcOuHeatSinkTemp);
+                publish_state(SensorKey::OU_COMPRESSOR_SURFACE_TEMP, status.RcOuCompressorSurfaceTemp);
+                publish_state(SensorKey::SUPER_HEAT_TEMP, static_cast<float>(status.RcDischargeSuperHeatTemp));
+                publish_state(SensorKey::SUB_COOL_TEMP, status.RcSubCoolTemp);
+            }
+            return true;
+        case GetType::EXTERNAL_STATE:
+            status.In1ThermostatRequest = res[1] != 0;
+            status.In6ThermostatRequest = res[2] != 0;
+            status.In5ThermostatRequest = res[3] != 0;
+            publish_state(BinarySensorKey::STATUS_IN1_REQUEST, status.In1ThermostatRequest);
+            publish_state(BinarySensorKey::STATUS_IN6_REQUEST, status.In6ThermostatRequest);
+            publish_state(BinarySensorKey::STATUS_IN5_REQUEST, status.In5ThermostatRequest);
+            return true;
+        case GetType::DIP_SWITCHES:
+            status.DipSwitch1 = static_cast<decltype(status.DipSwitch1)>(res[1]);
+            status.DipSwitch2 = static_cast<decltype(status.DipSwitch2)>(res[3]);
+            status.DipSwitch3 = static_cast<decltype(status.DipSwitch3)>(res[5]);
+            status.DipSwitch4 = static_cast<decltype(status.DipSwitch4)>(res[7]);
+            status.DipSwitch5 = static_cast<decltype(status.DipSwitch5)>(res[9]);
+            status.DipSwitch6 = static_cast<decltype(status.DipSwitch6)>(res[11]);
+            status.DipSwitch7 = static_cast<decltype(status.DipSwitch7)>(res[13]);
+            return true;
+        case GetType::ACTIVE_TIME:
+            status.CompressorOn = res[1] != 0;
+            status.Runtime = res.get_float24_v2(3);
+            publish_state(BinarySensorKey::STATUS_COMPRESSOR, status.CompressorOn);
+            publish_state(SensorKey::RUNTIME, status.Runtime);
+            return true;
+        case GetType::FLOW_RATE:
+            status.BoosterActive = res[2] != 0;
+            status.Booster2Active = res[3] != 0;
+            status.ImmersionActive = res[5] != 0;
+            status.FlowRate = static_cast<decltype(status.FlowRate)>(res[12]);
+            publish_state(BinarySensorKey::STATUS_BOOSTER, status.BoosterActive);
+            publish_state(BinarySensorKey::STATUS_BOOSTER_2, status.Booster2Active);
+            publish_state(BinarySensorKey::STATUS_IMMERSION, status.ImmersionActive);
+            publish_state(SensorKey::FLOW_RATE, static_cast<float>(status.FlowRate));
+            return true;
+        case GetType::PUMP_STATUS_A:
+            status.WaterPumpActive = res[1] != 0;
+            status.PumpPWM = static_cast<decltype(status.PumpPWM)>(res[2]);
+            status.PumpFeedback = static_cast<decltype(status.PumpFeedback)>(res[3]);
+            status.WaterPump2Active = res[4] != 0;
+            status.WaterPump3Active = res[5] != 0;
+            status.ThreeWayValveActive = res[6] != 0;
+            status.ThreeWayValve2Active = res[7] != 0;
+            status.MixingValveStep = static_cast<decltype(status.MixingValveStep)>(res[10]);
+            status.MixingValveStatus = static_cast<decltype(status.MixingValveStatus)>(res[11]);
+            publish_state(BinarySensorKey::STATUS_WATER_PUMP, status.WaterPumpActive);
+            publish_state(BinarySensorKey::STATUS_WATER_PUMP_2, status.WaterPump2Active);
+            publish_state(BinarySensorKey::STATUS_WATER_PUMP_3, status.WaterPump3Active);
+            publish_state(BinarySensorKey::STATUS_THREE_WAY_VALVE, status.ThreeWayValveActive);
+            publish_state(BinarySensorKey::STATUS_THREE_WAY_VALVE_2, status.ThreeWayValve2Active);
+            publish_state(SensorKey::MIXING_VALVE_STEP, static_cast<float>(status.MixingValveStep));
+            publish_state(SensorKey::STATUS_MIXING_VALVE, static_cast<float>(status.MixingValveStatus));
+            return true;
+        case GetType::PUMP_STATUS_B:
+            status.MixingValveStepZ1 = static_cast<decltype(status.MixingValveStepZ1)>(res[8]);
+            publish_state(SensorKey::MIXING_VALVE_STEP_Z1, static_cast<float>(status.MixingValveStepZ1));
+            return true;
+        case GetType::MODE_FLAGS_A:
+            status.Power = static_cast<decltype(status.Power)>(res[3]);
+            status.Operation = static_cast<decltype(status.Operation)>(res[4]);
+            status.HotWaterMode = static_cast<decltype(status.HotWaterMode)>(res[5]);
+            status.HeatingCoolingMode = static_cast<decltype(status.HeatingCoolingMode)>(res[6]);
+            status.HeatingCoolingModeZone2 = static_cast<decltype(status.HeatingCoolingModeZone2)>(res[7]);
+            status.DhwFlowTemperatureSetPoint = res.get_float16(8);
+            status.MRCFlag = static_cast<decltype(status.MRCFlag)>(res[14]);
+            publish_state(SensorKey::DHW_FLOW_TEMP_TARGET, status.DhwFlowTemperatureSetPoint);
+            return true;
+        case GetType::MODE_FLAGS_B:
+            status.DhwForcedActive = res[3] != 0;
+            status.HolidayMode = res[4] != 0;
+            status.ProhibitDhw = res[5] != 0;
+            status.ProhibitHeatingZ1 = res[6] != 0;
+            status.ProhibitCoolingZ1 = res[7] != 0;
+            status.ProhibitHeatingZ2 = res[8] != 0;
+            status.ProhibitCoolingZ2 = res[9] != 0;
+            status.ServerControl = res[10] != 0;
+            publish_state(BinarySensorKey::STATUS_DHW_FORCED, status.DhwForcedActive);
+            publish_state(BinarySensorKey::STATUS_HOLIDAY, status.HolidayMode);
+            publish_state(BinarySensorKey::STATUS_PROHIBIT_DHW, status.ProhibitDhw);
+            publish_state(BinarySensorKey::STATUS_PROHIBIT_HEATING_Z1, status.ProhibitHeatingZ1);
+            publish_state(BinarySensorKey::STATUS_PROHIBIT_COOL_Z1, status.ProhibitCoolingZ1);
+            publish_state(BinarySensorKey::STATUS_PROHIBIT_HEATING_Z2, status.ProhibitHeatingZ2);
+            publish_state(BinarySensorKey::STATUS_PROHIBIT_COOL_Z2, status.ProhibitCoolingZ2);
+            publish_state(BinarySensorKey::STATUS_SERVER_CONTROL, status.ServerControl);
+            return true;
+        case GetType::ENERGY_USAGE:
+            status.EnergyConsumedHeating = res.get_float24(4);
+            status.EnergyConsumedCooling = res.get_float24(7);
+            status.EnergyConsumedDhw = res.get_float24(10);
+            publish_state(SensorKey::HEATING_CONSUMED, status.EnergyConsumedHeating);
+            publish_state(SensorKey::COOL_CONSUMED, status.EnergyConsumedCooling);
+            publish_state(SensorKey::DHW_CONSUMED, status.EnergyConsumedDhw);
+            return true;
+        case GetType::ENERGY_DELIVERY:
+            status.EnergyDeliveredHeating = res.get_float24(4);
+            status.EnergyDeliveredCooling = res.get_float24(7);
+            status.EnergyDeliveredDhw = res.get_float24(10);
+            publish_state(SensorKey::HEATING_DELIVERED, status.EnergyDeliveredHeating);
+            publish_state(SensorKey::COOL_DELIVERED, status.EnergyDeliveredCooling);
+            publish_state(SensorKey::DHW_DELIVERED, status.EnergyDeliveredDhw);
+            return true;
+        case GetType::HARDWARE_CONFIGURATION:
+            status.Controller = static_cast<decltype(status.Controller)>(res[6]);
+            publish_state(SensorKey::CONTROLLER_VERSION, static_cast<float>(status.Controller));
+            return true;
+        default:
+            return false;
+        }
+    }
+
+} // namespace ecodan
+} // namespace esphome
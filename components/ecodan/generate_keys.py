@@ -0,0 +1,62 @@
+import ast
+import os
+
+# Platform schema file -> name of the generated enum. Every cv.Optional("key") in the schema
+# becomes one enumerator, in schema order, so the enums index flat arrays in EcodanHeatpump.
+PLATFORMS = [
+    ("sensor.py", "SensorKey"),
+    ("binary_sensor.py", "BinarySensorKey"),
+    ("text_sensor.py", "TextSensorKey"),
+]
+
+
+def schema_keys(path):
+    """Return the string keys of every cv.Optional(...) in the platform's CONFIG_SCHEMA, in order."""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "CONFIG_SCHEMA" for t in node.targets):
+            keys = []
+            for call in ast.walk(node):
+                if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+                        and call.func.attr == "Optional" and call.args
+                        and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str)):
+                    keys.append(call.args[0].value)
+            return keys
+    raise RuntimeError(f"No CONFIG_SCHEMA in {path}")
+
+
+def generate_header(output_file):
+    blocks = []
+    for source_file, enum_name in PLATFORMS:
+        keys = schema_keys(source_file)
+        lines = [f"        {key.upper()} = {i}," for i, key in enumerate(keys)]
+        lines.append(f"        COUNT = {len(keys)}")
+        blocks.append(f"    enum class {enum_name} : uint8_t {{\n" + "\n".join(lines) + "\n    };")
+
+    header_content = f"""#pragma once
+// Generated by generate_keys.py from the sensor, binary_sensor and text_sensor schemas; do not edit.
+#include <stdint.h>
+
+namespace esphome {{
+namespace ecodan
+{{
+{chr(10).join(blocks)}
+
+    template<typename Key>
+    constexpr uint8_t key_index(Key key) {{ return static_cast<uint8_t>(key); }}
+
+}} // namespace ecodan
+}} // namespace esphome
+"""
+
+    with open(output_file, 'w') as f:
+        f.write(header_content)
+
+    print(f"Success! {output_file} generated.")
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    generate_header("keys.h")
@@ -0,0 +1,117 @@
+#pragma once
+// Generated by generate_keys.py from the sensor, binary_sensor and text_sensor schemas; do not edit.
+#include <stdint.h>
+
+namespace esphome {
+namespace ecodan
+{
+    enum class SensorKey : uint8_t {
+        COMPRESSOR_FREQUENCY = 0,
+        OUTPUT_POWER = 1,
+        COMPUTED_OUTPUT_POWER = 2,
+        OUTSIDE_TEMP = 3,
+        HP_FEED_TEMP = 4,
+        HP_RETURN_TEMP = 5,
+        HP_REFRIGERANT_TEMP = 6,
+        HP_REFRIGERANT_CONDENSING_TEMP = 7,
+        BOILER_FLOW_TEMP = 8,
+        BOILER_RETURN_TEMP = 9,
+        DHW_TEMP = 10,
+        DHW_SECONDARY_TEMP = 11,
+        DHW_FLOW_TEMP_TARGET = 12,
+        DHW_FLOW_TEMP_DROP = 13,
+        LEGIONELLA_PREVENTION_TEMP = 14,
+        FLOW_RATE = 15,
+        ENERGY_CONSUMED_INCREASING = 16,
+        COOL_COP = 17,
+        COOL_CONSUMED = 18,
+        COOL_DELIVERED = 19,
+        HEATING_COP = 20,
+        HEATING_CONSUMED = 21,
+        HEATING_DELIVERED = 22,
+        DHW_COP = 23,
+        DHW_CONSUMED = 24,
+        DHW_DELIVERED = 25,
+        Z1_FLOW_TEMP_TARGET = 26,
+        Z1_ROOM_TEMP = 27,
+        Z1_ROOM_TEMP_TARGET = 28,
+        Z1_FEED_TEMP = 29,
+        Z1_RETURN_TEMP = 30,
+        Z2_FEED_TEMP = 31,
+        Z2_RETURN_TEMP = 32,
+        Z2_FLOW_TEMP_TARGET = 33,
+        Z2_ROOM_TEMP = 34,
+        Z2_ROOM_TEMP_TARGET = 35,
+        MIXING_TANK_TEMP = 36,
+        RUNTIME = 37,
+        CONTROLLER_VERSION = 38,
+        HEAT_SOURCE = 39,
+        REFRIGERANT_ERROR_CODE = 40,
+        STATUS_MIXING_VALVE = 41,
+        MIXING_VALVE_STEP = 42,
+        MIXING_VALVE_STEP_Z1 = 43,
+        STATUS_MULTI_ZONE = 44,
+        COMPRESSOR_STARTS = 45,
+        DISCHARGE_TEMP = 46,
+        OU_LIQUID_PIPE_TEMP = 47,
+        OU_TWO_PHASE_PIPE_TEMP = 48,
+        OU_SUCTION_PIPE_TEMP = 49,
+        OU_HEATSINK_TEMP = 50,
+        OU_COMPRESSOR_SURFACE_TEMP = 51,
+        SUPER_HEAT_TEMP = 52,
+        SUB_COOL_TEMP = 53,
+        FAN_SPEED = 54,
+        PUMP_SPEED = 55,
+        PUMP_FEEDBACK = 56,
+        OPERATION_MODE = 57,
+        PUBLISHES_SUPPRESSED = 58,
+        COUNT = 59
+    };
+    enum class BinarySensorKey : uint8_t {
+        STATUS_DEFROST = 0,
+        STATUS_DHW_FORCED = 1,
+        STATUS_HOLIDAY = 2,
+        STATUS_BOOSTER = 3,
+        STATUS_BOOSTER_2 = 4,
+        STATUS_IMMERSION = 5,
+        STATUS_IN1_REQUEST = 6,
+        STATUS_IN6_REQUEST = 7,
+        STATUS_IN5_REQUEST = 8,
+        STATUS_WATER_PUMP = 9,
+        STATUS_THREE_WAY_VALVE = 10,
+        STATUS_WATER_PUMP_2 = 11,
+        STATUS_WATER_PUMP_3 = 12,
+        STATUS_THREE_WAY_VALVE_2 = 13,
+        STATUS_SERVER_CONTROL = 14,
+        STATUS_SERVER_CONTROL_PROHIBIT_DHW = 15,
+        STATUS_SERVER_CONTROL_PROHIBIT_HEATING_Z1 = 16,
+        STATUS_SERVER_CONTROL_PROHIBIT_COOL_Z1 = 17,
+        STATUS_SERVER_CONTROL_PROHIBIT_HEATING_Z2 = 18,
+        STATUS_SERVER_CONTROL_PROHIBIT_COOL_Z2 = 19,
+        STATUS_PROHIBIT_DHW = 20,
+        STATUS_PROHIBIT_HEATING_Z1 = 21,
+        STATUS_PROHIBIT_COOL_Z1 = 22,
+        STATUS_PROHIBIT_HEATING_Z2 = 23,
+        STATUS_PROHIBIT_COOL_Z2 = 24,
+        STATUS_DHW_ECO = 25,
+        STATUS_POWER = 26,
+        STATUS_COMPRESSOR = 27,
+        STATUS_SHORT_CYCLE_LOCKOUT = 28,
+        STATUS_ZONE2_ENABLED = 29,
+        COUNT = 30
+    };
+    enum class TextSensorKey : uint8_t {
+        CONTROLLER_VERSION_TEXT = 0,
+        CONTROLLER_FIRMWARE_TEXT = 1,
+        HEAT_SOURCE_TEXT = 2,
+        FAULT_CODE_TEXT = 3,
+        REFRIGERANT_ERROR_CODE_TEXT = 4,
+        COMPRESSOR_LEVEL_TEXT = 5,
+        COUNT = 6
+    };
+
+    template<typename Key>
+    constexpr uint8_t key_index(Key key) { return static_cast<uint8_t>(key); }
+
+} // namespace ecodan
+} // namespace esphome
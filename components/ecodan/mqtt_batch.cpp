@@ -0,0 +1,68 @@
+#include "ecodan.h"
+
+namespace esphome {
+namespace ecodan
+{
+    // One JSON object with every sensor and binary sensor value published since the last batch,
+    // keyed by the entity object id (the same id as in the per entity MQTT topics):
+    //   {"feed_temp":35.2,"compressor":true,...}
+    // NaN is sent as null. Sent once per poll round, when dispatch_next_status_cmd wraps the poll
+    // table, or after mqtt_batch_interval when no round finishes (proxy mode polls nothing itself).
+    // Nothing is sent when nothing changed.
+    void EcodanHeatpump::publish_batch() {
+#ifdef USE_MQTT
+        if (mqttBatchTopic.empty())
+            return;
+        uint32_t now = millis();
+        if (!batchRoundDone && now - lastBatchMs < mqttBatchIntervalMs)
+            return;
+        if (batchSensors.none() && batchBinarySensors.none()) {
+            batchRoundDone = false;
+            lastBatchMs = now;
+            return;
+        }
+        // keep the flags while offline, the first batch after reconnecting carries everything
+        if (mqtt::global_mqtt_client == nullptr || !mqtt::global_mqtt_client->is_connected())
+            return;
+
+        std::string payload;
+        payload.reserve(32 * (batchSensors.count() + batchBinarySensors.count()) + 2);
+        payload += '{';
+        char value[24];
+        auto add = [&payload](const std::string &name, const char *value) {
+            if (payload.size() > 1)
+                payload += ',';
+            payload += '"';
+            payload += name;
+            payload += "\":";
+            payload += value;
+        };
+
+        for (size_t i = 0; i < sensors.size(); i++) {
+            if (!batchSensors[i] || sensors[i] == nullptr)
+                continue;
+            float state = sensors[i]->state;
+            if (std::isnan(state))
+                snprintf(value, sizeof(value), "null");
+            else
+                snprintf(value, sizeof(value), "%.7g", state);
+            add(sensors[i]->get_object_id(), value);
+        }
+        for (size_t i = 0; i < binarySensors.size(); i++) {
+            if (!batchBinarySensors[i] || binarySensors[i] == nullptr)
+                continue;
+            add(binarySensors[i]->get_object_id(), binarySensors[i]->state ? "true" : "false");
+        }
+        payload += '}';
+
+        if (mqtt::global_mqtt_client->publish(mqttBatchTopic, payload)) {
+            batchSensors.reset();
+            batchBinarySensors.reset();
+            batchRoundDone = false;
+            lastBatchMs = now;
+        }
+#endif
+    }
+
+} // namespace ecodan
+} // namespace esphome
@@ -3,6 +3,7 @@ import esphome.config_validation as cv
 from esphome.const import CONF_ID
 from esphome.components import sensor
 from esphome.const import (
+    CONF_DEVICE_CLASS,
     DEVICE_CLASS_ENERGY,
     DEVICE_CLASS_FREQUENCY,
     DEVICE_CLASS_POWER,
@@ -22,380 +23,458 @@ from esphome.const import (
     UNIT_KILOWATT,
     UNIT_KILOWATT_HOURS,
 )
-from . import ECODAN, CONF_ECODAN_ID
+from . import ECODAN, CONF_ECODAN_ID, SensorKey, RequestCode, enable_status_messages
+
+CONF_REQUEST_INTERVAL = "request_interval"
+CONF_REQUEST_PRIORITY = "request_priority"
+CONF_DEADBAND = "deadband"
+CONF_HEARTBEAT = "heartbeat"
+
+# Publish-on-change: a new value is only published when it differs from the last published one by at
+# least the deadband (any change for 0), or when the heartbeat has passed since that publish (0s = never).
+# The filter runs before Sensor::publish_state, so the sensor's state and on_value listeners see only the
+# published values too. The defaults per device class hold back unchanged values only, so state stays
+# exact, and re-publish on the heartbeat; the sensors are polled every few seconds.
+PUBLISH_FILTER_DEFAULTS = {
+    DEVICE_CLASS_ENERGY: (0.0, "15min"),
+}
+DEFAULT_PUBLISH_FILTER = (0.0, "5min")
+
+# No default filter: the optimizer's feed temperature and operation mode callbacks run on every poll,
+# and the return, outside and room temperatures are the other control inputs, kept on every poll with
+# them. deadband/heartbeat still apply when set on these.
+UNFILTERED_SENSORS = {
+    "hp_feed_temp", "hp_return_temp", "outside_temp",
+    "z1_feed_temp", "z1_return_temp", "z1_room_temp",
+    "z2_feed_temp", "z2_return_temp", "z2_room_temp",
+    "operation_mode",
+}
+
+# Sensors read with service request codes: key -> (request code, also reported in 0x0F by units with
+# extended outdoor thermistors, default minimum interval, default priority). Higher priority goes first
+# when several codes are due and the request code bus time budget is limited.
+REQUEST_CODE_SENSORS = {
+    "compressor_starts": ("COMPRESSOR_STARTS", False, "1h", 0),
+    "discharge_temp": ("TH4_DISCHARGE_TEMP", True, "30s", 2),
+    "ou_liquid_pipe_temp": ("TH3_LIQUID_PIPE1_TEMP", True, "30s", 2),
+    "ou_two_phase_pipe_temp": ("TH6_2_PHASE_PIPE_TEMP", True, "60s", 1),
+    "ou_suction_pipe_temp": ("TH32_SUCTION_PIPE_TEMP", True, "60s", 1),
+    "ou_heatsink_temp": ("TH8_HEAT_SINK_TEMP", True, "60s", 1),
+    "ou_compressor_surface_temp": ("TH33_SURFACE_TEMP", True, "60s", 1),
+    "super_heat_temp": ("DISCHARGE_SUPERHEAT", True, "30s", 2),
+    "sub_cool_temp": ("SUB_COOL", True, "60s", 1),
+    "fan_speed": ("FAN_SPEED", False, "2min", 0),
+}
+
+
+def request_code_schema(key):
+    _, _, interval, priority = REQUEST_CODE_SENSORS[key]
+    return {
+        cv.Optional(CONF_REQUEST_INTERVAL, default=interval): cv.positive_time_period_seconds,
+        cv.Optional(CONF_REQUEST_PRIORITY, default=priority): cv.int_range(min=0, max=255),
+    }
+
+
+def ecodan_sensor_schema(**kwargs):
+    return sensor.sensor_schema(**kwargs).extend({
+        cv.Optional(CONF_DEADBAND): cv.positive_float,
+        cv.Optional(CONF_HEARTBEAT): cv.positive_time_period_milliseconds,
+    })
+
+
+def publish_filter(key, conf):
+    """(deadband, heartbeat ms) of a sensor, None when every poll is published."""
+    if key in UNFILTERED_SENSORS:
+        if CONF_DEADBAND not in conf and CONF_HEARTBEAT not in conf:
+            return None
+        deadband, heartbeat = 0.0, "0s"
+    else:
+        deadband, heartbeat = PUBLISH_FILTER_DEFAULTS.get(conf.get(CONF_DEVICE_CLASS), DEFAULT_PUBLISH_FILTER)
+    deadband = conf.get(CONF_DEADBAND, deadband)
+    heartbeat = conf[CONF_HEARTBEAT] if CONF_HEARTBEAT in conf else cv.positive_time_period_milliseconds(heartbeat)
+    return deadband, heartbeat.total_milliseconds
+
 
 AUTO_LOAD = ["ecodan"]
 
 CONFIG_SCHEMA = cv.Schema(
     {
         cv.GenerateID(CONF_ECODAN_ID): cv.use_id(ECODAN),
-        cv.Optional("compressor_frequency"): sensor.sensor_schema(
+        cv.Optional("compressor_frequency"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_HERTZ,
             icon="mdi:sine-wave",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_FREQUENCY,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("output_power"): sensor.sensor_schema(
+        cv.Optional("output_power"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT,
             icon="mdi:home-lightning-bolt",
             accuracy_decimals=3,
             device_class=DEVICE_CLASS_POWER,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("computed_output_power"): sensor.sensor_schema(
+        cv.Optional("computed_output_power"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT,
             icon="mdi:home-lightning-bolt",
             accuracy_decimals=3,
             device_class=DEVICE_CLASS_POWER,
             state_class=STATE_CLASS_MEASUREMENT,
         ),        
-        cv.Optional("outside_temp"): sensor.sensor_schema(
+        cv.Optional("outside_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:sun-thermometer",
             accuracy_decimals=0,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("hp_feed_temp"): sensor.sensor_schema(
+        cv.Optional("hp_feed_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("hp_return_temp"): sensor.sensor_schema(
+        cv.Optional("hp_return_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("hp_refrigerant_temp"): sensor.sensor_schema(
+        cv.Optional("hp_refrigerant_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("hp_refrigerant_condensing_temp"): sensor.sensor_schema(
+        cv.Optional("hp_refrigerant_condensing_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("boiler_flow_temp"): sensor.sensor_schema(
+        cv.Optional("boiler_flow_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("boiler_return_temp"): sensor.sensor_schema(
+        cv.Optional("boiler_return_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),        
-        cv.Optional("dhw_temp"): sensor.sensor_schema(
+        cv.Optional("dhw_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:hand-water",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("dhw_secondary_temp"): sensor.sensor_schema(
+        cv.Optional("dhw_secondary_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:hand-water",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("dhw_flow_temp_target"): sensor.sensor_schema(
+        cv.Optional("dhw_flow_temp_target"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:hand-water",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("dhw_flow_temp_drop"): sensor.sensor_schema(
+        cv.Optional("dhw_flow_temp_drop"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:hand-water",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("legionella_prevention_temp"): sensor.sensor_schema(
+        cv.Optional("legionella_prevention_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:hand-water",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),        
-        cv.Optional("flow_rate"): sensor.sensor_schema(
+        cv.Optional("flow_rate"): ecodan_sensor_schema(
             unit_of_measurement="L/min",
             icon="mdi:waves-arrow-right",
             device_class=DEVICE_CLASS_VOLUME_FLOW_RATE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("energy_consumed_increasing"): sensor.sensor_schema(
+        cv.Optional("energy_consumed_increasing"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-export",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL_INCREASING,
         ),
-        cv.Optional("cool_cop"): sensor.sensor_schema(
+        cv.Optional("cool_cop"): ecodan_sensor_schema(
             icon="mdi:heat-pump-outline",
             state_class=STATE_CLASS_MEASUREMENT,
             accuracy_decimals=2,
         ),        
-        cv.Optional("cool_consumed"): sensor.sensor_schema(
+        cv.Optional("cool_consumed"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-export",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL,
         ),
-        cv.Optional("cool_delivered"): sensor.sensor_schema(
+        cv.Optional("cool_delivered"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-import",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL,
         ),
-        cv.Optional("heating_cop"): sensor.sensor_schema(
+        cv.Optional("heating_cop"): ecodan_sensor_schema(
             icon="mdi:heat-pump-outline",
             state_class=STATE_CLASS_MEASUREMENT,
             accuracy_decimals=2,
         ),        
-        cv.Optional("heating_consumed"): sensor.sensor_schema(
+        cv.Optional("heating_consumed"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-export",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL,
         ),
-        cv.Optional("heating_delivered"): sensor.sensor_schema(
+        cv.Optional("heating_delivered"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-import",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL,
         ),
-        cv.Optional("dhw_cop"): sensor.sensor_schema(
+        cv.Optional("dhw_cop"): ecodan_sensor_schema(
             icon="mdi:heat-pump-outline",
             state_class=STATE_CLASS_MEASUREMENT,
             accuracy_decimals=2,
         ),         
-        cv.Optional("dhw_consumed"): sensor.sensor_schema(
+        cv.Optional("dhw_consumed"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-export",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL,
         ),
-        cv.Optional("dhw_delivered"): sensor.sensor_schema(
+        cv.Optional("dhw_delivered"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_KILOWATT_HOURS,
             icon="mdi:transmission-tower-import",
             accuracy_decimals=2,
             device_class=DEVICE_CLASS_ENERGY,
             state_class=STATE_CLASS_TOTAL,
         ),
-        cv.Optional("z1_flow_temp_target"): sensor.sensor_schema(
+        cv.Optional("z1_flow_temp_target"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("z1_room_temp"): sensor.sensor_schema(
+        cv.Optional("z1_room_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),                        
-        cv.Optional("z1_room_temp_target"): sensor.sensor_schema(
+        cv.Optional("z1_room_temp_target"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("z1_feed_temp"): sensor.sensor_schema(
+        cv.Optional("z1_feed_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("z1_return_temp"): sensor.sensor_schema(
+        cv.Optional("z1_return_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("z2_feed_temp"): sensor.sensor_schema(
+        cv.Optional("z2_feed_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("z2_return_temp"): sensor.sensor_schema(
+        cv.Optional("z2_return_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),                            
-        cv.Optional("z2_flow_temp_target"): sensor.sensor_schema(
+        cv.Optional("z2_flow_temp_target"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("z2_room_temp"): sensor.sensor_schema(
+        cv.Optional("z2_room_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),                        
-        cv.Optional("z2_room_temp_target"): sensor.sensor_schema(
+        cv.Optional("z2_room_temp_target"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("mixing_tank_temp"): sensor.sensor_schema(
+        cv.Optional("mixing_tank_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:home-thermometer",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
         ),     
-        cv.Optional("runtime"): sensor.sensor_schema(
+        cv.Optional("runtime"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_HOUR,
             icon="mdi:clock",
             entity_category=ENTITY_CATEGORY_NONE,
         ),
-        cv.Optional("controller_version"): sensor.sensor_schema(
+        cv.Optional("controller_version"): ecodan_sensor_schema(
             entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
         ),
-        cv.Optional("heat_source"): sensor.sensor_schema(
+        cv.Optional("heat_source"): ecodan_sensor_schema(
             entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
         ),
-        cv.Optional("refrigerant_error_code"): sensor.sensor_schema(
+        cv.Optional("refrigerant_error_code"): ecodan_sensor_schema(
             entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
         ),
-        cv.Optional("status_mixing_valve"): sensor.sensor_schema(
+        cv.Optional("status_mixing_valve"): ecodan_sensor_schema(
             icon="mdi:valve",
             state_class=ENTITY_CATEGORY_NONE,
         ), 
-        cv.Optional("mixing_valve_step"): sensor.sensor_schema(
+        cv.Optional("mixing_valve_step"): ecodan_sensor_schema(
             icon="mdi:valve",
             state_class=STATE_CLASS_MEASUREMENT
         ),
-        cv.Optional("mixing_valve_step_z1"): sensor.sensor_schema(
+        cv.Optional("mixing_valve_step_z1"): ecodan_sensor_schema(
             icon="mdi:valve",
             state_class=STATE_CLASS_MEASUREMENT
         ),
-        cv.Optional("status_multi_zone"): sensor.sensor_schema(
+        cv.Optional("status_multi_zone"): ecodan_sensor_schema(
             icon="mdi:thermostat",
             state_class=ENTITY_CATEGORY_NONE
         ),
-        cv.Optional("compressor_starts"): sensor.sensor_schema(
+        cv.Optional("compressor_starts"): ecodan_sensor_schema(
             icon="mdi:counter",
             entity_category=ENTITY_CATEGORY_NONE,
-        ),
-        cv.Optional("discharge_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("compressor_starts")),
+        cv.Optional("discharge_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("ou_liquid_pipe_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("discharge_temp")),
+        cv.Optional("ou_liquid_pipe_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("ou_two_phase_pipe_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("ou_liquid_pipe_temp")),
+        cv.Optional("ou_two_phase_pipe_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("ou_suction_pipe_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("ou_two_phase_pipe_temp")),
+        cv.Optional("ou_suction_pipe_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("ou_heatsink_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("ou_suction_pipe_temp")),
+        cv.Optional("ou_heatsink_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("ou_compressor_surface_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("ou_heatsink_temp")),
+        cv.Optional("ou_compressor_surface_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("super_heat_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("ou_compressor_surface_temp")),
+        cv.Optional("super_heat_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("sub_cool_temp"): sensor.sensor_schema(
+        ).extend(request_code_schema("super_heat_temp")),
+        cv.Optional("sub_cool_temp"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_CELSIUS,
             icon="mdi:coolant-temperature",
             accuracy_decimals=1,
             device_class=DEVICE_CLASS_TEMPERATURE,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("fan_speed"): sensor.sensor_schema(
+        ).extend(request_code_schema("sub_cool_temp")),
+        cv.Optional("fan_speed"): ecodan_sensor_schema(
             unit_of_measurement=UNIT_REVOLUTIONS_PER_MINUTE,
             icon="mdi:fan",
             accuracy_decimals=0,
             device_class=DEVICE_CLASS_FREQUENCY,
             state_class=STATE_CLASS_MEASUREMENT,
-        ),
-        cv.Optional("pump_speed"): sensor.sensor_schema(
+        ).extend(request_code_schema("fan_speed")),
+        cv.Optional("pump_speed"): ecodan_sensor_schema(
             icon="mdi:gauge",
             state_class=STATE_CLASS_MEASUREMENT
         ),
-        cv.Optional("pump_feedback"): sensor.sensor_schema(
+        cv.Optional("pump_feedback"): ecodan_sensor_schema(
             icon="mdi:meter-electric",
             accuracy_decimals=0,
             unit_of_measurement=UNIT_WATT,
             device_class=DEVICE_CLASS_POWER,
             state_class=STATE_CLASS_MEASUREMENT,
         ),
-        cv.Optional("operation_mode"): sensor.sensor_schema(
+        cv.Optional("operation_mode"): ecodan_sensor_schema(
+        ),
+        # publishes skipped by the deadband/heartbeat filters, reported once a minute
+        cv.Optional("publishes_suppressed"): sensor.sensor_schema(
+            icon="mdi:filter-variant-remove",
+            accuracy_decimals=0,
+            state_class=STATE_CLASS_TOTAL_INCREASING,
+            entity_category=ENTITY_CATEGORY_DIAGNOSTIC,
         ),
     }
 ).extend(cv.COMPONENT_SCHEMA)
 
 async def to_code(config):
     hp = await cg.get_variable(config[CONF_ECODAN_ID])
+    keys = []
 
     for key, conf in config.items():
         if not isinstance(conf, dict):
@@ -403,6 +482,13 @@ async def to_code(config):
         id = conf.get("id")
         if id and id.type == sensor.Sensor:
             sens = await sensor.new_sensor(conf)
-            cg.add(hp.register_sensor(sens, key))
-            if key in ["compressor_starts", "discharge_temp", "ou_liquid_pipe_temp", "ou_two_phase_pipe_temp", "fan_speed"]:
-                cg.add(hp.enable_request_code_sensors())
\ No newline at end of file
+            cg.add(hp.register_sensor(sens, getattr(SensorKey, key.upper())))
+            keys.append(key)
+            if (publish := publish_filter(key, conf)) is not None:
+                cg.add(hp.set_publish_filter(getattr(SensorKey, key.upper()), *publish))
+            if key in REQUEST_CODE_SENSORS:
+                code, extended_thermistor, _, _ = REQUEST_CODE_SENSORS[key]
+                cg.add(hp.add_request_code(getattr(RequestCode, code), extended_thermistor,
+                                           conf[CONF_REQUEST_INTERVAL].total_seconds, conf[CONF_REQUEST_PRIORITY]))
+
+    enable_status_messages(hp, keys)
@@ -36,7 +36,11 @@ namespace ecodan
         }
 
         if (buffer.get_write_offset() == buffer.size()) {
-            if (buffer.verify_checksum()) {
+            bool valid = buffer.verify_checksum();
+            capture_frame(is_proxy_message ? CaptureDirection::FROM_SLAVE : CaptureDirection::FROM_FTC,
+                buffer.buffer(), buffer.get_write_offset(), valid);
+
+            if (valid) {
                 if (is_proxy_message) { // proxy comm
 
                     if (this->ignoreSlaveCMDs) {
@@ -146,6 +150,7 @@ namespace ecodan
         if (xSemaphoreTake(this->uart_tx_mutex_, (TickType_t)100) == pdTRUE) {    
             uart_->write_array(msg.buffer(), msg.size());
             xSemaphoreGive(this->uart_tx_mutex_);
+            capture_frame(CaptureDirection::TO_FTC, msg.buffer(), msg.size(), true);
         } else {
             ESP_LOGE(TAG, "failed to acquire uart_tx_mutex");
         }
@@ -0,0 +1,35 @@
+#pragma once
+// The status poll scheduler of dispatch_next_status_cmd, free of ESPHome and the bus so the host
+// test (tests/host/status_poll_test.cpp) builds it as is.
+#include <stdint.h>
+
+namespace esphome {
+namespace ecodan
+{
+    struct StatusPollRuntime {
+        uint8_t Cmd{0};             // index into statusCmdQueue
+        uint32_t IntervalMs{0};     // minimum time between polls, 0 = every round
+        uint32_t LastSentMs{0};
+        bool Sent{false};
+    };
+
+    // Index into queue of the message that is most overdue, -1 when nothing is due yet.
+    // Messages that were never sent go first; equally overdue messages keep queue order.
+    // The millis() wrap is harmless: overdue is taken from the unsigned difference.
+    inline int next_status_poll(const StatusPollRuntime *queue, uint8_t size, uint32_t now)
+    {
+        int next = -1;
+        int64_t mostOverdue = -1;
+        for (auto i = 0; i < size; i++) {
+            auto& poll = queue[i];
+            int64_t overdue = poll.Sent ? static_cast<int32_t>(now - poll.LastSentMs - poll.IntervalMs) : INT32_MAX;
+            if (overdue > mostOverdue) {
+                mostOverdue = overdue;
+                next = i;
+            }
+        }
+        return next;
+    }
+
+} // namespace ecodan
+} // namespace esphome
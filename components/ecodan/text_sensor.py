@@ -6,7 +6,7 @@ from esphome.const import (
     ENTITY_CATEGORY_NONE, ENTITY_CATEGORY_DIAGNOSTIC
 )
 
-from . import ECODAN, CONF_ECODAN_ID
+from . import ECODAN, CONF_ECODAN_ID, TextSensorKey, enable_status_messages
 
 
 AUTO_LOAD = ["ecodan"]
@@ -42,6 +42,7 @@ CONFIG_SCHEMA = cv.Schema(
 
 async def to_code(config):
     hp = await cg.get_variable(config[CONF_ECODAN_ID])
+    keys = []
 
     for key, conf in config.items():
         if not isinstance(conf, dict):
@@ -49,4 +50,7 @@ async def to_code(config):
         id = conf.get("id")
         if id and id.type == text_sensor.TextSensor:
             sens = await text_sensor.new_text_sensor(conf)
-            cg.add(hp.register_textSensor(sens, key))
+            cg.add(hp.register_textSensor(sens, getattr(TextSensorKey, key.upper())))
+            keys.append(key)
+
+    enable_status_messages(hp, keys)
@@ -220,6 +220,8 @@ def print_report(rows):
         print(f"    {p['start'].strftime('%H:%M')} - {p['end'].strftime('%H:%M')} ({p['duration_min']:.0f} min)")
     if not defrost_periods:
         print(f"  No defrost cycles detected")
+    else:
+        print(f"  Dip, recovery and energy penalty per defrost: scripts/defrost_analysis.py")
     print()
 
     # Energy
@@ -0,0 +1,766 @@
+# ABOUTME: CN105 protocol helpers mirroring components/ecodan (proto.h framing, Message getters, fields.cpp).
+# ABOUTME: Run with: python scripts/cn105.py FC 62 02 7A 10 0C ... (decodes one frame) or --check (golden vectors)
+
+import sys
+from enum import IntEnum
+from typing import NamedTuple, Optional
+
+HEADER_SIZE_A = 5
+HEADER_SIZE_B = 7
+PAYLOAD_SIZE = 16
+PAYLOAD_SIZE_OFFSET_A = 4
+PAYLOAD_SIZE_OFFSET_B = 6
+HEADER_MAGIC_A1 = 0xFC
+HEADER_MAGIC_A2 = 0x02
+HEADER_MAGIC_B = 0x02
+HEADER_MAGIC_C = 0x7A
+MAX_FRAME_SIZE = HEADER_SIZE_B + PAYLOAD_SIZE + 1
+
+
+class MsgType(IntEnum):
+    SET_CMD = 0x41
+    SET_RES = 0x61
+    GET_CMD = 0x42
+    GET_RES = 0x62
+    CONNECT_CMD = 0x5A
+    CONNECT_RES = 0x7A
+    GET_CONFIGURATION = 0x5B
+    CONFIGURATION_RES = 0x7B
+
+
+class SetType(IntEnum):
+    BASIC_SETTINGS = 0x32
+    CONTROLLER_SETTING = 0x34
+    ROOM_SETTINGS = 0x35
+    REMOTE_ROOM_SETTINGS = 0x07
+
+
+class GetType(IntEnum):
+    DATETIME_FIRMWARE = 0x01
+    DEFROST_STATE = 0x02
+    ERROR_STATE = 0x03
+    COMPRESSOR_FREQUENCY = 0x04
+    DHW_STATE = 0x05
+    HEATING_POWER = 0x07
+    TEMPERATURE_CONFIG = 0x09
+    SH_TEMPERATURE_STATE = 0x0B
+    TEMPERATURE_STATE_A = 0x0C
+    TEMPERATURE_STATE_B = 0x0D
+    TEMPERATURE_STATE_C = 0x0E
+    TEMPERATURE_STATE_D = 0x0F
+    EXTERNAL_STATE = 0x10
+    DIP_SWITCHES = 0x11
+    ACTIVE_TIME = 0x13
+    FLOW_RATE = 0x14
+    PUMP_STATUS_A = 0x15
+    PUMP_STATUS_B = 0x16
+    MODE_FLAGS_A = 0x26
+    MODE_FLAGS_B = 0x28
+    ENERGY_USAGE = 0xA1
+    ENERGY_DELIVERY = 0xA2
+    SERVICE_REQUEST_CODE = 0xA3
+    HARDWARE_CONFIGURATION = 0xC9
+
+
+class RequestCode(IntEnum):
+    COMPRESSOR_STARTS = 3
+    TH4_DISCHARGE_TEMP = 4
+    TH3_LIQUID_PIPE1_TEMP = 5
+    TH6_2_PHASE_PIPE_TEMP = 7
+    TH32_SUCTION_PIPE_TEMP = 8
+    TH8_HEAT_SINK_TEMP = 10
+    TH33_SURFACE_TEMP = 11
+    DISCHARGE_SUPERHEAT = 12
+    SUB_COOL = 13
+    FAN_SPEED = 19
+
+
+# ---------------------------------------------------------------------------
+# Framing
+# ---------------------------------------------------------------------------
+
+def header_size(frame):
+    return HEADER_SIZE_A if frame[0] == HEADER_MAGIC_A1 else HEADER_SIZE_B
+
+
+def payload_size(frame):
+    return frame[PAYLOAD_SIZE_OFFSET_A if frame[0] == HEADER_MAGIC_A1 else PAYLOAD_SIZE_OFFSET_B]
+
+
+def frame_size(frame):
+    """Total length implied by the header: header + payload + checksum."""
+    return header_size(frame) + payload_size(frame) + 1
+
+
+def checksum(frame):
+    """Checksum over everything after the sync byte, up to (not including) the checksum byte."""
+    return -sum(frame[1:frame_size(frame) - 1]) & 0xFF
+
+
+def verify_header(frame):
+    return (len(frame) >= HEADER_SIZE_A and frame[0] in (HEADER_MAGIC_A1, HEADER_MAGIC_A2)
+            and len(frame) >= header_size(frame) and payload_size(frame) <= PAYLOAD_SIZE)
+
+
+def verify_frame(frame):
+    """True when frame is exactly one complete packet with a valid header and checksum."""
+    return verify_header(frame) and len(frame) == frame_size(frame) and checksum(frame) == frame[-1]
+
+
+def build_frame(msg_type, payload=b""):
+    """0xFC packet around payload, zero padded to 16 bytes for GET/SET commands like Message does."""
+    payload = bytes(payload)
+    if len(payload) > PAYLOAD_SIZE:
+        raise ValueError(f"payload is {len(payload)} bytes, max {PAYLOAD_SIZE}")
+    frame = bytearray([HEADER_MAGIC_A1, int(msg_type), HEADER_MAGIC_B, HEADER_MAGIC_C, len(payload)]) + payload
+    frame.append(checksum(frame + b"\x00"))
+    return bytes(frame)
+
+
+def get_request(get_type, request_code=None):
+    """GET_CMD frame for a status message, or a SERVICE_REQUEST_CODE query when request_code is given."""
+    payload = bytearray(PAYLOAD_SIZE)
+    payload[0] = int(get_type)
+    if request_code is not None:
+        payload[1:3] = (int(request_code) & 0xFFFF).to_bytes(2, "big")
+    return build_frame(MsgType.GET_CMD, payload)
+
+
+def split_frames(data):
+    """Yield (offset, frame) for each valid packet in a raw byte stream.
+
+    Resynchronises on the sync bytes the same way process_serial_byte does: bytes outside a packet
+    are skipped, and a bad header or checksum drops the packet and continues after its first byte.
+    """
+    data = bytes(data)
+    i = 0
+    while i < len(data):
+        if data[i] not in (HEADER_MAGIC_A1, HEADER_MAGIC_A2):
+            i += 1
+            continue
+        candidate = data[i:i + MAX_FRAME_SIZE]
+        if not verify_header(candidate) or len(candidate) < frame_size(candidate):
+            i += 1
+            continue
+        frame = candidate[:frame_size(candidate)]
+        if checksum(frame) != frame[-1]:
+            i += 1
+            continue
+        yield i, frame
+        i += len(frame)
+
+
+class FrameReader:
+    """Incremental framer with the rules of process_serial_byte, for byte streams read in chunks.
+
+    feed() returns (frame, checksum_ok) for every packet completed by the new bytes. Only 0xFC
+    packets are accepted unless accept_b is set (the proxy port also sees 0x02 handshakes).
+    """
+
+    def __init__(self, accept_b=False):
+        self.sync = (HEADER_MAGIC_A1, HEADER_MAGIC_A2) if accept_b else (HEADER_MAGIC_A1,)
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        frames = []
+        for byte in data:
+            if not self.buffer and byte not in self.sync:
+                continue
+            self.buffer.append(byte)
+            if len(self.buffer) == header_size(self.buffer) and not verify_header(self.buffer):
+                self.buffer.clear()
+                continue
+            if len(self.buffer) >= header_size(self.buffer) and len(self.buffer) == frame_size(self.buffer):
+                frame = bytes(self.buffer)
+                self.buffer.clear()
+                frames.append((frame, checksum(frame) == frame[-1]))
+        return frames
+
+
+def payload_of(frame):
+    """The 16 byte payload of a frame, zero padded; payload[0] is the Get/Set type."""
+    start = header_size(frame)
+    payload = bytes(frame[start:start + payload_size(frame)])
+    return payload + bytes(PAYLOAD_SIZE - len(payload))
+
+
+# ---------------------------------------------------------------------------
+# Message getters (indices are payload offsets, as in proto.h)
+# ---------------------------------------------------------------------------
+
+# 10k NTC-sensor (type B=3950K): (max_byte, scale, offset)
+NTC_TABLE_V3 = [
+    (0x40, 0.79, -42.68),
+    (0x44, 0.7525, -40.28),
+    (0x4B, 0.69, -36.03),
+    (0x56, 0.60909, -29.9618),
+    (0x5D, 0.54714, -24.621),
+    (0x6A, 0.49308, -19.606),
+    (0x73, 0.44556, -14.545),
+    (0x80, 0.40923, -10.395),
+    (0x8B, 0.37364, -5.748),
+    (0x9B, 0.34313, -1.503),
+    (0xB4, 0.306, 4.187),
+    (0xB7, 0.28667, 7.67),
+]
+
+# NTC Sensor (type B=~3172, R_s=~9.8k)
+NTC_TABLE_V4 = [
+    (0x6A, 0.5060, -20.92),
+    (0xFF, 0.3780, -7.40),
+]
+
+
+def _s16(value):
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def u16(p, i):
+    return (p[i] << 8) | p[i + 1]
+
+
+def uint16_v2(p, i):
+    # returns int16_t in proto.h
+    return _s16((p[i + 1] << 8) | p[i])
+
+
+def int16(p, i):
+    return _s16(u16(p, i))
+
+
+def int16_v2(p, i):
+    return _s16((p[i + 1] << 8) | p[i])
+
+
+def float24(p, i):
+    return u16(p, i) + p[i + 2] / 100.0
+
+
+def float24_v2(p, i):
+    return ((p[i + 1] << 8) | p[i + 2]) * 100 + p[i]
+
+
+def float16(p, i):
+    return u16(p, i) / 100.0
+
+
+def float16_signed(p, i):
+    return int16(p, i) / 100.0
+
+
+def float8(p, i, correction=40.0):
+    return p[i] / 2 - correction
+
+
+def float8_v2(p, i):
+    return (p[i] - 40.0) / 2
+
+
+def _ntc(table, value):
+    for max_byte, scale, offset in table:
+        if value <= max_byte:
+            return value * scale + offset
+    _, scale, offset = table[-1]
+    return value * scale + offset
+
+
+def float8_v3(p, i):
+    return _ntc(NTC_TABLE_V3, p[i])
+
+
+def float8_v4(p, i):
+    return _ntc(NTC_TABLE_V4, p[i])
+
+
+# ---------------------------------------------------------------------------
+# Per-GetType fields, named after the Status members they set. This table is the single
+# source for the decoder here and for components/ecodan/fields.cpp (scripts/generate_fields.py).
+# ---------------------------------------------------------------------------
+
+
+class Field(NamedTuple):
+    """One payload field.
+
+    kind selects the getter: the Message getters above plus "u8", "bool" (byte != 0) and
+    "u8_minus40" (uint8_t - 40, the TH8/TH33 encoding). key is the sensor (binary sensor for
+    "bool") the value is published to, in the schema spelling of sensor.py/binary_sensor.py.
+    when names a bool field that must already be set for the component to decode this one.
+    """
+    kind: str
+    index: int
+    arg: Optional[float] = None
+    key: Optional[str] = None
+    when: Optional[str] = None
+
+
+F = Field
+
+FIELDS = {
+    GetType.DATETIME_FIRMWARE: {
+        "Year": F("u8", 1, 2000), "Month": F("u8", 2), "Day": F("u8", 3),
+        "Hour": F("u8", 4), "Minute": F("u8", 5), "Second": F("u8", 6),
+        "FirmwareMajor": F("u8", 7), "FirmwareMinor": F("u8", 8),
+    },
+    GetType.DEFROST_STATE: {
+        "MasterZone1": F("u8", 1), "MasterZone2": F("u8", 2),
+        "DefrostActive": F("bool", 3, key="status_defrost"),
+    },
+    GetType.ERROR_STATE: {
+        # 2+3 = fault code, [2]*100+[3]; 4+5 = fault code letters, 0x00 0x03 = A3
+        "RefrigerantErrorCode": F("u8", 1, key="refrigerant_error_code"), "FaultCodeNumeric": F("u16", 2),
+        "FaultCodeLetters": F("u16", 4), "MultiZoneStatus": F("u8", 8, key="status_multi_zone"),
+    },
+    GetType.COMPRESSOR_FREQUENCY: {
+        "CompressorFrequency": F("u8", 1, key="compressor_frequency"),
+    },
+    GetType.DHW_STATE: {
+        # 0x0 = heatpump, 0x1 = screw in heater, 0x2 = electric heater..
+        "HeatSource": F("u8", 6, key="heat_source"),
+    },
+    GetType.HEATING_POWER: {
+        "OutputPower": F("u8", 6, key="output_power"),
+        "EnergyConsumedIncreasing": F("u16", 11, 0.1, key="energy_consumed_increasing"),
+    },
+    GetType.TEMPERATURE_CONFIG: {
+        "Zone1SetTemperature": F("float16", 1, key="z1_room_temp_target"),
+        "Zone2SetTemperature": F("float16", 3, key="z2_room_temp_target"),
+        "Zone1FlowTemperatureSetPoint": F("float16", 5, key="z1_flow_temp_target"),
+        "Zone2FlowTemperatureSetPoint": F("float16", 7, key="z2_flow_temp_target"),
+        "LegionellaPreventionSetPoint": F("float16", 9, key="legionella_prevention_temp"),
+        "DhwTemperatureDrop": F("float8_v2", 11, key="dhw_flow_temp_drop"),
+        "MaximumFlowTemperature": F("float8_v2", 12), "MinimumFlowTemperature": F("float8_v2", 13),
+    },
+    GetType.SH_TEMPERATURE_STATE: {
+        # 0xF0 in the high byte means "not reported in the current system", published as 0
+        "Zone1RoomTemperature": F("room_float16", 1, key="z1_room_temp"),
+        "Zone2RoomTemperature": F("room_float16", 3, key="z2_room_temp"),
+        "OutsideTemperature": F("float8", 11, 40.0, key="outside_temp"),
+        "HpRefrigerantLiquidTemperature": F("float16_signed", 8, key="hp_refrigerant_temp"),
+    },
+    GetType.TEMPERATURE_STATE_A: {
+        "HpFeedTemperature": F("float16", 1, key="hp_feed_temp"),
+        "HpReturnTemperature": F("float16", 4, key="hp_return_temp"),
+        "DhwTemperature": F("float16", 7, key="dhw_temp"),
+        "DhwSecondaryTemperature": F("float16", 10, key="dhw_secondary_temp"),
+    },
+    GetType.TEMPERATURE_STATE_B: {
+        "Z1FeedTemperature": F("float16", 1, key="z1_feed_temp"),
+        "Z1ReturnTemperature": F("float16", 4, key="z1_return_temp"),
+        "Z2FeedTemperature": F("float16", 7, key="z2_feed_temp"),
+        "Z2ReturnTemperature": F("float16", 10, key="z2_return_temp"),
+    },
+    GetType.TEMPERATURE_STATE_C: {
+        "BoilerFlowTemperature": F("float16", 1, key="boiler_flow_temp"),
+        "BoilerReturnTemperature": F("float16", 4, key="boiler_return_temp"),
+    },
+    GetType.TEMPERATURE_STATE_D: {
+        "MixingTankTemperature": F("float16", 1, key="mixing_tank_temp"),
+        # stuck at 0x0FD9 (40.57) on some units, the condensing temperature is then in byte 6
+        "HpRefrigerantCondensingTemperature": F("condensing", 4, key="hp_refrigerant_condensing_temp"),
+        # FTC7+ only; once seen the component keeps decoding the extended thermistors
+        "ReportsExtendedOutdoorUnitThermistors": F("any_nonzero", 7, 15),
+        "RcDischargeTemp": F("u8", 7, key="discharge_temp", when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcOuLiquidPipeTemp": F("float8", 8, 39.0, key="ou_liquid_pipe_temp",
+                                when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcOuTwoPhasePipeTemp": F("float8", 9, 39.0, key="ou_two_phase_pipe_temp",
+                                  when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcOuSuctionPipeTemp": F("float8", 10, 39.0, key="ou_suction_pipe_temp",
+                                 when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcOuHeatSinkTemp": F("u8_minus40", 11, key="ou_heatsink_temp", when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcOuCompressorSurfaceTemp": F("u8_minus40", 12, key="ou_compressor_surface_temp",
+                                       when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcDischargeSuperHeatTemp": F("u8", 13, key="super_heat_temp", when="ReportsExtendedOutdoorUnitThermistors"),
+        "RcSubCoolTemp": F("float8", 14, 39.0, key="sub_cool_temp", when="ReportsExtendedOutdoorUnitThermistors"),
+    },
+    GetType.EXTERNAL_STATE: {
+        # IN1 thermostat heat/cool request, IN6 thermostat 2, IN5 outdoor thermostat
+        "In1ThermostatRequest": F("bool", 1, key="status_in1_request"),
+        "In6ThermostatRequest": F("bool", 2, key="status_in6_request"),
+        "In5ThermostatRequest": F("bool", 3, key="status_in5_request"),
+    },
+    GetType.DIP_SWITCHES: {
+        f"DipSwitch{n}": F("u8", 2 * n - 1) for n in range(1, 8)
+    },
+    GetType.ACTIVE_TIME: {
+        "CompressorOn": F("bool", 1, key="status_compressor"), "Runtime": F("float24_v2", 3, key="runtime"),
+    },
+    GetType.FLOW_RATE: {
+        "BoosterActive": F("bool", 2, key="status_booster"), "Booster2Active": F("bool", 3, key="status_booster_2"),
+        "ImmersionActive": F("bool", 5, key="status_immersion"), "FlowRate": F("u8", 12, key="flow_rate"),
+    },
+    GetType.PUMP_STATUS_A: {
+        "WaterPumpActive": F("bool", 1, key="status_water_pump"), "PumpPWM": F("u8", 2), "PumpFeedback": F("u8", 3),
+        "WaterPump2Active": F("bool", 4, key="status_water_pump_2"),
+        "WaterPump3Active": F("bool", 5, key="status_water_pump_3"),
+        "ThreeWayValveActive": F("bool", 6, key="status_three_way_valve"),
+        "ThreeWayValve2Active": F("bool", 7, key="status_three_way_valve_2"),
+        "MixingValveStep": F("u8", 10, key="mixing_valve_step"),
+        "MixingValveStatus": F("u8", 11, key="status_mixing_valve"),
+    },
+    GetType.PUMP_STATUS_B: {
+        "MixingValveStepZ1": F("u8", 8, key="mixing_valve_step_z1"),
+    },
+    GetType.MODE_FLAGS_A: {
+        "Power": F("u8", 3), "Operation": F("u8", 4), "HotWaterMode": F("u8", 5),
+        "HeatingCoolingMode": F("u8", 6), "HeatingCoolingModeZone2": F("u8", 7),
+        "DhwFlowTemperatureSetPoint": F("float16", 8, key="dhw_flow_temp_target"), "MRCFlag": F("u8", 14),
+    },
+    GetType.MODE_FLAGS_B: {
+        "DhwForcedActive": F("bool", 3, key="status_dhw_forced"), "HolidayMode": F("bool", 4, key="status_holiday"),
+        "ProhibitDhw": F("bool", 5, key="status_prohibit_dhw"),
+        "ProhibitHeatingZ1": F("bool", 6, key="status_prohibit_heating_z1"),
+        "ProhibitCoolingZ1": F("bool", 7, key="status_prohibit_cool_z1"),
+        "ProhibitHeatingZ2": F("bool", 8, key="status_prohibit_heating_z2"),
+        "ProhibitCoolingZ2": F("bool", 9, key="status_prohibit_cool_z2"),
+        "ServerControl": F("bool", 10, key="status_server_control"),
+    },
+    GetType.ENERGY_USAGE: {
+        "EnergyConsumedHeating": F("float24", 4, key="heating_consumed"),
+        "EnergyConsumedCooling": F("float24", 7, key="cool_consumed"),
+        "EnergyConsumedDhw": F("float24", 10, key="dhw_consumed"),
+    },
+    GetType.ENERGY_DELIVERY: {
+        "EnergyDeliveredHeating": F("float24", 4, key="heating_delivered"),
+        "EnergyDeliveredCooling": F("float24", 7, key="cool_delivered"),
+        "EnergyDeliveredDhw": F("float24", 10, key="dhw_delivered"),
+    },
+    GetType.SERVICE_REQUEST_CODE: {
+        # reply status 1/2 = value valid; COMPRESSOR_STARTS is an unsigned count of hundreds
+        "RequestCode": F("int16", 1), "RequestCodeStatus": F("u8", 3), "RequestCodeValue": F("request_value", 4),
+    },
+    GetType.HARDWARE_CONFIGURATION: {
+        # ftc, ft2b, ftc4, ftc5, ftc6
+        "Controller": F("u8", 6, key="controller_version"),
+    },
+}
+
+_SCALAR_GETTERS = {
+    "u16": u16, "int16": int16, "int16_v2": int16_v2, "uint16_v2": uint16_v2,
+    "float16": float16, "float16_signed": float16_signed, "float24": float24, "float24_v2": float24_v2,
+    "float8_v2": float8_v2, "float8_v3": float8_v3, "float8_v4": float8_v4,
+}
+
+
+def _decode_field(p, kind, index, arg=None):
+    if kind == "u8":
+        return p[index] + (arg or 0)
+    if kind == "bool":
+        return p[index] != 0
+    if kind == "u8_minus40":
+        return p[index] - 40.0
+    if kind == "float8":
+        return float8(p, index, arg)
+    if kind == "room_float16":
+        return float16(p, index) if p[index] != 0xF0 else 0.0
+    if kind == "condensing":
+        if p[index] == 0x0F and p[index + 1] == 0xD9:
+            return float8_v3(p, index + 2)
+        return float16_signed(p, index)
+    if kind == "any_nonzero":
+        return any(p[index:arg])
+    if kind == "request_value":
+        if int16(p, 1) == RequestCode.COMPRESSOR_STARTS:
+            return ((p[index + 1] << 8) | p[index]) * 100
+        return int16_v2(p, index)
+    value = _SCALAR_GETTERS[kind](p, index)
+    return value * arg if arg is not None else value
+
+
+def decode_payload(payload):
+    """Decode one 16 byte GET/configuration response payload into {field: value}.
+
+    Unknown types return an empty dict.
+    """
+    p = bytes(payload)
+    try:
+        fields = FIELDS[GetType(p[0])]
+    except ValueError:
+        return {}
+    return {name: _decode_field(p, spec.kind, spec.index, spec.arg) for name, spec in fields.items()}
+
+
+def _ntc_inverse(table, value):
+    low = -1
+    for max_byte, scale, offset in table:
+        raw = round((value - offset) / scale)
+        if low < raw <= max_byte:
+            return raw
+        low = max_byte
+    _, scale, offset = table[-1]
+    return round((value - offset) / scale)
+
+
+def _put16(p, i, value, little=False):
+    value = int(round(value)) & 0xFFFF
+    hi, lo = value >> 8, value & 0xFF
+    p[i:i + 2] = (lo, hi) if little else (hi, lo)
+
+
+def _encode_field(p, kind, index, arg, value):
+    if kind == "u8":
+        p[index] = int(value) - (arg or 0)
+    elif kind == "bool":
+        p[index] = 1 if value else 0
+    elif kind == "u8_minus40":
+        p[index] = round(value + 40)
+    elif kind == "float8":
+        p[index] = round((value + arg) * 2)
+    elif kind == "float8_v2":
+        p[index] = round(value * 2 + 40)
+    elif kind in ("float8_v3", "float8_v4"):
+        p[index] = _ntc_inverse(NTC_TABLE_V3 if kind == "float8_v3" else NTC_TABLE_V4, value)
+    elif kind == "u16":
+        _put16(p, index, value / arg if arg is not None else value)
+    elif kind == "int16":
+        _put16(p, index, value)
+    elif kind in ("int16_v2", "uint16_v2"):
+        _put16(p, index, value, little=True)
+    elif kind in ("float16", "float16_signed", "condensing"):
+        _put16(p, index, value * 100)
+    elif kind == "room_float16":
+        if value is None:
+            p[index:index + 2] = (0xF0, 0x00)
+        else:
+            _put16(p, index, value * 100)
+    elif kind == "float24":
+        whole = int(value)
+        _put16(p, index, whole)
+        p[index + 2] = round((value - whole) * 100)
+    elif kind == "float24_v2":
+        value = int(value)
+        p[index] = value % 100
+        _put16(p, index + 1, value // 100)
+    elif kind == "request_value":
+        starts = int16(p, 1) == RequestCode.COMPRESSOR_STARTS
+        _put16(p, index, value // 100 if starts else value, little=True)
+    # any_nonzero is derived from the other fields
+
+
+def encode_payload(get_type, values):
+    """Inverse of decode_payload: a 16 byte payload carrying the given field values.
+
+    Fields not in values are left zero. A room temperature of None encodes the 0xF0
+    "not present" marker. Values are rounded to the resolution of their encoding.
+    """
+    fields = FIELDS[GetType(get_type)]
+    p = [0] * PAYLOAD_SIZE
+    p[0] = int(get_type)
+    # the request code decides how the service request value is encoded
+    for name in sorted(values, key=lambda n: fields[n].kind == "request_value"):
+        spec = fields[name]
+        _encode_field(p, spec.kind, spec.index, spec.arg, values[name])
+    return bytes(b & 0xFF for b in p)
+
+
+def decode_frame(frame):
+    """(GetType or None, fields) for a complete frame, raising ValueError on bad framing."""
+    if not verify_frame(frame):
+        raise ValueError("invalid frame")
+    if frame[1] not in (MsgType.GET_RES, MsgType.CONFIGURATION_RES):
+        return None, {}
+    p = payload_of(frame)
+    try:
+        get_type = GetType(p[0])
+    except ValueError:
+        return None, {}
+    return get_type, decode_payload(p)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized decoding (NumPy)
+# ---------------------------------------------------------------------------
+
+def _ntc_vec(np, table, values):
+    bounds = np.array([row[0] for row in table])
+    scale = np.array([row[1] for row in table])
+    offset = np.array([row[2] for row in table])
+    segment = np.minimum(np.searchsorted(bounds, values, side="left"), len(table) - 1)
+    return values * scale[segment] + offset[segment]
+
+
+def _decode_field_vec(np, p, kind, index, arg=None):
+    b = p.astype(np.int32)
+
+    def be16(i):
+        return (b[:, i] << 8) | b[:, i + 1]
+
+    def le16(i):
+        return (b[:, i + 1] << 8) | b[:, i]
+
+    def signed(v):
+        return np.where(v & 0x8000, v - 0x10000, v)
+
+    if kind == "u8":
+        return b[:, index] + (arg or 0)
+    if kind == "bool":
+        return b[:, index] != 0
+    if kind == "u8_minus40":
+        return b[:, index] - 40.0
+    if kind == "float8":
+        return b[:, index] / 2 - arg
+    if kind == "float8_v2":
+        return (b[:, index] - 40.0) / 2
+    if kind == "float8_v3":
+        return _ntc_vec(np, NTC_TABLE_V3, b[:, index])
+    if kind == "float8_v4":
+        return _ntc_vec(np, NTC_TABLE_V4, b[:, index])
+    if kind == "u16":
+        value = be16(index)
+        return value * arg if arg is not None else value
+    if kind == "int16":
+        return signed(be16(index))
+    if kind in ("int16_v2", "uint16_v2"):
+        return signed(le16(index))
+    if kind == "float16":
+        return be16(index) / 100.0
+    if kind == "float16_signed":
+        return signed(be16(index)) / 100.0
+    if kind == "float24":
+        return be16(index) + b[:, index + 2] / 100.0
+    if kind == "float24_v2":
+        return be16(index + 1) * 100.0 + b[:, index]
+    if kind == "room_float16":
+        return np.where(b[:, index] != 0xF0, be16(index) / 100.0, 0.0)
+    if kind == "condensing":
+        stuck = (b[:, index] == 0x0F) & (b[:, index + 1] == 0xD9)
+        return np.where(stuck, _ntc_vec(np, NTC_TABLE_V3, b[:, index + 2]), signed(be16(index)) / 100.0)
+    if kind == "any_nonzero":
+        return (b[:, index:arg] != 0).any(axis=1)
+    if kind == "request_value":
+        starts = signed(be16(1)) == RequestCode.COMPRESSOR_STARTS
+        return np.where(starts, le16(index) * 100, signed(le16(index)))
+    raise ValueError(f"unknown field kind {kind}")
+
+
+def decode_batch(payloads, get_type=None):
+    """Decode many payloads at once.
+
+    payloads is a list of 16 byte payloads or anything np.asarray turns into an (N, 16) uint8 array. Rows are grouped by
+    their type byte. Returns {GetType: {field: ndarray}}, plus the row indices of each type
+    under the key "_rows" so results can be joined back to capture timestamps. Pass get_type
+    to decode only that type.
+    """
+    import numpy as np
+
+    if isinstance(payloads, (list, tuple)) and payloads and isinstance(payloads[0], (bytes, bytearray)):
+        p = np.frombuffer(b"".join(bytes(row[:PAYLOAD_SIZE]) for row in payloads), dtype=np.uint8).reshape(-1, PAYLOAD_SIZE)
+    else:
+        p = np.asarray(payloads, dtype=np.uint8)
+    if p.ndim != 2 or p.shape[1] < PAYLOAD_SIZE:
+        raise ValueError(f"expected an (N, {PAYLOAD_SIZE}) array, got shape {p.shape}")
+
+    types = [GetType(get_type)] if get_type is not None else [t for t in GetType if t in FIELDS]
+    result = {}
+    for t in types:
+        rows = np.flatnonzero(p[:, 0] == t)
+        if rows.size == 0:
+            continue
+        block = p[rows]
+        decoded = {name: _decode_field_vec(np, block, spec.kind, spec.index, spec.arg)
+                   for name, spec in FIELDS[t].items()}
+        decoded["_rows"] = rows
+        result[t] = decoded
+    return result
+
+
+def frames_to_payloads(frames):
+    """Stack the payloads of GET/configuration responses into an (N, 16) uint8 array."""
+    import numpy as np
+
+    rows = [payload_of(f) for f in frames if f[1] in (MsgType.GET_RES, MsgType.CONFIGURATION_RES)]
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(-1, PAYLOAD_SIZE)
+
+
+# ---------------------------------------------------------------------------
+# Golden vectors
+# ---------------------------------------------------------------------------
+
+# Frames copied from serial.cpp (proxy handshake and keep alive) and protocol.md (prohibit commands)
+GOLDEN_FRAMES = {
+    "connect_request": "fc 5a 02 7a 02 ca 01 5d",
+    "connect_response": "fc 7a 02 7a 01 00 09",
+    "first_request": "02 ff ff 00 00 00 00 02",
+    "expected_first_response": "02 ff ff 80 00 00 0a 01 00 40 00 00 06 02 7a 00 00 b5",
+    "expected_second_response": "02 ff ff 81 00 00 00 81",
+    "keep_alive_request": "fc 41 02 7a 10 34 00 01 00 00 00 00 00 00 00 00 01 00 00 00 00 fd",
+    "keep_alive_response": "fc 61 02 7a 10 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 13",
+    "prohibit_cool_z1": "fc 41 02 7a 10 34 10 00 00 00 00 00 01 00 00 00 00 00 00 00 00 ee",
+    "prohibit_cool_z2": "fc 41 02 7a 10 34 40 00 00 00 00 00 00 00 01 00 00 00 00 00 00 be",
+    "prohibit_heating_z1": "fc 41 02 7a 10 34 08 00 00 00 00 01 00 00 00 00 00 00 00 00 00 f6",
+    "prohibit_heating_z2": "fc 41 02 7a 10 34 20 00 00 00 00 00 00 01 00 00 00 00 00 00 00 de",
+    "prohibit_dhw": "fc 41 02 7a 10 34 04 00 00 00 01 00 00 00 00 00 00 00 00 00 00 fa",
+}
+
+# (payload hex, expected fields) built from the protocol.md layouts
+GOLDEN_PAYLOADS = [
+    ("0c 0d de 00 0b b8 00 13 88 00 00 00 00 00 00 00",
+     {"HpFeedTemperature": 35.5, "HpReturnTemperature": 30.0, "DhwTemperature": 50.0}),
+    ("0b f0 00 08 34 00 00 00 fe d4 00 6e 00 00 00 00",
+     {"Zone1RoomTemperature": 0.0, "Zone2RoomTemperature": 21.0, "OutsideTemperature": 15.0,
+      "HpRefrigerantLiquidTemperature": -3.0}),
+    ("a1 18 05 01 00 7b 32 00 0a 05 00 2a 00 00 00 00",
+     {"EnergyConsumedHeating": 123.5, "EnergyConsumedCooling": 10.05, "EnergyConsumedDhw": 42.0}),
+    ("13 01 00 2d 04 d2 00 00 00 00 00 00 00 00 00 00",
+     {"CompressorOn": True, "Runtime": 123445.0}),
+    ("a3 00 03 02 c8 00 00 00 00 00 00 00 00 00 00 00",
+     {"RequestCode": 3, "RequestCodeStatus": 2, "RequestCodeValue": 20000}),
+    ("0f 00 00 00 0f d9 80 00 00 00 00 00 00 00 00 00",
+     {"HpRefrigerantCondensingTemperature": 128 * 0.40923 - 10.395,
+      "ReportsExtendedOutdoorUnitThermistors": False}),
+]
+
+
+def check():
+    """Verify the framing and decoders against the golden vectors, returns the number of failures."""
+    failures = 0
+    for name, text in GOLDEN_FRAMES.items():
+        frame = bytes.fromhex(text)
+        if not verify_frame(frame):
+            print(f"FAIL frame {name}: checksum {checksum(frame):02x}, expected {frame[-1]:02x}")
+            failures += 1
+        elif frame[0] == HEADER_MAGIC_A1 and payload_size(frame) == PAYLOAD_SIZE:
+            rebuilt = build_frame(frame[1], frame[HEADER_SIZE_A:-1])
+            if rebuilt != frame:
+                print(f"FAIL frame {name}: rebuilt as {rebuilt.hex(' ')}")
+                failures += 1
+
+    stream = b"\x00\x13" + b"".join(bytes.fromhex(t) for t in GOLDEN_FRAMES.values()) + b"\xfc\x62"
+    found = [f for _, f in split_frames(stream)]
+    if len(found) != len(GOLDEN_FRAMES):
+        print(f"FAIL split_frames: {len(found)} frames, expected {len(GOLDEN_FRAMES)}")
+        failures += 1
+
+    for text, expected in GOLDEN_PAYLOADS:
+        payload = bytes.fromhex(text)
+        decoded = decode_payload(payload)
+        try:
+            batch = decode_batch([payload, payload])[GetType(payload[0])]
+        except ImportError:
+            batch = None
+        for field, value in expected.items():
+            got = [decoded[field]] + ([v.item() for v in batch[field]] if batch is not None else [])
+            if any(abs(g - value) > 1e-6 for g in got):
+                print(f"FAIL {GetType(payload[0]).name}.{field}: {got}, expected {value}")
+                failures += 1
+    print(f"{len(GOLDEN_FRAMES)} frames, {len(GOLDEN_PAYLOADS)} payloads checked, {failures} failures")
+    return failures
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args == ["--check"]:
+        sys.exit(1 if check() else 0)
+
+    frame = bytes.fromhex("".join(args))
+    if not verify_frame(frame):
+        print(f"invalid frame (checksum {checksum(frame):02x})" if verify_header(frame) else "invalid header")
+        sys.exit(1)
+    get_type, fields = decode_frame(frame)
+    print(f"{MsgType(frame[1]).name if frame[1] in MsgType._value2member_map_ else hex(frame[1])}"
+          f" {get_type.name if get_type else ''}")
+    for name, value in fields.items():
+        print(f"  {name} = {value}")
+
+
+if __name__ == "__main__":
+    main()
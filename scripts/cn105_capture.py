@@ -0,0 +1,280 @@
+# ABOUTME: Records and decodes raw CN105 bus captures streamed by the ecodan component (bus_capture_port option).
+# ABOUTME: Run with: python scripts/cn105_capture.py record 192.168.1.230:6638 bus.cap | summary bus.cap | csv bus.cap out/
+
+import argparse
+import csv
+import os
+import socket
+import struct
+import sys
+import time
+from enum import IntEnum
+
+import numpy as np
+
+import cn105
+
+# Stream layout, see components/ecodan/capture.cpp
+MAGIC = b"CN5C"
+FORMAT_VERSION = 1
+STREAM_HEADER = struct.Struct("<4sB3x")
+RECORD_HEADER = struct.Struct("<IBB")  # timestamp us, flags, length
+FLAG_DIRECTION = 0x03
+FLAG_DROPPED = 0x40
+FLAG_BAD_CHECKSUM = 0x80
+
+DEFAULT_PORT = 6638
+
+
+class Direction(IntEnum):
+    FROM_FTC = 0
+    TO_FTC = 1
+    FROM_SLAVE = 2
+
+
+class Capture:
+    """Frames of one capture as parallel arrays, in bus order.
+
+    t is seconds since the first record (micros() wraps are unwrapped), frames[i] is the raw
+    frame and payloads is an (N, 16) uint8 array with the zero padded payload of each frame.
+    """
+
+    def __init__(self, t, direction, bad, msg_type, payloads, frames, dropped):
+        self.t = t
+        self.direction = direction
+        self.bad = bad
+        self.msg_type = msg_type
+        self.payloads = payloads
+        self.frames = frames
+        self.dropped = dropped
+
+    def __len__(self):
+        return len(self.t)
+
+    def select(self, mask):
+        idx = np.flatnonzero(mask)
+        return Capture(self.t[idx], self.direction[idx], self.bad[idx], self.msg_type[idx],
+                       self.payloads[idx], [self.frames[i] for i in idx], self.dropped)
+
+
+def encode_record(timestamp_us, direction, frame, bad_checksum=False):
+    flags = int(direction) | (FLAG_BAD_CHECKSUM if bad_checksum else 0)
+    return RECORD_HEADER.pack(timestamp_us & 0xFFFFFFFF, flags, len(frame)) + bytes(frame)
+
+
+def encode_header():
+    return STREAM_HEADER.pack(MAGIC, FORMAT_VERSION)
+
+
+def read_capture(data):
+    """Parse a capture file body into a Capture."""
+    if len(data) < STREAM_HEADER.size:
+        raise ValueError("capture too short")
+    magic, version = STREAM_HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"bad magic {magic!r}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported capture format version {version}")
+
+    # Records are variable length, so only the walk over their headers is sequential;
+    # everything after that is done on whole arrays.
+    offsets, dropped = [], 0
+    pos, end, size = STREAM_HEADER.size, len(data), RECORD_HEADER.size
+    while pos + size <= end:
+        length = data[pos + 5]
+        if pos + size + length > end:
+            break  # capture cut off mid record
+        if data[pos + 4] & FLAG_DROPPED:
+            dropped += int.from_bytes(data[pos + size:pos + size + 4], "little")
+        else:
+            offsets.append(pos)
+        pos += size + length
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # room to read a full payload past the last frame without bounds checks
+    buf = np.concatenate([buf, np.zeros(cn105.MAX_FRAME_SIZE, dtype=np.uint8)])
+    rec = np.array(offsets, dtype=np.int64)
+    start = rec + size
+
+    ts = (buf[rec].astype(np.int64) | buf[rec + 1].astype(np.int64) << 8
+          | buf[rec + 2].astype(np.int64) << 16 | buf[rec + 3].astype(np.int64) << 24)
+    if len(ts):
+        ts += np.concatenate([[0], np.cumsum(np.diff(ts) < 0)]) << 32
+        ts -= ts[0]
+    t = ts / 1e6
+
+    flags = buf[rec + 4]
+    lengths = buf[rec + 5].astype(np.int64)
+    sync_a = buf[start] == cn105.HEADER_MAGIC_A1
+    header = np.where(sync_a, cn105.HEADER_SIZE_A, cn105.HEADER_SIZE_B)
+    psize = np.where(sync_a, buf[start + cn105.PAYLOAD_SIZE_OFFSET_A], buf[start + cn105.PAYLOAD_SIZE_OFFSET_B])
+    psize = np.minimum(np.minimum(psize, cn105.PAYLOAD_SIZE), np.maximum(lengths - header - 1, 0))
+    cols = np.arange(cn105.PAYLOAD_SIZE)
+    payloads = buf[(start + header)[:, None] + cols]
+    payloads = np.where(cols < psize[:, None], payloads, 0).astype(np.uint8)
+
+    frames = [data[s:s + n] for s, n in zip(start.tolist(), lengths.tolist())]
+    return Capture(t, (flags & FLAG_DIRECTION).astype(np.uint8), (flags & FLAG_BAD_CHECKSUM) != 0,
+                   buf[start + 1], payloads, frames, dropped)
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return read_capture(f.read())
+
+
+def time_series(capture):
+    """{GetType: {"t": seconds, field: values}} for every valid status reply from the FTC."""
+    replies = capture.select((capture.direction == Direction.FROM_FTC) & ~capture.bad
+                             & np.isin(capture.msg_type, [cn105.MsgType.GET_RES, cn105.MsgType.CONFIGURATION_RES]))
+    series = {}
+    for get_type, fields in cn105.decode_batch(replies.payloads).items():
+        rows = fields.pop("_rows")
+        series[get_type] = {"t": replies.t[rows], **fields}
+    return series
+
+
+def latency(capture):
+    """Round trip per request type: {name: (sent, answered, latencies in seconds)}.
+
+    A GET request is answered by the first GET_RES with the same type byte (and the same
+    request code for service requests) before the next request; SET commands pair with the
+    next SET_RES. Requests from a slave controller on the proxy port are included. Timestamps
+    are taken when a request is handed to the UART and when the last reply byte arrives, so
+    each value includes roughly 2 x 100 ms of 2400 baud transfer time.
+    """
+    valid = ~capture.bad
+    is_request = valid & np.isin(capture.direction, [Direction.TO_FTC, Direction.FROM_SLAVE]) \
+        & np.isin(capture.msg_type, [cn105.MsgType.GET_CMD, cn105.MsgType.SET_CMD])
+    is_reply = valid & (capture.direction == Direction.FROM_FTC) \
+        & np.isin(capture.msg_type, [cn105.MsgType.GET_RES, cn105.MsgType.SET_RES])
+
+    req = np.flatnonzero(is_request)
+    rep = np.flatnonzero(is_reply)
+    # key: GET type byte (plus request code) or 0x100 for any SET
+    p = capture.payloads.astype(np.int64)
+    key = np.where(capture.msg_type == cn105.MsgType.GET_CMD, p[:, 0], 0x100)
+    key = np.where(capture.msg_type == cn105.MsgType.GET_RES, p[:, 0], key)
+    key = np.where(capture.msg_type == cn105.MsgType.SET_RES, 0x100, key)
+    service = key == cn105.GetType.SERVICE_REQUEST_CODE
+    key = np.where(service, key << 16 | p[:, 1] << 8 | p[:, 2], key)
+
+    # latest request before each reply, and the reply must come before the request after that
+    answered = np.zeros(len(req), dtype=bool)
+    delay = np.full(len(req), np.nan)
+    if len(req) and len(rep):
+        prior = np.searchsorted(req, rep) - 1
+        ok = prior >= 0
+        prior, rep = prior[ok], rep[ok]
+        match = key[req[prior]] == key[rep]
+        prior, rep = prior[match], rep[match]
+        first = np.unique(prior, return_index=True)[1]
+        prior, rep = prior[first], rep[first]
+        answered[prior] = True
+        delay[prior] = capture.t[rep] - capture.t[req[prior]]
+
+    result = {}
+    for k in np.unique(key[req]):
+        sel = key[req] == k
+        result[_key_name(int(k))] = (int(sel.sum()), int(answered[sel].sum()), delay[sel & answered])
+    return result
+
+
+def _key_name(key):
+    if key == 0x100:
+        return "SET"
+    if key > 0xFFFF:
+        code = key & 0xFFFF
+        try:
+            return f"RC {cn105.RequestCode(code).name}"
+        except ValueError:
+            return f"RC {code}"
+    try:
+        return cn105.GetType(key).name
+    except ValueError:
+        return f"0x{key:02X}"
+
+
+def record(target, path, duration=None):
+    host, _, port = target.partition(":")
+    with socket.create_connection((host, int(port or DEFAULT_PORT)), timeout=10) as sock, open(path, "wb") as out:
+        sock.settimeout(1.0)
+        start = last_report = time.monotonic()
+        total = 0
+        while duration is None or time.monotonic() - start < duration:
+            try:
+                chunk = sock.recv(4096)
+            except socket.timeout:
+                chunk = b""
+            else:
+                if not chunk:
+                    break
+            out.write(chunk)
+            total += len(chunk)
+            if time.monotonic() - last_report >= 1.0:
+                last_report = time.monotonic()
+                print(f"\r{total} bytes, {last_report - start:.0f}s", end="", file=sys.stderr)
+        print(f"\r{total} bytes, {time.monotonic() - start:.0f}s", file=sys.stderr)
+
+
+def summary(capture, elapsed=None):
+    span = capture.t[-1] if len(capture) else 0.0
+    print(f"{len(capture)} frames over {span:.1f}s, {int(capture.bad.sum())} bad checksums, "
+          f"{capture.dropped} dropped on the device" + (f" (decoded in {elapsed:.2f}s)" if elapsed else ""))
+    for d in Direction:
+        print(f"  {d.name:<11}{int((capture.direction == d).sum()):>8}")
+
+    print(f"\n{'request':<28}{'sent':>7}{'lost':>6}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    for name, (sent, answered, delays) in sorted(latency(capture).items()):
+        if len(delays):
+            p50, p95, top = (f"{v * 1000:.0f}" for v in np.percentile(delays, [50, 95, 100]))
+        else:
+            p50 = p95 = top = "-"
+        print(f"{name:<28}{sent:>7}{sent - answered:>6}{p50:>9}{p95:>9}{top:>9}")
+
+
+def write_csv(capture, outdir):
+    """One CSV per GetType with a row per reply, t in seconds since the start of the capture."""
+    os.makedirs(outdir, exist_ok=True)
+    for get_type, fields in time_series(capture).items():
+        names = list(fields)
+        path = os.path.join(outdir, f"{get_type.name.lower()}.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(names)
+            columns = [fields[n].tolist() for n in names]
+            writer.writerows(zip(*columns))
+        print(f"{path}: {len(fields['t'])} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and decode CN105 bus captures")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="stream a capture from the device into a file")
+    rec.add_argument("target", help=f"host[:port], port defaults to {DEFAULT_PORT}")
+    rec.add_argument("file")
+    rec.add_argument("--duration", type=float, help="seconds, until interrupted when not given")
+    summ = sub.add_parser("summary", help="frame counts and round-trip latency per request type")
+    summ.add_argument("file")
+    out = sub.add_parser("csv", help="write per-GetType field time series as CSV")
+    out.add_argument("file")
+    out.add_argument("outdir")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        try:
+            record(args.target, args.file, args.duration)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    start = time.perf_counter()
+    capture = load(args.file)
+    if args.command == "summary":
+        summary(capture, time.perf_counter() - start)
+    else:
+        write_csv(capture, args.outdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# ABOUTME: Encoder/decoder for the packed int16 /dashboard/history format served by the asgard_dashboard component.
+# ABOUTME: Run with: python scripts/dashboard_history.py [http://192.168.1.230] (prints the device history as CSV) or --check
+
+import ast
+import math
+import os
+import struct
+import sys
+import time
+import urllib.request
+from array import array
+
+ESP32_URL = "http://192.168.1.230"
+
+MAGIC = b"EH"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<2sBBHHII")  # magic, version, series count, samples, reserved, interval s, age ms
+DESCRIPTOR = struct.Struct("<BxH")   # series id, pad, scale
+MISSING = -32768
+
+# Series ids are fixed by HISTORY_SERIES in components/asgard_dashboard/__init__.py
+SERIES_NAMES = {
+    0: "feed_temp",
+    1: "return_temp",
+    2: "outside_temp",
+    3: "compressor_hz",
+    4: "output_power_kw",
+    5: "cop",
+}
+
+SERIES_SCALES = {
+    0: 100,
+    1: 100,
+    2: 100,
+    3: 10,
+    4: 100,
+    5: 100,
+}
+
+
+def _pack_value(value, scale):
+    if value is None or value != value:
+        return MISSING
+    # lroundf on the device: halves away from zero
+    scaled = math.copysign(math.floor(abs(value * scale) + 0.5), value)
+    return int(max(-32767, min(32767, scaled)))
+
+
+def encode_history(series, interval_s, age_ms=0):
+    """Pack {series id: [value or None, ...]} (oldest first) the way the device does.
+
+    All series must have the same length. Scales come from SERIES_SCALES.
+    """
+    ids = list(series)
+    counts = {len(values) for values in series.values()}
+    if len(counts) > 1:
+        raise ValueError("all series must have the same number of samples")
+    count = counts.pop() if counts else 0
+
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(ids), count, 0, interval_s, age_ms))
+    for series_id in ids:
+        out += DESCRIPTOR.pack(series_id, SERIES_SCALES[series_id])
+    for series_id in ids:
+        scale = SERIES_SCALES[series_id]
+        samples = array("h", (_pack_value(v, scale) for v in series[series_id]))
+        if sys.byteorder != "little":
+            samples.byteswap()
+        out += samples.tobytes()
+    return bytes(out)
+
+
+def decode_history(data):
+    """Unpack a /dashboard/history body.
+
+    Returns a dict with interval_s, age_ms, count and series {id: [float or None, ...]}
+    (oldest first).
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("history body too short")
+    magic, version, n, count, _, interval_s, age_ms = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"bad magic {magic!r}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported history format version {version}")
+    expected = HEADER.size + n * DESCRIPTOR.size + n * count * 2
+    if len(data) != expected:
+        raise ValueError(f"history body is {len(data)} bytes, expected {expected}")
+
+    descriptors = [DESCRIPTOR.unpack_from(data, HEADER.size + i * DESCRIPTOR.size) for i in range(n)]
+    offset = HEADER.size + n * DESCRIPTOR.size
+    series = {}
+    for series_id, scale in descriptors:
+        samples = array("h")
+        samples.frombytes(data[offset:offset + count * 2])
+        if sys.byteorder != "little":
+            samples.byteswap()
+        series[series_id] = [None if v == MISSING else v / scale for v in samples]
+        offset += count * 2
+    return {"interval_s": interval_s, "age_ms": age_ms, "count": count, "series": series}
+
+
+def sample_times(history, now=None):
+    """Unix timestamps for each sample, derived from the age of the newest one."""
+    now = time.time() if now is None else now
+    newest = now - history["age_ms"] / 1000.0
+    count = history["count"]
+    return [newest - (count - 1 - i) * history["interval_s"] for i in range(count)]
+
+
+def device_body(ids, scales, ring, head, count, interval_s, age_ms):
+    """The bytes handle_history_ sends for a series-major ring of int16 slots (ring[series][slot]).
+
+    Written from the device code rather than from HEADER, so check() compares the two.
+    """
+    capacity = len(ring[0]) if ring else 0
+    header = bytearray(16)
+    header[0:2] = b"EH"
+    header[2] = FORMAT_VERSION
+    header[3] = len(ids)
+    header[4:6] = count.to_bytes(2, "little")
+    header[8:12] = interval_s.to_bytes(4, "little")
+    header[12:16] = age_ms.to_bytes(4, "little")
+    for series_id, scale in zip(ids, scales):
+        header += bytes([series_id, 0]) + scale.to_bytes(2, "little")
+    body = bytes(header)
+    oldest = (head + capacity - count) % capacity if capacity else 0
+    first_len = min(count, capacity - oldest)
+    for slots in ring:
+        ordered = slots[oldest:oldest + first_len] + slots[:count - first_len]
+        body += b"".join(v.to_bytes(2, "little", signed=True) for v in ordered)
+    return body
+
+
+def component_series():
+    """HISTORY_SERIES from the component's __init__.py, read without ESPHome installed."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "components", "asgard_dashboard",
+                        "__init__.py")
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "HISTORY_SERIES" for t in node.targets):
+            return ast.literal_eval(node.value)
+    return []
+
+
+def check():
+    """Round trip the codec against the device layout, returns the number of failures."""
+    failures = 0
+
+    def fail(message):
+        nonlocal failures
+        failures += 1
+        print(f"FAIL {message}")
+
+    # the 16 byte header, descriptors and samples, pinned byte for byte
+    golden = bytes.fromhex("45 48 01 02 02 00 00 00 3c 00 00 00 d2 04 00 00"
+                           "00 00 64 00 03 00 0a 00"
+                           "66 08 00 80 c2 01 00 00")
+    encoded = encode_history({0: [21.5, None], 3: [45.0, 0.0]}, 60, 1234)
+    if HEADER.size != 16:
+        fail(f"header is {HEADER.size} bytes, the device sends 16")
+    if encoded != golden:
+        fail(f"golden body encoded as {encoded.hex(' ')}")
+    decoded = decode_history(golden)
+    if (decoded["interval_s"], decoded["age_ms"], decoded["count"]) != (60, 1234, 2):
+        fail(f"golden header decoded as {decoded['interval_s']}, {decoded['age_ms']}, {decoded['count']}")
+    if decoded["series"] != {0: [21.5, None], 3: [45.0, 0.0]}:
+        fail(f"golden samples decoded as {decoded['series']}")
+
+    # HISTORY_MISSING: None and NaN become INT16_MIN, and clamping never produces it
+    for value, expected in ((None, MISSING), (float("nan"), MISSING), (-1e9, -32767), (1e9, 32767),
+                            (0.125, 13), (-0.125, -13)):
+        packed = _pack_value(value, 100)
+        if packed != expected:
+            fail(f"pack {value}: {packed}, expected {expected}")
+
+    # ring wrap-around: capacity 5, seven samples stored, so the oldest is at slot 2
+    ids, scales, capacity = [0, 3], [100, 10], 5
+    values = {0: [20.0, 20.25, None, 21.0, -5.5, 22.75, 23.0], 3: [0.0, 35.5, 40.0, None, 50.0, 62.3, 70.0]}
+    ring, head, count = [[MISSING] * capacity for _ in ids], 0, 0
+    for t in range(7):
+        for row, series_id, scale in zip(ring, ids, scales):
+            row[head] = _pack_value(values[series_id][t], scale)
+        head = (head + 1) % capacity
+        count = min(count + 1, capacity)
+        body = device_body(ids, scales, ring, head, count, 300, 0)
+        history = decode_history(body)
+        for series_id, scale in zip(ids, scales):
+            expected = [None if v is None else round(v * scale) / scale for v in values[series_id][max(0, t + 1 - capacity):t + 1]]
+            if history["series"][series_id] != expected:
+                fail(f"ring after {t + 1} samples, series {series_id}: {history['series'][series_id]}, expected {expected}")
+        window = {series_id: values[series_id][max(0, t + 1 - capacity):t + 1] for series_id in ids}
+        if encode_history(window, 300, 0) != body:
+            fail(f"encode_history differs from the device ring after {t + 1} samples")
+
+    # per series scaling: the decoder takes each series' scale from its descriptor
+    body = device_body([7], [1000], [[1234, -32767, MISSING]], 0, 3, 60, 0)
+    if decode_history(body)["series"] != {7: [1.234, -32.767, None]}:
+        fail(f"scale 1000 decoded as {decode_history(body)['series']}")
+    component = {series_id: scale for _, series_id, scale in component_series()}
+    if component != SERIES_SCALES:
+        fail(f"SERIES_SCALES {SERIES_SCALES} differ from HISTORY_SERIES {component}")
+
+    for broken, reason in ((golden[:10], "too short"), (b"XX" + golden[2:], "bad magic"),
+                           (golden[:2] + b"\x02" + golden[3:], "version"), (golden + b"\x00\x00", "length")):
+        try:
+            decode_history(broken)
+            fail(f"decoded a body with a wrong {reason}")
+        except ValueError:
+            pass
+
+    print(f"history codec checked, {failures} failures")
+    return failures
+
+
+def main():
+    if sys.argv[1:] == ["--check"]:
+        sys.exit(1 if check() else 0)
+    base = sys.argv[1] if len(sys.argv) > 1 else ESP32_URL
+    with urllib.request.urlopen(base.rstrip("/") + "/dashboard/history", timeout=10) as resp:
+        history = decode_history(resp.read())
+
+    ids = list(history["series"])
+    print(",".join(["timestamp"] + [SERIES_NAMES.get(i, f"series_{i}") for i in ids]))
+    for idx, ts in enumerate(sample_times(history)):
+        row = [time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))]
+        for series_id in ids:
+            value = history["series"][series_id][idx]
+            row.append("" if value is None else f"{value:g}")
+        print(",".join(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# ABOUTME: Load test for the ESP32 dashboard endpoints: N concurrent pollers plus SSE listeners, reports latency percentiles.
+# ABOUTME: Run with: python scripts/dashboard_load.py [--url http://192.168.1.230] [--clients 4] [--standin] (offline run)
+
+import argparse
+import http.client
+import json
+import math
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+ESP32_URL = "http://192.168.1.230"
+
+# Poller request mix: (name, method, path, relative weight). /dashboard/set posts a key the
+# device does not know, which goes through parsing and the action queue but changes nothing.
+REQUESTS = [
+    ("dashboard", "GET", "/dashboard", 1),
+    ("state", "GET", "/dashboard/state", 8),
+    ("set", "POST", "/dashboard/set", 1),
+]
+SET_BODY = json.dumps({"key": "loadtest_noop", "value": 0})
+
+# Event streams can be quiet for a while (keepalives every 15 s), so give them a longer socket timeout
+SSE_TIMEOUT = 30.0
+
+
+class Stats:
+    """Per-endpoint latency samples, error counts and byte totals, shared by all workers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.bytes = {}
+        self.error_kinds = {}
+
+    def record(self, name, latency, nbytes, error=None):
+        with self.lock:
+            self.bytes[name] = self.bytes.get(name, 0) + nbytes
+            if error is None:
+                self.latencies.setdefault(name, []).append(latency)
+            else:
+                self.errors[name] = self.errors.get(name, 0) + 1
+                self.error_kinds[error] = self.error_kinds.get(error, 0) + 1
+
+    def names(self):
+        return sorted(set(self.latencies) | set(self.errors) | set(self.bytes))
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def build_schedule():
+    """Expand REQUESTS weights into a fixed shuffled cycle so every worker sees the same mix."""
+    schedule = []
+    for name, method, path, weight in REQUESTS:
+        schedule.extend([(name, method, path)] * weight)
+    random.Random(0).shuffle(schedule)
+    return schedule
+
+
+def poller(host, port, timeout, stats, stop, think, offset):
+    schedule = build_schedule()
+    conn = None
+    i = offset
+    while not stop.is_set():
+        name, method, path = schedule[i % len(schedule)]
+        i += 1
+        if conn is None:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        body = SET_BODY if method == "POST" else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            data = resp.read()
+            latency = time.perf_counter() - start
+            error = None if resp.status == 200 else f"HTTP {resp.status}"
+            stats.record(name, latency, len(data), error)
+            if resp.getheader("Connection", "").lower() == "close":
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException) as e:
+            stats.record(name, time.perf_counter() - start, 0, type(e).__name__)
+            conn.close()
+            conn = None
+        if think > 0:
+            stop.wait(think)
+    if conn is not None:
+        conn.close()
+
+
+def listener(name, host, port, path, timeout, stats, stop):
+    """Hold an SSE connection open; latency is time to the first event, bytes count the whole stream."""
+    while not stop.is_set():
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        start = time.perf_counter()
+        received = 0
+        first = None
+        head = b""
+        try:
+            conn.request("GET", path, headers={"Accept": "text/event-stream"})
+            resp = conn.getresponse()
+            if resp.status != 200:
+                resp.read()
+                stats.record(name, time.perf_counter() - start, 0, f"HTTP {resp.status}")
+                stop.wait(1.0)
+                continue
+            while not stop.is_set():
+                chunk = resp.read1(4096)
+                if not chunk:
+                    raise ConnectionResetError("stream closed")
+                received += len(chunk)
+                if first is None:
+                    head += chunk
+                    if b"data:" in head and b"\n\n" in head[head.index(b"data:"):]:
+                        first = time.perf_counter() - start
+            stats.record(name, first if first is not None else time.perf_counter() - start, received)
+        except (OSError, http.client.HTTPException) as e:
+            stats.record(name, time.perf_counter() - start, received, type(e).__name__)
+            stop.wait(1.0)
+        finally:
+            conn.close()
+
+
+def report(stats, elapsed):
+    print(f"{'endpoint':<12}{'ok':>7}{'err':>6}{'err%':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'B/s':>11}")
+    total_ok = total_err = total_bytes = 0
+    all_latencies = []
+    for name in stats.names():
+        lat = sorted(stats.latencies.get(name, []))
+        ok, err, nbytes = len(lat), stats.errors.get(name, 0), stats.bytes.get(name, 0)
+        total_ok += ok
+        total_err += err
+        total_bytes += nbytes
+        if not name.startswith("sse:"):
+            all_latencies.extend(lat)
+        print(_row(name, lat, ok, err, nbytes, elapsed))
+    print(_row("total", sorted(all_latencies), total_ok, total_err, total_bytes, elapsed))
+    if stats.error_kinds:
+        print("errors: " + ", ".join(f"{k} x{v}" for k, v in sorted(stats.error_kinds.items())))
+
+
+def _row(name, lat, ok, err, nbytes, elapsed):
+    def ms(v):
+        return "-" if v is None else f"{v * 1000:.0f}"
+    rate = 100.0 * err / (ok + err) if ok + err else 0.0
+    return (f"{name:<12}{ok:>7}{err:>6}{rate:>6.1f}%"
+            f"{ms(percentile(lat, 50)):>9}{ms(percentile(lat, 95)):>9}{ms(percentile(lat, 99)):>9}"
+            f"{nbytes / elapsed:>11.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Ecodan dashboard HTTP endpoints")
+    parser.add_argument("--url", default=ESP32_URL)
+    parser.add_argument("--clients", type=int, default=4, help="concurrent pollers (dashboard/state/set mix)")
+    parser.add_argument("--events", type=int, default=1, help="concurrent /events listeners")
+    parser.add_argument("--streams", type=int, default=0, help="concurrent /dashboard/stream listeners")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--think", type=float, default=0.0, help="pause between a poller's requests (s)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request socket timeout (s)")
+    parser.add_argument("--standin", action="store_true", help="run against a local dashboard_standin server")
+    args = parser.parse_args()
+
+    if args.standin:
+        import dashboard_standin
+        server = dashboard_standin.start_background(0)
+        host, port = "127.0.0.1", server.server_address[1]
+        print(f"Using stand-in on http://{host}:{port}")
+    else:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+
+    stats = Stats()
+    stop = threading.Event()
+    threads = []
+    for i in range(args.clients):
+        threads.append(threading.Thread(target=poller, args=(host, port, args.timeout, stats, stop, args.think, i)))
+    for _ in range(args.events):
+        threads.append(threading.Thread(target=listener, args=("sse:events", host, port, "/events",
+                                                               max(args.timeout, SSE_TIMEOUT), stats, stop)))
+    for _ in range(args.streams):
+        threads.append(threading.Thread(target=listener, args=("sse:stream", host, port, "/dashboard/stream",
+                                                               max(args.timeout, SSE_TIMEOUT), stats, stop)))
+
+    print(f"{args.clients} pollers, {args.events} /events and {args.streams} /dashboard/stream listeners "
+          f"for {args.duration:.0f}s against {host}:{port}")
+    start = time.perf_counter()
+    for t in threads:
+        t.daemon = True
+        t.start()
+    try:
+        stop.wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    stop.set()
+    for t in threads:
+        t.join(timeout=args.timeout + 1)
+    report(stats, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
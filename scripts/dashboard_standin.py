@@ -0,0 +1,404 @@
+# ABOUTME: Stand-in for the ESP32 dashboard endpoints (/dashboard, /state, /set, /stream, /history, /events).
+# ABOUTME: Run with: python scripts/dashboard_standin.py [--port 8080] [--no-stream] then open http://localhost:8080/dashboard
+
+import argparse
+import ast
+import json
+import math
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dashboard_history import encode_history
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_DIR = os.path.join(REPO_DIR, "components", "asgard_dashboard")
+PAGE_FILE = os.path.join(COMPONENT_DIR, "dashboard_source.html")
+INIT_FILE = os.path.join(COMPONENT_DIR, "__init__.py")
+
+KEEPALIVE_S = 15
+
+SELECT_DEFAULTS = {
+    "heating_system_type": 1,
+    "room_temp_source_z1": 0,
+    "room_temp_source_z2": 0,
+    "operating_mode_z1": 0,
+    "operating_mode_z2": 0,
+    "temp_sensor_source_z1": 0,
+    "temp_sensor_source_z2": 0,
+}
+
+NUMBER_DEFAULTS = {
+    "auto_adaptive_setpoint_bias": 0.0,
+    "maximum_heating_flow_temp": 40.0,
+    "minimum_heating_flow_temp": 25.0,
+    "maximum_heating_flow_temp_z2": 35.0,
+    "minimum_heating_flow_temp_z2": 25.0,
+    "thermostat_hysteresis_z1": 0.3,
+    "thermostat_hysteresis_z2": 0.3,
+    "pred_sc_time": 10.0,
+    "pred_sc_delta": 2.0,
+}
+
+# NUMBER_TRAITS state key -> (min, max, step)
+NUMBER_TRAITS = {
+    "aa_bias_lim": (-2.0, 2.0, 0.1),
+    "max_flow_lim": (25.0, 60.0, 0.5),
+    "min_flow_lim": (20.0, 45.0, 0.5),
+    "max_flow_z2_lim": (25.0, 60.0, 0.5),
+    "min_flow_z2_lim": (20.0, 45.0, 0.5),
+    "hysteresis_z1_lim": (0.1, 1.0, 0.1),
+    "hysteresis_z2_lim": (0.1, 1.0, 0.1),
+    "pred_sc_time_lim": (1.0, 30.0, 1.0),
+    "pred_sc_delta_lim": (0.5, 5.0, 0.5),
+}
+
+# /dashboard/set keys that write a climate target, mapped to the state key they change
+CLIMATE_SET_KEYS = {
+    "virtual_climate_z1_setpoint": "z1_setpoint",
+    "virtual_climate_z2_setpoint": "z2_setpoint",
+    "heatpump_climate_z1_setpoint": "eco_z1_setpoint",
+    "heatpump_climate_z2_setpoint": "eco_z2_setpoint",
+}
+
+# /dashboard/set number keys whose state key differs from the set key
+NUMBER_SET_KEYS = {
+    "predictive_short_cycle_high_delta_time_window": "pred_sc_time",
+    "predictive_short_cycle_high_delta_threshold": "pred_sc_delta",
+}
+
+SWITCH_SET_KEYS = {
+    "predictive_short_cycle_control_enabled": "pred_sc_en",
+}
+
+
+def load_state_fields():
+    """Read (json key, field type) pairs from STATE_FIELDS in the component's __init__.py."""
+    with open(INIT_FILE, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == "STATE_FIELDS" for t in node.targets):
+            return [(json_key, field_type) for _, json_key, field_type in ast.literal_eval(node.value)]
+    raise RuntimeError(f"STATE_FIELDS not found in {INIT_FILE}")
+
+
+class SimulatedHeatPump:
+    """Heat pump state that drifts over time, serialized the way the device serializes it."""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.values = {
+            "z1_current_temp": 20.8, "z1_setpoint": 21.0,
+            "z2_current_temp": 20.1, "z2_setpoint": 20.5,
+            "eco_z1_current": 20.8, "eco_z1_setpoint": 21.0,
+            "eco_z2_current": 20.1, "eco_z2_setpoint": 20.5,
+            "dhw_flow_temp_target": 50.0,
+            "auto_adaptive_control_enabled": True,
+            "defrost_risk_handling_enabled": True,
+            "smart_boost_enabled": False,
+            "force_dhw": False,
+            "pred_sc_en": True,
+            "zone2_enabled": True,
+            "latest_version": "dev",
+        }
+        self.values.update(NUMBER_DEFAULTS)
+        self.values.update(SELECT_DEFAULTS)
+        self.compressor_starts = 1200
+
+    @staticmethod
+    def curves(t):
+        """Deterministic part of the simulation at t seconds after start (t may be negative)."""
+        running = math.sin(t / 300.0) > -0.3
+        defrost = running and (t % 1800) < 120
+        freq = 0.0 if not running else 35.0 + 15.0 * math.sin(t / 90.0)
+        outside = 4.0 + 3.0 * math.sin(t / 3600.0)
+        feed = 27.0 + (8.0 if running else 0.0) + math.sin(t / 45.0)
+        ret = feed - (4.5 if running else 0.5)
+        power = max(0.0, (feed - ret) * 4.18 * 15.0 / 60.0)
+        return running, defrost, freq, outside, feed, ret, power
+
+    def step(self):
+        """Advance the simulation to the current time."""
+        t = time.time() - self.started
+        with self.lock:
+            v = self.values
+            running, defrost, freq, outside, feed, ret, power = self.curves(t)
+            if running and not v.get("status_compressor"):
+                self.compressor_starts += 1
+            if running:
+                freq += random.uniform(-1, 1)
+            v.update({
+                "hp_feed_temp": feed,
+                "hp_return_temp": ret,
+                "outside_temp": outside,
+                "compressor_frequency": round(freq),
+                "flow_rate": 15.0 if running else 0.0,
+                "computed_output_power": power,
+                "daily_computed_output_power": 12.0 + t / 600.0,
+                "daily_total_energy_consumption": 3.5 + t / 2400.0,
+                "compressor_starts": self.compressor_starts,
+                "runtime": 4200.0 + t / 3600.0,
+                "wifi_signal_db": -60.0 + random.randint(-3, 3),
+                "dhw_temp": 47.0 + math.sin(t / 900.0),
+                "dhw_flow_temp_drop": 5.0,
+                "dhw_consumed": 1.2, "dhw_delivered": 3.4, "dhw_cop": 2.83,
+                "heating_consumed": 2.3 + t / 2400.0, "heating_produced": 8.6 + t / 600.0,
+                "cooling_consumed": 0.0, "cooling_produced": 0.0, "cooling_cop": 0.0,
+                "z1_flow_temp_target": 32.0, "z2_flow_temp_target": 30.0,
+                "status_compressor": running,
+                "status_booster": False,
+                "status_defrost": defrost,
+                "status_water_pump": running,
+                "status_in1_request": running,
+                "status_in6_request": False,
+                "status_operation": ("Defrosting" if defrost else "Heating") if running else "Off",
+            })
+            v["heating_cop"] = v["heating_produced"] / v["heating_consumed"]
+            v["z1_current_temp"] += random.uniform(-0.02, 0.02)
+            v["z2_current_temp"] += random.uniform(-0.02, 0.02)
+
+    def history_body(self, count, interval_s):
+        """/dashboard/history body: the model averaged over each of the last count intervals."""
+        now = time.time() - self.started
+        series = {i: [] for i in range(6)}
+        for k in range(count, 0, -1):
+            start = now - k * interval_s
+            points = [self.curves(start + j * interval_s / 12.0) for j in range(12)]
+            _, _, freq, outside, feed, ret, power = (sum(col) / len(points) for col in zip(*points))
+            for series_id, value in enumerate((feed, ret, outside, freq, power, 3.2 + outside * 0.1)):
+                series[series_id].append(value)
+        return encode_history(series, interval_s, age_ms=0)
+
+    def apply_set(self, key, value):
+        """Apply a /dashboard/set body the way EcodanDashboard::dispatch_set_ would."""
+        with self.lock:
+            if key in CLIMATE_SET_KEYS:
+                self.values[CLIMATE_SET_KEYS[key]] = float(value)
+            elif key == "dhw_setpoint":
+                self.values["dhw_flow_temp_target"] = float(value)
+            elif key in SELECT_DEFAULTS:
+                self.values[key] = int(value)
+            elif key in NUMBER_DEFAULTS or key in NUMBER_SET_KEYS:
+                self.values[NUMBER_SET_KEYS.get(key, key)] = float(value)
+            elif key in SWITCH_SET_KEYS or isinstance(self.values.get(key), bool):
+                self.values[SWITCH_SET_KEYS.get(key, key)] = float(value) > 0.5
+            else:
+                return False
+        return True
+
+    def serialize_values(self):
+        """Return [(json key, value text)] in table order, formatted like append_value_."""
+        out = []
+        with self.lock:
+            for key, field_type in self.fields:
+                out.append((key, self._format(key, field_type)))
+        return out
+
+    def state_json(self):
+        return "{" + ",".join(f'"{k}":{v}' for k, v in self.serialize_values()) + "}"
+
+    def _format(self, key, field_type):
+        if field_type == "NUMBER_TRAITS":
+            return '{"min":%.1f,"max":%.1f,"step":%.1f}' % NUMBER_TRAITS.get(key, (0.0, 0.0, 0.0))
+        value = self.values.get(key)
+        if field_type == "TEXT":
+            return json.dumps(value or "")[:2 + 2 * 64]
+        if field_type == "SELECT_INDEX":
+            return '"null"' if value is None else f'"{int(value)}"'
+        if field_type in ("BINARY", "BINARY_STATE", "SWITCH"):
+            if value is None:
+                return "false" if field_type != "BINARY" else "null"
+            return "true" if value else "false"
+        if value is None or (isinstance(value, float) and not (math.isfinite(value) and abs(value) < 1e15)):
+            return "null"
+        return ("%.2f" if field_type == "SENSOR" else "%.1f") % value
+
+
+class StreamSlots:
+    """Counts open /dashboard/stream connections against the device's client cap."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            if self.count >= self.limit:
+                return False
+            self.count += 1
+            return True
+
+    def release(self):
+        with self.lock:
+            self.count -= 1
+
+
+def make_handler(hp, args, slots):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+        def log_message(self, fmt, *a):
+            if args.verbose:
+                super().log_message(fmt, *a)
+
+        def _send(self, code, ctype, body):
+            data = body.encode("utf-8") if isinstance(body, str) else body
+            self.send_response(code)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path in ("/dashboard", "/dashboard/"):
+                with open(PAGE_FILE, "rb") as f:
+                    self._send(200, "text/html", f.read())
+            elif path == "/dashboard/state":
+                hp.step()
+                self._send(200, "application/json", hp.state_json())
+            elif path == "/dashboard/history":
+                self._send(200, "application/octet-stream", hp.history_body(args.history_size, args.history_interval))
+            elif path == "/dashboard/stream" and not args.no_stream:
+                self._stream()
+            elif path == "/events":
+                self._events()
+            else:
+                self._send(404, "text/plain", "Not found")
+
+        def do_POST(self):
+            if self.path.split("?", 1)[0] != "/dashboard/set":
+                self._send(404, "text/plain", "Not found")
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length == 0 or length > 512:
+                self._send(400, "text/plain", "Bad Request")
+                return
+            try:
+                body = json.loads(self.rfile.read(length))
+                key = body["key"]
+            except (ValueError, KeyError):
+                self._send(400, "text/plain", "Missing key")
+                return
+            if not hp.apply_set(key, body.get("value", 0)) and args.verbose:
+                print(f"Unknown key: {key}")
+            self._send(200, "application/json", '{"ok":true}')
+
+        def _start_event_stream(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Connection", "close")
+            self.end_headers()
+
+        def _stream(self):
+            """Snapshot on connect, then changed fields each interval within the byte budget."""
+            if not slots.acquire():
+                self._send(503, "text/plain", "Too many stream clients")
+                return
+            try:
+                self._start_event_stream()
+                self.wfile.write(b"retry: 5000\n\n")
+                sent = {}
+                snapshot = True
+                last_write = time.time()
+                while True:
+                    hp.step()
+                    parts = []
+                    size = len("event: state\ndata: {}\n\n")
+                    for key, text in hp.serialize_values():
+                        if not snapshot and sent.get(key) == text:
+                            continue
+                        need = len(key) + 4 + len(text)
+                        if parts and not snapshot and size + need > args.budget:
+                            continue
+                        parts.append(f'"{key}":{text}')
+                        sent[key] = text
+                        size += need
+                    snapshot = False
+                    if parts:
+                        self.wfile.write(("event: state\ndata: {" + ",".join(parts) + "}\n\n").encode())
+                        last_write = time.time()
+                    elif time.time() - last_write >= KEEPALIVE_S:
+                        self.wfile.write(b":\n\n")
+                        last_write = time.time()
+                    self.wfile.flush()
+                    time.sleep(args.interval)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                slots.release()
+
+        def _events(self):
+            """Minimal stand-in for the ESPHome web_server log stream."""
+            try:
+                self._start_event_stream()
+                while True:
+                    hp.step()
+                    msg = {
+                        "level": "INFO", "tag": "ecodan.component",
+                        "message": f"{datetime.now():%H:%M:%S} op={hp.values.get('status_operation')} "
+                                   f"feed={hp.values.get('hp_feed_temp', 0):.1f}",
+                    }
+                    self.wfile.write(f"event: log\ndata: {json.dumps(msg)}\n\n".encode())
+                    self.wfile.flush()
+                    time.sleep(5)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return Handler
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Stand-in server for the Ecodan dashboard")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--interval", type=float, default=1.0, help="stream tick in seconds (stream_interval)")
+    parser.add_argument("--budget", type=int, default=1024, help="per-client bytes per event (stream_budget)")
+    parser.add_argument("--max-clients", type=int, default=3, help="stream client cap (STREAM_MAX_CLIENTS)")
+    parser.add_argument("--history-size", type=int, default=1440, help="samples in /dashboard/history (history_size)")
+    parser.add_argument("--history-interval", type=int, default=60, help="seconds per history sample (history_interval)")
+    parser.add_argument("--no-stream", action="store_true", help="404 on /dashboard/stream to exercise polling")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    return parser
+
+
+def make_server(args):
+    hp = SimulatedHeatPump(load_state_fields())
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(hp, args, StreamSlots(args.max_clients)))
+    server.daemon_threads = True
+    return server
+
+
+def start_background(port=0, *extra_args):
+    """Start a stand-in on a background thread (port 0 picks a free one); returns the server."""
+    args = build_parser().parse_args(["--port", str(port), *extra_args])
+    server = make_server(args)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    args = build_parser().parse_args()
+    server = make_server(args)
+    print(f"Dashboard stand-in on http://{args.host}:{server.server_address[1]}/dashboard"
+          f" (stream {'off' if args.no_stream else 'on'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
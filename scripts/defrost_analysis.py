@@ -0,0 +1,265 @@
+# ABOUTME: Defrost penalty analytics: feed dip, recovery, heat pulled back and extra energy per defrost, summed per outside temperature bin.
+# ABOUTME: Run with: python scripts/defrost_analysis.py /opt/ecodan/data/ecodan_log.csv [--bin 1] [--out defrosts.csv]
+
+import argparse
+import csv
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+import optimizer_replay as replay
+from house_model import house_heat
+from tariff_cop import counter_steps
+
+PRE_MINUTES = 10            # the feed temperature a defrost starts from is the mean over this long before it
+RECOVERY_MINUTES = 30       # a defrost not recovered this long after its end counts as recovered then
+RECOVERY_TOLERANCE = 0.5    # C below the pre-defrost feed that counts as recovered
+MAX_ROW_GAP_S = 300         # longer logging gaps count for this long
+
+
+class Defrosts(NamedTuple):
+    """One entry per defrost in heating (defrosts during DHW are left out); row indexes into the history."""
+    start: np.ndarray         # first defrost row
+    end: np.ndarray           # first row after it
+    recovered: np.ndarray     # first row with the feed back, or the end of RECOVERY_MINUTES
+    outside: np.ndarray
+    minutes: np.ndarray
+    pre_feed: np.ndarray
+    dip: np.ndarray           # pre_feed - the lowest feed until recovered
+    recovery_minutes: np.ndarray  # from the end of the defrost; NaN when the feed did not come back in time
+    run_minutes: np.ndarray   # compressor minutes since the previous defrost ended, NaN for the first
+    pulled_kwh: np.ndarray    # heat taken back out of the emitters while defrosting
+    consumed_kwh: np.ndarray  # electricity from the start to recovered
+    heat_kwh: np.ndarray      # net heat into the house over the same rows
+
+    def __len__(self):
+        return len(self.start)
+
+
+def runs(flags):
+    """(start, end) rows of each run of True in flags, end exclusive."""
+    edges = np.diff(np.concatenate([[0], flags.astype(np.int8), [0]]))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def row_minutes(history):
+    """Minutes each row stands for, up to the next row."""
+    return np.minimum(np.diff(history.t, append=history.t[-1]), MAX_ROW_GAP_S) / 60.0
+
+
+def find_defrosts(history):
+    """Every defrost with its dip, recovery and energy, from cumulative sums and one window view, no loop over events."""
+    step_s = float(np.median(np.diff(history.t))) if len(history) > 1 else 60.0
+    pre_rows = max(int(round(PRE_MINUTES * 60 / step_s)), 1)
+    recovery_rows = max(int(round(RECOVERY_MINUTES * 60 / step_s)), 1)
+    minutes = row_minutes(history)
+
+    start, end = runs(history.defrost)
+    n = len(history)
+    # a defrost with the valve on DHW around it is a tank reheat, and one at the log's start has no feed before it
+    keep = start >= pre_rows
+    if len(start):
+        dhw_before = np.cumsum(np.concatenate([[0], history.dhw]))
+        dhw_near = dhw_before[np.minimum(end + recovery_rows, n)] - dhw_before[start - np.minimum(start, pre_rows)]
+        keep &= dhw_near == 0
+    start, end = start[keep], end[keep]
+
+    def window_sum(values, a, b):
+        total = np.concatenate([[0.0], np.cumsum(values)])
+        return total[b] - total[a]
+
+    feed = history.feed
+    finite = np.isfinite(feed)
+    pre_count = window_sum(finite, start - pre_rows, start)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pre_feed = window_sum(np.where(finite, feed, 0.0), start - pre_rows, start) / pre_count
+
+    # feed from each start over the defrost and up to RECOVERY_MINUTES after its end, NaN padded
+    longest = int((end - start).max()) if len(start) else 0
+    span = longest + recovery_rows
+    padded = np.concatenate([feed, np.full(span, np.nan)])
+    view = np.lib.stride_tricks.sliding_window_view(padded, span)[start]
+    offset = np.arange(span)
+    after_end = offset[None, :] >= (end - start)[:, None]
+    back = after_end & (view >= (pre_feed - RECOVERY_TOLERANCE)[:, None])
+    found = back.any(axis=1)
+    first_back = np.where(found, back.argmax(axis=1), (end - start) + recovery_rows)
+    recovered = np.minimum(start + first_back, n)
+    until = offset[None, :] < first_back[:, None]
+    with np.errstate(invalid="ignore"):
+        lowest = np.nanmin(np.where(until & np.isfinite(view), view, np.inf), axis=1)
+    dip = np.where(np.isfinite(lowest), pre_feed - lowest, np.nan)
+    recovery = np.where(found, window_sum(minutes, end, recovered), np.nan)
+
+    running = history.compressor & ~history.defrost & ~history.dhw
+    run_total = np.concatenate([[0.0], np.cumsum(minutes * running)])
+    run_minutes = np.full(len(start), np.nan)
+    run_minutes[1:] = run_total[start[1:]] - run_total[end[:-1]]
+
+    heat = np.nan_to_num(house_heat(history)) * minutes / 60.0
+    consumed = counter_steps(history.timestamps, history.heating_consumed)
+    return Defrosts(start, end, recovered, replay.forward_fill(history.outside)[start],
+                    window_sum(minutes, start, end), pre_feed, dip, recovery, run_minutes,
+                    -window_sum(np.minimum(heat, 0.0), start, end),
+                    window_sum(consumed, start, recovered), window_sum(heat, start, recovered))
+
+
+class Baseline(NamedTuple):
+    """Per outside temperature bin: heating away from any defrost, kW electricity and heat."""
+    hours: np.ndarray
+    consumed_kw: np.ndarray
+    heat_kw: np.ndarray
+
+
+class Summary(NamedTuple):
+    """Per outside temperature bin over the bins with heating; penalties against the matched baseline."""
+    outside: np.ndarray        # bin centres
+    heating_hours: np.ndarray  # compressor hours in heating
+    count: np.ndarray
+    per_hour: np.ndarray       # defrosts per heating hour
+    run_minutes: np.ndarray    # median compressor minutes between defrosts
+    minutes: np.ndarray        # mean defrost length
+    dip: np.ndarray
+    recovery: np.ndarray       # mean over the defrosts that recovered
+    unrecovered: np.ndarray
+    pulled_kwh: np.ndarray     # per defrost
+    extra_kwh: np.ndarray      # per defrost, electricity beyond the baseline over the same heating time
+    lost_kwh: np.ndarray       # per defrost, heat short of the baseline
+    cop: np.ndarray            # of all heating in the bin
+    clean_cop: np.ndarray      # of the baseline
+    penalty_share: np.ndarray  # extra electricity over all heating electricity in the bin
+
+
+def summarise(history, defrosts, width=1.0):
+    """Per bin sums with bincount over rows and events; the baseline is heating outside every defrost window."""
+    minutes = row_minutes(history)
+    heating = history.compressor & ~history.dhw
+    outside = replay.forward_fill(history.outside)
+    valid = heating & np.isfinite(outside)
+    row_bin = np.floor(np.where(valid, outside, 0.0) / width).astype(np.int64)
+
+    in_window = np.zeros(len(history) + 1, dtype=np.int64)
+    np.add.at(in_window, defrosts.start, 1)
+    np.add.at(in_window, defrosts.recovered, -1)
+    clean = valid & (np.cumsum(in_window)[:-1] == 0)
+
+    event_bin = np.floor(defrosts.outside / width).astype(np.int64)
+    low = min(row_bin[valid].min() if valid.any() else 0, event_bin.min() if len(defrosts) else 0)
+    high = max(row_bin[valid].max() if valid.any() else 0, event_bin.max() if len(defrosts) else 0)
+    size = int(high - low) + 1
+    rows, events = row_bin - low, event_bin - low
+
+    def per_row(values, where):
+        return np.bincount(rows[where], values[where], minlength=size)
+
+    def per_event(values):
+        ok = np.isfinite(values)
+        return np.bincount(events[ok], values[ok], minlength=size), np.bincount(events[ok], minlength=size)
+
+    heat = np.nan_to_num(house_heat(history)) * minutes / 60.0
+    consumed = counter_steps(history.timestamps, history.heating_consumed)
+    heating_hours = per_row(minutes, valid) / 60.0
+    clean_hours = per_row(minutes, clean) / 60.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        baseline = Baseline(clean_hours, per_row(consumed, clean) / clean_hours, per_row(heat, clean) / clean_hours)
+
+        # heating time in each event window, against which the baseline rates are charged
+        window_hours = np.concatenate([[0.0], np.cumsum(minutes * heating)])
+        window_hours = (window_hours[defrosts.recovered] - window_hours[defrosts.start]) / 60.0
+        extra = defrosts.consumed_kwh - baseline.consumed_kw[events] * window_hours
+        lost = baseline.heat_kw[events] * window_hours - defrosts.heat_kwh
+
+        count = np.bincount(events, minlength=size)
+        medians = np.full(size, np.nan)
+        for b in np.unique(events):
+            run = defrosts.run_minutes[events == b]
+            if np.isfinite(run).any():
+                medians[b] = np.nanmedian(run)
+
+        def mean(values):
+            total, n = per_event(values)
+            return total / n
+
+        total_consumed = per_row(consumed, valid)
+        total_heat = per_row(heat, valid)
+        extra_total, _ = per_event(extra)
+        summary = Summary((np.arange(size) + low + 0.5) * width, heating_hours, count, count / heating_hours,
+                          medians, mean(defrosts.minutes), mean(defrosts.dip), mean(defrosts.recovery_minutes),
+                          count - per_event(defrosts.recovery_minutes)[1], mean(defrosts.pulled_kwh), mean(extra),
+                          mean(lost), total_heat / total_consumed, baseline.heat_kw / baseline.consumed_kw,
+                          extra_total / total_consumed)
+    used = (heating_hours > 0) | (count > 0)
+    return Summary(*(values[used] for values in summary)), extra, lost
+
+
+def _fmt(value, digits=1):
+    return "-" if not math.isfinite(value) else f"{value:.{digits}f}"
+
+
+def report(history, defrosts, summary, extra, elapsed):
+    days = (history.t[-1] - history.t[0]) / 86400.0 if len(history) > 1 else 0.0
+    print(f"{len(history)} rows over {days:.0f} days: {len(defrosts)} defrosts in heating, {elapsed * 1000:.0f} ms\n")
+    if not len(defrosts):
+        return
+    print(f"{'outside':>8}{'hours':>8}{'defr':>6}{'per h':>7}{'run min':>8}{'min':>6}{'dip':>6}{'recov':>7}"
+          f"{'pulled':>8}{'extra':>7}{'lost':>7}{'COP':>6}{'clean':>7}{'penalty':>9}")
+    band = (replay.DEFROST_RISK_MIN_TEMP, replay.DEFROST_RISK_MAX_TEMP)
+    for row in zip(*summary):
+        s = Summary(*row)
+        risk = "*" if band[0] <= s.outside <= band[1] else " "
+        print(f"{s.outside:>7.1f}{risk}{s.heating_hours:>8.1f}{s.count:>6d}{_fmt(s.per_hour, 2):>7}"
+              f"{_fmt(s.run_minutes, 0):>8}{_fmt(s.minutes):>6}{_fmt(s.dip):>6}{_fmt(s.recovery):>7}"
+              f"{_fmt(s.pulled_kwh, 2):>8}{_fmt(s.extra_kwh, 2):>7}{_fmt(s.lost_kwh, 2):>7}{_fmt(s.cop, 2):>6}"
+              f"{_fmt(s.clean_cop, 2):>7}{_fmt(s.penalty_share * 100):>8}%")
+
+    total_extra = np.nansum(extra)
+    inside = (defrosts.outside >= band[0]) & (defrosts.outside <= band[1])
+    share = np.nansum(extra[inside]) / total_extra if total_extra > 0 else math.nan
+    print(f"\n* optimizer defrost risk band ({band[0]:g} to {band[1]:g} C): {inside.sum()} of {len(defrosts)} defrosts, "
+          f"{_fmt(share * 100, 0)}% of the extra electricity")
+    print(f"all defrosts: {np.nansum(defrosts.pulled_kwh):.1f} kWh pulled back from the emitters, "
+          f"{total_extra:.1f} kWh extra electricity, median dip {_fmt(np.nanmedian(defrosts.dip))} C, "
+          f"median recovery {_fmt(np.nanmedian(defrosts.recovery_minutes))} min")
+    print("run min: median compressor minutes between defrosts, the humidity proxy (frost builds faster in moist air)")
+
+
+def write_events(path, history, defrosts, extra, lost):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["start", "end", "outside_temp", "minutes", "pre_feed", "dip", "recovery_minutes",
+                         "run_minutes", "pulled_kwh", "consumed_kwh", "extra_kwh", "lost_heat_kwh"])
+        stamps = history.timestamps.astype("datetime64[s]").astype(str)
+        for i in range(len(defrosts)):
+            writer.writerow([stamps[defrosts.start[i]].replace("T", " "),
+                             stamps[min(defrosts.end[i], len(history) - 1)].replace("T", " "),
+                             _fmt(defrosts.outside[i]), _fmt(defrosts.minutes[i]), _fmt(defrosts.pre_feed[i]),
+                             _fmt(defrosts.dip[i]), _fmt(defrosts.recovery_minutes[i]),
+                             _fmt(defrosts.run_minutes[i], 0), _fmt(defrosts.pulled_kwh[i], 3),
+                             _fmt(defrosts.consumed_kwh[i], 3), _fmt(extra[i], 3), _fmt(lost[i], 3)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Defrost energy and COP penalty per outside temperature bin")
+    parser.add_argument("log", nargs="?", default=replay.LOG_FILE, help="mqtt_logger CSV (ecodan_log.csv)")
+    parser.add_argument("--bin", type=float, default=1.0, help="outside temperature bin width (C)")
+    parser.add_argument("--out", help="write every defrost as CSV")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    history = replay.load_history(args.log)
+    if not len(history):
+        raise SystemExit("The log has no rows.")
+    defrosts = find_defrosts(history)
+    summary, extra, lost = summarise(history, defrosts, args.bin)
+    elapsed = time.perf_counter() - start
+    report(history, defrosts, summary, extra, elapsed)
+
+    if args.out:
+        write_events(args.out, history, defrosts, extra, lost)
+        print(f"{args.out}: {len(defrosts)} defrosts")
+
+
+if __name__ == "__main__":
+    main()
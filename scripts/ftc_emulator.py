@@ -0,0 +1,539 @@
+# ABOUTME: Emulates an Ecodan FTC (and optionally a slave controller) speaking CN105 on a pty or serial port.
+# ABOUTME: Run with: python scripts/ftc_emulator.py [--link /tmp/ftc] [--latency 60] [--drop 0.01] [--corrupt 0.005] [--slave-link /tmp/slave]
+
+import argparse
+import heapq
+import math
+import os
+import pty
+import random
+import select
+import termios
+import time
+import tty
+
+import cn105
+from cn105 import GetType, MsgType, RequestCode, SetType
+
+# 8E1: start + 8 data + parity + stop
+BITS_PER_BYTE = 11
+
+# Frames from serial.cpp: what a slave controller sends on the proxy port while connecting
+SLAVE_HANDSHAKE = [
+    bytes.fromhex("02 ff ff 00 00 00 00 02"),
+    bytes.fromhex("02 ff ff 01 00 00 01 00 00"),
+    bytes.fromhex("fc 5a 02 7a 02 ca 01 5d"),
+]
+CONNECT_RESPONSE = bytes.fromhex("fc 7a 02 7a 01 00 09")
+
+
+class Plant:
+    """A heat pump that is good enough to look alive on a dashboard.
+
+    Heats zone 1 with a compressor that runs 40 min on / 10 min off, defrosts for 4 min every
+    45 min, reheats the DHW tank below 45 °C and keeps energy counters. SET commands change the
+    setpoints, modes and controller flags the way the FTC would.
+    """
+
+    def __init__(self, start):
+        self.start = start
+        self.last = start
+        self.power = 1
+        self.dhw_mode = 0
+        self.hc_mode = 1  # HEAT_FLOW_TEMP
+        self.hc_mode_z2 = 1
+        self.zone1_room_set = 21.0
+        self.zone2_room_set = 20.0
+        self.zone1_flow_set = 35.0
+        self.zone2_flow_set = 30.0
+        self.dhw_set = 50.0
+        self.flags = {name: False for name in (
+            "DhwForcedActive", "HolidayMode", "ProhibitDhw", "ProhibitHeatingZ1", "ProhibitCoolingZ1",
+            "ProhibitHeatingZ2", "ProhibitCoolingZ2", "ServerControl")}
+        self.mrc = 0
+        self.feed = 30.0
+        self.ret = 28.0
+        self.dhw = 47.0
+        self.dhw_heating = False
+        self.room = 20.5
+        self.runtime_hours = 12345.0
+        self.compressor_starts = 4200
+        self.compressor_was_on = False
+        self.consumed = [1234.5, 10.0, 456.7]   # heating, cooling, dhw kWh
+        self.delivered = [4321.0, 8.0, 1234.0]
+        self.power_kw = 0.0
+
+    def elapsed(self, now):
+        return now - self.start
+
+    def outside(self, now):
+        return 4.0 + 5.0 * math.sin(2 * math.pi * (self.elapsed(now) / 86400.0 - 0.25))
+
+    def compressor_on(self, now):
+        if not self.power:
+            return False
+        if self.dhw_heating:
+            return True
+        return self.elapsed(now) % 3000 < 2400 and not self.flags["ProhibitHeatingZ1"]
+
+    def defrosting(self, now):
+        return self.compressor_on(now) and self.elapsed(now) % 2700 >= 2460
+
+    def frequency(self, now):
+        if not self.compressor_on(now):
+            return 0
+        return 70 if self.dhw_heating else int(35 + 2 * max(0.0, 10.0 - self.outside(now)))
+
+    def operation(self, now):
+        if not self.power:
+            return 0
+        if self.dhw_heating:
+            return 1
+        return 2 if self.compressor_on(now) else 0
+
+    def step(self, now):
+        dt = now - self.last
+        self.last = now
+        if dt <= 0:
+            return
+        on = self.compressor_on(now)
+        if on and not self.compressor_was_on:
+            self.compressor_starts += 1
+        self.compressor_was_on = on
+
+        if self.dhw < 45.0 and not self.flags["ProhibitDhw"] and self.power:
+            self.dhw_heating = True
+        if self.dhw >= self.dhw_set or self.flags["ProhibitDhw"]:
+            self.dhw_heating = False
+
+        target = (55.0 if self.dhw_heating else self.zone1_flow_set) if on and not self.defrosting(now) else self.ret
+        self.feed += (target - self.feed) * min(1.0, dt / 300.0)
+        self.ret += (self.feed - 4.0 * on - self.ret) * min(1.0, dt / 600.0)
+        self.room += ((self.ret - 8.0) - self.room) * min(1.0, dt / 20000.0)
+        self.dhw += (0.5 if self.dhw_heating else -0.05) * dt / 60.0
+
+        self.power_kw = 0.02 * self.frequency(now) if on else 0.0
+        cop = max(1.5, 4.5 - 0.06 * (self.feed - self.outside(now)))
+        slot = 2 if self.dhw_heating else 0
+        self.consumed[slot] += self.power_kw * dt / 3600.0
+        self.delivered[slot] += self.power_kw * cop * dt / 3600.0
+        if on:
+            self.runtime_hours += dt / 3600.0
+
+    def values(self, get_type, now):
+        """Field values for encode_payload, keyed by cn105.FIELDS names."""
+        on = self.compressor_on(now)
+        lt = time.localtime()
+        if get_type == GetType.DATETIME_FIRMWARE:
+            return {"Year": lt.tm_year, "Month": lt.tm_mon, "Day": lt.tm_mday, "Hour": lt.tm_hour,
+                    "Minute": lt.tm_min, "Second": lt.tm_sec, "FirmwareMajor": 0x21, "FirmwareMinor": 0x03}
+        if get_type == GetType.DEFROST_STATE:
+            return {"DefrostActive": self.defrosting(now)}
+        if get_type == GetType.COMPRESSOR_FREQUENCY:
+            return {"CompressorFrequency": self.frequency(now)}
+        if get_type == GetType.DHW_STATE:
+            return {"HeatSource": 0}
+        if get_type == GetType.HEATING_POWER:
+            return {"OutputPower": round(self.power_kw), "EnergyConsumedIncreasing": round(sum(self.consumed), 1)}
+        if get_type == GetType.TEMPERATURE_CONFIG:
+            return {"Zone1SetTemperature": self.zone1_room_set, "Zone2SetTemperature": self.zone2_room_set,
+                    "Zone1FlowTemperatureSetPoint": self.zone1_flow_set,
+                    "Zone2FlowTemperatureSetPoint": self.zone2_flow_set, "LegionellaPreventionSetPoint": 60.0,
+                    "DhwTemperatureDrop": 5.0, "MaximumFlowTemperature": 55.0, "MinimumFlowTemperature": 25.0}
+        if get_type == GetType.SH_TEMPERATURE_STATE:
+            return {"Zone1RoomTemperature": round(self.room, 1), "Zone2RoomTemperature": None,
+                    "OutsideTemperature": round(self.outside(now) * 2) / 2,
+                    "HpRefrigerantLiquidTemperature": self.ret + 2.0 if on else self.ret}
+        if get_type == GetType.TEMPERATURE_STATE_A:
+            return {"HpFeedTemperature": self.feed, "HpReturnTemperature": self.ret, "DhwTemperature": self.dhw,
+                    "DhwSecondaryTemperature": self.dhw - 2.0}
+        if get_type == GetType.TEMPERATURE_STATE_B:
+            return {"Z1FeedTemperature": self.feed - 0.5, "Z1ReturnTemperature": self.ret + 0.3}
+        if get_type == GetType.TEMPERATURE_STATE_D:
+            return {"HpRefrigerantCondensingTemperature": self.feed + 3.0 if on else self.feed}
+        if get_type == GetType.ACTIVE_TIME:
+            return {"CompressorOn": on, "Runtime": round(self.runtime_hours)}
+        if get_type == GetType.FLOW_RATE:
+            return {"FlowRate": 18 if on else 0}
+        if get_type == GetType.PUMP_STATUS_A:
+            return {"WaterPumpActive": on, "PumpPWM": 41 if on else 0, "PumpFeedback": 2 if on else 0,
+                    "ThreeWayValveActive": self.dhw_heating}
+        if get_type == GetType.MODE_FLAGS_A:
+            return {"Power": self.power, "Operation": self.operation(now), "HotWaterMode": self.dhw_mode,
+                    "HeatingCoolingMode": self.hc_mode, "HeatingCoolingModeZone2": self.hc_mode_z2,
+                    "DhwFlowTemperatureSetPoint": self.dhw_set, "MRCFlag": self.mrc}
+        if get_type == GetType.MODE_FLAGS_B:
+            return dict(self.flags)
+        if get_type == GetType.ENERGY_USAGE:
+            return dict(zip(("EnergyConsumedHeating", "EnergyConsumedCooling", "EnergyConsumedDhw"), self.consumed))
+        if get_type == GetType.ENERGY_DELIVERY:
+            return dict(zip(("EnergyDeliveredHeating", "EnergyDeliveredCooling", "EnergyDeliveredDhw"), self.delivered))
+        if get_type == GetType.HARDWARE_CONFIGURATION:
+            return {"Controller": 3}
+        if get_type == GetType.DIP_SWITCHES:
+            return {"DipSwitch1": 0x10, "DipSwitch2": 0x00, "DipSwitch3": 0x00, "DipSwitch4": 0x00}
+        return {}
+
+    def request_code(self, code, now):
+        on = self.compressor_on(now)
+        return {
+            RequestCode.COMPRESSOR_STARTS: self.compressor_starts,
+            RequestCode.TH4_DISCHARGE_TEMP: round(self.feed + 30) if on else round(self.ret),
+            RequestCode.TH3_LIQUID_PIPE1_TEMP: round(self.outside(now) - 3) if on else round(self.outside(now)),
+            RequestCode.TH6_2_PHASE_PIPE_TEMP: round(self.outside(now) - 5) if on else round(self.outside(now)),
+            RequestCode.TH32_SUCTION_PIPE_TEMP: round(self.outside(now) - 2) if on else round(self.outside(now)),
+            RequestCode.TH8_HEAT_SINK_TEMP: 35 if on else round(self.outside(now)),
+            RequestCode.TH33_SURFACE_TEMP: round(self.feed + 20) if on else round(self.ret),
+            RequestCode.DISCHARGE_SUPERHEAT: 25 if on else 0,
+            RequestCode.SUB_COOL: 4 if on else 0,
+            RequestCode.FAN_SPEED: 550 if on else 0,
+        }.get(code, 0)
+
+    def apply_set(self, p):
+        """Apply a SET_CMD payload (layouts as built in commands.cpp)."""
+        if p[0] == SetType.BASIC_SETTINGS:
+            flags = p[1]
+            if flags & 0x01:
+                self.power = p[3]
+            if flags & 0x04:
+                self.dhw_mode = p[5]
+            if flags & 0x08:
+                self.hc_mode = p[6]
+            if flags & 0x10:
+                self.hc_mode_z2 = p[7]
+            if flags & 0x20:
+                self.dhw_set = cn105.float16(p, 8)
+            if flags & 0x80:
+                self.zone1_flow_set = cn105.float16(p, 10)
+            if p[2] & 0x02:
+                self.zone2_flow_set = cn105.float16(p, 12)
+            if p[2] & 0x08:
+                self.mrc = p[14]
+        elif p[0] == SetType.ROOM_SETTINGS:
+            if p[1] & 0x02:
+                self.zone1_room_set = cn105.float16(p, 4)
+            if p[1] & 0x08:
+                self.zone2_room_set = cn105.float16(p, 6)
+        elif p[0] == SetType.CONTROLLER_SETTING:
+            for bit, (name, index) in enumerate(zip(self.flags, range(3, 11))):
+                if p[1] & (1 << bit):
+                    self.flags[name] = bool(p[index])
+
+
+class Port:
+    """One end of a serial link, a pty (optionally symlinked) or a tty device, with line pacing.
+
+    Writes are delivered when the last byte would have left a real UART at the given baud rate,
+    one frame after the other. With paced_rx the same is done for incoming frames: a peer on a
+    pty writes a frame at once, the frame counts as received when it would have finished
+    arriving over the wire.
+    """
+
+    def __init__(self, baud, link=None, device=None):
+        self.byte_time = BITS_PER_BYTE / baud
+        self.tx_free = 0.0
+        self.rx_free = 0.0
+        if device:
+            self.fd = os.open(device, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+            self.name = device
+            self.paced_rx = False
+            self._configure(self.fd, baud)
+        else:
+            self.fd, slave = pty.openpty()
+            self._configure(slave, baud)
+            self.name = os.ttyname(slave)
+            self.slave_fd = slave  # keep it open so the master never sees EIO between clients
+            self.paced_rx = True
+            if link:
+                if os.path.islink(link):
+                    os.unlink(link)
+                os.symlink(self.name, link)
+                self.name = f"{link} -> {self.name}"
+        os.set_blocking(self.fd, False)
+
+    @staticmethod
+    def _configure(fd, baud):
+        tty.setraw(fd)
+        attrs = termios.tcgetattr(fd)
+        speed = getattr(termios, f"B{baud}", termios.B2400)
+        attrs[2] |= termios.PARENB
+        attrs[2] &= ~termios.PARODD
+        attrs[4] = attrs[5] = speed
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
+    def transfer_time(self, nbytes):
+        return nbytes * self.byte_time
+
+    def received_at(self, now, frame):
+        """When a frame read at now finished arriving."""
+        if not self.paced_rx:
+            return now
+        self.rx_free = max(now, self.rx_free) + self.transfer_time(len(frame))
+        return self.rx_free
+
+    def schedule_tx(self, ready, frame):
+        """Time at which a frame queued at ready has been fully sent."""
+        self.tx_free = max(ready, self.tx_free) + self.transfer_time(len(frame))
+        return self.tx_free
+
+    def write(self, data):
+        try:
+            os.write(self.fd, data)
+        except (BlockingIOError, OSError):
+            pass
+
+    def read(self):
+        try:
+            return os.read(self.fd, 4096)
+        except (BlockingIOError, OSError):
+            return b""
+
+
+class Stats:
+    def __init__(self):
+        self.counts = {}
+        self.poll_times = {}
+        self.latencies = {}
+
+    def count(self, name, n=1):
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def poll(self, name, now):
+        self.poll_times.setdefault(name, []).append(now)
+
+    def latency(self, name, seconds):
+        self.latencies.setdefault(name, []).append(seconds)
+
+
+class Emulator:
+    def __init__(self, args, now):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.plant = Plant(now)
+        self.stats = Stats()
+        self.timers = []
+        self.seq = 0
+        self.ftc = Port(args.baud, link=args.link, device=args.device)
+        self.ftc_reader = cn105.FrameReader(accept_b=True)
+        self.request_code_since = {}
+        self.last_set = None
+        self.slave = None
+        if args.slave_link or args.slave_device:
+            self.slave = SlaveController(self, Port(args.slave_baud, link=args.slave_link, device=args.slave_device))
+
+    def at(self, when, callback, *args):
+        self.seq += 1
+        heapq.heappush(self.timers, (when, self.seq, callback, args))
+
+    def reply_delay(self):
+        return max(0.0, self.rng.gauss(self.args.latency, self.args.jitter) / 1000.0)
+
+    def send(self, port, frame, ready, note=None):
+        """Queue a frame on a port after the processing delay, with drop/corruption applied."""
+        if self.rng.random() < self.args.drop:
+            self.stats.count("dropped replies")
+            return None
+        if self.rng.random() < self.args.corrupt:
+            frame = bytearray(frame)
+            frame[self.rng.randrange(1, len(frame))] ^= 1 << self.rng.randrange(8)
+            frame = bytes(frame)
+            self.stats.count("corrupted replies")
+        done = port.schedule_tx(ready, frame)
+        self.at(done - port.transfer_time(len(frame)), port.write, frame)
+        return done
+
+    def on_ftc_frame(self, frame, ok, now):
+        arrived = self.ftc.received_at(now, frame)
+        if not ok:
+            self.stats.count("bad checksum requests")
+            return
+        if frame[0] != cn105.HEADER_MAGIC_A1:
+            self.stats.count("proxied handshake frames")
+            return
+        self.at(arrived, self.answer, frame, arrived)
+
+    def answer(self, frame, arrived):
+        self.plant.step(arrived)
+        msg, p = frame[1], cn105.payload_of(frame)
+        ready = arrived + self.reply_delay()
+        if msg == MsgType.CONNECT_CMD:
+            self.stats.count("connect" if p[1] == 0x01 else "disconnect")
+            if p[1] == 0x01:
+                self.send(self.ftc, CONNECT_RESPONSE, ready)
+        elif msg == MsgType.GET_CONFIGURATION:
+            self.stats.count("GET_CONFIGURATION")
+            payload = cn105.encode_payload(GetType.HARDWARE_CONFIGURATION, self.plant.values(GetType.HARDWARE_CONFIGURATION, arrived))
+            self.send(self.ftc, cn105.build_frame(MsgType.CONFIGURATION_RES, payload), ready)
+        elif msg == MsgType.GET_CMD and p[0] == GetType.SERVICE_REQUEST_CODE:
+            self.answer_request_code(p, arrived, ready)
+        elif msg == MsgType.GET_CMD:
+            try:
+                get_type = GetType(p[0])
+                name = get_type.name
+                payload = cn105.encode_payload(get_type, self.plant.values(get_type, arrived))
+            except ValueError:
+                name, payload = f"0x{p[0]:02X}", bytes([p[0]]) + bytes(cn105.PAYLOAD_SIZE - 1)
+            self.stats.count(name)
+            self.stats.poll(name, arrived)
+            self.send(self.ftc, cn105.build_frame(MsgType.GET_RES, payload), ready)
+        elif msg == MsgType.SET_CMD:
+            # commands.cpp resends an unacknowledged command after 1 s
+            if self.last_set and self.last_set[0] == p and arrived - self.last_set[1] < 1.5:
+                self.stats.count("SET retries")
+            self.last_set = (p, arrived)
+            self.stats.count(f"SET {SetType(p[0]).name if p[0] in SetType._value2member_map_ else hex(p[0])}")
+            self.plant.apply_set(p)
+            done = self.send(self.ftc, cn105.build_frame(MsgType.SET_RES, bytes(cn105.PAYLOAD_SIZE)), ready)
+            if done is not None:
+                self.stats.latency("SET ack", done - arrived)
+        else:
+            self.stats.count(f"unhandled 0x{msg:02X}")
+
+    def answer_request_code(self, p, arrived, ready):
+        code = cn105.int16(p, 1)
+        name = f"RC {RequestCode(code).name}" if code in RequestCode._value2member_map_ else f"RC {code}"
+        self.stats.count(name)
+        # the FTC answers "not ready" (status 0) until the outdoor unit has reported the value
+        since = self.request_code_since.setdefault(code, arrived)
+        values = {"RequestCode": code, "RequestCodeStatus": 0}
+        if arrived - since >= self.args.rc_delay:
+            values.update(RequestCodeStatus=1, RequestCodeValue=self.plant.request_code(code, arrived))
+            del self.request_code_since[code]
+            self.stats.latency(name, arrived - since)
+        payload = cn105.encode_payload(GetType.SERVICE_REQUEST_CODE, values)
+        self.send(self.ftc, cn105.build_frame(MsgType.GET_RES, payload), ready)
+
+    def report(self, now):
+        s = self.stats
+        elapsed = now - self.plant.start
+        print(f"\n--- {elapsed:.0f}s ---")
+        for name in sorted(s.counts):
+            times = s.poll_times.get(name, [])
+            extra = ""
+            if len(times) > 1:
+                gaps = sorted(b - a for a, b in zip(times, times[1:]))
+                extra = f"  every {sum(gaps) / len(gaps):.2f}s (p95 {gaps[int(0.95 * (len(gaps) - 1))]:.2f}s)"
+            print(f"{name:<36}{s.counts[name]:>7}{extra}")
+        for name, values in sorted(s.latencies.items()):
+            values = sorted(values)
+            print(f"{name + ' latency':<36}{len(values):>7}  p50 {values[len(values) // 2] * 1000:.0f} ms, "
+                  f"max {values[-1] * 1000:.0f} ms")
+        total = sum(len(t) for t in s.poll_times.values())
+        if total and elapsed > 0:
+            print(f"{'status replies/s':<36}{total / elapsed:>7.2f}")
+        if self.slave:
+            self.slave.report()
+
+    def run(self):
+        print(f"FTC port {self.ftc.name} at {self.args.baud} baud")
+        if self.slave:
+            print(f"Slave port {self.slave.port.name} at {self.args.slave_baud} baud")
+        next_report = time.monotonic() + self.args.report
+        while True:
+            now = time.monotonic()
+            while self.timers and self.timers[0][0] <= now:
+                _, _, callback, args = heapq.heappop(self.timers)
+                callback(*args)
+            if now >= next_report:
+                self.report(now)
+                next_report = now + self.args.report
+            if self.slave:
+                self.slave.tick(now)
+
+            timeout = min([next_report - now] + ([self.timers[0][0] - now] if self.timers else []))
+            fds = [self.ftc.fd] + ([self.slave.port.fd] if self.slave else [])
+            readable, _, _ = select.select(fds, [], [], max(0.0, min(timeout, 0.05)))
+            now = time.monotonic()
+            if self.ftc.fd in readable:
+                for frame, ok in self.ftc_reader.feed(self.ftc.read()):
+                    self.on_ftc_frame(frame, ok, now)
+            if self.slave and self.slave.port.fd in readable:
+                self.slave.on_data(self.slave.port.read(), now)
+
+
+class SlaveController:
+    """A slave controller (MRC/MELCloud adapter) on the proxy port.
+
+    Runs the proxy handshake, then polls a GET every interval and measures the time until the
+    matching reply comes back through the proxy. Replies to the component's own polls are
+    forwarded too and are ignored here.
+    """
+
+    POLLS = [GetType.TEMPERATURE_STATE_A, GetType.MODE_FLAGS_A, GetType.SH_TEMPERATURE_STATE, GetType.ENERGY_USAGE]
+    TIMEOUT = 2.0
+
+    def __init__(self, emulator, port):
+        self.emulator = emulator
+        self.port = port
+        self.reader = cn105.FrameReader(accept_b=True)
+        self.handshake = 0
+        self.next_send = 0.0
+        self.pending = None
+        self.index = 0
+
+    def tick(self, now):
+        if self.pending and now - self.pending[1] > self.TIMEOUT:
+            self.emulator.stats.count(f"slave timeout {self.pending[2]}")
+            self.pending = None
+        if self.pending or now < self.next_send:
+            return
+        if self.handshake < len(SLAVE_HANDSHAKE):
+            frame, name = SLAVE_HANDSHAKE[self.handshake], f"handshake {self.handshake}"
+        else:
+            get_type = self.POLLS[self.index % len(self.POLLS)]
+            frame, name = cn105.get_request(get_type), get_type.name
+        done = self.port.schedule_tx(now, frame)
+        self.emulator.at(done - self.port.transfer_time(len(frame)), self.port.write, frame)
+        self.pending = (frame, done, name)
+        self.next_send = now + self.emulator.args.slave_interval
+
+    def on_data(self, data, now):
+        for frame, ok in self.reader.feed(data):
+            arrived = self.port.received_at(now, frame)
+            if not ok or not self.pending:
+                continue
+            sent, since, name = self.pending
+            if self.handshake < len(SLAVE_HANDSHAKE):
+                matched = True  # the component answers the handshake from its cache
+            else:
+                matched = frame[1] == MsgType.GET_RES and cn105.payload_of(frame)[0] == cn105.payload_of(sent)[0]
+            if matched:
+                self.emulator.stats.latency(f"slave {name}" if self.handshake >= len(SLAVE_HANDSHAKE) else "slave handshake",
+                                            arrived - since)
+                if self.handshake < len(SLAVE_HANDSHAKE):
+                    self.handshake += 1
+                else:
+                    self.index += 1
+                self.pending = None
+
+    def report(self):
+        print(f"{'slave handshake step':<36}{self.handshake:>7}/{len(SLAVE_HANDSHAKE)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Emulate an Ecodan FTC on a pseudo-terminal or serial port")
+    parser.add_argument("--link", help="symlink to create for the pty, e.g. /tmp/ftc")
+    parser.add_argument("--device", help="use a serial device (e.g. /dev/ttyUSB0) instead of a pty")
+    parser.add_argument("--baud", type=int, default=2400)
+    parser.add_argument("--latency", type=float, default=60.0, help="mean FTC processing delay before a reply (ms)")
+    parser.add_argument("--jitter", type=float, default=20.0, help="standard deviation of the delay (ms)")
+    parser.add_argument("--drop", type=float, default=0.0, help="probability a reply is never sent")
+    parser.add_argument("--corrupt", type=float, default=0.0, help="probability a reply has one bit flipped")
+    parser.add_argument("--rc-delay", type=float, default=2.0, help="seconds a service request code stays 'not ready'")
+    parser.add_argument("--slave-link", help="also emulate a slave controller on a second pty, symlinked here")
+    parser.add_argument("--slave-device", help="emulate the slave controller on a serial device instead")
+    parser.add_argument("--slave-baud", type=int, default=2400)
+    parser.add_argument("--slave-interval", type=float, default=1.0, help="seconds between slave requests")
+    parser.add_argument("--report", type=float, default=30.0, help="seconds between statistics reports")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    emulator = Emulator(args, time.monotonic())
+    try:
+        emulator.run()
+    except KeyboardInterrupt:
+        emulator.report(time.monotonic())
+
+
+if __name__ == "__main__":
+    main()
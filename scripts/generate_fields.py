@@ -0,0 +1,177 @@
+# ABOUTME: Generates components/ecodan/fields.cpp, the straight-line C++ field decoder, from cn105.FIELDS.
+# ABOUTME: Run with: python scripts/generate_fields.py (rewrite) or --check (fail when fields.cpp is out of date)
+
+import argparse
+import os
+import sys
+
+import cn105
+from cn105 import GetType
+
+COMPONENT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "components", "ecodan"))
+OUTPUT_FILE = os.path.join(COMPONENT_DIR, "fields.cpp")
+
+sys.path.insert(0, COMPONENT_DIR)
+from generate_keys import schema_keys  # noqa: E402
+
+# decoded into other structures than plain Status members, handled in response.cpp
+HANDWRITTEN = {GetType.DATETIME_FIRMWARE, GetType.SERVICE_REQUEST_CODE}
+
+# kinds that map one to one onto a Message getter
+GETTER_KINDS = {"float8_v2", "float8_v3", "float8_v4", "float16", "float16_signed", "float24", "float24_v2",
+                "int16", "int16_v2", "uint16_v2"}
+
+
+def cpp_float(value):
+    return f"{float(value)!r}f"
+
+
+def expression(field):
+    i, arg = field.index, field.arg
+    if field.kind == "u8":
+        return f"res[{i}]" if arg is None else f"res[{i}] + {int(arg)}"
+    if field.kind == "bool":
+        return f"res[{i}] != 0"
+    if field.kind == "u8_minus40":
+        return f"res[{i}] - 40.0f"
+    if field.kind == "float8":
+        return f"res.get_float8({i}, {cpp_float(arg)})"
+    if field.kind in GETTER_KINDS:
+        return f"res.get_{field.kind}({i})"
+    if field.kind == "u16":
+        if arg is None:
+            return f"res.get_u16({i})"
+        divisor = round(1 / arg)
+        if abs(divisor * arg - 1) < 1e-9:
+            return f"res.get_u16({i}) / {cpp_float(divisor)}"
+        return f"res.get_u16({i}) * {cpp_float(arg)}"
+    if field.kind == "room_float16":
+        return f"res[{i}] != 0xF0 ? res.get_float16({i}) : 0.0f"
+    if field.kind == "condensing":
+        return f"(res[{i}] == 0x0F && res[{i + 1}] == 0xD9) ? res.get_float8_v3({i + 2}) : res.get_float16_signed({i})"
+    if field.kind == "any_nonzero":
+        return f"any_nonzero(res, {i}, {int(arg)})"
+    raise ValueError(f"no C++ decoding for field kind {field.kind}")
+
+
+def assignment(name, field):
+    member = f"status.{name}"
+    if field.kind == "u8":
+        return [f"{member} = static_cast<decltype({member})>({expression(field)});"]
+    if field.kind == "any_nonzero":
+        # sticky: once a unit has reported the bytes, keep decoding them
+        return [f"{member} = {member} || {expression(field)};"]
+    return [f"{member} = {expression(field)};"]
+
+
+def publish(name, field):
+    member = f"status.{name}"
+    if field.key is None:
+        return []
+    if field.kind in ("bool", "any_nonzero"):
+        return [f"publish_state(BinarySensorKey::{field.key.upper()}, {member});"]
+    if field.kind == "u8":
+        return [f"publish_state(SensorKey::{field.key.upper()}, static_cast<float>({member}));"]
+    return [f"publish_state(SensorKey::{field.key.upper()}, {member});"]
+
+
+def guarded(fields, statements):
+    """statements(name, field) for every field in order, inside if blocks for the fields' when conditions."""
+    body, guard = [], None
+    for name, field in fields.items():
+        lines = statements(name, field)
+        if not lines:
+            continue
+        if field.when != guard:
+            if guard is not None:
+                body.append("}")
+            if field.when is not None:
+                body.append(f"if (status.{field.when}) {{")
+            guard = field.when
+        indent = "    " if guard is not None else ""
+        body.extend(indent + line for line in lines)
+    if guard is not None:
+        body.append("}")
+    return body
+
+
+def check_keys():
+    sensors = set(schema_keys(os.path.join(COMPONENT_DIR, "sensor.py")))
+    binary_sensors = set(schema_keys(os.path.join(COMPONENT_DIR, "binary_sensor.py")))
+    errors = []
+    for get_type, fields in cn105.FIELDS.items():
+        for name, field in fields.items():
+            if field.key is None:
+                continue
+            known = binary_sensors if field.kind in ("bool", "any_nonzero") else sensors
+            if field.key not in known:
+                errors.append(f"{get_type.name}.{name}: unknown key {field.key}")
+            if field.when is not None and field.when not in fields:
+                errors.append(f"{get_type.name}.{name}: when refers to unknown field {field.when}")
+    if errors:
+        raise SystemExit("\n".join(errors))
+
+
+def generate():
+    check_keys()
+    cases = []
+    for get_type, fields in cn105.FIELDS.items():
+        if get_type in HANDWRITTEN:
+            continue
+        # every member of the message is set before the first publish, so state callbacks reading
+        # get_status() see the whole message
+        body = guarded(fields, assignment) + guarded(fields, publish)
+        lines = [f"        case GetType::{get_type.name}:"]
+        lines.extend(f"            {line}" for line in body)
+        lines.append("            return true;")
+        cases.append("\n".join(lines))
+
+    return f"""// Generated by scripts/generate_fields.py from cn105.FIELDS in scripts/cn105.py; do not edit.
+#include "ecodan.h"
+
+namespace esphome {{
+namespace ecodan
+{{
+    static bool any_nonzero(Message& res, size_t begin, size_t end) {{
+        for (size_t i = begin; i < end; i++) {{
+            if (res[i] != 0)
+                return true;
+        }}
+        return false;
+    }}
+
+    bool EcodanHeatpump::decode_fields(Message& res)
+    {{
+        switch (res.payload_type<GetType>())
+        {{
+{chr(10).join(cases)}
+        default:
+            return false;
+        }}
+    }}
+
+}} // namespace ecodan
+}} // namespace esphome
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the C++ field decoder from cn105.FIELDS")
+    parser.add_argument("--check", action="store_true", help="only verify that fields.cpp is up to date")
+    args = parser.parse_args()
+
+    content = generate()
+    if args.check:
+        with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
+            if f.read() != content:
+                raise SystemExit(f"{OUTPUT_FILE} is out of date, run scripts/generate_fields.py")
+        print(f"{OUTPUT_FILE} is up to date.")
+        return
+
+    with open(OUTPUT_FILE, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    print(f"Success! {OUTPUT_FILE} generated.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,611 @@
+# ABOUTME: Fits a grey-box RC house model (emitter mass, building mass, UA) to ecodan_log.csv, runs policies on it closed loop.
+# ABOUTME: Run with: python scripts/house_model.py fit [ecodan_log.csv] --out house.json, then simulate house.json --days 150
+
+import argparse
+import json
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+import optimizer_replay as replay
+import optimizer_sweep as sweep
+from optimizer_replay import MAX_FEED_STEP_DOWN, MAX_FEED_STEP_DOWN_ADJUSTMENT, STARTUP_RAMP_S, Settings
+
+WATER_KW_PER_LMIN_K = 4.186 / 60.0
+BURN_IN_S = 12 * 3600  # emitter temperature estimate still settling from its initial guess
+# candidate time constants (hours) of the emitter towards the water and towards the building
+WATER_TAUS_H = np.geomspace(0.05, 20.0, 40)
+BUILDING_TAUS_H = np.geomspace(0.2, 100.0, 40)
+TIME_BLOCK = 2048  # bins per block of the candidate search
+WINDOW_S = 2 * 3600  # the room balance is integrated over windows this long, averaging out the 0.1 C room steps
+
+
+class ThermalModel(NamedTuple):
+    """2R2C grey box: the emitter (water, pipes, screed or radiators) and the building mass.
+
+        ce dTe/dt = he (Tw - Te) - heb (Te - Tb)
+        cb dTb/dt = heb (Te - Tb) - ua (Tb - To) + gains
+
+    Tw is the mean water temperature, Tb the room and To the outside temperature. Capacities
+    are in kWh/K, conductances in kW/K and gains (internal and solar, on average) in kW.
+    """
+    ce: float
+    cb: float
+    he: float
+    heb: float
+    ua: float
+    gains: float
+
+    def time_constants(self):
+        """Hours: emitter on its own, and the building losing heat with the emitter cold."""
+        return self.ce / (self.he + self.heb), self.cb / (self.heb + self.ua)
+
+    def stepper(self, step_s):
+        return Stepper(self, step_s)
+
+
+class Stepper:
+    """Exact discretisation of ThermalModel over step_s, with the heat into the emitter and the
+    outside temperature held for the step."""
+
+    def __init__(self, model, step_s):
+        m = model
+        a = np.array([[-m.heb / m.ce, m.heb / m.ce],
+                      [m.heb / m.cb, -(m.heb + m.ua) / m.cb]])
+        b = np.array([[1.0 / m.ce, 0.0, 0.0],
+                      [0.0, m.ua / m.cb, m.gains / m.cb]])
+        da, db = discretise(a, b, step_s / 3600.0)
+        (self.a00, self.a01), (self.a10, self.a11) = da.tolist()
+        (self.bp0, self.bo0, self.bc0), (self.bp1, self.bo1, self.bc1) = db.tolist()
+
+    def step(self, te, tb, power, outside):
+        """Emitter and room temperature one step later; works on floats and on arrays alike."""
+        return (self.a00 * te + self.a01 * tb + self.bp0 * power + self.bo0 * outside + self.bc0,
+                self.a10 * te + self.a11 * tb + self.bp1 * power + self.bo1 * outside + self.bc1)
+
+
+class HeatPump(NamedTuple):
+    """What the closed-loop simulation assumes about the unit, estimated from the log.
+
+    It holds the feed at the flow setpoint between min_kw and max_kw. Below min_kw it cannot
+    modulate further: it keeps making min_kw, the feed overshoots and it stops once the feed
+    is stop_overshoot above the setpoint. It starts again after min_off_s when the water has
+    cooled restart_drop below the setpoint.
+    """
+    min_kw: float
+    max_kw: float
+    water_kw_per_k: float  # flow rate times the heat capacity of water
+    carnot_efficiency: float
+    stop_overshoot: float = 2.0
+    restart_drop: float = 1.0
+    min_off_s: float = 600.0
+
+
+class Series(NamedTuple):
+    """The log averaged onto a regular grid of step_s bins."""
+    step_s: float
+    water: np.ndarray     # mean of feed and return while the water goes to the house
+    exchange: np.ndarray  # the bin has a water temperature for the house circuit
+    room: np.ndarray
+    outside: np.ndarray
+    heat: np.ndarray      # kW into the house circuit
+    logged: np.ndarray    # the bin has a logged room temperature
+
+
+def house_heat(history):
+    """kW into the house circuit: flow rate times feed - return, the unit's output power without a flow rate."""
+    from_flow = history.flow_rate * WATER_KW_PER_LMIN_K * (history.feed - history.ret)
+    heat = np.where(np.isfinite(from_flow), from_flow, history.power)
+    return np.where(history.dhw & np.isfinite(heat), 0.0, heat)
+
+
+def binned(history, step_s):
+    k = (history.t // step_s).astype(np.int64)
+    n = int(k[-1]) + 1 if len(k) else 0
+    rows = np.bincount(k, minlength=n)
+
+    def mean(values, valid=True):
+        ok = valid & np.isfinite(values)
+        count = np.bincount(k[ok], minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.bincount(k[ok], weights=values[ok], minlength=n) / count, count
+
+    # the 3-way valve sends the water to the tank during DHW
+    water, water_rows = mean((history.feed + history.ret) / 2.0, ~history.dhw)
+    room, room_rows = mean(history.room)
+    outside, _ = mean(history.outside)
+    heat, _ = mean(house_heat(history))
+    return Series(float(step_s), np.nan_to_num(water), (water_rows * 2 >= rows) & (rows > 0),
+                  replay.forward_fill(room), replay.forward_fill(outside), heat, room_rows > 0)
+
+
+def emitter_temperatures(series, water_rate, building_rate, start=0, stop=None, te=None):
+    """Emitter temperature at the bin edges start..stop for arrays of candidate rates (per hour).
+
+    The emitter node relaxes towards the water (when it flows to the house) and the room;
+    each bin is solved exactly with its averages held. Returns shape (bins + 1, candidates).
+    """
+    stop = len(series.room) if stop is None else stop
+    h = series.step_s / 3600.0
+    decay_on = np.exp(-(water_rate + building_rate) * h)
+    decay_off = np.exp(-building_rate * h)
+    share = water_rate / (water_rate + building_rate)
+    water, exchange, room = series.water.tolist(), series.exchange.tolist(), series.room.tolist()
+    if te is None:
+        te = np.full_like(water_rate, room[start])
+        if exchange[start]:
+            te += share * (water[start] - room[start])
+    out = np.empty((stop - start + 1,) + np.shape(water_rate))
+    out[0] = te
+    for j, k in enumerate(range(start, stop), 1):
+        if exchange[k]:
+            settled = room[k] + share * (water[k] - room[k])
+            te = settled + (te - settled) * decay_on
+        else:
+            te = room[k] + (te - room[k]) * decay_off
+        out[j] = te
+    return out
+
+
+def fit(history, step_s=600.0, holdout=0.25):
+    """ThermalModel by batched least squares, and the fit statistics.
+
+    For every pair of candidate emitter time constants the hidden emitter temperature follows
+    from the logged water and room temperatures, which leaves the room balance linear in the
+    building rates: one 3x3 least squares problem per candidate, all solved at once from
+    accumulated normal equations. The room balance is integrated over WINDOW_S so the 0.1 C
+    steps of the room sensor average out, and the candidates then compete on how well the model
+    run freely from the logged water temperatures follows the room. The logged heat into the
+    house circuit finally scales the rates to capacities and kW/K.
+    The last holdout fraction of the log is only used to check the fit.
+    """
+    series = binned(history, step_s)
+    n = len(series.room)
+    if n < 3:
+        raise SystemExit("The log is too short to fit a house model.")
+    h = step_s / 3600.0
+    fit_stop = max(2, int(n * (1.0 - holdout)))
+    water_rate, building_rate = (1.0 / g.ravel() for g in np.meshgrid(WATER_TAUS_H, BUILDING_TAUS_H, indexing="ij"))
+
+    room, outside = series.room, series.outside
+    usable = series.logged[1:] & series.logged[:-1] & np.isfinite(outside[:-1]) & np.isfinite(room[:-1])
+    usable &= np.arange(n - 1) * step_s >= BURN_IN_S
+    usable[fit_stop - 1:] = False
+    window = max(1, int(round(WINDOW_S / step_s)))
+    if usable.sum() < 10 * window:
+        raise SystemExit("Not enough logged room temperatures to fit a house model.")
+
+    # normal equations of the room balance integrated over windows of WINDOW_S,
+    # (Tb(end) - Tb(start)) / span = mean of gamma (Te - Tb) + delta (To - Tb) + eps, one set per candidate
+    g = len(water_rate)
+    xtx = np.zeros((g, 3, 3))
+    xty = np.zeros((g, 3))
+    yty = 0.0
+    used = 0
+    te = None
+    windows = (fit_stop - 1) // window
+    block = TIME_BLOCK // window * window
+    for start in range(0, windows * window, block):
+        stop = min(start + block, windows * window)
+        edges = emitter_temperatures(series, water_rate, building_rate, start, stop, te)
+        te = edges[-1]
+        shape = (-1, window)
+        w = usable[start:stop].reshape(shape).all(axis=1)
+        if not w.any():
+            continue
+        tb_mid = ((room[start:stop] + room[start + 1:stop + 1]) / 2.0)[:, None]
+        d = ((edges[:-1] + edges[1:]) / 2.0 - tb_mid).reshape(shape + (g,)).mean(axis=1)[w]
+        o = np.broadcast_to((outside[start:stop, None] - tb_mid).reshape(shape + (1,)).mean(axis=1)[w], d.shape)
+        y = ((room[start + window:stop + 1:window] - room[start:stop:window]) / (window * h))[w][:, None]
+        one = np.ones_like(d)
+        columns = (d, o, one)
+        for i in range(3):
+            xty[:, i] += (columns[i] * y).sum(axis=0)
+            for j in range(i, 3):
+                xtx[:, i, j] += (columns[i] * columns[j]).sum(axis=0)
+                xtx[:, j, i] = xtx[:, i, j]
+        yty += float((y[:, 0] ** 2).sum())
+        used += int(w.sum())
+
+    theta = np.linalg.solve(xtx + 1e-9 * np.eye(3), xty[:, :, None])[:, :, 0]
+    sse = yty - 2.0 * (theta * xty).sum(axis=1) + np.einsum("gi,gij,gj->g", theta, xtx, theta)
+    physical = (theta[:, 0] > 0) & (theta[:, 1] > 0)
+    if not physical.any():
+        raise SystemExit("No candidate gives positive heat transfer rates, the log has too little heating in it.")
+
+    # the windowed residual barely sees the slow building dynamics, the free run does
+    rates = np.concatenate([np.stack([water_rate, building_rate], axis=1), theta], axis=1)[physical]
+    free = free_run_rmse(series, rates.T, 0, fit_stop)
+    best = int(np.argmin(free))
+    alpha, beta, gamma, delta, eps = rates[best]
+
+    # he from the heat the water delivered: heat = he (Tw - Te), Te averaged over each bin
+    edges = emitter_temperatures(series, np.array([alpha]), np.array([beta]))[:, 0]
+    te_mid = (edges[:-1] + edges[1:]) / 2.0
+    sel = series.exchange[:fit_stop] & np.isfinite(series.heat[:fit_stop])
+    drive = (series.water - te_mid)[:fit_stop][sel]
+    heat = series.heat[:fit_stop][sel]
+    if len(heat) < 10 or not (drive ** 2).sum() > 0:
+        raise SystemExit("The log has neither flow_rate_lmin nor output_power_kw, the model cannot be scaled to kW.")
+    he = float((heat * drive).sum() / (drive ** 2).sum())
+    ce = he / alpha
+    heb = beta * ce
+    cb = heb / gamma
+    model = ThermalModel(ce=ce, cb=cb, he=he, heb=heb, ua=delta * cb, gains=eps * cb)
+
+    stats = {
+        "bins": n, "fit_bins": fit_stop, "step_s": step_s,
+        "window_rmse": math.sqrt(max(float(sse[physical][best]), 0.0) / max(used, 1)) * h * window,
+        "fit_free_run_rmse": float(free[best]),
+        "holdout_free_run_rmse": (float(free_run_rmse(series, rates[best][:, None], fit_stop - 1, n)[0])
+                                  if n - fit_stop > 1 else math.nan),
+    }
+    return model, stats
+
+
+def discretise(a, b, h):
+    """Exact zero-order hold discretisation of x' = a x + b u over h; a may carry leading batch axes."""
+    values, vectors = np.linalg.eig(a)
+    da = ((vectors * np.exp(values * h)[..., None, :]) @ np.linalg.inv(vectors)).real
+    return da, np.linalg.solve(a, (da - np.eye(a.shape[-1])) @ b)
+
+
+def free_run_rmse(series, rates, start, stop):
+    """Room RMSE against the log of the model run on the logged water and outside temperatures alone.
+
+    rates are the per hour rates of the emitter towards the water and the building, and of
+    the building towards the emitter and outside plus its gains (alpha, beta, gamma, delta,
+    eps), each an array over candidates. The run starts from the logged room at bin start.
+    """
+    alpha, beta, gamma, delta, eps = (np.asarray(r, dtype=np.float64) for r in rates)
+    zero = np.zeros_like(alpha)
+    h = series.step_s / 3600.0
+    maps = []
+    for water_rate in (alpha, zero):
+        a = np.stack([np.stack([-(water_rate + beta), beta], -1), np.stack([gamma, -(gamma + delta)], -1)], -2)
+        b = np.stack([np.stack([water_rate, zero, zero], -1), np.stack([zero, delta, eps], -1)], -2)
+        da, db = discretise(a, b, h)
+        maps.append((da[:, 0, 0], da[:, 0, 1], db[:, 0, 0], db[:, 0, 1], db[:, 0, 2],
+                     da[:, 1, 0], da[:, 1, 1], db[:, 1, 0], db[:, 1, 1], db[:, 1, 2]))
+
+    water, exchange, outside = series.water.tolist(), series.exchange.tolist(), series.outside.tolist()
+    room, logged = series.room.tolist(), series.logged.tolist()
+    tb = np.full_like(alpha, room[start])
+    te = tb + alpha / (alpha + beta) * (water[start] - room[start]) if exchange[start] else tb.copy()
+    sse = np.zeros_like(alpha)
+    count = 0
+    for k in range(start, stop - 1):
+        e0, e1, ew, eo, ec, b0, b1, bw, bo, bc = maps[0] if exchange[k] else maps[1]
+        te, tb = (e0 * te + e1 * tb + ew * water[k] + eo * outside[k] + ec,
+                  b0 * te + b1 * tb + bw * water[k] + bo * outside[k] + bc)
+        if logged[k + 1]:
+            sse += (tb - room[k + 1]) ** 2
+            count += 1
+    return np.sqrt(sse / max(count, 1))
+
+
+def estimate_heat_pump(history):
+    """Modulation range, water flow and Carnot efficiency as the log shows them while heating the house."""
+    heating = history.compressor & ~history.dhw & ~history.defrost
+    heat = house_heat(history)[heating]
+    heat = heat[np.isfinite(heat) & (heat > 0.1)]
+    flow = history.flow_rate[heating]
+    flow = flow[np.isfinite(flow) & (flow > 1.0)]
+    min_kw, max_kw = (float(np.percentile(heat, 10)), float(np.percentile(heat, 98))) if len(heat) > 100 else (2.0, 8.0)
+    lmin = float(np.median(flow)) if len(flow) > 100 else 17.0
+    efficiency = sweep.calibrate(history, Settings()).carnot_efficiency
+    return HeatPump(min_kw=min_kw, max_kw=max(max_kw, min_kw * 1.5), water_kw_per_k=lmin * WATER_KW_PER_LMIN_K,
+                    carnot_efficiency=efficiency)
+
+
+# --- closed loop -------------------------------------------------------------
+
+class DeltaTPolicy:
+    """process_adaptive_zone_'s heating branches for a batch of delta T parameter sets, rows of optimizer_sweep.PARAMS.
+
+    Suppression, the mode 2 cap, the startup ramp, the step down limit and flow clamping.
+    Not modelled: smart boost, defrost and suppression recovery ramps and the suppression
+    cooldown, the outside temperature lock and DHW.
+    """
+
+    def __init__(self, params, settings):
+        params = np.asarray(params, dtype=np.float64)
+        self.base, self.cold_limit, self.max_delta, self.error_range, self.linear = params.T
+        self.settings = settings
+
+    def __len__(self):
+        return len(self.base)
+
+    def __call__(self, t, room, target, feed, ret, outside, run_s):
+        s = self.settings
+        min_flow = min(s.min_flow, s.max_flow)
+        clamped = min(max(outside, replay.COLD_WEATHER_TEMP), replay.MILD_WEATHER_TEMP)
+        cold_factor = (replay.MILD_WEATHER_TEMP - clamped) / (replay.MILD_WEATHER_TEMP - replay.COLD_WEATHER_TEMP)
+        f32 = np.float32
+        error = ((np.float32(target) + f32(s.setpoint_bias)) - np.asarray(room, dtype=f32)).astype(np.float64)
+
+        dynamic_min = self.base + cold_factor * (self.cold_limit - self.base)
+        x = np.minimum(np.maximum(error, 0.0) / self.error_range, 1.0)
+        error_factor = np.where(self.linear > 0, x, x * x * (3.0 - 2.0 * x))
+        target_delta = dynamic_min + error_factor * (self.max_delta - dynamic_min)
+
+        ratio = np.minimum(run_s / STARTUP_RAMP_S, 1.0)
+        ramp = ret + self.base + np.maximum(target_delta - self.base, 0.0) * ratio
+        flow = np.where(run_s < STARTUP_RAMP_S, ramp, ret + target_delta)
+        flow = np.where(error < 0.0, np.minimum(ret + 1.0, min_flow + dynamic_min + 3.0), flow)
+        suppress = error <= -0.5
+        flow = np.floor(np.where(suppress, min_flow, flow) * 10.0 + 0.5) / 10.0
+
+        step_down = ~suppress & (np.asarray(feed, dtype=f32) - flow.astype(f32) > f32(MAX_FEED_STEP_DOWN))
+        flow = np.where(step_down, feed - MAX_FEED_STEP_DOWN_ADJUSTMENT, flow)
+        return np.minimum(np.maximum(flow, min_flow), s.max_flow)
+
+
+class LoggedPolicy:
+    """The flow setpoints the log shows, to check the closed loop against what really happened."""
+
+    def __init__(self, history):
+        self.t = history.t
+        self.setpoint = replay.forward_fill(history.flow_setpoint)
+
+    def __len__(self):
+        return 1
+
+    def __call__(self, t, room, target, feed, ret, outside, run_s):
+        i = min(int(np.searchsorted(self.t, t, side="right")) - 1, len(self.t) - 1)
+        return np.full(np.shape(room), self.setpoint[max(i, 0)])
+
+
+class Outcome(NamedTuple):
+    """Per policy (parameter set) totals of a closed-loop simulation."""
+    heat_kwh: np.ndarray
+    electricity_kwh: np.ndarray
+    starts_per_day: np.ndarray
+    run_fraction: np.ndarray
+    mean_flow: np.ndarray        # setpoint while the compressor runs
+    cold_kh: np.ndarray          # degree hours below the target
+    warm_kh: np.ndarray          # degree hours more than 0.5 C above the target
+    days: float
+    trace: dict                  # per loop run arrays (runs, policies) when asked for
+
+    @property
+    def scop(self):
+        return self.heat_kwh / np.maximum(self.electricity_kwh, 1e-9)
+
+
+def simulate(model, pump, outside, target, policy, step_s=120.0, interval_s=300.0, room=None, record=False):
+    """Run policy against the house model and the heat pump for len(outside) steps of step_s.
+
+    outside and target are per step (target may be a scalar). All of policy's parameter sets
+    run side by side as one array. The policy runs on the interval timer and whenever the
+    compressor starts, as the device's loop does. The heat the unit makes is set at the start
+    of each step, so step_s should stay well below the emitter time constant.
+    """
+    n_policies = len(policy)
+    outside = np.asarray(outside, dtype=np.float64)
+    targets = np.broadcast_to(np.asarray(target, dtype=np.float64), outside.shape).tolist()
+    # holding the feed at the setpoint, the heat follows the setpoint over the emitter through half the water's rise
+    he_eff = 1.0 / (1.0 / model.he + 0.5 / pump.water_kw_per_k)
+    stepper = model.stepper(step_s)
+    min_kw, max_kw = pump.min_kw, pump.max_kw
+    floor_rise = pump.min_kw / he_eff
+
+    # start in balance: the emitter carrying the losses the gains leave
+    tb = np.full(n_policies, targets[0] if room is None else room, dtype=np.float64)
+    te = tb + np.maximum(model.ua * (tb - outside[0]) - model.gains, 0.0) / model.heb
+    on = np.zeros(n_policies, dtype=bool)
+    started = np.zeros(n_policies)
+    stopped = np.full(n_policies, -np.inf)
+    power = np.zeros(n_policies)
+    setpoint = np.full(n_policies, np.nan)
+    next_tick = 0.0
+
+    heat = np.zeros(n_policies)
+    lift_per_heat = np.zeros(n_policies)
+    starts = np.zeros(n_policies)
+    run_steps = np.zeros(n_policies)
+    flow_sum = np.zeros(n_policies)
+    cold = np.zeros(n_policies)
+    warm = np.zeros(n_policies)
+    trace = {"room": [], "setpoint": [], "feed": [], "ret": [], "heat": []} if record else None
+
+    def run_policy(t, target_k, out):
+        feed = te + power / he_eff
+        ret = feed - power / pump.water_kw_per_k
+        if record:
+            for name, values in (("room", tb), ("feed", feed), ("ret", ret), ("heat", power)):
+                trace[name].append(values)
+        return policy(t, tb, target_k, feed, ret, out, np.where(on, t - started, np.inf))
+
+    for k, out in enumerate(outside.tolist()):
+        target_k = targets[k]
+        t = k * step_s
+        if t >= next_tick:
+            next_tick += interval_s
+            setpoint = run_policy(t, target_k, out)
+            if record:
+                trace["setpoint"].append(setpoint)
+        start = ~on & (t - stopped >= pump.min_off_s) & (te < setpoint - pump.restart_drop)
+        if start.any():
+            on |= start
+            started = np.where(start, t, started)
+            starts += start
+            # the unit was off, so the water sits at the emitter temperature
+            setpoint = np.where(start, policy(t, tb, target_k, te, te, out, np.where(on, t - started, np.inf)),
+                                setpoint)
+
+        drive = he_eff * (setpoint - te)
+        stop = on & (drive < min_kw) & (te + floor_rise > setpoint + pump.stop_overshoot)
+        if stop.any():
+            on &= ~stop
+            stopped = np.where(stop, t, stopped)
+        power = np.minimum(np.maximum(drive, min_kw), max_kw) * on
+        feed = te + power / he_eff
+        te, tb = stepper.step(te, tb, power, out)
+
+        heat += power
+        lift_per_heat += power / sweep.carnot(feed, out)
+        run_steps += on
+        flow_sum += setpoint * on
+        cold += np.maximum(target_k - tb, 0.0)
+        warm += np.maximum(tb - target_k - 0.5, 0.0)
+
+    h = step_s / 3600.0
+    days = len(outside) * step_s / 86400.0
+    if record:
+        trace = {name: np.array(values) for name, values in trace.items()}
+    return Outcome(heat_kwh=heat * h, electricity_kwh=lift_per_heat * h / pump.carnot_efficiency,
+                   starts_per_day=starts / max(days, 1e-9), run_fraction=run_steps / max(len(outside), 1),
+                   mean_flow=flow_sum / np.maximum(run_steps, 1), cold_kh=cold * h, warm_kh=warm * h, days=days,
+                   trace=trace)
+
+
+def outside_steps(history, days, step_s):
+    """The logged outside temperature on a regular step_s grid, the log repeated to cover days."""
+    if days:
+        history = history.tiled(days)
+    n = int(days * 86400 / step_s) if days else int(history.t[-1] // step_s) + 1
+    t = np.arange(n) * step_s
+    filled = replay.forward_fill(history.outside)
+    i = np.clip(np.searchsorted(history.t, t, side="right") - 1, 0, len(history) - 1)
+    return np.nan_to_num(filled[i], nan=float(np.nanmean(history.outside)))
+
+
+# --- command line -------------------------------------------------------------
+
+def save_model(path, model, pump, stats):
+    with open(path, "w") as f:
+        json.dump({"model": model._asdict(), "heat_pump": pump._asdict(), "fit": stats}, f, indent=2)
+    print(f"{path}: house model saved")
+
+
+def load_model(path):
+    with open(path) as f:
+        data = json.load(f)
+    return ThermalModel(**data["model"]), HeatPump(**data["heat_pump"])
+
+
+def show_model(model, pump):
+    emitter_h, building_h = model.time_constants()
+    print(f"emitter:  {model.ce:7.2f} kWh/K, {model.he:.3f} kW/K from the water, {model.heb:.3f} kW/K to the building "
+          f"(time constant {emitter_h:.1f} h)")
+    print(f"building: {model.cb:7.2f} kWh/K, UA {model.ua:.3f} kW/K, gains {model.gains:.2f} kW "
+          f"(time constant {building_h:.1f} h)")
+    lmin = pump.water_kw_per_k / WATER_KW_PER_LMIN_K
+    print(f"heat pump: {pump.min_kw:.1f} to {pump.max_kw:.1f} kW, water {lmin:.1f} l/min, "
+          f"Carnot efficiency {pump.carnot_efficiency:.2f}")
+
+
+def energy_balance_ua(history):
+    """The single kW/K number of overnight_report.analyze_heat_loss: mean heat over mean indoor-outdoor difference."""
+    heat = np.nanmean(house_heat(history))
+    difference = np.nanmean(history.room - history.outside)
+    return heat / difference if difference > 0 else math.nan
+
+
+def cmd_fit(args):
+    history = replay.load_history(args.log)
+    if not len(history):
+        raise SystemExit("The log has no rows.")
+    start = time.perf_counter()
+    model, stats = fit(history, args.step * 60.0, args.holdout)
+    pump = estimate_heat_pump(history)
+    elapsed = time.perf_counter() - start
+    print(f"{len(history)} rows over {history.t[-1] / 86400:.1f} days, {stats['bins']} bins of {args.step:g} min, "
+          f"{len(WATER_TAUS_H) * len(BUILDING_TAUS_H)} emitter candidates, fitted in {elapsed:.2f}s\n")
+    show_model(model, pump)
+    print(f"\nenergy balance heat loss (as in overnight_report): {energy_balance_ua(history):.3f} kW/K")
+    print(f"room RMSE: {stats['window_rmse']:.3f} C per {WINDOW_S / 60:g} min window; free run "
+          f"{stats['fit_free_run_rmse']:.2f} C over the fit, {stats['holdout_free_run_rmse']:.2f} C over the last "
+          f"{args.holdout:.0%}")
+    if args.out:
+        save_model(args.out, model, pump, stats)
+
+
+def cmd_simulate(args):
+    model, pump = load_model(args.model)
+    history = replay.load_history(args.log, args.target)
+    step_s = args.step
+    outside = outside_steps(history, args.days, step_s)
+    settings = Settings(heating_type=args.heating_type, min_flow=args.min_flow, max_flow=args.max_flow,
+                        setpoint_bias=args.bias)
+    show_model(model, pump)
+
+    if args.logged:
+        policy = LoggedPolicy(history)
+        outside = outside_steps(history, 0, step_s)
+        target = np.nan_to_num(history.target[np.clip(np.searchsorted(history.t, np.arange(len(outside)) * step_s,
+                                                                      side="right") - 1, 0, len(history) - 1)],
+                               nan=args.target or 20.0)
+        labels = ["logged setpoints"]
+    else:
+        p = settings.resolved_profile()
+        params = np.array([[p.base_min_delta_t, p.min_delta_cold_limit, p.max_delta_t, p.max_error_range,
+                            float(args.heating_type % 2)]])
+        if args.base or args.cold_limit or args.max_delta or args.error_range:
+            params = np.concatenate([params, sweep.grid(
+                sweep.parse_range(args.base or str(p.base_min_delta_t)),
+                sweep.parse_range(args.cold_limit or str(p.min_delta_cold_limit)),
+                sweep.parse_range(args.max_delta or str(p.max_delta_t)),
+                sweep.parse_range(args.error_range or str(p.max_error_range)), [float(args.heating_type % 2)])])
+        policy = DeltaTPolicy(params, settings)
+        target = args.target if args.target is not None else float(np.nanmedian(history.target))
+        labels = ["current profile"] + [" ".join(f"{v:g}" for v in row[:4]) for row in params[1:]]
+
+    start = time.perf_counter()
+    result = simulate(model, pump, outside, target, policy, step_s, settings.interval_s, record=args.logged)
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(policy)} policies x {result.days:.1f} days in {elapsed:.2f}s "
+          f"({len(outside)} steps of {step_s:g}s)\n")
+    print(f"{'policy':<22}{'heat kWh':>10}{'elec kWh':>10}{'SCOP':>6}{'starts/d':>9}{'run %':>7}{'flow C':>7}"
+          f"{'cold Kh':>8}{'warm Kh':>8}")
+    for i, label in enumerate(labels):
+        print(f"{label:<22}{result.heat_kwh[i]:>10.0f}{result.electricity_kwh[i]:>10.0f}{result.scop[i]:>6.2f}"
+              f"{result.starts_per_day[i]:>9.1f}{result.run_fraction[i] * 100:>7.1f}{result.mean_flow[i]:>7.1f}"
+              f"{result.cold_kh[i]:>8.0f}{result.warm_kh[i]:>8.0f}")
+    if args.logged:
+        ticks = (np.arange(len(result.trace["room"])) * settings.interval_s).astype(np.float64)
+        i = np.clip(np.searchsorted(history.t, ticks, side="right") - 1, 0, len(history) - 1)
+        logged = history.room[i]
+        ok = np.isfinite(logged)
+        rmse = float(np.sqrt(np.mean((result.trace["room"][:, 0][ok] - logged[ok]) ** 2)))
+        print(f"\nclosed loop room against the log: RMSE {rmse:.2f} C")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit a thermal house model and simulate optimizer policies on it")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fit_parser = commands.add_parser("fit", help="fit the model to a log")
+    fit_parser.add_argument("log", nargs="?", default=replay.LOG_FILE, help="mqtt_logger CSV (ecodan_log.csv)")
+    fit_parser.add_argument("--step", type=float, default=10.0, help="bin length in minutes")
+    fit_parser.add_argument("--holdout", type=float, default=0.25, help="fraction at the end kept out of the fit")
+    fit_parser.add_argument("--out", help="write the model as JSON")
+    fit_parser.set_defaults(func=cmd_fit)
+
+    sim_parser = commands.add_parser("simulate", help="run delta T policies closed loop on a fitted model")
+    sim_parser.add_argument("model", help="JSON written by fit --out")
+    sim_parser.add_argument("log", nargs="?", default=replay.LOG_FILE, help="log the outside temperatures come from")
+    sim_parser.add_argument("--days", type=float, default=150.0, help="repeat the log's weather to this many days")
+    sim_parser.add_argument("--step", type=float, default=120.0, help="simulation step in seconds")
+    sim_parser.add_argument("--heating-type", type=int, default=0)
+    sim_parser.add_argument("--min-flow", type=float, default=25.0)
+    sim_parser.add_argument("--max-flow", type=float, default=35.0)
+    sim_parser.add_argument("--target", type=float, help="room target; the median recovered target when not given")
+    sim_parser.add_argument("--bias", type=float, default=0.0)
+    sim_parser.add_argument("--base", help="also simulate these base_min_delta_t values, start:stop:step")
+    sim_parser.add_argument("--cold-limit", help="min_delta_cold_limit values")
+    sim_parser.add_argument("--max-delta", help="max_delta_t values")
+    sim_parser.add_argument("--error-range", help="max_error_range values")
+    sim_parser.add_argument("--logged", action="store_true",
+                            help="drive the model with the logged setpoints over the log instead, to check it")
+    sim_parser.set_defaults(func=cmd_simulate)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+# ABOUTME: Online recursive least squares heat loss and COP estimator over hourly buckets, the reference for logger and device.
+# ABOUTME: Run with: python scripts/learning_estimator.py /opt/ecodan/data/ecodan_log.csv [--forgetting 0.998] [--out rls.csv]
+
+import argparse
+import csv
+import math
+import time
+from datetime import datetime
+from typing import NamedTuple
+
+HOUR_S = 3600
+MAX_ROW_GAP_S = 300       # longer gaps in the log are not integrated over
+INDOOR_DEFAULT = 20.0     # update_learning_model's fixed indoor temperature, used without a room temperature
+WATER_KW_PER_LMIN_K = 4.186 / 60.0
+MIN_HEATING_MINUTES = 30  # COP only learns from hours the compressor heated this long
+MIN_ELEC_KWH = 0.2        # and used this much, the energy counters step in 0.01 kWh or coarser
+BASE_OUTSIDE = 7.0        # conditions the base COP is quoted at, as learned_base_cop_global
+BASE_FLOW = 35.0
+DEFAULT_FORGETTING = 0.998  # per hourly update, a memory of about 500 hours (three weeks)
+MAX_TRACE = 1e4           # P stops growing here in unexciting weather (windup guard)
+FILTER_HOURS = 24.0       # low pass on every term of the heat balance, a day: well past the emitter's and building's storage
+
+
+class Rls:
+    """Recursive least squares with exponential forgetting, on plain numbers so it ports to the device as is.
+
+    Minimises sum(forgetting ** (k - i) * weight_i * (y_i - theta . x_i) ** 2). An update is
+    O(n^2) in the number of regressors, which is fixed (3 here), so O(1) per bucket and O(n^2)
+    memory. number is the scalar type: float, or numpy.float32 to check single precision.
+    """
+
+    def __init__(self, n, forgetting=DEFAULT_FORGETTING, prior=1e3, number=float):
+        self.n = n
+        self.forgetting = number(forgetting)
+        self.number = number
+        self.theta = [number(0.0)] * n
+        self.p = [[number(prior if i == j else 0.0) for j in range(n)] for i in range(n)]
+        self.updates = 0
+
+    def predict(self, x):
+        return sum(t * v for t, v in zip(self.theta, x))
+
+    def update(self, x, y, weight=1.0):
+        """Fold in one observation; returns the a priori error."""
+        num = self.number
+        x = [num(v) for v in x]
+        n, p = self.n, self.p
+        px = [sum(p[i][j] * x[j] for j in range(n)) for i in range(n)]
+        denominator = self.forgetting / num(weight) + sum(x[i] * px[i] for i in range(n))
+        gain = [v / denominator for v in px]
+        error = num(y) - self.predict(x)
+        self.theta = [t + g * error for t, g in zip(self.theta, gain)]
+
+        # P = (P - gain px^T) / forgetting, kept symmetric; no forgetting once P is large
+        trace = sum(p[i][i] for i in range(n))
+        scale = 1.0 / self.forgetting if trace < MAX_TRACE else num(1.0)
+        for i in range(n):
+            for j in range(i, n):
+                value = (p[i][j] - gain[i] * px[j]) * scale
+                p[i][j] = value
+                p[j][i] = value
+        self.updates += 1
+        return error
+
+
+class Bucket(NamedTuple):
+    """One hour of the log folded into totals and means."""
+    start: datetime
+    minutes: float
+    heat_kwh: float          # into heating (not DHW)
+    elec_kwh: float          # for heating, NaN without the consumed counter
+    inside: float
+    outside: float
+    flow: float              # mean feed temperature while heating
+    heating_minutes: float   # compressor on, no DHW, no defrost
+
+
+class HourlyBuckets:
+    """Folds logger rows into hourly buckets, O(1) time and memory per row.
+
+    Heat and electricity come from the heating_delivered / heating_consumed counter steps
+    (a step down is the midnight reset, the new value is then the step). Without counters the
+    heat is flow rate times feed - return. Each row covers the time to the next one.
+    """
+
+    def __init__(self):
+        self.hour = None
+        self.last = None  # (time, row) of the previous row
+        self.counters = {}
+        self.reset()
+
+    def reset(self):
+        self.minutes = self.heat = self.elec = self.heating_minutes = 0.0
+        self.inside_sum = self.inside_minutes = 0.0
+        self.outside_sum = self.outside_minutes = 0.0
+        self.flow_sum = 0.0
+        self.has_counter_heat = self.has_counter_elec = False
+
+    def counter_step(self, name, value):
+        if value is None:
+            return None
+        previous = self.counters.get(name)
+        self.counters[name] = value
+        if previous is None:
+            return None
+        return value - previous if value >= previous else value
+
+    def add(self, when, row):
+        """Add one row (a dict of floats or None); returns the Bucket closed by it, if any."""
+        closed = None
+        if self.last is not None:
+            closed = self.integrate(when)
+        self.last = (when, row)
+        return closed
+
+    def integrate(self, when):
+        """Credit the previous row with the time until this one."""
+        then, row = self.last
+        hour = then.replace(minute=0, second=0, microsecond=0)
+        closed = None
+        if self.hour is not None and hour != self.hour:
+            closed = self.close()
+        self.hour = hour
+
+        gap = (when - then).total_seconds()
+        minutes = min(max(gap, 0.0), MAX_ROW_GAP_S) / 60.0
+        self.minutes += minutes
+        dhw = bool(row.get("3way_valve_dhw"))
+        heating = bool(row.get("compressor_on")) and not dhw and not row.get("defrost")
+        if heating:
+            self.heating_minutes += minutes
+            if row.get("feed_temp") is not None:
+                self.flow_sum += row["feed_temp"] * minutes
+        inside = row.get("room_temp")
+        if inside is not None:
+            self.inside_sum += inside * minutes
+            self.inside_minutes += minutes
+        if row.get("outside_temp") is not None:
+            self.outside_sum += row["outside_temp"] * minutes
+            self.outside_minutes += minutes
+
+        heat = self.counter_step("heating_delivered_kwh", row.get("heating_delivered_kwh"))
+        elec = self.counter_step("heating_consumed_kwh", row.get("heating_consumed_kwh"))
+        if heat is not None:
+            self.heat += heat
+            self.has_counter_heat = True
+        elif not self.has_counter_heat and not dhw:
+            flow, feed, ret = row.get("flow_rate_lmin"), row.get("feed_temp"), row.get("return_temp")
+            if None not in (flow, feed, ret):
+                self.heat += flow * WATER_KW_PER_LMIN_K * (feed - ret) * minutes / 60.0
+        if elec is not None:
+            self.elec += elec
+            self.has_counter_elec = True
+        return closed
+
+    def close(self):
+        bucket = Bucket(
+            start=self.hour, minutes=self.minutes, heat_kwh=self.heat,
+            elec_kwh=self.elec if self.has_counter_elec else math.nan,
+            inside=self.inside_sum / self.inside_minutes if self.inside_minutes else INDOOR_DEFAULT,
+            outside=self.outside_sum / self.outside_minutes if self.outside_minutes else math.nan,
+            flow=self.flow_sum / self.heating_minutes if self.heating_minutes else math.nan,
+            heating_minutes=self.heating_minutes)
+        self.reset()
+        return bucket
+
+    def flush(self):
+        """The partly filled current bucket, at the end of a log."""
+        if self.last is not None:
+            self.integrate(self.last[0])
+        return self.close() if self.minutes else None
+
+
+def cop_sample(bucket):
+    """(x, y, weight) of COP = b0 + b1 outside + b2 flow, weighted by the electricity, or None."""
+    if (bucket.heating_minutes < MIN_HEATING_MINUTES or math.isnan(bucket.elec_kwh) or bucket.elec_kwh < MIN_ELEC_KWH
+            or math.isnan(bucket.outside) or math.isnan(bucket.flow)):
+        return None
+    cop = bucket.heat_kwh / bucket.elec_kwh
+    if not 0.5 < cop < 10.0:
+        return None
+    return (1.0, bucket.outside, bucket.flow), cop, bucket.elec_kwh
+
+
+class HeatBalance:
+    """The hourly heat balance, heat kW = ua * (inside - outside) - gains + storage * d(inside)/dt, low passed.
+
+    An hour's heat says little about that hour's losses: the emitter and the building store and
+    release it, and the controller answers setbacks. The same first order low pass applied to
+    every term keeps the balance linear and averages that out; the inside temperature change
+    takes up what the building mass stores. O(1) per bucket.
+    """
+
+    def __init__(self, filter_hours=FILTER_HOURS):
+        self.keep = math.exp(-1.0 / filter_hours)
+        self.filtered = None
+        self.inside = None
+
+    def sample(self, bucket):
+        """(x, y, weight) for Rls, or None when the bucket is incomplete."""
+        if bucket.minutes < 45 or math.isnan(bucket.outside):
+            self.filtered = self.inside = None
+            return None
+        hours = bucket.minutes / 60.0
+        rise = bucket.inside - self.inside if self.inside is not None else 0.0
+        self.inside = bucket.inside
+        raw = (bucket.inside - bucket.outside, rise, bucket.heat_kwh / hours)
+        if self.filtered is None:
+            self.filtered = raw
+        else:
+            self.filtered = tuple(self.keep * f + (1.0 - self.keep) * r for f, r in zip(self.filtered, raw))
+        difference, rise, heat = self.filtered
+        return (difference, 1.0, rise), heat, 1.0
+
+
+class LearningEstimator:
+    """Heat loss and COP learned online from hourly buckets, in place of update_learning_model's daily EMA.
+
+    Heat loss: see HeatBalance, ua is the kW/K number and gains what the house gets for free.
+    COP: b0 + b1 * outside + b2 * flow, the base COP is its value at BASE_OUTSIDE and BASE_FLOW.
+    """
+
+    def __init__(self, forgetting=DEFAULT_FORGETTING, number=float, filter_hours=FILTER_HOURS):
+        self.balance = HeatBalance(filter_hours)
+        self.heat = Rls(3, forgetting, number=number)
+        self.cop = Rls(3, forgetting, number=number)
+        self.samples = (None, None)
+
+    def update(self, bucket):
+        """Returns which models took the bucket: (heat loss, cop)."""
+        heat = self.balance.sample(bucket)
+        if heat is not None:
+            self.heat.update(*heat)
+        cop = cop_sample(bucket)
+        if cop is not None:
+            self.cop.update(*cop)
+        self.samples = (heat, cop)
+        return heat is not None, cop is not None
+
+    @property
+    def heat_loss(self):
+        return float(self.heat.theta[0])
+
+    @property
+    def gains(self):
+        return -float(self.heat.theta[1])
+
+    @property
+    def storage(self):
+        """kWh/K the building stores per degree of inside temperature."""
+        return float(self.heat.theta[2])
+
+    @property
+    def base_cop(self):
+        if not self.cop.updates:
+            return math.nan
+        return float(self.cop.predict((1.0, BASE_OUTSIDE, BASE_FLOW)))
+
+
+class DailyEma:
+    """Optimizer::update_learning_model on daily totals, for comparison."""
+
+    ALPHA = 0.05
+
+    def __init__(self):
+        self.heat_loss = 0.0
+        self.base_cop = 0.0
+
+    def update(self, heat_kwh, elec_kwh, avg_temp, runtime_hours):
+        if heat_kwh < 5.0 or runtime_hours < 2.0:
+            return False
+        delta_t = 20.0 - avg_temp
+        if delta_t < 5.0:
+            return False
+        observed_heat_loss = (heat_kwh / 24.0) / delta_t
+        cop = heat_kwh / elec_kwh if elec_kwh > 0 else math.inf
+        if math.isinf(cop) or cop > 10.0:
+            cop = 0.0
+        observed_base_cop = cop + (7.0 - avg_temp) * 0.1
+        for name, observed in (("heat_loss", observed_heat_loss), ("base_cop", observed_base_cop)):
+            current = getattr(self, name)
+            setattr(self, name, observed if current <= 0.01 else self.ALPHA * observed + (1 - self.ALPHA) * current)
+        return True
+
+
+# --- checking against batch regression ---------------------------------------
+
+def read_rows(path):
+    """Logger CSV rows as (datetime, dict of float or None), streamed as the logger would see them."""
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                when = datetime.strptime(row.pop("timestamp"), "%Y-%m-%d %H:%M:%S")
+            except (KeyError, ValueError):
+                continue
+            values = {}
+            for key, raw in row.items():
+                if raw in ("", None):
+                    values[key] = None
+                elif raw in ("True", "False"):
+                    values[key] = 1.0 if raw == "True" else 0.0
+                else:
+                    try:
+                        values[key] = float(raw)
+                    except ValueError:
+                        values[key] = None
+            yield when, values
+
+
+def batch_solution(samples, forgetting, stop=None):
+    """Weighted least squares over samples[:stop] with the same forgetting, what RLS should track."""
+    import numpy as np
+
+    samples = samples[:stop]
+    x = np.array([s[0] for s in samples], dtype=np.float64)
+    y = np.array([s[1] for s in samples], dtype=np.float64)
+    w = np.array([s[2] for s in samples], dtype=np.float64) * forgetting ** np.arange(len(samples) - 1, -1, -1.0)
+    sw = np.sqrt(w)
+    theta, *_ = np.linalg.lstsq(x * sw[:, None], y * sw, rcond=None)
+    return theta
+
+
+def convergence(track, final, tolerance):
+    """Samples until the running estimate stays within tolerance of final, None if it never settles."""
+    outside = [i for i, value in enumerate(track) if abs(value - final) > tolerance]
+    if not outside:
+        return 0
+    return outside[-1] + 1 if outside[-1] + 1 < len(track) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Online RLS heat loss and COP learning, checked against batch regression")
+    parser.add_argument("log", nargs="?", default="/opt/ecodan/data/ecodan_log.csv", help="mqtt_logger CSV")
+    parser.add_argument("--forgetting", type=float, default=DEFAULT_FORGETTING, help="per hourly bucket")
+    parser.add_argument("--float32", action="store_true", help="run the estimator in single precision, as on the device")
+    parser.add_argument("--out", help="write the estimates after every bucket as CSV")
+    args = parser.parse_args()
+
+    number = float
+    if args.float32:
+        import numpy as np
+        number = np.float32
+
+    buckets = HourlyBuckets()
+    estimator = LearningEstimator(args.forgetting, number)
+    ema = DailyEma()
+    day, day_totals = None, [0.0, 0.0, 0.0, 0.0, 0]  # heat, elec, outside sum, heating minutes, buckets
+    heat_samples, cop_samples, trace = [], [], []
+    update_s = 0.0
+    rows = 0
+
+    def take(bucket):
+        nonlocal day, day_totals, update_s
+        if day is not None and bucket.start.date() != day and day_totals[4]:
+            heat, elec, outside_sum, minutes, count = day_totals
+            ema.update(heat, elec, outside_sum / count, minutes / 60.0)
+            day_totals = [0.0, 0.0, 0.0, 0.0, 0]
+        day = bucket.start.date()
+        if not math.isnan(bucket.outside):
+            day_totals[0] += bucket.heat_kwh
+            day_totals[1] += 0.0 if math.isnan(bucket.elec_kwh) else bucket.elec_kwh
+            day_totals[2] += bucket.outside
+            day_totals[3] += bucket.heating_minutes
+            day_totals[4] += 1
+
+        start = time.perf_counter()
+        took_heat, took_cop = estimator.update(bucket)
+        update_s += time.perf_counter() - start
+        if took_heat:
+            heat_samples.append(estimator.samples[0])
+        if took_cop:
+            cop_samples.append(estimator.samples[1])
+        trace.append((bucket, took_heat, took_cop, estimator.heat_loss, estimator.gains,
+                      estimator.base_cop, ema.heat_loss, ema.base_cop))
+
+    for when, row in read_rows(args.log):
+        rows += 1
+        bucket = buckets.add(when, row)
+        if bucket is not None:
+            take(bucket)
+    last = buckets.flush()
+    if last is not None:
+        take(last)
+    if not trace:
+        raise SystemExit("The log has no complete hour.")
+
+    print(f"{rows} rows, {len(trace)} hourly buckets: {len(heat_samples)} heat loss and {len(cop_samples)} COP updates, "
+          f"{update_s / len(trace) * 1e6:.0f} us per bucket ({'float32' if args.float32 else 'float64'}, "
+          f"forgetting {args.forgetting:g} per hour)\n")
+
+    print(f"{'':<34}{'UA kW/K':>9}{'gains kW':>10}{'base COP':>10}")
+    print(f"{'online RLS':<34}{estimator.heat_loss:>9.3f}{estimator.gains:>10.2f}{estimator.base_cop:>10.2f}")
+    if heat_samples:
+        theta = batch_solution(heat_samples, args.forgetting)
+        cop_theta = batch_solution(cop_samples, args.forgetting) if len(cop_samples) >= 3 else None
+        base = cop_theta @ [1.0, BASE_OUTSIDE, BASE_FLOW] if cop_theta is not None else math.nan
+        print(f"{'batch, same forgetting':<34}{theta[0]:>9.3f}{-theta[1]:>10.2f}{base:>10.2f}")
+        full = batch_solution(heat_samples, 1.0)
+        full_cop = batch_solution(cop_samples, 1.0) if len(cop_samples) >= 3 else None
+        base = full_cop @ [1.0, BASE_OUTSIDE, BASE_FLOW] if full_cop is not None else math.nan
+        print(f"{'batch, whole log':<34}{full[0]:>9.3f}{-full[1]:>10.2f}{base:>10.2f}")
+    print(f"{'update_learning_model daily EMA':<34}{ema.heat_loss:>9.3f}{'':>10}{ema.base_cop:>10.2f}")
+
+    # running agreement: the batch solution over the samples seen so far, once a day
+    if len(heat_samples) > 48:
+        worst = 0.0
+        seen = 0
+        for bucket, took_heat, _, ua, *_ in trace:
+            seen += took_heat
+            if took_heat and seen >= 48 and seen % 24 == 0:
+                worst = max(worst, abs(ua - batch_solution(heat_samples, args.forgetting, seen)[0]))
+        ua_track = [t[3] for t in trace if t[1]]
+        settle = convergence(ua_track, estimator.heat_loss, 0.05 * abs(estimator.heat_loss))
+        print(f"\nUA: largest daily difference to the running batch solution {worst:.4f} kW/K; "
+              f"within 5% of its final value after {settle if settle is not None else 'never'} hourly updates")
+    if cop_samples:
+        cop_track = [t[5] for t in trace if t[2]]
+        settle = convergence(cop_track, estimator.base_cop, 0.1)
+        print(f"base COP: within 0.1 of its final value after {settle if settle is not None else 'never'} hourly updates")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["hour", "heat_kwh", "elec_kwh", "inside", "outside", "flow", "heating_minutes",
+                             "rls_heat_loss", "rls_gains", "rls_base_cop", "ema_heat_loss", "ema_base_cop"])
+            for bucket, _, _, ua, gains, cop, ema_ua, ema_cop in trace:
+                writer.writerow([f"{bucket.start:%Y-%m-%d %H:%M}", f"{bucket.heat_kwh:.3f}", f"{bucket.elec_kwh:.3f}",
+                                 f"{bucket.inside:.2f}", f"{bucket.outside:.2f}", f"{bucket.flow:.2f}",
+                                 f"{bucket.heating_minutes:.0f}", f"{ua:.4f}", f"{gains:.3f}", f"{cop:.3f}",
+                                 f"{ema_ua:.4f}", f"{ema_cop:.3f}"])
+        print(f"{args.out}: {len(trace)} hourly buckets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+# ABOUTME: Load-shifting simulator: moves DHW runs and pre-heating into cheaper tariff hours over the logged demand.
+# ABOUTME: Run with: python scripts/load_shift.py /opt/ecodan/data/ecodan_log.csv [--schedule tariff.json] [--price NT=0.08 ...] [--model house.json]
+
+import argparse
+import csv
+import itertools
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+import house_model
+import optimizer_replay as replay
+from optimizer_sweep import carnot
+from tariff import load_tariff
+from tariff_cop import counter_steps
+
+MAX_ROW_GAP_S = 300          # longer logging gaps count for this long
+MIN_DAY_HOURS = 20.0         # days the log covers less are left out
+DEFAULT_TIME_CONSTANT_H = 40.0  # building capacity over UA when no house model is given
+FLOW_PER_BIAS = 2.0          # C of flow temperature per C of setpoint bias (the optimizer's delta T answer)
+COAST_RATE_HOURS = 3         # hours after a window whose mean demand sets how fast the stored heat goes
+MAX_COAST_H = 24.0
+
+PREHEAT_LENGTHS = (1, 2, 3, 4)
+PREHEAT_BIASES = (0.5, 1.0, 1.5, 2.0)
+
+
+class Days(NamedTuple):
+    """The log as complete days of hours: (days, 24) arrays."""
+    start: np.datetime64       # midnight of the first day
+    heat: np.ndarray           # kWh delivered to heating
+    heat_elec: np.ndarray
+    dhw: np.ndarray            # kWh delivered to the tank
+    dhw_elec: np.ndarray
+    dhw_minutes: np.ndarray    # minutes the 3-way valve was on DHW
+    outside: np.ndarray
+    heat_flow: np.ndarray      # mean feed while heating, NaN when it did not
+    dhw_flow: np.ndarray
+    price: np.ndarray          # at the middle of the hour
+
+
+def hourly(history, tariff):
+    """Fold the log into hours with bincount and keep the days it covers."""
+    for name in ("heating_delivered", "heating_consumed", "dhw_delivered", "dhw_consumed"):
+        if np.isnan(getattr(history, name)).all():
+            raise SystemExit(f"The log has no {replay.History.COLUMNS[name]} counter.")
+    start = history.timestamps[0].astype("datetime64[D]")
+    hour = ((history.timestamps - start) // np.timedelta64(3600, "s")).astype(np.int64)
+    n = (int(hour[-1]) // 24 + 1) * 24
+    weight = np.minimum(np.diff(history.t, append=history.t[-1]), MAX_ROW_GAP_S) / 60.0  # minutes
+
+    def total(values):
+        return np.bincount(hour, values, minlength=n)
+
+    def mean(values, rows):
+        ok = rows & np.isfinite(values)
+        minutes = total(weight * ok)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.bincount(hour[ok], values[ok] * weight[ok], minlength=n) / minutes
+
+    heating = history.compressor & ~history.dhw & ~history.defrost
+    outside = replay.forward_fill(history.outside)
+    columns = {
+        "heat": total(counter_steps(history.timestamps, history.heating_delivered)),
+        "heat_elec": total(counter_steps(history.timestamps, history.heating_consumed)),
+        "dhw": total(counter_steps(history.timestamps, history.dhw_delivered)),
+        "dhw_elec": total(counter_steps(history.timestamps, history.dhw_consumed)),
+        "dhw_minutes": total(weight * history.dhw),
+        "outside": replay.forward_fill(mean(outside, np.ones(len(history), dtype=bool))),
+        "heat_flow": mean(history.feed, heating),
+        "dhw_flow": mean(history.feed, history.dhw),
+    }
+    covered = total(weight).reshape(-1, 24).sum(axis=1) / 60.0 >= MIN_DAY_HOURS
+    if not covered.any():
+        raise SystemExit(f"No day in the log has {MIN_DAY_HOURS:g} h of rows.")
+    middle = start + (np.arange(n) * 3600 + 1800).astype("timedelta64[s]")
+    columns["price"] = tariff.prices(middle)
+    days = {name: values.reshape(-1, 24)[covered] for name, values in columns.items()}
+    return Days(start, **days)
+
+
+class CopModel(NamedTuple):
+    """COP = efficiency * carnot(flow, outside): heating flow linear in the outside temperature, DHW flow fixed."""
+    heat_efficiency: float
+    heat_flow_intercept: float
+    heat_flow_slope: float
+    dhw_efficiency: float
+    dhw_flow: float
+
+    def heat_cop(self, outside, bias=0.0):
+        flow = self.heat_flow_intercept + self.heat_flow_slope * outside + FLOW_PER_BIAS * bias
+        return self.heat_efficiency * carnot(flow, outside)
+
+    def dhw_cop(self, outside):
+        return self.dhw_efficiency * carnot(self.dhw_flow, outside)
+
+
+def fit_cop(days):
+    """Carnot efficiencies that reproduce the logged electricity, and the logged flow temperatures."""
+    heating = (days.heat > 0.05) & np.isfinite(days.heat_flow)
+    if heating.sum() < 10:
+        raise SystemExit("Too few heating hours with a delivered heat and a flow temperature to fit a COP curve.")
+    q, outside, flow = days.heat[heating], days.outside[heating], days.heat_flow[heating]
+    design = np.column_stack([np.ones(len(q)), outside]) * np.sqrt(q)[:, None]
+    (intercept, slope), *_ = np.linalg.lstsq(design, flow * np.sqrt(q), rcond=None)
+    fitted = intercept + slope * outside
+    heat_efficiency = np.sum(q / carnot(fitted, outside)) / max(np.sum(days.heat_elec[heating]), 1e-9)
+
+    dhw = (days.dhw > 0.05) & np.isfinite(days.dhw_flow)
+    if dhw.any():
+        dhw_flow = float(np.average(days.dhw_flow[dhw], weights=days.dhw[dhw]))
+        dhw_efficiency = np.sum(days.dhw[dhw] / carnot(dhw_flow, days.outside[dhw])) / \
+            max(np.sum(days.dhw_elec[dhw]), 1e-9)
+    else:
+        dhw_flow, dhw_efficiency = 50.0, heat_efficiency
+    return CopModel(float(heat_efficiency), float(intercept), float(slope), float(dhw_efficiency), dhw_flow)
+
+
+# --- DHW start times ---------------------------------------------------------------
+
+def dhw_options(max_starts=2):
+    """Every set of one to max_starts daily start hours."""
+    return [starts for k in range(1, max_starts + 1) for starts in itertools.combinations(range(24), k)]
+
+
+def dhw_costs(days, cop, options):
+    """(options, days) electricity and cost with each day's DHW heat made at the option's hours, evenly split.
+
+    The tank is assumed to carry the day's hot water between reheats; standing losses do not
+    change with the timing here. The last row is the logged timing (by valve minutes per hour).
+    """
+    share = np.zeros((len(options) + 1, 24))
+    for i, starts in enumerate(options):
+        share[i, list(starts)] = 1.0 / len(starts)
+    elec_per_kwh = 1.0 / cop.dhw_cop(days.outside)              # (days, 24)
+    total = days.dhw.sum(axis=1)
+    logged = days.dhw_minutes / np.maximum(days.dhw_minutes.sum(axis=1, keepdims=True), 1e-9)
+    elec = share[:-1] @ elec_per_kwh.T * total
+    cost = share[:-1] @ (elec_per_kwh * days.price).T * total
+    base_elec = np.sum(logged * elec_per_kwh, axis=1) * total
+    base_cost = np.sum(logged * elec_per_kwh * days.price, axis=1) * total
+    return np.vstack([elec, base_elec]), np.vstack([cost, base_cost])
+
+
+# --- pre-heat bias windows ---------------------------------------------------------
+
+def preheat_delta(days, cop, capacity, ua, length, bias):
+    """(24 window starts, days) change in electricity and cost for a bias window of length hours.
+
+    As the morning-start bias automation does, the room target is raised by bias for the
+    window: the unit makes capacity * bias kWh to warm the building plus the extra loss of
+    the ramp, at a flow raised by FLOW_PER_BIAS * bias. Afterwards the building coasts and
+    gives back the stored heat less the extra loss while it is warmer, taking it off the
+    demand of the hours that follow in order. Days are evaluated side by side; a window or
+    its coast may run into the next day.
+    """
+    n = len(days.heat)
+    nxt = np.vstack([days.heat[1:], np.zeros((1, 24))])
+    heat = np.concatenate([days.heat, nxt], axis=1)                              # (days, 48)
+    outside = np.concatenate([days.outside, np.vstack([days.outside[1:], days.outside[-1:]])], axis=1)
+    price = np.concatenate([days.price, np.vstack([days.price[1:], days.price[-1:]])], axis=1)
+    per_kwh = 1.0 / cop.heat_cop(outside)
+    per_kwh_bias = 1.0 / cop.heat_cop(outside, bias)
+
+    hours = np.arange(48)
+    starts = np.arange(24)[:, None]
+    window = (hours >= starts) & (hours < starts + length)                       # (24, 48)
+    after = hours >= starts + length
+
+    stored = capacity * bias
+    made = (stored + ua * bias * length / 2.0) / length                          # kWh per window hour
+    # demand right after the window sets how long the coast lasts
+    first_after = (hours >= starts + length) & (hours < starts + length + COAST_RATE_HOURS)
+    rate = np.maximum((first_after[:, None, :] * heat[None]).sum(axis=2) / COAST_RATE_HOURS, 0.05)  # (24, days)
+    coast_h = np.minimum(stored / rate, MAX_COAST_H)
+    given_back = np.maximum(stored - ua * bias * coast_h / 2.0, 0.0)
+
+    later = after[:, None, :] * heat[None]                                       # (24, days, 48)
+    before = np.cumsum(later, axis=2) - later
+    taken = np.clip(given_back[:, :, None] - before, 0.0, later)
+
+    in_window = window[:, None, :]
+    extra = in_window * (made * per_kwh_bias + heat * (per_kwh_bias - per_kwh))[None]
+    saved = taken * per_kwh[None]
+    elec = (extra - saved).sum(axis=2)
+    cost = ((extra - saved) * price[None]).sum(axis=2)
+    return elec, cost
+
+
+def preheat_grid(days, cop, capacity, ua):
+    """Every start, length and bias: (start, length, bias) rows with their summed changes."""
+    rows, elec, cost = [], [], []
+    for length in PREHEAT_LENGTHS:
+        for bias in PREHEAT_BIASES:
+            e, c = preheat_delta(days, cop, capacity, ua, length, bias)
+            rows.extend((start, length, bias) for start in range(24))
+            elec.append(e.sum(axis=1))
+            cost.append(c.sum(axis=1))
+    return rows, np.concatenate(elec), np.concatenate(cost)
+
+
+def building(history, model_path):
+    """(capacity kWh/K, UA kW/K) from a house_model fit, or the energy balance and DEFAULT_TIME_CONSTANT_H."""
+    if model_path:
+        model, _ = house_model.load_model(model_path)
+        return model.cb, model.ua
+    ua = house_model.energy_balance_ua(history)
+    if not math.isfinite(ua):
+        raise SystemExit("No UA from the log (room or heat missing), pass --model from house_model.py fit.")
+    return ua * DEFAULT_TIME_CONSTANT_H, ua
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate moving DHW and pre-heating into cheaper tariff hours")
+    parser.add_argument("log", nargs="?", default=replay.LOG_FILE, help="mqtt_logger CSV (ecodan_log.csv)")
+    parser.add_argument("--schedule", help="tariff schedule JSON (the built-in HR NT/VT schedule without)")
+    parser.add_argument("--spot", help="spot price CSV (timestamp,price)")
+    parser.add_argument("--price", action="append", default=[], metavar="TIER=PRICE",
+                        help="price per kWh of a tier, for schedules without prices")
+    parser.add_argument("--model", help="house model JSON from house_model.py fit (building capacity and UA)")
+    parser.add_argument("--dhw-starts", type=int, default=2, help="most DHW runs per day to try")
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--out", help="write every schedule with its yearly saving and COP as CSV")
+    args = parser.parse_args()
+
+    tariff = load_tariff(args.schedule, args.spot)
+    for item in args.price:
+        tier, _, value = item.partition("=")
+        if tier not in tariff.tier_info:
+            raise SystemExit(f"--price {item}: {tier} is not one of {tariff.tiers}")
+        tariff.tier_info[tier]["price"] = float(value)
+
+    history = replay.load_history(args.log)
+    if not len(history):
+        raise SystemExit("The log has no rows.")
+    started = time.perf_counter()
+    days = hourly(history, tariff)
+    if np.isnan(days.price).all():
+        raise SystemExit(f"{tariff.name} has no prices, give them with --price TIER=PRICE.")
+    cop = fit_cop(days)
+    capacity, ua = building(history, args.model)
+    scale = 365.0 / len(days.heat)
+
+    heat_model = np.sum(days.heat / cop.heat_cop(days.outside))
+    print(f"{len(days.heat)} complete days; heating COP {cop.heat_efficiency:.2f} x Carnot at flow "
+          f"{cop.heat_flow_intercept:.1f} {cop.heat_flow_slope:+.2f} x outside, DHW {cop.dhw_efficiency:.2f} x Carnot "
+          f"at {cop.dhw_flow:.1f} C; building {capacity:.1f} kWh/K, UA {ua:.3f} kW/K")
+    print(f"heating electricity: logged {days.heat_elec.sum():.1f} kWh, model {heat_model:.1f} kWh; "
+          f"logged cost {np.nansum((days.heat_elec + days.dhw_elec) * days.price):.2f}\n")
+
+    options = dhw_options(args.dhw_starts)
+    elec, cost = dhw_costs(days, cop, options)
+    totals_elec, totals_cost = np.nansum(elec, axis=1), np.nansum(cost, axis=1)
+    base_elec, base_cost = totals_elec[-1], totals_cost[-1]
+    dhw_heat = days.dhw.sum()
+    print(f"DHW, {dhw_heat:.0f} kWh: logged timing {base_cost:.2f} ({base_cost * scale:.2f} per year), "
+          f"COP {dhw_heat / max(base_elec, 1e-9):.2f}")
+    print(f"  {'starts':<14}{'cost':>9}{'saving/yr':>11}{'COP':>7}")
+    for i in np.argsort(totals_cost[:-1])[:args.top]:
+        hours = " ".join(f"{h:02d}:00" for h in options[i])
+        print(f"  {hours:<14}{totals_cost[i]:>9.2f}{(base_cost - totals_cost[i]) * scale:>11.2f}"
+              f"{dhw_heat / max(totals_elec[i], 1e-9):>7.2f}")
+
+    rows, delta_elec, delta_cost = preheat_grid(days, cop, capacity, ua)
+    heat_cost = np.nansum(days.heat / cop.heat_cop(days.outside) * days.price)
+    heat_total = days.heat.sum()
+    print(f"\npre-heat bias windows, heating {heat_total:.0f} kWh at {heat_cost:.2f} ({heat_cost * scale:.2f} per year), "
+          f"COP {heat_total / heat_model:.2f}")
+    print(f"  {'window':<14}{'bias':>6}{'saving/yr':>11}{'COP':>7}")
+    for i in np.argsort(delta_cost)[:args.top]:
+        start, length, bias = rows[i]
+        window = f"{start:02d}:00-{(start + length) % 24:02d}:00"
+        print(f"  {window:<14}{bias:>6.1f}{-delta_cost[i] * scale:>11.2f}"
+              f"{heat_total / (heat_model + delta_elec[i]):>7.2f}")
+
+    best_dhw = base_cost - totals_cost[:-1].min()
+    best_preheat = max(-delta_cost.min(), 0.0)
+    print(f"\nbest combined saving {(best_dhw + best_preheat) * scale:.2f} per year "
+          f"({time.perf_counter() - started:.2f} s for {len(options)} DHW and {len(rows)} pre-heat schedules)")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kind", "schedule", "bias", "saving_per_year", "cop"])
+            for starts, c, e in zip(options, totals_cost, totals_elec):
+                writer.writerow(["dhw", " ".join(f"{h:02d}:00" for h in starts), "",
+                                 f"{(base_cost - c) * scale:.2f}", f"{dhw_heat / max(e, 1e-9):.2f}"])
+            for (start, length, bias), c, e in zip(rows, delta_cost, delta_elec):
+                writer.writerow(["preheat", f"{start:02d}:00-{(start + length) % 24:02d}:00", bias,
+                                 f"{-c * scale:.2f}", f"{heat_total / (heat_model + e):.2f}"])
+        print(f"{args.out}: {len(options) + len(rows)} schedules")
+
+
+if __name__ == "__main__":
+    main()
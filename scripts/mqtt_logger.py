@@ -7,15 +7,22 @@ import os
 import threading
 import time
 import urllib.request
-from datetime import datetime, date, timedelta
+from datetime import datetime, timedelta
 
 import paho.mqtt.client as mqtt
 
+from tariff import load_tariff
+
 MQTT_BROKER = "127.0.0.1"
 MQTT_PORT = 1883
 MQTT_USER = "ecodan"
 MQTT_PASS_FILE = "/etc/mosquitto/ecodan_password.txt"
 TOPIC_PREFIX = "ecodan-heatpump"
+# all changed ecodan values of one poll round as one JSON object (ecodan: mqtt_batch_topic)
+BATCH_TOPIC = f"{TOPIC_PREFIX}/ecodan/state"
+# Per-entity topics of batched ids count again when no batch arrived for this long (batching
+# stopped or the device was reflashed without it); several status rounds, the slowest poll is 60 s
+BATCH_TIMEOUT = 120  # seconds
 
 HA_URL = "http://127.0.0.1:8123"
 HA_TOKEN_FILE = "/opt/ecodan/ha-token.txt"
@@ -24,6 +31,7 @@ LOG_DIR = "/opt/ecodan/data"
 LOG_FILE = os.path.join(LOG_DIR, "ecodan_log.csv")
 TRANSITION_FILE = os.path.join(LOG_DIR, "ecodan_transitions.csv")
 COP_STATE_FILE = os.path.join(LOG_DIR, "period_cop_state.json")
+TARIFF_FILE = "/opt/ecodan/tariff.json"  # schedule definition, see tariff.Tariff; the HR NT/VT schedule without it
 HISTORICAL_FILE = os.path.join(LOG_DIR, "historical_energy.json")
 WRITE_INTERVAL = 60  # seconds
 
@@ -118,41 +126,30 @@ lock = threading.Lock()
 prev_state = {}
 state_start_times = {}
 
-# --- Tariff-period COP tracking ---
-# Croatian electricity tariffs: summer NT 22-08, winter NT 21-07
-# DST switch: last Sunday of March (to summer) / last Sunday of October (to winter)
+# Object ids delivered by batch documents and when the last batch arrived (guarded by lock);
+# their per-entity topics are ignored until no batch arrived for BATCH_TIMEOUT
+batched_ids = set()
+last_batch_time = None
 
-def is_summer_time(d):
-    """Check if date falls in EU summer time (last Sun of Mar to last Sun of Oct)."""
-    year = d.year
-    # Last Sunday of March
-    mar31 = date(year, 3, 31)
-    dst_start = mar31.toordinal() - (mar31.weekday() + 1) % 7
-    # Last Sunday of October
-    oct31 = date(year, 10, 31)
-    dst_end = oct31.toordinal() - (oct31.weekday() + 1) % 7
-    return date.fromordinal(dst_start) <= d <= date.fromordinal(dst_end)
+# --- Tariff-period COP tracking ---
+# Tariff periods come from the schedule in TARIFF_FILE, compiled once per year into a boundary
+# table (default: Croatian NT 22-08 in summer time, 21-07 otherwise)
+tariff_calendar = load_tariff(TARIFF_FILE if os.path.exists(TARIFF_FILE) else None)
 
 
 def get_tariff_period(now):
-    """Return 'NT' (cheap/night) or 'VT' (expensive/day) for given datetime."""
-    hour = now.hour
-    if is_summer_time(now.date()):
-        return "NT" if (hour >= 22 or hour < 8) else "VT"
-    else:
-        return "NT" if (hour >= 21 or hour < 7) else "VT"
+    """Return the tariff tier name ('NT' or 'VT' by default) for given datetime."""
+    return tariff_calendar.period(now)
 
 
 def tariff_label(period, now):
     """Human-readable label for current tariff period."""
-    if period == "NT":
-        return "Night (NT)"
-    return "Day (VT)"
+    return tariff_calendar.label(period)
 
 
 # Period COP state: tracks energy counter deltas within each tariff period
 period_cop = {
-    "current_tariff": None,     # "NT" or "VT"
+    "current_tariff": None,     # tier name, "NT" or "VT" by default
     "period_start": None,       # ISO timestamp
     "consumed_prev": None,      # previous daily_consumed_kwh reading
     "produced_prev": None,      # previous daily_produced_kwh reading
@@ -194,6 +191,24 @@ def load_cop_state():
         pass
 
 
+def seed_cop_state():
+    """Rebuild period COP history and the period in progress from the CSV logs (tariff_cop.py).
+
+    Returns False when that is not possible here, load_cop_state() then restores the saved state.
+    """
+    try:
+        import tariff_cop
+        state = tariff_cop.live_state(tariff_calendar, os.path.join(LOG_DIR, "ecodan_log*.csv"), datetime.now(),
+                                      MAX_COP_HISTORY)
+    except Exception as e:
+        print(f"[{datetime.now():%H:%M:%S}] Could not recompute COP state from the logs: {e}")
+        return False
+    period_cop.update(state)
+    print(f"[{datetime.now():%H:%M:%S}] COP state recomputed from the logs: {len(period_cop['history'])} history "
+          f"entries, current period {period_cop['current_tariff'] or '-'} since {period_cop['period_start'] or '-'}")
+    return True
+
+
 def finalize_period(end_time):
     """Close the current tariff period and add to history."""
     consumed = period_cop["period_consumed"]
@@ -619,7 +634,8 @@ def on_connect(client, userdata, flags, reason_code, properties=None):
     print(f"[{datetime.now():%H:%M:%S}] MQTT connected (rc={reason_code})")
     client.subscribe(f"{TOPIC_PREFIX}/sensor/+/state")
     client.subscribe(f"{TOPIC_PREFIX}/binary_sensor/+/state")
-    print(f"[{datetime.now():%H:%M:%S}] Subscribed to {TOPIC_PREFIX}/+/+/state")
+    client.subscribe(BATCH_TOPIC)
+    print(f"[{datetime.now():%H:%M:%S}] Subscribed to {TOPIC_PREFIX}/+/+/state and {BATCH_TOPIC}")
     publish_cop_discovery()
 
 
@@ -745,7 +761,41 @@ def check_transitions(field, new_val):
     state_start_times[field] = now
 
 
+def on_batch(payload):
+    """Store one batch document: {object_id: number, true/false or null}, one lock for all of it."""
+    try:
+        values = json.loads(payload)
+    except ValueError:
+        return
+    if not isinstance(values, dict):
+        return
+
+    global last_batch_time
+    with lock:
+        batched_ids.update(values)
+        last_batch_time = time.monotonic()
+        transitions = []
+        for object_id, val in values.items():
+            if object_id in SENSORS:
+                csv_name = SENSORS[object_id]
+                latest[csv_name] = float("nan") if val is None else val
+                if csv_name == "aa_control_mode" and isinstance(val, (int, float)):
+                    transitions.append((csv_name, int(round(val))))
+            elif object_id in ALL_BINARY:
+                csv_name = ALL_BINARY[object_id]
+                latest[csv_name] = 1 if val else 0
+                if csv_name in TRANSITION_FIELDS:
+                    transitions.append((csv_name, latest[csv_name]))
+        # after the whole batch is stored, so transition snapshots see this poll's values
+        for csv_name, val in transitions:
+            check_transitions(csv_name, val)
+
+
 def on_message(client, userdata, msg):
+    if msg.topic == BATCH_TOPIC:
+        on_batch(msg.payload)
+        return
+
     topic_parts = msg.topic.split("/")
     if len(topic_parts) != 4:
         return
@@ -755,6 +805,11 @@ def on_message(client, userdata, msg):
     value_str = msg.payload.decode("utf-8", errors="replace")
 
     with lock:
+        if object_id in batched_ids:
+            if time.monotonic() - last_batch_time < BATCH_TIMEOUT:
+                return
+            # batches stopped: back to the per-entity topics until the next batch
+            batched_ids.clear()
         if component_type == "sensor" and object_id in SENSORS:
             csv_name = SENSORS[object_id]
             try:
@@ -892,7 +947,8 @@ def main():
 
     init_csv()
     init_transition_csv()
-    load_cop_state()
+    if not seed_cop_state():
+        load_cop_state()
 
     # MQTT client (must be created before writer thread starts)
     global mqtt_client
@@ -0,0 +1,602 @@
+# ABOUTME: Replays logged ecodan_log.csv history through a Python model of the auto-adaptive zone loop (optimizer.cpp).
+# ABOUTME: Run with: python scripts/optimizer_replay.py /opt/ecodan/data/ecodan_log.csv [--heating-type 0 --max-flow 35 ...]
+
+import argparse
+import csv
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+LOG_FILE = "/opt/ecodan/data/ecodan_log.csv"
+# mqtt_logger writes "" for values not received yet
+CELL_VALUES = {"": "nan", "True": "1", "False": "0"}
+
+# aa_mode values published by Optimizer::process_adaptive_zone_ / run_auto_adaptive_loop
+MODE_IDLE = 0         # disabled or hands off (defrost, DHW, lockout)
+MODE_NORMAL = 1
+MODE_ABOVE_TARGET = 2
+MODE_SUPPRESS = 3
+MODE_DEFROST_RECOVERY = 4
+MODE_SUPPRESS_RECOVERY = 5
+MODE_STARTUP_RAMP = 6
+
+MILD_WEATHER_TEMP = 15.0
+COLD_WEATHER_TEMP = -5.0
+DEFROST_RISK_MIN_TEMP = -2.0
+DEFROST_RISK_MAX_TEMP = 3.0
+OUTSIDE_LOCK_S = 15 * 60
+SUPPRESSION_RECOVERY_S = 20 * 60
+SUPPRESS_COOLDOWN_MAX_S = 60 * 60
+STARTUP_RAMP_S = 15 * 60
+POST_DHW_S = 5 * 60
+MAX_FEED_STEP_DOWN = 1.8
+MAX_FEED_STEP_DOWN_ADJUSTMENT = 1.0
+BOOST_UPDATE_INTERVAL_S = 5 * 60
+
+
+class Profile(NamedTuple):
+    """Delta T and smart boost constants of one heating_system_type group (run_auto_adaptive_loop)."""
+    base_min_delta_t: float
+    min_delta_cold_limit: float
+    max_delta_t: float
+    max_error_range: float
+    defrost_memory_s: float
+    boost_initial_wait_s: float
+    boost_step_interval_s: float
+    boost_max: float
+    boost_step: float
+
+
+UFH = Profile(1.0, 6.0, 6.5, 2.0, 35 * 60, 60 * 60, 30 * 60, 1.5, 0.15)
+HYBRID = Profile(3.0, 5.0, 8.0, 2.0, 25 * 60, 45 * 60, 20 * 60, 2.0, 0.15)
+RADIATOR = Profile(4.0, 6.0, 10.0, 1.5, 15 * 60, 20 * 60, 10 * 60, 2.5, 0.20)
+
+
+def profile_for(heating_type):
+    """heating_system_type select index (0..5, odd indices use the linear error curve) to its Profile."""
+    if heating_type <= 1:
+        return UFH
+    return HYBRID if heating_type <= 3 else RADIATOR
+
+
+class Settings(NamedTuple):
+    """The optimizer's number/select/switch entities, defaults as in confs/auto-adaptive.yaml."""
+    heating_type: int = 0
+    min_flow: float = 25.0
+    max_flow: float = 35.0
+    setpoint_bias: float = 0.0
+    smart_boost: bool = False
+    defrost_handling: bool = False
+    lockout_minutes: int = 0
+    min_on_minutes: float = 5.0
+    interval_s: float = 5 * 60
+    phase_s: float = 0.0
+    profile: Profile = None  # overrides the profile picked by heating_type
+
+    def resolved_profile(self):
+        return self.profile if self.profile is not None else profile_for(self.heating_type)
+
+
+class History:
+    """Logged rows as parallel float arrays (NaN where a value is missing); t is seconds since the first row."""
+
+    COLUMNS = {
+        "outside": "outside_temp",
+        "feed": "feed_temp",
+        "ret": "return_temp",
+        "room": "room_temp",
+        "flow_setpoint": "flow_target_temp",
+        "compressor": "compressor_on",
+        "defrost": "defrost",
+        "dhw": "3way_valve_dhw",
+        "lockout": "sc_lockout",
+        "logged_error": "aa_room_error",
+        "logged_flow": "aa_calculated_flow",
+        "logged_mode": "aa_control_mode",
+        "cop": "estimated_cop",
+        "flow_rate": "flow_rate_lmin",
+        "power": "output_power_kw",
+        "heating_delivered": "heating_delivered_kwh",
+        "heating_consumed": "heating_consumed_kwh",
+        "dhw_delivered": "dhw_delivered_kwh",
+        "dhw_consumed": "dhw_consumed_kwh",
+    }
+
+    def __init__(self, timestamps, columns, target=None):
+        self.timestamps = timestamps
+        self.t = (timestamps - timestamps[0]).astype(np.float64) if len(timestamps) else np.zeros(0)
+        for name, values in columns.items():
+            setattr(self, name, values)
+        for name in ("compressor", "defrost", "dhw", "lockout"):
+            setattr(self, name, np.nan_to_num(getattr(self, name)) > 0.5)
+        if target is None:
+            self.target = self.recover_target()
+        else:
+            self.target = np.broadcast_to(np.asarray(target, dtype=np.float64), self.t.shape).copy()
+
+    def __len__(self):
+        return len(self.t)
+
+    def recover_target(self):
+        """The log has no room target column; aa_room_error is target + bias - room at the last loop run.
+
+        Rows without a logged error take the previous recovered target. The result includes the
+        setpoint bias, so replays of such a history should run with setpoint_bias 0.
+        """
+        target = np.round((self.room + self.logged_error) * 10.0) / 10.0
+        return forward_fill(target)
+
+    def tiled(self, days):
+        """The history repeated back to back until it spans days, to time season-length replays."""
+        span = self.t[-1] + (self.t[1] - self.t[0] if len(self) > 1 else 60.0)
+        copies = max(1, math.ceil(days * 86400 / span))
+        offsets = (np.arange(copies) * span).astype("timedelta64[s]")
+        timestamps = (self.timestamps[None, :] + offsets[:, None]).ravel()
+        columns = {name: np.tile(getattr(self, name).astype(np.float64), copies) for name in self.COLUMNS}
+        return History(timestamps, columns, target=np.tile(self.target, copies))
+
+
+def forward_fill(values):
+    """Replace NaN with the last earlier non-NaN value (leading NaN stay)."""
+    valid = ~np.isnan(values)
+    idx = np.where(valid, np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    filled = values[idx]
+    filled[:np.argmax(valid) if valid.any() else len(values)] = np.nan
+    return filled
+
+
+def column_values(cells):
+    """Float array of logged CSV cells: blank (not received yet) and unparsable cells are NaN.
+
+    Binary sensors are logged as 0/1, older logs wrote True/False.
+    """
+    cells = [CELL_VALUES.get(cell, cell) for cell in cells]
+    try:
+        return np.array(cells, dtype=np.float64)
+    except ValueError:
+        return np.array([_cell_value(cell) for cell in cells], dtype=np.float64)
+
+
+def _cell_value(cell):
+    try:
+        return float(cell)
+    except ValueError:
+        return math.nan
+
+
+def load_history(path, target=None):
+    """Read the mqtt_logger CSV into a History, only the columns the optimizer model needs."""
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    position = {name: i for i, name in enumerate(header)}
+    stamps = np.array([row[0] for row in rows], dtype="datetime64[s]")
+    columns = {}
+    for name, column in History.COLUMNS.items():
+        i = position.get(column)
+        if i is None:
+            columns[name] = np.full(len(rows), np.nan)
+            continue
+        columns[name] = column_values([row[i] if i < len(row) else "" for row in rows])
+    return History(stamps, columns, target)
+
+
+def round_nearest(value):
+    """Optimizer::round_nearest, C round() is half away from zero."""
+    return math.copysign(math.floor(abs(value) * 10.0 + 0.5), value) / 10.0
+
+
+def step_down_needed(feed, flow):
+    """Optimizer::enforce_step_down's test, in float like the device: 34.7 - 32.9 is not above 1.8 there."""
+    return np.float32(feed) - np.float32(flow) > np.float32(MAX_FEED_STEP_DOWN)
+
+
+class Replay:
+    """Per loop run: the row it ran on, published aa_mode / aa_calculated_flow and the flow setpoint written.
+
+    NaN marks a value the device would not have published (or written) on that run. boost is the
+    smart boost factor and ratio the progress of the recovery or startup ramp (modes 4 to 6).
+    """
+
+    def __init__(self, rows, t, mode, flow, setpoint, boost, ratio):
+        self.rows = rows
+        self.t = t
+        self.mode = mode
+        self.flow = flow
+        self.setpoint = setpoint
+        self.boost = boost
+        self.ratio = ratio
+
+    def __len__(self):
+        return len(self.rows)
+
+    def per_row(self, n_rows):
+        """Published mode and flow as the logger would have seen them on each of n_rows rows."""
+        mode = np.full(n_rows, np.nan)
+        flow = np.full(n_rows, np.nan)
+        has_mode = ~np.isnan(self.mode)
+        mode[self.rows[has_mode]] = self.mode[has_mode]
+        has_flow = ~np.isnan(self.flow)
+        flow[self.rows[has_flow]] = self.flow[has_flow]
+        return forward_fill(mode), forward_fill(flow)
+
+
+def loop_rows(history, settings):
+    """Rows on which run_auto_adaptive_loop runs: the interval timer plus the event triggered runs.
+
+    The timer fires on the first row at or after each tick. Compressor starts, defrost ends and
+    the end of a DHW run (the operation mode going back to heating) trigger an extra run, as the
+    callbacks in events.cpp do.
+    """
+    t = history.t
+    ticks = np.arange(settings.phase_s, t[-1] + 1e-9, settings.interval_s) if len(t) else np.zeros(0)
+    timer = np.unique(np.searchsorted(t, ticks))
+    timer = timer[timer < len(t)]
+    compressor = history.compressor
+    defrost = history.defrost
+    comp_start = np.flatnonzero(compressor[1:] & ~compressor[:-1]) + 1
+    defrost_end = np.flatnonzero(~defrost[1:] & defrost[:-1]) + 1
+    dhw_end = np.flatnonzero(~history.dhw[1:] & history.dhw[:-1]) + 1
+    return np.unique(np.concatenate([timer, comp_start, defrost_end, dhw_end]))
+
+
+class LoopInputs(NamedTuple):
+    """Per row terms of the loop that do not depend on optimizer state or delta T constants."""
+    outside: np.ndarray          # outside temperature the loop uses (locked after a defrost)
+    cold_factor: np.ndarray
+    error: np.ndarray            # room target + bias - room
+    post_dhw: np.ndarray
+    hands_off: np.ndarray        # defrost, DHW or lockout: aa_mode 0
+    missing: np.ndarray          # inputs missing, the loop returns without publishing
+    defrost_weather: np.ndarray
+    defrost_ends: np.ndarray     # row indices
+
+
+def loop_inputs(history, settings=Settings()):
+    """The stateless part of the loop, on whole arrays."""
+    n = len(history)
+    t = history.t
+
+    # outside temperature locked at defrost start, used during and for 15 min after the defrost
+    defrost = history.defrost
+    starts = np.flatnonzero(defrost[1:] & ~defrost[:-1]) + 1
+    ends = np.flatnonzero(~defrost[1:] & defrost[:-1]) + 1
+    locked = np.full(n, np.nan)
+    locked[starts] = history.outside[starts]
+    locked = forward_fill(locked)
+    last_start = np.full(n, np.nan)
+    last_start[starts] = t[starts]
+    last_start = forward_fill(last_start)
+    last_end = np.full(n, np.nan)
+    last_end[ends] = t[ends]
+    last_end = forward_fill(last_end)
+    # during the defrost itself the loop is hands off, so only the window after its end matters
+    use_lock = ~np.isnan(locked) & (last_end >= last_start) & ((t - last_end) < OUTSIDE_LOCK_S)
+    outside = np.where(use_lock, locked, history.outside)
+
+    clamped = np.clip(outside, COLD_WEATHER_TEMP, MILD_WEATHER_TEMP)
+    cold_factor = (MILD_WEATHER_TEMP - clamped) / (MILD_WEATHER_TEMP - COLD_WEATHER_TEMP)
+
+    # in float like the device, so errors right at the -0.5 / -0.2 / 0.0 thresholds fall on the same side
+    f32 = np.float32
+    error = ((history.target.astype(f32) + f32(settings.setpoint_bias)) - history.room.astype(f32)).astype(np.float64)
+
+    # post DHW window: 5 min after the last feed temperature change seen during DHW with the compressor running
+    feed_changed = np.concatenate([[True], np.abs(np.diff(history.feed)) > 0.01])
+    dhw_run = np.where(history.dhw & history.compressor & feed_changed, t, np.nan)
+    post_dhw = (t < forward_fill(dhw_run) + POST_DHW_S) & ~history.dhw
+
+    hands_off = history.defrost | history.dhw | history.lockout
+    missing = (np.isnan(history.feed) | np.isnan(outside) | np.isnan(history.room) | np.isnan(history.target)
+               | np.isnan(history.flow_setpoint))
+    defrost_weather = (outside >= DEFROST_RISK_MIN_TEMP) & (outside <= DEFROST_RISK_MAX_TEMP)
+
+    return LoopInputs(outside, cold_factor, error, post_dhw, hands_off, missing, defrost_weather, ends)
+
+
+def replay(history, settings=Settings()):
+    """Run the zone 1 heating path of the auto-adaptive loop over history.
+
+    Modelled from optimizer.cpp / events.cpp: hands off during defrost, DHW and lockout, the
+    outside temperature locked for 15 min after a defrost, cold factor, smart boost, defrost and
+    suppression recovery ramps, suppression cooldown, mode 2 cap, startup ramp, step down limit
+    and flow clamping. Not modelled: zone 2, cooling, predictive short cycle boosts and the
+    post DHW feed temperature callbacks (only their effect on clamping order).
+    HEAT_ON is taken to be every row outside DHW and defrost, the log has no operation mode.
+    """
+    n = len(history)
+    p = settings.resolved_profile()
+    t = history.t
+    steps = loop_rows(history, settings)
+    inputs = loop_inputs(history, settings)
+    ends = inputs.defrost_ends
+    dynamic_min = p.base_min_delta_t + inputs.cold_factor * (p.min_delta_cold_limit - p.base_min_delta_t)
+    x = np.minimum(np.maximum(inputs.error, 0.0) / p.max_error_range, 1.0)
+    error_factor = x if settings.heating_type % 2 else x * x * (3.0 - 2.0 * x)
+
+    # --- the stateful part, one iteration per loop run ---
+
+    # compressor stops only update state, every other event row is also in steps
+    comp_rise = set((np.flatnonzero(history.compressor[1:] & ~history.compressor[:-1]) + 1).tolist())
+    comp_fall = set((np.flatnonzero(~history.compressor[1:] & history.compressor[:-1]) + 1).tolist())
+    defrost_end_rows = set(ends.tolist())
+    event_rows = np.union1d(steps, np.array(sorted(comp_fall), dtype=np.int64))
+    is_step = np.zeros(n, dtype=bool)
+    is_step[steps] = True
+
+    # plain lists index faster than numpy arrays in the loop below
+    T, ERR, DMIN, EF = t.tolist(), inputs.error.tolist(), dynamic_min.tolist(), error_factor.tolist()
+    RET, FEED = history.ret.tolist(), history.feed.tolist()
+    HANDS_OFF, MISSING = inputs.hands_off.tolist(), inputs.missing.tolist()
+    POST_DHW, DEFROST_WEATHER = inputs.post_dhw.tolist(), inputs.defrost_weather.tolist()
+    DEFROST = history.defrost.tolist()
+    STEP = is_step.tolist()
+
+    base = p.base_min_delta_t
+    max_delta = p.max_delta_t
+    min_flow = min(settings.min_flow, settings.max_flow)
+    max_flow = settings.max_flow
+    lockout_enabled = settings.lockout_minutes > 0
+    min_on_s = settings.min_on_minutes * 60.0
+
+    compressor_start = None
+    last_defrost = None
+    stagnation_start = None
+    last_error = 0.0
+    boost = 1.0
+    was_suppressing = False
+    suppression_end = None
+    cooldown_active = False
+    cooldown_start = 0.0
+
+    out_rows, out_mode, out_flow, out_setpoint, out_boost, out_ratio = [], [], [], [], [], []
+
+    for i in event_rows.tolist():
+        now = T[i]
+        if i in comp_fall:
+            # on_compressor_stop: the ramp timer only survives runs that were long enough with a lockout configured
+            if not lockout_enabled or (compressor_start is not None and not DEFROST[i]
+                                       and now - compressor_start < min_on_s):
+                compressor_start = None
+        if i in comp_rise and not DEFROST[i]:
+            compressor_start = now
+        if i in defrost_end_rows:
+            last_defrost = now
+        if not STEP[i]:
+            continue
+
+        out_rows.append(i)
+        if HANDS_OFF[i]:
+            out_mode.append(MODE_IDLE)
+            out_flow.append(math.nan)
+            out_setpoint.append(math.nan)
+            out_boost.append(boost)
+            out_ratio.append(math.nan)
+            continue
+        if MISSING[i]:
+            out_mode.append(math.nan)
+            out_flow.append(math.nan)
+            out_setpoint.append(math.nan)
+            out_boost.append(boost)
+            out_ratio.append(math.nan)
+            continue
+
+        err = ERR[i]
+        if settings.smart_boost:
+            # Optimizer::calculate_smart_boost
+            if err > 0.1 and err >= last_error - 0.01:
+                if stagnation_start is None:
+                    stagnation_start = now
+                stuck = now - stagnation_start
+                if stuck > p.boost_initial_wait_s:
+                    steps_done = int((stuck - p.boost_initial_wait_s) // p.boost_step_interval_s)
+                    boost = min(1.0 + (steps_done + 1) * p.boost_step, p.boost_max)
+            else:
+                stagnation_start = None
+                if boost > 1.0:
+                    boost = max(boost - p.boost_step * (BOOST_UPDATE_INTERVAL_S / p.boost_step_interval_s), 1.0)
+                else:
+                    boost = 1.0
+            last_error = err
+
+        dmin = DMIN[i]
+        target_delta = dmin + EF[i] * boost * (max_delta - dmin)
+        ret = RET[i]
+        suppress = False
+        mode = math.nan
+        ratio = math.nan
+
+        if math.isnan(ret):
+            flow = min_flow
+            published = math.nan
+        elif (settings.defrost_handling and DEFROST_WEATHER[i] and last_defrost is not None
+              and now - last_defrost < p.defrost_memory_s):
+            ratio = min(max((now - last_defrost) / p.defrost_memory_s, 0.0), 1.0)
+            flow = round_nearest(ret + base + max(target_delta - base, 0.0) * ratio)
+            mode, published = MODE_DEFROST_RECOVERY, flow
+        elif was_suppressing and suppression_end is not None and now - suppression_end < SUPPRESSION_RECOVERY_S:
+            ratio = min(max((now - suppression_end) / SUPPRESSION_RECOVERY_S, 0.0), 1.0)
+            flow = round_nearest(ret + base + max(target_delta - base, 0.0) * ratio)
+            mode, published = MODE_SUPPRESS_RECOVERY, flow
+        else:
+            if was_suppressing and suppression_end is not None:
+                was_suppressing = False
+                suppression_end = None
+                cooldown_active = True
+                cooldown_start = now
+            if cooldown_active and (err > -0.2 or now - cooldown_start > SUPPRESS_COOLDOWN_MAX_S):
+                cooldown_active = False
+
+            flow = ret + target_delta
+            if err <= -0.5 and not cooldown_active:
+                flow = min_flow
+                suppress = True
+                was_suppressing = True
+                mode = MODE_SUPPRESS
+            elif err < 0.0:
+                if was_suppressing and suppression_end is None:
+                    suppression_end = now
+                flow = min(ret + 1.0, min_flow + dmin + 3.0)
+                mode = MODE_ABOVE_TARGET
+            else:
+                if was_suppressing and suppression_end is None:
+                    suppression_end = now
+                if compressor_start is not None and now - compressor_start < STARTUP_RAMP_S:
+                    ratio = min(max((now - compressor_start) / STARTUP_RAMP_S, 0.0), 1.0)
+                    flow = ret + base + max(target_delta - base, 0.0) * ratio
+                    mode = MODE_STARTUP_RAMP
+                else:
+                    mode = MODE_NORMAL
+            flow = round_nearest(flow)
+            published = flow
+
+        # step down limit and zone clamp, in the order process_adaptive_zone_ applies them
+        feed = FEED[i]
+        if not suppress and not POST_DHW[i] and step_down_needed(feed, flow):
+            flow = feed - MAX_FEED_STEP_DOWN_ADJUSTMENT
+        flow = min(max(flow, min_flow), max_flow)
+        if POST_DHW[i] and not suppress and step_down_needed(feed, flow):
+            flow = feed - MAX_FEED_STEP_DOWN_ADJUSTMENT
+
+        out_mode.append(mode)
+        out_flow.append(published)
+        out_setpoint.append(flow)
+        out_boost.append(boost)
+        out_ratio.append(ratio)
+
+    rows = np.array(out_rows, dtype=np.int64)
+    return Replay(rows, t[rows], *(np.array(values, dtype=np.float64)
+                                   for values in (out_mode, out_flow, out_setpoint, out_boost, out_ratio)))
+
+
+class Agreement(NamedTuple):
+    rows: int
+    mode_match: float
+    flow_match: float
+    flow_mae: float
+    confusion: dict
+
+
+def compare(history, result, tolerance=0.15):
+    """Row by row agreement of the replayed and the logged aa_control_mode / aa_calculated_flow."""
+    mode, flow = result.per_row(len(history))
+    logged_mode, logged_flow = history.logged_mode, history.logged_flow
+    both = ~np.isnan(mode) & ~np.isnan(logged_mode)
+    flows = ~np.isnan(flow) & ~np.isnan(logged_flow)
+    diff = np.abs(flow[flows] - logged_flow[flows])
+    confusion = {}
+    if both.any():
+        pairs, counts = np.unique(np.stack([logged_mode[both], mode[both]]).astype(np.int64), axis=1,
+                                  return_counts=True)
+        confusion = {(int(a), int(b)): int(c) for (a, b), c in zip(pairs.T, counts)}
+    return Agreement(
+        rows=int(both.sum()),
+        mode_match=float((mode[both] == logged_mode[both]).mean()) if both.any() else math.nan,
+        flow_match=float((diff <= tolerance).mean()) if len(diff) else math.nan,
+        flow_mae=float(diff.mean()) if len(diff) else math.nan,
+        confusion=confusion,
+    )
+
+
+def best_phase(history, settings):
+    """The timer phase (whole rows within one interval) that best reproduces the logged values."""
+    step = float(np.median(np.diff(history.t))) if len(history) > 1 else 60.0
+    best = None
+    for phase in np.arange(0.0, settings.interval_s, step):
+        candidate = settings._replace(phase_s=float(phase))
+        score = compare(history, replay(history, candidate))
+        key = (np.nan_to_num(score.mode_match) + np.nan_to_num(score.flow_match))
+        if best is None or key > best[0]:
+            best = (key, candidate)
+    return best[1]
+
+
+def write_steps(path, history, result):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "aa_mode", "aa_calculated_flow", "flow_setpoint", "smart_boost",
+                         "logged_mode", "logged_flow"])
+        for k, i in enumerate(result.rows.tolist()):
+            writer.writerow([str(history.timestamps[i]).replace("T", " "), _fmt(result.mode[k]), _fmt(result.flow[k]),
+                             _fmt(result.setpoint[k]), _fmt(result.boost[k]), _fmt(history.logged_mode[i]),
+                             _fmt(history.logged_flow[i])])
+    print(f"{path}: {len(result)} loop runs")
+
+
+def _fmt(value):
+    return "" if math.isnan(value) else f"{value:g}"
+
+
+def report(history, result, settings, elapsed):
+    days = history.t[-1] / 86400 if len(history) else 0.0
+    print(f"{len(history)} rows over {days:.1f} days, {len(result)} loop runs "
+          f"(interval {settings.interval_s / 60:g} min, phase {settings.phase_s:g}s), replayed in {elapsed * 1000:.0f} ms")
+    modes, counts = np.unique(result.mode[~np.isnan(result.mode)].astype(np.int64), return_counts=True)
+    print("aa_mode runs: " + ", ".join(f"{m}: {c}" for m, c in zip(modes.tolist(), counts.tolist())))
+
+    score = compare(history, result)
+    if not score.rows:
+        print("The log has no aa_control_mode values to validate against.")
+        return
+    print(f"\nValidation on {score.rows} rows: aa_mode matches {score.mode_match:.1%}, "
+          f"aa_calculated_flow within 0.15 C {score.flow_match:.1%} (MAE {score.flow_mae:.2f} C)")
+    print("logged -> replayed mode counts:")
+    for (logged, replayed), count in sorted(score.confusion.items()):
+        marker = "" if logged == replayed else "  <-- differs"
+        print(f"  {logged} -> {replayed}: {count}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay logged history through the auto-adaptive optimizer model")
+    parser.add_argument("log", nargs="?", default=LOG_FILE, help="mqtt_logger CSV (ecodan_log.csv)")
+    parser.add_argument("--heating-type", type=int, default=0,
+                        help="heating_system_type select index: 0/1 UFH, 2/3 UFH + radiators, 4/5 radiators (odd = linear)")
+    parser.add_argument("--min-flow", type=float, default=25.0)
+    parser.add_argument("--max-flow", type=float, default=35.0)
+    parser.add_argument("--bias", type=float, default=0.0, help="setpoint bias, only with --target")
+    parser.add_argument("--target", type=float, help="room target; recovered from aa_room_error when not given")
+    parser.add_argument("--smart-boost", action="store_true")
+    parser.add_argument("--defrost-handling", action="store_true")
+    parser.add_argument("--lockout", type=int, default=0, help="short-cycle lockout duration select (minutes)")
+    parser.add_argument("--min-on", type=float, default=5.0, help="minimum compressor on time (minutes)")
+    parser.add_argument("--interval", type=float, default=5.0, help="update_interval_minutes")
+    parser.add_argument("--phase", default="auto", help="timer phase in seconds after the first row, or auto")
+    parser.add_argument("--season", type=float, help="also time a replay of the log tiled to this many days")
+    parser.add_argument("--out", help="write one CSV row per loop run")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    history = load_history(args.log, args.target)
+    print(f"Loaded {args.log} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    if not len(history):
+        raise SystemExit("The log has no rows.")
+
+    settings = Settings(heating_type=args.heating_type, min_flow=args.min_flow, max_flow=args.max_flow,
+                        setpoint_bias=args.bias if args.target is not None else 0.0,
+                        smart_boost=args.smart_boost, defrost_handling=args.defrost_handling,
+                        lockout_minutes=args.lockout, min_on_minutes=args.min_on, interval_s=args.interval * 60)
+    if args.phase == "auto":
+        settings = best_phase(history, settings)
+    else:
+        settings = settings._replace(phase_s=float(args.phase))
+
+    start = time.perf_counter()
+    result = replay(history, settings)
+    report(history, result, settings, time.perf_counter() - start)
+    if args.out:
+        write_steps(args.out, history, result)
+
+    if args.season:
+        season = history.tiled(args.season)
+        start = time.perf_counter()
+        result = replay(season, settings)
+        print(f"\nSeason replay: {len(season)} rows over {args.season:g} days, {len(result)} loop runs "
+              f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# ABOUTME: Sweeps auto-adaptive delta T parameters over logged history, thousands of sets at once, and ranks them.
+# ABOUTME: Run with: python scripts/optimizer_sweep.py /opt/ecodan/data/ecodan_log.csv [--base 0.5:4.5:0.5 ...] [--out sweep.csv]
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+import optimizer_replay as replay
+from optimizer_replay import (MAX_FEED_STEP_DOWN, MAX_FEED_STEP_DOWN_ADJUSTMENT, MODE_ABOVE_TARGET, MODE_SUPPRESS,
+                              MODE_NORMAL, Settings)
+
+# columns of a parameter set, one row per set
+PARAMS = ("base_min_delta_t", "min_delta_cold_limit", "max_delta_t", "max_error_range", "linear")
+METRICS = ("cycles_per_day", "mean_flow", "cop_proxy")
+
+DEFAULT_CARNOT_EFFICIENCY = 0.45
+# condensing above the flow, evaporating below the outside temperature
+CONDENSER_APPROACH = 3.0
+EVAPORATOR_APPROACH = 6.0
+
+BLOCK = 4096  # loop runs per time block
+
+
+class Trace(NamedTuple):
+    """The loop runs of one scalar replay that wrote a setpoint, with every parameter independent term.
+
+    In an open-loop replay the room, feed and return follow the log whatever the parameters, so
+    the branch taken on each run (aa_mode), the ramp progress and the smart boost factor are the
+    same for every parameter set; only the flow arithmetic depends on them.
+    """
+    mode: np.ndarray
+    ratio: np.ndarray
+    boost: np.ndarray
+    ret: np.ndarray
+    feed: np.ndarray
+    outside: np.ndarray
+    cold_factor: np.ndarray
+    error: np.ndarray
+    post_dhw: np.ndarray
+    running: np.ndarray   # compressor on (logged)
+    weight: np.ndarray    # seconds until the next loop run
+    days: float
+
+
+class PlantProxy(NamedTuple):
+    """What the scores assume about the heat pump, calibrated from the log.
+
+    The chance that the compressor stops before the next loop run is logistic in the setpoint
+    margin over the return temperature: a setpoint close to the return leaves the unit no room
+    to modulate down and it overshoots and stops.
+    """
+    stop_intercept: float
+    stop_slope: float  # per C of setpoint - return margin
+    carnot_efficiency: float
+
+    def stop_probability(self, margin):
+        return 1.0 / (1.0 + np.exp(-(self.stop_intercept + self.stop_slope * margin)))
+
+
+def trace(history, settings):
+    result = replay.replay(history, settings)
+    inputs = replay.loop_inputs(history, settings)
+    heated = ~np.isnan(result.setpoint)
+    rows = result.rows[heated]
+    weight = np.diff(result.t, append=result.t[-1] + settings.interval_s)[heated]
+    return Trace(
+        mode=result.mode[heated], ratio=result.ratio[heated], boost=result.boost[heated],
+        ret=history.ret[rows], feed=history.feed[rows], outside=inputs.outside[rows],
+        cold_factor=inputs.cold_factor[rows], error=inputs.error[rows], post_dhw=inputs.post_dhw[rows],
+        running=history.compressor[rows], weight=np.minimum(weight, settings.interval_s),
+        days=max(history.t[-1] / 86400.0, 1.0 / 24))
+
+
+def carnot(flow, outside):
+    condensing = flow + CONDENSER_APPROACH + 273.15
+    lift = np.maximum(flow + CONDENSER_APPROACH - (outside - EVAPORATOR_APPROACH), 5.0)
+    return condensing / lift
+
+
+def fit_logistic(x, y, iterations=25, ridge=1e-6):
+    """Intercept and slope of P(y) = 1 / (1 + exp(-(a + b x))) by iteratively reweighted least squares."""
+    design = np.stack([np.ones_like(x), x], axis=1)
+    coef = np.zeros(2)
+    for _ in range(iterations):
+        prob = 1.0 / (1.0 + np.exp(-design @ coef))
+        w = np.maximum(prob * (1.0 - prob), 1e-9)
+        hessian = design.T @ (design * w[:, None]) + ridge * np.eye(2)
+        step = np.linalg.solve(hessian, design.T @ (y - prob))
+        coef += step
+        if np.abs(step).max() < 1e-8:
+            break
+    return float(coef[0]), float(coef[1])
+
+
+def calibrate(history, settings):
+    """Compressor stop odds against the setpoint margin, and logged COP over the ideal one."""
+    heating = history.compressor & ~history.defrost & ~history.dhw
+    row_s = float(np.median(np.diff(history.t))) if len(history) > 1 else 60.0
+    ahead = max(1, int(round(settings.interval_s / row_s)))
+    # stopped within the next loop interval
+    off = (~history.compressor).astype(np.int64)
+    off_ahead = np.concatenate([np.cumsum(off)[ahead:], np.full(ahead, off.sum())]) - np.cumsum(off)
+    margin = history.flow_setpoint - history.ret
+    usable = heating & np.isfinite(margin)
+    stops = off_ahead[usable] > 0
+    if usable.sum() > 100 and 0 < stops.sum() < usable.sum():
+        intercept, slope = fit_logistic(margin[usable], stops.astype(np.float64))
+    else:
+        intercept, slope = -30.0, 0.0  # no stops seen: predict none
+
+    ratio = (history.cop / carnot(history.feed, history.outside))[heating]
+    ratio = ratio[np.isfinite(ratio) & (history.cop[heating] > 0.5) & (history.cop[heating] < 10)]
+    efficiency = float(np.median(ratio)) if len(ratio) > 100 else DEFAULT_CARNOT_EFFICIENCY
+    return PlantProxy(intercept, slope, efficiency)
+
+
+def setpoints(tr, params, settings, start=0, stop=None):
+    """Flow setpoints of runs start:stop for every parameter set, shape (runs, sets).
+
+    The same arithmetic as process_adaptive_zone_ (and optimizer_replay.replay), with the
+    parameters as the second axis.
+    """
+    sl = slice(start, stop)
+    base, cold_limit, max_delta, error_range, linear = (params[:, k][None, :] for k in range(len(PARAMS)))
+    mode = tr.mode[sl][:, None]
+    ret = tr.ret[sl][:, None]
+    feed = tr.feed[sl][:, None]
+    min_flow = min(settings.min_flow, settings.max_flow)
+
+    dynamic_min = base + tr.cold_factor[sl][:, None] * (cold_limit - base)
+    x = np.minimum(np.maximum(tr.error[sl][:, None], 0.0) / error_range, 1.0)
+    error_factor = np.where(linear > 0, x, x * x * (3.0 - 2.0 * x))
+    target_delta = dynamic_min + error_factor * tr.boost[sl][:, None] * (max_delta - dynamic_min)
+
+    ramp = ret + base + np.maximum(target_delta - base, 0.0) * tr.ratio[sl][:, None]
+    flow = np.where(mode == MODE_NORMAL, ret + target_delta, ramp)
+    flow = np.where(mode == MODE_ABOVE_TARGET, np.minimum(ret + 1.0, min_flow + dynamic_min + 3.0), flow)
+    suppress = mode == MODE_SUPPRESS
+    flow = np.where(suppress | np.isnan(mode), min_flow, flow)
+    flow = np.floor(flow * 10.0 + 0.5) / 10.0
+
+    post_dhw = tr.post_dhw[sl][:, None]
+    f32 = np.float32
+    step_down = ~suppress & (feed.astype(f32) - flow.astype(f32) > f32(MAX_FEED_STEP_DOWN))
+    flow = np.where(step_down & ~post_dhw, feed - MAX_FEED_STEP_DOWN_ADJUSTMENT, flow)
+    flow = np.clip(flow, min_flow, settings.max_flow)
+    step_down = ~suppress & (feed.astype(f32) - flow.astype(f32) > f32(MAX_FEED_STEP_DOWN))
+    return np.where(step_down & post_dhw, feed - MAX_FEED_STEP_DOWN_ADJUSTMENT, flow)
+
+
+def evaluate(tr, params, settings, proxy):
+    """METRICS for each parameter set, shape (sets, len(METRICS)).
+
+    cycles_per_day sums the stop probability of every run with the compressor on, scaled by
+    the time the run covers. mean_flow is the setpoint while the compressor runs and cop_proxy
+    the Carnot COP at that setpoint, scaled by the efficiency the logged COP shows, both
+    weighted by time.
+    """
+    n_sets = len(params)
+    cycles = np.zeros(n_sets)
+    flow_sum = np.zeros(n_sets)
+    cop_sum = np.zeros(n_sets)
+    running_time = float(tr.weight[tr.running].sum()) or 1.0
+
+    for start in range(0, len(tr.mode), BLOCK):
+        stop = min(start + BLOCK, len(tr.mode))
+        flow = setpoints(tr, params, settings, start, stop)
+        w = (tr.weight[start:stop] * tr.running[start:stop])[:, None]
+        margin = flow - tr.ret[start:stop][:, None]
+        cycles += (proxy.stop_probability(margin) * (w / settings.interval_s)).sum(axis=0)
+        flow_sum += (flow * w).sum(axis=0)
+        cop_sum += (proxy.carnot_efficiency * carnot(flow, tr.outside[start:stop][:, None]) * w).sum(axis=0)
+
+    return np.stack([cycles / tr.days, flow_sum / running_time, cop_sum / running_time], axis=1)
+
+
+# --- process pool ----------------------------------------------------------
+
+_worker = {}
+
+
+def _init_worker(tr, settings, proxy):
+    _worker.update(tr=tr, settings=settings, proxy=proxy)
+
+
+def _evaluate_chunk(params):
+    return evaluate(_worker["tr"], params, _worker["settings"], _worker["proxy"])
+
+
+def sweep(tr, params, settings, proxy, workers=None, chunk=256):
+    """evaluate() over params split into chunks spread across a process pool."""
+    chunks = [params[i:i + chunk] for i in range(0, len(params), chunk)]
+    if workers == 1 or len(chunks) == 1:
+        return np.concatenate([evaluate(tr, c, settings, proxy) for c in chunks])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tr, settings, proxy)) as pool:
+        return np.concatenate(list(pool.map(_evaluate_chunk, chunks)))
+
+
+# --- ranking ---------------------------------------------------------------
+
+def pareto_rank(objectives, chunk=1024):
+    """1 + the number of sets that dominate each set (all objectives minimised); 1 is the Pareto front."""
+    n = len(objectives)
+    rank = np.ones(n, dtype=np.int64)
+    for i in range(0, n, chunk):
+        block = objectives[i:i + chunk][:, None, :]
+        dominates = np.all(objectives[None, :, :] <= block, axis=2) & np.any(objectives[None, :, :] < block, axis=2)
+        rank[i:i + chunk] += dominates.sum(axis=1)
+    return rank
+
+
+def parse_range(text):
+    """'start:stop:step' (stop included) or a single value."""
+    parts = [float(v) for v in text.split(":")]
+    if len(parts) == 1:
+        return np.array(parts)
+    start, stop, step = parts
+    return np.round(np.arange(start, stop + step / 2, step), 6)
+
+
+def grid(base, cold_limit, max_delta, error_range, linear):
+    """Every combination as rows of PARAMS, keeping base <= cold limit <= max delta."""
+    mesh = np.meshgrid(base, cold_limit, max_delta, error_range, linear, indexing="ij")
+    params = np.stack([m.ravel() for m in mesh], axis=1)
+    keep = (params[:, 0] <= params[:, 1]) & (params[:, 1] <= params[:, 2])
+    return params[keep]
+
+
+def write_table(path, params, metrics, rank):
+    order = np.lexsort((-metrics[:, 2], metrics[:, 0], rank))
+    with open(path, "w") as f:
+        f.write(",".join(("rank",) + PARAMS + METRICS) + "\n")
+        for i in order:
+            values = [f"{v:g}" for v in params[i]] + [f"{v:.4f}" for v in metrics[i]]
+            f.write(",".join([str(rank[i])] + values) + "\n")
+    print(f"{path}: {len(params)} parameter sets")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank auto-adaptive delta T parameter sets over logged history")
+    parser.add_argument("log", nargs="?", default=replay.LOG_FILE, help="mqtt_logger CSV (ecodan_log.csv)")
+    parser.add_argument("--heating-type", type=int, default=0,
+                        help="profile for smart boost and defrost timing, and the baseline parameters")
+    parser.add_argument("--base", default="0.5:4.5:0.5", help="base_min_delta_t values, start:stop:step")
+    parser.add_argument("--cold-limit", default="3:8:0.5", help="min_delta_cold_limit values")
+    parser.add_argument("--max-delta", default="5:11:0.5", help="max_delta_t values")
+    parser.add_argument("--error-range", default="1:3:0.5", help="max_error_range values")
+    parser.add_argument("--linear", default="both", choices=("both", "yes", "no"), help="linear error curve")
+    parser.add_argument("--min-flow", type=float, default=25.0)
+    parser.add_argument("--max-flow", type=float, default=35.0)
+    parser.add_argument("--target", type=float, help="room target; recovered from aa_room_error when not given")
+    parser.add_argument("--smart-boost", action="store_true")
+    parser.add_argument("--defrost-handling", action="store_true")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk", type=int, default=256, help="parameter sets per pool task")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--out", help="write every set, ranked, as CSV")
+    args = parser.parse_args()
+
+    history = replay.load_history(args.log, args.target)
+    settings = Settings(heating_type=args.heating_type, min_flow=args.min_flow, max_flow=args.max_flow,
+                        smart_boost=args.smart_boost, defrost_handling=args.defrost_handling)
+    settings = replay.best_phase(history, settings)
+    tr = trace(history, settings)
+    proxy = calibrate(history, settings)
+    print(f"{len(history)} rows over {tr.days:.1f} days, {len(tr.mode)} heating loop runs; "
+          f"stop odds x{np.exp(proxy.stop_slope):.2f} per C of setpoint margin, "
+          f"Carnot efficiency {proxy.carnot_efficiency:.2f}")
+
+    linear = {"both": [0.0, 1.0], "yes": [1.0], "no": [0.0]}[args.linear]
+    params = grid(parse_range(args.base), parse_range(args.cold_limit), parse_range(args.max_delta),
+                  parse_range(args.error_range), linear)
+    p = settings.resolved_profile()
+    baseline = np.array([[p.base_min_delta_t, p.min_delta_cold_limit, p.max_delta_t, p.max_error_range,
+                          float(args.heating_type % 2)]])
+    params = np.concatenate([baseline, params])
+
+    start = time.perf_counter()
+    metrics = sweep(tr, params, settings, proxy, args.workers, args.chunk)
+    elapsed = time.perf_counter() - start
+    print(f"{len(params)} parameter sets x {len(tr.mode)} runs in {elapsed:.2f}s "
+          f"({len(params) * len(tr.mode) / elapsed / 1e6:.1f}M set-runs/s)")
+
+    objectives = metrics * np.array([1.0, 1.0, -1.0])
+    rank = pareto_rank(objectives)
+    order = np.lexsort((-metrics[:, 2], metrics[:, 0], rank))
+    front = int((rank == 1).sum())
+
+    header = f"{'rank':>5}  {'base':>5} {'cold':>5} {'max':>5} {'range':>5} {'lin':>4}  {'cycles/d':>8} {'flow C':>7} {'COP':>6}"
+    print(f"\nPareto front: {front} sets (fewer predicted cycles, lower flow, higher COP)\n{header}")
+
+    def show(i, note=""):
+        b, c, m, r, lin = params[i]
+        cyc, flow, cop = metrics[i]
+        print(f"{rank[i]:>5}  {b:>5g} {c:>5g} {m:>5g} {r:>5g} {'yes' if lin else 'no':>4}  "
+              f"{cyc:>8.2f} {flow:>7.2f} {cop:>6.2f}{note}")
+
+    for i in order[:args.top]:
+        show(i, "  <-- current profile" if i == 0 else "")
+    if 0 not in order[:args.top]:
+        show(0, "  <-- current profile")
+
+    if args.out:
+        write_table(args.out, params, metrics, rank)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# ABOUTME: Benchmarks the ecodan proxy path: an emulated slave controller and FTC on two ports around the device under test.
+# ABOUTME: Run with: python scripts/proxy_bench.py [--exec "<device under test> {ftc} {slave}"] (default: the tests/host/proxy_host.cpp build of serial.cpp)
+
+import argparse
+import collections
+import heapq
+import math
+import os
+import select
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+
+import cn105
+import ftc_emulator
+from cn105 import GetType, MsgType
+
+# serial.cpp answers these from a cache (and still forwards them to the FTC)
+HANDSHAKE = [
+    ("first_request", "02 ff ff 00 00 00 00 02", "02 ff ff 80 00 00 0a 01 00 40 00 00 06 02 7a 00 00 b5"),
+    ("second_request", "02 ff ff 01 00 00 01 00 00", "02 ff ff 81 00 00 00 81"),
+    ("connect_request", "fc 5a 02 7a 02 ca 01 5d", "fc 7a 02 7a 01 00 09"),
+    ("keep_alive_request", "fc 41 02 7a 10 34 00 01 00 00 00 00 00 00 00 00 01 00 00 00 00 fd",
+     "fc 61 02 7a 10 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 13"),
+]
+
+FORWARD_TYPES = [GetType.TEMPERATURE_STATE_A, GetType.MODE_FLAGS_A, GetType.SH_TEMPERATURE_STATE,
+                 GetType.ENERGY_USAGE, GetType.PUMP_STATUS_A]
+
+REPLY_TIMEOUT = 2.0
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# serial.cpp and proxy.cpp as they are, on the stand-in ESPHome and FreeRTOS headers in tests/host
+HOST_SOURCES = ["tests/host/proxy_host.cpp", "components/ecodan/serial.cpp", "components/ecodan/proxy.cpp"]
+
+
+def host_build(out_dir):
+    """Build the host proxy into out_dir and return its --exec command."""
+    exe = os.path.join(out_dir, "proxy_host")
+    command = ["g++", "-std=c++17", "-Wall", "-Wno-switch", "-pthread", "-I", "components/ecodan", "-I", "tests/host",
+               *HOST_SOURCES, "-o", exe]
+    build = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    if build.returncode:
+        sys.exit(f"host build failed:\n{build.stderr}")
+    return shlex.quote(exe) + " {ftc} {slave}"
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class BenchFtc(ftc_emulator.Emulator):
+    """The FTC emulator, recording when forwarded slave frames arrive and when its replies leave."""
+
+    def __init__(self, args, now, bench):
+        super().__init__(args, now)
+        self.bench = bench
+
+    def on_ftc_frame(self, frame, ok, now):
+        arrived = self.ftc.received_at(now, frame)
+        self.bench.ftc_received(frame, arrived, ok)
+        # the cached handshake frames (0x02 sync) are forwarded too, a real FTC ignores them
+        if ok and frame[0] == cn105.HEADER_MAGIC_A1:
+            self.at(arrived, self.answer, frame, arrived)
+
+    def send(self, port, frame, ready, note=None):
+        # hand a frame over once its last byte would be on the wire, the device only forwards whole frames
+        done = port.schedule_tx(ready, frame)
+        self.at(done, port.write, frame)
+        self.bench.ftc_sent(frame, done)
+        return done
+
+
+class Bench:
+    """Slave controller side of the rig.
+
+    Three phases: the cached handshake frames, GET requests forwarded through to the FTC and a
+    flood of unsolicited FTC frames. Times run from the last byte sent to the last byte received,
+    so every value includes the transfer of one frame (11 bits per byte at the port baud rate).
+    On ptys the wire is modelled by handing each frame over when its last byte would be sent.
+    """
+
+    def __init__(self, args):
+        self.args = args
+        self.samples = collections.defaultdict(list)
+        self.counts = collections.Counter()
+        self.slave_sent = collections.defaultdict(collections.deque)  # frame -> send done times
+        self.ftc_sent_at = collections.defaultdict(collections.deque)
+        emu_args = argparse.Namespace(
+            link=args.ftc_link, device=args.ftc_device, baud=args.baud, latency=args.latency, jitter=args.jitter,
+            drop=0.0, corrupt=0.0, rc_delay=2.0, slave_link=None, slave_device=None, seed=0)
+        self.ftc = BenchFtc(emu_args, time.monotonic(), self)
+        self.slave = ftc_emulator.Port(args.slave_baud, link=args.slave_link, device=args.slave_device)
+        self.slave_reader = cn105.FrameReader(accept_b=True)
+        self.waiting = None  # (name, expected reply or GetType, send done time, deadline)
+
+    # --- measurements -----------------------------------------------------
+
+    def ftc_received(self, frame, arrived, ok):
+        if not ok:
+            self.counts["corrupted on the way to the FTC"] += 1
+            return
+        sent = self.slave_sent.get(frame)
+        if sent:
+            self.samples["slave -> FTC forward"].append(arrived - sent.popleft())
+            self.counts["forwarded to FTC"] += 1
+        else:
+            self.counts["frames from the device itself"] += 1
+
+    def ftc_sent(self, frame, done):
+        self.ftc_sent_at[frame].append(done)
+
+    def slave_received(self, frame, arrived, ok):
+        if not ok:
+            self.counts["corrupted on the way to the slave"] += 1
+            return
+        sent = self.ftc_sent_at.get(frame)
+        if sent:
+            self.samples["FTC -> slave forward"].append(arrived - sent.popleft())
+            self.counts["forwarded to slave"] += 1
+        if not self.waiting:
+            return
+        name, expected, since, _ = self.waiting
+        if isinstance(expected, bytes):
+            hit = frame == expected
+        else:
+            hit = frame[1] == MsgType.GET_RES and cn105.payload_of(frame)[0] == expected
+        if hit:
+            self.samples[name].append(arrived - since)
+            self.waiting = None
+
+    # --- driving ----------------------------------------------------------
+
+    def slave_send(self, frame, now):
+        done = self.slave.schedule_tx(now, frame)
+        self.ftc.at(done, self.slave.write, frame)
+        self.slave_sent[frame].append(done)
+        return done
+
+    def steps(self):
+        for _ in range(self.args.rounds):
+            for name, request, reply in HANDSHAKE:
+                yield f"cached {name}", bytes.fromhex(request), bytes.fromhex(reply)
+        for i in range(self.args.requests):
+            get_type = FORWARD_TYPES[i % len(FORWARD_TYPES)]
+            yield "round trip via proxy", cn105.get_request(get_type), get_type
+
+    def flood(self, now):
+        """Unsolicited GET_RES frames back to back from the FTC, more than rx_message_queue_ holds.
+
+        serial.cpp forwards a frame to the slave before queueing it, so an overflowing queue shows
+        up as "Message queue was full" in the device log rather than as frames missing here.
+        """
+        payload = cn105.encode_payload(GetType.TEMPERATURE_STATE_A, {"HpFeedTemperature": 35.0})
+        frame = cn105.build_frame(MsgType.GET_RES, payload)
+        done = now
+        for _ in range(self.args.flood):
+            done = self.ftc.send(self.ftc.ftc, frame, now)
+        before = self.counts["forwarded to slave"]
+        return done, before
+
+    def pump(self, until):
+        """Run timers and read both ports until the monotonic time until (or waiting clears)."""
+        while True:
+            now = time.monotonic()
+            timers = self.ftc.timers
+            while timers and timers[0][0] <= now:
+                _, _, callback, args = heapq.heappop(timers)
+                callback(*args)
+            if now >= until or (self.waiting is None and until == math.inf):
+                return
+            if self.waiting and now > self.waiting[3]:
+                self.counts[f"timeout {self.waiting[0]}"] += 1
+                self.waiting = None
+                if until == math.inf:
+                    return
+            wake = min([until, self.waiting[3] if self.waiting else until] + ([timers[0][0]] if timers else []))
+            readable, _, _ = select.select([self.ftc.ftc.fd, self.slave.fd], [], [], max(0.0, min(wake - now, 0.05)))
+            now = time.monotonic()
+            if self.ftc.ftc.fd in readable:
+                for frame, ok in self.ftc.ftc_reader.feed(self.ftc.ftc.read()):
+                    self.ftc.on_ftc_frame(frame, ok, now)
+            if self.slave.fd in readable:
+                for frame, ok in self.slave_reader.feed(self.slave.read()):
+                    self.slave_received(frame, self.slave.received_at(now, frame), ok)
+
+    def run(self):
+        print(f"FTC port {self.ftc.ftc.name}, slave port {self.slave.name}, {self.args.baud} baud")
+        dut = None
+        with tempfile.TemporaryDirectory() as tmp:
+            exec_command = self.args.exec
+            if exec_command is None and not (self.args.ftc_device or self.args.slave_device):
+                exec_command = host_build(tmp)
+            if exec_command:
+                command = exec_command.format(ftc=self.args.ftc_link, slave=self.args.slave_link)
+                dut = subprocess.Popen(shlex.split(command))
+            self.measure(dut)
+        self.report()
+
+    def measure(self, dut):
+        self.pump(time.monotonic() + self.args.settle)
+        try:
+            for name, request, expected in self.steps():
+                done = self.slave_send(request, time.monotonic())
+                self.waiting = (name, expected, done, done + REPLY_TIMEOUT)
+                self.pump(math.inf)
+                self.pump(time.monotonic() + self.args.gap)
+
+            if self.args.flood:
+                done, before = self.flood(time.monotonic())
+                self.pump(done + REPLY_TIMEOUT)
+                self.counts["flood frames sent"] = self.args.flood
+                self.counts["flood frames forwarded"] = self.counts["forwarded to slave"] - before
+        finally:
+            if dut:
+                dut.terminate()
+                dut.wait()
+
+    def report(self):
+        print(f"\n{'measurement':<30}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+        for name in sorted(self.samples):
+            values = sorted(self.samples[name])
+            p50, p95, top = (percentile(values, p) * 1000 for p in (50, 95, 100))
+            print(f"{name:<30}{len(values):>6}{p50:>9.0f}{p95:>9.0f}{top:>9.0f}")
+        print()
+        for name, count in sorted(self.counts.items()):
+            print(f"{name:<36}{count:>6}")
+        if self.args.flood and self.counts["flood frames forwarded"] < self.args.flood:
+            print("Not every flood frame reached the slave.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure proxy forwarding latency and the handshake cache")
+    parser.add_argument("--ftc-link", default="/tmp/ftc", help="symlink for the FTC side pty")
+    parser.add_argument("--ftc-device", help="serial device wired to the device's FTC uart instead of a pty")
+    parser.add_argument("--slave-link", default="/tmp/slave", help="symlink for the slave side pty")
+    parser.add_argument("--slave-device", help="serial device wired to the device's proxy uart instead of a pty")
+    parser.add_argument("--baud", type=int, default=2400)
+    parser.add_argument("--slave-baud", type=int, default=2400)
+    parser.add_argument("--latency", type=float, default=60.0, help="FTC processing delay (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="FTC delay standard deviation (ms)")
+    parser.add_argument("--rounds", type=int, default=5, help="times each handshake frame is sent")
+    parser.add_argument("--requests", type=int, default=50, help="GET requests sent through the proxy")
+    parser.add_argument("--flood", type=int, default=30, help="unsolicited FTC frames sent back to back at the end")
+    parser.add_argument("--gap", type=float, default=0.2, help="idle seconds between slave requests")
+    parser.add_argument("--settle", type=float, default=1.0, help="seconds to wait before the first request")
+    parser.add_argument("--exec", help="device under test to start, {ftc} and {slave} are replaced by the pty paths "
+                        "(default: build and start tests/host/proxy_host.cpp unless a --*-device is given, "
+                        "\"\" to start nothing)")
+    Bench(parser.parse_args()).run()
+
+
+if __name__ == "__main__":
+    main()
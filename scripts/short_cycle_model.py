@@ -0,0 +1,363 @@
+# ABOUTME: Short-cycle predictor trained on ecodan_transitions.csv: labelled compressor runs, a logistic model, device thresholds.
+# ABOUTME: Run with: python scripts/short_cycle_model.py [/opt/ecodan/data/ecodan_transitions.csv] [--log ecodan_log.csv] [--short 20] [--out sc.json]
+
+import argparse
+import csv
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+import optimizer_replay as replay
+
+TRANSITIONS_FILE = "/opt/ecodan/data/ecodan_transitions.csv"
+SHORT_MINUTES = 20.0  # the Minimum On Time this installation runs with (docs/heat-pump-system.md)
+RIDGE = 1.0           # L2 penalty on the standardised logistic weights
+CUTOFF = 0.5
+
+# the predictive_short_cycle_high_delta_* number entities of confs/auto-adaptive.yaml: range and step
+THRESHOLDS = np.arange(1.0, 3.0 + 1e-9, 0.5)
+WINDOWS = np.arange(1.0, 5.0 + 1e-9, 0.5)
+DEVICE_DEFAULTS = (1.0, 4.0)
+
+FEATURES = ("outside", "lift", "room_error", "log_off_minutes", "log_previous_minutes")
+
+
+def number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class Episodes:
+    """Heating compressor runs from the transitions log, one array entry per COMP_ON..COMP_OFF pair.
+
+    Context is what the logger saw at COMP_ON: outside, feed and flow target temperatures and
+    the room error. Runs that carried DHW and runs whose start or stop the logger missed are
+    left out; off_minutes and previous_minutes are NaN where the log does not tell.
+    """
+
+    def __init__(self, start, minutes, outside, feed, target, room_error, off_minutes, previous_minutes):
+        self.start = start
+        self.minutes = minutes
+        self.outside = outside
+        self.feed = feed
+        self.target = target
+        self.room_error = room_error
+        self.off_minutes = off_minutes
+        self.previous_minutes = previous_minutes
+
+    def __len__(self):
+        return len(self.minutes)
+
+    def features(self):
+        """The FEATURES matrix, NaN where unknown."""
+        return np.column_stack([
+            self.outside,
+            self.target - self.feed,          # how far the water has to rise
+            self.room_error,
+            np.log1p(self.off_minutes),
+            np.log1p(self.previous_minutes),
+        ])
+
+    def short(self, short_minutes):
+        return self.minutes < short_minutes
+
+    def weeks(self):
+        """Monday of each run's week, as datetime64[D]."""
+        days = self.start.astype("datetime64[D]").astype(np.int64)
+        return (days - (days + 3) % 7).astype("datetime64[D]")
+
+
+def read_episodes(path):
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    rows.sort(key=lambda row: row["timestamp"])
+
+    found = {name: [] for name in ("start", "minutes", "outside", "feed", "target", "room_error", "off", "previous")}
+    running, dhw = None, False
+    last_off, last_minutes = None, math.nan
+    for row in rows:
+        event = row["event"]
+        when = np.datetime64(row["timestamp"].replace(" ", "T"), "s")
+        if event == "COMP_ON":
+            # a second start without a stop: the logger missed the stop, the open run is lost
+            running, dhw = (when, row), number(row.get("dhw_valve")) == 1
+        elif event == "DHW_START" and running is not None:
+            dhw = True
+        elif event == "COMP_OFF":
+            if running is not None:
+                started, context = running
+                minutes = (when - started) / np.timedelta64(60, "s")
+                if not dhw:
+                    found["start"].append(started)
+                    found["minutes"].append(minutes)
+                    found["outside"].append(number(context["outside_temp"]))
+                    found["feed"].append(number(context["feed_temp"]))
+                    found["target"].append(number(context["flow_target_temp"]))
+                    found["room_error"].append(number(context["aa_room_error"]))
+                    found["off"].append((started - last_off) / np.timedelta64(60, "s") if last_off is not None
+                                        else math.nan)
+                    found["previous"].append(last_minutes)
+                last_minutes = minutes
+            else:
+                last_minutes = math.nan
+            last_off, running = when, None
+
+    as_float = {name: np.array(values, dtype=np.float64) for name, values in found.items() if name != "start"}
+    return Episodes(np.array(found["start"], dtype="datetime64[s]"), as_float["minutes"], as_float["outside"],
+                    as_float["feed"], as_float["target"], as_float["room_error"], as_float["off"],
+                    as_float["previous"])
+
+
+# --- logistic model -------------------------------------------------------------
+
+class Logistic:
+    """P(short) = 1 / (1 + exp(-(intercept + coefficients . x))), x in FEATURES units, NaN taken as mean."""
+
+    def __init__(self, mean, intercept, coefficients):
+        self.mean = mean
+        self.intercept = intercept
+        self.coefficients = coefficients
+
+    def probability(self, x):
+        x = np.where(np.isnan(x), self.mean, x)
+        return 1.0 / (1.0 + np.exp(-(self.intercept + x @ self.coefficients)))
+
+    def as_dict(self):
+        return {"intercept": float(self.intercept),
+                "coefficients": dict(zip(FEATURES, self.coefficients.tolist())),
+                "mean": dict(zip(FEATURES, self.mean.tolist())),
+                "cutoff": CUTOFF}
+
+
+def fit_logistic(x, y, ridge=RIDGE, iterations=30):
+    """Ridge logistic regression by Newton steps over all runs at once; weights come back in raw units."""
+    mean = np.nanmean(x, axis=0)
+    mean = np.where(np.isnan(mean), 0.0, mean)
+    scale = np.nanstd(x, axis=0)
+    scale = np.where((scale > 1e-9) & ~np.isnan(scale), scale, 1.0)
+    z = np.nan_to_num((x - mean) / scale)
+    z = np.column_stack([np.ones(len(z)), z])
+    penalty = np.diag([0.0] + [ridge] * (z.shape[1] - 1))
+
+    w = np.zeros(z.shape[1])
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-(z @ w)))
+        gradient = z.T @ (p - y) + penalty @ w
+        hessian = (z * (p * (1.0 - p))[:, None]).T @ z + penalty
+        step = np.linalg.solve(hessian, gradient)
+        w -= step
+        if np.max(np.abs(step)) < 1e-8:
+            break
+
+    coefficients = w[1:] / scale
+    return Logistic(mean, w[0] - coefficients @ mean, coefficients)
+
+
+# --- the device's high delta rule -----------------------------------------------
+
+def high_delta_minutes(history, episodes, horizon_minutes, thresholds=THRESHOLDS):
+    """Longest time per run (rows) and threshold (columns) that feed - flow target stayed at or above it.
+
+    This is what Optimizer::predictive_short_cycle_check_for_zone_ times: the rule fires once
+    the time from the first to the last high row reaches the window. Rows with DHW or defrost
+    reset it, as hands-off does on the device. Only the first horizon_minutes of a run count:
+    every run overshoots on its way to a stop, a prediction is one that comes while a short
+    run could still be stretched.
+    """
+    horizon = np.minimum(episodes.minutes, horizon_minutes)
+    first = np.searchsorted(history.timestamps, episodes.start, side="left")
+    last = np.searchsorted(history.timestamps, episodes.start + np.round(horizon * 60).astype("timedelta64[s]"),
+                           side="left")
+    inside = np.zeros(len(history) + 1, dtype=np.int64)
+    np.add.at(inside, first, 1)
+    np.add.at(inside, last, -1)
+    inside = np.cumsum(inside[:-1]) > 0
+
+    heating = inside & history.compressor & ~history.dhw & ~history.defrost
+    delta = history.feed - history.flow_setpoint
+    high = heating[:, None] & (delta[:, None] >= thresholds[None, :])
+    index = np.arange(len(history))[:, None]
+    # rows since the last row that was not high, per threshold
+    reset = np.maximum.accumulate(np.where(high, -1, index), axis=0)
+    since = np.where(high, index - reset, 0)
+
+    row_minutes = np.median(np.diff(history.t)) / 60.0 if len(history) > 1 else 1.0
+    longest = np.zeros((len(episodes), len(thresholds)))
+    runs = last > first
+    if runs.any():
+        # since is zero between runs, so each run's maximum may reach on to the next run's first row
+        longest[runs] = np.maximum.reduceat(since, first[runs], axis=0)
+    return np.maximum(longest - 1, 0) * row_minutes
+
+
+def rule_fires(longest, windows=WINDOWS):
+    """(runs, thresholds, windows) bool: the rule would have boosted during that run."""
+    return longest[:, :, None] >= windows[None, None, :]
+
+
+def precision_recall(predicted, short):
+    """Precision and recall over the first axis, for every trailing grid point at once."""
+    short = short.reshape((-1,) + (1,) * (predicted.ndim - 1))
+    hits = np.sum(predicted & short, axis=0)
+    fired = np.sum(predicted, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return hits / fired, hits / np.sum(short)
+
+
+def fit_rule(longest, short):
+    """The (threshold, window) setting with the best F1 at telling short runs from long ones."""
+    precision, recall = precision_recall(rule_fires(longest), short)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        f1 = np.nan_to_num(2 * precision * recall / (precision + recall))
+    i, j = np.unravel_index(np.argmax(f1), f1.shape)
+    return float(THRESHOLDS[i]), float(WINDOWS[j])
+
+
+def fires_with(longest, setting):
+    threshold, window = setting
+    return longest[:, int(np.argmin(np.abs(THRESHOLDS - threshold)))] >= window
+
+
+# --- evaluation over held-out weeks ---------------------------------------------
+
+def auc(score, short):
+    """Area under the ROC curve: the chance a short run scores above a long one."""
+    positives, negatives = np.sum(short), np.sum(~short)
+    if not positives or not negatives:
+        return math.nan
+    order = np.argsort(score, kind="stable")
+    ranks = np.empty(len(score))
+    ranks[order] = np.arange(1, len(score) + 1)
+    return (np.sum(ranks[short]) - positives * (positives + 1) / 2) / (positives * negatives)
+
+
+def evaluate(episodes, short, longest=None):
+    """Leave one week out: every week predicted by models fitted on all the other weeks.
+
+    Returns per-week rows and the pooled held-out predictions. Runs that ran with the device's
+    boost active are scored as they ended, the boost's own effect is not undone.
+    """
+    x = episodes.features()
+    weeks = episodes.weeks()
+    probability = np.full(len(episodes), np.nan)
+    fired = np.zeros(len(episodes), dtype=bool)
+    rows = []
+    for week in np.unique(weeks):
+        held = weeks == week
+        if held.all() or np.sum(short[~held]) == 0:
+            continue
+        model = fit_logistic(x[~held], short[~held])
+        probability[held] = model.probability(x[held])
+        setting = None
+        if longest is not None:
+            setting = fit_rule(longest[~held], short[~held])
+            fired[held] = fires_with(longest[held], setting)
+        rows.append((week, held, setting))
+    return rows, probability, fired
+
+
+def scores(predicted, short):
+    precision, recall = precision_recall(predicted, short)
+    return float(precision), float(recall)
+
+
+def pr_text(predicted, short):
+    precision, recall = scores(predicted, short)
+    return f"{_fmt(precision)}/{_fmt(recall)}"
+
+
+def _fmt(value):
+    return "-" if value is None or math.isnan(value) else f"{value:.2f}"
+
+
+def report(episodes, short_minutes, rows, probability, fired, longest):
+    short = episodes.short(short_minutes)
+    previous_short = episodes.previous_minutes < short_minutes
+    print(f"{'week':<12}{'runs':>6}{'short':>7}{'AUC':>7}{'Brier':>7}{'logistic P/R':>14}"
+          f"{'persist P/R':>13}" + (f"{'rule P/R':>12}{'default P/R':>13}{'setting':>10}" if longest is not None else ""))
+    for week, held, setting in rows:
+        s = short[held]
+        p = probability[held]
+        line = (f"{str(week):<12}{held.sum():>6}{s.mean():>7.0%}{_fmt(auc(p, s)):>7}{np.mean((p - s) ** 2):>7.3f}"
+                f"{pr_text(p >= CUTOFF, s):>14}{pr_text(previous_short[held], s):>13}")
+        if longest is not None:
+            default = fires_with(longest[held], DEVICE_DEFAULTS)
+            line += f"{pr_text(fired[held], s):>12}{pr_text(default, s):>13}{f'{setting[0]:g}/{setting[1]:g}':>10}"
+        print(line)
+
+    held = ~np.isnan(probability)
+    if not held.any():
+        return {}
+    s, p = short[held], probability[held]
+    pooled = {"runs": int(held.sum()), "short_share": float(s.mean()), "auc": auc(p, s),
+              "brier": float(np.mean((p - s) ** 2)),
+              "logistic": scores(p >= CUTOFF, s), "persistence": scores(previous_short[held], s)}
+    line = (f"{'held out':<12}{held.sum():>6}{s.mean():>7.0%}{_fmt(pooled['auc']):>7}{pooled['brier']:>7.3f}"
+            f"{pr_text(p >= CUTOFF, s):>14}{pr_text(previous_short[held], s):>13}")
+    if longest is not None:
+        default = fires_with(longest[held], DEVICE_DEFAULTS)
+        pooled["rule"] = scores(fired[held], s)
+        pooled["device_defaults"] = scores(default, s)
+        line += f"{pr_text(fired[held], s):>12}{pr_text(default, s):>13}"
+    print(line)
+    return pooled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit and evaluate a short-cycle predictor from the transitions log")
+    parser.add_argument("transitions", nargs="?", default=TRANSITIONS_FILE, help="mqtt_logger transitions CSV")
+    parser.add_argument("--log", default=replay.LOG_FILE,
+                        help="mqtt_logger CSV for the feed - target history inside runs (device rule fit)")
+    parser.add_argument("--short", type=float, default=SHORT_MINUTES, help="runs shorter than this are short (min)")
+    parser.add_argument("--out", help="write the coefficients, device settings and evaluation as JSON")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    episodes = read_episodes(args.transitions)
+    if len(episodes) < 20:
+        raise SystemExit(f"{args.transitions}: only {len(episodes)} complete heating runs, too few to fit.")
+    short = episodes.short(args.short)
+    if short.all() or not short.any():
+        raise SystemExit(f"All {len(episodes)} runs fall on one side of {args.short:g} min, nothing to learn.")
+
+    longest = None
+    if args.log and os.path.exists(args.log):
+        history = replay.load_history(args.log)
+        longest = high_delta_minutes(history, episodes, args.short)
+    else:
+        print(f"{args.log} not found: fitting the logistic model only, not the device's high delta settings.")
+
+    print(f"{len(episodes)} heating runs, {short.sum()} shorter than {args.short:g} min "
+          f"({short.mean():.0%}), {len(np.unique(episodes.weeks()))} weeks\n")
+    rows, probability, fired = evaluate(episodes, short, longest)
+    pooled = report(episodes, args.short, rows, probability, fired, longest)
+
+    model = fit_logistic(episodes.features(), short)
+    print(f"\nlogistic model on all runs, P(short) = 1 / (1 + exp(-z)), z = {model.intercept:+.3f}")
+    for name, weight, mean in zip(FEATURES, model.coefficients, model.mean):
+        print(f"  {weight:+9.4f} * {name:<22} (mean {mean:.2f}, used when missing)")
+
+    result = {"short_minutes": args.short, "runs": len(episodes), "logistic": model.as_dict(), "held_out": pooled}
+    if longest is not None:
+        threshold, window = fit_rule(longest, short)
+        precision, recall = scores(fires_with(longest, (threshold, window)), short)
+        print(f"\ndevice settings: predictive_short_cycle_high_delta_threshold {threshold:g} C, "
+              f"predictive_short_cycle_high_delta_time_window {window:g} min "
+              f"(precision {_fmt(precision)}, recall {_fmt(recall)} on all runs)")
+        result["device"] = {"predictive_short_cycle_high_delta_threshold": threshold,
+                            "predictive_short_cycle_high_delta_time_window": window}
+    print(f"\n{time.perf_counter() - started:.1f} s")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"{args.out}: model saved")
+
+
+if __name__ == "__main__":
+    main()
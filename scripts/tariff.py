@@ -0,0 +1,288 @@
+# ABOUTME: Tariff calendar: compiles a schedule (seasons, day types, holidays, price tiers, spot prices) into per-year boundary tables.
+# ABOUTME: Run with: python scripts/tariff.py [--schedule /opt/ecodan/tariff.json] [--spot prices.csv] [--year 2026]
+
+import argparse
+import bisect
+import csv
+import json
+import time
+from datetime import date, datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1)
+
+# The Croatian two-tariff schedule get_tariff_period used to hard-code: NT 22-08 in summer
+# time, 21-07 otherwise, switching on the dates of the EU DST changes.
+DEFAULT_SCHEDULE = {
+    "name": "HR two-tariff (NT/VT)",
+    "default": "VT",
+    "tiers": {
+        "NT": {"label": "Night (NT)"},
+        "VT": {"label": "Day (VT)"},
+    },
+    "seasons": [
+        {"name": "summer", "from": "dst_start", "to": "dst_end",
+         "rules": [{"from": "22:00", "to": "08:00", "tier": "NT"}]},
+        {"name": "winter",
+         "rules": [{"from": "21:00", "to": "07:00", "tier": "NT"}]},
+    ],
+}
+
+DAY_TYPES = ("weekday", "weekend", "holiday")
+
+
+def seconds(when):
+    """Wall clock seconds since 1970 of a naive local datetime, the key of the boundary tables."""
+    return (when - EPOCH).total_seconds()
+
+
+def last_sunday(year, month, last_day):
+    end = date(year, month, last_day)
+    return end - timedelta(days=(end.weekday() + 1) % 7)
+
+
+def season_day(token, year):
+    """A season edge: MM-DD, or dst_start / dst_end (last Sunday of March / October)."""
+    if token == "dst_start":
+        return last_sunday(year, 3, 31)
+    if token == "dst_end":
+        return last_sunday(year, 10, 31)
+    month, day = (int(part) for part in token.split("-"))
+    return date(year, month, day)
+
+
+def minute_of_day(text):
+    hours, minutes = (int(part) for part in text.split(":"))
+    return hours * 60 + minutes
+
+
+class SpotPrices:
+    """Hourly (or any interval) prices from a CSV with timestamp,price columns; a price holds until the next."""
+
+    def __init__(self, path):
+        rows = []
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                try:
+                    when = datetime.strptime(row["timestamp"][:16], "%Y-%m-%d %H:%M")
+                    rows.append((seconds(when), float(row["price"])))
+                except (KeyError, ValueError):
+                    continue
+        if not rows:
+            raise SystemExit(f"{path}: no timestamp,price rows.")
+        rows.sort()
+        self.starts = [start for start, _ in rows]
+        self.values = [value for _, value in rows]
+
+    def at(self, when_s):
+        i = bisect.bisect_right(self.starts, when_s) - 1
+        return self.values[i] if i >= 0 else None
+
+    def bulk(self, when_s):
+        import numpy as np
+
+        i = np.searchsorted(np.asarray(self.starts), when_s, side="right") - 1
+        return np.where(i >= 0, np.asarray(self.values)[np.maximum(i, 0)], np.nan)
+
+
+class Tariff:
+    """A schedule compiled into sorted boundary tables, one per year, built when a year is first used.
+
+    A table is two parallel lists, the wall clock seconds each stretch starts at and its tier
+    index, so the tier at any time is one bisect: O(log n). classify() does a whole array of
+    timestamps with one searchsorted.
+
+    Schedule (see DEFAULT_SCHEDULE): tiers by name, each with an optional label and price
+    (a number, or "spot" for the spot price plus an optional "adder"); a default tier; seasons
+    tried in order, the first whose from..to (inclusive, may wrap the new year) holds the
+    date applies, a season without from/to holds all year; rules within a season, each a
+    from..to time of day (wrapping past midnight marks both ends of the same day) on some
+    day types (weekday, weekend, holiday; all without "days"), later rules win; holidays
+    as MM-DD for every year or YYYY-MM-DD.
+    """
+
+    def __init__(self, schedule, spot=None):
+        self.name = schedule.get("name", "tariff")
+        self.tiers = list(schedule["tiers"])
+        self.tier_info = {name: dict(info) for name, info in schedule["tiers"].items()}
+        self.default = self.tiers.index(schedule.get("default", self.tiers[0]))
+        self.seasons = schedule["seasons"]
+        self.holidays = set(schedule.get("holidays", []))
+        self.spot = spot
+        for season in self.seasons:
+            for rule in season.get("rules", []):
+                if rule["tier"] not in self.tier_info:
+                    raise SystemExit(f"{self.name}: rule tier {rule['tier']} is not one of {self.tiers}")
+                unknown = set(rule.get("days", DAY_TYPES)) - set(DAY_TYPES)
+                if unknown:
+                    raise SystemExit(f"{self.name}: unknown day types {sorted(unknown)}")
+        if spot is None and any(info.get("price") == "spot" for info in self.tier_info.values()):
+            raise SystemExit(f"{self.name}: a tier is priced at the spot price, pass the spot price CSV.")
+        self.tables = {}
+
+    def label(self, tier):
+        return self.tier_info[tier].get("label", tier)
+
+    def season_for(self, day):
+        for season in self.seasons:
+            if "from" not in season:
+                return season
+            start, end = season_day(season["from"], day.year), season_day(season["to"], day.year)
+            if (start <= day <= end) if start <= end else (day >= start or day <= end):
+                return season
+        return None
+
+    def day_type(self, day):
+        if f"{day:%m-%d}" in self.holidays or day.isoformat() in self.holidays:
+            return "holiday"
+        return "weekend" if day.weekday() >= 5 else "weekday"
+
+    def day_minutes(self, day):
+        """The tier of each minute of day, as [(start minute, tier index)] stretches."""
+        tiers = [self.default] * 1440
+        season = self.season_for(day)
+        kind = self.day_type(day)
+        for rule in season.get("rules", []) if season else []:
+            if kind not in rule.get("days", DAY_TYPES):
+                continue
+            start, end = minute_of_day(rule["from"]), minute_of_day(rule["to"])
+            tier = self.tiers.index(rule["tier"])
+            spans = [(start, end)] if start < end else [(start, 1440), (0, end)]
+            for a, b in spans:
+                tiers[a:b] = [tier] * (b - a)
+        return [(minute, tier) for minute, tier in enumerate(tiers) if minute == 0 or tiers[minute - 1] != tier]
+
+    def table(self, year):
+        """(starts, tiers) for year: the stretches in order, equal neighbours merged."""
+        if year not in self.tables:
+            starts, tiers = [], []
+            day = date(year, 1, 1)
+            while day.year == year:
+                base = seconds(datetime(day.year, day.month, day.day))
+                for minute, tier in self.day_minutes(day):
+                    if not tiers or tiers[-1] != tier:
+                        starts.append(base + minute * 60)
+                        tiers.append(tier)
+                day += timedelta(days=1)
+            self.tables[year] = (starts, tiers)
+        return self.tables[year]
+
+    def index(self, when):
+        starts, tiers = self.table(when.year)
+        return tiers[bisect.bisect_right(starts, seconds(when)) - 1]
+
+    def period(self, when):
+        """The tier name at a naive local datetime."""
+        return self.tiers[self.index(when)]
+
+    def price(self, when):
+        """The price at when, None when the tier has none (or no spot price is known yet)."""
+        info = self.tier_info[self.period(when)]
+        price = info.get("price")
+        if price == "spot":
+            spot = self.spot.at(seconds(when))
+            return None if spot is None else spot + info.get("adder", 0.0)
+        return price
+
+    def bulk_tables(self, stamps):
+        """The tables of every year from the first to the last of stamps as one pair of arrays.
+
+        A stretch running on over new year (NT across midnight) stays one stretch.
+        """
+        import numpy as np
+
+        years = stamps.astype("datetime64[Y]").astype(np.int64) + 1970
+        starts, tiers = [], []
+        for year in range(int(years.min()), int(years.max()) + 1):
+            s, t = self.table(year)
+            skip = 1 if tiers and tiers[-1][-1] == t[0] else 0
+            starts.append(np.asarray(s[skip:], dtype=np.float64))
+            tiers.append(np.asarray(t[skip:], dtype=np.int64))
+        return np.concatenate(starts), np.concatenate(tiers)
+
+    def locate(self, stamps):
+        """(stretch, starts, tiers): the stretch each datetime64 in stamps falls in, with one searchsorted.
+
+        stretch indexes starts (the seconds each stretch begins at) and tiers; two stamps share a
+        stretch exactly when they fall in the same uninterrupted tariff period.
+        """
+        import numpy as np
+
+        stamps = np.asarray(stamps, dtype="datetime64[s]")
+        if not len(stamps):
+            return np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0, dtype=np.int64)
+        starts, tiers = self.bulk_tables(stamps)
+        stretch = np.searchsorted(starts, stamps.astype(np.int64).astype(np.float64), side="right") - 1
+        return stretch, starts, tiers
+
+    def classify(self, stamps):
+        """Tier index of every datetime64 in stamps."""
+        stretch, _, tiers = self.locate(stamps)
+        return tiers[stretch]
+
+    def prices(self, stamps):
+        """Price of every datetime64 in stamps, NaN where there is none."""
+        import numpy as np
+
+        index = self.classify(stamps)
+        fixed = np.array([info.get("price") if isinstance(info.get("price"), (int, float)) else np.nan
+                          for info in self.tier_info.values()], dtype=np.float64)
+        result = fixed[index]
+        spot_tiers = [i for i, info in enumerate(self.tier_info.values()) if info.get("price") == "spot"]
+        if spot_tiers:
+            adders = np.array([info.get("adder", 0.0) for info in self.tier_info.values()])
+            on_spot = np.isin(index, spot_tiers)
+            when_s = np.asarray(stamps, dtype="datetime64[s]").astype(np.int64).astype(np.float64)
+            result[on_spot] = self.spot.bulk(when_s[on_spot]) + adders[index[on_spot]]
+        return result
+
+
+def load_tariff(path=None, spot_path=None):
+    """The schedule in path (JSON), DEFAULT_SCHEDULE without one; spot prices from spot_path or the schedule."""
+    schedule = DEFAULT_SCHEDULE
+    if path:
+        with open(path) as f:
+            schedule = json.load(f)
+    spot_path = spot_path or schedule.get("spot_prices")
+    return Tariff(schedule, SpotPrices(spot_path) if spot_path else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show a compiled tariff calendar")
+    parser.add_argument("--schedule", help="schedule JSON (the built-in HR NT/VT schedule without)")
+    parser.add_argument("--spot", help="spot price CSV (timestamp,price)")
+    parser.add_argument("--year", type=int, default=datetime.now().year)
+    args = parser.parse_args()
+
+    tariff = load_tariff(args.schedule, args.spot)
+    start = time.perf_counter()
+    starts, tiers = tariff.table(args.year)
+    compiled = time.perf_counter() - start
+    print(f"{tariff.name}, {args.year}: {len(starts)} stretches, compiled in {compiled * 1000:.0f} ms")
+
+    # the year's distinct daily patterns and the dates they run between
+    day, patterns = date(args.year, 1, 1), []
+    while day.year == args.year:
+        pattern = tuple((f"{minute // 60:02d}:{minute % 60:02d}", tariff.tiers[tier])
+                        for minute, tier in tariff.day_minutes(day))
+        if patterns and patterns[-1][2] == pattern:
+            patterns[-1][1] = day
+        else:
+            patterns.append([day, day, pattern])
+        day += timedelta(days=1)
+    for first, last, pattern in patterns:
+        print(f"  {first:%m-%d} .. {last:%m-%d}  " + "  ".join(f"{at} {tier}" for at, tier in pattern))
+
+    import numpy as np
+
+    stamps = np.arange(np.datetime64(f"{args.year}-01-01"), np.datetime64(f"{args.year + 1}-01-01"),
+                       np.timedelta64(60, "s"))
+    start = time.perf_counter()
+    index = tariff.classify(stamps)
+    elapsed = time.perf_counter() - start
+    shares = np.bincount(index, minlength=len(tariff.tiers)) / len(index)
+    print(f"\n{len(stamps)} minutes classified in {elapsed * 1000:.0f} ms: "
+          + ", ".join(f"{tier} {share:.1%}" for tier, share in zip(tariff.tiers, shares)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# ABOUTME: Recomputes consumed/produced/COP/cost per tariff period over all CSV logs from the daily energy counters.
+# ABOUTME: Run with: python scripts/tariff_cop.py ['/opt/ecodan/data/ecodan_log*.csv'] [--schedule tariff.json] [--spot prices.csv] [--out periods.csv]
+
+import argparse
+import csv
+import glob
+import math
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import numpy as np
+
+from optimizer_replay import column_values
+from tariff import EPOCH, load_tariff
+
+LOG_PATTERN = "/opt/ecodan/data/ecodan_log*.csv"
+COUNTERS = ("daily_consumed_kwh", "daily_produced_kwh")
+RESET_MINUTES = 10  # a counter drop this close to midnight, or across it, is the daily reset (consumed resets at 23:59)
+
+
+def read_counters(paths):
+    """Timestamps (datetime64[s]) and the COUNTERS as float arrays over all logs, in time order."""
+    stamps, columns = [], {name: [] for name in COUNTERS}
+    for path in paths:
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header or "timestamp" not in header:
+                continue
+            position = {name: i for i, name in enumerate(header)}
+            rows = list(reader)
+        stamps.append(np.array([row[0] for row in rows], dtype="datetime64[s]"))
+        for name in COUNTERS:
+            i = position.get(name)
+            if i is None:
+                columns[name].append(np.full(len(rows), np.nan))
+                continue
+            columns[name].append(column_values([row[i] if i < len(row) else "" for row in rows]))
+    if not stamps:
+        return np.zeros(0, dtype="datetime64[s]"), {name: np.zeros(0) for name in COUNTERS}
+
+    stamps = np.concatenate(stamps)
+    order = np.argsort(stamps, kind="stable")
+    stamps = stamps[order]
+    # rotated logs may overlap by a row; keep the first of equal timestamps
+    keep = np.concatenate([[True], stamps[1:] != stamps[:-1]])
+    return stamps[keep], {name: np.concatenate(values)[order][keep] for name, values in columns.items()}
+
+
+def counter_steps(stamps, values):
+    """kWh each sample adds to a daily counter, 0 on samples without a reading.
+
+    A drop across midnight (or within RESET_MINUTES of it) is the reset and the new value is
+    the step. Any other drop is a glitch: the running maximum since the last reset ignores it,
+    so the counter is not counted twice when it comes back.
+    """
+    steps = np.zeros(len(values))
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) < 2:
+        return steps
+    s, v = stamps[valid], values[valid]
+    day = s.astype("datetime64[D]")
+    minute = (s - day).astype(np.int64) / 60.0
+    near_midnight = (minute <= RESET_MINUTES) | (minute >= 1440 - RESET_MINUTES)
+    reset = (v[1:] < v[:-1]) & ((day[1:] != day[:-1]) | near_midnight[1:] | near_midnight[:-1])
+
+    # offsetting each reset segment above the previous one lets one accumulate run over all of them
+    segment = np.concatenate([[0], np.cumsum(reset)])
+    offset = segment * (np.nanmax(v) + 1.0)
+    monotone = np.maximum.accumulate(v + offset) - offset
+    steps[valid[1:]] = np.where(reset, monotone[1:], np.diff(monotone))
+    return steps
+
+
+class Period(NamedTuple):
+    """One uninterrupted tariff period as far as the logs cover it."""
+    tariff: str
+    start: datetime
+    end: datetime
+    consumed: float
+    produced: float
+    cost: float  # NaN when the tier has no price
+
+    @property
+    def cop(self):
+        return round(self.produced / self.consumed, 2) if self.consumed > 0.1 else 0.0
+
+    def as_entry(self):
+        """The period as a period_cop history entry of mqtt_logger."""
+        return {"tariff": self.tariff, "start": f"{self.start:%Y-%m-%d %H:%M}", "end": f"{self.end:%Y-%m-%d %H:%M}",
+                "consumed": round(self.consumed, 2), "produced": round(self.produced, 2), "cop": self.cop}
+
+
+def to_datetime(when_s):
+    return EPOCH + timedelta(seconds=float(when_s))
+
+
+def tariff_periods(tariff, stamps, consumed, produced):
+    """Periods with the counter steps summed into them, all samples at once.
+
+    A step goes to the period of the sample that shows it, as the live tracker does. A period
+    runs from its tariff boundary (or the first sample) to the next boundary (or the last sample).
+    """
+    if not len(stamps):
+        return []
+    stretch, starts, tiers = tariff.locate(stamps)
+    ids, first, inverse = np.unique(stretch, return_index=True, return_inverse=True)
+    consumed_sum = np.bincount(inverse, consumed, minlength=len(ids))
+    produced_sum = np.bincount(inverse, produced, minlength=len(ids))
+    prices = tariff.prices(stamps)
+    cost = np.bincount(inverse, consumed * np.nan_to_num(prices), minlength=len(ids))
+    priced = np.bincount(inverse, ~np.isnan(prices), minlength=len(ids)) > 0
+
+    stamp_s = stamps.astype(np.int64).astype(np.float64)
+    last_s = stamp_s[-1]
+    begin = np.maximum(starts[ids], stamp_s[first])
+    following = np.append(starts, math.inf)[ids + 1]
+    end = np.minimum(following, last_s)
+    return [Period(tariff.tiers[tiers[i]], to_datetime(b), to_datetime(e), float(c), float(p),
+                   float(k) if has_price else math.nan)
+            for i, b, e, c, p, k, has_price in zip(ids.tolist(), begin.tolist(), end.tolist(), consumed_sum.tolist(),
+                                                   produced_sum.tolist(), cost.tolist(), priced.tolist())]
+
+
+def recompute(tariff, pattern=LOG_PATTERN):
+    """(periods, stamps, counter values) over every log matching pattern."""
+    paths = sorted(glob.glob(pattern))
+    stamps, counters = read_counters(paths)
+    consumed = counter_steps(stamps, counters["daily_consumed_kwh"])
+    produced = counter_steps(stamps, counters["daily_produced_kwh"])
+    return tariff_periods(tariff, stamps, consumed, produced), stamps, counters
+
+
+def live_state(tariff, pattern, now, history_length):
+    """mqtt_logger's period_cop state rebuilt from the logs.
+
+    Completed periods become the history. When now is still in the period the logs end in,
+    that period carries on as the current one, with the last counter readings as the previous
+    values so the live deltas continue from them.
+    """
+    periods, stamps, counters = recompute(tariff, pattern)
+    state = {"history": [], "current_tariff": None, "period_start": None, "consumed_prev": None,
+             "produced_prev": None, "period_consumed": 0.0, "period_produced": 0.0}
+    if not periods:
+        return state
+    now_stretch = tariff.locate(np.array([now], dtype="datetime64[s]"))[0][0]
+    last_stretch = tariff.locate(stamps[-1:])[0][0]
+    completed = periods if now_stretch != last_stretch else periods[:-1]
+    state["history"] = [period.as_entry() for period in completed[-history_length:]]
+    if now_stretch == last_stretch:
+        current = periods[-1]
+
+        def last_reading(values):
+            valid = values[~np.isnan(values)]
+            return float(valid[-1]) if len(valid) else None
+
+        state.update({"current_tariff": current.tariff, "period_start": f"{current.start:%Y-%m-%d %H:%M}",
+                      "consumed_prev": last_reading(counters["daily_consumed_kwh"]),
+                      "produced_prev": last_reading(counters["daily_produced_kwh"]),
+                      "period_consumed": current.consumed, "period_produced": current.produced})
+    return state
+
+
+def _fmt(value, digits=2):
+    return "-" if math.isnan(value) else f"{value:.{digits}f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per tariff period consumed/produced/COP/cost over all logs")
+    parser.add_argument("logs", nargs="?", default=LOG_PATTERN, help="glob of mqtt_logger CSVs")
+    parser.add_argument("--schedule", help="tariff schedule JSON (the built-in HR NT/VT schedule without)")
+    parser.add_argument("--spot", help="spot price CSV (timestamp,price)")
+    parser.add_argument("--last", type=int, default=10, help="periods to list")
+    parser.add_argument("--out", help="write every period as CSV")
+    args = parser.parse_args()
+
+    tariff = load_tariff(args.schedule, args.spot)
+    start = time.perf_counter()
+    periods, stamps, _ = recompute(tariff, args.logs)
+    elapsed = time.perf_counter() - start
+    if not periods:
+        raise SystemExit(f"No logged samples in {args.logs}.")
+
+    print(f"{len(stamps)} samples, {len(periods)} {tariff.name} periods from {periods[0].start:%Y-%m-%d} "
+          f"to {periods[-1].end:%Y-%m-%d}, {elapsed:.2f} s\n")
+    print(f"{'tariff':<8}{'periods':>8}{'consumed':>10}{'produced':>10}{'COP':>6}{'cost':>10}")
+    for tier in tariff.tiers:
+        chosen = [p for p in periods if p.tariff == tier]
+        if not chosen:
+            continue
+        consumed = sum(p.consumed for p in chosen)
+        produced = sum(p.produced for p in chosen)
+        costs = [p.cost for p in chosen if not math.isnan(p.cost)]
+        cop = produced / consumed if consumed > 0.1 else 0.0
+        print(f"{tier:<8}{len(chosen):>8}{consumed:>10.1f}{produced:>10.1f}{cop:>6.2f}"
+              f"{_fmt(sum(costs) if costs else math.nan):>10}")
+
+    print(f"\n{'tariff':<8}{'start':<18}{'end':<18}{'consumed':>9}{'produced':>9}{'COP':>6}{'cost':>8}")
+    for p in periods[-args.last:]:
+        print(f"{p.tariff:<8}{p.start:%Y-%m-%d %H:%M}  {p.end:%Y-%m-%d %H:%M}  {p.consumed:>9.2f}{p.produced:>9.2f}"
+              f"{p.cop:>6.2f}{_fmt(p.cost):>8}")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["tariff", "start", "end", "consumed_kwh", "produced_kwh", "cop", "cost"])
+            for p in periods:
+                writer.writerow([p.tariff, f"{p.start:%Y-%m-%d %H:%M}", f"{p.end:%Y-%m-%d %H:%M}",
+                                 f"{p.consumed:.3f}", f"{p.produced:.3f}", f"{p.cop:.2f}", _fmt(p.cost, 4)])
+        print(f"\n{args.out}: {len(periods)} periods")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# ABOUTME: Fits a weather compensation curve from logged steady heating: the lowest flow per outside temperature that held the room.
+# ABOUTME: Run with: python scripts/weather_curve.py /opt/ecodan/data/ecodan_log.csv [--target 21] [--bin 1] [--out curve.json]
+
+import argparse
+import json
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+import optimizer_replay as replay
+
+STEADY_MINUTES = 60     # a row is steady when the hour up to it was all heating with the room at target
+ROOM_TOLERANCE = 0.2    # +- C around the room target
+MAX_ROW_GAP_S = 300     # windows over longer logging gaps are not steady
+QUANTILE = 0.1          # "minimal" flow of a bin, a low quantile rather than the single lowest window
+MIN_HOURS = 2.0         # bins with less steady heating are left out of the curve
+
+
+def steady_rows(history, window_minutes=STEADY_MINUTES, tolerance=ROOM_TOLERANCE):
+    """Rows ending a window of steady heating: compressor on, no defrost, DHW or lockout, room within tolerance.
+
+    Also returns the mean feed temperature over each window. Sliding window views keep it
+    vectorised over years of rows.
+    """
+    step_s = float(np.median(np.diff(history.t))) if len(history) > 1 else 60.0
+    n = max(int(round(window_minutes * 60 / step_s)), 1)
+    if len(history) < n:
+        return np.zeros(len(history), dtype=bool), np.full(len(history), np.nan)
+
+    room = replay.forward_fill(history.room)
+    heating = history.compressor & ~history.defrost & ~history.dhw & ~history.lockout
+    ok = heating & (np.abs(room - history.target) <= tolerance) & ~np.isnan(history.feed) & ~np.isnan(history.outside)
+
+    windows = np.lib.stride_tricks.sliding_window_view
+    all_ok = windows(ok, n).all(axis=1)
+    span = history.t[n - 1:] - history.t[:len(history) - n + 1]
+    all_ok &= span <= (n - 1) * step_s + MAX_ROW_GAP_S
+    feed = windows(np.nan_to_num(history.feed), n).mean(axis=1)
+
+    steady = np.zeros(len(history), dtype=bool)
+    steady[n - 1:] = all_ok
+    mean_feed = np.full(len(history), np.nan)
+    mean_feed[n - 1:] = np.where(all_ok, feed, np.nan)
+    return steady, mean_feed
+
+
+class Bins(NamedTuple):
+    """Steady heating per outside temperature bin; arrays over the bins that have any."""
+    outside: np.ndarray   # bin centres
+    hours: np.ndarray
+    mean_feed: np.ndarray
+    low_feed: np.ndarray  # QUANTILE of the window mean feed
+
+
+def binned(history, steady, mean_feed, width=1.0, quantile=QUANTILE):
+    """Per bin counts, means and a quantile with one sort for all bins instead of a loop over them."""
+    outside = history.outside[steady]
+    feed = mean_feed[steady]
+    if not len(feed):
+        return Bins(*(np.zeros(0) for _ in range(4)))
+    index = np.floor(outside / width).astype(np.int64)
+    order = np.lexsort((feed, index))
+    index, feed = index[order], feed[order]
+    keys, first, counts = np.unique(index, return_index=True, return_counts=True)
+    low = feed[first + np.floor(quantile * (counts - 1)).astype(np.int64)]
+    mean = np.add.reduceat(feed, first) / counts
+    step_h = float(np.median(np.diff(history.t))) / 3600.0 if len(history) > 1 else 1.0 / 60.0
+    return Bins((keys + 0.5) * width, counts * step_h, mean, low)
+
+
+def isotonic_decreasing(y, weight):
+    """Weighted least squares fit of y that never rises with the index: pool adjacent violators."""
+    values, weights, sizes = [], [], []
+    for v, w in zip(y.tolist(), weight.tolist()):
+        values.append(v)
+        weights.append(w)
+        sizes.append(1)
+        while len(values) > 1 and values[-2] < values[-1]:
+            w = weights[-2] + weights[-1]
+            values[-2] = (values[-2] * weights[-2] + values[-1] * weights[-1]) / w
+            weights[-2] = w
+            sizes[-2] += sizes[-1]
+            del values[-1], weights[-1], sizes[-1]
+    return np.repeat(values, sizes)
+
+
+class Curve(NamedTuple):
+    outside: np.ndarray
+    flow: np.ndarray
+
+    def flow_at(self, outside):
+        """The curve's flow temperature, held flat beyond its ends."""
+        return np.interp(outside, self.outside, self.flow)
+
+    def as_dict(self):
+        return {"points": [{"outside": round(float(o), 1), "flow": round(float(f), 1)}
+                           for o, f in zip(self.outside, self.flow)],
+                # the zone flow limits the optimizer clamps to, from the curve's ends
+                "minimum_heating_flow_temp": replay.round_nearest(float(self.flow.min())),
+                "maximum_heating_flow_temp": replay.round_nearest(float(self.flow.max()))}
+
+
+def fit_curve(bins, min_hours=MIN_HOURS):
+    """Isotonic fit of the bins' low flow over outside temperature, weighted by steady hours."""
+    keep = bins.hours >= min_hours
+    if keep.sum() < 2:
+        raise SystemExit(f"Only {keep.sum()} outside temperature bins have {min_hours:g} h of steady heating, "
+                         "too few for a curve.")
+    return Curve(bins.outside[keep], isotonic_decreasing(bins.low_feed[keep], bins.hours[keep]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fit a monotone weather compensation curve from steady heating")
+    parser.add_argument("log", nargs="?", default=replay.LOG_FILE, help="mqtt_logger CSV (ecodan_log.csv)")
+    parser.add_argument("--target", type=float, help="room target; recovered from aa_room_error when not given")
+    parser.add_argument("--bin", type=float, default=1.0, help="outside temperature bin width (C)")
+    parser.add_argument("--window", type=float, default=STEADY_MINUTES, help="minutes of steady heating per window")
+    parser.add_argument("--min-hours", type=float, default=MIN_HOURS, help="steady hours a bin needs")
+    parser.add_argument("--out", help="write the curve table as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    history = replay.load_history(args.log, args.target)
+    if not len(history):
+        raise SystemExit("The log has no rows.")
+    if np.isnan(history.target).all():
+        raise SystemExit("No room target: the log has no aa_room_error, pass --target.")
+    steady, mean_feed = steady_rows(history, args.window)
+    bins = binned(history, steady, mean_feed, args.bin)
+    curve = fit_curve(bins, args.min_hours)
+    elapsed = time.perf_counter() - start
+
+    days = (history.t[-1] - history.t[0]) / 86400.0 if len(history) > 1 else 0.0
+    print(f"{len(history)} rows over {days:.0f} days, {steady.mean():.1%} steady ({args.window:g} min windows, "
+          f"room within {ROOM_TOLERANCE:g} C of target), {elapsed * 1000:.0f} ms\n")
+    print(f"{'outside':>8}{'hours':>8}{'mean feed':>11}{f'p{QUANTILE * 100:.0f} feed':>10}{'curve':>8}")
+    fitted = dict(zip(curve.outside.tolist(), curve.flow.tolist()))
+    for outside, hours, mean, low in zip(*bins):
+        flow = fitted.get(outside, math.nan)
+        print(f"{outside:>8.1f}{hours:>8.1f}{mean:>11.1f}{low:>10.1f}" + (f"{flow:>8.1f}" if not math.isnan(flow) else
+                                                                         f"{'-':>8}"))
+    table = curve.as_dict()
+    print(f"\nflow limits from the curve: minimum {table['minimum_heating_flow_temp']:g} C, "
+          f"maximum {table['maximum_heating_flow_temp']:g} C")
+
+    if args.out:
+        table.update({"bin_width": args.bin, "window_minutes": args.window, "quantile": QUANTILE})
+        with open(args.out, "w") as f:
+            json.dump(table, f, indent=2)
+        print(f"{args.out}: curve saved")
+
+
+if __name__ == "__main__":
+    main()
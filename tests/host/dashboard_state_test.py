@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# ABOUTME: Host test of the /dashboard/state serializer (components/asgard_dashboard/state_json.h): JSON shape, buffer size, allocations.
+# ABOUTME: Run with: python tests/host/dashboard_state_test.py
+"""Build the serializer with g++ against the stand-in entity headers next to this file.
+
+The field tables and the buffer size come from components/asgard_dashboard/__init__.py, so this
+checks the same numbers codegen hands the device. Every scenario must parse with json.loads,
+keep the table's keys and order, fit the buffer state_buffer_size() gives its fields, write
+nothing past it, and allocate nothing.
+"""
+
+import ast
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+COMPONENT = os.path.join(ROOT, "components", "asgard_dashboard")
+
+# C++ entity type per field type
+ENTITY = {
+    "SENSOR": "sensor::Sensor",
+    "NUMBER": "number::Number",
+    "NUMBER_TRAITS": "number::Number",
+    "CLIMATE_CURRENT": "climate::Climate",
+    "CLIMATE_TARGET": "climate::Climate",
+    "BINARY": "binary_sensor::BinarySensor",
+    "BINARY_STATE": "binary_sensor::BinarySensor",
+    "SWITCH": "switch_::Switch",
+    "TEXT": "text_sensor::TextSensor",
+    "SELECT_INDEX": "select::Select",
+}
+
+LONG_TEXT = '\\"' * 70  # C++ literal: 70 quotes, each escaped on the wire
+CONTROL_TEXT = 'line\\none\\ttab\\x01\\"q\\"\\\\'
+# Statements that set entity e to one kind of value, per field type. A missing kind is "unset".
+VALUES = {
+    "typical": {
+        "SENSOR": "e.state = 42.37f; e.has_state_ = true;",
+        "NUMBER": "e.state = 21.5f; e.has_state_ = true;",
+        "NUMBER_TRAITS": "e.traits.min_value = 10; e.traits.max_value = 60; e.traits.step = 0.5f;",
+        "CLIMATE_CURRENT": "e.current_temperature = 20.4f;",
+        "CLIMATE_TARGET": "e.target_temperature = 21.0f;",
+        "BINARY": "e.state = true; e.has_state_ = true;",
+        "BINARY_STATE": "e.state = true; e.has_state_ = true;",
+        "SWITCH": "e.state = true;",
+        "TEXT": 'e.state = "Heating"; e.has_state_ = true;',
+        "SELECT_INDEX": "e.index = 2;",
+    },
+    "largest": {
+        "SENSOR": "e.state = FLT_MAX; e.has_state_ = true;",
+        "NUMBER": "e.state = -FLT_MAX; e.has_state_ = true;",
+        "NUMBER_TRAITS": "e.traits.min_value = -FLT_MAX; e.traits.max_value = FLT_MAX; e.traits.step = -FLT_MAX;",
+        "CLIMATE_CURRENT": "e.current_temperature = -FLT_MAX;",
+        "CLIMATE_TARGET": "e.target_temperature = FLT_MAX;",
+        "BINARY": "e.state = false; e.has_state_ = true;",
+        "BINARY_STATE": "e.state = false; e.has_state_ = true;",
+        "SWITCH": "e.state = false;",
+        "TEXT": f'e.state = "{LONG_TEXT}"; e.has_state_ = true;',
+        "SELECT_INDEX": "e.index = SIZE_MAX;",
+    },
+    "just_below_limit": {
+        "SENSOR": "e.state = -9.99e14f; e.has_state_ = true;",
+        "NUMBER": "e.state = -9.99e14f; e.has_state_ = true;",
+        "NUMBER_TRAITS": "e.traits.min_value = -9.99e14f; e.traits.max_value = -9.99e14f; e.traits.step = -9.99e14f;",
+        "CLIMATE_CURRENT": "e.current_temperature = -9.99e14f;",
+        "CLIMATE_TARGET": "e.target_temperature = -9.99e14f;",
+        "TEXT": f'e.state = "{CONTROL_TEXT}"; e.has_state_ = true;',
+    },
+    "not_finite": {
+        "SENSOR": "e.state = NAN; e.has_state_ = true;",
+        "NUMBER": "e.state = INFINITY; e.has_state_ = true;",
+        "NUMBER_TRAITS": "e.traits.min_value = -INFINITY; e.traits.max_value = INFINITY; e.traits.step = NAN;",
+        "CLIMATE_CURRENT": "e.current_temperature = INFINITY;",
+        "CLIMATE_TARGET": "e.target_temperature = NAN;",
+        "TEXT": 'e.state = ""; e.has_state_ = true;',
+    },
+    "unset": {},
+}
+
+CPP_HEAD = r"""
+#include <cfloat>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <new>
+#include <vector>
+
+#include "state_json.h"
+
+using namespace esphome;
+using namespace esphome::asgard_dashboard;
+
+static bool counting = false;
+static int allocations = 0;
+
+void *operator new(size_t size) {
+  if (counting) allocations++;
+  if (void *p = malloc(size ? size : 1)) return p;
+  throw std::bad_alloc();
+}
+void operator delete(void *p) noexcept { free(p); }
+void operator delete(void *p, size_t) noexcept { free(p); }
+
+static const size_t GUARD = 64;
+
+// One output line: name, cap, returned length, allocations, guard intact, then the buffer in hex.
+static void run(const char *name, const std::vector<StateField> &fields, size_t cap) {
+  std::vector<char> buf(cap + GUARD, 'Z');
+  allocations = 0;
+  counting = true;
+  size_t len = serialize_state(fields, buf.data(), cap);
+  counting = false;
+  bool guard = true;
+  for (size_t i = cap; i < buf.size(); i++) guard = guard && buf[i] == 'Z';
+  printf("%s %zu %zu %d %d ", name, cap, len, allocations, guard ? 1 : 0);
+  for (size_t i = 0; i < len; i++) printf("%02x", (unsigned char) buf[i]);
+  printf("\n");
+}
+
+int main() {
+"""
+
+
+def component_tables():
+    """TEXT_MAX_CHARS, STATE_VALUE_WIDTH, STATE_FIELDS and state_buffer_size() from __init__.py."""
+    with open(os.path.join(COMPONENT, "__init__.py")) as f:
+        tree = ast.parse(f.read())
+    wanted = {"TEXT_MAX_CHARS", "STATE_VALUE_WIDTH", "STATE_FIELDS", "state_buffer_size"}
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) in wanted for t in node.targets):
+            body.append(node)
+        elif isinstance(node, ast.FunctionDef) and node.name in wanted:
+            body.append(node)
+    namespace = {}
+    exec(compile(ast.Module(body=body, type_ignores=[]), "__init__.py", "exec"), namespace)
+    return namespace
+
+
+def scenarios(fields):
+    """(name, fields, value kind): every kind with the full table, then partial configurations."""
+    out = [(f"all_{kind}", fields, kind) for kind in VALUES]
+    # a third of the entities unconfigured, as codegen leaves them out of the table
+    out.append(("partial_largest", [f for i, f in enumerate(fields) if i % 3], "largest"))
+    out.append(("partial_typical", [f for i, f in enumerate(fields) if i % 3 != 1], "typical"))
+    out.append(("only_text", [f for f in fields if f[2] == "TEXT"][:1], "largest"))
+    out.append(("none", [], "typical"))
+    return out
+
+
+def cpp_source(cases, buffer_size):
+    lines = [CPP_HEAD]
+    for name, fields, kind in cases:
+        lines.append("  {")
+        lines.append("    std::vector<StateField> fields;")
+        for i, (conf_key, json_key, field_type) in enumerate(fields):
+            setup = VALUES[kind].get(field_type, "")
+            lines.append(f"    auto *e{i} = new {ENTITY[field_type]}();")
+            if setup:
+                lines.append(f"    {{ auto &e = *e{i}; {setup} }}")
+            lines.append(f'    fields.push_back({{"{json_key}", StateFieldType::{field_type}, e{i}}});')
+        lines.append(f'    run("{name}", fields, {buffer_size(fields)});')
+        lines.append("  }")
+    lines.append("  return 0;\n}\n")
+    return "\n".join(lines)
+
+
+def value_ok(field_type, value):
+    if field_type in ("SENSOR", "NUMBER", "CLIMATE_CURRENT", "CLIMATE_TARGET"):
+        return value is None or (isinstance(value, float) and math.isfinite(value))
+    if field_type == "NUMBER_TRAITS":
+        return (isinstance(value, dict) and list(value) == ["min", "max", "step"]
+                and all(v is None or isinstance(v, float) for v in value.values()))
+    if field_type == "BINARY":
+        return value is None or isinstance(value, bool)
+    if field_type in ("BINARY_STATE", "SWITCH"):
+        return isinstance(value, bool)
+    if field_type == "TEXT":
+        return isinstance(value, str)
+    if field_type == "SELECT_INDEX":
+        return isinstance(value, str) and (value == "null" or value.isdigit())
+    return False
+
+
+def check():
+    tables = component_tables()
+    fields = tables["STATE_FIELDS"]
+    buffer_size = tables["state_buffer_size"]
+    failures = 0
+
+    def fail(msg):
+        nonlocal failures
+        failures += 1
+        print(f"FAIL {msg}")
+
+    types = {f[2] for f in fields}
+    if types != set(tables["STATE_VALUE_WIDTH"]):
+        fail(f"STATE_FIELDS types {sorted(types)} != STATE_VALUE_WIDTH {sorted(tables['STATE_VALUE_WIDTH'])}")
+
+    cases = scenarios(fields)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "dashboard_state_test.cpp")
+        exe = os.path.join(tmp, "dashboard_state_test")
+        with open(src, "w") as f:
+            f.write(cpp_source(cases, buffer_size))
+        build = subprocess.run(["g++", "-std=c++17", "-Wall", "-I", HERE, "-I", COMPONENT, src, "-o", exe],
+                               capture_output=True, text=True)
+        if build.returncode:
+            print(build.stderr)
+            print("FAIL build")
+            return 1
+        output = subprocess.run([exe], capture_output=True, text=True, check=True).stdout
+
+    results = {}
+    for line in output.splitlines():
+        name, cap, length, allocs, guard, *data = line.split(" ")
+        results[name] = (int(cap), int(length), int(allocs), guard == "1", bytes.fromhex(data[0] if data else ""))
+
+    for name, case_fields, kind in cases:
+        cap, length, allocs, guard, data = results[name]
+        if length == 0:
+            fail(f"{name}: did not fit its {cap} byte buffer")
+            continue
+        if length + 1 > cap:
+            fail(f"{name}: {length} bytes + terminator exceed the {cap} byte buffer")
+        if not guard:
+            fail(f"{name}: wrote past the {cap} byte buffer")
+        if allocs:
+            fail(f"{name}: {allocs} allocations while serializing")
+        try:
+            state = json.loads(data.decode("utf-8"))
+        except ValueError as e:
+            fail(f"{name}: not JSON ({e}): {data[:120]!r}")
+            continue
+        keys = [f[1] for f in case_fields]
+        if list(state) != keys:
+            fail(f"{name}: keys {list(state)} != {keys}")
+            continue
+        for conf_key, json_key, field_type in case_fields:
+            if not value_ok(field_type, state[json_key]):
+                fail(f"{name}: {json_key} ({field_type}) = {state[json_key]!r}")
+        print(f"{name:18} {len(case_fields):2} fields {length:5} of {cap:5} bytes")
+
+    # the escaping keeps what JSON can carry and drops what it cannot
+    text_key = next(f[1] for f in fields if f[2] == "TEXT")
+    texts = {}
+    for name in ("all_largest", "all_just_below_limit"):
+        try:
+            texts[name] = json.loads(results[name][4])[text_key]
+        except ValueError:
+            pass  # already reported above
+    if "all_largest" in texts and texts["all_largest"] != '"' * tables["TEXT_MAX_CHARS"]:
+        fail(f"long text not cut to TEXT_MAX_CHARS: {texts['all_largest']!r}")
+    if "all_just_below_limit" in texts and texts["all_just_below_limit"] != 'line one tab "q"\\':
+        fail(f"control characters not replaced: {texts['all_just_below_limit']!r}")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check()
+    print(f"dashboard state checked, {failures} failures")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,8 @@
+#pragma once
+// Host stand-in for ESPHome's umbrella header: the core pieces components/ecodan/ecodan.h uses.
+#include <algorithm>
+#include <cstring>
+#include <queue>
+
+#include "esphome/core/component.h"
+#include "esphome/core/log.h"
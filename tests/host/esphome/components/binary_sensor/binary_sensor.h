@@ -0,0 +1,16 @@
+#pragma once
+// Host stand-in for the ESPHome entity: only the members the dashboard serializer and
+// components/ecodan/ecodan.h use.
+namespace esphome {
+namespace binary_sensor {
+struct BinarySensor {
+  bool state{false};
+  bool has_state_{false};
+  bool has_state() const { return has_state_; }
+  void publish_state(bool value) {
+    state = value;
+    has_state_ = true;
+  }
+};
+}  // namespace binary_sensor
+}  // namespace esphome
@@ -0,0 +1,41 @@
+#pragma once
+// Host stand-in for the ESPHome entity: the members the dashboard serializer reads and the
+// declarations components/ecodan/ecodan.h needs.
+#include <cmath>
+#include <cstdint>
+#include <initializer_list>
+#include <optional>
+
+namespace esphome {
+namespace climate {
+enum ClimateMode : uint8_t { CLIMATE_MODE_OFF, CLIMATE_MODE_HEAT_COOL, CLIMATE_MODE_COOL, CLIMATE_MODE_HEAT };
+enum ClimateFeature : uint32_t {
+  CLIMATE_SUPPORTS_CURRENT_TEMPERATURE = 1 << 0,
+  CLIMATE_SUPPORTS_TWO_POINT_TARGET_TEMPERATURE = 1 << 1,
+  CLIMATE_SUPPORTS_ACTION = 1 << 3,
+};
+struct ClimateTraits {
+  uint32_t feature_flags{0};
+  void add_feature_flags(uint32_t flags) { feature_flags |= flags; }
+  void clear_feature_flags(uint32_t flags) { feature_flags &= ~flags; }
+  void set_supported_modes(std::initializer_list<ClimateMode>) {}
+  void set_visual_min_temperature(float) {}
+  void set_visual_max_temperature(float) {}
+  void set_visual_target_temperature_step(float) {}
+  void set_visual_current_temperature_step(float) {}
+};
+struct ClimateCall {
+  std::optional<float> target_temperature;
+  const std::optional<float> &get_target_temperature() const { return target_temperature; }
+};
+struct Climate {
+  virtual ~Climate() = default;
+  virtual void control(const ClimateCall &call) {}
+  virtual ClimateTraits traits() { return {}; }
+  float current_temperature{NAN};
+  float target_temperature{NAN};
+  float target_temperature_low{NAN};
+  float target_temperature_high{NAN};
+};
+}  // namespace climate
+}  // namespace esphome
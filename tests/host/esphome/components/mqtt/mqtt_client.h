@@ -0,0 +1,2 @@
+#pragma once
+// Host stand-in for the ESPHome MQTT client: empty, the host build does not publish.
@@ -0,0 +1,20 @@
+#pragma once
+// Host stand-in for the ESPHome entity: only the members the dashboard serializer reads.
+#include <cmath>
+
+namespace esphome {
+namespace number {
+struct NumberTraits {
+  float min_value{0}, max_value{100}, step{1};
+  float get_min_value() const { return min_value; }
+  float get_max_value() const { return max_value; }
+  float get_step() const { return step; }
+};
+struct Number {
+  float state{NAN};
+  bool has_state_{false};
+  NumberTraits traits;
+  bool has_state() const { return has_state_; }
+};
+}  // namespace number
+}  // namespace esphome
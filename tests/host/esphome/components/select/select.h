@@ -0,0 +1,13 @@
+#pragma once
+// Host stand-in for the ESPHome entity: only the members the dashboard serializer reads.
+#include <cstddef>
+#include <optional>
+
+namespace esphome {
+namespace select {
+struct Select {
+  std::optional<size_t> index;
+  std::optional<size_t> active_index() const { return index; }
+};
+}  // namespace select
+}  // namespace esphome
@@ -0,0 +1,19 @@
+#pragma once
+// Host stand-in for the ESPHome entity: only the members the dashboard serializer and
+// components/ecodan/ecodan.h use.
+#include <cmath>
+
+namespace esphome {
+namespace sensor {
+struct Sensor {
+  float state{NAN};
+  float raw_state{NAN};
+  bool has_state_{false};
+  bool has_state() const { return has_state_; }
+  void publish_state(float value) {
+    raw_state = state = value;
+    has_state_ = true;
+  }
+};
+}  // namespace sensor
+}  // namespace esphome
@@ -0,0 +1,10 @@
+#pragma once
+// Host stand-in for the ESPHome socket component: the type only, the host build has no bus capture.
+namespace esphome {
+namespace socket {
+class Socket {
+ public:
+  virtual ~Socket() = default;
+};
+}  // namespace socket
+}  // namespace esphome
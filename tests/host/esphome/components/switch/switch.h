@@ -0,0 +1,9 @@
+#pragma once
+// Host stand-in for the ESPHome entity: only the members the dashboard serializer reads.
+namespace esphome {
+namespace switch_ {
+struct Switch {
+  bool state{false};
+};
+}  // namespace switch_
+}  // namespace esphome
@@ -0,0 +1,18 @@
+#pragma once
+// Host stand-in for the ESPHome entity: only the members the dashboard serializer and
+// components/ecodan/ecodan.h use.
+#include <string>
+
+namespace esphome {
+namespace text_sensor {
+struct TextSensor {
+  std::string state;
+  bool has_state_{false};
+  bool has_state() const { return has_state_; }
+  void publish_state(const std::string &value) {
+    state = value;
+    has_state_ = true;
+  }
+};
+}  // namespace text_sensor
+}  // namespace esphome
@@ -0,0 +1,13 @@
+#pragma once
+// Host stand-in for the ESPHome thermostat: the base members EcodanVirtualThermostat overrides.
+#include "esphome/components/climate/climate.h"
+
+namespace esphome {
+namespace thermostat {
+class ThermostatClimate : public climate::Climate {
+ public:
+  void control(const climate::ClimateCall &call) override {}
+  climate::ClimateTraits traits() override { return {}; }
+};
+}  // namespace thermostat
+}  // namespace esphome
@@ -0,0 +1,34 @@
+#pragma once
+// Host stand-in for the ESPHome UART component: the calls the ecodan serial path makes.
+#include <cstddef>
+#include <cstdint>
+
+namespace esphome {
+namespace uart {
+
+enum UARTParityOptions {
+  UART_CONFIG_PARITY_NONE,
+  UART_CONFIG_PARITY_EVEN,
+  UART_CONFIG_PARITY_ODD,
+};
+
+class UARTComponent {
+ public:
+  virtual ~UARTComponent() = default;
+  virtual void write_array(const uint8_t *data, size_t len) = 0;
+  virtual bool read_array(uint8_t *data, size_t len) = 0;
+  virtual int available() = 0;
+  bool read_byte(uint8_t *data) { return read_array(data, 1); }
+
+  void set_baud_rate(uint32_t baud_rate) { baud_rate_ = baud_rate; }
+  uint32_t get_baud_rate() const { return baud_rate_; }
+  uint8_t get_stop_bits() const { return 1; }
+  uint8_t get_data_bits() const { return 8; }
+  UARTParityOptions get_parity() const { return UART_CONFIG_PARITY_EVEN; }
+
+ protected:
+  uint32_t baud_rate_{2400};
+};
+
+}  // namespace uart
+}  // namespace esphome
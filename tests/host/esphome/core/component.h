@@ -0,0 +1,35 @@
+#pragma once
+// Host stand-in for the ESPHome component base classes and clock, steady_clock based.
+#include <chrono>
+#include <cstdint>
+
+namespace esphome {
+
+inline uint32_t micros() {
+  static const auto start = std::chrono::steady_clock::now();
+  return static_cast<uint32_t>(
+      std::chrono::duration_cast<std::chrono::microseconds>(std::chrono::steady_clock::now() - start).count());
+}
+
+inline uint32_t millis() { return micros() / 1000; }
+
+class Component {
+ public:
+  virtual ~Component() = default;
+  virtual void setup() {}
+  virtual void loop() {}
+  virtual void dump_config() {}
+};
+
+class PollingComponent : public Component {
+ public:
+  PollingComponent() = default;
+  virtual void update() = 0;
+  void set_update_interval(uint32_t update_interval) { update_interval_ = update_interval; }
+  uint32_t get_update_interval() const { return update_interval_; }
+
+ protected:
+  uint32_t update_interval_{0};
+};
+
+}  // namespace esphome
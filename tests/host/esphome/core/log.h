@@ -0,0 +1,16 @@
+#pragma once
+// Host stand-in for the ESPHome logger: every level goes to stderr, one line per call.
+#include <cstdio>
+
+#define ESP_HOST_LOG_(level, tag, ...)          \
+  do {                                          \
+    fprintf(stderr, "[%s][%s] ", level, tag);   \
+    fprintf(stderr, __VA_ARGS__);               \
+    fprintf(stderr, "\n");                      \
+  } while (0)
+
+#define ESP_LOGE(tag, ...) ESP_HOST_LOG_("E", tag, __VA_ARGS__)
+#define ESP_LOGW(tag, ...) ESP_HOST_LOG_("W", tag, __VA_ARGS__)
+#define ESP_LOGI(tag, ...) ESP_HOST_LOG_("I", tag, __VA_ARGS__)
+#define ESP_LOGD(tag, ...) ESP_HOST_LOG_("D", tag, __VA_ARGS__)
+#define ESP_LOGV(tag, ...) ESP_HOST_LOG_("V", tag, __VA_ARGS__)
@@ -0,0 +1,13 @@
+#pragma once
+// Host stand-in for the FreeRTOS types the ecodan component uses, one tick per millisecond.
+#include <cstdint>
+
+typedef uint32_t TickType_t;
+typedef int BaseType_t;
+typedef unsigned int UBaseType_t;
+
+#define pdTRUE 1
+#define pdFALSE 0
+#define pdPASS pdTRUE
+#define configMAX_PRIORITIES 25
+#define portMAX_DELAY (TickType_t) 0xffffffffUL
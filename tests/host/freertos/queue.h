@@ -0,0 +1,55 @@
+#pragma once
+// Host stand-in for FreeRTOS queues: fixed size items copied in and out under a mutex.
+#include <chrono>
+#include <condition_variable>
+#include <cstring>
+#include <deque>
+#include <mutex>
+#include <vector>
+
+#include "freertos/FreeRTOS.h"
+
+struct HostQueue {
+  HostQueue(UBaseType_t length, UBaseType_t item_size) : length(length), item_size(item_size) {}
+  const UBaseType_t length;
+  const UBaseType_t item_size;
+  std::mutex mutex;
+  std::condition_variable ready;
+  std::deque<std::vector<uint8_t>> items;
+};
+
+typedef HostQueue *QueueHandle_t;
+
+inline QueueHandle_t xQueueCreate(UBaseType_t length, UBaseType_t item_size) {
+  return new HostQueue(length, item_size);
+}
+
+inline BaseType_t xQueueSend(QueueHandle_t queue, const void *item, TickType_t ticks_to_wait) {
+  std::lock_guard<std::mutex> lock(queue->mutex);
+  if (queue->items.size() >= queue->length)
+    return pdFALSE;  // the component never waits for space
+  const auto *bytes = static_cast<const uint8_t *>(item);
+  queue->items.emplace_back(bytes, bytes + queue->item_size);
+  queue->ready.notify_one();
+  return pdTRUE;
+}
+
+inline BaseType_t xQueueReceive(QueueHandle_t queue, void *item, TickType_t ticks_to_wait) {
+  std::unique_lock<std::mutex> lock(queue->mutex);
+  if (!queue->ready.wait_for(lock, std::chrono::milliseconds(ticks_to_wait), [queue] { return !queue->items.empty(); }))
+    return pdFALSE;
+  memcpy(item, queue->items.front().data(), queue->item_size);
+  queue->items.pop_front();
+  return pdTRUE;
+}
+
+inline UBaseType_t uxQueueSpacesAvailable(QueueHandle_t queue) {
+  std::lock_guard<std::mutex> lock(queue->mutex);
+  return queue->length - queue->items.size();
+}
+
+inline BaseType_t xQueueReset(QueueHandle_t queue) {
+  std::lock_guard<std::mutex> lock(queue->mutex);
+  queue->items.clear();
+  return pdPASS;
+}
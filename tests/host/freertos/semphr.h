@@ -0,0 +1,19 @@
+#pragma once
+// Host stand-in for FreeRTOS mutexes: a std::timed_mutex.
+#include <chrono>
+#include <mutex>
+
+#include "freertos/FreeRTOS.h"
+
+typedef std::timed_mutex *SemaphoreHandle_t;
+
+inline SemaphoreHandle_t xSemaphoreCreateMutex() { return new std::timed_mutex(); }
+
+inline BaseType_t xSemaphoreTake(SemaphoreHandle_t mutex, TickType_t ticks_to_wait) {
+  return mutex->try_lock_for(std::chrono::milliseconds(ticks_to_wait)) ? pdTRUE : pdFALSE;
+}
+
+inline BaseType_t xSemaphoreGive(SemaphoreHandle_t mutex) {
+  mutex->unlock();
+  return pdTRUE;
+}
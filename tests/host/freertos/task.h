@@ -0,0 +1,22 @@
+#pragma once
+// Host stand-in for FreeRTOS tasks: a detached std::thread, the core and priority are ignored.
+#include <chrono>
+#include <thread>
+
+#include "freertos/FreeRTOS.h"
+
+typedef std::thread *TaskHandle_t;
+typedef void (*TaskFunction_t)(void *);
+
+inline BaseType_t xTaskCreatePinnedToCore(TaskFunction_t task, const char *name, uint32_t stack_depth, void *arg,
+                                          UBaseType_t priority, TaskHandle_t *handle, BaseType_t core_id) {
+  auto *thread = new std::thread(task, arg);
+  thread->detach();
+  if (handle != nullptr)
+    *handle = thread;
+  return pdPASS;
+}
+
+inline void vTaskDelay(TickType_t ticks) { std::this_thread::sleep_for(std::chrono::milliseconds(ticks)); }
+
+inline BaseType_t xPortGetCoreID() { return 0; }
@@ -0,0 +1,140 @@
+// Host build of the ecodan proxy path (components/ecodan/serial.cpp, proxy.cpp) on two ptys, the default device under test of scripts/proxy_bench.py.
+// Run with: g++ -std=c++17 -Wall -Wno-switch -pthread -I components/ecodan -I tests/host tests/host/proxy_host.cpp components/ecodan/serial.cpp components/ecodan/proxy.cpp -o /tmp/proxy_host && /tmp/proxy_host /tmp/ftc /tmp/slave
+//
+// serial.cpp and proxy.cpp build unchanged against the stand-in ESPHome and FreeRTOS headers next to
+// this file. This file takes the place of the rest of the component: the constructor, setup() and
+// loop() as ecodan.cpp has them for the proxy path, with the queued FTC frames counted instead of
+// decoded, and no bus capture.
+#include <cerrno>
+#include <csignal>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <fcntl.h>
+#include <sys/ioctl.h>
+#include <termios.h>
+#include <unistd.h>
+
+#include "ecodan.h"
+
+namespace esphome {
+namespace ecodan
+{
+    // ESPHome runs the main loop about every 16 ms
+    static const uint32_t LOOP_INTERVAL_MS = 16;
+    static uint32_t framesHandled = 0;
+
+    EcodanHeatpump::EcodanHeatpump() : PollingComponent() {
+        this->rx_message_queue_ = xQueueCreate(10, sizeof(Message));
+        this->uart_tx_mutex_ = xSemaphoreCreateMutex();
+    }
+
+    void EcodanHeatpump::setup() {
+        this->last_proxy_activity_ = std::chrono::steady_clock::now();
+        xTaskCreatePinnedToCore(
+            serial_io_task_trampoline,
+            "serial_io_task", 4096, this,
+            configMAX_PRIORITIES - 1, &this->serial_io_task_handle_, 1);
+    }
+
+    void EcodanHeatpump::loop() {
+        static Message received_message;
+        while (xQueueReceive(this->rx_message_queue_, &received_message, (TickType_t)0) == pdTRUE) {
+            framesHandled++;
+            received_message.reset();
+        }
+    }
+
+    void EcodanHeatpump::update() {}
+
+    void EcodanHeatpump::dump_config() {
+        ESP_LOGI(TAG, "proxy host build, %u FTC frames handled, slave %s", framesHandled,
+            proxy_available() ? "available" : "not seen");
+    }
+
+    void EcodanHeatpump::capture_frame(CaptureDirection direction, const uint8_t *data, uint8_t length, bool valid) {}
+}
+}
+
+using esphome::ecodan::EcodanHeatpump;
+
+// a pty in raw mode, read and written one frame at a time by serial.cpp
+class PtyUart : public esphome::uart::UARTComponent
+{
+public:
+    explicit PtyUart(int fd) : fd_(fd) {}
+
+    void write_array(const uint8_t *data, size_t len) override
+    {
+        while (len > 0) {
+            ssize_t n = write(fd_, data, len);
+            if (n < 0 && errno == EINTR)
+                continue;
+            if (n < 0)
+                return;
+            data += n;
+            len -= n;
+        }
+    }
+
+    bool read_array(uint8_t *data, size_t len) override
+    {
+        return read(fd_, data, len) == static_cast<ssize_t>(len);
+    }
+
+    int available() override
+    {
+        int count = 0;
+        return ioctl(fd_, FIONREAD, &count) == 0 ? count : 0;
+    }
+
+private:
+    int fd_;
+};
+
+static int open_pty(const char *path)
+{
+    int fd = open(path, O_RDWR | O_NOCTTY);
+    if (fd < 0) {
+        fprintf(stderr, "%s: %s\n", path, strerror(errno));
+        exit(2);
+    }
+    struct termios tio;
+    if (tcgetattr(fd, &tio) == 0) {
+        cfmakeraw(&tio);
+        tcsetattr(fd, TCSANOW, &tio);
+    }
+    return fd;
+}
+
+static volatile sig_atomic_t stopping = 0;
+
+static void stop(int)
+{
+    stopping = 1;
+}
+
+int main(int argc, char **argv)
+{
+    if (argc != 3) {
+        fprintf(stderr, "usage: %s FTC_PTY SLAVE_PTY\n", argv[0]);
+        return 2;
+    }
+    PtyUart ftc(open_pty(argv[1]));
+    PtyUart slave(open_pty(argv[2]));
+
+    EcodanHeatpump heatpump;
+    heatpump.set_uart_parent(&ftc);
+    heatpump.set_proxy_uart(&slave);
+    heatpump.setup();
+
+    signal(SIGTERM, stop);
+    signal(SIGINT, stop);
+    while (!stopping) {
+        heatpump.loop();
+        vTaskDelay(esphome::ecodan::LOOP_INTERVAL_MS);
+    }
+    heatpump.dump_config();
+    // the serial task never returns, leave without running its destructors
+    _exit(0);
+}
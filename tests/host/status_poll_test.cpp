@@ -0,0 +1,127 @@
+// Host test of the ecodan status poll scheduler (components/ecodan/status_poll.h): ordering and latency bounds.
+// Run with: g++ -std=c++17 -Wall -I components/ecodan tests/host/status_poll_test.cpp -o /tmp/status_poll_test && /tmp/status_poll_test
+#include <cstdio>
+#include <cstdlib>
+#include <vector>
+
+#include "status_poll.h"
+
+using esphome::ecodan::StatusPollRuntime;
+using esphome::ecodan::next_status_poll;
+
+static int failures = 0;
+
+#define CHECK(cond, ...)                                      \
+    do {                                                      \
+        if (!(cond)) {                                        \
+            failures++;                                       \
+            printf("FAIL %s:%d: %s: ", __FILE__, __LINE__, #cond); \
+            printf(__VA_ARGS__);                              \
+            printf("\n");                                     \
+        }                                                     \
+    } while (0)
+
+static void send(StatusPollRuntime &poll, uint32_t now)
+{
+    poll.Sent = true;
+    poll.LastSentMs = now;
+}
+
+static void never_sent_go_first_in_table_order()
+{
+    // the slow entries are never sent yet, so they go before the fast ones that were
+    std::vector<StatusPollRuntime> queue = {{0, 0}, {1, 60000}, {2, 0}, {3, 60000}, {4, 0}};
+    send(queue[0], 0);
+    send(queue[2], 0);
+    send(queue[4], 0);
+    uint32_t now = 5000;
+    int first = next_status_poll(queue.data(), queue.size(), now);
+    CHECK(first == 1, "picked %d", first);
+    send(queue[first], now);
+    int second = next_status_poll(queue.data(), queue.size(), now);
+    CHECK(second == 3, "picked %d", second);
+
+    std::vector<StatusPollRuntime> fresh = {{0, 0}, {1, 0}, {2, 60000}};
+    for (int expected = 0; expected < 3; expected++) {
+        int next = next_status_poll(fresh.data(), fresh.size(), 0);
+        CHECK(next == expected, "fresh queue picked %d, expected %d", next, expected);
+        send(fresh[next], 0);
+    }
+}
+
+static void most_overdue_wins()
+{
+    std::vector<StatusPollRuntime> queue = {{0, 0}, {1, 0}, {2, 60000}, {3, 1000}};
+    uint32_t now = 100000;
+    send(queue[0], now - 800);      // 800 ms overdue
+    send(queue[1], now - 1200);     // 1200 ms overdue
+    send(queue[2], now - 61500);    // 1500 ms overdue
+    send(queue[3], now - 1100);     // 100 ms overdue
+    int next = next_status_poll(queue.data(), queue.size(), now);
+    CHECK(next == 2, "picked %d", next);
+
+    // equally overdue: queue order
+    send(queue[2], now - 60800);
+    send(queue[1], now - 800);
+    next = next_status_poll(queue.data(), queue.size(), now);
+    CHECK(next == 0, "tie picked %d", next);
+}
+
+static void idle_when_nothing_is_due()
+{
+    std::vector<StatusPollRuntime> queue = {{0, 60000}, {1, 5000}};
+    send(queue[0], 1000);
+    send(queue[1], 1000);
+    int next = next_status_poll(queue.data(), queue.size(), 5999);
+    CHECK(next == -1, "picked %d before any interval passed", next);
+    next = next_status_poll(queue.data(), queue.size(), 6000);
+    CHECK(next == 1, "picked %d when the 5 s entry became due", next);
+}
+
+// Ten minutes of bus slots with four every-round messages and three 60 s ones, starting just before
+// the millis() wrap. Every message keeps to its bound: an every-round message waits at most one
+// round of the whole queue, a 60 s one at most one round past its interval.
+static void latency_bounds()
+{
+    const uint32_t SLOT_MS = 250;           // one request and its reply at 9600 baud
+    const uint32_t DURATION_MS = 10 * 60 * 1000;
+    std::vector<StatusPollRuntime> queue = {
+        {0, 60000}, {1, 0}, {2, 0}, {3, 60000}, {4, 0}, {5, 0}, {6, 60000}};
+    const uint32_t round = SLOT_MS * queue.size();
+
+    std::vector<uint32_t> worst(queue.size(), 0);
+    std::vector<int> polls(queue.size(), 0);
+    const uint32_t start = 0xFFFFFFFFu - 30000;
+    for (uint32_t elapsed = 0; elapsed < DURATION_MS; elapsed += SLOT_MS) {
+        uint32_t now = start + elapsed;
+        int next = next_status_poll(queue.data(), queue.size(), now);
+        if (next < 0)
+            continue;
+        auto &poll = queue[next];
+        if (poll.Sent) {
+            uint32_t gap = now - poll.LastSentMs;
+            if (gap > worst[next])
+                worst[next] = gap;
+        }
+        send(poll, now);
+        polls[next]++;
+    }
+
+    for (size_t i = 0; i < queue.size(); i++) {
+        uint32_t bound = queue[i].IntervalMs + round;
+        CHECK(worst[i] <= bound, "message %u waited %u ms, bound %u ms", (unsigned) i, worst[i], bound);
+        CHECK(polls[i] > 0, "message %u never polled", (unsigned) i);
+        printf("message %u every %5u ms: %4d polls, longest gap %5u ms (bound %5u)\n", (unsigned) i,
+               queue[i].IntervalMs, polls[i], worst[i], bound);
+    }
+}
+
+int main()
+{
+    never_sent_go_first_in_table_order();
+    most_overdue_wins();
+    idle_when_nothing_is_due();
+    latency_bounds();
+    printf("%s\n", failures ? "FAILED" : "OK");
+    return failures ? EXIT_FAILURE : EXIT_SUCCESS;
+}
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# ABOUTME: Test of the mqtt_logger CSV loaders (optimizer_replay.load_history, tariff_cop.read_counters) and the scripts built on them.
+# ABOUTME: Run with: python tests/scripts/logged_history_test.py
+"""Logs as mqtt_logger writes them: "" for every value not received yet.
+
+That covers the short-cycle binary sensors on installs without the short-cycle package and
+every binary sensor on the first rows after a logger restart. The loaders must read such cells
+as NaN, and every analysis script must run on a log that has them.
+"""
+
+import ast
+import csv
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS = os.path.join(os.path.dirname(os.path.dirname(HERE)), "scripts")
+sys.path.insert(0, SCRIPTS)
+
+import optimizer_replay as replay  # noqa: E402
+from tariff_cop import read_counters  # noqa: E402
+
+START = datetime(2026, 1, 12)
+STEP_S = 60
+BLANK_BINARY_EVERY = 97  # rows with the binary sensors blank, as after a logger restart
+
+
+def csv_columns():
+    """CSV_COLUMNS from mqtt_logger.py without importing it (it needs paho and a broker)."""
+    with open(os.path.join(SCRIPTS, "mqtt_logger.py")) as f:
+        tree = ast.parse(f.read())
+    wanted = {"SENSORS", "BINARY_SENSORS", "OPTIONAL_BINARY_SENSORS", "CSV_COLUMNS"}
+    body = [node for node in tree.body
+            if isinstance(node, ast.Assign) and any(getattr(t, "id", None) in wanted for t in node.targets)]
+    namespace = {}
+    exec(compile(ast.Module(body=body, type_ignores=[]), "mqtt_logger.py", "exec"), namespace)
+    return namespace["CSV_COLUMNS"], namespace["BINARY_SENSORS"], namespace["OPTIONAL_BINARY_SENSORS"]
+
+
+def write_log(path, rows, columns):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([row.get(column, "") for column in columns])
+
+
+def synthetic_log(path, days=4):
+    """A heated house on a two-node model with DHW runs and defrosts, logged once a minute.
+
+    The short-cycle columns stay blank throughout, the binary sensors are blank on the first row
+    and every BLANK_BINARY_EVERY rows, and one row after a "restart" has nothing but a timestamp.
+    """
+    columns, binary, optional = csv_columns()
+    rng = np.random.default_rng(7)
+    ua, capacity, emitter = 0.15, 10.0, 0.6      # kW/K, kWh/K, kW/K
+    room, water = 20.5, 26.0
+    on_since, defrost_left, last_defrost = None, 0, 0.0
+    counters = dict.fromkeys(("heating_delivered_kwh", "heating_consumed_kwh", "dhw_delivered_kwh",
+                              "dhw_consumed_kwh", "daily_consumed_kwh", "daily_produced_kwh"), 0.0)
+    dhw_temp, rows, day = 45.0, [], START.date()
+    for i in range(days * 86400 // STEP_S):
+        now = START + timedelta(seconds=i * STEP_S)
+        if now.date() != day:
+            day = now.date()
+            counters = dict.fromkeys(counters, 0.0)
+        hour = now.hour + now.minute / 60.0
+        outside = 2.5 + 5.0 * math.sin(2 * math.pi * (hour - 9.0) / 24.0) + rng.normal(0, 0.2)
+        dhw = 5.0 <= hour < 5.7 or 14.0 <= hour < 14.6
+        if dhw:
+            on = True
+        elif on_since is not None:
+            on = room < 21.3 or (now - on_since).total_seconds() < 20 * 60
+        else:
+            on = room < 20.7
+        on_since = (on_since or now) if on else None
+        if on and not dhw and outside < 3.0 and defrost_left == 0 and i * STEP_S - last_defrost > 90 * 60:
+            defrost_left, last_defrost = 5, i * STEP_S
+        defrost = defrost_left > 0
+        defrost_left = max(0, defrost_left - 1)
+
+        flow_target = 30.0 + 0.5 * (5.0 - outside)
+        if defrost:
+            water += (18.0 - water) * 0.3
+        elif on and not dhw:
+            water += (flow_target - water) * 0.25
+        else:
+            water += (room - water) * 0.05
+        heat = emitter * (water - room) if not dhw else emitter * (24.0 - room)
+        room += (heat - ua * (room - outside)) * STEP_S / 3600.0 / capacity
+        delta = max(0.0, heat / (15.0 / 60 * 4.186)) if on and not defrost else 0.0
+        feed = (50.0 if dhw else water + delta / 2)
+        ret = feed - (5.0 if dhw else delta)
+        cop = 3.4 + 0.08 * outside - (0.9 if dhw else 0.0)
+        power = (15.0 / 60 * 4.186 * (feed - ret)) if on and not defrost else 0.0
+        kwh = power * STEP_S / 3600.0
+        if dhw:
+            counters["dhw_delivered_kwh"] += kwh
+            counters["dhw_consumed_kwh"] += kwh / cop
+            dhw_temp = min(52.0, dhw_temp + 0.25)
+        else:
+            counters["heating_delivered_kwh"] += kwh
+            counters["heating_consumed_kwh"] += kwh / cop
+            dhw_temp = max(38.0, dhw_temp - 0.01)
+        counters["daily_produced_kwh"] += kwh
+        counters["daily_consumed_kwh"] += kwh / cop
+
+        error = 21.0 - room
+        row = {
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "outside_temp": f"{outside:.1f}", "feed_temp": f"{feed:.1f}", "return_temp": f"{ret:.1f}",
+            "dhw_temp": f"{dhw_temp:.1f}", "compressor_hz": f"{(35 + 2 * max(0.0, 5 - outside)) if on else 0:.0f}",
+            "output_power_kw": f"{power:.2f}", "estimated_cop": f"{cop if on else 0:.2f}",
+            "flow_rate_lmin": f"{15.0 if on else 0.0:.1f}", "flow_target_temp": f"{50.0 if dhw else flow_target:.1f}",
+            "aa_room_error": f"{error:.2f}", "aa_control_mode": "0" if dhw or defrost else "1",
+            "aa_calculated_flow": f"{flow_target:.1f}", "room_temp": f"{room:.2f}",
+            "delta_t": f"{feed - ret:.1f}",
+            "compressor_on": int(on), "defrost": int(defrost), "3way_valve_dhw": int(dhw),
+            "booster_heater": 0, "water_pump": int(on), "water_pump_2": 0, "dhw_eco": 0,
+        }
+        row.update({name: f"{value:.3f}" for name, value in counters.items()})
+        if i == 0 or i % BLANK_BINARY_EVERY == 0:
+            for name in binary.values():
+                row.pop(name)
+        if i == 2 * BLANK_BINARY_EVERY + 1:
+            row = {"timestamp": row["timestamp"]}
+        rows.append(row)
+    assert all(name not in row for row in rows for name in optional.values())
+    write_log(path, rows, columns)
+
+
+def check_loaders(tmp, fail):
+    columns = ["timestamp", "outside_temp", "compressor_on", "defrost", "3way_valve_dhw", "sc_lockout",
+               "aa_control_mode", "daily_consumed_kwh", "daily_produced_kwh"]
+    rows = [
+        {"timestamp": "2026-01-12 00:00:00", "outside_temp": "1.5", "daily_consumed_kwh": "0.1"},
+        {"timestamp": "2026-01-12 00:01:00", "outside_temp": "", "compressor_on": "1", "defrost": "0",
+         "3way_valve_dhw": "True", "daily_consumed_kwh": "", "daily_produced_kwh": "0.4"},
+        {"timestamp": "2026-01-12 00:02:00", "outside_temp": "unknown", "compressor_on": "", "defrost": "1",
+         "3way_valve_dhw": "False", "aa_control_mode": "3", "daily_consumed_kwh": "0.3"},
+    ]
+    path = os.path.join(tmp, "loader.csv")
+    write_log(path, rows, columns)
+    with open(path, "a", newline="") as f:
+        f.write("2026-01-12 00:03:00,2.0,1\n")  # a row cut short
+
+    history = replay.load_history(path)
+    expected = {
+        "outside": [1.5, math.nan, math.nan, 2.0],
+        "compressor": [False, True, False, True],
+        "defrost": [False, False, True, False],
+        "dhw": [False, True, False, False],
+        "lockout": [False, False, False, False],          # all blank
+        "logged_mode": [math.nan, math.nan, 3.0, math.nan],
+        "feed": [math.nan] * 4,                            # not a column of this log
+    }
+    for name, values in expected.items():
+        got = getattr(history, name)
+        if not np.array_equal(got, np.array(values), equal_nan=got.dtype.kind == "f"):
+            fail(f"load_history {name}: {got.tolist()} != {values}")
+    if history.t.tolist() != [0.0, 60.0, 120.0, 180.0]:
+        fail(f"load_history t: {history.t.tolist()}")
+
+    stamps, counters = read_counters([path])
+    got = counters["daily_consumed_kwh"]
+    if len(stamps) != 4 or not np.array_equal(got, [0.1, math.nan, 0.3, math.nan], equal_nan=True):
+        fail(f"read_counters daily_consumed_kwh: {got.tolist()}")
+    if not np.isnan(counters["daily_produced_kwh"][[0, 2, 3]]).all():
+        fail(f"read_counters daily_produced_kwh: {counters['daily_produced_kwh'].tolist()}")
+
+
+def check_scripts(tmp, fail):
+    log = os.path.join(tmp, "ecodan_log.csv")
+    synthetic_log(log)
+    history = replay.load_history(log)
+    if not (history.compressor.any() and history.defrost.any() and history.dhw.any()):
+        fail("synthetic log has no compressor, defrost or DHW rows")
+    model = os.path.join(tmp, "house.json")
+    runs = [
+        ["optimizer_replay.py", log, "--out", os.path.join(tmp, "steps.csv")],
+        ["optimizer_sweep.py", log, "--base", "1:2:1", "--cold-limit", "4:5:1", "--max-delta", "6:7:1",
+         "--error-range", "1:2:1", "--workers", "1"],
+        ["house_model.py", "fit", log, "--out", model],
+        ["house_model.py", "simulate", model, log, "--days", "7", "--base", "1:2:1"],
+        ["weather_curve.py", log, "--window", "30", "--min-hours", "0.5"],
+        ["load_shift.py", log, "--price", "NT=0.08", "--price", "VT=0.16", "--model", model],
+        ["defrost_analysis.py", log, "--out", os.path.join(tmp, "defrosts.csv")],
+        ["tariff_cop.py", log],
+    ]
+    for script, *args in runs:
+        result = subprocess.run([sys.executable, os.path.join(SCRIPTS, script), *args],
+                                capture_output=True, text=True, cwd=tmp)
+        name = " ".join([script] + [arg.replace(tmp + os.sep, "") for arg in args])
+        if result.returncode:
+            fail(f"{name} exited {result.returncode}:\n{(result.stderr or result.stdout)[-1500:]}")
+        else:
+            print(f"ok {name}")
+
+
+def check():
+    failures = 0
+
+    def fail(msg):
+        nonlocal failures
+        failures += 1
+        print(f"FAIL {msg}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        check_loaders(tmp, fail)
+        check_scripts(tmp, fail)
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check()
+    print(f"logged history checked, {failures} failures")
+    sys.exit(1 if failures else 0)